@@ -7,21 +7,30 @@ This package provides AWS client management functionality including:
 - Cached AWS client wrappers for transparent caching
 """
 
+from .account_catalog import AccountCatalog
+from .async_manager import AsyncAWSClientManager, AsyncServiceClient
 from .cached_client import (
     CachedAwsClient,
     CachedIdentityCenterClient,
     CachedIdentityStoreClient,
     CachedOrganizationsClient,
+    SingleFlight,
     create_cached_client_manager,
 )
+from .client_pool import ClientPool
 from .manager import AWSClientManager
 
 __all__ = [
+    "AccountCatalog",
     "AWSClientManager",
+    "AsyncAWSClientManager",
+    "AsyncServiceClient",
     "CachedAwsClient",
+    "ClientPool",
     "CachedOrganizationsClient",
     "CachedIdentityCenterClient",
     "CachedIdentityStoreClient",
+    "SingleFlight",
     "create_cached_client_manager",
 ]
 
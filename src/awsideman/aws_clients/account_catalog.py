@@ -0,0 +1,265 @@
+"""Single-pass catalog of the accounts in an organization.
+
+Looking accounts up one at a time costs a describe_account, a
+list_tags_for_resource and a walk of list_parents calls per account. The
+catalog instead reads every account from one paginated list_accounts call and
+takes OU paths from the organization hierarchy, which is built once (or loaded
+from its snapshot) for all accounts. Tags are only fetched when asked for, and
+then concurrently for all requested accounts at once.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..utils.models import AccountDetails, OrganizationTree
+from .manager import (
+    DEFAULT_HIERARCHY_CONCURRENCY,
+    AWSClientManager,
+    _calculate_ou_path,
+    _parse_joined_timestamp,
+    _tags_to_dict,
+    build_organization_hierarchy,
+)
+from .org_snapshot import OrganizationSnapshotStore
+
+logger = logging.getLogger(__name__)
+
+
+class AccountCatalog:
+    """Accounts, OU paths and tags of one organization, each fetched at most once."""
+
+    def __init__(
+        self,
+        organizations_client: Any,
+        organization_tree: Optional[OrganizationTree] = None,
+        max_concurrency: int = DEFAULT_HIERARCHY_CONCURRENCY,
+    ):
+        """
+        Initialize the account catalog.
+
+        Args:
+            organizations_client: Organizations client used for API calls
+            organization_tree: Hierarchy that is already built, if any
+            max_concurrency: Maximum number of concurrent tag and hierarchy requests
+        """
+        self.organizations_client = organizations_client
+        self.max_concurrency = max(1, max_concurrency)
+        self._organization_tree = organization_tree
+        self._accounts: Optional[Dict[str, Dict[str, Any]]] = None
+        self._ou_paths: Optional[Dict[str, List[str]]] = None
+        self._tags: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def accounts(self) -> List[Dict[str, Any]]:
+        """Get the raw account dictionaries in list_accounts order."""
+        return list(self._get_accounts().values())
+
+    def get(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """Get the raw account dictionary of an account, or None if it is not listed."""
+        return self._get_accounts().get(account_id)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the accounts have been listed already."""
+        return self._accounts is not None
+
+    def __contains__(self, account_id: object) -> bool:
+        return account_id in self._get_accounts()
+
+    def __len__(self) -> int:
+        return len(self._get_accounts())
+
+    def _get_accounts(self) -> Dict[str, Dict[str, Any]]:
+        """List the accounts of the organization on first use."""
+        with self._lock:
+            if self._accounts is None:
+                response = self.organizations_client.list_accounts()
+                accounts = response.get("Accounts", []) if isinstance(response, dict) else []
+                self._accounts = {
+                    account["Id"]: account
+                    for account in accounts
+                    if isinstance(account, dict) and account.get("Id")
+                }
+                logger.debug(f"Account catalog loaded {len(self._accounts)} accounts")
+            return self._accounts
+
+    def get_organization_tree(self, build: bool = True) -> Optional[OrganizationTree]:
+        """
+        Get the organization hierarchy.
+
+        Args:
+            build: Build the hierarchy if neither a tree nor a snapshot is available
+
+        Returns:
+            Root nodes of the hierarchy, or None if it is not available without building
+        """
+        if self._organization_tree is None:
+            if build:
+                self._organization_tree = build_organization_hierarchy(
+                    self.organizations_client, max_concurrency=self.max_concurrency
+                )
+            else:
+                snapshot_store = OrganizationSnapshotStore.for_client(self.organizations_client)
+                snapshot = snapshot_store.load() if snapshot_store is not None else None
+                if snapshot is not None:
+                    self._organization_tree = snapshot.roots
+        return self._organization_tree
+
+    def _get_ou_paths(self, build: bool) -> Optional[Dict[str, List[str]]]:
+        """Map account IDs to the names of their ancestors, root first."""
+        if self._ou_paths is None:
+            organization_tree = self.get_organization_tree(build=build)
+            if organization_tree is None:
+                return None
+
+            ou_paths: Dict[str, List[str]] = {}
+            stack = [(root, [root.name]) for root in reversed(organization_tree)]
+            while stack:
+                node, path = stack.pop()
+                for child in reversed(node.children):
+                    if child.is_account():
+                        ou_paths.setdefault(child.id, path)
+                    else:
+                        stack.append((child, path + [child.name]))
+            self._ou_paths = ou_paths
+        return self._ou_paths
+
+    def find_ou_path(self, account_id: str) -> Optional[List[str]]:
+        """
+        Get the OU path of an account from the hierarchy, without building it.
+
+        Args:
+            account_id: The unique identifier of the account
+
+        Returns:
+            List of OU names from root to account, or None if the hierarchy is
+            neither loaded nor saved as a snapshot, or does not contain the account
+        """
+        ou_paths = self._get_ou_paths(build=False)
+        if ou_paths is None:
+            return None
+        return ou_paths.get(account_id)
+
+    def get_ou_path(self, account_id: str) -> List[str]:
+        """
+        Get the OU path of an account from root to its parent.
+
+        The path comes from the hierarchy when it is loaded or saved as a
+        snapshot; otherwise only this account's parents are looked up.
+
+        Args:
+            account_id: The unique identifier of the account
+
+        Returns:
+            List of OU names from root to account
+        """
+        ou_path = self.find_ou_path(account_id)
+        if ou_path is not None:
+            return ou_path
+        return _calculate_ou_path(self.organizations_client, account_id)
+
+    def load_tags(self, account_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Fetch the tags of accounts whose tags are not loaded yet.
+
+        Args:
+            account_ids: Accounts to fetch tags for, all listed accounts if not given
+        """
+        if account_ids is None:
+            account_ids = self._get_accounts().keys()
+        missing = [
+            account_id for account_id in dict.fromkeys(account_ids) if account_id not in self._tags
+        ]
+        if not missing:
+            return
+
+        if len(missing) == 1 or self.max_concurrency == 1:
+            results = [self._fetch_tags(account_id) for account_id in missing]
+        else:
+            client_manager = getattr(self.organizations_client, "client_manager", None)
+            if isinstance(client_manager, AWSClientManager):
+                client_manager.ensure_concurrency(self.max_concurrency)
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                results = list(executor.map(self._fetch_tags, missing))
+
+        self._tags.update(zip(missing, results))
+
+    def _fetch_tags(self, account_id: str) -> Dict[str, str]:
+        """Fetch the tags of one account, or no tags if the call fails."""
+        try:
+            return _tags_to_dict(
+                self.organizations_client.list_tags_for_resource(account_id), account_id
+            )
+        except Exception as e:
+            logger.warning(f"Could not retrieve tags for account {account_id}: {e}")
+            return {}
+
+    def get_tags(self, account_id: str) -> Dict[str, str]:
+        """Get the tags of an account, fetching them if needed."""
+        self.load_tags([account_id])
+        return self._tags[account_id]
+
+    def get_account_details(
+        self, account_id: str, include_tags: bool = True
+    ) -> Optional[AccountDetails]:
+        """
+        Get the details of one account.
+
+        Args:
+            account_id: The unique identifier of the account
+            include_tags: Fetch the account's tags if they are not loaded yet
+
+        Returns:
+            AccountDetails, or None if the account is not listed in the organization
+        """
+        account_data = self.get(account_id)
+        if account_data is None:
+            return None
+        return self._to_details(
+            account_data,
+            self.get_ou_path(account_id),
+            self.get_tags(account_id) if include_tags else self._tags.get(account_id, {}),
+        )
+
+    def get_all_account_details(self, include_tags: bool = False) -> List[AccountDetails]:
+        """
+        Get the details of every account in the organization.
+
+        The hierarchy is built if needed, so OU paths cost no per-account calls.
+
+        Args:
+            include_tags: Fetch the tags of all accounts concurrently
+
+        Returns:
+            AccountDetails of all accounts in list_accounts order
+        """
+        accounts = self._get_accounts()
+        ou_paths = self._get_ou_paths(build=True) or {}
+        if include_tags:
+            self.load_tags(accounts.keys())
+        return [
+            self._to_details(
+                account_data,
+                ou_paths.get(account_id, []),
+                self._tags.get(account_id, {}),
+            )
+            for account_id, account_data in accounts.items()
+        ]
+
+    @staticmethod
+    def _to_details(
+        account_data: Dict[str, Any], ou_path: List[str], tags: Dict[str, str]
+    ) -> AccountDetails:
+        """Build AccountDetails from a list_accounts entry."""
+        return AccountDetails(
+            id=account_data["Id"],
+            name=account_data.get("Name", ""),
+            email=account_data.get("Email", ""),
+            status=account_data.get("Status", "UNKNOWN"),
+            joined_timestamp=_parse_joined_timestamp(account_data.get("JoinedTimestamp")),
+            tags=dict(tags),
+            ou_path=list(ou_path),
+        )
@@ -0,0 +1,398 @@
+"""Asyncio AWS clients for the async backup, restore and status code paths.
+
+The clients handed out by AWSClientManager are blocking boto3 clients. A
+coroutine that calls one stalls the event loop for the whole request, so
+``asyncio.gather`` over such coroutines still sends one request at a time.
+AsyncAWSClientManager is the asyncio counterpart built on aioboto3. It covers
+SSO Admin, Identity Store and Organizations, supports async pagination, and
+reads and writes the same cache entries as the blocking cached clients.
+Cache lookups and stores can read and write the disk or DynamoDB backend, so
+they run in the default executor rather than on the event loop.
+
+aiobotocore clients belong to the event loop that opened them. Clients are
+opened lazily on first use in a loop, and close() releases them. Each
+``asyncio.run`` call starts a new loop, so code that drives the manager that
+way should wrap each coroutine with run(), which closes the clients before
+the loop ends.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from ..cache.metrics import CacheMetrics
+from ..cache.key_builder import CacheKeyBuilder
+from .cached_client import OperationCache
+from .client_pool import DEFAULT_MAX_POOL_CONNECTIONS
+
+try:
+    import aioboto3  # type: ignore[import-untyped]
+    from aiobotocore.config import AioConfig
+except ImportError:  # pragma: no cover - aioboto3 is a declared dependency
+    aioboto3 = None
+    AioConfig = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncServiceClient:
+    """
+    Awaitable client for one AWS service.
+
+    Every boto3 operation is available as a coroutine method taking the boto3
+    keyword arguments, e.g. ``await client.list_instances()``.
+    """
+
+    def __init__(self, manager: "AsyncAWSClientManager", service_name: str):
+        """
+        Initialize the service client.
+
+        Args:
+            manager: Manager that owns the underlying aiobotocore client
+            service_name: Name of the AWS service
+        """
+        self._manager = manager
+        self.service_name = service_name
+
+    async def paginate(self, operation: str, result_key: str, **params: Any) -> List[Any]:
+        """
+        Fetch every page of a paginated operation.
+
+        Args:
+            operation: Paginated boto3 operation name, e.g. "list_users"
+            result_key: Response key holding the items, e.g. "Users"
+            **params: Operation parameters
+
+        Returns:
+            Items of all pages
+        """
+        return await self._manager.paginate(self.service_name, operation, result_key, **params)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def operation(**params: Any) -> Any:
+            return await self._manager.call(self.service_name, name, **params)
+
+        operation.__name__ = name
+        return operation
+
+
+class AsyncAWSClientManager:
+    """Manages aioboto3 clients for Identity Center operations."""
+
+    def __init__(
+        self,
+        profile: Optional[str] = None,
+        region: Optional[str] = None,
+        enable_caching: bool = True,
+        cache_manager: Optional[Any] = None,
+        max_concurrency: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        boto3_session: Optional[Any] = None,
+    ):
+        """
+        Initialize the async AWS client manager.
+
+        Args:
+            profile: AWS profile name to use
+            region: AWS region to use
+            enable_caching: Whether to cache read operations (default: True)
+            cache_manager: CacheManager shared with the blocking clients
+            max_concurrency: HTTP connections per service client
+            boto3_session: boto3 session whose credentials are used when no
+                profile is given, e.g. an assumed-role session
+
+        Raises:
+            ImportError: If aioboto3 is not installed
+        """
+        if aioboto3 is None:
+            raise ImportError("aioboto3 is required for async AWS clients")
+
+        self.profile = profile
+        self.region = region
+        self.enable_caching = enable_caching
+        self.cache_manager = cache_manager
+        self.max_concurrency = max_concurrency
+        self._boto3_session = boto3_session
+        self._session: Optional[Any] = None
+        self._operation_cache: Optional[OperationCache] = None
+        self._service_clients: Dict[str, AsyncServiceClient] = {}
+
+        # Event loop bound state, reset by _bind_loop()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._clients: Dict[str, Any] = {}
+        self._client_lock: Optional[asyncio.Lock] = None
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @classmethod
+    def from_client_manager(cls, client_manager: Any) -> "AsyncAWSClientManager":
+        """
+        Create the async counterpart of an AWSClientManager.
+
+        The profile, region, cache manager and connection pool size are taken
+        over. Without a profile, the credentials of the manager's boto3
+        session are used.
+
+        Args:
+            client_manager: AWSClientManager to mirror
+
+        Returns:
+            AsyncAWSClientManager for the same account and region
+        """
+        profile = getattr(client_manager, "profile", None)
+        region = getattr(client_manager, "region", None)
+        max_concurrency = getattr(client_manager, "max_concurrency", None)
+        enable_caching = getattr(client_manager, "enable_caching", True)
+        return cls(
+            profile=profile if isinstance(profile, str) else None,
+            region=region if isinstance(region, str) else None,
+            enable_caching=enable_caching is True,
+            cache_manager=getattr(client_manager, "cache_manager", None),
+            max_concurrency=(
+                max_concurrency
+                if isinstance(max_concurrency, int)
+                else DEFAULT_MAX_POOL_CONNECTIONS
+            ),
+            boto3_session=getattr(client_manager, "session", None),
+        )
+
+    async def __aenter__(self) -> "AsyncAWSClientManager":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> Any:
+        """Create the aioboto3 session on first use."""
+        if self._session is None:
+            session_kwargs: Dict[str, Any] = {}
+            region = self.region or getattr(self._boto3_session, "region_name", None)
+            if self.profile:
+                session_kwargs["profile_name"] = self.profile
+            elif self._boto3_session is not None:
+                credentials = self._boto3_session.get_credentials()
+                if credentials is not None:
+                    frozen = credentials.get_frozen_credentials()
+                    session_kwargs["aws_access_key_id"] = frozen.access_key
+                    session_kwargs["aws_secret_access_key"] = frozen.secret_key
+                    session_kwargs["aws_session_token"] = frozen.token
+            if isinstance(region, str):
+                session_kwargs["region_name"] = region
+            self._session = aioboto3.Session(**session_kwargs)
+        return self._session
+
+    def _bind_loop(self) -> None:
+        """Reset the loop-bound state when called from a different event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._clients:
+            logger.debug("Discarding async AWS clients opened in a previous event loop")
+        self._loop = loop
+        self._exit_stack = AsyncExitStack()
+        self._clients = {}
+        self._client_lock = asyncio.Lock()
+        self._in_flight = {}
+
+    async def get_client(self, service_name: str) -> Any:
+        """
+        Get the aiobotocore client for a service, opening it on first use.
+
+        Args:
+            service_name: Name of the AWS service
+
+        Returns:
+            aiobotocore client bound to the running event loop
+        """
+        self._bind_loop()
+        client = self._clients.get(service_name)
+        if client is not None:
+            return client
+
+        assert self._client_lock is not None and self._exit_stack is not None
+        async with self._client_lock:
+            client = self._clients.get(service_name)
+            if client is None:
+                client = await self._exit_stack.enter_async_context(
+                    self._get_session().client(
+                        service_name,
+                        config=AioConfig(max_pool_connections=self.max_concurrency),
+                    )
+                )
+                self._clients[service_name] = client
+            return client
+
+    async def close(self) -> None:
+        """Close the clients opened in the running event loop."""
+        if self._exit_stack is not None and self._loop is asyncio.get_running_loop():
+            exit_stack, self._exit_stack = self._exit_stack, AsyncExitStack()
+            self._clients = {}
+            await exit_stack.aclose()
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """
+        Await a coroutine and close the clients it opened.
+
+        Meant for ``asyncio.run(async_clients.run(coro))``, so that the
+        clients do not outlive the event loop.
+
+        Args:
+            awaitable: Coroutine using this manager
+
+        Returns:
+            Result of the coroutine
+        """
+        try:
+            return await awaitable
+        finally:
+            await self.close()
+
+    def _service_client(self, service_name: str) -> AsyncServiceClient:
+        client = self._service_clients.get(service_name)
+        if client is None:
+            client = self._service_clients[service_name] = AsyncServiceClient(self, service_name)
+        return client
+
+    def get_identity_center_client(self) -> AsyncServiceClient:
+        """Get the async SSO Admin client."""
+        return self._service_client("sso-admin")
+
+    def get_sso_admin_client(self) -> AsyncServiceClient:
+        """Get the async SSO Admin client."""
+        return self.get_identity_center_client()
+
+    def get_identity_store_client(self) -> AsyncServiceClient:
+        """Get the async Identity Store client."""
+        return self._service_client("identitystore")
+
+    def get_organizations_client(self) -> AsyncServiceClient:
+        """Get the async Organizations client."""
+        return self._service_client("organizations")
+
+    def _get_operation_cache(self) -> Optional[OperationCache]:
+        """Get the helper that builds cache keys and stores results, if caching is on."""
+        if not self.enable_caching or self.cache_manager is None:
+            return None
+        if self._operation_cache is None:
+            self._operation_cache = OperationCache(
+                self.cache_manager, scope=CacheKeyBuilder.client_scope(self.profile, self.region)
+            )
+        return self._operation_cache
+
+    async def call(self, service_name: str, operation: str, **params: Any) -> Any:
+        """
+        Call an AWS operation, serving read operations from the cache.
+
+        Args:
+            service_name: Name of the AWS service
+            operation: boto3 operation name
+            **params: Operation parameters
+
+        Returns:
+            API response
+        """
+
+        async def api_call() -> Any:
+            client = await self.get_client(service_name)
+            return await getattr(client, operation)(**params)
+
+        return await self._execute_with_cache(operation, params, api_call)
+
+    async def paginate(
+        self, service_name: str, operation: str, result_key: str, **params: Any
+    ) -> List[Any]:
+        """
+        Fetch every page of a paginated operation, caching the combined items.
+
+        Args:
+            service_name: Name of the AWS service
+            operation: Paginated boto3 operation name
+            result_key: Response key holding the items
+            **params: Operation parameters
+
+        Returns:
+            Items of all pages
+        """
+
+        async def api_call() -> List[Any]:
+            client = await self.get_client(service_name)
+            items: List[Any] = []
+            async for page in client.get_paginator(operation).paginate(**params):
+                items.extend(page.get(result_key, []))
+            return items
+
+        # The combined items are cached apart from single-page responses
+        return await self._execute_with_cache(  # type: ignore[no-any-return]
+            operation, {**params, "all_pages": result_key}, api_call
+        )
+
+    async def _execute_with_cache(
+        self, operation: str, params: Dict[str, Any], api_call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Serve an operation from the cache or call it, coalescing concurrent misses.
+
+        The cache is read and written in the default executor, so a lookup that
+        reaches the disk or DynamoDB backend does not block the event loop.
+        Successful write operations invalidate the entries they may have changed.
+        """
+        operation_cache = self._get_operation_cache()
+        try:
+            cache_key = operation_cache.cache_key(operation, params) if operation_cache else None
+        except Exception as e:
+            logger.warning(f"Failed to generate cache key for operation {operation}: {e}")
+            cache_key = None
+        if operation_cache is None:
+            return await api_call()
+        if cache_key is None:
+            result = await api_call()
+            await asyncio.to_thread(operation_cache.invalidate_write, operation, params)
+            return result
+
+        try:
+            found, value = await asyncio.to_thread(operation_cache.get_fresh, cache_key)
+            if found:
+                return value
+        except Exception as e:
+            logger.warning(f"Cache lookup failed for operation {operation}: {e}")
+            return await api_call()
+
+        self._bind_loop()
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = future
+        try:
+            started = time.perf_counter()
+            result = await api_call()
+            metrics = getattr(self.cache_manager, "metrics", None)
+            if isinstance(metrics, CacheMetrics):
+                metrics.record(operation, "aws", "fill", time.perf_counter() - started)
+            # Coalesced callers get the result without waiting for the store
+            future.set_result(result)
+            await asyncio.to_thread(
+                operation_cache.store_result,
+                operation,
+                cache_key,
+                result,
+                CacheKeyBuilder.operation_parameters(operation, (), params),
+            )
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(cache_key, None)
@@ -1,11 +1,18 @@
 """Cached AWS client wrapper for transparent caching of AWS API calls."""
 
-import hashlib
-import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
-
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from ..cache.adaptive_ttl import AdaptiveTTLPolicy
+from ..cache.aws_client import is_write_operation, write_invalidation_patterns
+from ..cache.config import DEFAULT_HARD_TTL
+from ..cache.dependencies import dependency_tags
+from ..cache.key_builder import CacheKeyBuilder
 from ..cache.manager import CacheManager
+from ..cache.metrics import CacheMetrics
 from ..utils.models import CacheConfig
 from .manager import (
     AWSClientManager,
@@ -16,27 +23,151 @@ from .manager import (
 
 logger = logging.getLogger(__name__)
 
+# Envelope keys for entries written in stale-while-revalidate mode
+SWR_VALUE_KEY = "_swr_value"
+SWR_FRESH_UNTIL_KEY = "_swr_fresh_until"
+
+# Key scope field naming the format of entries that are not plain API responses,
+# so readers that expect plain responses never find them
+VALUE_FORMAT_SCOPE_KEY = "format"
+SWR_VALUE_FORMAT = "swr"
+ORGANIZATIONS_VALUE_FORMAT = "organizations"
+
+# Upper bound on concurrent background refreshes; further stale hits are served
+# without scheduling another refresh until a slot frees up
+MAX_BACKGROUND_REFRESHES = 8
+
+
+class _InFlightCall:
+    """A call in progress whose outcome is shared with every waiter."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
 
-class CachedAwsClient:
+class SingleFlight:
     """
-    Wrapper around AWSClientManager that provides transparent caching of AWS API calls.
+    Coalesce concurrent calls that share a key into a single execution.
 
-    This class intercepts AWS API calls and checks the cache before making actual
-    API requests. Successful responses are cached for future use based on TTL settings.
+    The first caller for a key runs the function; callers arriving while it is
+    in flight block until it finishes and receive the same result, or the same
+    exception. Once the call completes the key is released, so later callers
+    start a new call (normally answered from the cache by then).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._coalesced: Dict[str, int] = {}
+
+    def do(self, key: str, fn: Callable[[], Any], operation: str = "unknown") -> Any:
+        """
+        Run ``fn`` for ``key`` unless an identical call is already in flight.
+
+        Args:
+            key: Key identifying identical calls (the cache key)
+            fn: Function to execute
+            operation: Operation name used for the coalesced-call counters
+
+        Returns:
+            Result of ``fn``, either computed here or by the in-flight caller
+
+        Raises:
+            Exception: Whatever ``fn`` raised, in the leader and in every waiter
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced[operation] = self._coalesced.get(operation, 0) + 1
+                leader = False
+            else:
+                call = _InFlightCall()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            logger.debug(f"Coalescing {operation} call with in-flight request")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+    def get_coalesced_counts(self) -> Dict[str, int]:
+        """Return the number of coalesced calls per operation."""
+        with self._lock:
+            return dict(self._coalesced)
+
+    def reset_stats(self) -> None:
+        """Reset the coalesced-call counters."""
+        with self._lock:
+            self._coalesced.clear()
+
+
+class OperationCache:
+    """
+    Reads and writes the cache entries of AWS API operations.
+
+    Entries are keyed by CacheKeyBuilder under a profile and region scope,
+    tagged with the resources they name, and stored with the configured,
+    stale-while-revalidate or adaptive TTL. CachedAwsClient builds on it to
+    cache blocking API calls; AsyncAWSClientManager uses it directly around
+    its awaited calls.
     """
 
     def __init__(
-        self, client_manager: AWSClientManager, cache_manager: Optional[CacheManager] = None
+        self,
+        cache_manager: Optional[CacheManager] = None,
+        stale_while_revalidate: Optional[bool] = None,
+        hard_ttl: Optional[int] = None,
+        scope: Optional[Mapping[str, str]] = None,
+        value_format: Optional[str] = None,
     ):
         """
-        Initialize the cached AWS client.
+        Initialize the operation cache.
 
         Args:
-            client_manager: AWSClientManager instance for AWS API calls
             cache_manager: Optional CacheManager instance. If None, creates a new one.
+            stale_while_revalidate: Serve stale entries while refreshing them in the
+                background. If None, uses the cache configuration (off by default).
+            hard_ttl: Seconds an entry may be served stale before it becomes a hard
+                miss. If None, uses the cache configuration.
+            scope: Profile and region the cache keys are scoped to, as built by
+                CacheKeyBuilder.client_scope(). If None, the default profile and region.
+            value_format: Name of the format of the stored values when they are not
+                the API responses themselves. If None, responses are stored as returned.
         """
-        self.client_manager = client_manager
         self.cache_manager = cache_manager or CacheManager()
+        self.scope = dict(scope) if scope is not None else CacheKeyBuilder.client_scope(None, None)
+        self.value_format = value_format
+
+        self._cache_config = self._load_cache_config()
+        if stale_while_revalidate is None:
+            stale_while_revalidate = (
+                getattr(self._cache_config, "stale_while_revalidate", False) is True
+            )
+        if hard_ttl is None:
+            configured_hard_ttl = getattr(self._cache_config, "hard_ttl", DEFAULT_HARD_TTL)
+            hard_ttl = configured_hard_ttl if isinstance(configured_hard_ttl, int) else None
+        self.stale_while_revalidate = stale_while_revalidate
+        self.hard_ttl = hard_ttl or DEFAULT_HARD_TTL
 
         # Track which operations are cacheable (read-only operations)
         self._cacheable_operations = {
@@ -72,37 +203,70 @@ class CachedAwsClient:
             "list_group_memberships",
         }
 
-    def get_organizations_client(self) -> "CachedOrganizationsClient":
+    def cache_key(self, operation: str, params: Dict[str, Any]) -> Optional[str]:
         """
-        Get a cached Organizations client.
+        Get the cache key of an operation call.
+
+        Args:
+            operation: AWS operation name
+            params: boto3 keyword arguments of the call
 
         Returns:
-            CachedOrganizationsClient instance
+            Cache key string, or None if the operation is not cached
         """
-        return CachedOrganizationsClient(self.client_manager, self.cache_manager)
+        if not self._is_cacheable_operation(operation):
+            return None
+        return self._generate_cache_key(
+            operation, CacheKeyBuilder.operation_parameters(operation, (), params)
+        )
 
-    def get_identity_center_client(self) -> "CachedIdentityCenterClient":
+    def get_fresh(self, cache_key: str) -> Tuple[bool, Any]:
         """
-        Get a cached Identity Center client.
+        Look up a cache entry that is still fresh.
+
+        Args:
+            cache_key: Cache key of the entry
 
         Returns:
-            CachedIdentityCenterClient instance
+            Tuple of (found, value). Missing and stale entries are not found.
         """
-        return CachedIdentityCenterClient(self.client_manager, self.cache_manager)
-
-    def get_identity_store_client(self) -> "CachedIdentityStoreClient":
+        cached = self.cache_manager.get(cache_key)
+        if cached is None:
+            return False, None
+        value, fresh = self._unwrap_cached_value(cached)
+        if not fresh:
+            return False, None
+        return True, value
+
+    def _key_scope(self) -> Dict[str, str]:
+        """Get the profile and region scope of the cache keys."""
+        return self.scope
+
+    def _value_scope(self) -> Dict[str, str]:
         """
-        Get a cached Identity Store client.
+        Get the key scope including the format of the stored values.
 
-        Returns:
-            CachedIdentityStoreClient instance
+        Processed values and stale-while-revalidate envelopes are only
+        understood here, so they are keyed apart from the plain responses the
+        other cache layers read.
         """
-        return CachedIdentityStoreClient(self.client_manager, self.cache_manager)
+        scope = self._key_scope()
+        formats = [self.value_format] if self.value_format else []
+        if self.stale_while_revalidate:
+            formats.append(SWR_VALUE_FORMAT)
+        if not formats:
+            return scope
+        return {**scope, VALUE_FORMAT_SCOPE_KEY: "+".join(formats)}
 
     def _generate_cache_key(self, operation: str, params: Dict[str, Any]) -> str:
         """
         Generate a deterministic cache key based on operation and parameters.
 
+        Keys follow the hierarchical CacheKeyBuilder scheme. The profile and
+        region, and the value format when it is not a plain response, are
+        hashed with the parameters to avoid conflicts between accounts and
+        between layers.
+
         Args:
             operation: AWS operation name
             params: Operation parameters
@@ -110,22 +274,69 @@ class CachedAwsClient:
         Returns:
             Cache key string
         """
-        # Create a deterministic representation of the parameters
-        # Sort keys to ensure consistent ordering
-        sorted_params = json.dumps(params, sort_keys=True, default=str)
+        return CacheKeyBuilder.build_operation_key(
+            operation, kwargs=params, scope=self._value_scope()
+        )
+
+    def _load_cache_config(self) -> Any:
+        """Return the cache manager's configuration, if it exposes one."""
+        try:
+            return self.cache_manager.get_cache_config()
+        except Exception:
+            return None
+
+    def _get_soft_ttl(self, operation: str) -> int:
+        """
+        Get the soft TTL for an operation in stale-while-revalidate mode.
+
+        Args:
+            operation: AWS operation name
+
+        Returns:
+            Seconds after which a cached value is stale
+        """
+        try:
+            ttl = self._cache_config.get_ttl_for_operation(operation)
+            if isinstance(ttl, int) and ttl > 0:
+                return ttl
+        except Exception:
+            pass
+        return CacheConfig().get_ttl_for_operation(operation)
+
+    def _get_adaptive_ttl(self, operation: str, cache_key: str, result: Any) -> Optional[int]:
+        """
+        Report a fetched value to the adaptive TTL policy and get the TTL to store it with.
+
+        Args:
+            operation: AWS operation name
+            cache_key: Cache key the value is stored under
+            result: Fetched value
+
+        Returns:
+            TTL in seconds, or None when adaptive TTLs are disabled
+        """
+        policy = getattr(self.cache_manager, "adaptive_ttl", None)
+        if not isinstance(policy, AdaptiveTTLPolicy):
+            return None
 
-        # Include profile and region in the key to avoid conflicts
-        profile = getattr(self.client_manager, "profile", "default") or "default"
-        region = getattr(self.client_manager, "region", "us-east-1") or "us-east-1"
+        base_ttl = self._get_soft_ttl(operation)
+        policy.observe(operation, cache_key, result, base_ttl)
+        return policy.ttl_for(operation, base_ttl)
 
-        # Create the key components
-        key_data = f"{operation}:{sorted_params}:{profile}:{region}"
+    @staticmethod
+    def _unwrap_cached_value(cached: Any) -> Tuple[Any, bool]:
+        """
+        Unwrap a cached value written in stale-while-revalidate mode.
 
-        # Generate a hash for the key to keep it manageable
-        key_hash = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+        Args:
+            cached: Value returned by the cache manager
 
-        # Return a readable key with hash
-        return f"{operation}_{key_hash[:16]}"
+        Returns:
+            Tuple of (value, is_fresh). Plain values are always fresh.
+        """
+        if isinstance(cached, dict) and SWR_FRESH_UNTIL_KEY in cached:
+            return cached.get(SWR_VALUE_KEY), time.time() <= cached[SWR_FRESH_UNTIL_KEY]
+        return cached, True
 
     def _is_cacheable_operation(self, operation: str) -> bool:
         """
@@ -139,6 +350,253 @@ class CachedAwsClient:
         """
         return operation in self._cacheable_operations
 
+    def store_result(
+        self,
+        operation: str,
+        cache_key: str,
+        result: Any,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Cache a successful API result, logging instead of raising on failure.
+
+        Args:
+            operation: AWS operation name
+            cache_key: Cache key to store the result under
+            result: API response
+            params: Operation parameters
+        """
+        # Try to cache the successful result - if caching fails, log but don't fail the operation
+        try:
+            logger.debug(f"Storing result in cache with key: {cache_key}")
+            tags = dependency_tags(params, result)
+            adaptive_ttl = self._get_adaptive_ttl(operation, cache_key, result)
+            if self.stale_while_revalidate:
+                soft_ttl = adaptive_ttl or self._get_soft_ttl(operation)
+                envelope = {SWR_VALUE_KEY: result, SWR_FRESH_UNTIL_KEY: time.time() + soft_ttl}
+                hard_ttl = timedelta(seconds=max(self.hard_ttl, soft_ttl))
+                self.cache_manager.set(cache_key, envelope, ttl=hard_ttl, tags=tags)
+            elif adaptive_ttl is not None:
+                self.cache_manager.set(
+                    cache_key, result, ttl=timedelta(seconds=adaptive_ttl), tags=tags
+                )
+            else:
+                self.cache_manager.set(cache_key, result, tags=tags)
+            logger.debug(f"Successfully cached result for operation {operation}")
+        except Exception as cache_error:
+            logger.warning(f"Failed to cache result for operation {operation}: {cache_error}")
+            # Continue - the API call was successful even if caching failed
+
+    def invalidate_write(self, operation: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Invalidate the entries a successful write operation may have changed.
+
+        Uses the key patterns of the cache-layer CachedAWSClient and the
+        dependency tags of the resources named in the request. Failures are
+        logged instead of raised.
+
+        Args:
+            operation: AWS operation name
+            params: Operation parameters
+
+        Returns:
+            Number of invalidated entries
+        """
+        if not is_write_operation(operation):
+            return 0
+        try:
+            params = params or {}
+            removed = sum(
+                self.cache_manager.invalidate(pattern)
+                for pattern in write_invalidation_patterns(operation, params)
+            )
+            tags = dependency_tags(CacheKeyBuilder.operation_parameters(operation, (), params))
+            if tags:
+                removed += self.cache_manager.invalidate_tags(tags)
+            logger.debug(f"Invalidated {removed} cache entries for operation {operation}")
+            return removed
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for operation {operation}: {e}")
+            return 0
+
+
+class CachedAwsClient(OperationCache):
+    """
+    Wrapper around AWSClientManager that provides transparent caching of AWS API calls.
+
+    This class intercepts AWS API calls and checks the cache before making actual
+    API requests. Successful responses are cached for future use based on TTL settings.
+
+    Concurrent cache misses for the same cache key are coalesced: only one thread
+    calls the API and the others wait for its result. The in-flight table is shared
+    by all instances because the cached client wrappers each create their own
+    CachedAwsClient, and cache keys already include the profile and region.
+
+    With stale-while-revalidate enabled, entries carry a soft TTL (the operation TTL)
+    and are kept in the cache until a hard TTL. A hit past the soft TTL returns the
+    stale value immediately and refreshes it on a background thread.
+    """
+
+    _single_flight = SingleFlight()
+
+    # Stale-while-revalidate state shared by all instances
+    _swr_lock = threading.Lock()
+    _refreshing: Set[str] = set()
+    _swr_stats: Dict[str, Dict[str, int]] = {
+        "stale_served": {},
+        "background_refreshes": {},
+        "refresh_failures": {},
+        "refreshes_skipped": {},
+    }
+
+    def __init__(
+        self,
+        client_manager: AWSClientManager,
+        cache_manager: Optional[CacheManager] = None,
+        stale_while_revalidate: Optional[bool] = None,
+        hard_ttl: Optional[int] = None,
+        value_format: Optional[str] = None,
+    ):
+        """
+        Initialize the cached AWS client.
+
+        Args:
+            client_manager: AWSClientManager instance for AWS API calls
+            cache_manager: Optional CacheManager instance. If None, creates a new one.
+            stale_while_revalidate: Serve stale entries while refreshing them in the
+                background. If None, uses the cache configuration (off by default).
+            hard_ttl: Seconds an entry may be served stale before it becomes a hard
+                miss. If None, uses the cache configuration.
+            value_format: Name of the format of the stored values when the API calls
+                return processed values instead of responses. If None, none.
+        """
+        self.client_manager = client_manager
+        super().__init__(cache_manager, stale_while_revalidate, hard_ttl, value_format=value_format)
+
+    def get_organizations_client(self) -> "CachedOrganizationsClient":
+        """
+        Get a cached Organizations client.
+
+        Returns:
+            CachedOrganizationsClient instance
+        """
+        return CachedOrganizationsClient(self.client_manager, self.cache_manager)
+
+    def get_identity_center_client(self) -> "CachedIdentityCenterClient":
+        """
+        Get a cached Identity Center client.
+
+        Returns:
+            CachedIdentityCenterClient instance
+        """
+        return CachedIdentityCenterClient(self.client_manager, self.cache_manager)
+
+    def get_identity_store_client(self) -> "CachedIdentityStoreClient":
+        """
+        Get a cached Identity Store client.
+
+        Returns:
+            CachedIdentityStoreClient instance
+        """
+        return CachedIdentityStoreClient(self.client_manager, self.cache_manager)
+
+    def _key_scope(self) -> Dict[str, str]:
+        """Get the scope of the client manager's current profile and region."""
+        return CacheKeyBuilder.client_scope(
+            getattr(self.client_manager, "profile", None),
+            getattr(self.client_manager, "region", None),
+        )
+
+    @classmethod
+    def get_coalescing_stats(cls) -> Dict[str, int]:
+        """
+        Get the number of API calls avoided by request coalescing.
+
+        Returns:
+            Dictionary mapping operation name to the number of coalesced calls
+        """
+        return cls._single_flight.get_coalesced_counts()
+
+    @classmethod
+    def reset_coalescing_stats(cls) -> None:
+        """Reset the coalesced-call counters."""
+        cls._single_flight.reset_stats()
+
+    @classmethod
+    def get_stale_stats(cls) -> Dict[str, Any]:
+        """
+        Get stale-while-revalidate counters.
+
+        Returns:
+            Dictionary with per-operation counts of stale values served, background
+            refreshes completed, failed and skipped, plus refreshes in progress
+        """
+        with cls._swr_lock:
+            stats: Dict[str, Any] = {name: dict(counts) for name, counts in cls._swr_stats.items()}
+            stats["refreshes_in_progress"] = len(cls._refreshing)
+        return stats
+
+    @classmethod
+    def reset_stale_stats(cls) -> None:
+        """Reset the stale-while-revalidate counters."""
+        with cls._swr_lock:
+            for counts in cls._swr_stats.values():
+                counts.clear()
+
+    @classmethod
+    def _record_swr(cls, counter: str, operation: str) -> None:
+        """Increment a per-operation stale-while-revalidate counter."""
+        with cls._swr_lock:
+            counts = cls._swr_stats[counter]
+            counts[operation] = counts.get(operation, 0) + 1
+
+    def _schedule_refresh(
+        self,
+        operation: str,
+        cache_key: str,
+        api_call: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Refresh a stale entry on a background thread.
+
+        At most one refresh per key runs at a time, and at most
+        MAX_BACKGROUND_REFRESHES in total.
+
+        Args:
+            operation: AWS operation name
+            cache_key: Cache key of the stale entry
+            api_call: Function that makes the actual API call
+            params: Operation parameters, used to tag the refreshed entry
+        """
+        with self._swr_lock:
+            if cache_key in self._refreshing:
+                return
+            if len(self._refreshing) >= MAX_BACKGROUND_REFRESHES:
+                counts = self._swr_stats["refreshes_skipped"]
+                counts[operation] = counts.get(operation, 0) + 1
+                return
+            self._refreshing.add(cache_key)
+
+        def refresh() -> None:
+            try:
+                self._single_flight.do(
+                    cache_key,
+                    lambda: self._call_and_cache(operation, cache_key, api_call, params),
+                    operation=operation,
+                )
+                self._record_swr("background_refreshes", operation)
+                logger.debug(f"Refreshed stale cache entry for operation {operation}")
+            except Exception as e:
+                self._record_swr("refresh_failures", operation)
+                logger.debug(f"Background refresh failed for operation {operation}: {e}")
+            finally:
+                with self._swr_lock:
+                    self._refreshing.discard(cache_key)
+
+        thread = threading.Thread(target=refresh, name=f"cache-refresh-{operation}", daemon=True)
+        thread.start()
+
     def _execute_with_cache(
         self, operation: str, params: Dict[str, Any], api_call: Callable[[], Any]
     ) -> Any:
@@ -172,8 +630,16 @@ class CachedAwsClient:
             logger.debug(f"Checking cache for key: {cache_key}")
             cached_result = self.cache_manager.get(cache_key)
             if cached_result is not None:
-                logger.debug(f"Cache hit for operation {operation}")
-                return cached_result
+                value, fresh = self._unwrap_cached_value(cached_result)
+                if fresh:
+                    logger.debug(f"Cache hit for operation {operation}")
+                    return value
+                if self.stale_while_revalidate:
+                    logger.debug(f"Serving stale cache entry for operation {operation}")
+                    self._record_swr("stale_served", operation)
+                    self._schedule_refresh(operation, cache_key, api_call, params)
+                    return value
+                logger.debug(f"Cache entry past its soft TTL for operation {operation}")
             else:
                 logger.debug(f"Cache miss for operation {operation}")
         except Exception as e:
@@ -181,27 +647,54 @@ class CachedAwsClient:
             logger.debug(f"Falling back to API call for operation {operation}")
             # Continue to API call - don't return here
 
-        # Cache miss or cache failure - call the API
+        # Cache miss or cache failure - call the API, sharing the call with any
+        # concurrent caller that missed on the same key
         logger.debug(f"Cache miss for operation {operation}, calling API")
         try:
-            result = api_call()
-
-            # Try to cache the successful result - if caching fails, log but don't fail the operation
-            try:
-                logger.debug(f"Storing result in cache with key: {cache_key}")
-                self.cache_manager.set(cache_key, result)
-                logger.debug(f"Successfully cached result for operation {operation}")
-            except Exception as cache_error:
-                logger.warning(f"Failed to cache result for operation {operation}: {cache_error}")
-                # Continue - the API call was successful even if caching failed
-
-            return result
-
+            return self._single_flight.do(
+                cache_key,
+                lambda: self._call_and_cache(operation, cache_key, api_call, params),
+                operation=operation,
+            )
         except Exception as e:
             logger.debug(f"API call failed for operation {operation}: {e}")
             # Don't cache errors, just re-raise
             raise
 
+    def _call_and_cache(
+        self,
+        operation: str,
+        cache_key: str,
+        api_call: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Call the API and cache the successful result.
+
+        The entry is tagged with the users, groups, permission sets and
+        accounts named in the request and response so that changes to any of
+        them invalidate it.
+
+        Args:
+            operation: AWS operation name
+            cache_key: Cache key to store the result under
+            api_call: Function that makes the actual API call
+            params: Operation parameters
+
+        Returns:
+            API response
+        """
+        started = time.perf_counter()
+        result = api_call()
+        # The API call is the cost a cache hit on this operation saves
+        metrics = getattr(self.cache_manager, "metrics", None)
+        if isinstance(metrics, CacheMetrics):
+            metrics.record(operation, "aws", "fill", time.perf_counter() - started)
+
+        self.store_result(operation, cache_key, result, params)
+
+        return result
+
 
 class CachedOrganizationsClient:
     """
@@ -221,7 +714,11 @@ class CachedOrganizationsClient:
         """
         self.client_manager = client_manager
         self.cache_manager = cache_manager
-        self._cached_aws_client = CachedAwsClient(client_manager, cache_manager)
+        # The wrapper caches the values it returns (e.g. the Account of a
+        # describe_account response), not the responses other layers cache
+        self._cached_aws_client = CachedAwsClient(
+            client_manager, cache_manager, value_format=ORGANIZATIONS_VALUE_FORMAT
+        )
         self._organizations_client = OrganizationsClientWrapper(client_manager)
 
     @property
@@ -456,28 +953,8 @@ class CachedIdentityCenterClient:
 
         # Return a wrapper function that provides caching
         def cached_method(*args, **kwargs):
-            # Convert args and kwargs to a parameters dict for cache key generation
-            params = {}
-            if args:
-                # For positional args, we need to map them to parameter names
-                # This is a simplified approach - in practice, you might want to inspect
-                # the method signature to get proper parameter names
-                if name == "describe_instance" and len(args) >= 1:
-                    params["instance_arn"] = args[0]
-                elif name == "list_permission_sets" and len(args) >= 1:
-                    params["instance_arn"] = args[0]
-                elif name == "describe_permission_set" and len(args) >= 2:
-                    params["instance_arn"] = args[0]
-                    params["permission_set_arn"] = args[1]
-                elif name == "list_accounts_for_provisioned_permission_set" and len(args) >= 2:
-                    params["instance_arn"] = args[0]
-                    params["permission_set_arn"] = args[1]
-                elif name == "list_permission_sets_provisioned_to_account" and len(args) >= 2:
-                    params["instance_arn"] = args[0]
-                    params["account_id"] = args[1]
-
-            # Add kwargs to params
-            params.update(kwargs)
+            # Name positional arguments so that every call style shares one cache key
+            params = CacheKeyBuilder.operation_parameters(name, args, kwargs)
 
             # Execute the API call with caching
             def api_call():
@@ -535,26 +1012,8 @@ class CachedIdentityStoreClient:
 
         # Return a wrapper function that provides caching
         def cached_method(*args, **kwargs):
-            # Convert args and kwargs to a parameters dict for cache key generation
-            params = {}
-            if args:
-                # For positional args, we need to map them to parameter names
-                # This is a simplified approach - in practice, you might want to inspect
-                # the method signature to get proper parameter names
-                if name == "describe_user" and len(args) >= 2:
-                    params["identity_store_id"] = args[0]
-                    params["user_id"] = args[1]
-                elif name == "describe_group" and len(args) >= 2:
-                    params["identity_store_id"] = args[0]
-                    params["group_id"] = args[1]
-                elif name == "list_group_memberships" and len(args) >= 2:
-                    params["identity_store_id"] = args[0]
-                    params["group_id"] = args[1]
-                elif name in ["list_users", "list_groups"] and len(args) >= 1:
-                    params["identity_store_id"] = args[0]
-
-            # Add kwargs to params
-            params.update(kwargs)
+            # Name positional arguments so that every call style shares one cache key
+            params = CacheKeyBuilder.operation_parameters(name, args, kwargs)
 
             # Execute the API call with caching
             def api_call():
@@ -0,0 +1,224 @@
+"""Shared, thread-safe boto3 client pool for AWSClientManager.
+
+boto3 sessions are not thread-safe, but the clients they create are. The pool
+therefore creates one client per service under a lock and hands the same
+client to every thread. Each client's HTTP connection pool
+(``max_pool_connections``) is sized to the worker concurrency the caller
+declares, instead of botocore's default of 10. Otherwise urllib3 opens and
+discards extra connections once more workers than that are in flight.
+
+A per-service gate tracks HTTP sends: a slot is taken on ``before-send`` and
+returned when botocore decides about retrying the attempt, or when the call
+finishes. When more threads send at once than the pool holds, the extra
+threads wait for a free slot. That wait time is recorded, which shows whether
+the configured concurrency matches the actual fan-out.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+from botocore.config import Config as BotocoreConfig
+
+logger = logging.getLogger(__name__)
+
+# botocore's own default for max_pool_connections
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+
+class _ConnectionGate:
+    """Counting gate whose limit can grow, with wait-time statistics."""
+
+    def __init__(self, limit: int) -> None:
+        self._condition = threading.Condition()
+        self.limit = limit
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.requests = 0
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def acquire(self) -> float:
+        """Take a slot, blocking while all are in use. Returns the seconds waited."""
+        start = time.perf_counter()
+        with self._condition:
+            waited = False
+            while self.in_use >= self.limit:
+                waited = True
+                self._condition.wait()
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.requests += 1
+            elapsed = time.perf_counter() - start if waited else 0.0
+            if waited:
+                self.waits += 1
+                self.wait_seconds_total += elapsed
+                self.wait_seconds_max = max(self.wait_seconds_max, elapsed)
+        return elapsed
+
+    def release(self) -> None:
+        """Return a slot."""
+        with self._condition:
+            self.in_use = max(0, self.in_use - 1)
+            self._condition.notify()
+
+    def resize(self, limit: int) -> None:
+        """Raise the limit and wake waiters that now fit."""
+        with self._condition:
+            self.limit = limit
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current slot usage and wait statistics."""
+        with self._condition:
+            return {
+                "max_connections": self.limit,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "requests": self.requests,
+                "waits": self.waits,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "wait_seconds_avg": (
+                    round(self.wait_seconds_total / self.waits, 6) if self.waits else 0.0
+                ),
+            }
+
+
+class ClientPool:
+    """
+    One shared botocore client per service, sized to the worker concurrency.
+
+    Clients are created lazily. Calling ensure_concurrency() with a larger
+    value replaces the pooled clients with ones that have a larger connection
+    pool. Callers that still hold an older client keep working, but they do
+    not get the extra connections.
+    """
+
+    def __init__(self, session: Any, max_connections: int = DEFAULT_MAX_POOL_CONNECTIONS):
+        """
+        Initialize the pool.
+
+        Args:
+            session: boto3 session used to create clients
+            max_connections: HTTP connections per service client, normally the
+                number of worker threads that share the client
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+
+        self.session = session
+        self.max_connections = max_connections
+        self._lock = threading.Lock()
+        self._clients: Dict[str, Any] = {}
+        self._gates: Dict[str, _ConnectionGate] = {}
+        self._held = threading.local()
+
+    def get_client(self, service_name: str) -> Any:
+        """
+        Get the shared client for a service, creating it on first use.
+
+        Args:
+            service_name: Name of the AWS service
+
+        Returns:
+            botocore client that may be used from any thread
+        """
+        client = self._clients.get(service_name)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(service_name)
+            if client is None:
+                client = self._create_client(service_name)
+                self._clients[service_name] = client
+            return client
+
+    def _create_client(self, service_name: str) -> Any:
+        """Create a client with a sized connection pool. Caller holds the lock."""
+        gate = self._gates.get(service_name)
+        if gate is None:
+            gate = self._gates[service_name] = _ConnectionGate(self.max_connections)
+
+        client = self.session.client(
+            service_name,
+            config=BotocoreConfig(max_pool_connections=self.max_connections),
+        )
+
+        events = getattr(getattr(client, "meta", None), "events", None)
+        if events is not None and hasattr(events, "register"):
+            events.register("before-send", lambda **kwargs: self._acquire(gate))
+            # needs-retry runs after every attempt and before any retry backoff;
+            # after-call and after-call-error cover attempts that ended otherwise
+            for event in ("needs-retry", "after-call", "after-call-error"):
+                events.register(event, lambda **kwargs: self._release(gate))
+
+        logger.debug(
+            f"Created pooled {service_name} client with {self.max_connections} connections"
+        )
+        return client
+
+    def _acquire(self, gate: _ConnectionGate) -> None:
+        """Take a slot for the current thread, unless it already holds one."""
+        held = getattr(self._held, "gates", None)
+        if held is None:
+            held = self._held.gates = set()
+        if id(gate) not in held:
+            gate.acquire()
+            held.add(id(gate))
+
+    def _release(self, gate: _ConnectionGate) -> None:
+        """Return the slot held by the current thread, if any."""
+        held = getattr(self._held, "gates", None)
+        if held and id(gate) in held:
+            held.discard(id(gate))
+            gate.release()
+
+    def ensure_concurrency(self, workers: int) -> None:
+        """
+        Grow the connection pools to serve at least the given number of workers.
+
+        Args:
+            workers: Number of threads that will share the pooled clients
+        """
+        if workers <= self.max_connections:
+            return
+
+        with self._lock:
+            if workers <= self.max_connections:
+                return
+            logger.debug(
+                f"Growing AWS client pools from {self.max_connections} to {workers} connections"
+            )
+            self.max_connections = workers
+            for gate in self._gates.values():
+                gate.resize(workers)
+            for service_name in list(self._clients):
+                self._clients[service_name] = self._create_client(service_name)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get per-service connection usage and pool wait times.
+
+        Returns:
+            Dictionary with the pool size and statistics per service
+        """
+        with self._lock:
+            gates = dict(self._gates)
+        services = {name: gate.stats() for name, gate in sorted(gates.items())}
+        return {
+            "max_connections": self.max_connections,
+            "services": services,
+            "wait_seconds_total": round(
+                sum(service["wait_seconds_total"] for service in services.values()), 6
+            ),
+            "waits": sum(service["waits"] for service in services.values()),
+        }
+
+    def clear(self) -> None:
+        """Drop the pooled clients; statistics are kept."""
+        with self._lock:
+            self._clients.clear()
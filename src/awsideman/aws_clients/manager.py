@@ -1,7 +1,9 @@
 """AWS client utilities for awsideman."""
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, cast
 
 import boto3
 from botocore.exceptions import ClientError
@@ -17,9 +19,13 @@ from ..utils.models import (
     PolicyList,
     PolicyType,
 )
+from .client_pool import DEFAULT_MAX_POOL_CONNECTIONS, ClientPool
 
 logger = logging.getLogger(__name__)
 
+# Nodes of one hierarchy level whose children are fetched at once
+DEFAULT_HIERARCHY_CONCURRENCY = 10
+
 
 # Simple error handling functions for backward compatibility
 def handle_aws_error(error: ClientError, operation: str) -> None:
@@ -66,6 +72,7 @@ class AWSClientManager:
         enable_caching: bool = True,
         cache_manager: Optional[Any] = None,
         cache_config: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Initialize the AWS client manager.
@@ -76,14 +83,18 @@ class AWSClientManager:
             enable_caching: Whether to enable caching for read operations (default: True)
             cache_manager: Optional CacheManager instance for caching operations
             cache_config: Optional cache configuration dictionary
+            max_concurrency: Number of worker threads expected to share the clients;
+                sizes each client's HTTP connection pool (default: botocore's 10)
         """
         self.profile = profile
         self.region = region
         self.enable_caching = enable_caching
         self.cache_manager = cache_manager
         self.cache_config = cache_config or {}
+        self.max_concurrency = max_concurrency or DEFAULT_MAX_POOL_CONNECTIONS
         self.session = None
         self._cached_client: Optional[Any] = None
+        self._client_pool: Optional[ClientPool] = None
         self._init_session()
 
     def _init_session(self) -> None:
@@ -131,7 +142,7 @@ class AWSClientManager:
         try:
             # Try to get caller identity using STS - this is a lightweight operation
             # that will fail if credentials are invalid or expired
-            sts_client = self.session.client("sts")
+            sts_client = self.get_client("sts")
             sts_client.get_caller_identity()
             return True
         except Exception as e:
@@ -145,6 +156,7 @@ class AWSClientManager:
         region: Optional[str] = None,
         enable_caching: bool = True,
         cache_config: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
     ) -> "AWSClientManager":
         """
         Create an AWS client manager with automatic cache integration.
@@ -157,6 +169,7 @@ class AWSClientManager:
             region: AWS region to use
             enable_caching: Whether to enable caching
             cache_config: Optional cache configuration dictionary
+            max_concurrency: Number of worker threads expected to share the clients
 
         Returns:
             Configured AWSClientManager instance with cache integration
@@ -176,21 +189,58 @@ class AWSClientManager:
             enable_caching=enable_caching,
             cache_manager=cache_manager,
             cache_config=cache_config,
+            max_concurrency=max_concurrency,
         )
 
+    @property
+    def client_pool(self) -> ClientPool:
+        """Pool of shared service clients bound to the current session."""
+        if self.session is None:
+            raise RuntimeError("Session not initialized")
+        if self._client_pool is None or self._client_pool.session is not self.session:
+            self._client_pool = ClientPool(self.session, self.max_concurrency)
+        return self._client_pool
+
     def get_client(self, service_name: str) -> Any:
         """
         Get an AWS service client.
 
+        The client is shared by all callers and threads; its connection pool
+        is sized to max_concurrency.
+
         Args:
             service_name: Name of the AWS service
 
         Returns:
             AWS service client
         """
-        if self.session is None:
-            raise RuntimeError("Session not initialized")
-        return self.session.client(service_name)
+        return self.client_pool.get_client(service_name)
+
+    def ensure_concurrency(self, workers: int) -> None:
+        """
+        Size the client connection pools for the given number of worker threads.
+
+        Call this before fanning out work to a thread pool so that workers do
+        not wait for HTTP connections.
+
+        Args:
+            workers: Number of threads that will call AWS concurrently
+        """
+        if workers > self.max_concurrency:
+            self.max_concurrency = workers
+        if self.session is not None:
+            self.client_pool.ensure_concurrency(workers)
+
+    def get_client_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection usage and pool wait times of the shared clients.
+
+        Returns:
+            Dictionary with the pool size and per-service wait statistics
+        """
+        if self._client_pool is None:
+            return {"max_connections": self.max_concurrency, "services": {}}
+        return self._client_pool.stats()
 
     def get_raw_identity_center_client(self) -> Any:
         """
@@ -219,6 +269,17 @@ class AWSClientManager:
         """
         return self.get_client("organizations")
 
+    def get_async_client_manager(self) -> Any:
+        """
+        Get an asyncio client manager for the same profile, region and cache.
+
+        Returns:
+            AsyncAWSClientManager mirroring this manager
+        """
+        from .async_manager import AsyncAWSClientManager
+
+        return AsyncAWSClientManager.from_client_manager(self)
+
     def get_cached_client(self) -> Any:
         """Get a cached AWS client wrapper."""
         if self._cached_client is None:
@@ -260,11 +321,16 @@ class AWSClientManager:
         if self.enable_caching:
             # Use the new unified cache system
             from ..cache.aws_client import CachedIdentityCenterClient
+            from ..cache.key_builder import CacheKeyBuilder
             from ..cache.manager import CacheManager
 
             cache_manager = self.cache_manager or CacheManager(profile=self.profile)
             raw_client = self.get_raw_identity_center_client()
-            return CachedIdentityCenterClient(raw_client, cache_manager)
+            return CachedIdentityCenterClient(
+                raw_client,
+                cache_manager,
+                scope=CacheKeyBuilder.client_scope(self.profile, self.region),
+            )
         else:
             return IdentityCenterClientWrapper(self)
 
@@ -278,11 +344,16 @@ class AWSClientManager:
         if self.enable_caching:
             # Use the new unified cache system
             from ..cache.aws_client import CachedIdentityStoreClient
+            from ..cache.key_builder import CacheKeyBuilder
             from ..cache.manager import CacheManager
 
             cache_manager = self.cache_manager or CacheManager(profile=self.profile)
             raw_client = self.get_raw_identity_store_client()
-            return CachedIdentityStoreClient(raw_client, cache_manager)
+            return CachedIdentityStoreClient(
+                raw_client,
+                cache_manager,
+                scope=CacheKeyBuilder.client_scope(self.profile, self.region),
+            )
         else:
             return IdentityStoreClientWrapper(self)
 
@@ -368,6 +439,23 @@ class OrganizationsClientWrapper:
             self._client = self.client_manager.get_raw_organizations_client()
         return self._client
 
+    def _list_all_pages(
+        self, operation: Callable[..., Any], result_key: str, **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """Call a list operation until NextToken runs out and join the pages."""
+        items: List[Dict[str, Any]] = []
+        next_token = None
+        while True:
+            response = (
+                operation(**kwargs, NextToken=next_token) if next_token else operation(**kwargs)
+            )
+            result = response.get(result_key, [])
+            if isinstance(result, list):
+                items.extend(result)
+            next_token = response.get("NextToken")
+            if not isinstance(next_token, str) or not next_token:
+                return items
+
     @with_retry(max_retries=3)
     def list_roots(self) -> List[Dict[str, Any]]:
         """
@@ -403,9 +491,11 @@ class OrganizationsClientWrapper:
             ClientError: If the API call fails
         """
         try:
-            response = self.client.list_organizational_units_for_parent(ParentId=parent_id)
-            result = response.get("OrganizationalUnits", [])
-            return result if isinstance(result, list) else []
+            return self._list_all_pages(
+                self.client.list_organizational_units_for_parent,
+                "OrganizationalUnits",
+                ParentId=parent_id,
+            )
         except ClientError as e:
             handle_aws_error(e, "ListOrganizationalUnitsForParent")
             # This should never be reached, but mypy needs it
@@ -426,9 +516,9 @@ class OrganizationsClientWrapper:
             ClientError: If the API call fails
         """
         try:
-            response = self.client.list_accounts_for_parent(ParentId=parent_id)
-            result = response.get("Accounts", [])
-            return result if isinstance(result, list) else []
+            return self._list_all_pages(
+                self.client.list_accounts_for_parent, "Accounts", ParentId=parent_id
+            )
         except ClientError as e:
             handle_aws_error(e, "ListAccountsForParent")
             # This should never be reached, but mypy needs it
@@ -446,9 +536,17 @@ class OrganizationsClientWrapper:
             ClientError: If the API call fails
         """
         try:
-            # Use the basic AWS Organizations API to list all accounts
+            # Follow NextToken so organizations with more than one page are complete
             response = self.client.list_accounts()
-            return response  # type: ignore[no-any-return]
+            if not isinstance(response, dict):
+                return response  # type: ignore[no-any-return]
+            accounts = list(response.get("Accounts", []))
+            next_token = response.get("NextToken")
+            while isinstance(next_token, str) and next_token:
+                page = self.client.list_accounts(NextToken=next_token)
+                accounts.extend(page.get("Accounts", []))
+                next_token = page.get("NextToken")
+            return {**{k: v for k, v in response.items() if k != "NextToken"}, "Accounts": accounts}
         except ClientError as e:
             handle_aws_error(e, "ListAccounts")
             # This should never be reached, but mypy needs it
@@ -601,17 +699,25 @@ class IdentityStoreClientWrapper:
 
 def build_organization_hierarchy(
     organizations_client: OrganizationsClientWrapper,
+    max_concurrency: int = DEFAULT_HIERARCHY_CONCURRENCY,
+    refresh: bool = False,
 ) -> OrganizationTree:
     """
     Build the complete organization hierarchy tree structure.
 
-    This function recursively constructs the organization tree starting from roots,
-    then building OUs and accounts under each parent. It handles error cases
+    The tree is built level by level starting from the roots: the OUs and
+    accounts under every node of one level are fetched concurrently, with at
+    most ``max_concurrency`` requests in flight. It handles error cases
     gracefully and provides comprehensive error handling for incomplete or
     malformed organization data.
 
+    When the client is cached, the finished tree is saved as a snapshot and
+    later calls load it from the cache instead of walking the organization.
+
     Args:
         organizations_client: OrganizationsClient instance for API calls
+        max_concurrency: Maximum number of nodes whose children are fetched at once
+        refresh: Rebuild the tree even if a saved snapshot exists
 
     Returns:
         OrganizationTree: List of root OrgNode objects representing the complete hierarchy
@@ -620,6 +726,17 @@ def build_organization_hierarchy(
         ClientError: If critical AWS API calls fail
         ValueError: If organization structure is malformed or incomplete
     """
+    from .org_snapshot import OrganizationSnapshotStore
+
+    snapshot_store = OrganizationSnapshotStore.for_client(organizations_client)
+    if snapshot_store is not None and not refresh:
+        snapshot = snapshot_store.load()
+        if snapshot is not None:
+            logger.debug(
+                f"Loaded organization hierarchy snapshot ({snapshot.age_seconds():.0f}s old)"
+            )
+            return snapshot.roots
+
     try:
         # Start by getting all roots
         roots_data = organizations_client.list_roots()
@@ -632,14 +749,7 @@ def build_organization_hierarchy(
 
         for root_data in roots_data:
             try:
-                # Create root node
-                root_node = _create_org_node_from_data(root_data, NodeType.ROOT)
-
-                # Recursively build children for this root
-                _build_children_recursive(organizations_client, root_node)
-
-                organization_tree.append(root_node)
-
+                organization_tree.append(_create_org_node_from_data(root_data, NodeType.ROOT))
             except Exception as e:
                 console.print(
                     f"[yellow]Warning: Failed to build hierarchy for root {root_data.get('Id', 'unknown')}: {str(e)}[/yellow]"
@@ -652,6 +762,17 @@ def build_organization_hierarchy(
                 "Failed to build organization hierarchy. No valid roots could be processed."
             )
 
+        complete = _build_levels(organizations_client, organization_tree, max_concurrency)
+
+        if snapshot_store is not None:
+            if complete:
+                snapshot_store.save(organization_tree)
+            else:
+                logger.warning(
+                    "Not saving the organization hierarchy snapshot: "
+                    "children of some nodes could not be retrieved"
+                )
+
         return organization_tree
 
     except ClientError as e:
@@ -664,33 +785,85 @@ def build_organization_hierarchy(
         raise
 
 
-def _build_children_recursive(
+def _build_levels(
+    organizations_client: OrganizationsClientWrapper,
+    nodes: List[OrgNode],
+    max_concurrency: int = DEFAULT_HIERARCHY_CONCURRENCY,
+) -> bool:
+    """
+    Build the subtrees of the given nodes breadth-first.
+
+    The children of all nodes of a level are fetched concurrently and attached
+    once the whole level is done, so the result does not depend on the order
+    in which requests complete. A node that appears twice is only attached the
+    first time, which protects against cycles in malformed data.
+
+    Args:
+        organizations_client: OrganizationsClient instance for API calls
+        nodes: Nodes whose children should be built
+        max_concurrency: Maximum number of nodes whose children are fetched at once
+
+    Returns:
+        bool: True if the children of every node were retrieved, False if any
+        fetch failed and the subtrees are incomplete
+    """
+    max_concurrency = max(1, max_concurrency)
+    client_manager = getattr(organizations_client, "client_manager", None)
+    if isinstance(client_manager, AWSClientManager):
+        client_manager.ensure_concurrency(max_concurrency)
+
+    seen = {node.id for node in nodes}
+    level = list(nodes)
+    complete = True
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        while level:
+            if len(level) == 1 or max_concurrency == 1:
+                children = [_fetch_children(organizations_client, node) for node in level]
+            else:
+                children = list(
+                    executor.map(lambda node: _fetch_children(organizations_client, node), level)
+                )
+
+            next_level = []
+            for parent_node, (child_nodes, fetched) in zip(level, children):
+                complete = complete and fetched
+                for child_node in child_nodes:
+                    if child_node.id in seen:
+                        logger.debug(f"Skipping {child_node.id}, already in the hierarchy")
+                        continue
+                    seen.add(child_node.id)
+                    parent_node.add_child(child_node)
+                    if child_node.is_ou():
+                        next_level.append(child_node)
+            level = next_level
+
+    return complete
+
+
+def _fetch_children(
     organizations_client: OrganizationsClientWrapper, parent_node: OrgNode
-) -> None:
+) -> Tuple[List[OrgNode], bool]:
     """
-    Recursively build children (OUs and accounts) for a given parent node.
+    Fetch the OUs and accounts directly under a parent node.
 
     Args:
         organizations_client: OrganizationsClient instance for API calls
-        parent_node: The parent OrgNode to build children for
+        parent_node: The parent OrgNode to fetch children for
 
-    Raises:
-        ClientError: If AWS API calls fail
+    Returns:
+        Tuple[List[OrgNode], bool]: Child OUs followed by child accounts, and
+        whether they were all retrieved; children fetched before an API
+        failure are kept
     """
+    children: List[OrgNode] = []
     try:
         # Get organizational units under this parent
         ous_data = organizations_client.list_organizational_units_for_parent(parent_node.id)
 
         for ou_data in ous_data:
             try:
-                # Create OU node
-                ou_node = _create_org_node_from_data(ou_data, NodeType.OU)
-
-                # Recursively build children for this OU BEFORE adding to parent
-                _build_children_recursive(organizations_client, ou_node)
-
-                parent_node.add_child(ou_node)
-
+                children.append(_create_org_node_from_data(ou_data, NodeType.OU))
             except Exception as e:
                 console.print(
                     f"[yellow]Warning: Failed to process OU {ou_data.get('Id', 'unknown')}: {str(e)}[/yellow]"
@@ -703,11 +876,7 @@ def _build_children_recursive(
 
         for account_data in accounts_data:
             try:
-                # Create account node
-                account_node = _create_org_node_from_data(account_data, NodeType.ACCOUNT)
-
-                parent_node.add_child(account_node)
-
+                children.append(_create_org_node_from_data(account_data, NodeType.ACCOUNT))
             except Exception as e:
                 console.print(
                     f"[yellow]Warning: Failed to process account {account_data.get('Id', 'unknown')}: {str(e)}[/yellow]"
@@ -720,10 +889,30 @@ def _build_children_recursive(
             f"[yellow]Warning: Failed to retrieve children for {parent_node.id}: {str(e)}[/yellow]"
         )
         # Don't re-raise here as we want to continue building the rest of the tree
+        return children, False
     except Exception as e:
         console.print(
             f"[yellow]Warning: Unexpected error building children for {parent_node.id}: {str(e)}[/yellow]"
         )
+        return children, False
+
+    return children, True
+
+
+def _build_children_recursive(
+    organizations_client: OrganizationsClientWrapper, parent_node: OrgNode
+) -> None:
+    """
+    Build all descendants (OUs and accounts) of a given parent node.
+
+    Kept for callers that build a single subtree; the subtree is built level
+    by level like build_organization_hierarchy does.
+
+    Args:
+        organizations_client: OrganizationsClient instance for API calls
+        parent_node: The parent OrgNode to build children for
+    """
+    _build_levels(organizations_client, [parent_node])
 
 
 def _create_org_node_from_data(data: Dict[str, Any], node_type: NodeType) -> OrgNode:
@@ -763,19 +952,55 @@ def _create_org_node_from_data(data: Dict[str, Any], node_type: NodeType) -> Org
     return OrgNode(id=node_id, name=node_name, type=node_type, children=[])
 
 
+def _parse_joined_timestamp(joined_timestamp: Any) -> datetime:
+    """Convert an account's JoinedTimestamp to a datetime, or datetime.min if missing."""
+    if not joined_timestamp:
+        return datetime.min
+    # AWS returns datetime objects, but ensure we handle string format too
+    if isinstance(joined_timestamp, str):
+        return datetime.fromisoformat(joined_timestamp.replace("Z", "+00:00"))
+    return cast(datetime, joined_timestamp)
+
+
+def _tags_to_dict(tags_data: Any, account_id: str) -> Dict[str, str]:
+    """Convert list_tags_for_resource output of a cached or uncached client to a dict."""
+    tags_list: List[Dict[str, str]] = []
+    if isinstance(tags_data, dict) and "Tags" in tags_data:
+        # Cached client returns {"Tags": [...]}
+        tags_list = tags_data["Tags"]
+    elif isinstance(tags_data, list):
+        # Non-cached client returns [...] directly
+        tags_list = tags_data
+    else:
+        # Fallback for unexpected types
+        console.print(
+            f"[yellow]Warning: Unexpected tags data format for account {account_id}: {type(tags_data)}[/yellow]"
+        )
+    return {tag["Key"]: tag["Value"] for tag in tags_list}
+
+
 def get_account_details(
-    organizations_client: OrganizationsClientWrapper, account_id: str
+    organizations_client: OrganizationsClientWrapper,
+    account_id: str,
+    catalog: Optional[Any] = None,
 ) -> AccountDetails:
     """
     Get comprehensive account details including metadata and organizational context.
 
     This function retrieves detailed information about an AWS account including
-    its basic metadata (name, email, status, etc.), tags, and calculates the
-    full organizational unit path from root to the account.
+    its basic metadata (name, email, status, etc.), tags, and the full
+    organizational unit path from root to the account. With a catalog, the
+    account record and OU path come from it. Otherwise, and for accounts the
+    catalog does not list, the account is looked up with describe_account and
+    its OU path is read from the hierarchy snapshot, or from its parents if no
+    snapshot is saved.
 
     Args:
         organizations_client: OrganizationsClient instance for API calls
         account_id: The unique identifier of the account to retrieve details for
+        catalog: AccountCatalog to read from, so that lookups of several
+            accounts share one list_accounts call. A single lookup without one
+            does not list the organization's accounts.
 
     Returns:
         AccountDetails: Comprehensive account information including OU path
@@ -784,64 +1009,44 @@ def get_account_details(
         ClientError: If AWS API calls fail
         ValueError: If account is not found or data is malformed
     """
+    from .account_catalog import AccountCatalog
+
+    if catalog is not None:
+        try:
+            account_details = catalog.get_account_details(account_id)
+            if account_details is not None:
+                return cast(AccountDetails, account_details)
+        except Exception as e:
+            logger.debug(f"Account catalog lookup failed for {account_id}: {e}")
+
     try:
         # Get basic account information
         account_data = organizations_client.describe_account(account_id)
         if not account_data:
             raise ValueError(f"Account {account_id} not found")
 
-        # Extract basic account information
-        account_name = account_data.get("Name", "")
-        account_email = account_data.get("Email", "")
-        account_status = account_data.get("Status", "UNKNOWN")
-        joined_timestamp = account_data.get("JoinedTimestamp")
-
-        # Convert joined timestamp to datetime if present
-        if joined_timestamp:
-            # AWS returns datetime objects, but ensure we handle string format too
-            if isinstance(joined_timestamp, str):
-                from datetime import datetime
-
-                joined_timestamp = datetime.fromisoformat(joined_timestamp.replace("Z", "+00:00"))
-        else:
-            from datetime import datetime
-
-            joined_timestamp = datetime.min
-
         # Get account tags
         try:
-            tags_data = organizations_client.list_tags_for_resource(account_id)
-
-            # Handle different return types from cached vs non-cached clients
-            tags_list: List[Dict[str, str]] = []
-            if isinstance(tags_data, dict) and "Tags" in tags_data:
-                # Cached client returns {"Tags": [...]}
-                tags_list = tags_data["Tags"]
-            elif isinstance(tags_data, list):
-                # Non-cached client returns [...] directly
-                tags_list = tags_data
-            else:
-                # Fallback for unexpected types
-                console.print(
-                    f"[yellow]Warning: Unexpected tags data format for account {account_id}: {type(tags_data)}[/yellow]"
-                )
-
-            tags = {tag["Key"]: tag["Value"] for tag in tags_list}
+            tags = _tags_to_dict(
+                organizations_client.list_tags_for_resource(account_id), account_id
+            )
         except Exception as e:
             console.print(
                 f"[yellow]Warning: Could not retrieve tags for account {account_id}: {str(e)}[/yellow]"
             )
             tags = {}
 
-        # Calculate full OU path from root to account
-        ou_path = _calculate_ou_path(organizations_client, account_id)
+        # Full OU path from root to account, from the hierarchy snapshot if one is saved
+        ou_path = (catalog or AccountCatalog(organizations_client)).find_ou_path(account_id)
+        if ou_path is None:
+            ou_path = _calculate_ou_path(organizations_client, account_id)
 
         return AccountDetails(
             id=account_id,
-            name=account_name,
-            email=account_email,
-            status=account_status,
-            joined_timestamp=joined_timestamp,
+            name=account_data.get("Name", ""),
+            email=account_data.get("Email", ""),
+            status=account_data.get("Status", "UNKNOWN"),
+            joined_timestamp=_parse_joined_timestamp(account_data.get("JoinedTimestamp")),
             tags=tags,
             ou_path=ou_path,
         )
@@ -891,40 +1096,51 @@ def search_accounts(
     query_lower = query.strip().lower()
 
     try:
-        # Get all accounts in the organization by traversing the hierarchy
-        all_accounts = _get_all_accounts_in_organization(organizations_client)
+        from .account_catalog import AccountCatalog
 
-        matching_accounts = []
+        # One list_accounts call covers every account in the organization
+        catalog = AccountCatalog(organizations_client)
 
-        for account_data in all_accounts:
-            account_id = account_data["Id"]
-            account_name = account_data.get("Name", "")
-
-            # Perform case-insensitive partial string matching on account name
-            if query_lower not in account_name.lower():
-                continue
+        # Perform case-insensitive partial string matching on account name
+        candidate_ids = [
+            account_data["Id"]
+            for account_data in _get_all_accounts_in_organization(organizations_client, catalog)
+            if query_lower in account_data.get("Name", "").lower()
+        ]
 
+        # Every candidate needs an OU path to be filtered; use the hierarchy for all of them
+        if ou_filter and len(candidate_ids) > 1:
             try:
-                # Get comprehensive account details
-                account_details = get_account_details(organizations_client, account_id)
-
-                # Apply OU filter if specified
-                if ou_filter and not _account_matches_ou_filter(account_details, ou_filter):
-                    continue
-
-                # Apply tag filter if specified
-                if tag_filter and not _account_matches_tag_filter(account_details, tag_filter):
-                    continue
+                catalog.get_organization_tree()
+            except Exception as e:
+                logger.debug(f"Falling back to per-account OU paths: {e}")
+        # Tags are shown in the results, so fetch them for the candidates at once
+        catalog.load_tags(candidate_ids)
 
-                matching_accounts.append(account_details)
+        candidate_accounts = []
 
+        for account_id in candidate_ids:
+            try:
+                # Get comprehensive account details
+                candidate_accounts.append(
+                    get_account_details(organizations_client, account_id, catalog=catalog)
+                )
             except Exception as e:
                 console.print(
                     f"[yellow]Warning: Could not get details for account {account_id}: {str(e)}[/yellow]"
                 )
                 continue
 
-        return matching_accounts
+        # Apply the OU and tag filters to the candidates
+        return [
+            account
+            for account in candidate_accounts
+            if (not ou_filter or ou_filter in account.ou_path)
+            and (
+                not tag_filter
+                or all(account.tags.get(key) == value for key, value in tag_filter.items())
+            )
+        ]
 
     except ClientError as e:
         console.print(f"[red]Error: Failed to search accounts: {str(e)}[/red]")
@@ -936,12 +1152,14 @@ def search_accounts(
 
 def _get_all_accounts_in_organization(
     organizations_client: OrganizationsClientWrapper,
+    catalog: Optional[Any] = None,
 ) -> List[Dict[str, Any]]:
     """
-    Get all accounts in the organization by traversing the complete hierarchy.
+    Get all accounts in the organization from a single list_accounts call.
 
     Args:
         organizations_client: OrganizationsClient instance for API calls
+        catalog: AccountCatalog to read from, created if not given
 
     Returns:
         List[Dict[str, Any]]: List of all account data dictionaries in the organization
@@ -949,68 +1167,11 @@ def _get_all_accounts_in_organization(
     Raises:
         ClientError: If AWS API calls fail
     """
-    all_accounts = []
-
-    # Build the organization hierarchy to get all accounts
-    organization_tree = build_organization_hierarchy(organizations_client)
-
-    # Recursively collect all accounts from the tree
-    def collect_accounts_from_node(node: OrgNode) -> None:
-        """Recursively collect account data from organization tree."""
-        if node.is_account():
-            # For account nodes, we need to get the full account data
-            try:
-                account_data = organizations_client.describe_account(node.id)
-                all_accounts.append(account_data)
-            except Exception as e:
-                console.print(
-                    f"[yellow]Warning: Could not get account data for {node.id}: {str(e)}[/yellow]"
-                )
-
-        # Recursively process children
-        for child in node.children:
-            collect_accounts_from_node(child)
-
-    # Collect accounts from all root nodes
-    for root in organization_tree:
-        collect_accounts_from_node(root)
-
-    return all_accounts
-
-
-def _account_matches_ou_filter(account_details: AccountDetails, ou_filter: str) -> bool:
-    """
-    Check if an account matches the OU filter.
+    from .account_catalog import AccountCatalog
 
-    Args:
-        account_details: AccountDetails object to check
-        ou_filter: OU ID to filter by
-
-    Returns:
-        bool: True if account is in the specified OU or its children, False otherwise
-    """
-    # Check if the account's OU path contains the specified OU
-    # This includes both direct membership and membership in child OUs
-    return ou_filter in account_details.ou_path
-
-
-def _account_matches_tag_filter(
-    account_details: AccountDetails, tag_filter: Dict[str, str]
-) -> bool:
-    """
-    Check if an account matches the tag filter.
-
-    Args:
-        account_details: AccountDetails object to check
-        tag_filter: Dictionary of tag key-value pairs to match
-
-    Returns:
-        bool: True if account has all specified tags with matching values, False otherwise
-    """
-    for tag_key, tag_value in tag_filter.items():
-        if not account_details.has_tag(tag_key, tag_value):
-            return False
-    return True
+    if catalog is None:
+        catalog = AccountCatalog(organizations_client)
+    return cast(List[Dict[str, Any]], catalog.accounts)
 
 
 def _calculate_ou_path(
@@ -1126,16 +1287,27 @@ class PolicyResolver:
     This class handles the complex logic of tracing policies from an account up through
     its organizational unit hierarchy to the root, collecting all attached policies
     at each level and determining their effective status.
+
+    The policies of each target are fetched once per resolver and shared by all
+    accounts it resolves, so accounts under the same OUs reuse the OU and root
+    lookups.
     """
 
-    def __init__(self, organizations_client: OrganizationsClientWrapper):
+    def __init__(
+        self,
+        organizations_client: OrganizationsClientWrapper,
+        max_concurrency: int = DEFAULT_HIERARCHY_CONCURRENCY,
+    ):
         """
         Initialize the PolicyResolver.
 
         Args:
             organizations_client: OrganizationsClient instance for API calls
+            max_concurrency: Maximum number of policy lookups in flight for bulk resolution
         """
         self.organizations_client = organizations_client
+        self.max_concurrency = max(1, max_concurrency)
+        self._target_policies: Dict[Tuple[str, PolicyType], PolicyList] = {}
 
     def resolve_policies_for_account(self, account_id: str) -> PolicyList:
         """
@@ -1163,37 +1335,7 @@ class PolicyResolver:
             if not hierarchy_path.ids:
                 raise ValueError(f"Could not determine hierarchy path for account {account_id}")
 
-            all_policies = []
-
-            # Traverse the hierarchy from account to root, collecting policies at each level
-            for i, target_id in enumerate(hierarchy_path.ids):
-                target_name = (
-                    hierarchy_path.names[i] if i < len(hierarchy_path.names) else target_id
-                )
-                target_type = (
-                    hierarchy_path.types[i] if i < len(hierarchy_path.types) else NodeType.OU
-                )
-
-                try:
-                    # Get SCPs attached to this target
-                    scps = self._get_policies_for_target(
-                        target_id, PolicyType.SERVICE_CONTROL_POLICY, target_name, target_type
-                    )
-                    all_policies.extend(scps)
-
-                    # Get RCPs attached to this target
-                    rcps = self._get_policies_for_target(
-                        target_id, PolicyType.RESOURCE_CONTROL_POLICY, target_name, target_type
-                    )
-                    all_policies.extend(rcps)
-
-                except Exception as e:
-                    console.print(
-                        f"[yellow]Warning: Could not get policies for {target_id} ({target_name}): {str(e)}[/yellow]"
-                    )
-                    continue
-
-            return all_policies
+            return self._collect_policies(hierarchy_path)
 
         except ClientError as e:
             console.print(
@@ -1206,6 +1348,196 @@ class PolicyResolver:
             )
             raise
 
+    def resolve_policies_for_accounts(self, account_ids: Iterable[str]) -> Dict[str, PolicyList]:
+        """
+        Resolve all SCPs and RCPs affecting each of several accounts.
+
+        The hierarchy paths of all accounts come from one organization tree,
+        and the policies of every distinct target on those paths are fetched
+        once, concurrently. Accounts under the same OUs therefore share the
+        OU and root lookups instead of repeating them.
+
+        Args:
+            account_ids: The unique identifiers of the accounts to resolve policies for
+
+        Returns:
+            Dict[str, PolicyList]: Policies affecting each account, keyed by account ID.
+            Accounts whose hierarchy path cannot be determined are left out.
+        """
+        account_ids = list(dict.fromkeys(account_ids))
+        hierarchy_paths = self._get_hierarchy_paths(account_ids)
+
+        # Every distinct target on any of the paths, with the name and type to report
+        targets: Dict[str, Tuple[str, NodeType]] = {}
+        for hierarchy_path in hierarchy_paths.values():
+            for target_id, target_name, target_type in self._path_targets(hierarchy_path):
+                targets.setdefault(target_id, (target_name, target_type))
+        self._prefetch_policies(targets)
+
+        resolved: Dict[str, PolicyList] = {}
+        for account_id in account_ids:
+            hierarchy_path = hierarchy_paths.get(account_id)
+            if hierarchy_path is None or not hierarchy_path.ids:
+                console.print(
+                    f"[yellow]Warning: Could not determine hierarchy path for account {account_id}[/yellow]"
+                )
+                continue
+            resolved[account_id] = self._collect_policies(hierarchy_path)
+
+        return resolved
+
+    def _collect_policies(self, hierarchy_path: HierarchyPath) -> PolicyList:
+        """
+        Collect the SCPs and RCPs attached to each target of a hierarchy path.
+
+        Args:
+            hierarchy_path: Path from root to account
+
+        Returns:
+            PolicyList: Policies of all targets in path order
+        """
+        all_policies = []
+
+        # Traverse the hierarchy from account to root, collecting policies at each level
+        for target_id, target_name, target_type in self._path_targets(hierarchy_path):
+            try:
+                # Get SCPs attached to this target
+                scps = self._get_shared_policies_for_target(
+                    target_id, PolicyType.SERVICE_CONTROL_POLICY, target_name, target_type
+                )
+                all_policies.extend(scps)
+
+                # Get RCPs attached to this target
+                rcps = self._get_shared_policies_for_target(
+                    target_id, PolicyType.RESOURCE_CONTROL_POLICY, target_name, target_type
+                )
+                all_policies.extend(rcps)
+
+            except Exception as e:
+                console.print(
+                    f"[yellow]Warning: Could not get policies for {target_id} ({target_name}), "
+                    f"the policies listed for this account are incomplete: {str(e)}[/yellow]"
+                )
+                continue
+
+        return all_policies
+
+    @staticmethod
+    def _path_targets(hierarchy_path: HierarchyPath) -> List[Tuple[str, str, NodeType]]:
+        """Get the ID, name and type of each target of a hierarchy path."""
+        return [
+            (
+                target_id,
+                hierarchy_path.names[i] if i < len(hierarchy_path.names) else target_id,
+                hierarchy_path.types[i] if i < len(hierarchy_path.types) else NodeType.OU,
+            )
+            for i, target_id in enumerate(hierarchy_path.ids)
+        ]
+
+    def _get_shared_policies_for_target(
+        self, target_id: str, policy_type: PolicyType, target_name: str, target_node_type: NodeType
+    ) -> PolicyList:
+        """
+        Get the policies of a target, fetching them only the first time.
+
+        Only successful lookups are remembered; a failed lookup raises and is
+        tried again the next time the target is needed.
+        """
+        key = (target_id, policy_type)
+        if key not in self._target_policies:
+            self._target_policies[key] = self._fetch_policies_for_target(
+                target_id, policy_type, target_name, target_node_type
+            )
+        return self._target_policies[key]
+
+    def _prefetch_policies(self, targets: Dict[str, Tuple[str, NodeType]]) -> None:
+        """
+        Fetch the SCPs and RCPs of targets that have not been fetched yet, concurrently.
+
+        Args:
+            targets: Target names and types keyed by target ID
+        """
+        lookups = [
+            (target_id, policy_type, target_name, target_type)
+            for target_id, (target_name, target_type) in targets.items()
+            for policy_type in (
+                PolicyType.SERVICE_CONTROL_POLICY,
+                PolicyType.RESOURCE_CONTROL_POLICY,
+            )
+            if (target_id, policy_type) not in self._target_policies
+        ]
+        if not lookups:
+            return
+
+        def fetch(lookup: Tuple[str, PolicyType, str, NodeType]) -> Optional[PolicyList]:
+            try:
+                return self._fetch_policies_for_target(*lookup)
+            except Exception as e:
+                # Left unmemoized so the lookup is retried when the target is collected
+                logger.debug(f"Prefetching {lookup[1].value} policies for {lookup[0]} failed: {e}")
+                return None
+
+        if len(lookups) == 1 or self.max_concurrency == 1:
+            results = [fetch(lookup) for lookup in lookups]
+        else:
+            client_manager = getattr(self.organizations_client, "client_manager", None)
+            if isinstance(client_manager, AWSClientManager):
+                client_manager.ensure_concurrency(self.max_concurrency)
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                results = list(executor.map(fetch, lookups))
+
+        for (target_id, policy_type, _, _), policies in zip(lookups, results):
+            if policies is not None:
+                self._target_policies[(target_id, policy_type)] = policies
+
+    def _get_hierarchy_paths(self, account_ids: List[str]) -> Dict[str, HierarchyPath]:
+        """
+        Get the hierarchy paths of several accounts.
+
+        Paths are read from the organization tree, which is built once (or
+        loaded from its snapshot) for all accounts. Accounts not found in the
+        tree, or all accounts if only one is requested, walk their parents.
+
+        Args:
+            account_ids: The unique identifiers of the accounts
+
+        Returns:
+            Dict[str, HierarchyPath]: Path from root to account, keyed by account ID
+        """
+        hierarchy_paths: Dict[str, HierarchyPath] = {}
+
+        if len(account_ids) > 1:
+            try:
+                organization_tree = build_organization_hierarchy(
+                    self.organizations_client, max_concurrency=self.max_concurrency
+                )
+                wanted = set(account_ids)
+                stack: List[Tuple[OrgNode, HierarchyPath]] = [
+                    (root, HierarchyPath(ids=[root.id], names=[root.name], types=[root.type]))
+                    for root in organization_tree
+                ]
+                while stack:
+                    node, path = stack.pop()
+                    for child in node.children:
+                        child_path = HierarchyPath(
+                            ids=path.ids + [child.id],
+                            names=path.names + [child.name],
+                            types=path.types + [child.type],
+                        )
+                        if child.is_account():
+                            if child.id in wanted:
+                                hierarchy_paths.setdefault(child.id, child_path)
+                        else:
+                            stack.append((child, child_path))
+            except Exception as e:
+                logger.debug(f"Falling back to per-account hierarchy paths: {e}")
+
+        for account_id in account_ids:
+            if account_id not in hierarchy_paths:
+                hierarchy_paths[account_id] = self._get_hierarchy_path(account_id)
+
+        return hierarchy_paths
+
     def _get_hierarchy_path(self, account_id: str) -> HierarchyPath:
         """
         Get the complete hierarchy path from account to root.
@@ -1330,6 +1662,39 @@ class PolicyResolver:
         """
         Get all policies of a specific type attached to a target.
 
+        Args:
+            target_id: The unique identifier of the target (account, OU, or root)
+            policy_type: The type of policy to retrieve (SCP or RCP)
+            target_name: Human-readable name of the target
+            target_node_type: The type of the target node
+
+        Returns:
+            PolicyList: List of PolicyInfo objects for policies attached to the target,
+            or an empty list if they could not be retrieved
+        """
+        try:
+            return self._fetch_policies_for_target(
+                target_id, policy_type, target_name, target_node_type
+            )
+        except ClientError as e:
+            console.print(
+                f"[yellow]Warning: Could not get {policy_type.value} policies for {target_id}: {str(e)}[/yellow]"
+            )
+        except Exception as e:
+            console.print(
+                f"[yellow]Warning: Unexpected error getting {policy_type.value} policies for {target_id}: {str(e)}[/yellow]"
+            )
+        return []
+
+    def _fetch_policies_for_target(
+        self, target_id: str, policy_type: PolicyType, target_name: str, target_node_type: NodeType
+    ) -> PolicyList:
+        """
+        Fetch all policies of a specific type attached to a target.
+
+        A policy type that is not enabled for the organization is reported as
+        having no policies; any other failure is raised.
+
         Args:
             target_id: The unique identifier of the target (account, OU, or root)
             policy_type: The type of policy to retrieve (SCP or RCP)
@@ -1349,39 +1714,6 @@ class PolicyResolver:
             policy_data_list = self.organizations_client.list_policies_for_target(
                 target_id, policy_type.value
             )
-
-            for policy_data in policy_data_list:
-                try:
-                    # Extract policy information
-                    policy_id = policy_data.get("Id", "")
-                    policy_name = policy_data.get("Name", policy_id)
-                    policy_description = policy_data.get("Description", "")
-                    aws_managed = policy_data.get("AwsManaged", False)
-
-                    # Determine effective status
-                    # For now, we assume all attached policies are enabled
-                    # In the future, this could be enhanced to check for conditional policies
-                    effective_status = self._determine_policy_status(policy_data, target_node_type)
-
-                    policy_info = PolicyInfo(
-                        id=policy_id,
-                        name=policy_name,
-                        type=policy_type,
-                        description=policy_description,
-                        aws_managed=aws_managed,
-                        attachment_point=target_id,
-                        attachment_point_name=target_name,
-                        effective_status=effective_status,
-                    )
-
-                    policies.append(policy_info)
-
-                except Exception as e:
-                    console.print(
-                        f"[yellow]Warning: Could not process policy data for {target_id}: {str(e)}[/yellow]"
-                    )
-                    continue
-
         except ClientError as e:
             # If the target doesn't support the policy type, that's expected
             if "PolicyTypeNotEnabledException" in str(
@@ -1390,14 +1722,40 @@ class PolicyResolver:
                 console.print(
                     f"[dim]Policy type {policy_type.value} not enabled for target {target_id}[/dim]"
                 )
-            else:
+                return policies
+            raise
+
+        for policy_data in policy_data_list:
+            try:
+                # Extract policy information
+                policy_id = policy_data.get("Id", "")
+                policy_name = policy_data.get("Name", policy_id)
+                policy_description = policy_data.get("Description", "")
+                aws_managed = policy_data.get("AwsManaged", False)
+
+                # Determine effective status
+                # For now, we assume all attached policies are enabled
+                # In the future, this could be enhanced to check for conditional policies
+                effective_status = self._determine_policy_status(policy_data, target_node_type)
+
+                policy_info = PolicyInfo(
+                    id=policy_id,
+                    name=policy_name,
+                    type=policy_type,
+                    description=policy_description,
+                    aws_managed=aws_managed,
+                    attachment_point=target_id,
+                    attachment_point_name=target_name,
+                    effective_status=effective_status,
+                )
+
+                policies.append(policy_info)
+
+            except Exception as e:
                 console.print(
-                    f"[yellow]Warning: Could not get {policy_type.value} policies for {target_id}: {str(e)}[/yellow]"
+                    f"[yellow]Warning: Could not process policy data for {target_id}: {str(e)}[/yellow]"
                 )
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Unexpected error getting {policy_type.value} policies for {target_id}: {str(e)}[/yellow]"
-            )
+                continue
 
         return policies
 
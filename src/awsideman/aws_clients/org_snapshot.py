@@ -0,0 +1,139 @@
+"""Persisted snapshots of the organization hierarchy.
+
+Building the hierarchy takes two Organizations calls per root and OU. The
+finished tree is therefore saved as a single cache entry, and later commands
+load it with one cache read instead of walking the organization again.
+
+Each snapshot records the format version it was written with. Entries from
+another version are ignored, and the tree is rebuilt. Snapshots are stored
+under the ``organization`` resource prefix. Invalidating organization data
+therefore drops the snapshot as well, and it expires with the cache's default
+TTL like the calls it replaces.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..cache.key_builder import CacheKeyBuilder
+from ..cache.manager import CacheManager
+from ..utils.models import OrganizationTree, OrgNode
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout changes; older snapshots are then rebuilt
+HIERARCHY_SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class OrganizationSnapshot:
+    """A saved organization hierarchy."""
+
+    roots: OrganizationTree
+    created_at: float
+    version: int = HIERARCHY_SNAPSHOT_VERSION
+
+    def age_seconds(self) -> float:
+        """Get the age of the snapshot in seconds."""
+        return time.time() - self.created_at
+
+
+class OrganizationSnapshotStore:
+    """Loads and saves hierarchy snapshots for one profile and region."""
+
+    def __init__(
+        self,
+        cache_manager: CacheManager,
+        profile: Optional[str] = None,
+        region: Optional[str] = None,
+    ):
+        """
+        Initialize the snapshot store.
+
+        Args:
+            cache_manager: CacheManager that persists the snapshot
+            profile: AWS profile the hierarchy belongs to
+            region: AWS region the hierarchy was read from
+        """
+        self.cache_manager = cache_manager
+        self.key = CacheKeyBuilder.build_key(
+            "organization",
+            "get",
+            "hierarchy",
+            profile=profile or "default",
+            region=region or "us-east-1",
+        )
+
+    @classmethod
+    def for_client(cls, organizations_client: Any) -> Optional["OrganizationSnapshotStore"]:
+        """
+        Get the snapshot store of a cached Organizations client.
+
+        Args:
+            organizations_client: Organizations client used to build the hierarchy
+
+        Returns:
+            Snapshot store, or None if the client does not use the cache
+        """
+        cache_manager = getattr(organizations_client, "cache_manager", None)
+        if not isinstance(cache_manager, CacheManager):
+            return None
+
+        client_manager = getattr(organizations_client, "client_manager", None)
+        profile = getattr(client_manager, "profile", None)
+        region = getattr(client_manager, "region", None)
+        return cls(
+            cache_manager,
+            profile=profile if isinstance(profile, str) else None,
+            region=region if isinstance(region, str) else None,
+        )
+
+    def load(self) -> Optional[OrganizationSnapshot]:
+        """
+        Load the saved snapshot.
+
+        Returns:
+            The snapshot, or None if there is none or it cannot be used
+        """
+        try:
+            data = self.cache_manager.get(self.key)
+            if not isinstance(data, dict):
+                return None
+            if data.get("version") != HIERARCHY_SNAPSHOT_VERSION:
+                logger.debug(f"Ignoring organization snapshot with version {data.get('version')}")
+                return None
+            return OrganizationSnapshot(
+                roots=[OrgNode.from_dict(root) for root in data["roots"]],
+                created_at=float(data["created_at"]),
+                version=HIERARCHY_SNAPSHOT_VERSION,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load organization snapshot: {e}")
+            return None
+
+    def save(self, organization_tree: OrganizationTree) -> None:
+        """
+        Save a hierarchy as the current snapshot.
+
+        Args:
+            organization_tree: Root nodes of the complete hierarchy
+        """
+        try:
+            self.cache_manager.set(
+                self.key,
+                {
+                    "version": HIERARCHY_SNAPSHOT_VERSION,
+                    "created_at": time.time(),
+                    "roots": [root.to_dict() for root in organization_tree],
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save organization snapshot: {e}")
+
+    def invalidate(self) -> None:
+        """Remove the saved snapshot."""
+        try:
+            self.cache_manager.invalidate(self.key)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate organization snapshot: {e}")
@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 
-from ..aws_clients import AWSClientManager
+from ..aws_clients import AsyncAWSClientManager, AWSClientManager
 from .cross_account import CrossAccountClientManager
 from .interfaces import CollectorInterface
 from .models import (
@@ -33,6 +33,9 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent lookups when collecting without asyncio clients
+DEFAULT_MAX_CONCURRENCY = 10
+
 
 class IdentityCenterCollector(CollectorInterface):
     """
@@ -40,16 +43,25 @@ class IdentityCenterCollector(CollectorInterface):
     and incremental backups.
     """
 
-    def __init__(self, client_manager: AWSClientManager, instance_arn: str):
+    def __init__(
+        self,
+        client_manager: AWSClientManager,
+        instance_arn: str,
+        async_client_manager: Optional[AsyncAWSClientManager] = None,
+    ):
         """
         Initialize the Identity Center collector.
 
         Args:
             client_manager: AWS client manager for service connections
             instance_arn: ARN of the Identity Center instance
+            async_client_manager: Optional asyncio clients; when given, users,
+                groups, permission sets and assignments are collected with
+                concurrent non-blocking requests instead of blocking calls
         """
         self.client_manager = client_manager
         self.instance_arn = instance_arn
+        self.async_client_manager = async_client_manager
         self._identity_center_client = None
         self._identity_store_client = None
         self._organizations_client = None
@@ -103,9 +115,14 @@ class IdentityCenterCollector(CollectorInterface):
         if self._identity_store_id is None:
             try:
                 # Try the list instances approach first as it's more reliable
-                response = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: self.identity_center_client.list_instances()
-                )
+                if self.async_client_manager is not None:
+                    response = (
+                        await self.async_client_manager.get_identity_center_client().list_instances()
+                    )
+                else:
+                    response = await asyncio.get_event_loop().run_in_executor(
+                        None, lambda: self.identity_center_client.list_instances()
+                    )
                 instances = response.get("Instances", [])
                 for instance in instances:
                     if instance.get("InstanceArn") == self.instance_arn:
@@ -189,23 +206,23 @@ class IdentityCenterCollector(CollectorInterface):
             identity_store_id = await self.get_identity_store_id()
 
             # Use pagination to get all users
-            paginator = self.identity_store_client.get_paginator("list_users")
-            page_iterator = paginator.paginate(IdentityStoreId=identity_store_id)
+            raw_users = await self._paginate(
+                "identitystore", "list_users", "Users", IdentityStoreId=identity_store_id
+            )
 
-            for page in page_iterator:
-                for user in page.get("Users", []):
-                    # Skip inactive users if not requested
-                    if not options.include_inactive_users and not user.get("Active", True):
-                        continue
+            for user in raw_users:
+                # Skip inactive users if not requested
+                if not options.include_inactive_users and not user.get("Active", True):
+                    continue
 
-                    # For incremental backups, check modification time
-                    if options.backup_type == BackupType.INCREMENTAL and options.since:
-                        # AWS doesn't provide modification timestamps for users in list operation
-                        # We'll need to get detailed user info to check timestamps
-                        pass
+                # For incremental backups, check modification time
+                if options.backup_type == BackupType.INCREMENTAL and options.since:
+                    # AWS doesn't provide modification timestamps for users in list operation
+                    # We'll need to get detailed user info to check timestamps
+                    pass
 
-                    user_data = await self._convert_user_data(user, identity_store_id)
-                    users.append(user_data)
+                user_data = await self._convert_user_data(user, identity_store_id)
+                users.append(user_data)
 
             self._collection_stats["users"]["count"] = len(users)
             self._collection_stats["users"]["duration"] = time.time() - start_time
@@ -237,13 +254,14 @@ class IdentityCenterCollector(CollectorInterface):
             identity_store_id = await self.get_identity_store_id()
 
             # Use pagination to get all groups
-            paginator = self.identity_store_client.get_paginator("list_groups")
-            page_iterator = paginator.paginate(IdentityStoreId=identity_store_id)
+            raw_groups = await self._paginate(
+                "identitystore", "list_groups", "Groups", IdentityStoreId=identity_store_id
+            )
 
-            for page in page_iterator:
-                for group in page.get("Groups", []):
-                    group_data = await self._convert_group_data(group, identity_store_id)
-                    groups.append(group_data)
+            # Group members are fetched concurrently when asyncio clients are available
+            groups = await self._gather_bounded(
+                [self._convert_group_data(group, identity_store_id) for group in raw_groups]
+            )
 
             self._collection_stats["groups"]["count"] = len(groups)
             self._collection_stats["groups"]["duration"] = time.time() - start_time
@@ -272,17 +290,13 @@ class IdentityCenterCollector(CollectorInterface):
         permission_sets = []
 
         try:
-            # Use pagination to get all permission sets
-            paginator = self.identity_center_client.get_paginator("list_permission_sets")
-            page_iterator = paginator.paginate(InstanceArn=self.instance_arn)
-
             # Collect permission set ARNs first
-            permission_set_arns = []
-            for page in page_iterator:
-                permission_set_arns.extend(page.get("PermissionSets", []))
+            permission_set_arns = await self._get_permission_set_arns()
 
             # Use parallel processing to get detailed permission set data
-            if options.parallel_collection:
+            if self.async_client_manager is not None:
+                permission_sets = await self._collect_permission_sets_async(permission_set_arns)
+            elif options.parallel_collection:
                 permission_sets = await self._collect_permission_sets_parallel(permission_set_arns)
             else:
                 permission_sets = await self._collect_permission_sets_sequential(
@@ -319,62 +333,64 @@ class IdentityCenterCollector(CollectorInterface):
             # Get all permission sets first
             permission_set_arns = await self._get_permission_set_arns()
 
-            # For each permission set, get the accounts where it's provisioned
-            for ps_arn in permission_set_arns:
-                try:
-                    # Get accounts where this permission set is provisioned
-                    accounts_response = (
-                        self.identity_center_client.list_accounts_for_provisioned_permission_set(
+            if self.async_client_manager is not None:
+                assignments = await self._collect_assignments_async(permission_set_arns)
+            else:
+                # For each permission set, get the accounts where it's provisioned
+                for ps_arn in permission_set_arns:
+                    try:
+                        # Get accounts where this permission set is provisioned
+                        client = self.identity_center_client
+                        accounts_response = client.list_accounts_for_provisioned_permission_set(
                             InstanceArn=self.instance_arn,
                             PermissionSetArn=ps_arn,
                         )
-                    )
 
-                    provisioned_accounts = accounts_response.get("AccountIds", [])
+                        provisioned_accounts = accounts_response.get("AccountIds", [])
 
-                    # For each provisioned account, get assignments
-                    for account_id in provisioned_accounts:
-                        try:
-                            # Get all assignments for this account and permission set
-                            paginator = self.identity_center_client.get_paginator(
-                                "list_account_assignments"
-                            )
-                            page_iterator = paginator.paginate(
-                                InstanceArn=self.instance_arn,
-                                AccountId=account_id,
-                                PermissionSetArn=ps_arn,
-                            )
+                        # For each provisioned account, get assignments
+                        for account_id in provisioned_accounts:
+                            try:
+                                # Get all assignments for this account and permission set
+                                paginator = self.identity_center_client.get_paginator(
+                                    "list_account_assignments"
+                                )
+                                page_iterator = paginator.paginate(
+                                    InstanceArn=self.instance_arn,
+                                    AccountId=account_id,
+                                    PermissionSetArn=ps_arn,
+                                )
 
-                            for page in page_iterator:
-                                for assignment in page.get("AccountAssignments", []):
-                                    assignments.append(
-                                        AssignmentData(
-                                            account_id=account_id,
-                                            permission_set_arn=ps_arn,
-                                            principal_type=assignment["PrincipalType"],
-                                            principal_id=assignment["PrincipalId"],
+                                for page in page_iterator:
+                                    for assignment in page.get("AccountAssignments", []):
+                                        assignments.append(
+                                            AssignmentData(
+                                                account_id=account_id,
+                                                permission_set_arn=ps_arn,
+                                                principal_type=assignment["PrincipalType"],
+                                                principal_id=assignment["PrincipalId"],
+                                            )
                                         )
-                                    )
 
-                        except ClientError as e:
-                            # Some accounts might not have assignments, which is normal
-                            if e.response["Error"]["Code"] not in [
-                                "ResourceNotFoundException",
-                                "AccessDeniedException",
-                            ]:
-                                logger.warning(
-                                    f"Failed to get assignments for account {account_id}: {e}"
-                                )
+                            except ClientError as e:
+                                # Some accounts might not have assignments, which is normal
+                                if e.response["Error"]["Code"] not in [
+                                    "ResourceNotFoundException",
+                                    "AccessDeniedException",
+                                ]:
+                                    logger.warning(
+                                        f"Failed to get assignments for account {account_id}: {e}"
+                                    )
 
-                except ClientError as e:
-                    # Some permission sets might not be provisioned anywhere
-                    if e.response["Error"]["Code"] not in [
-                        "ResourceNotFoundException",
-                        "AccessDeniedException",
-                    ]:
-                        logger.warning(
-                            f"Failed to get provisioned accounts for permission set {ps_arn}: {e}"
-                        )
+                    except ClientError as e:
+                        # Some permission sets might not be provisioned anywhere
+                        if e.response["Error"]["Code"] not in [
+                            "ResourceNotFoundException",
+                            "AccessDeniedException",
+                        ]:
+                            logger.warning(
+                                f"Failed to get provisioned accounts for permission set {ps_arn}: {e}"
+                            )
 
             self._collection_stats["assignments"]["count"] = len(assignments)
             self._collection_stats["assignments"]["duration"] = time.time() - start_time
@@ -769,6 +785,40 @@ class IdentityCenterCollector(CollectorInterface):
             relationships=relationships,
         )
 
+    async def _paginate(
+        self, service_name: str, operation: str, result_key: str, **params: Any
+    ) -> List[Any]:
+        """Fetch all items of a paginated operation with the async or blocking client."""
+        if self.async_client_manager is not None:
+            return await self.async_client_manager.paginate(
+                service_name, operation, result_key, **params
+            )
+
+        client = (
+            self.identity_store_client
+            if service_name == "identitystore"
+            else self.identity_center_client
+        )
+        items: List[Any] = []
+        for page in client.get_paginator(operation).paginate(**params):
+            items.extend(page.get(result_key, []))
+        return items
+
+    async def _gather_bounded(self, coroutines: List[Any]) -> List[Any]:
+        """Run coroutines concurrently, at most max_concurrency at a time, keeping order."""
+        limit = (
+            self.async_client_manager.max_concurrency
+            if self.async_client_manager is not None
+            else DEFAULT_MAX_CONCURRENCY
+        )
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(coroutine: Any) -> Any:
+            async with semaphore:
+                return await coroutine
+
+        return list(await asyncio.gather(*(bounded(coroutine) for coroutine in coroutines)))
+
     async def _convert_user_data(self, user: Dict[str, Any], identity_store_id: str) -> UserData:
         """Convert AWS API user data to UserData model."""
         # Get external IDs if available
@@ -792,14 +842,15 @@ class IdentityCenterCollector(CollectorInterface):
         # Get group members
         members = []
         try:
-            paginator = self.identity_store_client.get_paginator("list_group_memberships")
-            page_iterator = paginator.paginate(
-                IdentityStoreId=identity_store_id, GroupId=group["GroupId"]
+            memberships = await self._paginate(
+                "identitystore",
+                "list_group_memberships",
+                "GroupMemberships",
+                IdentityStoreId=identity_store_id,
+                GroupId=group["GroupId"],
             )
-
-            for page in page_iterator:
-                for membership in page.get("GroupMemberships", []):
-                    members.append(membership["MemberId"]["UserId"])
+            for membership in memberships:
+                members.append(membership["MemberId"]["UserId"])
         except ClientError as e:
             logger.warning(f"Failed to get members for group {group['GroupId']}: {e}")
 
@@ -853,6 +904,154 @@ class IdentityCenterCollector(CollectorInterface):
 
         return permission_sets
 
+    async def _collect_permission_sets_async(
+        self, permission_set_arns: List[str]
+    ) -> List[PermissionSetData]:
+        """Collect permission set details concurrently with the asyncio clients."""
+        results = await self._gather_bounded(
+            [self._get_permission_set_details_async(arn) for arn in permission_set_arns]
+        )
+        return [permission_set for permission_set in results if permission_set]
+
+    async def _get_permission_set_details_async(
+        self, permission_set_arn: str
+    ) -> Optional[PermissionSetData]:
+        """Get detailed permission set information, issuing the lookups concurrently."""
+        assert self.async_client_manager is not None
+        client = self.async_client_manager.get_identity_center_client()
+        params = {"InstanceArn": self.instance_arn, "PermissionSetArn": permission_set_arn}
+
+        (
+            describe_response,
+            policy_response,
+            managed_policies,
+            customer_managed_policies,
+            boundary_response,
+        ) = await asyncio.gather(
+            client.describe_permission_set(**params),
+            client.get_inline_policy_for_permission_set(**params),
+            client.paginate(
+                "list_managed_policies_in_permission_set", "AttachedManagedPolicies", **params
+            ),
+            client.paginate(
+                "list_customer_managed_policy_references_in_permission_set",
+                "CustomerManagedPolicyReferences",
+                **params,
+            ),
+            client.get_permissions_boundary_for_permission_set(**params),
+            return_exceptions=True,
+        )
+
+        if isinstance(describe_response, BaseException):
+            logger.error(
+                f"Failed to get permission set details for {permission_set_arn}: "
+                f"{describe_response}"
+            )
+            return None
+
+        optional_lookups = {
+            "inline policy": policy_response,
+            "managed policies": managed_policies,
+            "customer managed policies": customer_managed_policies,
+            "permissions boundary": boundary_response,
+        }
+        for lookup, result in optional_lookups.items():
+            if isinstance(result, BaseException) and not (
+                isinstance(result, ClientError)
+                and result.response["Error"]["Code"] == "ResourceNotFoundException"
+            ):
+                logger.warning(f"Failed to get {lookup} for {permission_set_arn}: {result}")
+
+        def value(result: Any, default: Any) -> Any:
+            return default if isinstance(result, BaseException) else result
+
+        ps_info = describe_response["PermissionSet"]
+        return PermissionSetData(
+            permission_set_arn=permission_set_arn,
+            name=ps_info["Name"],
+            description=ps_info.get("Description"),
+            session_duration=ps_info.get("SessionDuration"),
+            relay_state=ps_info.get("RelayState"),
+            inline_policy=value(policy_response, {}).get("InlinePolicy"),
+            managed_policies=[policy["Arn"] for policy in value(managed_policies, [])],
+            customer_managed_policies=value(customer_managed_policies, []),
+            permissions_boundary=value(boundary_response, {}).get("PermissionsBoundary"),
+        )
+
+    async def _collect_assignments_async(
+        self, permission_set_arns: List[str]
+    ) -> List[AssignmentData]:
+        """Collect the assignments of every provisioned permission set concurrently."""
+        assert self.async_client_manager is not None
+        client = self.async_client_manager.get_identity_center_client()
+
+        async def provisioned_accounts(ps_arn: str) -> List[str]:
+            try:
+                return await client.paginate(
+                    "list_accounts_for_provisioned_permission_set",
+                    "AccountIds",
+                    InstanceArn=self.instance_arn,
+                    PermissionSetArn=ps_arn,
+                )
+            except ClientError as e:
+                # Some permission sets might not be provisioned anywhere
+                if e.response["Error"]["Code"] not in [
+                    "ResourceNotFoundException",
+                    "AccessDeniedException",
+                ]:
+                    logger.warning(
+                        f"Failed to get provisioned accounts for permission set {ps_arn}: {e}"
+                    )
+                return []
+
+        accounts_per_permission_set = await self._gather_bounded(
+            [provisioned_accounts(ps_arn) for ps_arn in permission_set_arns]
+        )
+
+        results = await self._gather_bounded(
+            [
+                self._get_assignments_async(account_id, ps_arn)
+                for ps_arn, account_ids in zip(permission_set_arns, accounts_per_permission_set)
+                for account_id in account_ids
+            ]
+        )
+        return [assignment for assignments in results for assignment in assignments]
+
+    async def _get_assignments_async(
+        self, account_id: str, permission_set_arn: str
+    ) -> List[AssignmentData]:
+        """Get assignments for a specific account and permission set with the asyncio clients."""
+        assert self.async_client_manager is not None
+        try:
+            raw_assignments = await self.async_client_manager.paginate(
+                "sso-admin",
+                "list_account_assignments",
+                "AccountAssignments",
+                InstanceArn=self.instance_arn,
+                AccountId=account_id,
+                PermissionSetArn=permission_set_arn,
+            )
+        except ClientError as e:
+            # Some combinations might not have assignments, which is normal
+            if e.response["Error"]["Code"] not in [
+                "ResourceNotFoundException",
+                "AccessDeniedException",
+            ]:
+                logger.warning(
+                    f"Failed to get assignments for {account_id}/{permission_set_arn}: {e}"
+                )
+            return []
+
+        return [
+            AssignmentData(
+                account_id=account_id,
+                permission_set_arn=permission_set_arn,
+                principal_type=assignment["PrincipalType"],
+                principal_id=assignment["PrincipalId"],
+            )
+            for assignment in raw_assignments
+        ]
+
     def _get_permission_set_details(self, permission_set_arn: str) -> Optional[PermissionSetData]:
         """Get detailed permission set information."""
         try:
@@ -977,14 +1176,10 @@ class IdentityCenterCollector(CollectorInterface):
 
     async def _get_permission_set_arns(self) -> List[str]:
         """Get all permission set ARNs."""
-        permission_set_arns = []
-
         try:
-            paginator = self.identity_center_client.get_paginator("list_permission_sets")
-            page_iterator = paginator.paginate(InstanceArn=self.instance_arn)
-
-            for page in page_iterator:
-                permission_set_arns.extend(page.get("PermissionSets", []))
+            permission_set_arns = await self._paginate(
+                "sso-admin", "list_permission_sets", "PermissionSets", InstanceArn=self.instance_arn
+            )
         except ClientError as e:
             logger.error(f"Failed to get permission set ARNs: {e}")
             raise
@@ -10,7 +10,12 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from ..aws_clients import AWSClientManager, CachedIdentityCenterClient, CachedIdentityStoreClient
+from ..aws_clients import (
+    AsyncAWSClientManager,
+    AWSClientManager,
+    CachedIdentityCenterClient,
+    CachedIdentityStoreClient,
+)
 from .cross_account import (
     CrossAccountClientManager,
     CrossAccountPermissionValidator,
@@ -926,17 +931,19 @@ class CrossAccountRestoreManager(RestoreManagerInterface):
             # Get appropriate client manager (cross-account or local)
             target_client_manager = await self._get_target_client_manager(options)
 
-            # Create restore processor with target client manager
-            identity_center_client = target_client_manager.get_identity_center_client()
-            identity_store_client = target_client_manager.get_identity_store_client()
+            # Create restore processor with asyncio clients for the target environment
             conflict_resolver = ConflictResolver(options.conflict_strategy)
+            async with AsyncAWSClientManager.from_client_manager(
+                target_client_manager
+            ) as async_client_manager:
+                restore_processor = RestoreProcessor(
+                    async_client_manager.get_identity_center_client(),
+                    async_client_manager.get_identity_store_client(),
+                    conflict_resolver,
+                )
 
-            restore_processor = RestoreProcessor(
-                identity_center_client, identity_store_client, conflict_resolver
-            )
-
-            # Process the restore
-            restore_result = await restore_processor.process_restore(backup_data, options)
+                # Process the restore
+                restore_result = await restore_processor.process_restore(backup_data, options)
 
             return restore_result
 
@@ -428,6 +428,9 @@ class BatchProcessor:
         self.batch_size = batch_size
         self.retry_handler = RetryHandler()
 
+        # Size the shared client connection pools for the worker threads
+        aws_client_manager.ensure_concurrency(batch_size)
+
         # Initialize AWS clients
         self.sso_admin_client = aws_client_manager.get_identity_center_client()
         self.identity_store_client = aws_client_manager.get_identity_store_client()
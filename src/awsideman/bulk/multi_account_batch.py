@@ -666,6 +666,14 @@ class MultiAccountBatchProcessor(BatchProcessor):
         """
         return self.backoff_manager.get_manager_stats()
 
+    def get_client_pool_stats(self) -> Dict[str, Any]:
+        """Get connection usage and pool wait times of the shared AWS clients.
+
+        Returns:
+            Dictionary with the pool size and per-service wait statistics
+        """
+        return self.aws_client_manager.get_client_pool_stats()
+
     def reset_intelligent_backoff_contexts(self):
         """Reset all intelligent backoff contexts and circuit breakers."""
         self.backoff_manager.reset_all_contexts()
@@ -400,7 +400,8 @@ class PreviewGenerator:
         # Parse assignments from file
         assignments = processor.parse_assignments()
 
-        # Resolve names to IDs/ARNs
+        # Resolve names to IDs/ARNs, loading persisted resolutions in one cache read
+        resolver.prefetch_cached_resolutions(assignments)
         resolved_assignments = []
         for assignment in assignments:
             resolved_assignment = resolver.resolve_assignment(assignment)
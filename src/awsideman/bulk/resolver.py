@@ -76,17 +76,17 @@ class ResourceResolver:
         """
         cache_key = f"principal:{principal_type}:{principal_name}"
 
-        # Check persistent cache first
+        # Check in-memory cache first
+        if cache_key in self._principal_cache:
+            return self._principal_cache[cache_key]
+
+        # Then the persistent cache
         try:
             cached_result = self.cache_manager.get(cache_key)
             if cached_result is not None:
                 return ResolutionResult(**cached_result)
         except Exception:
-            pass  # Fall back to in-memory cache
-
-        # Check in-memory cache
-        if cache_key in self._principal_cache:
-            return self._principal_cache[cache_key]
+            pass  # Resolve through the API
 
         try:
             if principal_type.upper() == "USER":
@@ -193,17 +193,17 @@ class ResourceResolver:
         """
         cache_key = f"permission_set:{permission_set_name}"
 
-        # Check persistent cache first
+        # Check in-memory cache first
+        if permission_set_name in self._permission_set_cache:
+            return self._permission_set_cache[permission_set_name]
+
+        # Then the persistent cache
         try:
             cached_result = self.cache_manager.get(cache_key)
             if cached_result is not None:
                 return ResolutionResult(**cached_result)
         except Exception:
-            pass  # Fall back to in-memory cache
-
-        # Check in-memory cache
-        if permission_set_name in self._permission_set_cache:
-            return self._permission_set_cache[permission_set_name]
+            pass  # Resolve through the API
 
         try:
             # List all permission sets with pagination and find by name
@@ -300,17 +300,17 @@ class ResourceResolver:
         """
         cache_key = f"account:{account_name}"
 
-        # Check persistent cache first
+        # Check in-memory cache first
+        if account_name in self._account_cache:
+            return self._account_cache[account_name]
+
+        # Then the persistent cache
         try:
             cached_result = self.cache_manager.get(cache_key)
             if cached_result is not None:
                 return ResolutionResult(**cached_result)
         except Exception:
-            pass  # Fall back to in-memory cache
-
-        # Check in-memory cache
-        if account_name in self._account_cache:
-            return self._account_cache[account_name]
+            pass  # Resolve through the API
 
         try:
             # Try to resolve account individually first (faster for single accounts)
@@ -558,12 +558,61 @@ class ResourceResolver:
             "account_mappings_cached": stats["account_mappings"],
         }
 
+    def prefetch_cached_resolutions(self, assignments: List[Dict[str, Any]]) -> int:
+        """Load persisted resolutions for a batch of assignments with one cache read.
+
+        Every principal, permission set and account name referenced by the
+        assignments is looked up in a single ``get_many`` call and the hits are
+        copied into the in-memory caches, so the per-assignment resolution that
+        follows does not go back to the persistent cache.
+
+        Args:
+            assignments: List of assignment dictionaries
+
+        Returns:
+            Number of resolutions loaded from the persistent cache
+        """
+        targets: Dict[str, Any] = {}
+        for assignment in assignments:
+            principal_name = assignment.get("principal_name")
+            principal_type = assignment.get("principal_type", "USER")
+            permission_set_name = assignment.get("permission_set_name")
+            account_name = assignment.get("account_name")
+
+            if principal_name:
+                cache_key = f"principal:{principal_type}:{principal_name}"
+                targets[cache_key] = (self._principal_cache, cache_key)
+            if permission_set_name:
+                targets[f"permission_set:{permission_set_name}"] = (
+                    self._permission_set_cache,
+                    permission_set_name,
+                )
+            if account_name and not (account_name.isdigit() and len(account_name) == 12):
+                targets[f"account:{account_name}"] = (self._account_cache, account_name)
+
+        try:
+            cached_results = self.cache_manager.get_many(list(targets))
+        except Exception:
+            return 0  # Resolve through the API
+
+        loaded = 0
+        for cache_key, cached_result in cached_results.items():
+            memory_cache, memory_key = targets[cache_key]
+            try:
+                memory_cache[memory_key] = ResolutionResult(**cached_result)
+                loaded += 1
+            except TypeError:
+                continue
+        return loaded
+
     def warm_cache_for_assignments(self, assignments: List[Dict[str, Any]]) -> None:
         """Pre-warm caches for a list of assignments to optimize batch processing.
 
         Args:
             assignments: List of assignment dictionaries
         """
+        self.prefetch_cached_resolutions(assignments)
+
         # Extract unique names for pre-warming
         principal_names = set()
         permission_set_names = set()
@@ -579,7 +628,7 @@ class ResourceResolver:
                 principal_names.add((principal_name, principal_type))
             if permission_set_name:
                 permission_set_names.add(permission_set_name)
-            if account_name:
+            if account_name and account_name not in self._account_cache:
                 account_names.add(account_name)
 
         # Pre-populate account cache first (most expensive operation)
@@ -603,7 +652,7 @@ class ResourceResolver:
 
         # Pre-resolve principals
         for principal_name, principal_type in principal_names:
-            cache_key = f"{principal_type}:{principal_name}"
+            cache_key = f"principal:{principal_type}:{principal_name}"
             if cache_key not in self._principal_cache:
                 try:
                     self.resolve_principal_name(principal_name, principal_type)
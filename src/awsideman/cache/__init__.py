@@ -22,6 +22,7 @@ from .backends.dynamodb import DynamoDBBackend
 from .backends.file import FileBackend
 from .backends.hybrid import HybridBackend
 from .config import AdvancedCacheConfig
+from .dependencies import DependencyIndex, dependency_tags, resource_tag
 
 # Error handling and circuit breaker
 from .errors import (
@@ -63,6 +64,7 @@ from .key_builder import (
 
 # Core cache management
 from .manager import CacheManager
+from .sweeper import ExpirySweeper
 from .utils import CachePathManager
 
 # Cache models and metrics - removed legacy models
@@ -75,6 +77,7 @@ __all__ = [
     "CachePathManager",
     "BackendFactory",
     "AdvancedCacheConfig",
+    "ExpirySweeper",
     # Cache key generation
     "CacheKeyBuilder",
     "CacheKeyValidationError",
@@ -91,6 +94,9 @@ __all__ = [
     "invalidate_group_cache",
     "invalidate_permission_set_cache",
     "invalidate_assignment_cache",
+    "DependencyIndex",
+    "dependency_tags",
+    "resource_tag",
     # Cache models and metrics - removed legacy models
     # Error handling and circuit breaker
     "CacheError",
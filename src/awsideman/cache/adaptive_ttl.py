@@ -0,0 +1,299 @@
+"""Adaptive per-operation TTLs learned from how often refreshed values change.
+
+Every time a cached AWS response is fetched again, its fingerprint is compared
+with the fingerprint stored for the same cache key on the previous fetch. The
+outcome is counted for the key family (the AWS operation) and moves the
+family's TTL:
+
+- an unchanged refresh lengthens the TTL by ``increase_factor``
+- a changed refresh shortens it by ``decrease_factor``
+
+The TTL starts at the operation's configured TTL and always stays within
+``[min_ttl, max_ttl]``. Stable data such as permission set definitions drifts
+towards the upper bound and is fetched less often, while volatile data such
+as group memberships drifts towards the lower bound.
+
+With a state file, the learned TTLs and the fingerprints of recently fetched
+keys are saved next to the cache and loaded by the next process, so short
+CLI runs keep learning where the previous run stopped.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default TTL bounds in seconds
+DEFAULT_ADAPTIVE_TTL_MIN = 60
+DEFAULT_ADAPTIVE_TTL_MAX = 86400
+
+# Multipliers applied after an unchanged and a changed refresh
+DEFAULT_INCREASE_FACTOR = 1.25
+DEFAULT_DECREASE_FACTOR = 0.5
+
+# Fingerprints are kept for at most this many keys, least recently fetched first out
+DEFAULT_MAX_TRACKED_KEYS = 10000
+
+# File name of the learned state kept in local cache directories
+ADAPTIVE_TTL_STATE_FILE_NAME = "_adaptive_ttl.state"
+
+# Seconds between saves of the learned state while values are being observed
+DEFAULT_SAVE_INTERVAL = 30.0
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Return a stable digest of an API response.
+
+    Args:
+        value: Response data, usually JSON-like dicts and lists
+
+    Returns:
+        Hex digest that changes whenever the response content changes
+    """
+    try:
+        payload = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    except (TypeError, ValueError):
+        payload = repr(value).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class _FamilyState:
+    """Current TTL and refresh counters of one key family."""
+
+    def __init__(self, ttl: float, base_ttl: int) -> None:
+        self.ttl = ttl
+        self.base_ttl = base_ttl
+        self.unchanged = 0
+        self.changed = 0
+
+
+class AdaptiveTTLPolicy:
+    """
+    Thread-safe TTL controller keyed by operation.
+
+    Callers report each fetched value with observe() and ask for the TTL to
+    store it with through ttl_for(). With a state file, the learned state is
+    saved at most every ``save_interval`` seconds while values are observed,
+    and on close() or interpreter exit.
+    """
+
+    def __init__(
+        self,
+        min_ttl: int = DEFAULT_ADAPTIVE_TTL_MIN,
+        max_ttl: int = DEFAULT_ADAPTIVE_TTL_MAX,
+        increase_factor: float = DEFAULT_INCREASE_FACTOR,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        max_tracked_keys: int = DEFAULT_MAX_TRACKED_KEYS,
+        state_file: Optional[Path] = None,
+        save_interval: float = DEFAULT_SAVE_INTERVAL,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            min_ttl: Shortest TTL in seconds the policy may choose
+            max_ttl: Longest TTL in seconds the policy may choose
+            increase_factor: TTL multiplier after an unchanged refresh (> 1)
+            decrease_factor: TTL multiplier after a changed refresh (< 1)
+            max_tracked_keys: Number of cache keys whose last fingerprint is kept
+            state_file: Where to keep the learned TTLs and fingerprints between
+                        processes. None keeps them in memory only.
+            save_interval: Minimum seconds between saves of the state file
+
+        Raises:
+            ValueError: If the bounds or factors are inconsistent
+        """
+        if min_ttl <= 0 or max_ttl < min_ttl:
+            raise ValueError("Adaptive TTL bounds must satisfy 0 < min_ttl <= max_ttl")
+        if increase_factor <= 1 or not 0 < decrease_factor < 1:
+            raise ValueError("Adaptive TTL factors must be > 1 (increase) and < 1 (decrease)")
+
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.increase_factor = increase_factor
+        self.decrease_factor = decrease_factor
+        self.max_tracked_keys = max_tracked_keys
+
+        self.state_file = state_file
+        self.save_interval = save_interval
+
+        self._lock = threading.Lock()
+        self._families: Dict[str, _FamilyState] = {}
+        self._fingerprints: "OrderedDict[str, str]" = OrderedDict()
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+        if self.state_file is not None:
+            self._load_state()
+            atexit.register(self.save)
+
+    def _clamp(self, ttl: float) -> float:
+        return min(max(ttl, self.min_ttl), self.max_ttl)
+
+    def _family(self, family: str, base_ttl: int) -> _FamilyState:
+        """Return the state of a family, starting at its base TTL. Caller holds the lock."""
+        state = self._families.get(family)
+        if state is None:
+            state = self._families[family] = _FamilyState(self._clamp(base_ttl), base_ttl)
+        return state
+
+    def observe(self, family: str, key: str, value: Any, base_ttl: int) -> Optional[bool]:
+        """
+        Record a fetched value and adjust the TTL of its family.
+
+        Args:
+            family: Key family, normally the AWS operation name
+            key: Cache key the value is stored under
+            value: Fetched value
+            base_ttl: Configured TTL of the family, used as its starting point
+
+        Returns:
+            True if the value changed since the last fetch of the key, False if
+            it did not, None on the first fetch
+        """
+        digest = fingerprint(value)
+        with self._lock:
+            state = self._family(family, base_ttl)
+            previous = self._fingerprints.pop(key, None)
+            self._fingerprints[key] = digest
+            while len(self._fingerprints) > self.max_tracked_keys:
+                self._fingerprints.popitem(last=False)
+
+            self._dirty = True
+            if previous is None:
+                changed = None
+            else:
+                changed = previous != digest
+                if changed:
+                    state.changed += 1
+                    state.ttl = self._clamp(state.ttl * self.decrease_factor)
+                else:
+                    state.unchanged += 1
+                    state.ttl = self._clamp(state.ttl * self.increase_factor)
+            save_due = (
+                self.state_file is not None
+                and time.monotonic() - self._last_save >= self.save_interval
+            )
+
+        if changed is not None:
+            logger.debug(
+                f"Adaptive TTL for {family}: {int(state.ttl)}s after "
+                f"{'changed' if changed else 'unchanged'} refresh"
+            )
+        if save_due:
+            self.save()
+        return changed
+
+    def ttl_for(self, family: str, base_ttl: int) -> int:
+        """
+        Get the TTL to store a value of a family with.
+
+        Args:
+            family: Key family, normally the AWS operation name
+            base_ttl: Configured TTL of the family
+
+        Returns:
+            TTL in seconds within the configured bounds
+        """
+        with self._lock:
+            return int(self._family(family, base_ttl).ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the chosen TTL and refresh counters per family."""
+        with self._lock:
+            families = {}
+            for family, state in sorted(self._families.items()):
+                refreshes = state.changed + state.unchanged
+                families[family] = {
+                    "ttl": int(state.ttl),
+                    "base_ttl": state.base_ttl,
+                    "refreshes": refreshes,
+                    "changed": state.changed,
+                    "change_ratio": round(state.changed / refreshes, 4) if refreshes else None,
+                }
+            return {
+                "min_ttl": self.min_ttl,
+                "max_ttl": self.max_ttl,
+                "tracked_keys": len(self._fingerprints),
+                "families": families,
+            }
+
+    def reset(self) -> None:
+        """Forget all learned TTLs and fingerprints."""
+        with self._lock:
+            self._families.clear()
+            self._fingerprints.clear()
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the learned state to the state file if it changed."""
+        if self.state_file is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            state = {
+                "families": {
+                    family: {
+                        "ttl": state.ttl,
+                        "base_ttl": state.base_ttl,
+                        "unchanged": state.unchanged,
+                        "changed": state.changed,
+                    }
+                    for family, state in self._families.items()
+                },
+                "fingerprints": list(self._fingerprints.items()),
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        state_file = Path(self.state_file)
+        temp_file = state_file.with_name(f"{state_file.name}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(temp_file, state_file)
+        except OSError as e:
+            logger.warning(f"Failed to save adaptive TTL state: {e}")
+
+    def close(self) -> None:
+        """Save the learned state and stop saving it at interpreter exit."""
+        self.save()
+        atexit.unregister(self.save)
+
+    def _load_state(self) -> None:
+        """Load the state saved by a previous process, if any."""
+        if self.state_file is None:
+            return
+        try:
+            state = json.loads(Path(self.state_file).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable adaptive TTL state {self.state_file}: {e}")
+            return
+        if not isinstance(state, dict):
+            return
+
+        try:
+            for family, saved in state.get("families", {}).items():
+                family_state = _FamilyState(
+                    self._clamp(float(saved["ttl"])), int(saved["base_ttl"])
+                )
+                family_state.unchanged = int(saved.get("unchanged", 0))
+                family_state.changed = int(saved.get("changed", 0))
+                self._families[family] = family_state
+            for key, digest in state.get("fingerprints", [])[-self.max_tracked_keys :]:
+                self._fingerprints[str(key)] = str(digest)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring malformed adaptive TTL state {self.state_file}: {e}")
+            self._families.clear()
+            self._fingerprints.clear()
@@ -6,14 +6,24 @@ caching for read operations and cache invalidation for write operations.
 
 import logging
 from datetime import timedelta
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
+from .adaptive_ttl import AdaptiveTTLPolicy
+from .dependencies import dependency_tags
 from .interfaces import ICacheManager
-from .key_builder import CacheKeyBuilder
+from .key_builder import ALL_IDENTIFIER, CacheKeyBuilder
 from .manager import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Normalized request parameter naming the resource changed by a write operation
+_WRITE_IDENTIFIER_PARAMETERS = {
+    "user": "userid",
+    "group": "groupid",
+    "permission_set": "permissionsetarn",
+    "instance": "instancearn",
+}
+
 
 class CachedAWSClient:
     """
@@ -24,8 +34,8 @@ class CachedAWSClient:
 
     Features:
     - Automatic detection of read vs write operations
-    - Intelligent cache key generation using CacheKeyBuilder
-    - Automatic cache invalidation for write operations
+    - Hierarchical cache keys from CacheKeyBuilder.build_operation_key
+    - Prefix-range invalidation of the written resource for write operations
     - Graceful degradation when cache operations fail
     - Support for custom TTL per operation type
     """
@@ -99,6 +109,7 @@ class CachedAWSClient:
         resource_type: str,
         cache_manager: Optional[ICacheManager] = None,
         ttl_config: Optional[Dict[str, timedelta]] = None,
+        scope: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize the cached AWS client wrapper.
@@ -108,11 +119,18 @@ class CachedAWSClient:
             resource_type: Type of AWS resource (user, group, permission_set, etc.)
             cache_manager: Cache manager instance (defaults to CacheManager singleton)
             ttl_config: Custom TTL configuration for different operation types
+            scope: Profile and region hashed into cache keys, see
+                CacheKeyBuilder.client_scope (defaults to the default profile
+                and the region of the wrapped client)
         """
         self.aws_client = aws_client
         self.resource_type = resource_type
         self.cache_manager = cache_manager or CacheManager()
         self.ttl_config = {**self.DEFAULT_TTL_CONFIG, **(ttl_config or {})}
+        if scope is None:
+            region = getattr(getattr(aws_client, "meta", None), "region_name", None)
+            scope = CacheKeyBuilder.client_scope(None, region if isinstance(region, str) else None)
+        self.scope = dict(scope)
 
         logger.debug(f"Initialized CachedAWSClient for resource type: {resource_type}")
 
@@ -178,21 +196,7 @@ class CachedAWSClient:
         Returns:
             True if operation should invalidate cache
         """
-        # Check explicit list first
-        if operation_name in self.WRITE_OPERATIONS:
-            return True
-
-        # Check common patterns
-        write_prefixes = (
-            "create_",
-            "update_",
-            "delete_",
-            "put_",
-            "attach_",
-            "detach_",
-            "provision_",
-        )
-        return any(operation_name.startswith(prefix) for prefix in write_prefixes)
+        return is_write_operation(operation_name)
 
     def _create_cached_method(self, operation_name: str, original_method: Callable) -> Callable:
         """
@@ -231,8 +235,15 @@ class CachedAWSClient:
 
                 # Cache the result
                 try:
-                    ttl = self._get_ttl_for_operation(operation_name)
-                    self.cache_manager.set(cache_key, result, ttl)
+                    ttl = self._get_adaptive_ttl(
+                        operation_name,
+                        cache_key,
+                        result,
+                        self._get_ttl_for_operation(operation_name),
+                    )
+                    params = CacheKeyBuilder.operation_parameters(operation_name, args, kwargs)
+                    tags = dependency_tags(params, result)
+                    self.cache_manager.set(cache_key, result, ttl, tags=tags)
                     logger.debug(f"Cached result for {operation_name}")
                 except Exception as cache_error:
                     logger.warning(f"Failed to cache result for {operation_name}: {cache_error}")
@@ -286,6 +297,11 @@ class CachedAWSClient:
         """
         Generate a cache key for the operation and parameters.
 
+        Operations known to CacheKeyBuilder get their resource type and
+        identifier from its operation table; others are keyed under the
+        resource type of this client. The client's scope is hashed in, as in
+        the aws_clients cached client layer.
+
         Args:
             operation_name: Name of the AWS operation
             args: Positional arguments
@@ -294,74 +310,12 @@ class CachedAWSClient:
         Returns:
             Cache key string
         """
-        # Map operation to cache key builder operation
-        if operation_name.startswith("list_"):
-            cache_operation = "list"
-        elif operation_name.startswith("describe_"):
-            cache_operation = "describe"
-        elif operation_name.startswith("get_"):
-            cache_operation = "get"
-        else:
-            cache_operation = operation_name
-
-        # Extract identifiers based on resource type and operation
-        identifier = None
-        sub_identifier = None
-        additional_params = {}
-
-        # Handle common parameter patterns
-        if self.resource_type == "user":
-            if "UserId" in kwargs:
-                identifier = kwargs["UserId"]
-            elif len(args) >= 2 and operation_name in ["describe_user"]:
-                identifier = args[1]  # Usually identity_store_id, user_id
-        elif self.resource_type == "group":
-            if "GroupId" in kwargs:
-                identifier = kwargs["GroupId"]
-            elif len(args) >= 2 and operation_name in ["describe_group", "list_group_memberships"]:
-                identifier = args[1]  # Usually identity_store_id, group_id
-        elif self.resource_type == "permission_set":
-            if "PermissionSetArn" in kwargs:
-                identifier = kwargs["PermissionSetArn"]
-            elif len(args) >= 2 and operation_name in ["describe_permission_set"]:
-                identifier = args[1]  # Usually instance_arn, permission_set_arn
-        elif self.resource_type == "assignment":
-            if "AccountId" in kwargs:
-                identifier = kwargs["AccountId"]
-            if "PermissionSetArn" in kwargs:
-                sub_identifier = kwargs["PermissionSetArn"]
-
-        # Add remaining parameters to additional params, but handle pagination carefully
-        for key, value in kwargs.items():
-            if key not in ["UserId", "GroupId", "PermissionSetArn", "AccountId", "InstanceArn"]:
-                # For list operations, only include pagination if it's a specific page request
-                if key in ["MaxResults", "NextToken"]:
-                    if operation_name.startswith("list_") and key == "NextToken" and value:
-                        # This is a request for a specific page
-                        additional_params[key.lower()] = value
-                    elif (
-                        operation_name.startswith("list_")
-                        and key == "MaxResults"
-                        and "NextToken" in kwargs
-                        and kwargs["NextToken"]
-                    ):
-                        # Include MaxResults only if NextToken is also present
-                        additional_params[key.lower()] = value
-                    # Skip MaxResults for initial requests to allow consistent caching
-                else:
-                    additional_params[key] = value
-
-        # For list operations without specific identifiers, use "all" as identifier
-        if cache_operation == "list" and identifier is None:
-            identifier = "all"
-
-        # Use CacheKeyBuilder to generate the key
-        return CacheKeyBuilder.build_key(
-            resource_type=self.resource_type,
-            operation=cache_operation,
-            identifier=identifier,
-            sub_identifier=sub_identifier,
-            **additional_params,
+        return CacheKeyBuilder.build_operation_key(
+            operation_name,
+            args,
+            kwargs,
+            scope=self.scope,
+            default_resource_type=self.resource_type,
         )
 
     def _get_ttl_for_operation(self, operation_name: str) -> timedelta:
@@ -383,6 +337,29 @@ class CachedAWSClient:
         else:
             return self.ttl_config["default"]
 
+    def _get_adaptive_ttl(
+        self, operation_name: str, cache_key: str, result: Any, base_ttl: timedelta
+    ) -> timedelta:
+        """
+        Adjust an operation TTL by what the adaptive TTL policy learned, if enabled.
+
+        Args:
+            operation_name: Name of the operation
+            cache_key: Cache key the result is stored under
+            result: Fetched result
+            base_ttl: Static TTL of the operation
+
+        Returns:
+            TTL to store the result with
+        """
+        policy = getattr(self.cache_manager, "adaptive_ttl", None)
+        if not isinstance(policy, AdaptiveTTLPolicy):
+            return base_ttl
+
+        base_seconds = int(base_ttl.total_seconds())
+        policy.observe(operation_name, cache_key, result, base_seconds)
+        return timedelta(seconds=policy.ttl_for(operation_name, base_seconds))
+
     def _invalidate_for_operation(self, operation_name: str, args: tuple, kwargs: dict) -> int:
         """
         Invalidate cache entries for a write operation.
@@ -395,41 +372,101 @@ class CachedAWSClient:
         Returns:
             Number of invalidated cache entries
         """
-        # Determine operation type for invalidation
-        if operation_name.startswith("create_"):
-            operation_type = "create"
-        elif operation_name.startswith("update_"):
-            operation_type = "update"
-        elif operation_name.startswith("delete_"):
-            operation_type = "delete"
-        else:
-            operation_type = "modify"
-
-        # Extract resource identifier for targeted invalidation
-        resource_id = None
-        additional_context = {}
-
-        if self.resource_type == "user":
-            if "UserId" in kwargs:
-                resource_id = kwargs["UserId"]
-        elif self.resource_type == "group":
-            if "GroupId" in kwargs:
-                resource_id = kwargs["GroupId"]
-        elif self.resource_type == "permission_set":
-            if "PermissionSetArn" in kwargs:
-                resource_id = kwargs["PermissionSetArn"]
-        elif self.resource_type == "assignment":
-            if "AccountId" in kwargs:
-                additional_context["account_id"] = kwargs["AccountId"]
-            if "PermissionSetArn" in kwargs:
-                additional_context["permission_set_arn"] = kwargs["PermissionSetArn"]
-            if "PrincipalId" in kwargs:
-                additional_context["principal_id"] = kwargs["PrincipalId"]
-
-        # Use the cache manager's invalidation method
-        # Create a pattern based on the operation and resource
-        pattern = f"{operation_type}:{self.resource_type}:{resource_id}"
-        return self.cache_manager.invalidate(pattern)
+        return sum(
+            self.cache_manager.invalidate(pattern)
+            for pattern in self._invalidation_patterns(operation_name, kwargs)
+        )
+
+    def _invalidation_patterns(self, operation_name: str, kwargs: dict) -> List[str]:
+        """
+        Build the key patterns affected by a write operation, see write_invalidation_patterns.
+
+        Args:
+            operation_name: Name of the write operation
+            kwargs: Keyword arguments
+
+        Returns:
+            List of invalidation patterns
+        """
+        return write_invalidation_patterns(operation_name, kwargs, self.resource_type)
+
+
+def is_write_operation(operation_name: str) -> bool:
+    """
+    Check if an operation is a write operation that should invalidate cache.
+
+    Args:
+        operation_name: Name of the operation
+
+    Returns:
+        True if operation should invalidate cache
+    """
+    # Check explicit list first
+    if operation_name in CachedAWSClient.WRITE_OPERATIONS:
+        return True
+
+    # Check common patterns
+    write_prefixes = (
+        "create_",
+        "update_",
+        "delete_",
+        "put_",
+        "attach_",
+        "detach_",
+        "provision_",
+    )
+    return any(operation_name.startswith(prefix) for prefix in write_prefixes)
+
+
+def write_invalidation_patterns(
+    operation_name: str, kwargs: Mapping[str, Any], default_resource_type: Optional[str] = None
+) -> List[str]:
+    """
+    Build the key patterns affected by a write operation.
+
+    Every pattern is a key prefix followed by ``*``, so backends that index
+    keys remove the entries with a prefix-range scan. A write drops the
+    collection entries (``{resource_type}:all:``) of its resource type and
+    every entry of the resource it names.
+
+    Args:
+        operation_name: Name of the write operation
+        kwargs: Keyword arguments
+        default_resource_type: Resource type of writes whose name does not
+            contain one; such writes invalidate nothing if None
+
+    Returns:
+        List of invalidation patterns
+    """
+    resource_type = _write_resource_type(operation_name) or default_resource_type
+    if resource_type is None:
+        return []
+    params = CacheKeyBuilder.operation_parameters(operation_name, (), kwargs)
+
+    if resource_type == "assignment":
+        # Assignment entries are keyed by account
+        account_id = params.get("accountid") or params.get("targetid")
+        return [CacheKeyBuilder.build_prefix("assignment", account_id) + "*"]
+
+    patterns = [CacheKeyBuilder.build_prefix(resource_type, ALL_IDENTIFIER) + "*"]
+    resource_id = params.get(_WRITE_IDENTIFIER_PARAMETERS.get(resource_type, ""))
+    if isinstance(resource_id, str) and resource_id:
+        patterns.append(CacheKeyBuilder.build_prefix(resource_type, resource_id) + "*")
+
+    # Group membership changes also affect the cached data of the member
+    member = params.get("memberid")
+    if isinstance(member, dict) and member.get("UserId"):
+        patterns.append(CacheKeyBuilder.build_prefix("user", member["UserId"]) + "*")
+
+    return patterns
+
+
+def _write_resource_type(operation_name: str) -> Optional[str]:
+    """Return the resource type a write operation changes, if its name contains one."""
+    for resource_type in ("assignment", "permission_set", "group", "user", "instance"):
+        if resource_type in operation_name:
+            return resource_type
+    return None
 
 
 class CachedIdentityCenterClient(CachedAWSClient):
@@ -440,6 +477,7 @@ class CachedIdentityCenterClient(CachedAWSClient):
         identity_center_client: Any,
         cache_manager: Optional[ICacheManager] = None,
         ttl_config: Optional[Dict[str, timedelta]] = None,
+        scope: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize cached Identity Center client.
@@ -448,12 +486,14 @@ class CachedIdentityCenterClient(CachedAWSClient):
             identity_center_client: boto3 SSO Admin client
             cache_manager: Cache manager instance
             ttl_config: Custom TTL configuration
+            scope: Profile and region hashed into cache keys
         """
         super().__init__(
             aws_client=identity_center_client,
             resource_type="permission_set",
             cache_manager=cache_manager,
             ttl_config=ttl_config,
+            scope=scope,
         )
 
         # Explicitly override key methods to ensure they go through caching
@@ -475,144 +515,6 @@ class CachedIdentityCenterClient(CachedAWSClient):
                 "describe_permission_set", original_method
             )
 
-    def _generate_cache_key(self, operation_name: str, args: tuple, kwargs: dict) -> str:
-        """
-        Generate a cache key for Identity Center operations.
-
-        Args:
-            operation_name: Name of the AWS operation
-            args: Positional arguments
-            kwargs: Keyword arguments
-
-        Returns:
-            Cache key string
-        """
-        # Map operation to cache key builder operation
-        if operation_name.startswith("list_"):
-            cache_operation = "list"
-        elif operation_name.startswith("describe_"):
-            cache_operation = "describe"
-        elif operation_name.startswith("get_"):
-            cache_operation = "get"
-        else:
-            cache_operation = operation_name
-
-        # Extract identifiers based on operation
-        identifier = None
-        sub_identifier = None
-        additional_params = {}
-
-        # Handle permission set operations
-        if "permission_set" in operation_name.lower():
-            resource_type = "permission_set"
-            if "PermissionSetArn" in kwargs:
-                identifier = kwargs["PermissionSetArn"]
-            elif len(args) >= 2 and operation_name in ["describe_permission_set"]:
-                # describe_permission_set(instance_arn, permission_set_arn)
-                identifier = args[1]
-            elif operation_name == "list_permission_sets":
-                # For list_permission_sets, use InstanceArn as the identifier
-                # to ensure different SSO instances have different cache keys
-                # but the same instance always generates the same key
-                if "InstanceArn" in kwargs:
-                    identifier = kwargs["InstanceArn"]
-                elif len(args) >= 1:
-                    # list_permission_sets(instance_arn)
-                    identifier = args[0]
-                else:
-                    identifier = "all"
-        # Handle assignment operations
-        elif "assignment" in operation_name.lower():
-            resource_type = "assignment"
-            if "AccountId" in kwargs:
-                identifier = kwargs["AccountId"]
-            if "PermissionSetArn" in kwargs:
-                sub_identifier = kwargs["PermissionSetArn"]
-        # Handle instance operations
-        elif "instance" in operation_name.lower():
-            resource_type = "instance"
-            if "InstanceArn" in kwargs:
-                identifier = kwargs["InstanceArn"]
-            elif len(args) >= 1 and operation_name in ["describe_instance"]:
-                identifier = args[0]
-            elif operation_name == "list_instances":
-                identifier = "all"
-        else:
-            # Default to permission_set
-            resource_type = "permission_set"
-            identifier = "all"
-
-        # Handle pagination parameters carefully
-        # For list operations, we should cache the complete result, not paginated chunks
-        # Only include pagination in cache key if it's a specific page request
-        if operation_name.startswith("list_") and "NextToken" in kwargs and kwargs["NextToken"]:
-            # This is a request for a specific page, include pagination in key
-            additional_params["next_token"] = kwargs["NextToken"]
-            if "MaxResults" in kwargs:
-                additional_params["max_results"] = kwargs["MaxResults"]
-        # For initial requests (no NextToken), don't include pagination in cache key
-        # This allows caching of complete results regardless of MaxResults setting
-
-        # Use CacheKeyBuilder to generate the key
-        return CacheKeyBuilder.build_key(
-            resource_type=resource_type,
-            operation=cache_operation,
-            identifier=identifier,
-            sub_identifier=sub_identifier,
-            **additional_params,
-        )
-
-    def _invalidate_for_operation(self, operation_name: str, args: tuple, kwargs: dict) -> int:
-        """
-        Invalidate cache entries for Identity Center write operations.
-
-        Args:
-            operation_name: Name of the write operation
-            args: Positional arguments
-            kwargs: Keyword arguments
-
-        Returns:
-            Number of invalidated cache entries
-        """
-        # Determine operation type for invalidation
-        if operation_name.startswith("create_"):
-            operation_type = "create"
-        elif operation_name.startswith("update_"):
-            operation_type = "update"
-        elif operation_name.startswith("delete_"):
-            operation_type = "delete"
-        elif operation_name.startswith("provision_"):
-            operation_type = "provision"
-        else:
-            operation_type = "modify"
-
-        # Determine resource type and ID
-        resource_type = "permission_set"  # Default
-        resource_id = None
-        additional_context = {}
-
-        if "permission_set" in operation_name.lower():
-            resource_type = "permission_set"
-            if "PermissionSetArn" in kwargs:
-                resource_id = kwargs["PermissionSetArn"]
-        elif "assignment" in operation_name.lower():
-            resource_type = "assignment"
-            if "AccountId" in kwargs:
-                additional_context["account_id"] = kwargs["AccountId"]
-            if "PermissionSetArn" in kwargs:
-                additional_context["permission_set_arn"] = kwargs["PermissionSetArn"]
-            if "PrincipalId" in kwargs:
-                additional_context["principal_id"] = kwargs["PrincipalId"]
-        elif "instance" in operation_name.lower():
-            resource_type = "instance"
-            if "InstanceArn" in kwargs:
-                resource_id = kwargs["InstanceArn"]
-
-        # Use the cache manager's invalidation method
-        # Create a pattern based on the operation and resource
-        pattern = f"{operation_type}:{resource_type}:{resource_id}"
-        return self.cache_manager.invalidate(pattern)
-
 
 class CachedIdentityStoreClient(CachedAWSClient):
     """Cached wrapper for AWS Identity Store client."""
@@ -622,6 +524,7 @@ class CachedIdentityStoreClient(CachedAWSClient):
         identity_store_client: Any,
         cache_manager: Optional[ICacheManager] = None,
         ttl_config: Optional[Dict[str, timedelta]] = None,
+        scope: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize cached Identity Store client.
@@ -630,12 +533,14 @@ class CachedIdentityStoreClient(CachedAWSClient):
             identity_store_client: boto3 Identity Store client
             cache_manager: Cache manager instance
             ttl_config: Custom TTL configuration
+            scope: Profile and region hashed into cache keys
         """
         super().__init__(
             aws_client=identity_store_client,
             resource_type="user",  # Primary resource type, but handles groups too
             cache_manager=cache_manager,
             ttl_config=ttl_config,
+            scope=scope,
         )
 
         # Explicitly override key methods to ensure they go through caching
@@ -686,140 +591,6 @@ class CachedIdentityStoreClient(CachedAWSClient):
             original_method = self.aws_client.delete_group
             self.delete_group = self._create_invalidating_method("delete_group", original_method)
 
-    def _generate_cache_key(self, operation_name: str, args: tuple, kwargs: dict) -> str:
-        """
-        Generate a cache key for Identity Store operations.
-
-        Args:
-            operation_name: Name of the AWS operation
-            args: Positional arguments
-            kwargs: Keyword arguments
-
-        Returns:
-            Cache key string
-        """
-        # Map operation to cache key builder operation
-        if operation_name.startswith("list_"):
-            cache_operation = "list"
-        elif operation_name.startswith("describe_"):
-            cache_operation = "describe"
-        elif operation_name.startswith("get_"):
-            cache_operation = "get"
-        else:
-            cache_operation = operation_name
-
-        # Extract identifiers based on operation
-        identifier = None
-        sub_identifier = None
-        additional_params = {}
-
-        # Handle user operations
-        if "user" in operation_name.lower():
-            resource_type = "user"
-            if "UserId" in kwargs:
-                identifier = kwargs["UserId"]
-            elif len(args) >= 2 and operation_name in ["describe_user"]:
-                # describe_user(identity_store_id, user_id)
-                identifier = args[1]
-            elif operation_name == "list_users":
-                identifier = "all"
-                # Include filters in additional params
-                if "Filters" in kwargs:
-                    additional_params["filters"] = str(kwargs["Filters"])
-        # Handle group operations
-        elif "group" in operation_name.lower():
-            resource_type = "group"
-            if "GroupId" in kwargs:
-                identifier = kwargs["GroupId"]
-            elif len(args) >= 2 and operation_name in ["describe_group", "list_group_memberships"]:
-                # describe_group(identity_store_id, group_id)
-                identifier = args[1]
-            elif operation_name == "list_groups":
-                identifier = "all"
-                # Include filters in additional params
-                if "Filters" in kwargs:
-                    additional_params["filters"] = str(kwargs["Filters"])
-        else:
-            # Default to user resource type
-            resource_type = "user"
-            identifier = "all"
-
-        # Handle pagination parameters carefully
-        # For list operations, we should cache the complete result, not paginated chunks
-        # Only include pagination in cache key if it's a specific page request
-        if operation_name.startswith("list_") and "NextToken" in kwargs and kwargs["NextToken"]:
-            # This is a request for a specific page, include pagination in key
-            additional_params["next_token"] = kwargs["NextToken"]
-            if "MaxResults" in kwargs:
-                additional_params["max_results"] = kwargs["MaxResults"]
-        # For initial requests (no NextToken), don't include pagination in cache key
-        # This allows caching of complete results regardless of MaxResults setting
-
-        # Use CacheKeyBuilder to generate the key
-        return CacheKeyBuilder.build_key(
-            resource_type=resource_type,
-            operation=cache_operation,
-            identifier=identifier,
-            sub_identifier=sub_identifier,
-            **additional_params,
-        )
-
-    def _invalidate_for_operation(self, operation_name: str, args: tuple, kwargs: dict) -> int:
-        """
-        Invalidate cache entries for Identity Store write operations.
-
-        Args:
-            operation_name: Name of the write operation
-            args: Positional arguments
-            kwargs: Keyword arguments
-
-        Returns:
-            Number of invalidated cache entries
-        """
-        # Determine operation type for invalidation
-        if operation_name.startswith("create_"):
-            operation_type = "create"
-        elif operation_name.startswith("update_"):
-            operation_type = "update"
-        elif operation_name.startswith("delete_"):
-            operation_type = "delete"
-        else:
-            operation_type = "modify"
-
-        # Determine resource type and ID
-        resource_type = "user"  # Default
-        resource_id = None
-        additional_context = {}
-
-        if "user" in operation_name.lower():
-            resource_type = "user"
-            if "UserId" in kwargs:
-                resource_id = kwargs["UserId"]
-        elif "group" in operation_name.lower():
-            resource_type = "group"
-            if "GroupId" in kwargs:
-                resource_id = kwargs["GroupId"]
-            # For group membership operations, also invalidate user cache
-            if "membership" in operation_name.lower():
-                additional_context["affects_users"] = True
-                if "MemberId" in kwargs:
-                    additional_context["member_id"] = kwargs["MemberId"]
-
-        # Use the cache manager's invalidation method
-        # Create a pattern based on the operation and resource
-        pattern = f"{operation_type}:{resource_type}:{resource_id}"
-        total_invalidated = self.cache_manager.invalidate(pattern)
-
-        # For group membership operations, also invalidate user-related cache
-        if additional_context.get("affects_users"):
-            member_id = additional_context.get("member_id")
-            if member_id:
-                user_pattern = f"{operation_type}:user:{member_id}"
-                user_invalidated = self.cache_manager.invalidate(user_pattern)
-                total_invalidated += user_invalidated
-
-        return total_invalidated
-
 
 class CachedOrganizationsClient(CachedAWSClient):
     """Cached wrapper for AWS Organizations client."""
@@ -829,6 +600,7 @@ class CachedOrganizationsClient(CachedAWSClient):
         organizations_client: Any,
         cache_manager: Optional[ICacheManager] = None,
         ttl_config: Optional[Dict[str, timedelta]] = None,
+        scope: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize cached Organizations client.
@@ -837,12 +609,14 @@ class CachedOrganizationsClient(CachedAWSClient):
             organizations_client: boto3 Organizations client
             cache_manager: Cache manager instance
             ttl_config: Custom TTL configuration
+            scope: Profile and region hashed into cache keys
         """
         super().__init__(
             aws_client=organizations_client,
             resource_type="account",
             cache_manager=cache_manager,
             ttl_config=ttl_config,
+            scope=scope,
         )
 
 
@@ -851,6 +625,7 @@ def create_cached_client(
     resource_type: str,
     cache_manager: Optional[ICacheManager] = None,
     ttl_config: Optional[Dict[str, timedelta]] = None,
+    scope: Optional[Mapping[str, Any]] = None,
 ) -> CachedAWSClient:
     """
     Factory function to create a cached AWS client wrapper.
@@ -860,6 +635,7 @@ def create_cached_client(
         resource_type: Type of AWS resource
         cache_manager: Cache manager instance
         ttl_config: Custom TTL configuration
+        scope: Profile and region hashed into cache keys
 
     Returns:
         CachedAWSClient instance
@@ -869,4 +645,5 @@ def create_cached_client(
         resource_type=resource_type,
         cache_manager=cache_manager,
         ttl_config=ttl_config,
+        scope=scope,
     )
@@ -2,6 +2,8 @@
 
 This module provides various storage backends for the cache system:
 - FileBackend: Local file system storage
+- SegmentLogBackend: Local append-only segment log storage
+- SQLiteBackend: Local SQLite database storage
 - DynamoDBBackend: AWS DynamoDB storage
 - HybridBackend: Combined local/remote storage
 - CacheBackend: Abstract base class for all backends
@@ -11,11 +13,15 @@ from .base import CacheBackend, CacheBackendError
 from .dynamodb import DynamoDBBackend
 from .file import FileBackend
 from .hybrid import HybridBackend
+from .segment import SegmentLogBackend
+from .sqlite import SQLiteBackend
 
 __all__ = [
     "CacheBackend",
     "CacheBackendError",
     "FileBackend",
+    "SegmentLogBackend",
+    "SQLiteBackend",
     "DynamoDBBackend",
     "HybridBackend",
 ]
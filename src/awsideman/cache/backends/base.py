@@ -2,10 +2,26 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# File name of the expiry sweeper state kept in local cache directories
+SWEEP_STATE_FILE_NAME = "_expiry_sweep.state"
+
+
+@dataclass
+class SweepResult:
+    """Outcome of one bounded step of an incremental expiry sweep."""
+
+    scanned: int = 0
+    removed: int = 0
+    bytes_freed: int = 0
+    # Position to resume from; None once the pass has reached the end
+    cursor: Optional[str] = None
+
 
 class CacheBackend(ABC):
     """
@@ -15,6 +31,9 @@ class CacheBackend(ABC):
     to provide pluggable storage options for the cache system.
     """
 
+    # Whether the backend persists dependency tags and can look keys up by tag
+    supports_tags = False
+
     @abstractmethod
     def get(self, key: str) -> Optional[bytes]:
         """
@@ -86,6 +105,144 @@ class CacheBackend(ABC):
         """
         pass
 
+    def list_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """
+        List the cache keys stored in the backend.
+
+        Backends that cannot enumerate their keys cheaply return an empty list.
+
+        Args:
+            prefix: Only return keys starting with this prefix
+
+        Returns:
+            List of cache keys
+        """
+        return []
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Retrieve raw data for several keys.
+
+        The default implementation calls get() once per key. Backends with a
+        native multi-key read override it.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to raw bytes for the keys that were found
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        results = {}
+        for key in keys:
+            data = self.get(key)
+            if data is not None:
+                results[key] = data
+        return results
+
+    def set_many(
+        self, items: Dict[str, bytes], ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Store raw data for several keys with the same TTL.
+
+        The default implementation calls set() once per key. Backends with a
+        native multi-key write override it.
+
+        Args:
+            items: Dictionary of cache key to raw bytes data
+            ttl: Optional TTL in seconds. Backend may ignore if not supported.
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        for key, data in items.items():
+            self.set(key, data, ttl, operation)
+
+    def delete_many(self, keys: List[str]) -> None:
+        """
+        Remove several cache entries.
+
+        The default implementation calls invalidate() once per key. Backends
+        with a native multi-key delete override it.
+
+        Args:
+            keys: Cache keys to remove
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        for key in keys:
+            self.invalidate(key)
+
+    def tag(self, tags_by_key: Dict[str, List[str]]) -> None:
+        """
+        Record the dependency tags of stored entries.
+
+        Tags are replaced whenever the key is written again. The default
+        implementation ignores tags; backends that set ``supports_tags``
+        persist them.
+
+        Args:
+            tags_by_key: Dictionary of cache key to dependency tags
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        return None
+
+    def keys_for_tags(self, tags: List[str]) -> List[str]:
+        """
+        List the live cache keys tagged with any of the given tags.
+
+        Args:
+            tags: Dependency tags
+
+        Returns:
+            List of cache keys; empty for backends that do not support tags
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        return []
+
+    def sweep_expired(self, cursor: Optional[str] = None, limit: int = 500) -> SweepResult:
+        """
+        Remove expired entries in bounded steps.
+
+        Each call examines at most ``limit`` entries starting after ``cursor``
+        and returns the cursor to resume from. The default implementation runs
+        the backend's full ``cleanup_expired_files`` pass, if it has one, as a
+        single step.
+
+        Args:
+            cursor: Cursor returned by the previous step, None to start a pass
+            limit: Maximum number of entries to examine
+
+        Returns:
+            SweepResult for this step
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        cleanup = getattr(self, "cleanup_expired_files", None)
+        if cleanup is None:
+            return SweepResult()
+        removed = int(cleanup() or 0)
+        return SweepResult(scanned=removed, removed=removed)
+
+    def sweep_state_file(self) -> Optional[Path]:
+        """
+        Path where the expiry sweeper keeps its cursor between runs.
+
+        Returns:
+            Path next to the local cache data, or None for remote backends
+        """
+        return None
+
 
 class CacheBackendError(Exception):
     """
@@ -20,6 +20,13 @@ MAX_ITEM_SIZE = 350 * 1024  # 350KB to leave room for metadata
 COMPRESSION_THRESHOLD = 1024  # Compress items larger than 1KB
 CHUNK_SIZE = MAX_ITEM_SIZE - 1024  # Leave room for metadata in each chunk
 
+# BatchGetItem and BatchWriteItem request limits
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+# Retries for unprocessed batch items, with exponential backoff from the base delay
+BATCH_MAX_RETRIES = 5
+BATCH_RETRY_BASE_DELAY = 0.05
+
 
 class DynamoDBBackend(CacheBackend):
     """
@@ -247,20 +254,7 @@ class DynamoDBBackend(CacheBackend):
                 self._set_chunked_data(key, compressed_data, ttl, operation)
             else:
                 # Store as single item
-                item = {
-                    "cache_key": key,
-                    "data": base64.b64encode(compressed_data).decode("utf-8"),
-                    "operation": operation,
-                    "created_at": int(time.time()),
-                    "is_compressed": len(compressed_data) != len(data),
-                    "original_size": len(data),
-                }
-
-                # Add TTL if specified
-                if ttl and ttl > 0:
-                    item["ttl"] = int(time.time() + ttl)
-
-                # Store item in DynamoDB
+                item = self._build_item(key, data, compressed_data, ttl, operation)
                 self._put_item_with_retry(item)
 
             logger.debug(f"Stored cache entry for key: {key}")
@@ -275,6 +269,250 @@ class DynamoDBBackend(CacheBackend):
                     original_error=e,
                 )
 
+    def _build_item(
+        self, key: str, data: bytes, compressed_data: bytes, ttl: Optional[int], operation: str
+    ) -> Dict[str, Any]:
+        """Build a single (non-chunked) cache item."""
+        item = {
+            "cache_key": key,
+            "data": base64.b64encode(compressed_data).decode("utf-8"),
+            "operation": operation,
+            "created_at": int(time.time()),
+            "is_compressed": len(compressed_data) != len(data),
+            "original_size": len(data),
+        }
+
+        # Add TTL if specified
+        if ttl and ttl > 0:
+            item["ttl"] = int(time.time() + ttl)
+
+        return item
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Retrieve raw data for several keys with BatchGetItem.
+
+        Keys are fetched 100 at a time and unprocessed keys are retried with
+        exponential backoff.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to raw bytes for the keys that were found
+
+        Raises:
+            CacheBackendError: If DynamoDB operation fails
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        for key in unique_keys:
+            self._validate_key(key, "get")
+        if not unique_keys:
+            return {}
+
+        try:
+            self._ensure_table_exists()
+            items = self._batch_get_items([{"cache_key": key} for key in unique_keys])
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code == "ResourceNotFoundException":
+                logger.warning(f"DynamoDB table {self.table_name} not found")
+                return {}
+            elif error_code in ["ProvisionedThroughputExceededException", "RequestLimitExceeded"]:
+                logger.warning(f"DynamoDB throttling for batch get of {len(unique_keys)} keys")
+                return {}
+            raise CacheBackendError(
+                f"DynamoDB batch get operation failed: {e}",
+                backend_type="dynamodb",
+                original_error=e,
+            )
+
+        current_time = int(time.time())
+        results = {}
+        for item in items:
+            key = item["cache_key"]
+            if "ttl" in item and item["ttl"] < current_time:
+                continue
+
+            if item.get("is_chunked", False):
+                data = self._get_chunked_data(key, item)
+            else:
+                data = self._decode_item_data(item)
+            if data is not None:
+                results[key] = data
+
+        logger.debug(f"Batch get returned {len(results)} of {len(unique_keys)} keys")
+        return results
+
+    def set_many(
+        self, items: Dict[str, bytes], ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Store several entries with BatchWriteItem.
+
+        Entries that need chunking are stored individually; everything else is
+        written 25 items per request with unprocessed items retried.
+
+        Args:
+            items: Dictionary of cache key to raw bytes data
+            ttl: Optional TTL in seconds
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If DynamoDB operation fails
+        """
+        if ttl is not None and (not isinstance(ttl, int) or ttl <= 0):
+            raise CacheBackendError("TTL must be a positive integer")
+        for key in items:
+            self._validate_key(key, "set")
+        if not items:
+            return
+
+        try:
+            self._ensure_table_exists()
+
+            requests = []
+            for key, data in items.items():
+                compressed_data = self._compress_data_if_needed(data)
+                if len(compressed_data) > MAX_ITEM_SIZE:
+                    self._set_chunked_data(key, compressed_data, ttl, operation)
+                else:
+                    item = self._build_item(key, data, compressed_data, ttl, operation)
+                    requests.append({"PutRequest": {"Item": item}})
+
+            self._batch_write(requests)
+            logger.debug(f"Stored {len(items)} cache entries in batch")
+        except ClientError as e:
+            raise CacheBackendError(
+                f"DynamoDB batch write operation failed: {e}",
+                backend_type="dynamodb",
+                original_error=e,
+            )
+
+    def delete_many(self, keys: List[str]) -> None:
+        """
+        Remove several cache entries with BatchWriteItem.
+
+        Entry metadata is read in one batch first so that the chunks of
+        chunked entries are cleaned up as well.
+
+        Args:
+            keys: Cache keys to remove
+
+        Raises:
+            CacheBackendError: If DynamoDB operation fails
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return
+
+        try:
+            self._ensure_table_exists()
+
+            metadata = self._batch_get_items(
+                [{"cache_key": key} for key in unique_keys],
+                projection="cache_key, is_chunked, chunk_id",
+            )
+            for item in metadata:
+                if item.get("is_chunked", False) and item.get("chunk_id"):
+                    self._cleanup_chunks(item["cache_key"], item["chunk_id"])
+
+            self._batch_write(
+                [{"DeleteRequest": {"Key": {"cache_key": key}}} for key in unique_keys]
+            )
+            logger.debug(f"Invalidated {len(unique_keys)} cache entries in batch")
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            if error_code == "ResourceNotFoundException":
+                logger.debug(f"Table {self.table_name} not found during batch invalidation")
+                return
+            raise CacheBackendError(
+                f"DynamoDB batch delete operation failed: {e}",
+                backend_type="dynamodb",
+                original_error=e,
+            )
+
+    def _batch_get_items(
+        self, keys: List[Dict[str, Any]], projection: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch items with BatchGetItem, retrying unprocessed keys.
+
+        Uses the table resource's client so attribute values are plain Python
+        values, as with the table resource itself.
+
+        Args:
+            keys: Primary keys of the items to fetch
+            projection: Optional projection expression
+
+        Returns:
+            List of items that were found
+        """
+        batch_client = self.table.meta.client
+        items: List[Dict[str, Any]] = []
+
+        for start in range(0, len(keys), BATCH_GET_LIMIT):
+            request: Dict[str, Any] = {"Keys": keys[start : start + BATCH_GET_LIMIT]}
+            if projection:
+                request["ProjectionExpression"] = projection
+            pending = {self.table_name: request}
+
+            attempt = 0
+            while pending:
+                response = batch_client.batch_get_item(RequestItems=pending)
+                items.extend(response.get("Responses", {}).get(self.table_name, []))
+                pending = response.get("UnprocessedKeys") or {}
+                if pending:
+                    attempt += 1
+                    self._backoff_unprocessed(attempt, "get")
+
+        return items
+
+    def _batch_write(self, requests: List[Dict[str, Any]]) -> None:
+        """
+        Send put/delete requests with BatchWriteItem, retrying unprocessed items.
+
+        Args:
+            requests: PutRequest/DeleteRequest entries
+        """
+        batch_client = self.table.meta.client
+
+        for start in range(0, len(requests), BATCH_WRITE_LIMIT):
+            pending = {self.table_name: requests[start : start + BATCH_WRITE_LIMIT]}
+
+            attempt = 0
+            while pending:
+                response = batch_client.batch_write_item(RequestItems=pending)
+                pending = response.get("UnprocessedItems") or {}
+                if pending:
+                    attempt += 1
+                    self._backoff_unprocessed(attempt, "write")
+
+    def _backoff_unprocessed(self, attempt: int, operation: str) -> None:
+        """Sleep before retrying unprocessed batch items, or give up."""
+        if attempt > BATCH_MAX_RETRIES:
+            raise CacheBackendError(
+                f"DynamoDB batch {operation} still had unprocessed items after "
+                f"{BATCH_MAX_RETRIES} retries",
+                backend_type="dynamodb",
+            )
+        delay = BATCH_RETRY_BASE_DELAY * (2 ** (attempt - 1))
+        logger.debug(f"Retrying unprocessed batch {operation} items in {delay:.2f}s")
+        time.sleep(delay)
+
+    def _validate_key(self, key: str, operation: str) -> None:
+        if not input_validator.validate_cache_key(key):
+            logger.security_event(
+                "invalid_cache_key",
+                {
+                    "operation": operation,
+                    "key": input_validator.sanitize_log_data(key),
+                    "backend": "dynamodb",
+                },
+                "WARNING",
+            )
+            raise CacheBackendError(f"Invalid cache key format: {key}")
+
     def invalidate(self, key: Optional[str] = None) -> None:
         """
         Remove cache entries from DynamoDB.
@@ -995,35 +1233,14 @@ class DynamoDBBackend(CacheBackend):
             List of chunk items
         """
         try:
-            chunks = []
-
-            # Build list of chunk keys to retrieve
-            chunk_keys = []
-            for i in range(chunk_count):
-                chunk_key = f"{key}#chunk#{chunk_id}#{i}"
-                chunk_keys.append({"cache_key": chunk_key})
-
-            # Retrieve chunks in batches of 100 (DynamoDB batch limit)
-            batch_size = 100
-
-            for i in range(0, len(chunk_keys), batch_size):
-                batch_keys = chunk_keys[i : i + batch_size]
-
-                response = self.client.batch_get_item(
-                    RequestItems={self.table_name: {"Keys": batch_keys}}
-                )
-
-                # Process retrieved items
-                items = response.get("Responses", {}).get(self.table_name, [])
-                for item in items:
-                    chunks.append({"chunk_index": item["chunk_index"], "chunk_data": item["data"]})
-
-                # Handle unprocessed keys (retry logic could be added here)
-                unprocessed = response.get("UnprocessedKeys", {})
-                if unprocessed:
-                    logger.warning(f"Some chunks were not retrieved for key {key}")
-
-            return chunks
+            chunk_keys = [
+                {"cache_key": f"{key}#chunk#{chunk_id}#{i}"} for i in range(int(chunk_count))
+            ]
+
+            return [
+                {"chunk_index": item["chunk_index"], "chunk_data": item["data"]}
+                for item in self._batch_get_items(chunk_keys)
+            ]
 
         except Exception as e:
             raise CacheBackendError(
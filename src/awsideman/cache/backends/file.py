@@ -1,20 +1,45 @@
 """File-based cache backend implementation."""
 
+import bisect
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...encryption.aes import AESEncryption
 from ...encryption.key_manager import KeyManager
 from ...utils.models import CacheEntry
 from ...utils.security import get_secure_logger, input_validator
+from ..config import DEFAULT_COMPRESSION_THRESHOLD
 from ..utils import CachePathManager
-from .base import BackendHealthStatus, CacheBackend, CacheBackendError
+from .base import (
+    SWEEP_STATE_FILE_NAME,
+    BackendHealthStatus,
+    CacheBackend,
+    CacheBackendError,
+    SweepResult,
+)
+from .file_index import FileKeyIndex, IndexEntry
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - lz4 is a declared dependency
+    lz4_frame = None  # type: ignore[assignment]
 
 # Use secure logger instead of standard logger
 logger = get_secure_logger(__name__)
 
+# Worker threads used by the multi-key operations
+BATCH_IO_WORKERS = 8
+
+# Metadata "payload" value of encrypted files whose serialized entry was encrypted as-is
+RAW_PAYLOAD_FORMAT = "raw"
+
+# Metadata "compression" value of files whose payload is an lz4 frame
+LZ4_COMPRESSION = "lz4"
+
 
 class FileBackend(CacheBackend):
     """
@@ -22,13 +47,25 @@ class FileBackend(CacheBackend):
 
     Stores cache entries as JSON files in the local filesystem.
     Maintains backward compatibility with existing cache files.
+
+    A persistent key index (see FileKeyIndex) tracks the original key, TTL and
+    operation of every file so that listing keys and recent entries does not
+    require opening each cache file. The index also stores dependency tags.
+
+    Payloads larger than the compression threshold are stored as lz4 frames
+    (compressed before encryption) when that makes them smaller. The key index
+    keeps the compressed and uncompressed sizes and the compression time of
+    each entry for get_stats().
     """
 
+    supports_tags = True
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
         profile: Optional[str] = None,
         encryption_enabled: bool = True,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
     ):
         """
         Initialize file backend.
@@ -38,12 +75,15 @@ class FileBackend(CacheBackend):
                       Defaults to ~/.awsideman/cache/
             profile: AWS profile name for isolation
             encryption_enabled: Whether to enable encryption for stored data
+            compression_threshold: Payload size in bytes above which entries are
+                      lz4-compressed. 0 disables compression.
         """
         self.cache_dir = cache_dir
         self.profile = profile
         self.path_manager = CachePathManager(cache_dir, profile)
         self.backend_type = "file"
         self.encryption_enabled = encryption_enabled
+        self.compression_threshold = compression_threshold
 
         # Initialize encryption system if enabled
         self.encryption_provider = None
@@ -69,6 +109,11 @@ class FileBackend(CacheBackend):
                 original_error=e,
             )
 
+        self.key_index = FileKeyIndex(self.path_manager.get_cache_directory())
+
+        # Time and sorted file names of the directory listing of the current sweep pass
+        self._sweep_listing: Optional[Tuple[float, List[str]]] = None
+
     def get(self, key: str) -> Optional[bytes]:
         """
         Retrieve raw data from file backend with input validation.
@@ -127,20 +172,24 @@ class FileBackend(CacheBackend):
 
                             if self.encryption_enabled and self.encryption_provider:
                                 try:
-                                    # Decrypt the data
-                                    decrypted_data = self.encryption_provider.decrypt(
-                                        encrypted_data
-                                    )
-
-                                    # Re-serialize as pickle to match the expected format
-                                    import pickle
-
-                                    pickled_data = pickle.dumps(decrypted_data)
+                                    if metadata.get("payload") == RAW_PAYLOAD_FORMAT:
+                                        # The payload was encrypted as stored; no re-serialization
+                                        payload = self._decompress_payload(
+                                            self.encryption_provider.decrypt_bytes(encrypted_data),
+                                            metadata,
+                                        )
+                                    else:
+                                        # Older files hold the entry encrypted as JSON
+                                        import pickle
+
+                                        payload = pickle.dumps(
+                                            self.encryption_provider.decrypt(encrypted_data)
+                                        )
 
                                     logger.debug(
                                         f"File backend cache hit for key: {key} (encrypted and decrypted)"
                                     )
-                                    return pickled_data
+                                    return payload
 
                                 except Exception as e:
                                     logger.error(f"Failed to decrypt data for key {key}: {e}")
@@ -153,6 +202,16 @@ class FileBackend(CacheBackend):
                                     f"Found encrypted data but encryption is disabled for key: {key}"
                                 )
                                 return encrypted_data
+                        elif metadata.get("encrypted") is False:
+                            # Unencrypted binary format (non-JSON payload, e.g. pickled entries)
+                            if time.time() > metadata["created_at"] + metadata["ttl"]:
+                                self._remove_cache_file(cache_file)
+                                return None
+
+                            logger.debug(f"File backend cache hit for key: {key} (binary)")
+                            return self._decompress_payload(
+                                file_content[4 + metadata_length :], metadata
+                            )
                 except (ValueError, json.JSONDecodeError, KeyError):
                     # Not the new format, fall through to old format
                     pass
@@ -235,6 +294,103 @@ class FileBackend(CacheBackend):
             ttl: Optional TTL in seconds. If None, uses default TTL of 3600.
             operation: AWS operation that generated this data
 
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        self._index_set(self._write_entry(key, data, ttl, operation))
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Retrieve raw data for several keys, reading the files in parallel.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to raw bytes for the keys that were found
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if len(unique_keys) <= 1:
+            return super().get_many(unique_keys)
+
+        with ThreadPoolExecutor(max_workers=min(BATCH_IO_WORKERS, len(unique_keys))) as pool:
+            values = list(pool.map(self.get, unique_keys))
+
+        return {key: data for key, data in zip(unique_keys, values) if data is not None}
+
+    def set_many(
+        self, items: Dict[str, bytes], ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Store several entries, writing the files in parallel.
+
+        The key index is updated once for the whole batch.
+
+        Args:
+            items: Dictionary of cache key to raw bytes data
+            ttl: Optional TTL in seconds. If None, uses default TTL of 3600.
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        if not items:
+            return
+
+        def write(item: Tuple[str, bytes]) -> IndexEntry:
+            key, data = item
+            return self._write_entry(key, data, ttl, operation)
+
+        with ThreadPoolExecutor(max_workers=min(BATCH_IO_WORKERS, len(items))) as pool:
+            written = list(pool.map(write, items.items()))
+
+        try:
+            self.key_index.record_set_many(written)
+        except Exception as e:
+            # The index self-heals on the next listing, never fail the write
+            logger.warning(f"Failed to update cache key index for batch write: {e}")
+
+    def delete_many(self, keys: List[str]) -> None:
+        """
+        Remove several cache entries with a single key index update.
+
+        Args:
+            keys: Cache keys to remove
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        removed = []
+        try:
+            for key in dict.fromkeys(keys):
+                if self.path_manager.delete_cache_file(key):
+                    removed.append(self.path_manager.get_cache_file_path(key).name)
+        except OSError as e:
+            logger.error(f"OS error invalidating cache: {e}")
+            raise CacheBackendError(
+                f"OS error invalidating cache: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+        finally:
+            if removed:
+                try:
+                    self.key_index.record_delete(removed)
+                except Exception as e:
+                    logger.warning(f"Failed to update cache key index for batch delete: {e}")
+
+        logger.debug(f"File backend invalidated {len(removed)} cache entries")
+
+    def _write_entry(self, key: str, data: bytes, ttl: Optional[int], operation: str) -> IndexEntry:
+        """
+        Validate and write a single cache file without touching the key index.
+
+        Returns:
+            IndexEntry describing the written file
+
         Raises:
             CacheBackendError: If backend operation fails
         """
@@ -275,27 +431,30 @@ class FileBackend(CacheBackend):
             # Write to cache file
             cache_file = self.path_manager.get_cache_file_path(key)
             temp_file = cache_file.with_suffix(".tmp")
+            created_at = time.time()
+
+            # Compress first; encrypted output does not compress
+            payload, compression = self._compress_payload(data)
+            # Header fields are only written for payloads that were actually compressed
+            header = compression if "compression" in compression else {}
 
             if self.encryption_enabled and self.encryption_provider:
                 # Encrypt the data before storing
                 try:
-                    # First, deserialize the pickled data to get the original data structure
-                    import pickle
-
-                    entry_data = pickle.loads(data)
-
-                    # Encrypt the data using the encryption provider
-                    encrypted_data = self.encryption_provider.encrypt(entry_data)
+                    # Encrypt the serialized entry as it is
+                    encrypted_data = self.encryption_provider.encrypt_bytes(payload)
 
                     # Store encrypted data with metadata
                     cache_metadata = {
                         "encrypted": True,
-                        "created_at": time.time(),
+                        "created_at": created_at,
                         "ttl": effective_ttl,
                         "key": key,
                         "operation": operation,
                         "data_size": len(encrypted_data),
                         "encryption_type": self.encryption_provider.get_encryption_type(),
+                        "payload": RAW_PAYLOAD_FORMAT,
+                        **header,
                     }
 
                     # Write metadata as JSON header followed by encrypted data
@@ -314,15 +473,31 @@ class FileBackend(CacheBackend):
                 except Exception as e:
                     logger.error(f"Failed to encrypt data for key {key}: {e}")
                     # Fall back to unencrypted storage
-                    self._store_unencrypted_data(temp_file, data, key, operation, effective_ttl)
+                    self._store_unencrypted_data(
+                        temp_file, payload, key, operation, effective_ttl, created_at, header
+                    )
             else:
                 # Store unencrypted data (backward compatibility)
-                self._store_unencrypted_data(temp_file, data, key, operation, effective_ttl)
+                self._store_unencrypted_data(
+                    temp_file, payload, key, operation, effective_ttl, created_at, header
+                )
 
             # Atomic rename
             temp_file.rename(cache_file)
             logger.debug(f"File backend cached data for key: {key} with TTL: {effective_ttl}s")
 
+            return IndexEntry(
+                cache_file.name,
+                key,
+                created_at,
+                effective_ttl,
+                operation,
+                self._file_size(cache_file),
+                uncompressed_size=compression.get("uncompressed_size", 0),
+                compressed_size=compression.get("compressed_size", 0),
+                compress_seconds=compression.get("compress_seconds", 0.0),
+            )
+
         except (TypeError, ValueError) as e:
             logger.error(f"Failed to serialize data for cache key {key}: {e}")
             self._cleanup_temp_file(cache_file)
@@ -370,56 +545,124 @@ class FileBackend(CacheBackend):
             )
 
     def _store_unencrypted_data(
-        self, temp_file: Path, data: bytes, key: str, operation: str, ttl: int
+        self,
+        temp_file: Path,
+        data: bytes,
+        key: str,
+        operation: str,
+        ttl: int,
+        created_at: Optional[float] = None,
+        compression: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Store unencrypted data in the old JSON format for backward compatibility.
 
+        Non-JSON and compressed payloads are stored in the binary header format.
+
         Args:
             temp_file: Temporary file path to write to
             data: Raw bytes data to store
             key: Cache key
             operation: Operation name
             ttl: TTL in seconds
+            created_at: Creation timestamp. Defaults to the current time.
+            compression: Metadata header fields describing a compressed payload
         """
-        try:
-            # Try to decode as JSON first (for backward compatibility)
-            decoded_data = data.decode("utf-8")
-            deserialized_data = json.loads(decoded_data)
-
-            # Create cache entry in old format
-            cache_data = {
-                "data": deserialized_data,
-                "created_at": time.time(),
-                "ttl": ttl,
-                "key": key,
-                "operation": operation,
-            }
+        if created_at is None:
+            created_at = time.time()
 
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, default=str)
-
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            # Data is not JSON, store as binary with metadata (pickled data)
-            cache_metadata = {
-                "encrypted": False,
-                "created_at": time.time(),
-                "ttl": ttl,
-                "key": key,
-                "operation": operation,
-                "data_size": len(data),
-            }
+        if not compression:
+            try:
+                # Try to decode as JSON first (for backward compatibility)
+                decoded_data = data.decode("utf-8")
+                deserialized_data = json.loads(decoded_data)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                pass
+            else:
+                # Create cache entry in old format
+                cache_data = {
+                    "data": deserialized_data,
+                    "created_at": created_at,
+                    "ttl": ttl,
+                    "key": key,
+                    "operation": operation,
+                }
+
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(cache_data, f, indent=2, default=str)
+                return
+
+        # Data is not JSON, store as binary with metadata (pickled or compressed data)
+        cache_metadata = {
+            "encrypted": False,
+            "created_at": created_at,
+            "ttl": ttl,
+            "key": key,
+            "operation": operation,
+            "data_size": len(data),
+            **(compression or {}),
+        }
+
+        # Write metadata as JSON header followed by raw data
+        with open(temp_file, "wb") as f:
+            # Write metadata header
+            metadata_json = json.dumps(cache_metadata).encode("utf-8")
+            metadata_length = len(metadata_json)
+
+            # Write: [4 bytes length][metadata JSON][raw data]
+            f.write(metadata_length.to_bytes(4, byteorder="big"))
+            f.write(metadata_json)
+            f.write(data)
+
+    def _compress_payload(self, data: bytes) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        lz4-compress a payload larger than the compression threshold.
 
-            # Write metadata as JSON header followed by raw data
-            with open(temp_file, "wb") as f:
-                # Write metadata header
-                metadata_json = json.dumps(cache_metadata).encode("utf-8")
-                metadata_length = len(metadata_json)
+        The compressed frame is only kept when it is smaller than the input.
 
-                # Write: [4 bytes length][metadata JSON][raw data]
-                f.write(metadata_length.to_bytes(4, byteorder="big"))
-                f.write(metadata_json)
-                f.write(data)
+        Args:
+            data: Serialized cache entry
+
+        Returns:
+            Tuple of (payload to store, compression accounting). The accounting
+            is empty when compression was not attempted; it contains
+            "compression" and "compressed_size" only when the frame was kept.
+        """
+        if lz4_frame is None or not self.compression_threshold:
+            return data, {}
+        if len(data) <= self.compression_threshold:
+            return data, {}
+
+        start = time.perf_counter()
+        compressed = lz4_frame.compress(data)
+        accounting: Dict[str, Any] = {
+            "uncompressed_size": len(data),
+            "compress_seconds": time.perf_counter() - start,
+        }
+        if len(compressed) >= len(data):
+            return data, accounting
+
+        accounting["compression"] = LZ4_COMPRESSION
+        accounting["compressed_size"] = len(compressed)
+        return compressed, accounting
+
+    @staticmethod
+    def _decompress_payload(payload: bytes, metadata: Dict[str, Any]) -> bytes:
+        """
+        Undo the compression recorded in a cache file's metadata header.
+
+        Raises:
+            ValueError: If the codec is unknown or the frame is corrupted
+        """
+        compression = metadata.get("compression")
+        if not compression:
+            return payload
+        if compression != LZ4_COMPRESSION or lz4_frame is None:
+            raise ValueError(f"Unsupported cache entry compression: {compression}")
+        try:
+            return lz4_frame.decompress(payload)
+        except RuntimeError as e:
+            raise ValueError(f"Corrupted lz4 payload: {e}") from e
 
     def invalidate(self, key: Optional[str] = None) -> None:
         """
@@ -435,10 +678,12 @@ class FileBackend(CacheBackend):
             if key is None:
                 # Clear all cache entries
                 deleted_count = self.path_manager.clear_all_cache_files()
+                self._index_clear()
                 logger.info(f"File backend cleared all cache entries ({deleted_count} files)")
             else:
                 # Clear specific cache entry
                 if self.path_manager.delete_cache_file(key):
+                    self._index_delete(self.path_manager.get_cache_file_path(key))
                     logger.debug(f"File backend invalidated cache entry for key: {key}")
                 else:
                     logger.debug(f"File backend cache entry not found for key: {key}")
@@ -516,7 +761,8 @@ class FileBackend(CacheBackend):
                                     metadata_json = file_content[4 : 4 + metadata_length]
                                     metadata = json.loads(metadata_json.decode("utf-8"))
 
-                                    if metadata.get("encrypted", False):
+                                    # Header format, encrypted or binary
+                                    if "encrypted" in metadata:
                                         is_encrypted_format = True
                                         # Check if expired
                                         if time.time() > metadata["created_at"] + metadata["ttl"]:
@@ -577,6 +823,7 @@ class FileBackend(CacheBackend):
                 "total_size_bytes": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
                 "cache_directory": str(self.path_manager.get_cache_directory()),
+                "compression": self._compression_stats(),
             }
 
             # Add warning if there are corrupted entries
@@ -593,283 +840,221 @@ class FileBackend(CacheBackend):
                 original_error=e,
             )
 
-    def get_recent_entries(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _compression_stats(self) -> Dict[str, Any]:
         """
-        Get recent cache entries with metadata.
-
-        Args:
-            limit: Maximum number of entries to return
+        Summarize compression of the entries in the key index.
 
         Returns:
-            List of dictionaries containing entry metadata
+            Dictionary with the codec, threshold, compressed and uncompressed
+            payload byte totals of compressed entries, and the time spent
+            compressing the entries currently stored
         """
-        entries: List[Dict[str, Any]] = []
-
-        try:
-            # Get cache files either from path_manager or directly from cache directory
-            if self.path_manager:
-                cache_files = self.path_manager.list_cache_files()
-            else:
-                # Fallback: list cache files directly from cache directory
-                if self.cache_dir is None:
-                    return entries
-                cache_dir = Path(self.cache_dir)
-                if not cache_dir.exists():
-                    return entries
-                cache_files = list(cache_dir.glob("*.json"))
-
-            if not cache_files:
-                return entries
-
-            # Sort by modification time (newest first)
-            cache_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        entries = self.key_index.entries()
+        compressed = [entry for entry in entries if entry.compressed_size]
+        uncompressed_bytes = sum(entry.uncompressed_size for entry in compressed)
+        compressed_bytes = sum(entry.compressed_size for entry in compressed)
+
+        return {
+            "codec": LZ4_COMPRESSION if lz4_frame is not None else None,
+            "threshold_bytes": self.compression_threshold,
+            "compressed_entries": len(compressed),
+            "incompressible_entries": sum(
+                1 for entry in entries if entry.uncompressed_size and not entry.compressed_size
+            ),
+            "uncompressed_bytes": uncompressed_bytes,
+            "compressed_bytes": compressed_bytes,
+            "compression_ratio": (
+                round(compressed_bytes / uncompressed_bytes, 3) if uncompressed_bytes else None
+            ),
+            "compress_time_ms": round(sum(entry.compress_seconds for entry in entries) * 1000, 3),
+        }
+
+    def list_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """
+        List the original cache keys stored in the file backend.
 
-            for cache_file in cache_files[:limit]:
-                try:
-                    # Get basic file info
-                    stat = cache_file.stat()
-                    key = cache_file.stem  # Remove .json extension
+        Keys are served from the persistent key index, so cache files are only
+        opened when they are not yet known to the index.
 
-                    # Try to read the cache entry JSON to get metadata
-                    try:
-                        # First try to read as binary to detect if it's encrypted
-                        with open(cache_file, "rb") as f:
-                            file_content = f.read()
+        Args:
+            prefix: Only return keys starting with this prefix
 
-                        # Check if it's the new encrypted format
-                        if len(file_content) >= 4:
-                            try:
-                                # Try to read metadata length
-                                metadata_length = int.from_bytes(file_content[:4], byteorder="big")
-                                if metadata_length > 0 and metadata_length < len(file_content):
-                                    # Try to parse metadata
-                                    metadata_json = file_content[4 : 4 + metadata_length]
-                                    metadata = json.loads(metadata_json.decode("utf-8"))
+        Returns:
+            List of cache keys
+        """
+        return [
+            entry.key
+            for entry in self._indexed_entries()
+            if entry.key and (not prefix or entry.key.startswith(prefix))
+        ]
 
-                                    if metadata.get("encrypted", False):
-                                        # This is encrypted format - extract metadata from header
-                                        created_at = metadata.get("created_at", 0)
-                                        ttl = metadata.get("ttl", 0)
-                                        operation = metadata.get("operation", "unknown")
+    def tag(self, tags_by_key: Dict[str, List[str]]) -> None:
+        """
+        Record dependency tags for cache files in the key index.
 
-                                        # Calculate age and remaining TTL
-                                        current_time = time.time()
-                                        age_seconds = current_time - created_at
-                                        remaining_ttl = ttl - age_seconds
+        Args:
+            tags_by_key: Dictionary of cache key to dependency tags
+        """
+        try:
+            self.key_index.record_tags(
+                {
+                    self.path_manager.get_cache_file_path(key).name: tags
+                    for key, tags in tags_by_key.items()
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record dependency tags in cache key index: {e}")
 
-                                        # Format TTL information
-                                        if remaining_ttl > 0:
-                                            ttl_display = f"{remaining_ttl:.0f}s remaining"
-                                        else:
-                                            ttl_display = "Expired"
+    def keys_for_tags(self, tags: List[str]) -> List[str]:
+        """
+        List the unexpired cache keys tagged with any of the given tags.
 
-                                        # Calculate age
-                                        if age_seconds < 60:
-                                            age_display = f"{age_seconds:.0f}s ago"
-                                        elif age_seconds < 3600:
-                                            age_display = f"{age_seconds/60:.0f}m ago"
-                                        else:
-                                            age_display = f"{age_seconds/3600:.1f}h ago"
+        Served from the key index alone; no cache file is opened.
 
-                                        # Get the actual cache key from metadata
-                                        actual_key = metadata.get("key", key)
+        Args:
+            tags: Dependency tags
 
-                                        # Try to parse as hierarchical key first
-                                        from ..key_builder import CacheKeyBuilder
+        Returns:
+            List of cache keys
+        """
+        now = time.time()
+        return [
+            entry.key
+            for entry in self.key_index.entries_for_tags(tags)
+            if entry.key and not entry.is_expired(now)
+        ]
 
-                                        key_components = CacheKeyBuilder.parse_key(actual_key)
+    def get_recent_entries(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get recent cache entries with metadata.
 
-                                        # Check if this is a hierarchical key (has colons)
-                                        if (
-                                            ":" in actual_key
-                                            and key_components.get("resource_type") != actual_key
-                                        ):
-                                            # This is a hierarchical key
-                                            resource_type = key_components.get(
-                                                "resource_type", "other"
-                                            )
-                                            operation_from_key = key_components.get(
-                                                "operation", operation
-                                            )
+        Args:
+            limit: Maximum number of entries to return
 
-                                        else:
-                                            # This is a hash-based key, extract info from operation name
-                                            operation_name = actual_key
-                                            if operation_name.startswith("list_"):
-                                                operation_from_key = "list"
-                                                if "user" in operation_name:
-                                                    resource_type = "user"
-                                                elif "group" in operation_name:
-                                                    resource_type = "group"
-                                                elif "permission_set" in operation_name:
-                                                    resource_type = "permission_set"
-                                                elif "assignment" in operation_name:
-                                                    resource_type = "assignment"
-                                                elif "account" in operation_name:
-                                                    resource_type = "account"
-                                                elif "organizational_unit" in operation_name:
-                                                    resource_type = "organizational_unit"
-                                                else:
-                                                    resource_type = "other"
-                                            elif operation_name.startswith("describe_"):
-                                                operation_from_key = "describe"
-                                                if "user" in operation_name:
-                                                    resource_type = "user"
-                                                elif "group" in operation_name:
-                                                    resource_type = "group"
-                                                elif "permission_set" in operation_name:
-                                                    resource_type = "permission_set"
-                                                elif "assignment" in operation_name:
-                                                    resource_type = "assignment"
-                                                elif "account" in operation_name:
-                                                    resource_type = "account"
-                                                else:
-                                                    resource_type = "other"
-                                            else:
-                                                operation_from_key = operation_name
-                                                resource_type = "other"
-
-                                        entry = {
-                                            "key": key,
-                                            "operation": operation_from_key,
-                                            "resource": resource_type,
-                                            "ttl": ttl_display,
-                                            "age": age_display,
-                                            "size": f"{stat.st_size} bytes",
-                                            "modified": stat.st_mtime,
-                                            "file_size": stat.st_size,
-                                            "is_expired": remaining_ttl <= 0,
-                                        }
-
-                                        entries.append(entry)
-                                        continue  # Skip to next file
-                            except (ValueError, json.JSONDecodeError, KeyError, UnicodeDecodeError):
-                                # Not the new encrypted format, fall through to plain text
-                                pass
+        Returns:
+            List of dictionaries containing entry metadata
+        """
+        entries: List[Dict[str, Any]] = []
 
-                        # Try to read as plain text JSON
-                        with open(cache_file, "r", encoding="utf-8") as f:
-                            cache_data = json.load(f)
-
-                        # Extract metadata from the JSON
-                        created_at = cache_data.get("created_at", 0)
-                        ttl = cache_data.get("ttl", 0)
-                        operation = cache_data.get("operation", "unknown")
-
-                        # Calculate age and remaining TTL
-                        current_time = time.time()
-                        age_seconds = current_time - created_at
-                        remaining_ttl = ttl - age_seconds
-
-                        # Format TTL information
-                        if remaining_ttl > 0:
-                            ttl_display = f"{remaining_ttl:.0f}s remaining"
-                        else:
-                            ttl_display = "Expired"
-
-                        # Calculate age
-                        if age_seconds < 60:
-                            age_display = f"{age_seconds:.0f}s ago"
-                        elif age_seconds < 3600:
-                            age_display = f"{age_seconds/60:.0f}m ago"
-                        else:
-                            age_display = f"{age_seconds/3600:.1f}h ago"
-
-                        # Get the actual cache key from the cache data
-                        actual_key = cache_data.get("key", key)
-
-                        # Try to parse as hierarchical key first
-                        from ..key_builder import CacheKeyBuilder
-
-                        key_components = CacheKeyBuilder.parse_key(actual_key)
-
-                        # Check if this is a hierarchical key (has colons)
-                        if ":" in actual_key and key_components.get("resource_type") != actual_key:
-                            # This is a hierarchical key
-                            resource_type = key_components.get("resource_type", "other")
-                            operation_from_key = key_components.get("operation", operation)
-                        else:
-                            # This is a hash-based key, extract info from operation name
-                            operation_name = actual_key
-                            if operation_name.startswith("list_"):
-                                operation_from_key = "list"
-                                if "user" in operation_name:
-                                    resource_type = "user"
-                                elif "group" in operation_name:
-                                    resource_type = "group"
-                                elif "permission_set" in operation_name:
-                                    resource_type = "permission_set"
-                                elif "assignment" in operation_name:
-                                    resource_type = "assignment"
-                                elif "account" in operation_name:
-                                    resource_type = "account"
-                                elif "organizational_unit" in operation_name:
-                                    resource_type = "organizational_unit"
-                                else:
-                                    resource_type = "other"
-                            elif operation_name.startswith("describe_"):
-                                operation_from_key = "describe"
-                                if "user" in operation_name:
-                                    resource_type = "user"
-                                elif "group" in operation_name:
-                                    resource_type = "group"
-                                elif "permission_set" in operation_name:
-                                    resource_type = "permission_set"
-                                elif "assignment" in operation_name:
-                                    resource_type = "assignment"
-                                elif "account" in operation_name:
-                                    resource_type = "account"
-                                else:
-                                    resource_type = "other"
-                            else:
-                                operation_from_key = operation_name
-                                resource_type = "other"
+        try:
+            indexed = self._indexed_entries()
+            if not indexed:
+                return entries
 
-                        entry = {
-                            "key": key,
-                            "operation": operation_from_key,
-                            "resource": resource_type,
-                            "ttl": ttl_display,
-                            "age": age_display,
-                            "size": f"{stat.st_size} bytes",
-                            "modified": stat.st_mtime,
-                            "file_size": stat.st_size,
-                            "is_expired": remaining_ttl <= 0,
-                        }
-                        entries.append(entry)
+            # Newest first
+            indexed.sort(key=lambda e: e.created_at, reverse=True)
+            current_time = time.time()
 
-                    except (json.JSONDecodeError, KeyError, TypeError, UnicodeDecodeError) as e:
-                        # If we can't read the JSON, return basic file info
-                        logger.debug(f"Could not read cache entry metadata from {cache_file}: {e}")
-                        # Parse the cache key to extract resource type and operation
-                        from ..key_builder import CacheKeyBuilder
+            for index_entry in indexed[:limit]:
+                # Keep the file name (hash) as the displayed key, as before
+                key = Path(index_entry.filename).stem
 
-                        key_components = CacheKeyBuilder.parse_key(key)
-                        resource_type = key_components.get("resource_type", "other")
-                        operation_from_key = key_components.get("operation", "unknown")
+                if index_entry.key is None:
+                    # Metadata could not be read from the file
+                    from ..key_builder import CacheKeyBuilder
 
-                        entry = {
+                    key_components = CacheKeyBuilder.parse_key(key)
+                    entries.append(
+                        {
                             "key": key,
-                            "operation": operation_from_key,
-                            "resource": resource_type,
+                            "operation": key_components.get("operation", "unknown"),
+                            "resource": key_components.get("resource_type", "other"),
                             "ttl": "Unknown",
                             "age": "Unknown",
-                            "size": f"{stat.st_size} bytes",
-                            "modified": stat.st_mtime,
-                            "file_size": stat.st_size,
+                            "size": f"{index_entry.size} bytes",
+                            "modified": index_entry.created_at,
+                            "file_size": index_entry.size,
                             "is_expired": False,
                         }
-                        entries.append(entry)
-
-                except Exception as e:
-                    logger.debug(f"Error reading cache entry metadata from {cache_file}: {e}")
+                    )
                     continue
 
+                # Calculate age and remaining TTL
+                age_seconds = current_time - index_entry.created_at
+                remaining_ttl = index_entry.ttl - age_seconds
+
+                # Format TTL information
+                if remaining_ttl > 0:
+                    ttl_display = f"{remaining_ttl:.0f}s remaining"
+                else:
+                    ttl_display = "Expired"
+
+                # Calculate age
+                if age_seconds < 60:
+                    age_display = f"{age_seconds:.0f}s ago"
+                elif age_seconds < 3600:
+                    age_display = f"{age_seconds/60:.0f}m ago"
+                else:
+                    age_display = f"{age_seconds/3600:.1f}h ago"
+
+                operation_from_key, resource_type = self._describe_key(
+                    index_entry.key, index_entry.operation
+                )
+
+                entries.append(
+                    {
+                        "key": key,
+                        "operation": operation_from_key,
+                        "resource": resource_type,
+                        "ttl": ttl_display,
+                        "age": age_display,
+                        "size": f"{index_entry.size} bytes",
+                        "modified": index_entry.created_at,
+                        "file_size": index_entry.size,
+                        "is_expired": remaining_ttl <= 0,
+                    }
+                )
+
         except Exception as e:
             logger.warning(f"Error getting recent entries from file backend: {e}")
 
         return entries
 
+    @staticmethod
+    def _describe_key(actual_key: str, operation: str) -> Tuple[str, str]:
+        """
+        Derive display operation and resource type from a cache key.
+
+        Args:
+            actual_key: Original cache key
+            operation: Operation recorded with the entry
+
+        Returns:
+            Tuple of (operation, resource_type)
+        """
+        from ..key_builder import CacheKeyBuilder
+
+        key_components = CacheKeyBuilder.parse_key(actual_key)
+
+        # Check if this is a hierarchical key (has colons)
+        if ":" in actual_key and key_components.get("resource_type") != actual_key:
+            return (
+                key_components.get("operation", operation),
+                key_components.get("resource_type", "other"),
+            )
+
+        # This is a hash-based key, extract info from operation name
+        if actual_key.startswith("list_"):
+            resource_names = [
+                "user",
+                "group",
+                "permission_set",
+                "assignment",
+                "account",
+                "organizational_unit",
+            ]
+            operation_from_key = "list"
+        elif actual_key.startswith("describe_"):
+            resource_names = ["user", "group", "permission_set", "assignment", "account"]
+            operation_from_key = "describe"
+        else:
+            return actual_key, "other"
+
+        for resource_name in resource_names:
+            if resource_name in actual_key:
+                return operation_from_key, resource_name
+        return operation_from_key, "other"
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check if file backend is healthy and accessible.
@@ -998,6 +1183,7 @@ class FileBackend(CacheBackend):
             if cache_file.exists():
                 cache_file.unlink()
                 logger.debug(f"Removed expired cache file: {cache_file}")
+            self._index_delete(cache_file)
         except PermissionError as e:
             logger.error(f"Permission denied removing cache file {cache_file}: {e}")
         except OSError as e:
@@ -1017,6 +1203,7 @@ class FileBackend(CacheBackend):
             if cache_file.exists():
                 cache_file.unlink()
                 logger.info(f"Removed corrupted cache file {cache_file}: {reason}")
+            self._index_delete(cache_file)
         except Exception as e:
             logger.error(f"Failed to remove corrupted cache file {cache_file}: {e}")
 
@@ -1042,8 +1229,8 @@ class FileBackend(CacheBackend):
         """
         Clean up expired cache files from the filesystem.
 
-        This method scans all cache files and removes those that have expired.
-        It's more efficient than checking files individually during access.
+        Expiry is decided from the key index, so only expired files are
+        touched. Files unknown to the index are indexed first.
 
         Returns:
             Number of expired files removed
@@ -1052,40 +1239,29 @@ class FileBackend(CacheBackend):
             CacheBackendError: If cleanup operation fails
         """
         try:
-            # Get all cache files
-            if self.path_manager:
-                cache_files = self.path_manager.list_cache_files()
-            else:
-                # Fallback: list cache files directly from cache directory
-                if self.cache_dir is None:
-                    return 0
-                cache_dir = Path(self.cache_dir)
-                if not cache_dir.exists():
-                    return 0
-                cache_files = list(cache_dir.glob("*.json"))
-
-            if not cache_files:
-                return 0
-
-            removed_count = 0
             current_time = time.time()
+            cache_dir = self.path_manager.get_cache_directory()
+            removed: List[str] = []
 
-            for cache_file in cache_files:
-                try:
-                    # Check if file is expired without loading full content
-                    if self._is_file_expired(cache_file, current_time):
-                        self._remove_cache_file(cache_file)
-                        removed_count += 1
-                        logger.debug(f"Removed expired cache file: {cache_file}")
+            for entry in self._indexed_entries():
+                if not entry.is_expired(current_time):
+                    continue
 
+                cache_file = cache_dir / entry.filename
+                try:
+                    if cache_file.exists():
+                        cache_file.unlink()
+                    removed.append(entry.filename)
+                    logger.debug(f"Removed expired cache file: {cache_file}")
                 except Exception as e:
                     logger.warning(f"Error checking/removing cache file {cache_file}: {e}")
                     continue
 
-            if removed_count > 0:
-                logger.info(f"Cleaned up {removed_count} expired cache files")
+            if removed:
+                self.key_index.record_delete(removed)
+                logger.info(f"Cleaned up {len(removed)} expired cache files")
 
-            return removed_count
+            return len(removed)
 
         except Exception as e:
             logger.error(f"Failed to cleanup expired cache files: {e}")
@@ -1095,67 +1271,178 @@ class FileBackend(CacheBackend):
                 original_error=e,
             )
 
-    def _is_file_expired(self, cache_file: Path, current_time: float) -> bool:
+    def sweep_expired(self, cursor: Optional[str] = None, limit: int = 500) -> SweepResult:
         """
-        Check if a cache file is expired without loading full content.
+        Remove expired cache files in file name order, a bounded slice at a time.
+
+        Expiry and sizes come from the key index, so only expired files are
+        touched. The directory is listed at the start of each pass, and each
+        slice reconciles only its own range of file names with the index, so
+        at most ``limit`` unindexed files are read per slice.
 
         Args:
-            cache_file: Path to cache file
-            current_time: Current timestamp
+            cursor: File name the previous slice ended at, None to start a pass
+            limit: Maximum number of index entries to examine
 
         Returns:
-            True if file is expired, False otherwise
+            SweepResult for this slice
+
+        Raises:
+            CacheBackendError: If the sweep fails
         """
         try:
-            # Try to read as binary first to detect format
+            if cursor is None or self._sweep_listing is None:
+                listed_at = time.time()
+                filenames = sorted(f.name for f in self.path_manager.list_cache_files())
+                self._sweep_listing = (listed_at, filenames)
+            listed_at, filenames = self._sweep_listing
+
+            start = 0 if cursor is None else bisect.bisect_right(filenames, cursor)
+            listed = filenames[start : start + limit]
+            self.key_index.reconcile(
+                listed,
+                self._read_index_metadata,
+                after=cursor,
+                through=listed[-1] if len(listed) == limit else None,
+                listed_at=listed_at,
+            )
+
+            entries = self.key_index.entries_after(cursor, limit)
+            current_time = time.time()
+            cache_dir = self.path_manager.get_cache_directory()
+            result = SweepResult(scanned=len(entries))
+            removed: List[str] = []
+
+            for entry in entries:
+                if not entry.is_expired(current_time):
+                    continue
+                try:
+                    (cache_dir / entry.filename).unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"Error removing expired cache file {entry.filename}: {e}")
+                    continue
+                removed.append(entry.filename)
+                result.bytes_freed += entry.size
+
+            if removed:
+                self.key_index.record_delete(removed)
+            result.removed = len(removed)
+            # A short slice means the end of the index was reached
+            result.cursor = entries[-1].filename if len(entries) == limit else None
+            if result.cursor is None:
+                self._sweep_listing = None
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to sweep expired cache files: {e}")
+            raise CacheBackendError(
+                f"Failed to sweep expired cache files: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+    def sweep_state_file(self) -> Optional[Path]:
+        """Keep the sweeper state next to the cache files."""
+        return self.path_manager.get_cache_directory() / SWEEP_STATE_FILE_NAME
+
+    def _indexed_entries(self) -> List[IndexEntry]:
+        """
+        Return key index entries reconciled against the files on disk.
+
+        Listing the directory is cheap; only files missing from the index are
+        opened to recover their metadata.
+
+        Returns:
+            List of index entries for the cache files currently on disk
+        """
+        filenames = [cache_file.name for cache_file in self.path_manager.list_cache_files()]
+        self.key_index.reconcile(filenames, self._read_index_metadata)
+        return self.key_index.entries()
+
+    def _read_index_metadata(self, filename: str) -> Optional[IndexEntry]:
+        """
+        Read index metadata from a cache file that is not yet indexed.
+
+        Args:
+            filename: Name of the cache file within the cache directory
+
+        Returns:
+            IndexEntry for the file, or None if the file no longer exists.
+            Unreadable files are returned with an already-expired entry so
+            that cleanup removes them.
+        """
+        cache_file = self.path_manager.get_cache_directory() / filename
+        try:
             with open(cache_file, "rb") as f:
                 file_content = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Could not read cache file {cache_file} for indexing: {e}")
+            return IndexEntry(filename, None, 0.0, 0)
 
-            # Check if it's the new encrypted format
-            if len(file_content) >= 4:
-                try:
-                    # Try to read metadata length
-                    metadata_length = int.from_bytes(file_content[:4], byteorder="big")
-                    if metadata_length > 0 and metadata_length < len(file_content):
-                        # Try to parse metadata
-                        metadata_json = file_content[4 : 4 + metadata_length]
-                        metadata = json.loads(metadata_json.decode("utf-8"))
+        size = len(file_content)
+        metadata = None
 
-                        if metadata.get("encrypted", False):
-                            # Check if expired
-                            return current_time > float(metadata["created_at"]) + float(
-                                metadata["ttl"]
-                            )
-                except (ValueError, json.JSONDecodeError, KeyError):
-                    # Not the new format, fall through to old format
-                    pass
+        # Header format: [4 bytes length][metadata JSON][payload]
+        if size >= 4:
+            metadata_length = int.from_bytes(file_content[:4], byteorder="big")
+            if 0 < metadata_length < size:
+                try:
+                    metadata = json.loads(file_content[4 : 4 + metadata_length].decode("utf-8"))
+                except (ValueError, UnicodeDecodeError):
+                    metadata = None
 
-            # Try old JSON format - only read the first part to get TTL info
+        # Legacy plain JSON format
+        if not isinstance(metadata, dict):
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    # Read only the first few lines to get TTL info
-                    content = f.read(1024)  # Read first 1KB
-
-                    # Try to extract created_at and ttl from the JSON
-                    if '"created_at"' in content and '"ttl"' in content:
-                        # Parse just the relevant fields
-                        import re
+                metadata = json.loads(file_content.decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                metadata = None
 
-                        created_at_match = re.search(r'"created_at":\s*(\d+(?:\.\d+)?)', content)
-                        ttl_match = re.search(r'"ttl":\s*(\d+)', content)
+        try:
+            compressed = metadata.get("compression") is not None
+            return IndexEntry(
+                filename=filename,
+                key=metadata["key"],
+                created_at=float(metadata["created_at"]),
+                ttl=int(metadata["ttl"]),
+                operation=metadata.get("operation", "unknown"),
+                size=size,
+                uncompressed_size=int(metadata.get("uncompressed_size", 0)) if compressed else 0,
+                compressed_size=int(metadata.get("compressed_size", 0)) if compressed else 0,
+                compress_seconds=(
+                    float(metadata.get("compress_seconds", 0.0)) if compressed else 0.0
+                ),
+            )
+        except (TypeError, KeyError, ValueError):
+            return IndexEntry(filename, None, 0.0, 0, size=size)
 
-                        if created_at_match and ttl_match:
-                            created_at = float(created_at_match.group(1))
-                            ttl = int(ttl_match.group(1))
-                            return current_time > created_at + ttl
+    def _index_set(self, entry: IndexEntry) -> None:
+        """Record a written cache file in the key index."""
+        try:
+            self.key_index.record_set_many([entry])
+        except Exception as e:
+            # The index self-heals on the next listing, never fail the write
+            logger.warning(f"Failed to update cache key index for key {entry.key}: {e}")
 
-            except (json.JSONDecodeError, UnicodeDecodeError, ValueError):
-                # If we can't parse it, consider it expired
-                return True
+    @staticmethod
+    def _file_size(cache_file: Path) -> int:
+        try:
+            return os.stat(cache_file).st_size
+        except OSError:
+            return 0
 
-            # If we can't determine expiration, consider it not expired
-            return False
+    def _index_delete(self, cache_file: Path) -> None:
+        """Record a removed cache file in the key index."""
+        try:
+            self.key_index.record_delete([cache_file.name])
+        except Exception as e:
+            logger.warning(f"Failed to update cache key index for {cache_file}: {e}")
 
-        except Exception:
-            # If there's any error reading the file, consider it expired
-            return True
+    def _index_clear(self) -> None:
+        """Drop all entries from the key index."""
+        try:
+            self.key_index.clear()
+        except Exception as e:
+            logger.warning(f"Failed to clear cache key index: {e}")
@@ -0,0 +1,451 @@
+"""Persistent key index for the file cache backend.
+
+The file backend names cache files after a SHA-256 hash of the cache key, so
+recovering the original key, TTL or operation used to require opening and
+parsing every file. This module keeps that metadata in an append-only JSON
+lines journal next to the cache files so that key listing, pattern
+invalidation and recent-entry listing only touch the journal.
+
+Journal records are one JSON object per line:
+
+- ``{"f": filename, "k": key, "c": created_at, "t": ttl, "o": operation, "s": size}``
+  records a write.
+- ``{"f": filename, "d": 1}`` records a removal.
+- ``{"f": filename, "g": [tag, ...]}`` records the dependency tags of the file
+  written last; write records may carry ``"g"`` as well.
+
+Write records of entries that were considered for compression also carry the
+uncompressed payload size ``"u"``, the lz4-compressed payload size ``"z"`` (only
+when the compressed payload was kept) and the time spent compressing ``"x"``.
+
+Replaying the journal is idempotent, so readers in other processes can pick up
+new records incrementally from their last offset. The journal is compacted
+into a snapshot (written to a temp file and swapped in with ``os.replace``)
+once it grows well beyond the number of live entries.
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from ...utils.security import get_secure_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = get_secure_logger(__name__)
+
+# Neither name ends in ".json" so the index never shows up as a cache file.
+INDEX_FILE_NAME = "_key_index.jsonl"
+LOCK_FILE_NAME = "_key_index.lock"
+
+# Minimum number of journal lines before compaction is considered.
+DEFAULT_COMPACT_THRESHOLD = 1000
+
+
+@dataclass
+class IndexEntry:
+    """Metadata for a single cache file tracked by the key index."""
+
+    filename: str
+    key: Optional[str]
+    created_at: float
+    ttl: int
+    operation: str = "unknown"
+    size: int = 0
+    tags: List[str] = field(default_factory=list)
+    uncompressed_size: int = 0
+    compressed_size: int = 0
+    compress_seconds: float = 0.0
+
+    @property
+    def expires_at(self) -> float:
+        """Timestamp at which the entry expires."""
+        return self.created_at + self.ttl
+
+    def is_expired(self, current_time: Optional[float] = None) -> bool:
+        """Check whether the entry has expired."""
+        if current_time is None:
+            current_time = time.time()
+        return current_time > self.expires_at
+
+    def to_record(self) -> Dict:
+        """Serialize the entry as a journal record."""
+        record = {
+            "f": self.filename,
+            "k": self.key,
+            "c": self.created_at,
+            "t": self.ttl,
+            "o": self.operation,
+            "s": self.size,
+        }
+        if self.tags:
+            record["g"] = self.tags
+        if self.uncompressed_size:
+            record["u"] = self.uncompressed_size
+            record["x"] = self.compress_seconds
+        if self.compressed_size:
+            record["z"] = self.compressed_size
+        return record
+
+
+class FileKeyIndex:
+    """
+    Append-only, multi-process safe index of the files in a cache directory.
+
+    Writers append records under an exclusive ``flock`` on a sidecar lock file.
+    Readers refresh incrementally by reading the journal from the last offset
+    they saw; a changed inode or a shrunken file triggers a full reload.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+    ):
+        """
+        Initialize the key index.
+
+        Args:
+            cache_dir: Directory holding the cache files and the index journal
+            compact_threshold: Minimum journal length (in records) before compaction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.index_file = self.cache_dir / INDEX_FILE_NAME
+        self.lock_file = self.cache_dir / LOCK_FILE_NAME
+        self.compact_threshold = compact_threshold
+
+        self._entries: Dict[str, IndexEntry] = {}
+        self._files_by_tag: Dict[str, Set[str]] = defaultdict(set)
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._journal_records = 0
+        self._thread_lock = threading.RLock()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the in-process lock and, where supported, the cross-process lock."""
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "a") as lock_handle:
+                fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+
+    def _drop_entry(self, filename: str) -> None:
+        """Remove an entry and its tags from the in-memory view."""
+        entry = self._entries.pop(filename, None)
+        if entry is not None:
+            self._untag(entry)
+
+    def _untag(self, entry: IndexEntry) -> None:
+        for tag in entry.tags:
+            files = self._files_by_tag.get(tag)
+            if files is not None:
+                files.discard(entry.filename)
+                if not files:
+                    del self._files_by_tag[tag]
+
+    def _set_tags(self, entry: IndexEntry, tags: List[str]) -> None:
+        self._untag(entry)
+        entry.tags = list(tags)
+        for tag in entry.tags:
+            self._files_by_tag[tag].add(entry.filename)
+
+    def _reset(self) -> None:
+        self._entries.clear()
+        self._files_by_tag.clear()
+        self._offset = 0
+        self._journal_records = 0
+
+    def _apply_record(self, record: Dict) -> None:
+        """Apply a single journal record to the in-memory view."""
+        filename = record.get("f")
+        if not filename:
+            return
+
+        if record.get("d"):
+            self._drop_entry(filename)
+            return
+
+        if "c" not in record:
+            # Tag record for the file as last written
+            entry = self._entries.get(filename)
+            if entry is not None:
+                self._set_tags(entry, record.get("g") or [])
+            return
+
+        self._drop_entry(filename)
+        entry = IndexEntry(
+            filename=filename,
+            key=record.get("k"),
+            created_at=float(record.get("c", 0)),
+            ttl=int(record.get("t", 0)),
+            operation=record.get("o", "unknown"),
+            size=int(record.get("s", 0)),
+            uncompressed_size=int(record.get("u", 0)),
+            compressed_size=int(record.get("z", 0)),
+            compress_seconds=float(record.get("x", 0.0)),
+        )
+        self._entries[filename] = entry
+        self._set_tags(entry, record.get("g") or [])
+
+    def _refresh(self) -> None:
+        """Bring the in-memory view up to date with the on-disk journal."""
+        try:
+            stat = os.stat(self.index_file)
+        except FileNotFoundError:
+            self._reset()
+            self._inode = None
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Journal was compacted, cleared or replaced - start over
+            self._reset()
+            self._inode = stat.st_ino
+
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.index_file, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read()
+
+        # Only consume complete lines; a partial trailing line is picked up next time
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+
+        for line in chunk[: end + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply_record(json.loads(line))
+            except (ValueError, TypeError) as e:
+                logger.debug(f"Skipping malformed key index record: {e}")
+            self._journal_records += 1
+
+        self._offset += end + 1
+
+    def _append(self, records: List[Dict]) -> None:
+        """Append records to the journal. Caller must hold the file lock."""
+        payload = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(payload)
+
+        # Our own records are replayed like anyone else's; replay is idempotent
+        self._refresh()
+
+        if self._journal_records > max(self.compact_threshold, 2 * len(self._entries)):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the journal as a snapshot of live entries. Caller must hold the lock."""
+        temp_file = self.index_file.with_name(INDEX_FILE_NAME + ".tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                for entry in self._entries.values():
+                    f.write(json.dumps(entry.to_record(), separators=(",", ":")) + "\n")
+            os.replace(temp_file, self.index_file)
+            logger.debug(f"Compacted cache key index to {len(self._entries)} entries")
+        except OSError as e:
+            logger.warning(f"Failed to compact cache key index: {e}")
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+            return
+
+        self._inode = None
+        self._refresh()
+
+    def record_set(
+        self,
+        filename: str,
+        key: str,
+        created_at: float,
+        ttl: int,
+        operation: str = "unknown",
+        size: int = 0,
+    ) -> None:
+        """
+        Record that a cache file was written.
+
+        Args:
+            filename: Name of the cache file within the cache directory
+            key: Original cache key
+            created_at: Creation timestamp stored in the entry
+            ttl: TTL in seconds
+            operation: AWS operation that generated the entry
+            size: Size of the cache file in bytes
+        """
+        entry = IndexEntry(filename, key, created_at, ttl, operation, size)
+        with self._file_lock():
+            self._append([entry.to_record()])
+
+    def record_set_many(self, entries: List[IndexEntry]) -> None:
+        """
+        Record several written cache files with a single journal append.
+
+        Args:
+            entries: Index entries for the written files
+        """
+        if not entries:
+            return
+        with self._file_lock():
+            self._append([entry.to_record() for entry in entries])
+
+    def record_tags(self, tags_by_file: Dict[str, List[str]]) -> None:
+        """
+        Record the dependency tags of written cache files.
+
+        Args:
+            tags_by_file: Dictionary of cache file name to dependency tags
+        """
+        records = [
+            {"f": filename, "g": sorted(tags)} for filename, tags in tags_by_file.items() if tags
+        ]
+        if not records:
+            return
+        with self._file_lock():
+            self._append(records)
+
+    def record_delete(self, filenames: List[str]) -> None:
+        """
+        Record that cache files were removed.
+
+        Args:
+            filenames: Names of the removed cache files
+        """
+        if not filenames:
+            return
+        with self._file_lock():
+            self._append([{"f": filename, "d": 1} for filename in filenames])
+
+    def clear(self) -> None:
+        """Drop every entry by swapping in an empty journal."""
+        with self._file_lock():
+            temp_file = self.index_file.with_name(INDEX_FILE_NAME + ".tmp")
+            temp_file.write_text("", encoding="utf-8")
+            os.replace(temp_file, self.index_file)
+            self._inode = None
+            self._refresh()
+
+    def reconcile(
+        self,
+        filenames: List[str],
+        read_metadata: Callable[[str], Optional[IndexEntry]],
+        after: Optional[str] = None,
+        through: Optional[str] = None,
+        listed_at: Optional[float] = None,
+    ) -> None:
+        """
+        Reconcile the index with the files actually present on disk.
+
+        Files written by older versions or by other tools are indexed by reading
+        their metadata once; entries whose files have disappeared are dropped.
+        With ``after`` or ``through``, only the file names in that range are
+        reconciled, so a large directory can be reconciled a slice at a time.
+
+        Args:
+            filenames: Names of the cache files on disk, within the range if one is given
+            read_metadata: Callback returning index metadata for an unknown file
+            after: Exclusive lower bound of the file names to reconcile
+            through: Inclusive upper bound of the file names to reconcile
+            listed_at: When ``filenames`` was listed; entries created later are
+                kept even if their files are not listed
+        """
+        with self._thread_lock:
+            self._refresh()
+            present = set(filenames)
+            missing = [name for name in filenames if name not in self._entries]
+            stale = [
+                name
+                for name, entry in self._entries.items()
+                if name not in present
+                and (after is None or name > after)
+                and (through is None or name <= through)
+                and (listed_at is None or entry.created_at < listed_at)
+            ]
+
+        if not missing and not stale:
+            return
+
+        records: List[Dict] = [{"f": name, "d": 1} for name in stale]
+        for name in missing:
+            entry = read_metadata(name)
+            if entry is not None:
+                records.append(entry.to_record())
+
+        if records:
+            with self._file_lock():
+                self._append(records)
+
+    def entries(self) -> List[IndexEntry]:
+        """Return all indexed entries."""
+        with self._thread_lock:
+            self._refresh()
+            return list(self._entries.values())
+
+    def entries_for_tags(self, tags: Iterable[str]) -> List[IndexEntry]:
+        """
+        Return the indexed entries tagged with any of the given tags.
+
+        Args:
+            tags: Dependency tags
+
+        Returns:
+            List of matching index entries
+        """
+        with self._thread_lock:
+            self._refresh()
+            filenames: Set[str] = set()
+            for tag in tags:
+                filenames.update(self._files_by_tag.get(tag, ()))
+            return [self._entries[name] for name in filenames if name in self._entries]
+
+    def entries_after(self, filename: Optional[str], limit: int) -> List[IndexEntry]:
+        """
+        Return up to ``limit`` entries in file name order, starting after a cursor.
+
+        Args:
+            filename: Exclusive lower bound on the file name, None to start at the beginning
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of index entries sorted by file name
+        """
+        with self._thread_lock:
+            self._refresh()
+            names = (
+                self._entries
+                if filename is None
+                else (name for name in self._entries if name > filename)
+            )
+            return [self._entries[name] for name in heapq.nsmallest(limit, names)]
+
+    def get(self, filename: str) -> Optional[IndexEntry]:
+        """Return the index entry for a cache file, if any."""
+        with self._thread_lock:
+            self._refresh()
+            return self._entries.get(filename)
+
+    def __len__(self) -> int:
+        with self._thread_lock:
+            self._refresh()
+            return len(self._entries)
@@ -2,11 +2,16 @@
 
 import logging
 import time
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from .base import BackendHealthStatus, CacheBackend, CacheBackendError
+from .base import BackendHealthStatus, CacheBackend, CacheBackendError, SweepResult
 from .dynamodb import DynamoDBBackend
 from .file import FileBackend
+from .write_behind import WriteBehindQueue
+
+if TYPE_CHECKING:
+    from ..metrics import CacheMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +25,16 @@ class HybridBackend(CacheBackend):
     - All data is stored in DynamoDB for sharing across machines
     - Local cache acts as a fast access layer
     - Automatic promotion/demotion based on access patterns
+    - Optional write-behind: writes land locally at once and reach DynamoDB
+      through a bounded queue drained by a background flusher
     """
 
     def __init__(
-        self, local_backend: FileBackend, remote_backend: DynamoDBBackend, local_ttl: int = 300
+        self,
+        local_backend: FileBackend,
+        remote_backend: DynamoDBBackend,
+        local_ttl: int = 300,
+        write_behind_queue_size: int = 0,
     ):
         """
         Initialize hybrid backend.
@@ -32,6 +43,8 @@ class HybridBackend(CacheBackend):
             local_backend: File backend for local caching
             remote_backend: DynamoDB backend for remote storage
             local_ttl: TTL for local cache entries in seconds (default: 5 minutes)
+            write_behind_queue_size: Queue remote writes for a background flusher,
+                                     holding at most this many keys (0 writes synchronously)
         """
         self.local_backend = local_backend
         self.remote_backend = remote_backend
@@ -42,7 +55,17 @@ class HybridBackend(CacheBackend):
         self._access_counts: Dict[str, int] = {}
         self._last_access_times: Dict[str, float] = {}
 
-        logger.debug(f"Initialized hybrid backend with local_ttl: {local_ttl}s")
+        self._write_behind: Optional[WriteBehindQueue] = None
+        if write_behind_queue_size > 0:
+            self._write_behind = WriteBehindQueue(remote_backend, write_behind_queue_size)
+
+        # Per-tier latency histograms, attached by the CacheManager
+        self._metrics: Optional["CacheMetrics"] = None
+
+        logger.debug(
+            f"Initialized hybrid backend with local_ttl: {local_ttl}s, "
+            f"write_behind_queue_size: {write_behind_queue_size}"
+        )
 
     def get(self, key: str) -> Optional[bytes]:
         """
@@ -69,7 +92,9 @@ class HybridBackend(CacheBackend):
 
             # First, try local cache for fast access
             try:
+                started = time.perf_counter()
                 local_data = self.local_backend.get(key)
+                self._observe(key, "local", local_data, started)
                 if local_data is not None:
                     logger.debug(f"Hybrid backend local cache hit for key: {key}")
                     return local_data
@@ -77,9 +102,17 @@ class HybridBackend(CacheBackend):
                 logger.warning(f"Local backend error during get for key {key}: {e}")
                 # Continue to remote backend
 
+            # A write still queued for DynamoDB is newer than anything stored there
+            if self._write_behind is not None:
+                pending_data = self._write_behind.get(key)
+                if pending_data is not None:
+                    return pending_data
+
             # If not in local cache, try remote DynamoDB
             try:
+                started = time.perf_counter()
                 remote_data = self.remote_backend.get(key)
+                self._observe(key, "remote", remote_data, started)
                 if remote_data is not None:
                     logger.debug(f"Hybrid backend remote cache hit for key: {key}")
 
@@ -124,6 +157,10 @@ class HybridBackend(CacheBackend):
         2. Store to local cache if data is likely to be accessed again soon
         3. Handle partial failures gracefully
 
+        In write-behind mode the entry is always stored locally and the remote
+        write is queued; it is written synchronously only when the queue stays
+        full.
+
         Args:
             key: Cache key to store data under
             data: Raw bytes data to store
@@ -134,10 +171,16 @@ class HybridBackend(CacheBackend):
             CacheBackendError: If remote storage fails (local failures are logged but not raised)
         """
         try:
+            if self._write_behind is not None:
+                self._set_write_behind(self._write_behind, key, data, ttl, operation)
+                return
+
             # Always store to remote backend first (most important)
             remote_error = None
             try:
+                started = time.perf_counter()
                 self.remote_backend.set(key, data, ttl, operation)
+                self._observe(key, "remote", data, started, outcome="fill")
                 logger.debug(f"Stored key {key} to remote backend")
             except CacheBackendError as e:
                 remote_error = e
@@ -151,7 +194,9 @@ class HybridBackend(CacheBackend):
                     if ttl is not None and ttl < self.local_ttl:
                         effective_local_ttl = ttl
 
+                    started = time.perf_counter()
                     self.local_backend.set(key, data, effective_local_ttl, operation)
+                    self._observe(key, "local", data, started, outcome="fill")
                     logger.debug(
                         f"Stored key {key} to local backend with TTL: {effective_local_ttl}s"
                     )
@@ -176,6 +221,71 @@ class HybridBackend(CacheBackend):
                 original_error=e,
             )
 
+    def attach_metrics(self, metrics: "CacheMetrics") -> None:
+        """
+        Record local and remote tier latencies into a metrics registry.
+
+        Args:
+            metrics: Registry shared with the owning CacheManager
+        """
+        self._metrics = metrics
+
+    def _observe(
+        self,
+        key: str,
+        tier: str,
+        data: Optional[bytes],
+        started: float,
+        outcome: Optional[str] = None,
+    ) -> None:
+        """Record a tier lookup (hit or miss by ``data``) or fill started at ``started``."""
+        if self._metrics is None:
+            return
+        self._metrics.record_key(
+            key,
+            tier,
+            outcome or ("hit" if data is not None else "miss"),
+            time.perf_counter() - started,
+            size=len(data) if data is not None else None,
+        )
+
+    def _local_ttl_for(self, ttl: Optional[int]) -> int:
+        """Use the local TTL, unless the entry's own TTL is shorter."""
+        if ttl is not None and ttl < self.local_ttl:
+            return ttl
+        return self.local_ttl
+
+    def _set_write_behind(
+        self, queue: WriteBehindQueue, key: str, data: bytes, ttl: Optional[int], operation: str
+    ) -> None:
+        """Store locally and queue the remote write, falling back to a synchronous write."""
+        try:
+            started = time.perf_counter()
+            self.local_backend.set(key, data, self._local_ttl_for(ttl), operation)
+            self._observe(key, "local", data, started, outcome="fill")
+        except CacheBackendError as e:
+            logger.warning(f"Failed to store key {key} to local backend: {e}")
+
+        if not queue.put(key, data, ttl, operation):
+            self.remote_backend.set(key, data, ttl, operation)
+        self._track_access(key)
+
+    def flush(self) -> int:
+        """
+        Send every queued write-behind entry to the remote backend.
+
+        Returns:
+            Number of entries written, 0 when write-behind is disabled
+        """
+        if self._write_behind is None:
+            return 0
+        return self._write_behind.flush()
+
+    def close(self) -> None:
+        """Flush queued remote writes and stop the write-behind flusher."""
+        if self._write_behind is not None:
+            self._write_behind.close()
+
     def invalidate(self, key: Optional[str] = None) -> None:
         """
         Remove cache entries from hybrid backend.
@@ -195,6 +305,10 @@ class HybridBackend(CacheBackend):
             local_error = None
             remote_error = None
 
+            # Queued writes must not recreate the entries after the delete
+            if self._write_behind is not None:
+                self._write_behind.discard(None if key is None else [key])
+
             # Invalidate from local backend
             try:
                 self.local_backend.invalidate(key)
@@ -244,6 +358,176 @@ class HybridBackend(CacheBackend):
                 original_error=e,
             )
 
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Retrieve data for several keys from the hybrid backend.
+
+        Local hits are served first; the remaining keys are fetched from the
+        remote backend in one batch and promoted locally where appropriate.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to raw bytes for the keys that were found
+
+        Raises:
+            CacheBackendError: If the remote backend fails
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        for key in unique_keys:
+            self._track_access(key)
+
+        results: Dict[str, bytes] = {}
+        try:
+            results.update(self.local_backend.get_many(unique_keys))
+        except CacheBackendError as e:
+            logger.warning(f"Local backend error during batch get: {e}")
+
+        if self._write_behind is not None:
+            for key in unique_keys:
+                if key not in results:
+                    pending_data = self._write_behind.get(key)
+                    if pending_data is not None:
+                        results[key] = pending_data
+
+        missing = [key for key in unique_keys if key not in results]
+        if not missing:
+            return results
+
+        remote_results = self.remote_backend.get_many(missing)
+        results.update(remote_results)
+
+        promote = {
+            key: data for key, data in remote_results.items() if self._should_promote_to_local(key)
+        }
+        if promote:
+            try:
+                self.local_backend.set_many(promote, self.local_ttl, "promotion")
+                logger.debug(f"Promoted {len(promote)} keys to local cache")
+            except CacheBackendError as e:
+                logger.warning(f"Failed to promote keys to local cache: {e}")
+
+        return results
+
+    def set_many(
+        self, items: Dict[str, bytes], ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Store several entries to the remote backend and, where appropriate, locally.
+
+        Args:
+            items: Dictionary of cache key to raw bytes data
+            ttl: Optional TTL in seconds
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If remote storage fails (local failures are logged but not raised)
+        """
+        if not items:
+            return
+
+        if self._write_behind is not None:
+            try:
+                self.local_backend.set_many(items, self._local_ttl_for(ttl), operation)
+            except CacheBackendError as e:
+                logger.warning(f"Failed to store batch to local backend: {e}")
+
+            rejected = {
+                key: data
+                for key, data in items.items()
+                if not self._write_behind.put(key, data, ttl, operation)
+            }
+            if rejected:
+                self.remote_backend.set_many(rejected, ttl, operation)
+            for key in items:
+                self._track_access(key)
+            return
+
+        remote_error = None
+        try:
+            self.remote_backend.set_many(items, ttl, operation)
+        except CacheBackendError as e:
+            remote_error = e
+            logger.error(f"Failed to store batch of {len(items)} keys to remote backend: {e}")
+
+        local_items = {
+            key: data for key, data in items.items() if self._should_cache_locally(key, operation)
+        }
+        if local_items:
+            try:
+                self.local_backend.set_many(local_items, self._local_ttl_for(ttl), operation)
+            except CacheBackendError as e:
+                logger.warning(f"Failed to store batch to local backend: {e}")
+
+        if remote_error:
+            raise remote_error
+
+        for key in items:
+            self._track_access(key)
+
+    def delete_many(self, keys: List[str]) -> None:
+        """
+        Remove several entries from both backends.
+
+        Args:
+            keys: Cache keys to remove
+
+        Raises:
+            CacheBackendError: If the remote backend fails (local failures are logged)
+        """
+        if self._write_behind is not None:
+            self._write_behind.discard(keys)
+
+        try:
+            self.local_backend.delete_many(keys)
+        except CacheBackendError as e:
+            logger.warning(f"Failed to delete batch from local backend: {e}")
+
+        for key in keys:
+            self._access_counts.pop(key, None)
+            self._last_access_times.pop(key, None)
+
+        self.remote_backend.delete_many(keys)
+
+    def list_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """
+        List cache keys held by the local tier.
+
+        The remote tier is not scanned; keys that only live remotely are
+        reached through their own TTLs or a full invalidation.
+
+        Args:
+            prefix: Only return keys starting with this prefix
+
+        Returns:
+            List of cache keys from the local backend
+        """
+        try:
+            return self.local_backend.list_keys(prefix)
+        except Exception as e:
+            logger.warning(f"Failed to list keys from local backend: {e}")
+            return []
+
+    def sweep_expired(self, cursor: Optional[str] = None, limit: int = 500) -> SweepResult:
+        """
+        Sweep expired entries from the local tier.
+
+        DynamoDB removes expired items itself through its native TTL.
+
+        Args:
+            cursor: Cursor returned by the previous step, None to start a pass
+            limit: Maximum number of entries to examine
+
+        Returns:
+            SweepResult of the local backend
+        """
+        return self.local_backend.sweep_expired(cursor, limit)
+
+    def sweep_state_file(self) -> Optional[Path]:
+        """Keep the sweeper state with the local tier."""
+        return self.local_backend.sweep_state_file()
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get hybrid backend statistics.
@@ -264,6 +548,8 @@ class HybridBackend(CacheBackend):
                     "most_accessed_keys": self._get_most_accessed_keys(5),
                 },
             }
+            if self._write_behind is not None:
+                stats["write_behind"] = self._write_behind.stats()
 
             # Get local backend stats
             try:
@@ -0,0 +1,1005 @@
+"""Append-only segment log cache backend.
+
+Entries are appended to a small number of large segment files instead of one
+file per key, which keeps inode usage and directory scans independent of the
+number of cached entries. Each process keeps an in-memory index from cache key
+to record location and reads values through memory-mapped segments.
+
+Layout of the segment directory:
+
+- ``MANIFEST``: JSON list of live segment ids, oldest first. The last segment
+  is the active one; all writes are appended to it. The manifest is replaced
+  atomically whenever segments are added or removed.
+- ``seg-<id>.log``: records, one after another.
+- ``LOCK``: sidecar file used for an exclusive ``flock`` around writes, so
+  several processes can share the log.
+
+Each record is a fixed header followed by the key, the operation name and the
+value::
+
+    crc32 | flags | created_at | ttl | key_len | op_len | value_len | key | op | value
+
+Overwrites and invalidations append a new record (a tombstone for
+invalidations); the superseded bytes are reclaimed by compaction, which
+rewrites the live, unexpired records into a fresh segment and drops the old
+ones. Compaction runs on a background thread once the garbage ratio passes a
+threshold.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from ...encryption.aes import AESEncryption
+from ...encryption.key_manager import KeyManager
+from ...utils.security import get_secure_logger, input_validator
+from ..utils import CachePathManager
+from .base import CacheBackend, CacheBackendError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = get_secure_logger(__name__)
+
+SEGMENT_DIR_NAME = "segments"
+MANIFEST_FILE_NAME = "MANIFEST"
+LOCK_FILE_NAME = "LOCK"
+MANIFEST_VERSION = 1
+
+# crc32, flags, created_at, ttl, key length, operation length, value length
+RECORD_HEADER = struct.Struct(">IBdIHHI")
+
+FLAG_TOMBSTONE = 0x01
+FLAG_ENCRYPTED = 0x02
+# Set with FLAG_ENCRYPTED when the stored bytes are encrypted as-is rather than as JSON
+FLAG_RAW_PAYLOAD = 0x04
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_COMPACTION_INTERVAL = 60
+DEFAULT_GARBAGE_RATIO = 0.5
+DEFAULT_MIN_COMPACTION_BYTES = 1024 * 1024
+
+
+@dataclass
+class RecordLocation:
+    """Position and metadata of the live record for a cache key."""
+
+    segment_id: int
+    offset: int
+    length: int
+    created_at: float
+    ttl: int
+    operation: str
+    flags: int
+
+    @property
+    def expires_at(self) -> float:
+        """Timestamp at which the entry expires."""
+        return self.created_at + self.ttl
+
+    def is_expired(self, current_time: Optional[float] = None) -> bool:
+        """Check whether the entry has expired."""
+        if current_time is None:
+            current_time = time.time()
+        return current_time > self.expires_at
+
+
+def encode_record(
+    key: str, value: bytes, created_at: float, ttl: int, operation: str, flags: int = 0
+) -> bytes:
+    """
+    Encode a single log record.
+
+    Args:
+        key: Cache key
+        value: Stored value bytes (empty for tombstones)
+        created_at: Creation timestamp
+        ttl: TTL in seconds
+        operation: AWS operation that generated the entry
+        flags: Record flags
+
+    Returns:
+        Encoded record bytes
+    """
+    key_bytes = key.encode("utf-8")
+    op_bytes = operation.encode("utf-8")[:0xFFFF]
+    header = RECORD_HEADER.pack(
+        0, flags, created_at, ttl, len(key_bytes), len(op_bytes), len(value)
+    )
+    body = header[4:] + key_bytes + op_bytes + value
+    return struct.pack(">I", zlib.crc32(body)) + body
+
+
+class SegmentLogBackend(CacheBackend):
+    """
+    Cache backend storing entries in append-only segment files.
+
+    Lookups are served from an in-memory index and memory-mapped segments, so
+    a read costs a dictionary lookup, a manifest ``stat`` to pick up writes from
+    other processes, and a slice of the mapped file. Statistics, key listing
+    and expiry cleanup never walk the cache directory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        profile: Optional[str] = None,
+        encryption_enabled: bool = False,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        compaction_interval: float = DEFAULT_COMPACTION_INTERVAL,
+        garbage_ratio: float = DEFAULT_GARBAGE_RATIO,
+        min_compaction_bytes: int = DEFAULT_MIN_COMPACTION_BYTES,
+        auto_compact: bool = True,
+    ):
+        """
+        Initialize the segment log backend.
+
+        Args:
+            cache_dir: Optional custom cache directory path.
+                      Defaults to ~/.awsideman/cache/
+            profile: AWS profile name for isolation
+            encryption_enabled: Whether to enable encryption for stored data
+            max_segment_bytes: Size at which the active segment is sealed
+            compaction_interval: Seconds between background compaction checks
+            garbage_ratio: Fraction of dead bytes that triggers compaction
+            min_compaction_bytes: Log size below which compaction is skipped
+            auto_compact: Whether to run the background compaction thread
+        """
+        self.cache_dir = cache_dir
+        self.profile = profile
+        self.backend_type = "segment"
+        self.encryption_enabled = encryption_enabled
+        self.max_segment_bytes = max_segment_bytes
+        self.compaction_interval = compaction_interval
+        self.garbage_ratio = garbage_ratio
+        self.min_compaction_bytes = min_compaction_bytes
+
+        # Initialize encryption system if enabled
+        self.encryption_provider = None
+        if self.encryption_enabled:
+            try:
+                key_manager = KeyManager()
+                self.encryption_provider = AESEncryption(key_manager)
+                logger.debug("Segment backend encryption initialized successfully")
+            except Exception as e:
+                logger.warning(
+                    f"Failed to initialize encryption, falling back to unencrypted storage: {e}"
+                )
+                self.encryption_enabled = False
+
+        self.segment_dir = (
+            CachePathManager(cache_dir, profile).get_cache_directory() / SEGMENT_DIR_NAME
+        )
+        self.manifest_file = self.segment_dir / MANIFEST_FILE_NAME
+        self.lock_file = self.segment_dir / LOCK_FILE_NAME
+
+        self._lock = threading.RLock()
+        self._index: Dict[str, RecordLocation] = {}
+        self._segments: List[int] = []
+        self._scanned: Dict[int, int] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._writer: Optional[Tuple[int, IO[bytes]]] = None
+        self._manifest_stamp: Optional[Tuple[int, int]] = None
+        self._live_bytes = 0
+
+        # Counters
+        self._compactions = 0
+        self._reclaimed_bytes = 0
+        self._corrupted_records = 0
+
+        try:
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+            with self._write_lock():
+                if not self.manifest_file.exists():
+                    self._create_segment(1)
+                    self._write_manifest([1])
+                self._refresh()
+        except Exception as e:
+            logger.error(f"Failed to initialize segment log: {e}")
+            raise CacheBackendError(
+                f"Failed to initialize segment backend: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+        if auto_compact:
+            self._compactor = threading.Thread(
+                target=self._compaction_loop, name="cache-segment-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    # Locking and manifest handling
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Hold the in-process lock and, where supported, the cross-process lock."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            with open(self.lock_file, "a") as lock_handle:
+                fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.segment_dir / f"seg-{segment_id:08d}.log"
+
+    def _read_manifest(self) -> List[int]:
+        with open(self.manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return [int(segment_id) for segment_id in manifest.get("segments", [])]
+
+    def _write_manifest(self, segments: List[int]) -> None:
+        """Atomically replace the manifest. Caller must hold the write lock."""
+        temp_file = self.manifest_file.with_name(MANIFEST_FILE_NAME + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "segments": segments}, f)
+        os.replace(temp_file, self.manifest_file)
+
+    def _create_segment(self, segment_id: int) -> None:
+        self._segment_path(segment_id).touch()
+
+    def _reset_state(self) -> None:
+        """Drop the in-memory view. Caller must hold the lock."""
+        self._close_files()
+        self._index.clear()
+        self._segments = []
+        self._scanned.clear()
+        self._live_bytes = 0
+        self._manifest_stamp = None
+
+    def _close_files(self) -> None:
+        if self._writer is not None:
+            try:
+                self._writer[1].close()
+            except OSError:
+                pass
+            self._writer = None
+        for mapped in self._maps.values():
+            try:
+                mapped.close()
+            except (BufferError, ValueError):
+                pass
+        self._maps.clear()
+
+    def _refresh(self) -> None:
+        """Bring the in-memory index up to date with the log. Caller must hold the lock."""
+        try:
+            stat = os.stat(self.manifest_file)
+        except FileNotFoundError:
+            self._reset_state()
+            return
+
+        stamp = (stat.st_ino, stat.st_mtime_ns)
+        if stamp != self._manifest_stamp:
+            # Segments were added, compacted or cleared - rebuild from the manifest
+            segments = self._read_manifest()
+            self._reset_state()
+            self._segments = segments
+            self._manifest_stamp = stamp
+            for segment_id in segments:
+                self._scan_segment(segment_id)
+            return
+
+        # Only the active segment grows between manifest changes
+        if self._segments:
+            self._scan_segment(self._segments[-1])
+
+    def _scan_segment(self, segment_id: int) -> None:
+        """Index records appended to a segment since the last scan."""
+        try:
+            size = os.path.getsize(self._segment_path(segment_id))
+        except FileNotFoundError:
+            return
+
+        offset = self._scanned.get(segment_id, 0)
+        if size <= offset:
+            return
+
+        mapped = self._map(segment_id, size)
+        position = offset
+        while position + RECORD_HEADER.size <= size:
+            _, flags, created_at, ttl, key_len, op_len, value_len = RECORD_HEADER.unpack_from(
+                mapped, position
+            )
+            length = RECORD_HEADER.size + key_len + op_len + value_len
+            if position + length > size:
+                # Partially written record - picked up on a later refresh
+                break
+
+            key_start = position + RECORD_HEADER.size
+            try:
+                key = mapped[key_start : key_start + key_len].decode("utf-8")
+                operation = mapped[key_start + key_len : key_start + key_len + op_len].decode(
+                    "utf-8"
+                )
+            except UnicodeDecodeError:
+                logger.warning(f"Corrupted record in segment {segment_id} at offset {position}")
+                self._corrupted_records += 1
+                break
+
+            if flags & FLAG_TOMBSTONE:
+                self._drop(key)
+            else:
+                self._place(
+                    key,
+                    RecordLocation(segment_id, position, length, created_at, ttl, operation, flags),
+                )
+            position += length
+
+        self._scanned[segment_id] = position
+
+    def _map(self, segment_id: int, min_size: int) -> mmap.mmap:
+        """Return a read-only mapping of a segment covering at least ``min_size`` bytes."""
+        mapped = self._maps.get(segment_id)
+        if mapped is not None and len(mapped) >= min_size:
+            return mapped
+
+        if mapped is not None:
+            mapped.close()
+        with open(self._segment_path(segment_id), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[segment_id] = mapped
+        return mapped
+
+    def _place(self, key: str, location: RecordLocation) -> None:
+        previous = self._index.get(key)
+        if previous is not None:
+            self._live_bytes -= previous.length
+        self._index[key] = location
+        self._live_bytes += location.length
+
+    def _drop(self, key: str) -> None:
+        previous = self._index.pop(key, None)
+        if previous is not None:
+            self._live_bytes -= previous.length
+
+    def _total_bytes(self) -> int:
+        return sum(self._scanned.get(segment_id, 0) for segment_id in self._segments)
+
+    # Writes
+
+    def _append(self, record: bytes) -> Tuple[int, int]:
+        """
+        Append a record to the active segment, sealing it first if it is full.
+
+        Caller must hold the write lock and have refreshed the index.
+
+        Returns:
+            Tuple of (segment id, offset) of the appended record
+        """
+        segment_id = self._segments[-1]
+        path = self._segment_path(segment_id)
+        size = path.stat().st_size if path.exists() else 0
+
+        # Seal when full, or when the tail holds bytes we could not index
+        if (size > 0 and size + len(record) > self.max_segment_bytes) or size != self._scanned.get(
+            segment_id, 0
+        ):
+            segment_id = max(self._segments) + 1
+            self._create_segment(segment_id)
+            self._segments.append(segment_id)
+            self._write_manifest(self._segments)
+            stat = os.stat(self.manifest_file)
+            self._manifest_stamp = (stat.st_ino, stat.st_mtime_ns)
+            self._scanned[segment_id] = 0
+            size = 0
+
+        if self._writer is None or self._writer[0] != segment_id:
+            if self._writer is not None:
+                self._writer[1].close()
+            self._writer = (segment_id, open(self._segment_path(segment_id), "ab"))
+
+        writer = self._writer[1]
+        writer.write(record)
+        writer.flush()
+        self._scanned[segment_id] = size + len(record)
+        return segment_id, size
+
+    def _encode_value(self, key: str, data: bytes) -> Tuple[bytes, int]:
+        """Encrypt the value if encryption is enabled. Returns (value, flags)."""
+        if self.encryption_enabled and self.encryption_provider:
+            try:
+                return (
+                    self.encryption_provider.encrypt_bytes(data),
+                    FLAG_ENCRYPTED | FLAG_RAW_PAYLOAD,
+                )
+            except Exception as e:
+                logger.error(f"Failed to encrypt data for key {key}: {e}")
+        return data, 0
+
+    def _decode_value(self, key: str, value: bytes, flags: int) -> Optional[bytes]:
+        """Decrypt the value if it was stored encrypted."""
+        if not flags & FLAG_ENCRYPTED:
+            return value
+
+        if not (self.encryption_enabled and self.encryption_provider):
+            logger.warning(f"Found encrypted data but encryption is disabled for key: {key}")
+            return value
+
+        try:
+            if flags & FLAG_RAW_PAYLOAD:
+                return self.encryption_provider.decrypt_bytes(value)
+
+            # Records written before raw payloads were encrypted hold JSON
+            import pickle
+
+            return pickle.dumps(self.encryption_provider.decrypt(value))
+        except Exception as e:
+            logger.error(f"Failed to decrypt data for key {key}: {e}")
+            return None
+
+    def _validate_key(self, key: str, operation: str) -> None:
+        if not input_validator.validate_cache_key(key):
+            logger.security_event(
+                "invalid_cache_key",
+                {
+                    "operation": operation,
+                    "key": input_validator.sanitize_log_data(key),
+                    "backend": self.backend_type,
+                },
+                "WARNING",
+            )
+            raise CacheBackendError(f"Invalid cache key format: {key}")
+
+    # CacheBackend interface
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve raw data from the segment log.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Raw bytes data if found and not expired, None otherwise
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        self._validate_key(key, "get")
+
+        try:
+            with self._lock:
+                self._refresh()
+                location = self._index.get(key)
+                if location is None or location.is_expired():
+                    return None
+
+                mapped = self._map(location.segment_id, location.offset + location.length)
+                record = mapped[location.offset : location.offset + location.length]
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading segment log for key {key}: {e}")
+            raise CacheBackendError(
+                f"Error reading segment log: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        # Verify and decode outside the lock
+        return self._decode_record(key, location, record)
+
+    def _decode_record(self, key: str, location: RecordLocation, record: bytes) -> Optional[bytes]:
+        """Verify a record's checksum and return its decoded value."""
+        (crc,) = struct.unpack_from(">I", record)
+        if zlib.crc32(record[4:]) != crc:
+            logger.warning(f"Checksum mismatch for cache key {key}, discarding record")
+            with self._lock:
+                self._corrupted_records += 1
+                if self._index.get(key) is location:
+                    self._drop(key)
+            return None
+
+        _, flags, _, _, key_len, op_len, _ = RECORD_HEADER.unpack_from(record)
+        value = record[RECORD_HEADER.size + key_len + op_len :]
+        logger.debug(f"Segment backend cache hit for key: {key}")
+        return self._decode_value(key, value, flags)
+
+    def set(
+        self, key: str, data: bytes, ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Append an entry to the segment log.
+
+        Args:
+            key: Cache key to store data under
+            data: Raw bytes data to store
+            ttl: Optional TTL in seconds. If None, uses default TTL of 3600.
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        self._validate_key(key, "set")
+        if ttl is not None and (not isinstance(ttl, int) or ttl <= 0):
+            raise CacheBackendError("TTL must be a positive integer")
+
+        effective_ttl = ttl or 3600
+        created_at = time.time()
+        value, flags = self._encode_value(key, data)
+        record = encode_record(key, value, created_at, effective_ttl, operation, flags)
+
+        try:
+            with self._write_lock():
+                self._refresh()
+                segment_id, offset = self._append(record)
+                self._place(
+                    key,
+                    RecordLocation(
+                        segment_id, offset, len(record), created_at, effective_ttl, operation, flags
+                    ),
+                )
+        except OSError as e:
+            logger.error(f"Error appending to segment log for key {key}: {e}")
+            raise CacheBackendError(
+                f"Error writing segment log: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        logger.debug(f"Segment backend cached data for key: {key} with TTL: {effective_ttl}s")
+        self._maybe_request_compaction()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Remove cache entries from the segment log.
+
+        Args:
+            key: Cache key to invalidate. If None, invalidates all cache entries.
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        try:
+            with self._write_lock():
+                self._refresh()
+
+                if key is None:
+                    old_segments = list(self._segments)
+                    new_segment = max(old_segments, default=0) + 1
+                    self._create_segment(new_segment)
+                    self._write_manifest([new_segment])
+                    self._reset_state()
+                    self._remove_segments(old_segments)
+                    self._refresh()
+                    logger.debug(f"Cleared {len(old_segments)} cache segments")
+                    return
+
+                if key not in self._index:
+                    return
+
+                location = self._index[key]
+                record = encode_record(key, b"", time.time(), 0, location.operation, FLAG_TOMBSTONE)
+                self._append(record)
+                self._drop(key)
+                logger.debug(f"Invalidated segment log entry for key: {key}")
+        except OSError as e:
+            logger.error(f"Error invalidating segment log: {e}")
+            raise CacheBackendError(
+                f"Error invalidating segment log: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        self._maybe_request_compaction()
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Retrieve raw data for several keys with a single index refresh.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to raw bytes for the keys that were found
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        for key in keys:
+            self._validate_key(key, "get")
+
+        found: List[Tuple[str, RecordLocation, bytes]] = []
+        try:
+            with self._lock:
+                self._refresh()
+                current_time = time.time()
+                for key in dict.fromkeys(keys):
+                    location = self._index.get(key)
+                    if location is None or location.is_expired(current_time):
+                        continue
+                    mapped = self._map(location.segment_id, location.offset + location.length)
+                    found.append(
+                        (key, location, mapped[location.offset : location.offset + location.length])
+                    )
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading segment log: {e}")
+            raise CacheBackendError(
+                f"Error reading segment log: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        results = {}
+        for key, location, record in found:
+            value = self._decode_record(key, location, record)
+            if value is not None:
+                results[key] = value
+        return results
+
+    def set_many(
+        self, items: Dict[str, bytes], ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Append several entries to the segment log under one write lock.
+
+        Args:
+            items: Dictionary of cache key to raw bytes data
+            ttl: Optional TTL in seconds. If None, uses default TTL of 3600.
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        if ttl is not None and (not isinstance(ttl, int) or ttl <= 0):
+            raise CacheBackendError("TTL must be a positive integer")
+
+        effective_ttl = ttl or 3600
+        created_at = time.time()
+        records = []
+        for key, data in items.items():
+            self._validate_key(key, "set")
+            value, flags = self._encode_value(key, data)
+            records.append(
+                (key, flags, encode_record(key, value, created_at, effective_ttl, operation, flags))
+            )
+
+        if not records:
+            return
+
+        try:
+            with self._write_lock():
+                self._refresh()
+                for key, flags, record in records:
+                    segment_id, offset = self._append(record)
+                    self._place(
+                        key,
+                        RecordLocation(
+                            segment_id,
+                            offset,
+                            len(record),
+                            created_at,
+                            effective_ttl,
+                            operation,
+                            flags,
+                        ),
+                    )
+        except OSError as e:
+            logger.error(f"Error appending batch to segment log: {e}")
+            raise CacheBackendError(
+                f"Error writing segment log: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        logger.debug(f"Segment backend cached {len(records)} entries with TTL: {effective_ttl}s")
+        self._maybe_request_compaction()
+
+    def delete_many(self, keys: List[str]) -> None:
+        """
+        Append tombstones for several keys under one write lock.
+
+        Args:
+            keys: Cache keys to remove
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        try:
+            with self._write_lock():
+                self._refresh()
+                now = time.time()
+                for key in dict.fromkeys(keys):
+                    location = self._index.get(key)
+                    if location is None:
+                        continue
+                    self._append(
+                        encode_record(key, b"", now, 0, location.operation, FLAG_TOMBSTONE)
+                    )
+                    self._drop(key)
+        except OSError as e:
+            logger.error(f"Error invalidating segment log: {e}")
+            raise CacheBackendError(
+                f"Error invalidating segment log: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        self._maybe_request_compaction()
+
+    def _remove_segments(self, segment_ids: List[int]) -> None:
+        for segment_id in segment_ids:
+            try:
+                self._segment_path(segment_id).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove cache segment {segment_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get segment backend statistics from the in-memory index.
+
+        Returns:
+            Dictionary containing backend statistics and metadata
+        """
+        with self._lock:
+            self._refresh()
+            current_time = time.time()
+            expired = sum(1 for loc in self._index.values() if loc.is_expired(current_time))
+            total_bytes = self._total_bytes()
+            stats = {
+                "backend_type": self.backend_type,
+                "total_entries": len(self._index),
+                "valid_entries": len(self._index) - expired,
+                "expired_entries": expired,
+                "corrupted_entries": self._corrupted_records,
+                "total_size_bytes": total_bytes,
+                "total_size_mb": round(total_bytes / (1024 * 1024), 2),
+                "cache_directory": str(self.segment_dir),
+                "segments": len(self._segments),
+                "live_bytes": self._live_bytes,
+                "garbage_bytes": max(0, total_bytes - self._live_bytes),
+                "compactions": self._compactions,
+                "reclaimed_bytes": self._reclaimed_bytes,
+            }
+
+        if self._corrupted_records:
+            stats["warning"] = f"{self._corrupted_records} corrupted records detected"
+        return stats
+
+    def health_check(self) -> Dict[str, Any]:
+        """
+        Check if the segment log is readable and writable.
+
+        Returns:
+            Dictionary with health status information
+        """
+        try:
+            with self._lock:
+                self._refresh()
+            if not os.access(self.segment_dir, os.W_OK):
+                return {
+                    "healthy": False,
+                    "backend_type": self.backend_type,
+                    "message": f"Cannot write to segment directory: {self.segment_dir}",
+                }
+            return {
+                "healthy": True,
+                "backend_type": self.backend_type,
+                "message": "Segment backend is healthy and accessible",
+            }
+        except Exception as e:
+            logger.error(f"Segment backend health check failed: {e}")
+            return {
+                "healthy": False,
+                "backend_type": self.backend_type,
+                "message": f"Unexpected error: {e}",
+                "error": str(e),
+            }
+
+    def list_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """
+        List the cache keys with a live, unexpired record.
+
+        Args:
+            prefix: Only return keys starting with this prefix
+
+        Returns:
+            List of cache keys
+        """
+        with self._lock:
+            self._refresh()
+            current_time = time.time()
+            return [
+                key
+                for key, loc in self._index.items()
+                if not loc.is_expired(current_time) and (not prefix or key.startswith(prefix))
+            ]
+
+    def get_recent_entries(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get recent cache entries with metadata.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of dictionaries containing entry metadata
+        """
+        from .file import FileBackend
+
+        with self._lock:
+            self._refresh()
+            newest = sorted(self._index.items(), key=lambda item: item[1].created_at, reverse=True)
+        current_time = time.time()
+
+        entries: List[Dict[str, Any]] = []
+        for key, location in newest[:limit]:
+            age_seconds = current_time - location.created_at
+            remaining_ttl = location.ttl - age_seconds
+
+            if age_seconds < 60:
+                age_display = f"{age_seconds:.0f}s ago"
+            elif age_seconds < 3600:
+                age_display = f"{age_seconds/60:.0f}m ago"
+            else:
+                age_display = f"{age_seconds/3600:.1f}h ago"
+
+            operation, resource_type = FileBackend._describe_key(key, location.operation)
+            entries.append(
+                {
+                    "key": key,
+                    "operation": operation,
+                    "resource": resource_type,
+                    "ttl": f"{remaining_ttl:.0f}s remaining" if remaining_ttl > 0 else "Expired",
+                    "age": age_display,
+                    "size": f"{location.length} bytes",
+                    "modified": location.created_at,
+                    "file_size": location.length,
+                    "is_expired": remaining_ttl <= 0,
+                }
+            )
+
+        return entries
+
+    def cleanup_expired_files(self) -> int:
+        """
+        Drop expired entries by compacting the log.
+
+        Returns:
+            Number of expired entries removed
+        """
+        with self._lock:
+            self._refresh()
+            current_time = time.time()
+            expired = sum(1 for loc in self._index.values() if loc.is_expired(current_time))
+
+        if expired:
+            self.compact()
+        return expired
+
+    # Compaction
+
+    def compact(self) -> int:
+        """
+        Rewrite live, unexpired records into a fresh segment and drop the old ones.
+
+        Returns:
+            Number of bytes reclaimed
+
+        Raises:
+            CacheBackendError: If compaction fails
+        """
+        try:
+            with self._write_lock():
+                self._refresh()
+                old_segments = list(self._segments)
+                before = self._total_bytes()
+                current_time = time.time()
+                order = {segment_id: position for position, segment_id in enumerate(old_segments)}
+                live = sorted(
+                    (
+                        (key, loc)
+                        for key, loc in self._index.items()
+                        if not loc.is_expired(current_time)
+                    ),
+                    key=lambda item: (order.get(item[1].segment_id, 0), item[1].offset),
+                )
+
+                compacted_id = max(old_segments, default=0) + 1
+                active_id = compacted_id + 1
+                new_index: Dict[str, RecordLocation] = {}
+                offset = 0
+                with open(self._segment_path(compacted_id), "wb") as f:
+                    for key, loc in live:
+                        mapped = self._map(loc.segment_id, loc.offset + loc.length)
+                        record = mapped[loc.offset : loc.offset + loc.length]
+                        if zlib.crc32(record[4:]) != struct.unpack_from(">I", record)[0]:
+                            self._corrupted_records += 1
+                            continue
+                        f.write(record)
+                        new_index[key] = RecordLocation(
+                            compacted_id,
+                            offset,
+                            loc.length,
+                            loc.created_at,
+                            loc.ttl,
+                            loc.operation,
+                            loc.flags,
+                        )
+                        offset += loc.length
+                self._create_segment(active_id)
+                self._write_manifest([compacted_id, active_id])
+
+                self._reset_state()
+                self._remove_segments(old_segments)
+                self._refresh()
+
+                reclaimed = max(0, before - offset)
+                self._compactions += 1
+                self._reclaimed_bytes += reclaimed
+        except OSError as e:
+            logger.error(f"Segment log compaction failed: {e}")
+            raise CacheBackendError(
+                f"Segment log compaction failed: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        logger.debug(
+            f"Compacted {len(old_segments)} segments into {len(new_index)} live records, "
+            f"reclaimed {reclaimed} bytes"
+        )
+        return reclaimed
+
+    def needs_compaction(self) -> bool:
+        """Check whether dead or expired records exceed the garbage ratio."""
+        with self._lock:
+            self._refresh()
+            total = self._total_bytes()
+            if total < self.min_compaction_bytes:
+                return False
+            current_time = time.time()
+            live = sum(
+                loc.length for loc in self._index.values() if not loc.is_expired(current_time)
+            )
+        return (total - live) / total >= self.garbage_ratio
+
+    def _maybe_request_compaction(self) -> None:
+        """Wake the compactor early when overwrites alone pass the garbage ratio."""
+        if self._compactor is None:
+            return
+        total = self._total_bytes()
+        if total >= self.min_compaction_bytes and (
+            (total - self._live_bytes) / total >= self.garbage_ratio
+        ):
+            self._wake_event.set()
+
+    def _compaction_loop(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.compaction_interval)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                if self.needs_compaction():
+                    self.compact()
+            except Exception as e:
+                logger.warning(f"Background segment compaction failed: {e}")
+
+    def close(self) -> None:
+        """Stop the compaction thread and release file handles and mappings."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._compactor is not None and self._compactor is not threading.current_thread():
+            self._compactor.join(timeout=5)
+        with self._lock:
+            self._close_files()
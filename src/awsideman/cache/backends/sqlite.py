@@ -0,0 +1,745 @@
+"""SQLite cache backend implementation.
+
+Entries live in a single SQLite database in the profile's cache directory.
+The database runs in WAL mode so readers never block the writer, and each
+thread uses its own connection with a busy timeout so several awsideman
+processes on one host can share the cache safely.
+
+The table is indexed on the key (primary key), ``expires_at``, ``operation``
+and ``created_at``, which turns the maintenance operations into indexed
+queries:
+
+- expiry cleanup is a single ``DELETE ... WHERE expires_at <= ?``; the
+  incremental sweep takes the oldest expired rows ``LIMIT ?`` at a time
+- listing keys by prefix (pattern invalidation) is a key range scan
+- recent entries are ``ORDER BY created_at DESC LIMIT ?``
+
+Dependency tags live in a ``cache_tags`` table keyed on ``(tag, key)``, so the
+keys affected by a change are found with one index lookup per tag. A trigger
+removes the tags of deleted entries.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...encryption.aes import AESEncryption
+from ...encryption.key_manager import KeyManager
+from ...utils.security import get_secure_logger, input_validator
+from ..utils import CachePathManager
+from .base import SWEEP_STATE_FILE_NAME, CacheBackend, CacheBackendError, SweepResult
+
+logger = get_secure_logger(__name__)
+
+DATABASE_FILE_NAME = "cache.sqlite3"
+SCHEMA_VERSION = 1
+
+# Seconds a connection waits for another process's write lock
+DEFAULT_BUSY_TIMEOUT = 30.0
+
+# Keys bound per statement in the multi-key operations; well below SQLite's limit
+MAX_BATCH_PARAMETERS = 500
+
+# Values of the encrypted column: the stored bytes were encrypted as JSON (older rows)
+# or as the raw payload
+ENCRYPTED_JSON = 1
+ENCRYPTED_RAW = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    ttl INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    operation TEXT NOT NULL DEFAULT 'unknown',
+    encrypted INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_operation ON cache_entries (operation);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_created_at ON cache_entries (created_at);
+CREATE TABLE IF NOT EXISTS cache_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_cache_tags_key ON cache_tags (key);
+CREATE TRIGGER IF NOT EXISTS trg_cache_entries_delete_tags AFTER DELETE ON cache_entries
+BEGIN
+    DELETE FROM cache_tags WHERE key = OLD.key;
+END;
+"""
+
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Return the smallest string greater than every string starting with ``prefix``.
+
+    Used to turn a prefix match into a ``key >= ? AND key < ?`` range that the
+    primary key index can serve.
+
+    Args:
+        prefix: Key prefix
+
+    Returns:
+        Exclusive upper bound, or None if the range is unbounded
+    """
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    SQLite-based cache backend implementation.
+
+    Stores cache entries as rows in a WAL-mode SQLite database. Every
+    statement runs in autocommit mode, so each write is its own short
+    transaction and concurrent processes only serialize on the write itself.
+    """
+
+    supports_tags = True
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        profile: Optional[str] = None,
+        encryption_enabled: bool = False,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+    ):
+        """
+        Initialize the SQLite backend.
+
+        Args:
+            cache_dir: Optional custom cache directory path.
+                      Defaults to ~/.awsideman/cache/
+            profile: AWS profile name for isolation
+            encryption_enabled: Whether to enable encryption for stored data
+            busy_timeout: Seconds to wait for a lock held by another connection
+        """
+        self.cache_dir = cache_dir
+        self.profile = profile
+        self.backend_type = "sqlite"
+        self.encryption_enabled = encryption_enabled
+        self.busy_timeout = busy_timeout
+
+        # Initialize encryption system if enabled
+        self.encryption_provider = None
+        if self.encryption_enabled:
+            try:
+                key_manager = KeyManager()
+                self.encryption_provider = AESEncryption(key_manager)
+                logger.debug("SQLite backend encryption initialized successfully")
+            except Exception as e:
+                logger.warning(
+                    f"Failed to initialize encryption, falling back to unencrypted storage: {e}"
+                )
+                self.encryption_enabled = False
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        try:
+            path_manager = CachePathManager(cache_dir, profile)
+            path_manager.ensure_cache_directory()
+            self.database_file = path_manager.get_cache_directory() / DATABASE_FILE_NAME
+            self._initialize_schema()
+        except Exception as e:
+            logger.error(f"Failed to initialize SQLite cache database: {e}")
+            raise CacheBackendError(
+                f"Failed to initialize sqlite backend: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+    # Connection handling
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening one if needed."""
+        connection = getattr(self._local, "connection", None)
+        # Connections must not be shared with a forked child process
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        connection = sqlite3.connect(
+            str(self.database_file),
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection
+
+    def _initialize_schema(self) -> None:
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def _execute(self, sql: str, parameters: Tuple = ()) -> sqlite3.Cursor:
+        try:
+            return self._connection().execute(sql, parameters)
+        except sqlite3.Error as e:
+            logger.error(f"SQLite cache query failed: {e}")
+            raise CacheBackendError(
+                f"SQLite cache query failed: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+    def close(self) -> None:
+        """Close every connection opened by this backend."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    # Encryption
+
+    def _encode_value(self, key: str, data: bytes) -> Tuple[bytes, int]:
+        """Encrypt the value if encryption is enabled. Returns (value, encrypted)."""
+        if self.encryption_enabled and self.encryption_provider:
+            try:
+                return self.encryption_provider.encrypt_bytes(data), ENCRYPTED_RAW
+            except Exception as e:
+                logger.error(f"Failed to encrypt data for key {key}: {e}")
+        return data, 0
+
+    def _decode_value(self, key: str, value: bytes, encrypted: int) -> Optional[bytes]:
+        """Decrypt the value if it was stored encrypted."""
+        if not encrypted:
+            return value
+
+        if not (self.encryption_enabled and self.encryption_provider):
+            logger.warning(f"Found encrypted data but encryption is disabled for key: {key}")
+            return value
+
+        try:
+            if encrypted == ENCRYPTED_RAW:
+                return self.encryption_provider.decrypt_bytes(value)
+
+            # Rows written before raw payloads were encrypted hold JSON
+            import pickle
+
+            return pickle.dumps(self.encryption_provider.decrypt(value))
+        except Exception as e:
+            logger.error(f"Failed to decrypt data for key {key}: {e}")
+            return None
+
+    def _validate_key(self, key: str, operation: str) -> None:
+        if not input_validator.validate_cache_key(key):
+            logger.security_event(
+                "invalid_cache_key",
+                {
+                    "operation": operation,
+                    "key": input_validator.sanitize_log_data(key),
+                    "backend": self.backend_type,
+                },
+                "WARNING",
+            )
+            raise CacheBackendError(f"Invalid cache key format: {key}")
+
+    # CacheBackend interface
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve raw data from the database.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Raw bytes data if found and not expired, None otherwise
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        self._validate_key(key, "get")
+
+        row = self._execute(
+            "SELECT data, encrypted FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+
+        logger.debug(f"SQLite backend cache hit for key: {key}")
+        return self._decode_value(key, bytes(row[0]), row[1])
+
+    def set(
+        self, key: str, data: bytes, ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Store raw data in the database.
+
+        Args:
+            key: Cache key to store data under
+            data: Raw bytes data to store
+            ttl: Optional TTL in seconds. If None, uses default TTL of 3600.
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        self._validate_key(key, "set")
+        if ttl is not None and (not isinstance(ttl, int) or ttl <= 0):
+            raise CacheBackendError("TTL must be a positive integer")
+
+        effective_ttl = ttl or 3600
+        created_at = time.time()
+        value, encrypted = self._encode_value(key, data)
+
+        self._execute(
+            "INSERT OR REPLACE INTO cache_entries "
+            "(key, data, created_at, ttl, expires_at, operation, encrypted, size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                sqlite3.Binary(value),
+                created_at,
+                effective_ttl,
+                created_at + effective_ttl,
+                operation,
+                encrypted,
+                len(value),
+            ),
+        )
+        logger.debug(f"SQLite backend cached data for key: {key} with TTL: {effective_ttl}s")
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Remove cache entries from the database.
+
+        Args:
+            key: Cache key to invalidate. If None, invalidates all cache entries.
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        if key is None:
+            cursor = self._execute("DELETE FROM cache_entries")
+            logger.debug(f"Cleared {cursor.rowcount} SQLite cache entries")
+            return
+
+        self._execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        logger.debug(f"Invalidated SQLite cache entry for key: {key}")
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """
+        Retrieve raw data for several keys with ``IN`` queries.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to raw bytes for the keys that were found
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        for key in unique_keys:
+            self._validate_key(key, "get")
+
+        results = {}
+        now = time.time()
+        for start in range(0, len(unique_keys), MAX_BATCH_PARAMETERS):
+            chunk = unique_keys[start : start + MAX_BATCH_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._execute(
+                f"SELECT key, data, encrypted FROM cache_entries "
+                f"WHERE key IN ({placeholders}) AND expires_at > ?",
+                (*chunk, now),
+            ).fetchall()
+            for key, data, encrypted in rows:
+                value = self._decode_value(key, bytes(data), encrypted)
+                if value is not None:
+                    results[key] = value
+        return results
+
+    def set_many(
+        self, items: Dict[str, bytes], ttl: Optional[int] = None, operation: str = "unknown"
+    ) -> None:
+        """
+        Store several entries in a single transaction.
+
+        Args:
+            items: Dictionary of cache key to raw bytes data
+            ttl: Optional TTL in seconds. If None, uses default TTL of 3600.
+            operation: AWS operation that generated this data
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        if ttl is not None and (not isinstance(ttl, int) or ttl <= 0):
+            raise CacheBackendError("TTL must be a positive integer")
+
+        effective_ttl = ttl or 3600
+        created_at = time.time()
+        rows = []
+        for key, data in items.items():
+            self._validate_key(key, "set")
+            value, encrypted = self._encode_value(key, data)
+            rows.append(
+                (
+                    key,
+                    sqlite3.Binary(value),
+                    created_at,
+                    effective_ttl,
+                    created_at + effective_ttl,
+                    operation,
+                    encrypted,
+                    len(value),
+                )
+            )
+
+        if not rows:
+            return
+
+        connection = self._connection()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, data, created_at, ttl, expires_at, operation, encrypted, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"SQLite cache batch write failed: {e}")
+            raise CacheBackendError(
+                f"SQLite cache batch write failed: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+        logger.debug(f"SQLite backend cached {len(rows)} entries with TTL: {effective_ttl}s")
+
+    def delete_many(self, keys: List[str]) -> None:
+        """
+        Remove several cache entries with ``IN`` deletes.
+
+        Args:
+            keys: Cache keys to remove
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), MAX_BATCH_PARAMETERS):
+            chunk = unique_keys[start : start + MAX_BATCH_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            self._execute(f"DELETE FROM cache_entries WHERE key IN ({placeholders})", tuple(chunk))
+
+    def tag(self, tags_by_key: Dict[str, List[str]]) -> None:
+        """
+        Replace the dependency tags of several entries in a single transaction.
+
+        Args:
+            tags_by_key: Dictionary of cache key to dependency tags
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        if not tags_by_key:
+            return
+
+        keys = list(tags_by_key)
+        rows = [(tag, key) for key, tags in tags_by_key.items() for tag in set(tags)]
+
+        connection = self._connection()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for start in range(0, len(keys), MAX_BATCH_PARAMETERS):
+                    chunk = keys[start : start + MAX_BATCH_PARAMETERS]
+                    placeholders = ", ".join("?" * len(chunk))
+                    connection.execute(
+                        f"DELETE FROM cache_tags WHERE key IN ({placeholders})", tuple(chunk)
+                    )
+                connection.executemany(
+                    "INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)", rows
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"SQLite cache tag write failed: {e}")
+            raise CacheBackendError(
+                f"SQLite cache tag write failed: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+    def keys_for_tags(self, tags: List[str]) -> List[str]:
+        """
+        List the unexpired keys tagged with any of the given tags.
+
+        Args:
+            tags: Dependency tags
+
+        Returns:
+            List of cache keys
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        unique_tags = list(dict.fromkeys(tags))
+        keys: Dict[str, None] = {}
+        now = time.time()
+        for start in range(0, len(unique_tags), MAX_BATCH_PARAMETERS):
+            chunk = unique_tags[start : start + MAX_BATCH_PARAMETERS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._execute(
+                f"SELECT DISTINCT t.key FROM cache_tags t "
+                f"JOIN cache_entries e ON e.key = t.key "
+                f"WHERE t.tag IN ({placeholders}) AND e.expires_at > ?",
+                (*chunk, now),
+            ).fetchall()
+            keys.update((row[0], None) for row in rows)
+        return list(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get SQLite backend statistics.
+
+        Returns:
+            Dictionary containing backend statistics and metadata
+        """
+        try:
+            total, expired, data_bytes = self._execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at <= ?), 0), COALESCE(SUM(size), 0) "
+                "FROM cache_entries",
+                (time.time(),),
+            ).fetchone()
+            by_operation = dict(
+                self._execute(
+                    "SELECT operation, COUNT(*) FROM cache_entries GROUP BY operation"
+                ).fetchall()
+            )
+            page_count = self._execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._execute("PRAGMA page_size").fetchone()[0]
+            database_bytes = page_count * page_size
+
+            return {
+                "backend_type": self.backend_type,
+                "total_entries": total,
+                "valid_entries": total - expired,
+                "expired_entries": expired,
+                "corrupted_entries": 0,
+                "data_size_bytes": data_bytes,
+                "total_size_bytes": database_bytes,
+                "total_size_mb": round(database_bytes / (1024 * 1024), 2),
+                "cache_directory": str(self.database_file.parent),
+                "database_file": str(self.database_file),
+                "entries_by_operation": by_operation,
+            }
+        except Exception as e:
+            logger.error(f"Error getting SQLite backend stats: {e}")
+            return {"backend_type": self.backend_type, "error": str(e)}
+
+    def health_check(self) -> Dict[str, Any]:
+        """
+        Check if the database is readable and writable.
+
+        Returns:
+            Dictionary with health status information
+        """
+        try:
+            result = self._execute("PRAGMA quick_check").fetchone()[0]
+            if result != "ok":
+                return {
+                    "healthy": False,
+                    "backend_type": self.backend_type,
+                    "message": f"SQLite integrity check failed: {result}",
+                }
+            if not os.access(self.database_file, os.W_OK):
+                return {
+                    "healthy": False,
+                    "backend_type": self.backend_type,
+                    "message": f"Cannot write to cache database: {self.database_file}",
+                }
+            return {
+                "healthy": True,
+                "backend_type": self.backend_type,
+                "message": "SQLite backend is healthy and accessible",
+            }
+        except Exception as e:
+            logger.error(f"SQLite backend health check failed: {e}")
+            return {
+                "healthy": False,
+                "backend_type": self.backend_type,
+                "message": f"Unexpected error: {e}",
+                "error": str(e),
+            }
+
+    def list_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """
+        List unexpired cache keys, optionally restricted to a prefix.
+
+        A prefix is matched as a range on the primary key index.
+
+        Args:
+            prefix: Only return keys starting with this prefix
+
+        Returns:
+            List of cache keys
+        """
+        now = time.time()
+        if not prefix:
+            rows = self._execute(
+                "SELECT key FROM cache_entries WHERE expires_at > ?", (now,)
+            ).fetchall()
+        else:
+            upper = prefix_upper_bound(prefix)
+            if upper is None:
+                rows = self._execute(
+                    "SELECT key FROM cache_entries WHERE key >= ? AND expires_at > ?",
+                    (prefix, now),
+                ).fetchall()
+            else:
+                rows = self._execute(
+                    "SELECT key FROM cache_entries WHERE key >= ? AND key < ? AND expires_at > ?",
+                    (prefix, upper, now),
+                ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_recent_entries(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get recent cache entries with metadata.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of dictionaries containing entry metadata
+        """
+        from .file import FileBackend
+
+        rows = self._execute(
+            "SELECT key, created_at, ttl, operation, size FROM cache_entries "
+            "ORDER BY created_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        current_time = time.time()
+
+        entries: List[Dict[str, Any]] = []
+        for key, created_at, ttl, operation, size in rows:
+            age_seconds = current_time - created_at
+            remaining_ttl = ttl - age_seconds
+
+            if age_seconds < 60:
+                age_display = f"{age_seconds:.0f}s ago"
+            elif age_seconds < 3600:
+                age_display = f"{age_seconds/60:.0f}m ago"
+            else:
+                age_display = f"{age_seconds/3600:.1f}h ago"
+
+            operation_name, resource_type = FileBackend._describe_key(key, operation)
+            entries.append(
+                {
+                    "key": key,
+                    "operation": operation_name,
+                    "resource": resource_type,
+                    "ttl": f"{remaining_ttl:.0f}s remaining" if remaining_ttl > 0 else "Expired",
+                    "age": age_display,
+                    "size": f"{size} bytes",
+                    "modified": created_at,
+                    "file_size": size,
+                    "is_expired": remaining_ttl <= 0,
+                }
+            )
+
+        return entries
+
+    def cleanup_expired_files(self) -> int:
+        """
+        Delete expired entries with a single indexed DELETE.
+
+        Returns:
+            Number of expired entries removed
+        """
+        cursor = self._execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        removed = cursor.rowcount
+        if removed:
+            logger.debug(f"Removed {removed} expired SQLite cache entries")
+        return removed
+
+    def sweep_expired(self, cursor: Optional[str] = None, limit: int = 500) -> SweepResult:
+        """
+        Delete the oldest expired rows, at most ``limit`` per call.
+
+        Rows are read from the ``expires_at`` index and deleted in the same
+        transaction. Deleted rows drop out of the next query, so the cursor
+        only signals that expired rows may remain.
+
+        Args:
+            cursor: Ignored; accepted for interface compatibility
+            limit: Maximum number of rows to remove
+
+        Returns:
+            SweepResult for this step
+
+        Raises:
+            CacheBackendError: If backend operation fails
+        """
+        connection = self._connection()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = connection.execute(
+                    "SELECT key, size FROM cache_entries WHERE expires_at <= ? "
+                    "ORDER BY expires_at LIMIT ?",
+                    (time.time(), limit),
+                ).fetchall()
+                for start in range(0, len(rows), MAX_BATCH_PARAMETERS):
+                    chunk = [key for key, _ in rows[start : start + MAX_BATCH_PARAMETERS]]
+                    placeholders = ", ".join("?" * len(chunk))
+                    connection.execute(
+                        f"DELETE FROM cache_entries WHERE key IN ({placeholders})", tuple(chunk)
+                    )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"SQLite cache expiry sweep failed: {e}")
+            raise CacheBackendError(
+                f"SQLite cache expiry sweep failed: {e}",
+                backend_type=self.backend_type,
+                original_error=e,
+            )
+
+        return SweepResult(
+            scanned=len(rows),
+            removed=len(rows),
+            bytes_freed=sum(size for _, size in rows),
+            cursor=rows[-1][0] if len(rows) == limit else None,
+        )
+
+    def sweep_state_file(self) -> Optional[Path]:
+        """Keep the sweeper state next to the database."""
+        return self.database_file.parent / SWEEP_STATE_FILE_NAME
@@ -0,0 +1,290 @@
+"""Write-behind queue for the remote tier of the hybrid backend.
+
+Writes are accepted into a bounded, key-coalescing queue and a background
+flusher thread sends them to the remote backend with set_many, which groups
+them into BatchWriteItem requests. Pending writes are flushed when the queue
+is closed, including at interpreter exit.
+
+When the queue is full, writers wait for the flusher to make room. If no room
+frees up within the enqueue timeout the write is rejected and the caller falls
+back to a synchronous remote write, so a stalled remote tier slows writers down
+instead of growing the queue without bound.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import CacheBackend, CacheBackendError
+
+logger = logging.getLogger(__name__)
+
+# Seconds the flusher waits for a full batch before flushing what it has
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+# Writes taken per flush (DynamoDB set_many sends them 25 per BatchWriteItem)
+DEFAULT_FLUSH_BATCH_SIZE = 100
+
+# Seconds a writer waits for room in a full queue before writing synchronously
+DEFAULT_ENQUEUE_TIMEOUT = 5.0
+
+
+@dataclass
+class PendingWrite:
+    """A write waiting to be sent to the remote backend."""
+
+    data: bytes
+    ttl: Optional[int]
+    operation: str
+
+
+class WriteBehindQueue:
+    """
+    Bounded queue of remote writes drained by a background flusher.
+
+    Only the latest write of a key is kept while it waits. Flushes are
+    serialized, so writes of the same key reach the remote backend in order.
+    """
+
+    def __init__(
+        self,
+        remote_backend: CacheBackend,
+        max_size: int,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        enqueue_timeout: float = DEFAULT_ENQUEUE_TIMEOUT,
+    ):
+        """
+        Initialize the queue and start the flusher thread.
+
+        Args:
+            remote_backend: Backend that receives the flushed writes
+            max_size: Maximum number of distinct keys waiting to be flushed
+            flush_interval: Seconds to wait for a full batch before flushing
+            batch_size: Maximum number of writes sent per flush
+            enqueue_timeout: Seconds a writer waits for room in a full queue
+        """
+        if max_size <= 0:
+            raise ValueError("Write-behind queue size must be positive")
+
+        self.remote_backend = remote_backend
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.enqueue_timeout = enqueue_timeout
+
+        self._pending: "OrderedDict[str, PendingWrite]" = OrderedDict()
+        self._in_flight: Dict[str, PendingWrite] = {}
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+
+        self._stats: Dict[str, Any] = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "flushed": 0,
+            "failed": 0,
+            "flushes": 0,
+            "backpressure_waits": 0,
+            "sync_fallbacks": 0,
+            "max_queue_depth": 0,
+        }
+        self._flush_seconds_total = 0.0
+        self._flush_seconds_last = 0.0
+        self._flush_seconds_max = 0.0
+
+        self._thread = threading.Thread(
+            target=self._run, name="cache-write-behind-flusher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, key: str, data: bytes, ttl: Optional[int], operation: str) -> bool:
+        """
+        Queue a write, waiting for room if the queue is full.
+
+        Args:
+            key: Cache key
+            data: Raw bytes data
+            ttl: Optional TTL in seconds
+            operation: AWS operation that generated this data
+
+        Returns:
+            True if the write was queued, False if the caller must write it
+            synchronously because the queue stayed full or is closed
+        """
+        write = PendingWrite(data, ttl, operation)
+        with self._condition:
+            if self._closed:
+                self._stats["sync_fallbacks"] += 1
+                return False
+
+            if key in self._pending:
+                self._pending[key] = write
+                self._stats["coalesced"] += 1
+                return True
+
+            if len(self._pending) >= self.max_size:
+                self._stats["backpressure_waits"] += 1
+                deadline = time.monotonic() + self.enqueue_timeout
+                while len(self._pending) >= self.max_size and not self._closed:
+                    self._condition.notify_all()
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if len(self._pending) >= self.max_size or self._closed:
+                    self._stats["sync_fallbacks"] += 1
+                    return False
+
+            self._pending[key] = write
+            self._stats["enqueued"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(self._pending))
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+            return True
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the data of a write that has not reached the remote backend yet.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Queued or in-flight data, or None if nothing is pending for the key
+        """
+        with self._condition:
+            write = self._pending.get(key) or self._in_flight.get(key)
+            return write.data if write is not None else None
+
+    def discard(self, keys: Optional[List[str]] = None) -> None:
+        """
+        Drop pending writes ahead of a remote delete.
+
+        Waits for an in-flight flush to finish so that it cannot write a
+        discarded key back after the caller deletes it.
+
+        Args:
+            keys: Keys to drop, or None to drop every pending write
+        """
+        with self._flush_lock:
+            with self._condition:
+                if keys is None:
+                    self._pending.clear()
+                else:
+                    for key in keys:
+                        self._pending.pop(key, None)
+                self._condition.notify_all()
+
+    def flush(self) -> int:
+        """
+        Send every pending write to the remote backend on the calling thread.
+
+        Returns:
+            Number of writes sent
+        """
+        sent = 0
+        while True:
+            flushed = self._flush_batch()
+            if not flushed:
+                return sent
+            sent += flushed
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Stop the flusher thread and flush the remaining writes.
+
+        Args:
+            timeout: Seconds to wait for the flusher thread to stop
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        remaining = self.flush()
+        if remaining:
+            logger.debug(f"Flushed {remaining} pending cache writes on close")
+        atexit.unregister(self.close)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return queue depth, throughput counters and flush latency.
+
+        Returns:
+            Dictionary of write-behind metrics
+        """
+        with self._condition:
+            flushes = self._stats["flushes"]
+            return {
+                **self._stats,
+                "queue_depth": len(self._pending),
+                "in_flight": len(self._in_flight),
+                "capacity": self.max_size,
+                "flush_latency_ms": {
+                    "last": round(self._flush_seconds_last * 1000, 3),
+                    "avg": round(self._flush_seconds_total / flushes * 1000, 3) if flushes else 0.0,
+                    "max": round(self._flush_seconds_max * 1000, 3),
+                },
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+            try:
+                self._flush_batch()
+            except Exception as e:
+                logger.warning(f"Write-behind flush failed: {e}")
+
+    def _flush_batch(self) -> int:
+        """Send up to one batch of pending writes; returns the number taken."""
+        with self._flush_lock:
+            with self._condition:
+                while self._pending and len(self._in_flight) < self.batch_size:
+                    key, write = self._pending.popitem(last=False)
+                    self._in_flight[key] = write
+                batch = dict(self._in_flight)
+                # Writers blocked on a full queue can proceed
+                self._condition.notify_all()
+            if not batch:
+                return 0
+
+            groups: Dict[Tuple[Optional[int], str], Dict[str, bytes]] = {}
+            for key, write in batch.items():
+                groups.setdefault((write.ttl, write.operation), {})[key] = write.data
+
+            flushed = failed = 0
+            start = time.perf_counter()
+            for (ttl, operation), items in groups.items():
+                try:
+                    self.remote_backend.set_many(items, ttl, operation)
+                    flushed += len(items)
+                except CacheBackendError as e:
+                    # The entries stay in the local tier; only the remote copy is lost
+                    failed += len(items)
+                    logger.warning(f"Failed to flush {len(items)} cache writes to remote: {e}")
+            elapsed = time.perf_counter() - start
+
+            with self._condition:
+                self._in_flight.clear()
+                self._stats["flushes"] += 1
+                self._stats["flushed"] += flushed
+                self._stats["failed"] += failed
+                self._flush_seconds_last = elapsed
+                self._flush_seconds_total += elapsed
+                self._flush_seconds_max = max(self._flush_seconds_max, elapsed)
+
+            logger.debug(f"Flushed {flushed} cache writes to remote in {elapsed * 1000:.1f} ms")
+            return len(batch)
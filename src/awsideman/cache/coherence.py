@@ -0,0 +1,211 @@
+"""Cross-process invalidation journal for the CacheManager memory tier.
+
+Every awsideman process keeps its own in-memory tier in front of the shared
+persistent backend. When one process invalidates entries, the others would
+keep serving their in-memory copies until the TTL ran out. This module lets
+processes that share a cache directory publish invalidations to an
+append-only JSON lines journal and pick up each other's invalidations before
+they serve from memory.
+
+Journal records are one JSON object per line, each carrying the token of the
+publishing process in ``"p"``:
+
+- ``{"p": token, "k": [key, ...]}`` invalidates individual keys.
+- ``{"p": token, "m": pattern}`` invalidates keys matching an fnmatch pattern.
+- ``{"p": token, "x": 1}`` clears the whole memory tier.
+
+The journal size is the generation counter: a reader compares one ``os.stat``
+against the inode and offset it last consumed, so the check costs a single
+system call when nothing changed. Appends and rotation run under an exclusive
+``flock`` on a sidecar lock file. Once the journal grows past its size limit,
+it is replaced with an empty file; readers that notice the new inode cannot
+know what they missed and clear their memory tier.
+"""
+
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..utils.security import get_secure_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = get_secure_logger(__name__)
+
+# Neither name ends in ".json" so the journal never shows up as a cache file.
+JOURNAL_FILE_NAME = "_invalidation_journal.jsonl"
+LOCK_FILE_NAME = "_invalidation_journal.lock"
+
+# Journal size in bytes past which it is rotated
+DEFAULT_MAX_JOURNAL_BYTES = 1024 * 1024
+
+# Record returned to readers that lost track of the journal
+CLEAR_RECORD: Dict[str, Any] = {"x": 1}
+
+
+class InvalidationJournal:
+    """
+    Append-only invalidation log shared by the processes using one cache directory.
+
+    Records published by this instance are skipped when polling, since the
+    publishing process has already applied them to its own memory tier.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_JOURNAL_BYTES):
+        """
+        Initialize the journal and start reading from its current end.
+
+        Args:
+            cache_dir: Cache directory shared by the cooperating processes
+            max_bytes: Journal size in bytes past which it is rotated
+        """
+        self.cache_dir = Path(cache_dir)
+        self.journal_file = self.cache_dir / JOURNAL_FILE_NAME
+        self.lock_file = self.cache_dir / LOCK_FILE_NAME
+        self.max_bytes = max_bytes
+        self.token = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+        self._thread_lock = threading.RLock()
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._stats = {"published": 0, "applied": 0, "resets": 0, "rotations": 0}
+
+        # Invalidations published before this process started are irrelevant,
+        # since its memory tier is empty
+        try:
+            stat = os.stat(self.journal_file)
+            self._inode, self._offset = stat.st_ino, stat.st_size
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the in-process lock and, where supported, the cross-process lock."""
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "a") as lock_handle:
+                fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+
+    def _publish(self, record: Dict[str, Any]) -> None:
+        """Append a record, rotating the journal first when it is full."""
+        record["p"] = self.token
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        try:
+            with self._file_lock():
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                try:
+                    if os.stat(self.journal_file).st_size >= self.max_bytes:
+                        self._rotate()
+                except FileNotFoundError:
+                    pass
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(line)
+                self._stats["published"] += 1
+        except OSError as e:
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def _rotate(self) -> None:
+        """Replace the journal with an empty file. Caller must hold the file lock."""
+        temp_file = self.journal_file.with_name(JOURNAL_FILE_NAME + ".tmp")
+        temp_file.touch()
+        os.replace(temp_file, self.journal_file)
+        self._stats["rotations"] += 1
+        logger.debug("Rotated cache invalidation journal")
+
+    def publish_keys(self, keys: List[str]) -> None:
+        """Publish the invalidation of individual keys."""
+        if keys:
+            self._publish({"k": list(keys)})
+
+    def publish_pattern(self, pattern: str) -> None:
+        """Publish the invalidation of every key matching an fnmatch pattern."""
+        self._publish({"m": pattern})
+
+    def publish_clear(self) -> None:
+        """Publish the invalidation of every key."""
+        self._publish(dict(CLEAR_RECORD))
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Return the records other processes published since the last poll.
+
+        When the journal was rotated or removed, a single clear record is
+        returned instead, because invalidations may have been missed.
+
+        Returns:
+            List of journal records, empty when nothing changed
+        """
+        try:
+            stat = os.stat(self.journal_file)
+            inode, size = stat.st_ino, stat.st_size
+        except FileNotFoundError:
+            inode, size = None, 0
+
+        if inode == self._inode and size == self._offset:
+            return []
+
+        with self._thread_lock:
+            if inode != self._inode or size < self._offset:
+                # Rotated, truncated or deleted: the gap cannot be replayed
+                missed = self._inode is not None or self._offset > 0
+                self._inode, self._offset = inode, 0
+                if missed:
+                    self._stats["resets"] += 1
+                    records = [dict(CLEAR_RECORD)]
+                    records.extend(self._read_new_records())
+                    return records
+            return self._read_new_records()
+
+    def _read_new_records(self) -> List[Dict[str, Any]]:
+        """Read complete records past the offset. Caller must hold the thread lock."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return []
+
+        # Only consume complete lines; a partial trailing line is picked up next time
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return []
+        self._offset += end + 1
+
+        records = []
+        for line in chunk[: end + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                logger.debug(f"Skipping malformed invalidation record: {e}")
+                continue
+            if isinstance(record, dict) and record.get("p") != self.token:
+                records.append(record)
+
+        self._stats["applied"] += len(records)
+        return records
+
+    def stats(self) -> Dict[str, Any]:
+        """Return publish and apply counters and the current journal position."""
+        with self._thread_lock:
+            return {
+                **self._stats,
+                "journal_file": str(self.journal_file),
+                "offset": self._offset,
+            }
@@ -7,9 +7,23 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ..utils.models import CacheConfig
+from .adaptive_ttl import DEFAULT_ADAPTIVE_TTL_MAX, DEFAULT_ADAPTIVE_TTL_MIN
+from .memory_tier import DEFAULT_MAX_ENTRIES, DEFAULT_MAX_SIZE_MB
 
 logger = logging.getLogger(__name__)
 
+# Default upper bound on how long stale entries may be served (24 hours)
+DEFAULT_HARD_TTL = 86400
+
+# Default size in bytes above which file cache entries are lz4-compressed
+DEFAULT_COMPRESSION_THRESHOLD = 4096
+
+# Default seconds between background expiry sweeps (0 disables the sweeper thread)
+DEFAULT_EXPIRY_SWEEP_INTERVAL = 0
+
+# Default bound of the hybrid write-behind queue (0 writes to DynamoDB synchronously)
+DEFAULT_WRITE_BEHIND_QUEUE_SIZE = 0
+
 
 @dataclass
 class ProfileCacheConfig:
@@ -24,7 +38,7 @@ class ProfileCacheConfig:
     profile_name: str
 
     # Backend configuration
-    backend_type: str = "file"  # "file", "dynamodb", "hybrid"
+    backend_type: str = "file"  # "file", "segment", "sqlite", "dynamodb", "hybrid"
 
     # DynamoDB configuration (only used if backend_type is "dynamodb" or "hybrid")
     dynamodb_table_name: Optional[str] = None
@@ -49,6 +63,31 @@ class ProfileCacheConfig:
     # Hybrid backend configuration
     hybrid_local_ttl: int = 300  # 5 minutes local cache for hybrid mode
 
+    # In-memory LRU tier bounds
+    memory_max_entries: int = DEFAULT_MAX_ENTRIES
+    memory_max_size_mb: int = DEFAULT_MAX_SIZE_MB
+
+    # Stale-while-revalidate: serve expired entries until hard_ttl while refreshing
+    stale_while_revalidate: bool = False
+    hard_ttl: int = DEFAULT_HARD_TTL
+
+    # lz4-compress file cache entries larger than this many bytes (0 disables)
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+
+    # Seconds between budgeted background expiry sweeps (0 disables)
+    expiry_sweep_interval: int = DEFAULT_EXPIRY_SWEEP_INTERVAL
+
+    # Queue hybrid remote writes for a background flusher, up to this many keys (0 disables)
+    write_behind_queue_size: int = DEFAULT_WRITE_BEHIND_QUEUE_SIZE
+
+    # Share invalidations with other processes using the same cache directory
+    coherence_journal: bool = True
+
+    # Learn per-operation TTLs from how often refreshed values change, within bounds
+    adaptive_ttl: bool = False
+    adaptive_ttl_min: int = DEFAULT_ADAPTIVE_TTL_MIN
+    adaptive_ttl_max: int = DEFAULT_ADAPTIVE_TTL_MAX
+
     def __post_init__(self):
         """Post-initialization validation and setup."""
         # Initialize operation_ttls if not provided
@@ -56,7 +95,7 @@ class ProfileCacheConfig:
             self.operation_ttls = {}
 
         # Validate backend type
-        valid_backends = ["file", "dynamodb", "hybrid"]
+        valid_backends = ["file", "segment", "sqlite", "dynamodb", "hybrid"]
         if self.backend_type not in valid_backends:
             logger.warning(
                 f"Invalid backend type '{self.backend_type}' for profile {self.profile_name}, defaulting to 'file'"
@@ -83,7 +122,7 @@ class ProfileCacheConfig:
                 )
 
         # Validate file configuration for file backends
-        if self.backend_type in ["file", "hybrid"]:
+        if self.backend_type in ["file", "segment", "sqlite", "hybrid"]:
             if not self.file_cache_dir:
                 # Use default file cache directory
                 self.file_cache_dir = str(Path.home() / ".awsideman" / "cache" / self.profile_name)
@@ -104,6 +143,17 @@ class ProfileCacheConfig:
             "max_size_mb": self.max_size_mb,
             "operation_ttls": self.operation_ttls.copy() if self.operation_ttls else {},
             "hybrid_local_ttl": self.hybrid_local_ttl,
+            "memory_max_entries": self.memory_max_entries,
+            "memory_max_size_mb": self.memory_max_size_mb,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "hard_ttl": self.hard_ttl,
+            "compression_threshold": self.compression_threshold,
+            "expiry_sweep_interval": self.expiry_sweep_interval,
+            "write_behind_queue_size": self.write_behind_queue_size,
+            "coherence_journal": self.coherence_journal,
+            "adaptive_ttl": self.adaptive_ttl,
+            "adaptive_ttl_min": self.adaptive_ttl_min,
+            "adaptive_ttl_max": self.adaptive_ttl_max,
         }
 
     @classmethod
@@ -129,7 +179,7 @@ class AdvancedCacheConfig(CacheConfig):
     """
 
     # Backend configuration
-    backend_type: str = "file"  # "file", "dynamodb", "hybrid"
+    backend_type: str = "file"  # "file", "segment", "sqlite", "dynamodb", "hybrid"
 
     # DynamoDB configuration
     dynamodb_table_name: str = "awsideman-cache"
@@ -146,6 +196,31 @@ class AdvancedCacheConfig(CacheConfig):
     # File backend specific configuration
     file_cache_dir: Optional[str] = None
 
+    # In-memory LRU tier bounds
+    memory_max_entries: int = DEFAULT_MAX_ENTRIES
+    memory_max_size_mb: int = DEFAULT_MAX_SIZE_MB
+
+    # Stale-while-revalidate: serve expired entries until hard_ttl while refreshing
+    stale_while_revalidate: bool = False
+    hard_ttl: int = DEFAULT_HARD_TTL
+
+    # lz4-compress file cache entries larger than this many bytes (0 disables)
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+
+    # Seconds between budgeted background expiry sweeps (0 disables)
+    expiry_sweep_interval: int = DEFAULT_EXPIRY_SWEEP_INTERVAL
+
+    # Queue hybrid remote writes for a background flusher, up to this many keys (0 disables)
+    write_behind_queue_size: int = DEFAULT_WRITE_BEHIND_QUEUE_SIZE
+
+    # Share invalidations with other processes using the same cache directory
+    coherence_journal: bool = True
+
+    # Learn per-operation TTLs from how often refreshed values change, within bounds
+    adaptive_ttl: bool = False
+    adaptive_ttl_min: int = DEFAULT_ADAPTIVE_TTL_MIN
+    adaptive_ttl_max: int = DEFAULT_ADAPTIVE_TTL_MAX
+
     # Profile information
     profile: Optional[str] = None
 
@@ -163,7 +238,7 @@ class AdvancedCacheConfig(CacheConfig):
             self.profile_configs = {}
 
         # Validate backend type (but don't auto-correct in __post_init__)
-        valid_backends = ["file", "dynamodb", "hybrid"]
+        valid_backends = ["file", "segment", "sqlite", "dynamodb", "hybrid"]
         if self.backend_type not in valid_backends:
             logger.warning(f"Invalid backend type '{self.backend_type}', will need correction")
 
@@ -207,6 +282,17 @@ class AdvancedCacheConfig(CacheConfig):
             max_size_mb=self.max_size_mb,
             operation_ttls=self.operation_ttls.copy() if self.operation_ttls else {},
             hybrid_local_ttl=self.hybrid_local_ttl,
+            memory_max_entries=self.memory_max_entries,
+            memory_max_size_mb=self.memory_max_size_mb,
+            stale_while_revalidate=self.stale_while_revalidate,
+            hard_ttl=self.hard_ttl,
+            compression_threshold=self.compression_threshold,
+            expiry_sweep_interval=self.expiry_sweep_interval,
+            write_behind_queue_size=self.write_behind_queue_size,
+            coherence_journal=self.coherence_journal,
+            adaptive_ttl=self.adaptive_ttl,
+            adaptive_ttl_min=self.adaptive_ttl_min,
+            adaptive_ttl_max=self.adaptive_ttl_max,
         )
 
     @classmethod
@@ -249,6 +335,17 @@ class AdvancedCacheConfig(CacheConfig):
                 "dynamodb_profile",
                 "hybrid_local_ttl",
                 "file_cache_dir",
+                "memory_max_entries",
+                "memory_max_size_mb",
+                "stale_while_revalidate",
+                "hard_ttl",
+                "compression_threshold",
+                "expiry_sweep_interval",
+                "write_behind_queue_size",
+                "coherence_journal",
+                "adaptive_ttl",
+                "adaptive_ttl_min",
+                "adaptive_ttl_max",
             ]:
                 if key in cache_section:
                     advanced_config_data[key] = cache_section[key]
@@ -323,6 +420,33 @@ class AdvancedCacheConfig(CacheConfig):
             "dynamodb_profile": os.getenv("AWSIDEMAN_CACHE_DYNAMODB_PROFILE"),
             "hybrid_local_ttl": cls._get_env_int("AWSIDEMAN_CACHE_HYBRID_LOCAL_TTL", 300),
             "file_cache_dir": os.getenv("AWSIDEMAN_CACHE_FILE_DIR"),
+            "memory_max_entries": cls._get_env_int(
+                "AWSIDEMAN_CACHE_MEMORY_MAX_ENTRIES", DEFAULT_MAX_ENTRIES
+            ),
+            "memory_max_size_mb": cls._get_env_int(
+                "AWSIDEMAN_CACHE_MEMORY_MAX_SIZE_MB", DEFAULT_MAX_SIZE_MB
+            ),
+            "stale_while_revalidate": cls._get_env_bool(
+                "AWSIDEMAN_CACHE_STALE_WHILE_REVALIDATE", False
+            ),
+            "hard_ttl": cls._get_env_int("AWSIDEMAN_CACHE_HARD_TTL", DEFAULT_HARD_TTL),
+            "compression_threshold": cls._get_env_int(
+                "AWSIDEMAN_CACHE_COMPRESSION_THRESHOLD", DEFAULT_COMPRESSION_THRESHOLD
+            ),
+            "expiry_sweep_interval": cls._get_env_int(
+                "AWSIDEMAN_CACHE_EXPIRY_SWEEP_INTERVAL", DEFAULT_EXPIRY_SWEEP_INTERVAL
+            ),
+            "write_behind_queue_size": cls._get_env_int(
+                "AWSIDEMAN_CACHE_WRITE_BEHIND_QUEUE_SIZE", DEFAULT_WRITE_BEHIND_QUEUE_SIZE
+            ),
+            "coherence_journal": cls._get_env_bool("AWSIDEMAN_CACHE_COHERENCE_JOURNAL", True),
+            "adaptive_ttl": cls._get_env_bool("AWSIDEMAN_CACHE_ADAPTIVE_TTL", False),
+            "adaptive_ttl_min": cls._get_env_int(
+                "AWSIDEMAN_CACHE_ADAPTIVE_TTL_MIN", DEFAULT_ADAPTIVE_TTL_MIN
+            ),
+            "adaptive_ttl_max": cls._get_env_int(
+                "AWSIDEMAN_CACHE_ADAPTIVE_TTL_MAX", DEFAULT_ADAPTIVE_TTL_MAX
+            ),
         }
 
         # Load profile-specific configurations from environment
@@ -352,18 +476,46 @@ class AdvancedCacheConfig(CacheConfig):
                         "enabled": "enabled",
                         "default_ttl": "default_ttl",
                         "max_size_mb": "max_size_mb",
+                        "memory_max_entries": "memory_max_entries",
+                        "memory_max_size_mb": "memory_max_size_mb",
+                        "stale_while_revalidate": "stale_while_revalidate",
+                        "hard_ttl": "hard_ttl",
+                        "compression_threshold": "compression_threshold",
+                        "expiry_sweep_interval": "expiry_sweep_interval",
+                        "write_behind_queue_size": "write_behind_queue_size",
+                        "coherence_journal": "coherence_journal",
+                        "adaptive_ttl": "adaptive_ttl",
+                        "adaptive_ttl_min": "adaptive_ttl_min",
+                        "adaptive_ttl_max": "adaptive_ttl_max",
                     }
 
                     if setting in setting_mapping and value is not None:
                         config_key = setting_mapping[setting]
-                        if setting in ["enabled", "encryption_enabled"]:
+                        if setting in [
+                            "enabled",
+                            "encryption_enabled",
+                            "stale_while_revalidate",
+                            "coherence_journal",
+                            "adaptive_ttl",
+                        ]:
                             profile_configs[profile_name][config_key] = value.lower() in (
                                 "true",
                                 "1",
                                 "yes",
                                 "on",
                             )
-                        elif setting in ["default_ttl", "max_size_mb"]:
+                        elif setting in [
+                            "default_ttl",
+                            "max_size_mb",
+                            "memory_max_entries",
+                            "memory_max_size_mb",
+                            "hard_ttl",
+                            "compression_threshold",
+                            "expiry_sweep_interval",
+                            "write_behind_queue_size",
+                            "adaptive_ttl_min",
+                            "adaptive_ttl_max",
+                        ]:
                             try:
                                 profile_configs[profile_name][config_key] = int(value)
                             except (ValueError, TypeError):
@@ -479,6 +631,59 @@ class AdvancedCacheConfig(CacheConfig):
                 if os.getenv("AWSIDEMAN_CACHE_FILE_DIR")
                 else config.file_cache_dir
             ),
+            "memory_max_entries": (
+                env_config.memory_max_entries
+                if os.getenv("AWSIDEMAN_CACHE_MEMORY_MAX_ENTRIES")
+                else config.memory_max_entries
+            ),
+            "memory_max_size_mb": (
+                env_config.memory_max_size_mb
+                if os.getenv("AWSIDEMAN_CACHE_MEMORY_MAX_SIZE_MB")
+                else config.memory_max_size_mb
+            ),
+            "stale_while_revalidate": (
+                env_config.stale_while_revalidate
+                if os.getenv("AWSIDEMAN_CACHE_STALE_WHILE_REVALIDATE")
+                else config.stale_while_revalidate
+            ),
+            "hard_ttl": (
+                env_config.hard_ttl if os.getenv("AWSIDEMAN_CACHE_HARD_TTL") else config.hard_ttl
+            ),
+            "compression_threshold": (
+                env_config.compression_threshold
+                if os.getenv("AWSIDEMAN_CACHE_COMPRESSION_THRESHOLD")
+                else config.compression_threshold
+            ),
+            "expiry_sweep_interval": (
+                env_config.expiry_sweep_interval
+                if os.getenv("AWSIDEMAN_CACHE_EXPIRY_SWEEP_INTERVAL")
+                else config.expiry_sweep_interval
+            ),
+            "write_behind_queue_size": (
+                env_config.write_behind_queue_size
+                if os.getenv("AWSIDEMAN_CACHE_WRITE_BEHIND_QUEUE_SIZE")
+                else config.write_behind_queue_size
+            ),
+            "coherence_journal": (
+                env_config.coherence_journal
+                if os.getenv("AWSIDEMAN_CACHE_COHERENCE_JOURNAL")
+                else config.coherence_journal
+            ),
+            "adaptive_ttl": (
+                env_config.adaptive_ttl
+                if os.getenv("AWSIDEMAN_CACHE_ADAPTIVE_TTL")
+                else config.adaptive_ttl
+            ),
+            "adaptive_ttl_min": (
+                env_config.adaptive_ttl_min
+                if os.getenv("AWSIDEMAN_CACHE_ADAPTIVE_TTL_MIN")
+                else config.adaptive_ttl_min
+            ),
+            "adaptive_ttl_max": (
+                env_config.adaptive_ttl_max
+                if os.getenv("AWSIDEMAN_CACHE_ADAPTIVE_TTL_MAX")
+                else config.adaptive_ttl_max
+            ),
         }
 
         # Merge operation TTLs
@@ -500,7 +705,7 @@ class AdvancedCacheConfig(CacheConfig):
         errors = {}
 
         # Validate backend type
-        valid_backends = ["file", "dynamodb", "hybrid"]
+        valid_backends = ["file", "segment", "sqlite", "dynamodb", "hybrid"]
         if self.backend_type not in valid_backends:
             errors["backend_type"] = (
                 f"Invalid backend type '{self.backend_type}'. Must be one of: {valid_backends}"
@@ -524,6 +729,37 @@ class AdvancedCacheConfig(CacheConfig):
         if self.max_size_mb <= 0:
             errors["max_size_mb"] = "Max size must be positive"
 
+        # Validate memory tier bounds
+        if self.memory_max_entries <= 0:
+            errors["memory_max_entries"] = "Memory tier max entries must be positive"
+
+        if self.memory_max_size_mb <= 0:
+            errors["memory_max_size_mb"] = "Memory tier max size must be positive"
+
+        # Validate stale-while-revalidate window
+        if self.hard_ttl <= 0:
+            errors["hard_ttl"] = "Hard TTL must be positive"
+        elif self.stale_while_revalidate and self.hard_ttl < self.default_ttl:
+            errors["hard_ttl"] = "Hard TTL must not be shorter than the default TTL"
+
+        # Validate compression threshold
+        if self.compression_threshold < 0:
+            errors["compression_threshold"] = "Compression threshold must not be negative"
+
+        # Validate expiry sweep interval
+        if self.expiry_sweep_interval < 0:
+            errors["expiry_sweep_interval"] = "Expiry sweep interval must not be negative"
+
+        # Validate write-behind queue size
+        if self.write_behind_queue_size < 0:
+            errors["write_behind_queue_size"] = "Write-behind queue size must not be negative"
+
+        # Validate adaptive TTL bounds
+        if self.adaptive_ttl_min <= 0:
+            errors["adaptive_ttl_min"] = "Adaptive TTL minimum must be positive"
+        elif self.adaptive_ttl_max < self.adaptive_ttl_min:
+            errors["adaptive_ttl_max"] = "Adaptive TTL maximum must not be below the minimum"
+
         # Validate DynamoDB configuration if using DynamoDB backend
         if self.backend_type in ["dynamodb", "hybrid"]:
             if not self.dynamodb_table_name:
@@ -565,6 +801,17 @@ class AdvancedCacheConfig(CacheConfig):
             "dynamodb_profile": self.dynamodb_profile,
             "hybrid_local_ttl": self.hybrid_local_ttl,
             "file_cache_dir": self.file_cache_dir,
+            "memory_max_entries": self.memory_max_entries,
+            "memory_max_size_mb": self.memory_max_size_mb,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "hard_ttl": self.hard_ttl,
+            "compression_threshold": self.compression_threshold,
+            "expiry_sweep_interval": self.expiry_sweep_interval,
+            "write_behind_queue_size": self.write_behind_queue_size,
+            "coherence_journal": self.coherence_journal,
+            "adaptive_ttl": self.adaptive_ttl,
+            "adaptive_ttl_min": self.adaptive_ttl_min,
+            "adaptive_ttl_max": self.adaptive_ttl_max,
         }
 
     def save_to_file(self, config_path: Optional[str] = None) -> None:
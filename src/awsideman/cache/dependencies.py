@@ -0,0 +1,244 @@
+"""Dependency tags for targeted cache invalidation.
+
+Cache entries are tagged at write time with the Identity Center resources they
+depend on - users, groups, permission sets and accounts. A reverse index from
+tag to keys lets the invalidation engine remove exactly the entries affected by
+a change instead of matching a glob pattern against every cached key.
+
+Tags have the form ``{resource_type}:{resource_id}``, e.g. ``user:9067-abcd`` or
+``permission_set:ps-1234``. Permission set ARNs are reduced to the permission
+set ID so that a tag built from an ARN matches one built from the bare ID.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+from .key_builder import CacheKeyBuilder
+
+# Request and response fields that identify a resource, normalized to lower
+# case without underscores so that boto3 (UserId) and Python (user_id) style
+# parameter names map to the same resource type.
+_IDENTIFIER_FIELDS = {
+    "userid": "user",
+    "groupid": "group",
+    "permissionsetarn": "permission_set",
+    "accountid": "account",
+    "targetid": "account",
+}
+
+# Glob patterns covering keys built by CacheKeyBuilder for a tagged resource.
+# Used for backends that cannot look keys up by tag. Each pattern is a key
+# prefix, so backends that index keys resolve it with a prefix-range scan.
+_FALLBACK_PATTERNS = {
+    "user": ["user:{resource_id}:*"],
+    "group": ["group:{resource_id}:*"],
+    "permission_set": ["permission_set:{resource_id}:*", "assignment:*"],
+    "account": ["account:{resource_id}:*", "assignment:{resource_id}:*"],
+}
+
+# Upper bound on the number of keys tracked in memory by a DependencyIndex.
+DEFAULT_MAX_INDEXED_KEYS = 100_000
+
+
+def resource_tag(resource_type: str, resource_id: str) -> str:
+    """
+    Build the dependency tag for a resource.
+
+    Args:
+        resource_type: Resource type (user, group, permission_set, account)
+        resource_id: Resource identifier; permission sets may be given as an ARN
+
+    Returns:
+        Dependency tag string
+    """
+    if resource_type == "permission_set" and "/" in resource_id:
+        resource_id = resource_id.split("/")[-1]
+    return f"{resource_type}:{resource_id}"
+
+
+def _normalize_field(name: str) -> str:
+    return name.replace("_", "").lower()
+
+
+def _principal_tags(principal_id: str, principal_type: Optional[str]) -> List[str]:
+    principal_type = (principal_type or "").lower()
+    if principal_type in ("user", "group"):
+        return [resource_tag(principal_type, principal_id)]
+    # Without a type the principal could be either; identity store IDs are unique
+    return [resource_tag("user", principal_id), resource_tag("group", principal_id)]
+
+
+def _tags_from_mapping(values: Mapping[str, Any], tags: Set[str]) -> None:
+    """Add tags for the identifier fields of a single request or response item."""
+    principal_id = None
+    principal_type = None
+
+    for name, value in values.items():
+        field = _normalize_field(str(name))
+
+        if field == "memberid" and isinstance(value, Mapping):
+            # Group memberships identify the member as {"UserId": ...}
+            _tags_from_mapping(value, tags)
+        elif field == "principalid" and isinstance(value, str):
+            principal_id = value
+        elif field == "principaltype" and isinstance(value, str):
+            principal_type = value
+        elif field in _IDENTIFIER_FIELDS and isinstance(value, str) and value:
+            tags.add(resource_tag(_IDENTIFIER_FIELDS[field], value))
+
+    if principal_id:
+        tags.update(_principal_tags(principal_id, principal_type))
+
+
+def dependency_tags(params: Optional[Mapping[str, Any]], response: Any = None) -> List[str]:
+    """
+    Derive dependency tags for a cached AWS call.
+
+    Tags come from the identifier parameters of the request and from the
+    identifiers of the items in the response, so that e.g. a cached group
+    membership list is tagged with every user it contains.
+
+    Args:
+        params: Request parameters (boto3 or snake_case names)
+        response: Optional API response dictionary
+
+    Returns:
+        Sorted list of dependency tags
+    """
+    tags: Set[str] = set()
+
+    if params:
+        _tags_from_mapping(params, tags)
+
+    if isinstance(response, Mapping):
+        for value in response.values():
+            if not isinstance(value, list):
+                continue
+            for item in value:
+                if isinstance(item, Mapping):
+                    _tags_from_mapping(item, tags)
+
+    return sorted(tags)
+
+
+def fallback_patterns(tags: Iterable[str]) -> List[str]:
+    """
+    Translate dependency tags to CacheKeyBuilder glob patterns.
+
+    Args:
+        tags: Dependency tags
+
+    Returns:
+        Glob patterns matching the keys that depend on the tagged resources
+    """
+    patterns: List[str] = []
+    for tag in tags:
+        resource_type, _, resource_id = tag.partition(":")
+        for template in _FALLBACK_PATTERNS.get(resource_type, []):
+            pattern = template.format(resource_id=CacheKeyBuilder.normalize_identifier(resource_id))
+            if pattern not in patterns:
+                patterns.append(pattern)
+    return patterns
+
+
+class DependencyIndex:
+    """
+    Thread-safe reverse index from dependency tag to cache keys.
+
+    The index is bounded; once it has dropped keys to stay within its limit it
+    reports itself as incomplete so that callers fall back to pattern matching.
+    """
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_INDEXED_KEYS):
+        """
+        Initialize the dependency index.
+
+        Args:
+            max_keys: Maximum number of keys to track
+        """
+        self.max_keys = max_keys
+        self._tags_by_key: Dict[str, Set[str]] = {}
+        self._keys_by_tag: Dict[str, Set[str]] = defaultdict(set)
+        self._complete = True
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str) -> None:
+        """Remove a key from the index. Caller must hold the lock."""
+        for tag in self._tags_by_key.pop(key, ()):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def add(self, key: str, tags: Iterable[str]) -> None:
+        """
+        Record the tags of a cache key, replacing any previous tags.
+
+        Args:
+            key: Cache key
+            tags: Dependency tags of the entry stored under the key
+        """
+        tag_set = set(tags)
+        with self._lock:
+            self._remove(key)
+            if not tag_set:
+                return
+
+            if len(self._tags_by_key) >= self.max_keys:
+                # Dicts keep insertion order, so this drops the oldest key
+                self._remove(next(iter(self._tags_by_key)))
+                self._complete = False
+
+            self._tags_by_key[key] = tag_set
+            for tag in tag_set:
+                self._keys_by_tag[tag].add(key)
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """
+        Forget the tags of removed cache keys.
+
+        Args:
+            keys: Cache keys that were removed
+        """
+        with self._lock:
+            for key in keys:
+                self._remove(key)
+
+    def keys_for(self, tags: Iterable[str]) -> Set[str]:
+        """
+        Return the keys tagged with any of the given tags.
+
+        Args:
+            tags: Dependency tags
+
+        Returns:
+            Set of matching cache keys
+        """
+        with self._lock:
+            keys: Set[str] = set()
+            for tag in tags:
+                keys.update(self._keys_by_tag.get(tag, ()))
+            return keys
+
+    def clear(self) -> None:
+        """Drop every key; the index is complete again afterwards."""
+        with self._lock:
+            self._tags_by_key.clear()
+            self._keys_by_tag.clear()
+            self._complete = True
+
+    @property
+    def complete(self) -> bool:
+        """Whether every tagged key written since the last clear is still indexed."""
+        return self._complete
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of indexed keys and tags."""
+        with self._lock:
+            return {
+                "indexed_keys": len(self._tags_by_key),
+                "indexed_tags": len(self._keys_by_tag),
+                "complete": self._complete,
+            }
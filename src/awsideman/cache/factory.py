@@ -5,6 +5,8 @@ from typing import Any, Dict
 
 from .backends.base import CacheBackend, CacheBackendError
 from .backends.file import FileBackend
+from .backends.segment import SegmentLogBackend
+from .backends.sqlite import SQLiteBackend
 from .config import AdvancedCacheConfig
 
 # Import DynamoDBBackend for type hints
@@ -43,6 +45,10 @@ class BackendFactory:
         try:
             if backend_type == "file":
                 return BackendFactory._create_file_backend(config)
+            elif backend_type == "segment":
+                return BackendFactory._create_segment_backend(config)
+            elif backend_type == "sqlite":
+                return BackendFactory._create_sqlite_backend(config)
             elif backend_type == "dynamodb":
                 return BackendFactory._create_dynamodb_backend(config)
             elif backend_type == "hybrid":
@@ -126,6 +132,7 @@ class BackendFactory:
                 cache_dir=config.file_cache_dir,
                 profile=config.profile,
                 encryption_enabled=config.encryption_enabled,
+                compression_threshold=config.compression_threshold,
             )
         except Exception as e:
             logger.error(f"Failed to create file backend: {e}")
@@ -133,6 +140,64 @@ class BackendFactory:
                 f"Failed to create file backend: {e}", backend_type="file", original_error=e
             )
 
+    @staticmethod
+    def _create_segment_backend(config: AdvancedCacheConfig) -> SegmentLogBackend:
+        """
+        Create a segment log backend instance.
+
+        Args:
+            config: Advanced cache configuration
+
+        Returns:
+            SegmentLogBackend instance
+
+        Raises:
+            CacheBackendError: If segment backend creation fails
+        """
+        try:
+            logger.debug(
+                f"Creating segment backend with cache_dir: {config.file_cache_dir}, profile: {config.profile}"
+            )
+            return SegmentLogBackend(
+                cache_dir=config.file_cache_dir,
+                profile=config.profile,
+                encryption_enabled=config.encryption_enabled,
+            )
+        except Exception as e:
+            logger.error(f"Failed to create segment backend: {e}")
+            raise CacheBackendError(
+                f"Failed to create segment backend: {e}", backend_type="segment", original_error=e
+            )
+
+    @staticmethod
+    def _create_sqlite_backend(config: AdvancedCacheConfig) -> SQLiteBackend:
+        """
+        Create a SQLite backend instance.
+
+        Args:
+            config: Advanced cache configuration
+
+        Returns:
+            SQLiteBackend instance
+
+        Raises:
+            CacheBackendError: If SQLite backend creation fails
+        """
+        try:
+            logger.debug(
+                f"Creating sqlite backend with cache_dir: {config.file_cache_dir}, profile: {config.profile}"
+            )
+            return SQLiteBackend(
+                cache_dir=config.file_cache_dir,
+                profile=config.profile,
+                encryption_enabled=config.encryption_enabled,
+            )
+        except Exception as e:
+            logger.error(f"Failed to create sqlite backend: {e}")
+            raise CacheBackendError(
+                f"Failed to create sqlite backend: {e}", backend_type="sqlite", original_error=e
+            )
+
     @staticmethod
     def _create_dynamodb_backend(config: AdvancedCacheConfig) -> "DynamoDBBackend":
         """
@@ -204,6 +269,7 @@ class BackendFactory:
                 local_backend=file_backend,
                 remote_backend=dynamodb_backend,
                 local_ttl=config.hybrid_local_ttl,
+                write_behind_queue_size=config.write_behind_queue_size,
             )
         except ImportError as e:
             logger.error(f"Hybrid backend requires additional dependencies: {e}")
@@ -229,7 +295,7 @@ class BackendFactory:
         Returns:
             List of available backend type names
         """
-        available = ["file"]  # File backend is always available
+        available = ["file", "segment", "sqlite"]  # Local backends are always available
 
         # Check if DynamoDB backend is available
         try:
@@ -274,6 +340,22 @@ class BackendFactory:
                 "requirements": [],
                 "features": ["Local storage", "Fast access", "No network dependency"],
             },
+            "segment": {
+                "name": "Segment Log Backend",
+                "description": "Local append-only segment log with background compaction",
+                "requirements": [],
+                "features": ["Local storage", "Few large files", "Memory-mapped reads"],
+            },
+            "sqlite": {
+                "name": "SQLite Backend",
+                "description": "Local SQLite database in WAL mode",
+                "requirements": [],
+                "features": [
+                    "Local storage",
+                    "Indexed expiry and key lookups",
+                    "Multi-process safe",
+                ],
+            },
             "dynamodb": {
                 "name": "DynamoDB Backend",
                 "description": "AWS DynamoDB-based cache storage",
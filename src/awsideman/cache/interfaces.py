@@ -3,7 +3,9 @@
 import threading
 from abc import ABC, ABCMeta, abstractmethod
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from .dependencies import fallback_patterns
 
 
 class ICacheManager(ABC):
@@ -28,7 +30,13 @@ class ICacheManager(ABC):
         pass
 
     @abstractmethod
-    def set(self, key: str, data: Any, ttl: Optional[timedelta] = None) -> None:
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[timedelta] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
         """
         Store data in cache with optional TTL.
 
@@ -36,6 +44,7 @@ class ICacheManager(ABC):
             key: Cache key to store data under
             data: Data to cache
             ttl: Optional TTL override. If None, uses default TTL.
+            tags: Optional dependency tags of the entry, used by invalidate_tags()
         """
         pass
 
@@ -82,6 +91,68 @@ class ICacheManager(ABC):
         """
         pass
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve cached data for several keys.
+
+        The default implementation calls get() once per key.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to cached data for the keys that were found
+        """
+        results = {}
+        for key in keys:
+            data = self.get(key)
+            if data is not None:
+                results[key] = data
+        return results
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[timedelta] = None) -> None:
+        """
+        Store several entries with the same TTL.
+
+        The default implementation calls set() once per key.
+
+        Args:
+            items: Dictionary of cache key to data
+            ttl: Optional TTL override. If None, uses default TTL.
+        """
+        for key, data in items.items():
+            self.set(key, data, ttl)
+
+    def delete_many(self, keys: List[str]) -> int:
+        """
+        Remove several exact cache keys.
+
+        The default implementation calls invalidate() once per key.
+
+        Args:
+            keys: Cache keys to remove
+
+        Returns:
+            Number of entries removed
+        """
+        return sum(self.invalidate(key) for key in keys)
+
+    def invalidate_tags(self, tags: List[str]) -> int:
+        """
+        Invalidate the entries that depend on any of the given resources.
+
+        The default implementation invalidates the CacheKeyBuilder glob
+        patterns equivalent to the tags. Implementations that index tags
+        override it to remove only the tagged entries.
+
+        Args:
+            tags: Dependency tags (see cache.dependencies)
+
+        Returns:
+            Number of invalidated entries
+        """
+        return sum(self.invalidate(pattern) for pattern in fallback_patterns(tags))
+
 
 class SingletonABCMeta(ABCMeta):
     """
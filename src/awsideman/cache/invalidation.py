@@ -3,11 +3,18 @@
 This module provides intelligent cache invalidation based on operation types
 and resource relationships. It ensures that when resources are modified,
 all related cached data is properly invalidated to maintain consistency.
+
+Entries that depend on a specific user, group, permission set or account are
+found through their dependency tags (see ``dependencies``) rather than by
+matching an identifier glob against every cached key; glob patterns remain
+for list caches that are invalidated as a whole.
 """
 
+import fnmatch
 import logging
 from typing import Dict, List, Optional
 
+from .dependencies import resource_tag
 from .interfaces import ICacheManager
 from .key_builder import CacheKeyBuilder
 
@@ -62,15 +69,38 @@ class CacheInvalidationEngine:
         patterns = self._get_invalidation_patterns(
             operation_type, resource_type, resource_id, additional_context or {}
         )
+        tags = self._get_dependency_tags(
+            operation_type, resource_type, resource_id, additional_context or {}
+        )
+
+        wildcard_patterns = [p for p in patterns if any(c in p for c in "*?[")]
+        exact_keys = [
+            p
+            for p in patterns
+            if p not in wildcard_patterns
+            and not any(fnmatch.fnmatch(p, wildcard) for wildcard in wildcard_patterns)
+        ]
 
         total_invalidated = 0
-        for pattern in patterns:
+        for pattern in wildcard_patterns:
             invalidated_count = self.cache_manager.invalidate(pattern)
             total_invalidated += invalidated_count
 
             if invalidated_count > 0:
                 logger.debug(f"Invalidated {invalidated_count} entries with pattern: {pattern}")
 
+        # Exact keys not already covered by a wildcard are removed in one batch
+        if exact_keys:
+            invalidated_count = self.cache_manager.delete_many(exact_keys)
+            total_invalidated += invalidated_count
+            logger.debug(f"Invalidated {invalidated_count} entries by exact key")
+
+        # Entries depending on the affected resources are removed via the tag index
+        if tags:
+            invalidated_count = self.cache_manager.invalidate_tags(tags)
+            total_invalidated += invalidated_count
+            logger.debug(f"Invalidated {invalidated_count} entries by dependency tag")
+
         logger.debug(f"Total invalidated entries: {total_invalidated}")
         return total_invalidated
 
@@ -198,7 +228,11 @@ class CacheInvalidationEngine:
         for pattern_template in base_patterns:
             # Replace placeholders in pattern templates
             pattern = pattern_template.format(
-                resource_type=resource_type, resource_id=resource_id or "*", **context
+                resource_type=resource_type,
+                resource_id=(
+                    CacheKeyBuilder.normalize_identifier(resource_id) if resource_id else "*"
+                ),
+                **context,
             )
             patterns.append(pattern)
 
@@ -243,12 +277,17 @@ class CacheInvalidationEngine:
         patterns = []
         context = context or {}
 
+        # Without an identifier there is no tag to target; drop the whole resource type
+        if not resource_id and operation_type in ["update", "delete"]:
+            if resource_type in ["user", "group", "permission_set", "account"]:
+                patterns.append(CacheKeyBuilder.build_prefix(resource_type) + "*")
+
         if resource_type == "user":
             # When user is modified, invalidate group membership caches
             if operation_type in ["update", "delete"]:
                 patterns.extend(
                     [
-                        "group:members:*",  # All group membership lists
+                        "group:*:*members*",  # All group membership lists
                         "assignment:*",  # All assignment caches (user might be assigned)
                     ]
                 )
@@ -262,20 +301,11 @@ class CacheInvalidationEngine:
                     ]
                 )
 
-            # Handle membership changes
+            # Handle membership changes; the affected users are handled by tag
             if operation_type in ["add_member", "remove_member"]:
-                patterns.extend(
-                    [
-                        f"group:members:{resource_id}",  # Specific group membership
-                        "group:members:*",  # All group memberships (for consistency)
-                    ]
-                )
-
-                # If we know which users were affected, invalidate their related caches
-                if "affected_user_ids" in context:
-                    user_ids = context["affected_user_ids"].split(",")
-                    for user_id in user_ids:
-                        patterns.append(f"user:*:{user_id}")
+                if resource_id:
+                    # Every entry of the group, including its membership list
+                    patterns.append(CacheKeyBuilder.build_prefix("group", resource_id) + "*")
 
         elif resource_type == "permission_set":
             # When permission set is modified, invalidate assignment caches
@@ -286,34 +316,64 @@ class CacheInvalidationEngine:
                     ]
                 )
 
-                # If we have account context, be more specific
-                if "account_id" in context and context["account_id"]:
-                    patterns.append(f"assignment:*:acc-{context['account_id']}*")
-
         elif resource_type == "assignment":
             # When assignments are modified, invalidate related resource caches
             if operation_type in ["create", "delete"]:
                 # Invalidate assignment list caches
-                patterns.extend(
-                    [
-                        "assignment:list:*",
-                        "assignment:account_assignments:*",
-                    ]
-                )
+                patterns.append("assignment:*")
 
-                # Invalidate specific account assignment caches
-                if "account_id" in context and context["account_id"]:
-                    patterns.append(f"assignment:*:acc-{context['account_id']}*")
+        return patterns
+
+    def _get_dependency_tags(
+        self,
+        operation_type: str,
+        resource_type: str,
+        resource_id: Optional[str] = None,
+        context: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Generate the dependency tags of the resources affected by an operation.
 
-                # Invalidate principal-specific caches
-                if "principal_id" in context and context["principal_id"]:
-                    principal_type = context.get("principal_type", "").lower()
-                    if principal_type == "user":
-                        patterns.append(f"user:*:{context['principal_id']}")
-                    elif principal_type == "group":
-                        patterns.append(f"group:*:{context['principal_id']}")
+        Every cached entry tagged with one of these resources is invalidated,
+        e.g. updating a user removes its description, its group memberships and
+        any membership list that contains it.
 
-        return patterns
+        Args:
+            operation_type: Type of operation
+            resource_type: Type of resource
+            resource_id: Specific resource identifier
+            context: Additional context
+
+        Returns:
+            List of dependency tags
+        """
+        tags: List[str] = []
+        context = context or {}
+
+        if resource_type in ("user", "group", "permission_set", "account"):
+            if resource_id and operation_type not in ("create",):
+                tags.append(resource_tag(resource_type, resource_id))
+
+            # Membership changes affect the cached data of each member
+            if resource_type == "group" and context.get("affected_user_ids"):
+                for user_id in context["affected_user_ids"].split(","):
+                    if user_id:
+                        tags.append(resource_tag("user", user_id))
+
+        elif resource_type == "assignment" and operation_type in ("create", "delete"):
+            if context.get("account_id"):
+                tags.append(resource_tag("account", context["account_id"]))
+            if context.get("permission_set_arn"):
+                tags.append(resource_tag("permission_set", context["permission_set_arn"]))
+            if context.get("principal_id"):
+                principal_type = context.get("principal_type", "").lower()
+                if principal_type in ("user", "group"):
+                    tags.append(resource_tag(principal_type, context["principal_id"]))
+                else:
+                    tags.append(resource_tag("user", context["principal_id"]))
+                    tags.append(resource_tag("group", context["principal_id"]))
+
+        return list(dict.fromkeys(tags))
 
     def _load_invalidation_rules(self) -> Dict[str, Dict[str, List[str]]]:
         """
@@ -325,72 +385,60 @@ class CacheInvalidationEngine:
         return {
             "user": {
                 "create": [
-                    "user:list:*",  # Invalidate all user lists
+                    "user:all:*",  # Invalidate all user lists
                 ],
                 "update": [
-                    "user:list:*",  # Invalidate all user lists
-                    "user:describe:{resource_id}",  # Invalidate specific user
-                    "user:*:{resource_id}",  # Invalidate all operations for this user
+                    "user:all:*",  # Invalidate all user lists
+                    "user:{resource_id}:*",  # Invalidate every entry of the user
                 ],
                 "delete": [
-                    "user:list:*",  # Invalidate all user lists
-                    "user:*:{resource_id}",  # Invalidate all operations for this user
+                    "user:all:*",  # Invalidate all user lists
                 ],
             },
             "group": {
                 "create": [
-                    "group:list:*",  # Invalidate all group lists
+                    "group:all:*",  # Invalidate all group lists
                 ],
                 "update": [
-                    "group:list:*",  # Invalidate all group lists
-                    "group:describe:{resource_id}",  # Invalidate specific group
-                    "group:*:{resource_id}",  # Invalidate all operations for this group
+                    "group:all:*",  # Invalidate all group lists
+                    "group:{resource_id}:*",  # Invalidate every entry of the group
                 ],
                 "delete": [
-                    "group:list:*",  # Invalidate all group lists
-                    "group:*:{resource_id}",  # Invalidate all operations for this group
+                    "group:all:*",  # Invalidate all group lists
                 ],
                 "add_member": [
-                    "group:members:{resource_id}",  # Invalidate group membership
-                    "group:describe:{resource_id}",  # Group details might include member count
+                    "group:{resource_id}:*",  # Group membership and details
                 ],
                 "remove_member": [
-                    "group:members:{resource_id}",  # Invalidate group membership
-                    "group:describe:{resource_id}",  # Group details might include member count
+                    "group:{resource_id}:*",  # Group membership and details
                 ],
             },
             "permission_set": {
                 "create": [
-                    "permission_set:list:*",  # Invalidate all permission set lists
+                    "permission_set:all:*",  # Invalidate all permission set lists
                 ],
                 "update": [
-                    "permission_set:list:*",  # Invalidate all permission set lists
-                    "permission_set:describe:{resource_id}",  # Invalidate specific permission set
-                    "permission_set:*:{resource_id}",  # Invalidate all operations for this permission set
+                    "permission_set:all:*",  # Invalidate all permission set lists
+                    "permission_set:{resource_id}:*",  # Invalidate every entry of the permission set
                 ],
                 "delete": [
-                    "permission_set:list:*",  # Invalidate all permission set lists
-                    "permission_set:*:{resource_id}",  # Invalidate all operations for this permission set
+                    "permission_set:all:*",  # Invalidate all permission set lists
                 ],
                 "update_policies": [
-                    "permission_set:policies:{resource_id}",  # Invalidate permission set policies
-                    "permission_set:describe:{resource_id}",  # Permission set details might include policy info
+                    "permission_set:{resource_id}:*",  # Policies and details of the permission set
                 ],
             },
             "assignment": {
                 "create": [
-                    "assignment:list:*",  # Invalidate all assignment lists
-                    "assignment:account_assignments:*",  # Invalidate account assignment lists
+                    "assignment:*",  # Invalidate all assignment lists
                 ],
                 "delete": [
-                    "assignment:list:*",  # Invalidate all assignment lists
-                    "assignment:account_assignments:*",  # Invalidate account assignment lists
+                    "assignment:*",  # Invalidate all assignment lists
                 ],
             },
             "account": {
                 "update": [
-                    "account:list:*",  # Invalidate all account lists
-                    "account:*:{resource_id}",  # Invalidate all operations for this account
+                    "account:all:*",  # Invalidate all account lists
                 ],
             },
         }
@@ -427,7 +475,7 @@ class CacheInvalidationEngine:
                         )
 
                         # Basic validation - pattern should contain valid characters
-                        if not test_pattern or ":" not in test_pattern:
+                        if not test_pattern or CacheKeyBuilder.SEPARATOR not in test_pattern:
                             errors.append(
                                 f"Invalid pattern '{pattern}' for {resource_type}.{operation_type}"
                             )
@@ -1,15 +1,126 @@
 """Cache key generation system for the unified cache manager.
 
-This module provides a hierarchical cache key generation system that follows
-the pattern: {resource_type}:{operation}:{identifier}:{sub_identifier}
+Every cache key follows one hierarchical scheme::
 
-The key builder ensures consistent key generation across all AWS operations
-and supports targeted cache invalidation through pattern matching.
+    {resource_type}:{identifier}:{operation}[:{sub_identifier}]:{param_hash}
+
+The identifier is the resource the entry belongs to (a user ID, a permission
+set ID, an account ID) or ``all`` for collections such as user lists, so all
+entries of one resource share the prefix ``{resource_type}:{identifier}:`` and
+can be invalidated with a single prefix-range scan on backends that support it.
+The remaining request parameters are reduced to a short hash.
+
+Keys for AWS API calls are built by ``build_operation_key`` from a table of
+cacheable operations, so the cached client layers produce the same key for the
+same call regardless of argument style (positional, boto3 or snake_case names).
 """
 
 import hashlib
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+# Identifier used for entries that do not belong to a single resource
+ALL_IDENTIFIER = "all"
+
+# Resource type of operations that are not in the operation table
+DEFAULT_RESOURCE_TYPE = "other"
+
+# Pagination parameters are only part of the key when a specific page is requested
+_PAGINATION_PARAMETERS = ("nexttoken", "maxresults")
+
+# Resource type, identifying parameter and positional parameter names of each
+# cacheable AWS operation. Parameter names are normalized (see
+# normalize_parameter_name). List operations have no identifying parameter:
+# their scope (identity store, instance) is part of the parameter hash.
+OPERATION_KEYS: Dict[str, Tuple[str, Optional[str], Tuple[str, ...]]] = {
+    # Identity Store
+    "list_users": ("user", None, ("identity_store_id",)),
+    "describe_user": ("user", "userid", ("identity_store_id", "user_id")),
+    "list_groups": ("group", None, ("identity_store_id",)),
+    "describe_group": ("group", "groupid", ("identity_store_id", "group_id")),
+    "list_group_memberships": ("group", "groupid", ("identity_store_id", "group_id")),
+    # Identity Center (SSO Admin)
+    "list_instances": ("instance", None, ()),
+    "describe_instance": ("instance", "instancearn", ("instance_arn",)),
+    "list_permission_sets": ("permission_set", None, ("instance_arn",)),
+    "describe_permission_set": (
+        "permission_set",
+        "permissionsetarn",
+        ("instance_arn", "permission_set_arn"),
+    ),
+    "list_managed_policies_in_permission_set": (
+        "permission_set",
+        "permissionsetarn",
+        ("instance_arn", "permission_set_arn"),
+    ),
+    "list_customer_managed_policy_references_in_permission_set": (
+        "permission_set",
+        "permissionsetarn",
+        ("instance_arn", "permission_set_arn"),
+    ),
+    "get_inline_policy_for_permission_set": (
+        "permission_set",
+        "permissionsetarn",
+        ("instance_arn", "permission_set_arn"),
+    ),
+    "get_permissions_boundary_for_permission_set": (
+        "permission_set",
+        "permissionsetarn",
+        ("instance_arn", "permission_set_arn"),
+    ),
+    "list_accounts_for_provisioned_permission_set": (
+        "permission_set",
+        "permissionsetarn",
+        ("instance_arn", "permission_set_arn"),
+    ),
+    "list_permission_sets_provisioned_to_account": (
+        "account",
+        "accountid",
+        ("instance_arn", "account_id"),
+    ),
+    "list_account_assignments": (
+        "assignment",
+        "accountid",
+        ("instance_arn", "account_id", "permission_set_arn"),
+    ),
+    # Organizations
+    "list_roots": ("organization", None, ()),
+    "list_organizational_units_for_parent": ("organization", "parentid", ("parent_id",)),
+    "list_accounts_for_parent": ("organization", "parentid", ("parent_id",)),
+    "list_parents": ("organization", "childid", ("child_id",)),
+    "list_accounts": ("account", None, ()),
+    "describe_account": ("account", "accountid", ("account_id",)),
+    "list_tags_for_resource": ("account", "resourceid", ("resource_id",)),
+    "list_policies_for_target": ("account", "targetid", ("target_id", "filter_type")),
+}
+
+
+def normalize_parameter_name(name: str) -> str:
+    """
+    Normalize a request parameter name.
+
+    boto3 (``PermissionSetArn``) and Python (``permission_set_arn``) spellings
+    of a parameter normalize to the same name.
+
+    Args:
+        name: Parameter name
+
+    Returns:
+        Lower case parameter name without underscores
+    """
+    return name.replace("_", "").lower()
+
+
+def _canonical(value: Any) -> str:
+    """Render a parameter value as a string that does not depend on dict order."""
+    if isinstance(value, Mapping):
+        items = sorted((str(k), _canonical(v)) for k, v in value.items())
+        return "{" + ",".join(f"{k!r}:{v}" for k, v in items) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_canonical(v) for v in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_canonical(v) for v in value)) + "}"
+    return repr(value)
 
 
 class CacheKeyValidationError(Exception):
@@ -36,6 +147,7 @@ class CacheKeyBuilder:
         "permission_set",
         "assignment",
         "account",
+        "organization",
         "instance",
         "application",
         "trusted_token_issuer",
@@ -63,6 +175,9 @@ class CacheKeyBuilder:
     # Pattern for validating key components (alphanumeric, hyphens, underscores)
     COMPONENT_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
+    # Pattern for AWS operation names used as the operation component
+    OPERATION_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
     @classmethod
     def build_key(
         cls,
@@ -78,9 +193,9 @@ class CacheKeyBuilder:
         Args:
             resource_type: Type of AWS resource (user, group, permission_set, etc.)
             operation: Operation being performed (list, describe, get, etc.)
-            identifier: Primary identifier (user ID, group ID, etc.)
+            identifier: Primary identifier (user ID, group ID, etc.), ``all`` if omitted
             sub_identifier: Secondary identifier for nested operations
-            **kwargs: Additional parameters to include in key generation
+            **kwargs: Additional parameters to include in the parameter hash
 
         Returns:
             Formatted cache key string
@@ -88,29 +203,123 @@ class CacheKeyBuilder:
         Raises:
             CacheKeyValidationError: If key components are invalid
         """
-        # Validate required components
         cls._validate_resource_type(resource_type)
         cls._validate_operation(operation)
 
-        # Build key components
-        components = [resource_type, operation]
+        return cls._assemble(resource_type, identifier, operation, sub_identifier, kwargs)
 
-        if identifier:
-            components.append(cls._sanitize_component(identifier))
+    @staticmethod
+    def client_scope(profile: Optional[str], region: Optional[str]) -> Dict[str, str]:
+        """
+        Get the scope hashed into the keys of the calls made by one client.
 
-        if sub_identifier:
-            components.append(cls._sanitize_component(sub_identifier))
+        Both cached client layers key their calls with this scope, so the same
+        call is cached once whichever layer makes it. Callers that store
+        something other than the API response add its format to the scope.
 
-        # Add additional parameters if provided
-        if kwargs:
-            param_hash = cls._hash_parameters(kwargs)
-            components.append(param_hash)
+        Args:
+            profile: AWS profile of the client, if any
+            region: AWS region of the client, if any
 
-        # Join components and validate final key
-        key = cls.SEPARATOR.join(components)
-        cls._validate_key_length(key)
+        Returns:
+            Scope for build_operation_key
+        """
+        return {"profile": profile or "default", "region": region or "us-east-1"}
 
-        return key
+    @classmethod
+    def build_operation_key(
+        cls,
+        operation: str,
+        args: Sequence[Any] = (),
+        kwargs: Optional[Mapping[str, Any]] = None,
+        scope: Optional[Mapping[str, Any]] = None,
+        default_resource_type: str = DEFAULT_RESOURCE_TYPE,
+    ) -> str:
+        """
+        Build the cache key of an AWS API call.
+
+        The resource type and identifier come from the operation table, so
+        ``describe_permission_set(instance_arn, permission_set_arn)`` and
+        ``describe_permission_set(InstanceArn=..., PermissionSetArn=...)`` share
+        one key. Pagination parameters are ignored unless a specific page is
+        requested with a NextToken.
+
+        Args:
+            operation: AWS operation name, e.g. ``describe_permission_set``
+            args: Positional arguments of the call
+            kwargs: Keyword arguments of the call
+            scope: Values that separate otherwise identical calls, such as the
+                profile and region, hashed together with the parameters
+            default_resource_type: Resource type of operations not in the table
+
+        Returns:
+            Formatted cache key string
+
+        Raises:
+            CacheKeyValidationError: If the operation name or key is invalid
+        """
+        if not cls.OPERATION_NAME_PATTERN.match(operation or ""):
+            raise CacheKeyValidationError(f"Invalid operation name '{operation}'")
+
+        resource_type, identifier_parameter, _ = OPERATION_KEYS.get(
+            operation, (default_resource_type, None, ())
+        )
+
+        identifier = None
+        params: Dict[str, Any] = {}
+        for name, value in cls.operation_parameters(operation, args, kwargs).items():
+            if name == identifier_parameter and isinstance(value, str) and value:
+                identifier = value
+            else:
+                params[name] = value
+
+        if not params.get("nexttoken"):
+            for name in _PAGINATION_PARAMETERS:
+                params.pop(name, None)
+
+        return cls._assemble(
+            cls._sanitize_component(resource_type) or DEFAULT_RESOURCE_TYPE,
+            identifier,
+            operation,
+            None,
+            params,
+            scope,
+        )
+
+    @classmethod
+    def operation_parameters(
+        cls,
+        operation: str,
+        args: Sequence[Any] = (),
+        kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Map the arguments of an AWS call to normalized parameter names.
+
+        Positional arguments are named from the operation table; keyword
+        arguments override them.
+
+        Args:
+            operation: AWS operation name
+            args: Positional arguments of the call
+            kwargs: Keyword arguments of the call
+
+        Returns:
+            Dictionary of normalized parameter names to values, without None values
+        """
+        positional_names = OPERATION_KEYS.get(operation, (None, None, ()))[2]
+
+        params: Dict[str, Any] = {}
+        for position, value in enumerate(args):
+            if position < len(positional_names):
+                name = normalize_parameter_name(positional_names[position])
+            else:
+                name = f"arg{position}"
+            params[name] = value
+        for name, value in (kwargs or {}).items():
+            params[normalize_parameter_name(str(name))] = value
+
+        return {name: value for name, value in params.items() if value is not None}
 
     @classmethod
     def build_user_key(cls, operation: str, user_id: Optional[str] = None, **kwargs: Any) -> str:
@@ -188,6 +397,9 @@ class CacheKeyBuilder:
         """
         Build cache key for assignment operations.
 
+        Assignments are grouped by account; the permission set is the
+        sub-identifier and the principal is part of the parameter hash.
+
         Args:
             operation: Assignment operation
             account_id: AWS account ID
@@ -198,19 +410,13 @@ class CacheKeyBuilder:
         Returns:
             Assignment cache key
         """
-        # Create composite identifier for assignments
-        identifiers = []
-        if account_id:
-            identifiers.append(f"acc-{account_id}")
+        sub_identifier = None
         if permission_set_arn:
-            ps_name = cls._extract_permission_set_name(permission_set_arn)
-            identifiers.append(f"ps-{ps_name}")
+            sub_identifier = cls._extract_permission_set_name(permission_set_arn)
         if principal_id:
-            identifiers.append(f"prin-{principal_id}")
-
-        identifier = "_".join(identifiers) if identifiers else None
+            kwargs["principal_id"] = principal_id
 
-        return cls.build_key("assignment", operation, identifier, **kwargs)
+        return cls.build_key("assignment", operation, account_id, sub_identifier, **kwargs)
 
     @classmethod
     def build_account_key(
@@ -229,6 +435,26 @@ class CacheKeyBuilder:
         """
         return cls.build_key("account", operation, account_id, **kwargs)
 
+    @classmethod
+    def build_prefix(cls, resource_type: str, identifier: Optional[str] = None) -> str:
+        """
+        Build the key prefix shared by all entries of a resource type or resource.
+
+        ``CacheManager.invalidate(prefix + "*")`` removes these entries with a
+        prefix-range scan on backends that index keys.
+
+        Args:
+            resource_type: Resource type
+            identifier: Resource identifier; ARNs are reduced to their last segment
+
+        Returns:
+            Key prefix ending with the separator
+        """
+        components = [resource_type]
+        if identifier:
+            components.append(cls.normalize_identifier(identifier))
+        return cls.SEPARATOR.join(components) + cls.SEPARATOR
+
     @classmethod
     def build_invalidation_pattern(
         cls,
@@ -239,6 +465,9 @@ class CacheKeyBuilder:
         """
         Build pattern for cache invalidation.
 
+        Trailing wildcards are collapsed so that the pattern keeps the longest
+        literal prefix, e.g. ``user:*`` rather than ``user:*:*:*``.
+
         Args:
             resource_type: Resource type to invalidate (optional, * for all)
             operation: Operation to invalidate (optional, * for all)
@@ -247,17 +476,15 @@ class CacheKeyBuilder:
         Returns:
             Invalidation pattern with wildcards
         """
-        components = []
-
-        components.append(resource_type or "*")
-        components.append(operation or "*")
-
-        if identifier:
-            components.append(cls._sanitize_component(identifier))
-        else:
-            components.append("*")
+        components = [
+            resource_type or "*",
+            cls.normalize_identifier(identifier) if identifier else "*",
+            operation or "*",
+        ]
+        while components and components[-1] == "*":
+            components.pop()
 
-        return cls.SEPARATOR.join(components)
+        return cls.SEPARATOR.join(components + ["*"])
 
     @classmethod
     def parse_key(cls, key: str) -> Dict[str, Optional[str]]:
@@ -271,16 +498,62 @@ class CacheKeyBuilder:
             Dictionary with key components
         """
         components = key.split(cls.SEPARATOR)
-
-        result = {
-            "resource_type": components[0] if len(components) > 0 else None,
-            "operation": components[1] if len(components) > 1 else None,
-            "identifier": components[2] if len(components) > 2 else None,
-            "sub_identifier": components[3] if len(components) > 3 else None,
-            "parameters_hash": components[4] if len(components) > 4 else None,
+        return {
+            "resource_type": components[0],
+            "identifier": components[1] if len(components) > 1 else None,
+            "operation": components[2] if len(components) > 2 else None,
+            "sub_identifier": components[3] if len(components) > 4 else None,
+            "parameters_hash": components[-1] if len(components) > 3 else None,
         }
 
-        return result
+    @classmethod
+    def normalize_identifier(cls, identifier: Any) -> str:
+        """
+        Convert a resource identifier to its key component.
+
+        ARNs are reduced to their last path segment (``ps-...``, ``ssoins-...``)
+        and the result is sanitized.
+
+        Args:
+            identifier: Resource identifier or ARN
+
+        Returns:
+            Key component for the identifier
+        """
+        value = str(identifier)
+        if value.startswith("arn:") and "/" in value:
+            value = value.rsplit("/", 1)[-1]
+
+        sanitized = cls._sanitize_component(value)
+        if not sanitized:
+            # Nothing printable survived sanitizing; keep the identifier distinct
+            sanitized = hashlib.blake2b(value.encode("utf-8"), digest_size=6).hexdigest()
+        return sanitized
+
+    @classmethod
+    def _assemble(
+        cls,
+        resource_type: str,
+        identifier: Optional[str],
+        operation: str,
+        sub_identifier: Optional[str],
+        params: Mapping[str, Any],
+        scope: Optional[Mapping[str, Any]] = None,
+    ) -> str:
+        """Join validated components into a key."""
+        components = [
+            resource_type,
+            cls.normalize_identifier(identifier) if identifier else ALL_IDENTIFIER,
+            operation,
+        ]
+        if sub_identifier:
+            components.append(cls.normalize_identifier(sub_identifier))
+        components.append(cls._hash_parameters(params, scope))
+
+        key = cls.SEPARATOR.join(components)
+        cls._validate_key_length(key)
+
+        return key
 
     @classmethod
     def _validate_resource_type(cls, resource_type: str) -> None:
@@ -351,22 +624,36 @@ class CacheKeyBuilder:
         return sanitized
 
     @classmethod
-    def _hash_parameters(cls, params: Dict[str, Any]) -> str:
+    def _hash_parameters(
+        cls, params: Mapping[str, Any], scope: Optional[Mapping[str, Any]] = None
+    ) -> str:
         """
         Create hash of parameters for key generation.
 
+        Parameter names are normalized and None values dropped, so equivalent
+        calls hash alike. Values are rendered with repr rather than serialized
+        as JSON, and BLAKE2b keeps the digest cheap for the short inputs.
+
         Args:
             params: Parameters to hash
+            scope: Optional scope values hashed separately from the parameters
 
         Returns:
             Short hash string
         """
-        # Sort parameters for consistent hashing
-        sorted_items = sorted(params.items())
-        param_string = str(sorted_items)
-
-        # Create short hash
-        return hashlib.sha256(param_string.encode()).hexdigest()[:12]
+        normalized = {
+            normalize_parameter_name(str(name)): value
+            for name, value in params.items()
+            if value is not None
+        }
+        parts = [f"{name}={_canonical(normalized[name])}" for name in sorted(normalized)]
+        if scope:
+            parts.extend(f"@{name}={scope[name]!r}" for name in sorted(scope))
+
+        digest = hashlib.blake2b(
+            "\x1f".join(parts).encode("utf-8", "backslashreplace"), digest_size=6
+        )
+        return digest.hexdigest()
 
     @classmethod
     def _extract_permission_set_name(cls, permission_set_arn: str) -> str:
@@ -5,17 +5,40 @@ import hashlib
 import json
 import logging
 import os
+import pickle
 import re
 import threading
 import time
+from contextlib import ExitStack
 from datetime import timedelta
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .adaptive_ttl import ADAPTIVE_TTL_STATE_FILE_NAME, AdaptiveTTLPolicy
+from .coherence import InvalidationJournal
+from .dependencies import DependencyIndex, fallback_patterns
 from .errors import CacheBackendError, CacheKeyError, CircuitBreaker, GracefulDegradationMixin
 from .interfaces import ICacheManager
+from .memory_tier import DEFAULT_MAX_ENTRIES, DEFAULT_MAX_SIZE_MB, StripedMemoryTier
+from .metrics import CacheMetrics
+from .sweeper import DEFAULT_BUDGET_MS, ExpirySweeper
 
 logger = logging.getLogger(__name__)
 
+# Number of per-key write locks; writers to different stripes never contend
+KEY_LOCK_STRIPES = 32
+
+# Run an in-memory expiry sweep once every this many sets
+CLEANUP_INTERVAL_SETS = 100
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of an fnmatch pattern before its first wildcard."""
+    for index, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:index]
+    return pattern
+
 
 class CacheValidationError(CacheBackendError):
     """Exception raised when cache validation fails."""
@@ -34,9 +57,11 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
     Features:
     - Profile-aware singleton pattern (one instance per profile)
     - Thread-safe operations
-    - In-memory storage with TTL support
+    - Bounded, size-aware LRU in-memory tier with TTL support
     - Pattern-based invalidation
-    - Statistics tracking
+    - Dependency-tag invalidation backed by a reverse index
+    - Invalidations shared with other processes through an on-disk journal
+    - Statistics tracking, with latency and payload histograms per operation and tier
     - Automatic cleanup of expired entries
     """
 
@@ -87,9 +112,21 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
         super().__init__()
 
         self._initialized = True
-        self._cache: Dict[str, Dict[str, Any]] = {}
         self._profile = profile
-        self._lock: threading.RLock = threading.RLock()  # Reentrant lock for nested operations
+        # Guards statistics and the rate limiter only. Backend I/O and deserialization
+        # never run under it; the memory tier and key stripes carry their own locks.
+        self._lock: threading.RLock = threading.RLock()
+        self._key_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+        # Bumped on every invalidation so in-flight reads never repopulate stale entries
+        self._generation = 0
+        # Bumped on every write of a key in the stripe, under the stripe lock, so a
+        # backend read that raced with a set() does not overwrite the newer value
+        self._key_versions = [0] * KEY_LOCK_STRIPES
+        # Order the backend writes of each stripe without holding its key lock, so
+        # reads and memory writes never wait for backend I/O
+        self._backend_write_locks = [threading.Lock() for _ in range(KEY_LOCK_STRIPES)]
+        # Stripe version of the latest write of each key still to reach the backend
+        self._pending_writes: Dict[str, int] = {}
 
         # Use the stored kwargs from first creation for consistency
         stored_kwargs = getattr(self, "_init_kwargs", {})
@@ -97,8 +134,21 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
 
         # Initialize persistent backend (file backend by default)
         self._backend: Optional[Any] = None
+        self._cache_config: Optional[Any] = None
         self._initialize_backend()
 
+        # In-memory tier, bounded by the configured entry count and size
+        self._cache: Any = self._create_memory_tier()
+
+        # Reverse index from dependency tag to the keys written by this process
+        self._dependencies = DependencyIndex()
+
+        # Invalidation journal shared with other processes using the same cache directory
+        self._journal: Optional[InvalidationJournal] = self._create_journal()
+
+        # TTLs learned per operation by the cached AWS clients, when enabled
+        self._adaptive_ttl: Optional[AdaptiveTTLPolicy] = self._create_adaptive_ttl()
+
         # Circuit breaker for cache operations
         # Use shorter recovery timeout for testing
         recovery_timeout = 0.1 if os.getenv("PYTEST_CURRENT_TEST") else 60
@@ -123,11 +173,22 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             "invalidations": 0,
             "clears": 0,
             "errors": 0,
+            "memory_hits": 0,
+            "backend_hits": 0,
         }
 
+        # Latency and payload size histograms per operation and tier. A backend
+        # with several tiers (hybrid) records its own local and remote timings.
+        self._metrics = CacheMetrics()
+        self._backend_tier = self._detect_backend_tier()
+
         # Configuration attributes for compatibility
         self._config = self._create_compatibility_config()
 
+        # Incremental expiry sweeper of the persistent backend, created on first use
+        self._sweeper: Optional[ExpirySweeper] = None
+        self._start_background_sweeper()
+
         logger.debug("CacheManager initialized as singleton")
 
     def _initialize_backend(self) -> None:
@@ -144,6 +205,8 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
                 config = get_default_cache_config()
                 logger.debug("Using default cache config")
 
+            self._cache_config = config
+
             # Create backend using BackendFactory with fallback
             self._backend = BackendFactory.create_backend_with_fallback(config)
             logger.info(
@@ -155,6 +218,225 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             logger.info("Falling back to in-memory only caching")
             self._backend = None
 
+    def _start_background_sweeper(self) -> None:
+        """Start the background expiry sweeper if an interval is configured."""
+        interval = getattr(self._cache_config, "expiry_sweep_interval", 0)
+        if not isinstance(interval, int) or interval <= 0 or self._backend is None:
+            return
+
+        try:
+            sweeper = self.get_expiry_sweeper()
+            if sweeper is not None:
+                sweeper.start(interval)
+                logger.debug(f"Started background expiry sweeper every {interval}s")
+        except Exception as e:
+            logger.warning(f"Failed to start background expiry sweeper: {e}")
+
+    def _create_memory_tier(self) -> StripedMemoryTier:
+        """Create the striped in-memory LRU tier from the loaded cache configuration."""
+        max_entries = getattr(self._cache_config, "memory_max_entries", DEFAULT_MAX_ENTRIES)
+        max_size_mb = getattr(self._cache_config, "memory_max_size_mb", DEFAULT_MAX_SIZE_MB)
+
+        try:
+            return StripedMemoryTier(
+                max_entries=int(max_entries), max_bytes=int(max_size_mb * 1024 * 1024)
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid memory tier configuration, using defaults: {e}")
+            return StripedMemoryTier()
+
+    def _detect_backend_tier(self) -> Optional[str]:
+        """
+        Attach the metrics registry to the backend and return its tier name.
+
+        Returns:
+            ``local`` or ``remote``, or None when the backend records its own tiers
+        """
+        if self._backend is None:
+            return None
+        if hasattr(self._backend, "attach_metrics"):
+            try:
+                self._backend.attach_metrics(self._metrics)
+                return None
+            except Exception as e:
+                logger.debug(f"Could not attach cache metrics to backend: {e}")
+        backend_type = getattr(self._backend, "backend_type", None)
+        return "remote" if backend_type == "dynamodb" else "local"
+
+    def _create_journal(self) -> Optional[InvalidationJournal]:
+        """Create the cross-process invalidation journal unless it is disabled."""
+        if self._cache_config is None or not getattr(
+            self._cache_config, "coherence_journal", False
+        ):
+            return None
+
+        try:
+            from .utils import CachePathManager
+
+            profile = getattr(self._cache_config, "profile", None) or self._profile
+            path_manager = CachePathManager(self._cache_config.file_cache_dir, profile)
+            return InvalidationJournal(path_manager.get_cache_directory())
+        except Exception as e:
+            logger.warning(f"Failed to initialize cache invalidation journal: {e}")
+            return None
+
+    def _create_adaptive_ttl(self) -> Optional[AdaptiveTTLPolicy]:
+        """Create the adaptive TTL policy if it is enabled in the configuration."""
+        if getattr(self._cache_config, "adaptive_ttl", False) is not True:
+            return None
+
+        try:
+            return AdaptiveTTLPolicy(
+                min_ttl=int(self._cache_config.adaptive_ttl_min),
+                max_ttl=int(self._cache_config.adaptive_ttl_max),
+                state_file=self._adaptive_ttl_state_file(),
+            )
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Invalid adaptive TTL configuration, using static TTLs: {e}")
+            return None
+
+    def _adaptive_ttl_state_file(self) -> Optional[Path]:
+        """Keep the learned TTLs in the profile's cache directory, if there is one."""
+        file_cache_dir = getattr(self._cache_config, "file_cache_dir", None)
+        if file_cache_dir is not None and not isinstance(file_cache_dir, str):
+            return None
+        try:
+            from .utils import CachePathManager
+
+            profile = getattr(self._cache_config, "profile", None) or self._profile
+            path_manager = CachePathManager(file_cache_dir, profile)
+            return path_manager.get_cache_directory() / ADAPTIVE_TTL_STATE_FILE_NAME
+        except Exception as e:
+            logger.warning(f"Failed to locate adaptive TTL state, keeping it in memory: {e}")
+            return None
+
+    def _sync_with_journal(self) -> None:
+        """Apply invalidations published by other processes to the memory tier."""
+        if self._journal is None:
+            return
+
+        records = self._journal.poll()
+        if not records:
+            return
+
+        with self._lock:
+            self._generation += 1
+
+        for record in records:
+            if record.get("x"):
+                self._cache.clear()
+                self._dependencies.clear()
+                continue
+            keys = list(record.get("k") or [])
+            pattern = record.get("m")
+            if isinstance(pattern, str):
+                keys.extend(key for key in self._cache.keys() if fnmatch.fnmatch(key, pattern))
+            for key in keys:
+                self._cache.pop(key, None)
+            self._dependencies.discard(keys)
+
+        logger.debug(f"Applied {len(records)} invalidations from other processes")
+
+    def _key_stripe(self, key: str) -> int:
+        """Return the index of the lock stripe of a cache key."""
+        return hash(key) % len(self._key_locks)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Return the write lock stripe for a cache key."""
+        return self._key_locks[self._key_stripe(key)]
+
+    def _evict_refilled(self, keys: Optional[List[str]] = None) -> None:
+        """
+        Drop entries that reads refilled while an invalidation was running.
+
+        A read that began after an invalidation bumped the generation but
+        before the backend delete returned can fill the memory tier with the
+        deleted value. Bumping the generation again once the backend is clean
+        stops such reads from filling, and evicting under the stripe locks
+        removes the fills that already happened.
+
+        Args:
+            keys: Invalidated keys, or None when the whole cache was cleared
+        """
+        with self._lock:
+            self._generation += 1
+
+        if keys is None:
+            with ExitStack() as stack:
+                for key_lock in self._key_locks:
+                    stack.enter_context(key_lock)
+                self._cache.clear()
+            return
+
+        for key in keys:
+            with self._key_lock(key):
+                self._cache.pop(key, None)
+
+    def _claim_backend_write(self, key: str, version: int) -> bool:
+        """
+        Check that a pending backend write is still the latest write of its key.
+
+        Must be called with the key's backend write lock held. A superseded
+        write is dropped; the newer write reaches the backend after it.
+
+        Args:
+            key: Cache key being written
+            version: Stripe version assigned to the write
+
+        Returns:
+            True if the write should be sent to the backend
+        """
+        with self._key_lock(key):
+            if self._pending_writes.get(key) != version:
+                return False
+            del self._pending_writes[key]
+            return True
+
+    def _fill_from_backend(
+        self,
+        key: str,
+        entry: Dict[str, Any],
+        size: Optional[int],
+        generation: int,
+        version: int,
+    ) -> None:
+        """
+        Store an entry read from the backend in the memory tier.
+
+        The fill is skipped when the memory tier already holds the key, or when
+        a write or invalidation happened since the backend read began, since
+        the entry read may then be older than the current value.
+
+        Args:
+            key: Cache key that was read
+            entry: Entry read from the backend
+            size: Serialized size of the entry
+            generation: Invalidation generation when the read began
+            version: Version of the key's stripe when the read began
+        """
+        stripe = self._key_stripe(key)
+        with self._key_locks[stripe]:
+            if (
+                generation == self._generation
+                and version == self._key_versions[stripe]
+                and key not in self._cache
+            ):
+                self._store_in_memory(key, entry, size)
+
+    def _record(self, *counters: str, amount: int = 1) -> None:
+        """Increment statistics counters."""
+        with self._lock:
+            for counter in counters:
+                self._stats[counter] += amount
+
+    def _store_in_memory(self, key: str, entry: Dict[str, Any], size: Optional[int]) -> None:
+        """Insert into the memory tier, serializing with writers when it is not thread-safe."""
+        if isinstance(self._cache, StripedMemoryTier):
+            self._cache.put(key, entry, size=size)
+        else:
+            with self._lock:
+                self._cache.put(key, entry, size=size)
+
     def _validate_key(self, key: str) -> None:
         """
         Validate cache key for security and safety.
@@ -222,6 +504,13 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
         current_time = time.time()
         key = f"{operation}:{identifier}"
 
+        with self._lock:
+            return self._consume_rate_limit(key, operation, identifier, current_time)
+
+    def _consume_rate_limit(
+        self, key: str, operation: str, identifier: str, current_time: float
+    ) -> bool:
+        """Consume one operation from the rate limit window. Caller holds the lock."""
         if key not in self._rate_limiter:
             self._rate_limiter[key] = {"count": 0, "window_start": current_time}
 
@@ -472,7 +761,7 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
 
             if expired_keys:
                 for key in expired_keys:
-                    del self._cache[key]
+                    self._cache.pop(key, None)
                 healing_results["actions_taken"].append(
                     f"Cleaned up {len(expired_keys)} expired entries"
                 )
@@ -641,6 +930,15 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
         """Get the compatibility configuration object."""
         return self._config
 
+    def get_cache_config(self) -> Optional[Any]:
+        """
+        Get the cache configuration the manager was initialized with.
+
+        Returns:
+            AdvancedCacheConfig instance, or None if it could not be loaded
+        """
+        return self._cache_config
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics for monitoring (compatibility method).
@@ -649,84 +947,95 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             Dictionary containing cache statistics compatible with existing commands
         """
         try:
-            with self._lock:
-                current_time = time.time()
-
-                # Count expired entries
-                expired_count = 0
-                total_entries = len(self._cache)
+            current_time = time.time()
 
-                # Also count entries from backend if available
-                backend_entries = 0
-                backend_size_bytes = 0
-                backend_size_mb = 0
-                if self._backend is not None and hasattr(self._backend, "get_stats"):
-                    try:
-                        backend_stats = self._backend.get_stats()
-                        # Map backend-specific fields to standard fields
-                        backend_entries = backend_stats.get(
-                            "total_entries", 0
-                        ) or backend_stats.get("item_count", 0)
-                        backend_size_bytes = backend_stats.get(
-                            "total_size_bytes", 0
-                        ) or backend_stats.get("table_size_bytes", 0)
-                        backend_size_mb = backend_stats.get("total_size_mb", 0) or (
-                            backend_size_bytes / (1024 * 1024) if backend_size_bytes > 0 else 0
-                        )
-                        total_entries += backend_entries
-                        logger.debug(
-                            f"Backend stats: {backend_stats}, backend_entries: {backend_entries}, total_entries: {total_entries}"
-                        )
-                    except Exception as e:
-                        logger.debug(f"Failed to get backend stats: {e}")
-                else:
+            # Count expired entries
+            expired_count = 0
+            total_entries = len(self._cache)
+
+            # Also count entries from backend if available
+            backend_entries = 0
+            backend_size_bytes = 0
+            backend_size_mb = 0
+            compression_stats = None
+            write_behind_stats = None
+            if self._backend is not None and hasattr(self._backend, "get_stats"):
+                try:
+                    backend_stats = self._backend.get_stats()
+                    # Map backend-specific fields to standard fields
+                    backend_entries = backend_stats.get("total_entries", 0) or backend_stats.get(
+                        "item_count", 0
+                    )
+                    backend_size_bytes = backend_stats.get(
+                        "total_size_bytes", 0
+                    ) or backend_stats.get("table_size_bytes", 0)
+                    backend_size_mb = backend_stats.get("total_size_mb", 0) or (
+                        backend_size_bytes / (1024 * 1024) if backend_size_bytes > 0 else 0
+                    )
+                    total_entries += backend_entries
+                    # File backends report compression directly, hybrid under its local tier
+                    local_stats = backend_stats.get("local_backend")
+                    compression_stats = backend_stats.get("compression") or (
+                        local_stats.get("compression") if isinstance(local_stats, dict) else None
+                    )
+                    write_behind_stats = backend_stats.get("write_behind")
                     logger.debug(
-                        f"No backend or get_stats method: backend={self._backend}, has_get_stats={hasattr(self._backend, 'get_stats') if self._backend else False}"
+                        f"Backend stats: {backend_stats}, backend_entries: {backend_entries}, total_entries: {total_entries}"
                     )
+                except Exception as e:
+                    logger.debug(f"Failed to get backend stats: {e}")
+            else:
+                logger.debug(
+                    f"No backend or get_stats method: backend={self._backend}, has_get_stats={hasattr(self._backend, 'get_stats') if self._backend else False}"
+                )
 
-                for entry in self._cache.values():
-                    if current_time > entry["expires_at"]:
-                        expired_count += 1
+            for entry in self._cache.values():
+                if current_time > entry["expires_at"]:
+                    expired_count += 1
 
-                # Calculate hit rate
-                total_requests = self._stats["hits"] + self._stats["misses"]
-                hit_rate = (
-                    (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0.0
-                )
+            # Calculate hit rate
+            total_requests = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0.0
 
-                # Get circuit breaker stats
-                circuit_stats = self._circuit_breaker.get_stats()
-
-                # Get degradation stats
-                degradation_stats = self.get_degradation_stats()
-
-                # Return compatibility format
-                return {
-                    "enabled": True,  # CacheManager is always enabled
-                    "backend_type": (
-                        getattr(self._backend, "backend_type", "memory")
-                        if self._backend
-                        else "memory"
-                    ),
-                    "total_entries": total_entries,
-                    "valid_entries": total_entries - expired_count,
-                    "expired_entries": expired_count,
-                    "corrupted_entries": 0,  # Not applicable for memory backend
-                    "hits": self._stats["hits"],
-                    "misses": self._stats["misses"],
-                    "sets": self._stats["sets"],
-                    "invalidations": self._stats["invalidations"],
-                    "clears": self._stats["clears"],
-                    "errors": self._stats["errors"],
-                    "hit_rate": hit_rate,
-                    "hit_rate_percentage": round(hit_rate, 2),
-                    "default_ttl": int(self._default_ttl.total_seconds()),
-                    "max_size_mb": 100,  # Default value
-                    "total_size_mb": backend_size_mb,  # From backend
-                    "total_size_bytes": backend_size_bytes,  # From backend
-                    "circuit_breaker": circuit_stats,
-                    "degradation": degradation_stats,
-                }
+            # Get circuit breaker stats
+            circuit_stats = self._circuit_breaker.get_stats()
+
+            # Get degradation stats
+            degradation_stats = self.get_degradation_stats()
+
+            # Return compatibility format
+            return {
+                "enabled": True,  # CacheManager is always enabled
+                "backend_type": (
+                    getattr(self._backend, "backend_type", "memory") if self._backend else "memory"
+                ),
+                "total_entries": total_entries,
+                "valid_entries": total_entries - expired_count,
+                "expired_entries": expired_count,
+                "corrupted_entries": 0,  # Not applicable for memory backend
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "sets": self._stats["sets"],
+                "invalidations": self._stats["invalidations"],
+                "clears": self._stats["clears"],
+                "errors": self._stats["errors"],
+                "hit_rate": hit_rate,
+                "hit_rate_percentage": round(hit_rate, 2),
+                "memory_hits": self._stats["memory_hits"],
+                "backend_hits": self._stats["backend_hits"],
+                "memory_tier": self._cache.get_stats(),
+                "default_ttl": int(self._default_ttl.total_seconds()),
+                "max_size_mb": 100,  # Default value
+                "total_size_mb": backend_size_mb,  # From backend
+                "total_size_bytes": backend_size_bytes,  # From backend
+                "compression": compression_stats,  # From file or hybrid local backend
+                "write_behind": write_behind_stats,  # From hybrid backend in write-behind mode
+                "adaptive_ttl": (
+                    self._adaptive_ttl.stats() if self._adaptive_ttl is not None else None
+                ),
+                "circuit_breaker": circuit_stats,
+                "degradation": degradation_stats,
+            }
         except Exception as e:
             logger.error(f"Failed to get cache statistics: {e}")
             return {
@@ -770,21 +1079,20 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             Dictionary containing cache size information
         """
         try:
-            with self._lock:
-                total_entries = len(self._cache)
-                max_entries = self._config.max_size
-                usage_percentage = (total_entries / max_entries * 100) if max_entries > 0 else 0
-
-                return {
-                    "total_entries": total_entries,
-                    "max_entries": max_entries,
-                    "usage_percentage": round(usage_percentage, 2),
-                    "is_over_limit": total_entries > max_entries,
-                    "bytes_over_limit": 0,  # Not applicable for memory backend
-                    "available_space_mb": 100,  # Default value
-                    "used_space_mb": 0,  # Not applicable for memory backend
-                    "free_space_mb": 100,  # Default value
-                }
+            total_entries = len(self._cache)
+            max_entries = self._config.max_size
+            usage_percentage = (total_entries / max_entries * 100) if max_entries > 0 else 0
+
+            return {
+                "total_entries": total_entries,
+                "max_entries": max_entries,
+                "usage_percentage": round(usage_percentage, 2),
+                "is_over_limit": total_entries > max_entries,
+                "bytes_over_limit": 0,  # Not applicable for memory backend
+                "available_space_mb": 100,  # Default value
+                "used_space_mb": 0,  # Not applicable for memory backend
+                "free_space_mb": 100,  # Default value
+            }
         except Exception as e:
             logger.error(f"Failed to get cache size info: {e}")
             return {
@@ -809,113 +1117,92 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             List of recent cache entries with metadata
         """
         try:
-            with self._lock:
-                current_time = time.time()
-                recent_entries = []
-
-                # First, get entries from in-memory cache
-                for key, entry in self._cache.items():
-                    if current_time <= entry["expires_at"]:  # Only show non-expired entries
-                        recent_entries.append(
-                            {
-                                "key": key,
-                                "created_at": entry["created_at"],
-                                "expires_at": entry["expires_at"],
-                                "ttl": str(
-                                    int(entry["ttl"])
-                                ),  # Convert to string to avoid rendering issues
-                                "size": str(
-                                    len(str(entry["data"])) if entry["data"] else "0"
-                                ),  # Convert to string
-                                "age": str(
-                                    int(time.time() - entry["created_at"])
-                                ),  # Convert to string
-                            }
-                        )
+            current_time = time.time()
+            recent_entries = []
 
-                # If we have a backend with get_recent_entries method, use it
-                if self._backend is not None and hasattr(self._backend, "get_recent_entries"):
-                    try:
-                        backend_entries = self._backend.get_recent_entries(limit)
-                        # Add backend entries to our list
-                        recent_entries.extend(backend_entries)
-                        # Sort all entries by creation time and limit
-                        recent_entries.sort(key=lambda x: x.get("created_at", 0), reverse=True)
-                        return recent_entries[:limit]
-                    except Exception as e:
-                        logger.debug(f"Failed to get recent entries from backend: {e}")
-                        # Continue with file-based backend fallback if available
+            # First, get entries from in-memory cache
+            for key, entry in self._cache.items():
+                if current_time <= entry["expires_at"]:  # Only show non-expired entries
+                    recent_entries.append(
+                        {
+                            "key": key,
+                            "created_at": entry["created_at"],
+                            "expires_at": entry["expires_at"],
+                            "ttl": str(
+                                int(entry["ttl"])
+                            ),  # Convert to string to avoid rendering issues
+                            "size": str(
+                                len(str(entry["data"])) if entry["data"] else "0"
+                            ),  # Convert to string
+                            "age": str(int(time.time() - entry["created_at"])),  # Convert to string
+                        }
+                    )
 
-                # Fallback: If we have a file-based backend, also get entries from there
-                elif self._backend is not None and hasattr(self._backend, "path_manager"):
-                    try:
-                        # Get actual cache files from the backend
-                        cache_files = self._backend.path_manager.list_cache_files()
-                        # Sort files by modification time (newest first) and process more than limit to account for parsing failures
-                        cache_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                        for cache_file in cache_files[
-                            : limit * 2
-                        ]:  # Process more files to account for parsing failures
-                            try:
-                                # Read the cache file directly to get metadata
-                                with open(cache_file, "rb") as f:
-                                    file_content = f.read()
-
-                                # Parse the metadata from the JSON header
-                                import json
-
-                                if len(file_content) >= 4:
-                                    try:
-                                        # Try to read metadata length
-                                        metadata_length = int.from_bytes(
-                                            file_content[:4], byteorder="big"
-                                        )
-                                        if metadata_length > 0 and metadata_length < len(
-                                            file_content
-                                        ):
-                                            # Parse metadata JSON
-                                            metadata_json = file_content[4 : 4 + metadata_length]
-                                            metadata = json.loads(metadata_json.decode("utf-8"))
-
-                                            # Extract key from metadata
-                                            key = metadata.get("key", cache_file.stem)
-                                            created_at = metadata.get("created_at", time.time())
-                                            ttl = metadata.get("ttl", 900)
-
-                                            # Calculate expiration and age
-                                            expires_at = created_at + ttl
-                                            age = int(time.time() - created_at)
-
-                                            # Add the actual cache entry
-                                            recent_entries.append(
-                                                {
-                                                    "key": key,
-                                                    "created_at": created_at,
-                                                    "expires_at": expires_at,
-                                                    "ttl": str(ttl),
-                                                    "size": str(
-                                                        metadata.get("data_size", "unknown")
-                                                    ),
-                                                    "age": str(age),
-                                                }
-                                            )
-                                    except (ValueError, json.JSONDecodeError, KeyError) as e:
-                                        logger.debug(
-                                            f"Failed to parse metadata for {cache_file}: {e}"
-                                        )
-                                        # Fall back to basic entry
+            # If we have a backend with get_recent_entries method, use it
+            if self._backend is not None and hasattr(self._backend, "get_recent_entries"):
+                try:
+                    backend_entries = self._backend.get_recent_entries(limit)
+                    # Add backend entries to our list
+                    recent_entries.extend(backend_entries)
+                    # Sort all entries by creation time and limit
+                    recent_entries.sort(key=lambda x: x.get("created_at", 0), reverse=True)
+                    return recent_entries[:limit]
+                except Exception as e:
+                    logger.debug(f"Failed to get recent entries from backend: {e}")
+                    # Continue with file-based backend fallback if available
+
+            # Fallback: If we have a file-based backend, also get entries from there
+            elif self._backend is not None and hasattr(self._backend, "path_manager"):
+                try:
+                    # Get actual cache files from the backend
+                    cache_files = self._backend.path_manager.list_cache_files()
+                    # Sort files by modification time (newest first) and process more than limit to account for parsing failures
+                    cache_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+                    for cache_file in cache_files[
+                        : limit * 2
+                    ]:  # Process more files to account for parsing failures
+                        try:
+                            # Read the cache file directly to get metadata
+                            with open(cache_file, "rb") as f:
+                                file_content = f.read()
+
+                            # Parse the metadata from the JSON header
+                            import json
+
+                            if len(file_content) >= 4:
+                                try:
+                                    # Try to read metadata length
+                                    metadata_length = int.from_bytes(
+                                        file_content[:4], byteorder="big"
+                                    )
+                                    if metadata_length > 0 and metadata_length < len(file_content):
+                                        # Parse metadata JSON
+                                        metadata_json = file_content[4 : 4 + metadata_length]
+                                        metadata = json.loads(metadata_json.decode("utf-8"))
+
+                                        # Extract key from metadata
+                                        key = metadata.get("key", cache_file.stem)
+                                        created_at = metadata.get("created_at", time.time())
+                                        ttl = metadata.get("ttl", 900)
+
+                                        # Calculate expiration and age
+                                        expires_at = created_at + ttl
+                                        age = int(time.time() - created_at)
+
+                                        # Add the actual cache entry
                                         recent_entries.append(
                                             {
-                                                "key": cache_file.stem,
-                                                "created_at": time.time(),
-                                                "expires_at": time.time() + 3600,
-                                                "ttl": "3600",
-                                                "size": "unknown",
-                                                "age": "0",
+                                                "key": key,
+                                                "created_at": created_at,
+                                                "expires_at": expires_at,
+                                                "ttl": str(ttl),
+                                                "size": str(metadata.get("data_size", "unknown")),
+                                                "age": str(age),
                                             }
                                         )
-                                else:
-                                    # Fall back to basic entry if file is too short
+                                except (ValueError, json.JSONDecodeError, KeyError) as e:
+                                    logger.debug(f"Failed to parse metadata for {cache_file}: {e}")
+                                    # Fall back to basic entry
                                     recent_entries.append(
                                         {
                                             "key": cache_file.stem,
@@ -926,9 +1213,8 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
                                             "age": "0",
                                         }
                                     )
-                            except Exception as e:
-                                logger.debug(f"Failed to read cache file {cache_file}: {e}")
-                                # Add a basic entry if we can't read the full data
+                            else:
+                                # Fall back to basic entry if file is too short
                                 recent_entries.append(
                                     {
                                         "key": cache_file.stem,
@@ -939,14 +1225,27 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
                                         "age": "0",
                                     }
                                 )
-                    except Exception as e:
-                        logger.debug(f"Failed to get backend cache files: {e}")
+                        except Exception as e:
+                            logger.debug(f"Failed to read cache file {cache_file}: {e}")
+                            # Add a basic entry if we can't read the full data
+                            recent_entries.append(
+                                {
+                                    "key": cache_file.stem,
+                                    "created_at": time.time(),
+                                    "expires_at": time.time() + 3600,
+                                    "ttl": "3600",
+                                    "size": "unknown",
+                                    "age": "0",
+                                }
+                            )
+                except Exception as e:
+                    logger.debug(f"Failed to get backend cache files: {e}")
 
-                # Sort by creation time (newest first)
-                recent_entries.sort(key=lambda x: x["created_at"], reverse=True)
+            # Sort by creation time (newest first)
+            recent_entries.sort(key=lambda x: x["created_at"], reverse=True)
 
-                # Limit results
-                return recent_entries[:limit]
+            # Limit results
+            return recent_entries[:limit]
 
         except Exception as e:
             logger.error(f"Failed to get recent entries: {e}")
@@ -994,41 +1293,61 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
 
     def _get_internal(self, key: str) -> Optional[Any]:
         """Internal get operation without circuit breaker."""
-        with self._lock:
-            # First check in-memory cache
-            if key in self._cache:
-                entry = self._cache[key]
-                current_time = time.time()
-
-                if current_time > entry["expires_at"]:
-                    # Entry has expired, remove it
-                    del self._cache[key]
-                    self._stats["misses"] += 1
-                    return None
-
-                self._stats["hits"] += 1
-                return entry["data"]
+        self._sync_with_journal()
 
-            # If not in memory, try backend
-            if self._backend:
-                try:
-                    import pickle
-
-                    backend_data = self._backend.get(key)
-                    if backend_data:
-                        # Parse the backend data
-                        entry_data = pickle.loads(backend_data)
-                        # Store in memory for faster access
-                        self._cache[key] = entry_data
-                        self._stats["hits"] += 1
-                        return entry_data["data"]
-                except Exception as e:
-                    logger.debug(f"Backend get failed for key {key}: {e}")
+        # First check in-memory cache
+        started = time.perf_counter()
+        entry = self._cache.get(key)
+        if entry is not None:
+            if time.time() > entry["expires_at"]:
+                # Entry has expired, remove it
+                self._cache.pop(key, None)
+                self._metrics.record_key(key, "memory", "miss", time.perf_counter() - started)
+                self._record("misses")
+                return None
 
-            self._stats["misses"] += 1
-            return None
+            self._metrics.record_key(key, "memory", "hit", time.perf_counter() - started)
+            self._record("hits", "memory_hits")
+            return entry["data"]
+        self._metrics.record_key(key, "memory", "miss", time.perf_counter() - started)
 
-    def set(self, key: str, data: Any, ttl: Optional[timedelta] = None) -> None:
+        # If not in memory, try backend. No lock is held here, so concurrent
+        # misses on different keys overlap their I/O and deserialization.
+        if self._backend:
+            generation = self._generation
+            version = self._key_versions[self._key_stripe(key)]
+            try:
+                started = time.perf_counter()
+                backend_data = self._backend.get(key)
+                if self._backend_tier is not None:
+                    self._metrics.record_key(
+                        key,
+                        self._backend_tier,
+                        "hit" if backend_data else "miss",
+                        time.perf_counter() - started,
+                        size=len(backend_data) if backend_data else None,
+                    )
+                if backend_data:
+                    # Parse the backend data
+                    entry_data = pickle.loads(backend_data)
+                    # Store in memory for faster access, unless a write or an
+                    # invalidation raced with the read and the value may be stale
+                    self._fill_from_backend(key, entry_data, len(backend_data), generation, version)
+                    self._record("hits", "backend_hits")
+                    return entry_data["data"]
+            except Exception as e:
+                logger.debug(f"Backend get failed for key {key}: {e}")
+
+        self._record("misses")
+        return None
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[timedelta] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
         """
         Store data in cache with optional TTL.
 
@@ -1036,6 +1355,7 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             key: Cache key to store data under
             data: Data to cache
             ttl: Optional TTL override. If None, uses default TTL.
+            tags: Optional dependency tags (see cache.dependencies) used by invalidate_tags()
 
         Raises:
             CacheKeyError: If key format is invalid
@@ -1055,54 +1375,450 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             data = self._encrypt_sensitive_data(data)
 
         def cache_operation():
-            return self._circuit_breaker.call(self._set_internal, key, data, ttl)
+            return self._circuit_breaker.call(self._set_internal, key, data, ttl, tags)
 
         def fallback_operation():
             logger.warning(f"Cache set failed for key {key}, operation skipped")
 
         self.with_graceful_degradation(cache_operation, fallback_operation)
 
-    def _set_internal(self, key: str, data: Any, ttl: Optional[timedelta] = None) -> None:
+    def _set_internal(
+        self,
+        key: str,
+        data: Any,
+        ttl: Optional[timedelta] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
         """Internal set operation without circuit breaker."""
+        # Use provided TTL or default
+        entry_ttl = ttl or self._default_ttl
+        expires_at = time.time() + entry_ttl.total_seconds()
+
+        entry_data = {
+            "data": data,
+            "expires_at": expires_at,
+            "created_at": time.time(),
+            "ttl": entry_ttl.total_seconds(),
+        }
+
+        # Serialize once, outside any lock; the payload length doubles as the
+        # memory tier size estimate
+        try:
+            backend_data: Optional[bytes] = pickle.dumps(entry_data)
+        except Exception as e:
+            logger.debug(f"Could not serialize cache entry for key {key}: {e}")
+            backend_data = None
+
+        # Writers of the same key are ordered by its lock stripe; the version
+        # assigned here decides which write the backend keeps
+        stripe = self._key_stripe(key)
+        size = len(backend_data) if backend_data is not None else None
+        write_backend = self._backend is not None and backend_data is not None
+        with self._key_locks[stripe]:
+            self._key_versions[stripe] += 1
+            version = self._key_versions[stripe]
+
+            # Store in memory for fast access
+            started = time.perf_counter()
+            self._store_in_memory(key, entry_data, size)
+            self._metrics.record_key(
+                key, "memory", "fill", time.perf_counter() - started, size=size
+            )
+            if write_backend:
+                self._pending_writes[key] = version
+
+        # Also store in backend for persistence, outside the key lock
+        if write_backend:
+            with self._backend_write_locks[stripe]:
+                if self._claim_backend_write(key, version):
+                    try:
+                        from .key_builder import CacheKeyBuilder
+
+                        # Parse operation from cache key for better status display
+                        key_components = CacheKeyBuilder.parse_key(key)
+                        operation = key_components.get("operation", "unknown")
+
+                        started = time.perf_counter()
+                        self._backend.set(
+                            key,
+                            backend_data,
+                            ttl=int(entry_ttl.total_seconds()),
+                            operation=operation,
+                        )
+                        if self._backend_tier is not None:
+                            self._metrics.record(
+                                operation,
+                                self._backend_tier,
+                                "fill",
+                                time.perf_counter() - started,
+                                size=size,
+                            )
+                    except Exception as e:
+                        logger.debug(f"Backend set failed for key {key}: {e}")
+
+        self._record_tags({key: tags or []})
+
         with self._lock:
-            # Use provided TTL or default
-            entry_ttl = ttl or self._default_ttl
-            expires_at = time.time() + entry_ttl.total_seconds()
+            self._stats["sets"] += 1
+            run_cleanup = self._stats["sets"] % CLEANUP_INTERVAL_SETS == 0
+
+        # Clean up expired entries periodically. This is keyed on the number of
+        # sets rather than the tier size, which stays constant once the tier is full.
+        if run_cleanup:
+            self.cleanup_expired()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve cached data for several keys.
+
+        Memory-tier hits are served directly; the remaining keys are read from
+        the backend with a single multi-key call.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary of key to cached data for the keys that were found
+
+        Raises:
+            CacheKeyError: If a key format is invalid
+            CacheValidationError: If a key exceeds its rate limit
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        for key in unique_keys:
+            self._validate_key(key)
+
+        if not self._check_rate_limits("get", unique_keys):
+            raise CacheValidationError("Rate limit exceeded for get operation")
+
+        def cache_operation():
+            return self._circuit_breaker.call(self._get_many_internal, unique_keys)
+
+        def fallback_operation():
+            logger.warning(f"Cache batch get failed for {len(unique_keys)} keys, returning none")
+            return {}
+
+        results = self.with_graceful_degradation(cache_operation, fallback_operation) or {}
+
+        # Decrypt sensitive data if needed
+        for key, value in list(results.items()):
+            if isinstance(value, dict) and value.get("encrypted", False):
+                try:
+                    results[key] = self._decrypt_sensitive_data(value)
+                except CacheValidationError as e:
+                    logger.error(f"Failed to decrypt sensitive data for key {key}: {e}")
+                    del results[key]
+
+        return results
+
+    def _get_many_internal(self, keys: List[str]) -> Dict[str, Any]:
+        """Internal batch get operation without circuit breaker."""
+        self._sync_with_journal()
+
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        current_time = time.time()
+
+        for key in keys:
+            entry = self._cache.get(key)
+            if entry is None:
+                missing.append(key)
+            elif current_time > entry["expires_at"]:
+                self._cache.pop(key, None)
+                missing.append(key)
+            else:
+                results[key] = entry["data"]
+        if results:
+            self._record("hits", "memory_hits", amount=len(results))
+
+        if missing and self._backend:
+            generation = self._generation
+            versions = {key: self._key_versions[self._key_stripe(key)] for key in missing}
+            try:
+                backend_results = self._backend.get_many(missing)
+            except Exception as e:
+                logger.debug(f"Backend batch get failed for {len(missing)} keys: {e}")
+                backend_results = {}
+
+            for key, backend_data in backend_results.items():
+                try:
+                    entry_data = pickle.loads(backend_data)
+                except Exception as e:
+                    logger.debug(f"Could not deserialize backend entry for key {key}: {e}")
+                    continue
+                if key in versions:
+                    self._fill_from_backend(
+                        key, entry_data, len(backend_data), generation, versions[key]
+                    )
+                results[key] = entry_data["data"]
+                self._record("hits", "backend_hits")
+
+        misses = len(keys) - len(results)
+        if misses:
+            self._record("misses", amount=misses)
+        return results
+
+    def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[timedelta] = None,
+        tags: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        """
+        Store several entries with the same TTL.
+
+        Entries are written to the memory tier and then to the backend with
+        one multi-key call per operation type.
+
+        Args:
+            items: Dictionary of cache key to data
+            ttl: Optional TTL override. If None, uses default TTL.
+            tags: Optional dictionary of cache key to dependency tags
+
+        Raises:
+            CacheKeyError: If a key format is invalid
+            CacheValidationError: If a key or value is invalid or rate limited
+        """
+        for key, data in items.items():
+            self._validate_key(key)
+            self._validate_value(data)
+
+        if not self._check_rate_limits("set", list(items)):
+            raise CacheValidationError("Rate limit exceeded for set operation")
+
+        # Encrypt sensitive data
+        prepared = {
+            key: self._encrypt_sensitive_data(data) if self._is_sensitive_data(key, data) else data
+            for key, data in items.items()
+        }
 
+        def cache_operation():
+            return self._circuit_breaker.call(self._set_many_internal, prepared, ttl, tags)
+
+        def fallback_operation():
+            logger.warning(f"Cache batch set failed for {len(prepared)} keys, operation skipped")
+
+        self.with_graceful_degradation(cache_operation, fallback_operation)
+
+    def _set_many_internal(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[timedelta] = None,
+        tags: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        """Internal batch set operation without circuit breaker."""
+        if not items:
+            return
+
+        from .key_builder import CacheKeyBuilder
+
+        entry_ttl = ttl or self._default_ttl
+        now = time.time()
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        by_operation: Dict[str, Dict[str, bytes]] = {}
+        for key, data in items.items():
             entry_data = {
                 "data": data,
-                "expires_at": expires_at,
-                "created_at": time.time(),
+                "expires_at": now + entry_ttl.total_seconds(),
+                "created_at": now,
                 "ttl": entry_ttl.total_seconds(),
             }
+            entries[key] = entry_data
+            try:
+                operation = CacheKeyBuilder.parse_key(key).get("operation", "unknown")
+                by_operation.setdefault(operation, {})[key] = pickle.dumps(entry_data)
+            except Exception as e:
+                logger.debug(f"Could not serialize cache entry for key {key}: {e}")
+
+        sizes = {
+            key: len(payload)
+            for payloads in by_operation.values()
+            for key, payload in payloads.items()
+        }
 
-            # Store in memory for fast access
-            self._cache[key] = entry_data
+        # Take every involved key lock stripe in index order, so batch and
+        # single-key writers agree on the last write without deadlocking
+        stripes = sorted({self._key_stripe(key) for key in entries})
+        versions: Dict[str, int] = {}
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._key_locks[stripe])
+                self._key_versions[stripe] += 1
+
+            for key, entry_data in entries.items():
+                self._store_in_memory(key, entry_data, sizes.get(key))
+                if self._backend and key in sizes:
+                    versions[key] = self._key_versions[self._key_stripe(key)]
+                    self._pending_writes[key] = versions[key]
+
+        # Write to the backend after releasing the key locks, skipping the keys
+        # that a newer write has superseded meanwhile
+        if versions:
+            with ExitStack() as stack:
+                for stripe in stripes:
+                    stack.enter_context(self._backend_write_locks[stripe])
+                for operation, payloads in by_operation.items():
+                    current = {
+                        key: payload
+                        for key, payload in payloads.items()
+                        if self._claim_backend_write(key, versions[key])
+                    }
+                    if not current:
+                        continue
+                    try:
+                        self._backend.set_many(
+                            current, ttl=int(entry_ttl.total_seconds()), operation=operation
+                        )
+                    except Exception as e:
+                        logger.debug(f"Backend batch set failed for {len(current)} keys: {e}")
 
-            # Also store in backend for persistence
-            if self._backend:
-                try:
-                    import pickle
+        self._record_tags({key: (tags or {}).get(key, []) for key in entries})
 
-                    from .key_builder import CacheKeyBuilder
+        with self._lock:
+            previous = self._stats["sets"]
+            self._stats["sets"] += len(entries)
+            run_cleanup = previous // CLEANUP_INTERVAL_SETS != self._stats["sets"] // (
+                CLEANUP_INTERVAL_SETS
+            )
 
-                    backend_data = pickle.dumps(entry_data)
+        if run_cleanup:
+            self.cleanup_expired()
 
-                    # Parse operation from cache key for better status display
-                    key_components = CacheKeyBuilder.parse_key(key)
-                    operation = key_components.get("operation", "unknown")
+    def delete_many(self, keys: List[str]) -> int:
+        """
+        Remove several exact cache keys from memory and, in one batch, the backend.
 
-                    self._backend.set(
-                        key, backend_data, ttl=int(entry_ttl.total_seconds()), operation=operation
-                    )
-                except Exception as e:
-                    logger.debug(f"Backend set failed for key {key}: {e}")
+        Args:
+            keys: Cache keys to remove (no wildcard matching)
 
-            self._stats["sets"] += 1
+        Returns:
+            Number of distinct keys removed
+
+        Raises:
+            CacheKeyError: If a key format is invalid
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        for key in unique_keys:
+            self._validate_key(key)
+
+        def cache_operation():
+            return self._circuit_breaker.call(self._delete_many_internal, unique_keys)
+
+        def fallback_operation():
+            logger.warning(f"Cache batch delete failed for {len(unique_keys)} keys, returning 0")
+            return 0
+
+        result = self.with_graceful_degradation(cache_operation, fallback_operation)
+        return int(result) if result is not None else 0
 
-            # Clean up expired entries periodically
-            if len(self._cache) % 10 == 0:  # Every 10th operation
-                self.cleanup_expired()
+    def _delete_many_internal(self, keys: List[str]) -> int:
+        """Internal batch delete operation without circuit breaker."""
+        if not keys:
+            return 0
+
+        with self._lock:
+            self._generation += 1
+
+        for key in keys:
+            self._cache.pop(key, None)
+        self._delete_from_backend(keys)
+        self._evict_refilled(keys)
+        self._dependencies.discard(keys)
+        if self._journal is not None:
+            self._journal.publish_keys(keys)
+
+        self._record("invalidations", amount=len(keys))
+        return len(keys)
+
+    def _record_tags(self, tags_by_key: Dict[str, List[str]]) -> None:
+        """Index the dependency tags of written keys and persist them where supported."""
+        for key, tags in tags_by_key.items():
+            self._dependencies.add(key, tags)
+
+        tagged = {key: tags for key, tags in tags_by_key.items() if tags}
+        if tagged and self._backend_supports_tags():
+            try:
+                self._backend.tag(tagged)
+            except Exception as e:
+                logger.debug(f"Backend tag write failed for {len(tagged)} keys: {e}")
+
+    def _backend_supports_tags(self) -> bool:
+        return self._backend is not None and getattr(self._backend, "supports_tags", False) is True
+
+    def invalidate_tags(self, tags: List[str]) -> int:
+        """
+        Invalidate the entries that depend on any of the given resources.
+
+        Keys are looked up in the dependency index of this process and, when
+        the backend stores tags, in the backend, so the cost is proportional to
+        the number of matching entries. Backends without tag support fall back
+        to the equivalent CacheKeyBuilder glob patterns.
+
+        Args:
+            tags: Dependency tags, e.g. ``["user:<user-id>", "account:<account-id>"]``
+
+        Returns:
+            Number of invalidated entries
+        """
+        unique_tags = list(dict.fromkeys(tags))
+        if not unique_tags:
+            return 0
+
+        def cache_operation():
+            return self._circuit_breaker.call(self._invalidate_tags_internal, unique_tags)
+
+        def fallback_operation():
+            logger.warning(f"Cache invalidation failed for {len(unique_tags)} tags, returning 0")
+            return 0
+
+        result = self.with_graceful_degradation(cache_operation, fallback_operation)
+        return int(result) if result is not None else 0
+
+    def _invalidate_tags_internal(self, tags: List[str]) -> int:
+        """Internal tag invalidation without circuit breaker."""
+        keys = self._dependencies.keys_for(tags)
+
+        if self._backend is None:
+            complete = self._dependencies.complete
+        elif self._backend_supports_tags():
+            try:
+                keys.update(self._backend.keys_for_tags(tags))
+                complete = True
+            except Exception as e:
+                logger.debug(f"Backend tag lookup failed, falling back to patterns: {e}")
+                complete = False
+        else:
+            complete = False
+
+        removed = self._delete_many_internal(sorted(keys))
+
+        if not complete:
+            for pattern in fallback_patterns(tags):
+                removed += self._invalidate_internal(pattern)
+
+        logger.debug(f"Invalidated {removed} cache entries for tags: {', '.join(tags)}")
+        return removed
+
+    def _delete_from_backend(self, keys: List[str]) -> None:
+        """Remove keys from the backend with a single multi-key call."""
+        if not keys or self._backend is None:
+            return
+        try:
+            self._backend.delete_many(keys)
+            logger.debug(f"Invalidated {len(keys)} backend entries")
+        except Exception as e:
+            logger.debug(f"Failed to invalidate {len(keys)} backend entries: {e}")
+
+    def _check_rate_limits(self, operation: str, keys: List[str]) -> bool:
+        """Consume one operation per key under a single lock acquisition."""
+        current_time = time.time()
+        with self._lock:
+            allowed = True
+            for key in keys:
+                if not self._consume_rate_limit(f"{operation}:{key}", operation, key, current_time):
+                    allowed = False
+            return allowed
 
     def invalidate(self, pattern: str) -> int:
         """
@@ -1141,73 +1857,78 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
     def _invalidate_internal(self, pattern: str) -> int:
         """Internal invalidate operation without circuit breaker."""
         with self._lock:
-            keys_to_remove = []
-
-            # If pattern is "*", clear everything including backend
-            if pattern == "*":
-                # Clear in-memory cache
-                keys_to_remove = list(self._cache.keys())
-                self._cache.clear()
-
-                # Also clear the persistent backend if available
-                if self._backend is not None and hasattr(self._backend, "invalidate"):
-                    try:
-                        # Invalidate all entries in the backend
-                        self._backend.invalidate()
-                        logger.info("Cleared backend cache")
-                    except Exception as e:
-                        logger.warning(f"Failed to clear backend cache: {e}")
-
-                removed_count = len(keys_to_remove)
-                if removed_count > 0:
-                    self._stats["invalidations"] += removed_count
-                    logger.debug(f"Invalidated {removed_count} cache entries and cleared backend")
+            self._generation += 1
 
-                return removed_count
+        keys_to_remove = []
 
-            # For pattern-based invalidation, we need to check both in-memory and backend
-            # First, collect all keys that match the pattern from in-memory cache
-            for key in self._cache.keys():
-                if fnmatch.fnmatch(key, pattern):
-                    keys_to_remove.append(key)
+        # If pattern is "*", clear everything including backend
+        if pattern == "*":
+            # Clear in-memory cache
+            keys_to_remove = list(self._cache.keys())
+            self._cache.clear()
+            self._dependencies.clear()
+            if self._journal is not None:
+                self._journal.publish_clear()
 
-            # Also check backend for matching keys if it supports listing
-            if self._backend:
+            # Also clear the persistent backend if available
+            if self._backend is not None and hasattr(self._backend, "invalidate"):
                 try:
-                    # Get all keys from backend and check for matches
-                    backend_keys = self._get_backend_keys()
-                    for key in backend_keys:
-                        if fnmatch.fnmatch(key, pattern) and key not in keys_to_remove:
-                            keys_to_remove.append(key)
+                    # Invalidate all entries in the backend
+                    self._backend.invalidate()
+                    logger.info("Cleared backend cache")
                 except Exception as e:
-                    logger.debug(f"Could not get backend keys for pattern matching: {e}")
-
-            # Remove matching entries from both in-memory cache and backend
-            for key in keys_to_remove:
-                # Remove from in-memory cache if present
-                if key in self._cache:
-                    del self._cache[key]
-
-                # Remove from backend if available
-                if self._backend is not None and hasattr(self._backend, "invalidate"):
-                    try:
-                        self._backend.invalidate(key)
-                        logger.debug(f"Invalidated backend entry for key: {key}")
-                    except Exception as e:
-                        logger.debug(f"Failed to invalidate backend entry for key {key}: {e}")
+                    logger.warning(f"Failed to clear backend cache: {e}")
+            self._evict_refilled()
 
             removed_count = len(keys_to_remove)
             if removed_count > 0:
-                self._stats["invalidations"] += removed_count
-                logger.debug(
-                    f"Invalidated {removed_count} cache entries matching pattern: {pattern}"
-                )
+                self._record("invalidations", amount=removed_count)
+                logger.debug(f"Invalidated {removed_count} cache entries and cleared backend")
 
             return removed_count
 
-    def _get_backend_keys(self) -> List[str]:
-        """
-        Get all cache keys from the backend.
+        # For pattern-based invalidation, we need to check both in-memory and backend
+        # First, collect all keys that match the pattern from in-memory cache
+        for key in self._cache.keys():
+            if fnmatch.fnmatch(key, pattern):
+                keys_to_remove.append(key)
+
+        # Also check backend for matching keys if it supports listing
+        if self._backend:
+            try:
+                # Narrow the backend listing to the literal prefix of the pattern
+                backend_keys = self._get_backend_keys(_literal_prefix(pattern))
+                seen = set(keys_to_remove)
+                for key in backend_keys:
+                    if key not in seen and fnmatch.fnmatch(key, pattern):
+                        keys_to_remove.append(key)
+                        seen.add(key)
+            except Exception as e:
+                logger.debug(f"Could not get backend keys for pattern matching: {e}")
+
+        # Remove matching entries from the in-memory cache and, in one batch, the backend
+        for key in keys_to_remove:
+            self._cache.pop(key, None)
+        self._delete_from_backend(keys_to_remove)
+        self._evict_refilled(keys_to_remove)
+        self._dependencies.discard(keys_to_remove)
+        # Other processes may hold matching keys this one never saw
+        if self._journal is not None:
+            self._journal.publish_pattern(pattern)
+
+        removed_count = len(keys_to_remove)
+        if removed_count > 0:
+            self._record("invalidations", amount=removed_count)
+            logger.debug(f"Invalidated {removed_count} cache entries matching pattern: {pattern}")
+
+        return removed_count
+
+    def _get_backend_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """
+        Get cache keys from the backend.
+
+        Args:
+            prefix: Only return keys starting with this prefix
 
         Returns:
             List of cache keys from the backend
@@ -1216,36 +1937,10 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             return []
 
         try:
-            # For file backend, we need to read the metadata from each file to get the original key
-            if hasattr(self._backend, "path_manager"):
-                cache_files = self._backend.path_manager.list_cache_files()
-                keys = []
-                for cache_file in cache_files:
-                    try:
-                        # Read the cache file to extract the original key from metadata
-                        with open(cache_file, "rb") as f:
-                            file_content = f.read()
-
-                        # Check if it's the new format with metadata
-                        if len(file_content) >= 4:
-                            metadata_length = int.from_bytes(file_content[:4], byteorder="big")
-                            if metadata_length > 0 and metadata_length < len(file_content):
-                                metadata_json = file_content[4 : 4 + metadata_length]
-                                metadata = json.loads(metadata_json.decode("utf-8"))
-                                if "key" in metadata:
-                                    keys.append(metadata["key"])
-                                    continue
-
-                        # For legacy format, we can't easily get the key, so skip
-                        logger.debug(f"Could not extract key from legacy cache file {cache_file}")
-
-                    except Exception as e:
-                        logger.debug(f"Could not read cache file {cache_file}: {e}")
-                return keys
-
-            # If we can't list keys, return empty list
-            logger.debug("Backend does not support key listing")
-            return []
+            # Local backends serve this from their key index
+            if prefix:
+                return list(self._backend.list_keys(prefix))
+            return list(self._backend.list_keys())
 
         except Exception as e:
             logger.debug(f"Failed to get backend keys: {e}")
@@ -1270,22 +1965,28 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
     def _clear_internal(self) -> None:
         """Internal clear operation without circuit breaker."""
         with self._lock:
-            cleared_count = len(self._cache)
+            self._generation += 1
 
-            # Clear in-memory cache
-            self._cache.clear()
+        cleared_count = len(self._cache)
 
-            # Also clear the persistent backend if available
-            if self._backend is not None and hasattr(self._backend, "invalidate"):
-                try:
-                    # Invalidate all entries in the backend
-                    self._backend.invalidate()
-                    logger.info("Cleared backend cache")
-                except Exception as e:
-                    logger.warning(f"Failed to clear backend cache: {e}")
+        # Clear in-memory cache
+        self._cache.clear()
+        self._dependencies.clear()
+        if self._journal is not None:
+            self._journal.publish_clear()
+
+        # Also clear the persistent backend if available
+        if self._backend is not None and hasattr(self._backend, "invalidate"):
+            try:
+                # Invalidate all entries in the backend
+                self._backend.invalidate()
+                logger.info("Cleared backend cache")
+            except Exception as e:
+                logger.warning(f"Failed to clear backend cache: {e}")
+        self._evict_refilled()
 
-            self._stats["clears"] += 1
-            logger.info(f"Cleared {cleared_count} in-memory cache entries and backend cache")
+        self._record("clears")
+        logger.info(f"Cleared {cleared_count} in-memory cache entries and backend cache")
 
     def exists(self, key: str) -> bool:
         """
@@ -1317,19 +2018,18 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
 
     def _exists_internal(self, key: str) -> bool:
         """Internal exists check without circuit breaker."""
-        with self._lock:
-            if key not in self._cache:
-                return False
+        self._sync_with_journal()
 
-            entry = self._cache[key]
-            current_time = time.time()
+        entry = self._cache.get(key)
+        if entry is None:
+            return False
 
-            if current_time > entry["expires_at"]:
-                # Entry has expired, remove it
-                del self._cache[key]
-                return False
+        if time.time() > entry["expires_at"]:
+            # Entry has expired, remove it
+            self._cache.pop(key, None)
+            return False
 
-            return True
+        return True
 
     def get_stats(self) -> dict:
         """
@@ -1339,44 +2039,50 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             Dictionary containing cache statistics
         """
         try:
-            with self._lock:
-                current_time = time.time()
+            current_time = time.time()
 
-                # Count expired entries
-                expired_count = 0
-                total_entries = len(self._cache)
+            # Count expired entries
+            expired_count = 0
+            total_entries = len(self._cache)
 
-                for entry in self._cache.values():
-                    if current_time > entry["expires_at"]:
-                        expired_count += 1
+            for entry in self._cache.values():
+                if current_time > entry["expires_at"]:
+                    expired_count += 1
 
-                # Calculate hit rate
-                total_requests = self._stats["hits"] + self._stats["misses"]
-                hit_rate = (
-                    (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0.0
-                )
+            # Calculate hit rate
+            total_requests = self._stats["hits"] + self._stats["misses"]
+            hit_rate = (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0.0
+
+            # Get circuit breaker stats
+            circuit_stats = self._circuit_breaker.get_stats()
+
+            # Get degradation stats
+            degradation_stats = self.get_degradation_stats()
 
-                # Get circuit breaker stats
-                circuit_stats = self._circuit_breaker.get_stats()
-
-                # Get degradation stats
-                degradation_stats = self.get_degradation_stats()
-
-                return {
-                    "total_entries": total_entries,
-                    "expired_entries": expired_count,
-                    "active_entries": total_entries - expired_count,
-                    "hits": self._stats["hits"],
-                    "misses": self._stats["misses"],
-                    "sets": self._stats["sets"],
-                    "invalidations": self._stats["invalidations"],
-                    "clears": self._stats["clears"],
-                    "errors": self._stats["errors"],
-                    "hit_rate_percentage": round(hit_rate, 2),
-                    "default_ttl_seconds": self._default_ttl.total_seconds(),
-                    "circuit_breaker": circuit_stats,
-                    "degradation": degradation_stats,
-                }
+            return {
+                "total_entries": total_entries,
+                "expired_entries": expired_count,
+                "active_entries": total_entries - expired_count,
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "sets": self._stats["sets"],
+                "invalidations": self._stats["invalidations"],
+                "clears": self._stats["clears"],
+                "errors": self._stats["errors"],
+                "hit_rate_percentage": round(hit_rate, 2),
+                "memory_hits": self._stats["memory_hits"],
+                "backend_hits": self._stats["backend_hits"],
+                "memory_tier": self._cache.get_stats(),
+                "dependency_index": self._dependencies.stats(),
+                "expiry_sweeper": self._sweeper.stats() if self._sweeper is not None else None,
+                "coherence_journal": self._journal.stats() if self._journal is not None else None,
+                "adaptive_ttl": (
+                    self._adaptive_ttl.stats() if self._adaptive_ttl is not None else None
+                ),
+                "default_ttl_seconds": self._default_ttl.total_seconds(),
+                "circuit_breaker": circuit_stats,
+                "degradation": degradation_stats,
+            }
         except Exception as e:
             logger.error(f"Failed to get cache statistics: {e}")
             return {
@@ -1385,6 +2091,25 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
                 "degradation": self.get_degradation_stats(),
             }
 
+    @property
+    def metrics(self) -> CacheMetrics:
+        """Latency and payload size histograms of this cache manager."""
+        return self._metrics
+
+    @property
+    def adaptive_ttl(self) -> Optional[AdaptiveTTLPolicy]:
+        """Adaptive TTL policy shared by the cached AWS clients, or None when disabled."""
+        return self._adaptive_ttl
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get per-operation, per-tier latency and payload size histograms.
+
+        Returns:
+            JSON-serializable snapshot, see CacheMetrics.snapshot()
+        """
+        return self._metrics.snapshot()
+
     def cleanup_expired(self) -> int:
         """
         Remove expired entries from cache.
@@ -1392,22 +2117,21 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
         Returns:
             Number of expired entries removed
         """
-        with self._lock:
-            current_time = time.time()
-            keys_to_remove = []
+        current_time = time.time()
+        keys_to_remove = []
 
-            for key, entry in self._cache.items():
-                if current_time > entry["expires_at"]:
-                    keys_to_remove.append(key)
+        for key, entry in self._cache.items():
+            if current_time > entry["expires_at"]:
+                keys_to_remove.append(key)
 
-            for key in keys_to_remove:
-                del self._cache[key]
+        for key in keys_to_remove:
+            self._cache.pop(key, None)
 
-            removed_count = len(keys_to_remove)
-            if removed_count > 0:
-                logger.debug(f"Cleaned up {removed_count} expired cache entries")
+        removed_count = len(keys_to_remove)
+        if removed_count > 0:
+            logger.debug(f"Cleaned up {removed_count} expired cache entries")
 
-            return removed_count
+        return removed_count
 
     def cleanup_expired_files(self) -> int:
         """
@@ -1433,6 +2157,45 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
             logger.error(f"Failed to cleanup expired files: {e}")
             return 0
 
+    def get_expiry_sweeper(self) -> Optional[ExpirySweeper]:
+        """
+        Get the incremental expiry sweeper of the persistent backend.
+
+        Returns:
+            ExpirySweeper instance, or None without a persistent backend
+        """
+        if self._backend is None:
+            return None
+        with self._lock:
+            if self._sweeper is None or self._sweeper.backend is not self._backend:
+                if self._sweeper is not None:
+                    self._sweeper.stop()
+                self._sweeper = ExpirySweeper(self._backend)
+            return self._sweeper
+
+    def sweep_expired(self, budget_ms: float = DEFAULT_BUDGET_MS) -> Dict[str, Any]:
+        """
+        Remove expired backend entries incrementally within a time budget.
+
+        Unlike cleanup_expired_files(), the sweep stops once the budget is
+        spent and the next call resumes where it stopped.
+
+        Args:
+            budget_ms: Time budget in milliseconds
+
+        Returns:
+            Dictionary describing the run (see ExpirySweeper.run), with an
+            "error" entry if the sweep failed
+        """
+        try:
+            sweeper = self.get_expiry_sweeper()
+            if sweeper is None:
+                return {"entries_reclaimed": 0, "bytes_freed": 0, "pass_completed": True}
+            return sweeper.run(budget_ms)
+        except Exception as e:
+            logger.error(f"Failed to sweep expired entries: {e}")
+            return {"entries_reclaimed": 0, "bytes_freed": 0, "error": str(e)}
+
     def get_cache_size(self) -> int:
         """
         Get current number of cache entries.
@@ -1440,8 +2203,7 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
         Returns:
             Number of entries in cache
         """
-        with self._lock:
-            return len(self._cache)
+        return len(self._cache)
 
     def get_keys_matching(self, pattern: str) -> list:
         """
@@ -1453,12 +2215,11 @@ class CacheManager(ICacheManager, GracefulDegradationMixin):
         Returns:
             List of matching cache keys
         """
-        with self._lock:
-            matching_keys = []
-            for key in self._cache.keys():
-                if fnmatch.fnmatch(key, pattern):
-                    matching_keys.append(key)
-            return matching_keys
+        matching_keys = []
+        for key in self._cache.keys():
+            if fnmatch.fnmatch(key, pattern):
+                matching_keys.append(key)
+        return matching_keys
 
     def invalidate_for_operation(
         self,
@@ -0,0 +1,354 @@
+"""Bounded, size-aware LRU memory tier for the cache manager."""
+
+import logging
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_SIZE_MB = 50
+DEFAULT_STRIPES = 8
+
+
+def estimate_entry_size(entry: Any) -> int:
+    """
+    Estimate the in-memory footprint of a cache entry in bytes.
+
+    Uses the pickled size, which tracks the payload size closely and is cheap
+    for the plain dict/list structures returned by AWS APIs. Falls back to
+    sys.getsizeof for objects that cannot be pickled.
+
+    Args:
+        entry: Cache entry to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    try:
+        return len(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(entry)
+
+
+class MemoryTier:
+    """
+    In-memory LRU store bounded by entry count and approximate byte size.
+
+    Entries are the manager's entry dicts (``data``, ``expires_at``, ...).
+    Reads through ``get`` or ``[]`` mark an entry as most recently used; when
+    either bound is exceeded the least recently used entries are evicted.
+
+    The tier supports the mapping operations the cache manager relies on
+    (``in``, ``[]``, ``del``, ``len``, ``keys``/``values``/``items``, ``clear``)
+    so it can stand in for a plain dict. It is not thread-safe by itself;
+    callers serialize access.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+    ):
+        """
+        Initialize the memory tier.
+
+        Args:
+            max_entries: Maximum number of resident entries
+            max_bytes: Maximum approximate size of resident entries in bytes
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+
+        # Counters
+        self._evictions = 0
+        self._evicted_bytes = 0
+        self._rejections = 0
+
+    def put(self, key: str, entry: Dict[str, Any], size: Optional[int] = None) -> List[str]:
+        """
+        Insert or replace an entry and evict as needed to stay within bounds.
+
+        Args:
+            key: Cache key
+            entry: Entry dict to store
+            size: Approximate size in bytes. Estimated if not provided.
+
+        Returns:
+            Keys evicted to make room (not including the key being stored)
+        """
+        if size is None:
+            size = estimate_entry_size(entry)
+
+        self._remove(key)
+
+        if size > self.max_bytes:
+            # Never let a single oversized entry flush the whole tier
+            self._rejections += 1
+            logger.debug(f"Entry for key {key} ({size} bytes) exceeds memory tier limit")
+            return []
+
+        self._entries[key] = entry
+        self._sizes[key] = size
+        self._total_bytes += size
+
+        evicted = []
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            victim, _ = self._entries.popitem(last=False)
+            victim_size = self._sizes.pop(victim, 0)
+            self._total_bytes -= victim_size
+            self._evictions += 1
+            self._evicted_bytes += victim_size
+            evicted.append(victim)
+
+        if evicted:
+            logger.debug(f"Memory tier evicted {len(evicted)} entries")
+
+        return evicted
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the entry for ``key`` and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._entries.move_to_end(key)
+        return entry
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove and return the entry for ``key``."""
+        entry = self._entries.get(key, default)
+        self._remove(key)
+        return entry
+
+    def _remove(self, key: str) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._total_bytes -= self._sizes.pop(key, 0)
+
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        self._entries.clear()
+        self._sizes.clear()
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate size of resident entries in bytes."""
+        return self._total_bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get residency and eviction counters.
+
+        Returns:
+            Dictionary of memory tier statistics
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "size_bytes": self._total_bytes,
+            "max_size_bytes": self.max_bytes,
+            "entry_utilization_percentage": round(len(self._entries) / self.max_entries * 100, 2),
+            "size_utilization_percentage": round(self._total_bytes / self.max_bytes * 100, 2),
+            "evictions": self._evictions,
+            "evicted_bytes": self._evicted_bytes,
+            "rejected_oversized": self._rejections,
+        }
+
+    # Mapping protocol used by the cache manager
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self._entries[key]
+        self._entries.move_to_end(key)
+        return entry
+
+    def __setitem__(self, key: str, entry: Dict[str, Any]) -> None:
+        self.put(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._entries:
+            raise KeyError(key)
+        self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def keys(self) -> List[str]:
+        """Return resident keys, least recently used first."""
+        return list(self._entries.keys())
+
+    def values(self) -> List[Dict[str, Any]]:
+        """Return resident entries, least recently used first."""
+        return list(self._entries.values())
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return resident (key, entry) pairs, least recently used first."""
+        return list(self._entries.items())
+
+
+class StripedMemoryTier:
+    """
+    Thread-safe memory tier split into independently locked LRU stripes.
+
+    Keys are assigned to a stripe by hash, and each stripe is a MemoryTier with
+    its own lock and an equal share of the entry and byte bounds. Operations on
+    different stripes never contend, and no lock is held for longer than a few
+    dict operations. LRU order is tracked per stripe, which approximates a
+    global LRU closely for evenly distributed keys.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_SIZE_MB * 1024 * 1024,
+        stripes: int = DEFAULT_STRIPES,
+    ):
+        """
+        Initialize the striped memory tier.
+
+        Args:
+            max_entries: Maximum number of resident entries across all stripes
+            max_bytes: Maximum approximate size of resident entries across all stripes
+            stripes: Number of independently locked stripes
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        stripes = max(1, min(stripes, max_entries))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._stripes = [
+            MemoryTier(
+                max_entries=max(1, max_entries // stripes),
+                max_bytes=max(1, max_bytes // stripes),
+            )
+            for _ in range(stripes)
+        ]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe_for(self, key: str) -> Tuple[MemoryTier, threading.Lock]:
+        index = hash(key) % len(self._stripes)
+        return self._stripes[index], self._locks[index]
+
+    def put(self, key: str, entry: Dict[str, Any], size: Optional[int] = None) -> List[str]:
+        """Insert or replace an entry. See MemoryTier.put."""
+        if size is None:
+            # Estimate outside the lock
+            size = estimate_entry_size(entry)
+        stripe, lock = self._stripe_for(key)
+        with lock:
+            return stripe.put(key, entry, size)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the entry for ``key`` and mark it most recently used."""
+        stripe, lock = self._stripe_for(key)
+        with lock:
+            return stripe.get(key, default)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove and return the entry for ``key``."""
+        stripe, lock = self._stripe_for(key)
+        with lock:
+            return stripe.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all entries from every stripe."""
+        for stripe, lock in zip(self._stripes, self._locks):
+            with lock:
+                stripe.clear()
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate size of resident entries in bytes."""
+        return sum(stripe.total_bytes for stripe in self._stripes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get residency and eviction counters aggregated across stripes.
+
+        Returns:
+            Dictionary of memory tier statistics
+        """
+        totals = {"entries": 0, "size_bytes": 0, "evictions": 0, "evicted_bytes": 0}
+        rejected = 0
+        for stripe, lock in zip(self._stripes, self._locks):
+            with lock:
+                stripe_stats = stripe.get_stats()
+            for name in totals:
+                totals[name] += stripe_stats[name]
+            rejected += stripe_stats["rejected_oversized"]
+
+        return {
+            "entries": totals["entries"],
+            "max_entries": self.max_entries,
+            "size_bytes": totals["size_bytes"],
+            "max_size_bytes": self.max_bytes,
+            "entry_utilization_percentage": round(totals["entries"] / self.max_entries * 100, 2),
+            "size_utilization_percentage": round(totals["size_bytes"] / self.max_bytes * 100, 2),
+            "evictions": totals["evictions"],
+            "evicted_bytes": totals["evicted_bytes"],
+            "rejected_oversized": rejected,
+            "stripes": len(self._stripes),
+        }
+
+    # Mapping protocol used by the cache manager
+
+    def __contains__(self, key: object) -> bool:
+        stripe, lock = self._stripe_for(key)  # type: ignore[arg-type]
+        with lock:
+            return key in stripe
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        stripe, lock = self._stripe_for(key)
+        with lock:
+            return stripe[key]
+
+    def __setitem__(self, key: str, entry: Dict[str, Any]) -> None:
+        self.put(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        stripe, lock = self._stripe_for(key)
+        with lock:
+            del stripe[key]
+
+    def __len__(self) -> int:
+        return sum(len(stripe) for stripe in self._stripes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def keys(self) -> List[str]:
+        """Return a snapshot of resident keys."""
+        return [key for key, _ in self.items()]
+
+    def values(self) -> List[Dict[str, Any]]:
+        """Return a snapshot of resident entries."""
+        return [entry for _, entry in self.items()]
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return a snapshot of resident (key, entry) pairs."""
+        result: List[Tuple[str, Dict[str, Any]]] = []
+        for stripe, lock in zip(self._stripes, self._locks):
+            with lock:
+                result.extend(stripe.items())
+        return result
@@ -0,0 +1,305 @@
+"""In-process latency and payload size histograms for cache operations.
+
+Every lookup and fill is recorded per cacheable operation and per tier:
+
+- ``memory``: the CacheManager in-memory LRU tier
+- ``local``: a backend on this host (file, segment, SQLite, hybrid local tier)
+- ``remote``: DynamoDB, directly or as the hybrid remote tier
+- ``aws``: the AWS API call made on a cache miss
+
+Lookups are recorded as ``hit`` or ``miss`` and writes as ``fill``. For the
+``aws`` tier ``fill`` is the latency of the API call that populated the cache,
+which is what a hit on that operation saves. Histograms use fixed buckets so
+that snapshots from several processes can be merged.
+"""
+
+import bisect
+import json
+import logging
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+TIERS = ("memory", "local", "remote", "aws")
+OUTCOMES = ("hit", "miss", "fill")
+
+# Bucket upper bounds; the last, implicit bucket is unbounded
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+SIZE_BUCKETS_BYTES: Tuple[float, ...] = tuple(float(4**exponent) for exponent in range(3, 13))
+
+# Operations past this many distinct names are folded into OTHER_OPERATION, so
+# ad-hoc keys cannot grow the registry without bound
+MAX_OPERATIONS = 256
+UNKNOWN_OPERATION = "unknown"
+OTHER_OPERATION = "other"
+
+
+def operation_from_key(key: str) -> str:
+    """
+    Return the operation component of a structured cache key.
+
+    Args:
+        key: Cache key built by CacheKeyBuilder
+
+    Returns:
+        Operation name, or ``unknown`` when the key has no operation component
+    """
+    parts = key.split(":", 3)
+    if len(parts) > 2 and parts[2]:
+        return parts[2]
+    return UNKNOWN_OPERATION
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with count, sum, min and max.
+
+    Not thread-safe on its own; CacheMetrics serializes access to it.
+    """
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket that holds it.
+
+        Args:
+            fraction: Percentile as a fraction between 0 and 1
+
+        Returns:
+            Estimated value, never above the largest observation
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                break
+        return self.max
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """
+        Add the observations of a serialized histogram with the same buckets.
+
+        Args:
+            data: Dictionary produced by to_dict()
+
+        Raises:
+            ValueError: If the bucket bounds differ
+        """
+        bounds = [bound for bound, _ in data.get("buckets", [])[:-1]]
+        if tuple(float(bound) for bound in bounds) != self.bounds:
+            raise ValueError("Cannot merge histograms with different buckets")
+        for index, (_, bucket_count) in enumerate(data["buckets"]):
+            self.counts[index] += int(bucket_count)
+        count = int(data.get("count", 0))
+        if count:
+            self.count += count
+            self.total += float(data.get("sum", 0.0))
+            self.min = min(self.min, float(data.get("min", math.inf)))
+            self.max = max(self.max, float(data.get("max", 0.0)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary including the raw buckets."""
+        buckets: List[List[Any]] = [
+            [bound, bucket_count] for bound, bucket_count in zip(self.bounds, self.counts)
+        ]
+        buckets.append(["+Inf", self.counts[-1]])
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "min": round(self.min, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "p50": round(self.percentile(0.50), 6),
+            "p90": round(self.percentile(0.90), 6),
+            "p99": round(self.percentile(0.99), 6),
+            "buckets": buckets,
+        }
+
+
+class _TierMetrics:
+    """Latency histograms per outcome and a payload size histogram for one tier."""
+
+    def __init__(self) -> None:
+        self.latency_ms = {outcome: Histogram(LATENCY_BUCKETS_MS) for outcome in OUTCOMES}
+        self.payload_bytes = Histogram(SIZE_BUCKETS_BYTES)
+
+    def to_dict(self) -> Dict[str, Any]:
+        hits = self.latency_ms["hit"].count
+        lookups = hits + self.latency_ms["miss"].count
+        return {
+            "hits": hits,
+            "misses": self.latency_ms["miss"].count,
+            "fills": self.latency_ms["fill"].count,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "latency_ms": {
+                outcome: histogram.to_dict() for outcome, histogram in self.latency_ms.items()
+            },
+            "payload_bytes": self.payload_bytes.to_dict(),
+        }
+
+
+class CacheMetrics:
+    """
+    Thread-safe registry of cache histograms keyed by operation and tier.
+
+    Recording takes one short lock and a bucket search, so it is cheap enough
+    to run on every cache lookup.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: Dict[str, Dict[str, _TierMetrics]] = {}
+
+    def _tier(self, operation: str, tier: str) -> _TierMetrics:
+        """Return the metrics of an operation and tier, creating them. Caller holds the lock."""
+        tiers = self._operations.get(operation)
+        if tiers is None:
+            if len(self._operations) >= MAX_OPERATIONS:
+                operation = OTHER_OPERATION
+                tiers = self._operations.get(operation)
+            if tiers is None:
+                tiers = self._operations[operation] = {}
+        metrics = tiers.get(tier)
+        if metrics is None:
+            metrics = tiers[tier] = _TierMetrics()
+        return metrics
+
+    def record(
+        self,
+        operation: Optional[str],
+        tier: str,
+        outcome: str,
+        seconds: float,
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Record one cache lookup or fill.
+
+        Args:
+            operation: Cacheable operation name, e.g. ``list_users``
+            tier: One of TIERS
+            outcome: One of OUTCOMES
+            seconds: Elapsed time in seconds
+            size: Payload size in bytes, if known
+        """
+        if tier not in TIERS or outcome not in OUTCOMES:
+            logger.debug(f"Ignoring cache metric with tier {tier} and outcome {outcome}")
+            return
+        with self._lock:
+            metrics = self._tier(operation or UNKNOWN_OPERATION, tier)
+            metrics.latency_ms[outcome].observe(seconds * 1000.0)
+            if size is not None:
+                metrics.payload_bytes.observe(float(size))
+
+    def record_key(
+        self, key: str, tier: str, outcome: str, seconds: float, size: Optional[int] = None
+    ) -> None:
+        """Record a cache lookup or fill for a structured cache key."""
+        self.record(operation_from_key(key), tier, outcome, seconds, size)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return all histograms as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with per-operation, per-tier histograms and per-tier totals
+        """
+        with self._lock:
+            operations = {
+                operation: {tier: metrics.to_dict() for tier, metrics in sorted(tiers.items())}
+                for operation, tiers in sorted(self._operations.items())
+            }
+
+        totals: Dict[str, Dict[str, Any]] = {}
+        for tiers in operations.values():
+            for tier, data in tiers.items():
+                total = totals.setdefault(tier, {"hits": 0, "misses": 0, "fills": 0})
+                for counter in ("hits", "misses", "fills"):
+                    total[counter] += data[counter]
+        for total in totals.values():
+            lookups = total["hits"] + total["misses"]
+            total["hit_ratio"] = round(total["hits"] / lookups, 4) if lookups else None
+
+        return {"operations": operations, "tiers": totals}
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Add the histograms of a snapshot, e.g. one exported by another process.
+
+        Args:
+            snapshot: Dictionary produced by snapshot()
+        """
+        with self._lock:
+            for operation, tiers in snapshot.get("operations", {}).items():
+                for tier, data in tiers.items():
+                    if tier not in TIERS:
+                        continue
+                    metrics = self._tier(operation, tier)
+                    for outcome, histogram in data.get("latency_ms", {}).items():
+                        if outcome in metrics.latency_ms:
+                            metrics.latency_ms[outcome].merge(histogram)
+                    if "payload_bytes" in data:
+                        metrics.payload_bytes.merge(data["payload_bytes"])
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Return the snapshot as a JSON document."""
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True)
+
+    def export_json(self, path: str) -> None:
+        """
+        Write the snapshot to a JSON file.
+
+        Args:
+            path: Destination file path
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+    def reset(self) -> None:
+        """Discard all recorded observations."""
+        with self._lock:
+            self._operations.clear()
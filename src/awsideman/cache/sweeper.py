@@ -0,0 +1,229 @@
+"""Incremental expiry sweeper for cache backends.
+
+Removing expired entries used to be a single blocking pass over the whole
+cache. The sweeper instead asks the backend to sweep a bounded slice of
+entries at a time (see CacheBackend.sweep_expired) and stops once its time
+budget is spent, keeping the cursor where it stopped.
+
+The cursor and the cumulative metrics are saved to a small state file next to
+the local cache data, so a sweep started by one command is resumed by the
+next one. A daemon thread can also run budgeted sweeps at a fixed interval.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..utils.security import get_secure_logger
+from .backends.base import CacheBackend
+
+logger = get_secure_logger(__name__)
+
+# Entries examined per backend call
+DEFAULT_SLICE_SIZE = 500
+
+# Time budget of a single sweep run in milliseconds
+DEFAULT_BUDGET_MS = 50
+
+_COUNTERS = (
+    "runs",
+    "slices",
+    "passes_completed",
+    "entries_scanned",
+    "entries_reclaimed",
+    "bytes_freed",
+)
+
+
+class ExpirySweeper:
+    """
+    Remove expired cache entries in budgeted, resumable runs.
+
+    Runs are serialized within the process. Concurrent runs from several
+    processes are harmless: backends only ever delete expired entries, and the
+    last run to finish saves its cursor.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        slice_size: int = DEFAULT_SLICE_SIZE,
+        state_file: Optional[Path] = None,
+    ):
+        """
+        Initialize the sweeper.
+
+        Args:
+            backend: Cache backend to sweep
+            slice_size: Maximum number of entries examined per backend call
+            state_file: Where to keep the cursor and metrics between runs.
+                        Defaults to the backend's sweep_state_file(); None keeps
+                        them in memory only.
+        """
+        self.backend = backend
+        self.slice_size = slice_size
+        self.state_file = state_file if state_file is not None else backend.sweep_state_file()
+
+        self._cursor: Optional[str] = None
+        self._totals: Dict[str, Any] = {name: 0 for name in _COUNTERS}
+        self._totals["sweep_time_ms"] = 0.0
+        self._last_run: Dict[str, Any] = {}
+
+        self._run_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._load_state()
+
+    def run(self, budget_ms: float = DEFAULT_BUDGET_MS) -> Dict[str, Any]:
+        """
+        Sweep slices until the pass completes or the time budget is spent.
+
+        At least one slice is swept per run, so the budget may be overrun by
+        up to one slice.
+
+        Args:
+            budget_ms: Time budget in milliseconds
+
+        Returns:
+            Dictionary with the slices, entries scanned and reclaimed, bytes
+            freed and elapsed time of this run, and whether the pass completed
+
+        Raises:
+            CacheBackendError: If the backend sweep fails
+        """
+        with self._run_lock:
+            # Another process may have advanced the sweep since the last run
+            self._load_state()
+
+            start = time.perf_counter()
+            deadline = start + budget_ms / 1000
+            run: Dict[str, Any] = {
+                "slices": 0,
+                "entries_scanned": 0,
+                "entries_reclaimed": 0,
+                "bytes_freed": 0,
+                "pass_completed": False,
+            }
+
+            try:
+                while True:
+                    result = self.backend.sweep_expired(self._cursor, self.slice_size)
+                    run["slices"] += 1
+                    run["entries_scanned"] += result.scanned
+                    run["entries_reclaimed"] += result.removed
+                    run["bytes_freed"] += result.bytes_freed
+                    self._cursor = result.cursor
+
+                    if result.cursor is None:
+                        run["pass_completed"] = True
+                        break
+                    if time.perf_counter() >= deadline:
+                        break
+            finally:
+                run["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+                run["cursor"] = self._cursor
+                self._record(run)
+
+            if run["entries_reclaimed"]:
+                logger.debug(
+                    f"Expiry sweep reclaimed {run['entries_reclaimed']} entries "
+                    f"({run['bytes_freed']} bytes) in {run['elapsed_ms']} ms"
+                )
+            return dict(run)
+
+    def _record(self, run: Dict[str, Any]) -> None:
+        """Add a run to the cumulative metrics and persist them."""
+        self._totals["runs"] += 1
+        self._totals["passes_completed"] += int(run["pass_completed"])
+        for name in ("slices", "entries_scanned", "entries_reclaimed", "bytes_freed"):
+            self._totals[name] += run[name]
+        self._totals["sweep_time_ms"] = round(self._totals["sweep_time_ms"] + run["elapsed_ms"], 3)
+        self._last_run = dict(run, finished_at=time.time())
+        self._save_state()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the cumulative sweep metrics.
+
+        Returns:
+            Dictionary with the counters, total sweep time, current cursor,
+            last run and whether the background thread is running
+        """
+        with self._run_lock:
+            return {
+                **self._totals,
+                "cursor": self._cursor,
+                "last_run": dict(self._last_run),
+                "background": self._thread is not None and self._thread.is_alive(),
+            }
+
+    def start(self, interval: float, budget_ms: float = DEFAULT_BUDGET_MS) -> None:
+        """
+        Run a budgeted sweep every ``interval`` seconds on a daemon thread.
+
+        Args:
+            interval: Seconds between runs
+            budget_ms: Time budget of each run in milliseconds
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            args=(interval, budget_ms),
+            name="cache-expiry-sweeper",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread, if running."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _loop(self, interval: float, budget_ms: float) -> None:
+        while not self._stop_event.wait(interval):
+            try:
+                self.run(budget_ms)
+            except Exception as e:
+                logger.warning(f"Background expiry sweep failed: {e}")
+
+    def _load_state(self) -> None:
+        """Load the cursor and metrics saved by the previous run, if any."""
+        if self.state_file is None:
+            return
+        try:
+            state = json.loads(Path(self.state_file).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable expiry sweep state {self.state_file}: {e}")
+            return
+
+        if not isinstance(state, dict):
+            return
+        self._cursor = state.get("cursor")
+        for name in _COUNTERS:
+            self._totals[name] = int(state.get(name, 0))
+        self._totals["sweep_time_ms"] = float(state.get("sweep_time_ms", 0.0))
+        self._last_run = state.get("last_run") or {}
+
+    def _save_state(self) -> None:
+        """Atomically persist the cursor and metrics."""
+        if self.state_file is None:
+            return
+        state_file = Path(self.state_file)
+        temp_file = state_file.with_name(state_file.name + ".tmp")
+        state = {**self._totals, "cursor": self._cursor, "last_run": self._last_run}
+        try:
+            temp_file.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(temp_file, state_file)
+        except OSError as e:
+            logger.warning(f"Failed to save expiry sweep state: {e}")
@@ -11,8 +11,16 @@ import os
 from typing import Any, Dict, Optional, Union
 
 from ..aws_clients.manager import AWSClientManager
-from .config import AdvancedCacheConfig
+from .adaptive_ttl import DEFAULT_ADAPTIVE_TTL_MAX, DEFAULT_ADAPTIVE_TTL_MIN
+from .config import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    DEFAULT_EXPIRY_SWEEP_INTERVAL,
+    DEFAULT_HARD_TTL,
+    DEFAULT_WRITE_BEHIND_QUEUE_SIZE,
+    AdvancedCacheConfig,
+)
 from .manager import CacheManager
+from .memory_tier import DEFAULT_MAX_ENTRIES, DEFAULT_MAX_SIZE_MB
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +145,23 @@ def get_profile_cache_config(profile_name: str) -> AdvancedCacheConfig:
             "encryption_enabled": cache_section.get("encryption_enabled", False),
             "encryption_type": cache_section.get("encryption_type", "none"),
             "hybrid_local_ttl": cache_section.get("hybrid_local_ttl", 300),
+            "memory_max_entries": cache_section.get("memory_max_entries", DEFAULT_MAX_ENTRIES),
+            "memory_max_size_mb": cache_section.get("memory_max_size_mb", DEFAULT_MAX_SIZE_MB),
+            "stale_while_revalidate": cache_section.get("stale_while_revalidate", False),
+            "hard_ttl": cache_section.get("hard_ttl", DEFAULT_HARD_TTL),
+            "compression_threshold": cache_section.get(
+                "compression_threshold", DEFAULT_COMPRESSION_THRESHOLD
+            ),
+            "expiry_sweep_interval": cache_section.get(
+                "expiry_sweep_interval", DEFAULT_EXPIRY_SWEEP_INTERVAL
+            ),
+            "write_behind_queue_size": cache_section.get(
+                "write_behind_queue_size", DEFAULT_WRITE_BEHIND_QUEUE_SIZE
+            ),
+            "coherence_journal": cache_section.get("coherence_journal", True),
+            "adaptive_ttl": cache_section.get("adaptive_ttl", False),
+            "adaptive_ttl_min": cache_section.get("adaptive_ttl_min", DEFAULT_ADAPTIVE_TTL_MIN),
+            "adaptive_ttl_max": cache_section.get("adaptive_ttl_max", DEFAULT_ADAPTIVE_TTL_MAX),
         }
 
         # If profile-specific config exists, merge it with base config
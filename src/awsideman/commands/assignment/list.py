@@ -28,6 +28,9 @@ from ..common import (
 )
 from .helpers import console, resolve_permission_set_info, resolve_principal_info
 
+# Accounts queried concurrently when listing assignments across the organization
+MAX_ACCOUNT_WORKERS = 25
+
 config = Config()
 
 
@@ -123,6 +126,9 @@ def list_assignments(
         console.print("[red]Error: Limit must be a positive integer.[/red]")
         raise typer.Exit(1)
 
+    # Size the shared client connection pools for the account fan-out below
+    aws_client.ensure_concurrency(MAX_ACCOUNT_WORKERS)
+
     # Get SSO admin client
     try:
         sso_admin_client = aws_client.get_sso_admin_client()
@@ -374,7 +380,9 @@ def list_assignments(
                     start_time = time.time()
 
                     # Use ThreadPoolExecutor for parallel processing
-                    max_workers = min(25, total_accounts)  # Limit concurrent requests
+                    max_workers = min(
+                        MAX_ACCOUNT_WORKERS, total_accounts
+                    )  # Limit concurrent requests
                     with ThreadPoolExecutor(max_workers=max_workers) as executor:
                         # Submit all accounts for processing
                         future_to_account: Dict[Any, Dict[str, Any]] = {
@@ -417,6 +425,14 @@ def list_assignments(
                             f"[green]Completed processing {total_accounts} accounts in {total_time:.1f}s "
                             f"({total_accounts/total_time:.1f} accounts/sec)[/green]"
                         )
+                    if verbose:
+                        pool_stats = aws_client.get_client_pool_stats()
+                        if isinstance(pool_stats, dict) and pool_stats.get("waits"):
+                            console.print(
+                                f"[dim]Waited {pool_stats['wait_seconds_total']:.2f}s for AWS "
+                                f"connections in {pool_stats['waits']} requests "
+                                f"(pool size {pool_stats['max_connections']})[/dim]"
+                            )
                 except Exception as e:
                     console.print(
                         f"[yellow]Warning: Unable to access AWS Organizations. Cannot search across all accounts. Error: {str(e)}[/yellow]"
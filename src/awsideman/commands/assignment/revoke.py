@@ -17,6 +17,7 @@ from ...bulk.performance_optimizer import (
 )
 from ...bulk.resolver import ResourceResolver
 from ...commands.permission_set.helpers import resolve_permission_set_identifier
+from ...utils.account_filter import AccountFilter, is_compound_filter_expression
 from ...utils.config import Config
 from ...utils.error_handler import handle_aws_error
 from ...utils.validators import validate_profile, validate_sso_instance
@@ -60,6 +61,22 @@ def _get_all_accounts(aws_client: AWSClientManager) -> list:
         raise
 
 
+def _get_accounts_by_compound_filter(aws_client: AWSClientManager, account_filter: str) -> list:
+    """Get active accounts matching every term of a compound filter."""
+    try:
+        filter_obj = AccountFilter(
+            filter_expression=account_filter,
+            organizations_client=aws_client.get_organizations_client(),
+        )
+        return [account for account in filter_obj.resolve_accounts() if account.status == "ACTIVE"]
+    except ValueError as e:
+        console.print(f"[red]Error: Invalid account filter: {str(e)}[/red]")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Error getting accounts by filter: {str(e)}[/red]")
+        raise
+
+
 def _get_accounts_by_tag(aws_client: AWSClientManager, tag_key: str, tag_value: str) -> list:
     """Get accounts by tag filter."""
     try:
@@ -112,7 +129,7 @@ def revoke_permission_set(
     account_filter: Optional[str] = typer.Option(
         None,
         "--filter",
-        help="Account filter for multi-account revocation (* for all accounts, or tag:Key=Value for tag-based filtering)",
+        help="Account filter for multi-account revocation (* for all accounts, tag:Key=Value for tag-based filtering, or terms such as 'tag:env=prod ou:Root/Workloads name:*payments*' that must all match)",
     ),
     accounts: Optional[str] = typer.Option(
         None, "--accounts", help="Comma-separated list of account IDs for multi-account revocation"
@@ -359,6 +376,9 @@ def revoke_multi_account_with_filter(
         if account_filter == "*":
             # Get all accounts from AWS Organizations
             accounts = _get_all_accounts(aws_client)
+        elif is_compound_filter_expression(account_filter):
+            # Combined tag:, ou: and name: terms are answered from the account index
+            accounts = _get_accounts_by_compound_filter(aws_client, account_filter)
         elif account_filter.startswith("tag:"):
             # Parse tag filter (format: tag:Key=Value)
             tag_parts = account_filter[4:].split("=", 1)
@@ -371,7 +391,7 @@ def revoke_multi_account_with_filter(
         else:
             console.print(f"[red]Error: Unsupported account filter format: {account_filter}[/red]")
             console.print(
-                "[yellow]Supported formats: '*' for all accounts, 'tag:Key=Value' for tag-based filtering[/yellow]"
+                "[yellow]Supported formats: '*' for all accounts, 'tag:Key=Value' for tag-based filtering, or 'tag:', 'ou:' and 'name:' terms combined[/yellow]"
             )
             raise typer.Exit(1)
 
@@ -265,8 +265,14 @@ def create_backup(
         console.print(f"[blue]Using configured SSO instance: {instance_arn}[/blue]")
         console.print(f"[blue]Identity Store ID: {identity_store_id}[/blue]")
 
-        # Create the IdentityCenterCollector with the profile-specific instance
-        collector = IdentityCenterCollector(client_manager=aws_client, instance_arn=instance_arn)
+        # Create the IdentityCenterCollector with the profile-specific instance; the
+        # asyncio clients let it collect resources with concurrent requests
+        async_client_manager = aws_client.get_async_client_manager()
+        collector = IdentityCenterCollector(
+            client_manager=aws_client,
+            instance_arn=instance_arn,
+            async_client_manager=async_client_manager,
+        )
 
         # Get the current AWS account ID
         try:
@@ -296,7 +302,9 @@ def create_backup(
             task = progress.add_task("Creating backup...", total=None)
 
             # Execute backup
-            backup_result = asyncio.run(backup_manager.create_backup(options=backup_options))
+            backup_result = asyncio.run(
+                async_client_manager.run(backup_manager.create_backup(options=backup_options))
+            )
 
             progress.update(task, description="Backup completed successfully!")
 
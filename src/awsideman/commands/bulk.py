@@ -271,7 +271,8 @@ def bulk_assign(
             # Create resource resolver
             resolver = ResourceResolver(aws_client, instance_arn, identity_store_id)
 
-            # Cache will populate naturally as needed during resolution
+            # Load persisted resolutions for the whole file with one cache read
+            resolver.prefetch_cached_resolutions(assignments)
 
             # Resolve all assignments
             resolved_assignments = []
@@ -616,7 +617,8 @@ def bulk_revoke(
             # Create resource resolver
             resolver = ResourceResolver(aws_client, instance_arn, identity_store_id)
 
-            # Cache will populate naturally as needed during resolution
+            # Load persisted resolutions for the whole file with one cache read
+            resolver.prefetch_cached_resolutions(assignments)
 
             # Resolve all assignments
             resolved_assignments = []
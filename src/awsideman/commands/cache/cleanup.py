@@ -1,6 +1,6 @@
 """Cache cleanup command for awsideman."""
 
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 
@@ -17,6 +17,12 @@ def cleanup_expired(
     no_cache: bool = advanced_cache_option(),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
     force: bool = typer.Option(False, "--force", "-f", help="Force cleanup without confirmation"),
+    budget_ms: Optional[int] = typer.Option(
+        None,
+        "--budget-ms",
+        min=1,
+        help="Sweep incrementally for about this many milliseconds, resuming where the last run stopped",
+    ),
 ) -> None:
     """Clean up expired cache files from the filesystem.
 
@@ -24,11 +30,15 @@ def cleanup_expired(
     cache performance. It's safe to run and will only remove files that have
     exceeded their TTL (Time To Live).
 
+    With --budget-ms the cleanup runs as an incremental sweep that stops once
+    the time budget is spent; the next run continues from the same position.
+
     Examples:
         awsideman cache cleanup expired
         awsideman cache cleanup expired --profile production
         awsideman cache cleanup expired --force
         awsideman cache cleanup expired --verbose
+        awsideman cache cleanup expired --force --budget-ms 200
     """
     try:
         # Extract and process standard command parameters
@@ -78,6 +88,10 @@ def cleanup_expired(
 
         console.print("[blue]Starting cache cleanup...[/blue]")
 
+        if budget_ms is not None:
+            _run_budgeted_sweep(cache_manager, budget_ms, verbose)
+            return
+
         # Clean up expired files
         removed_files = cache_manager.cleanup_expired_files()
 
@@ -113,6 +127,37 @@ def cleanup_expired(
         raise typer.Exit(1)
 
 
+def _run_budgeted_sweep(cache_manager: Any, budget_ms: int, verbose: bool) -> None:
+    """Run one incremental expiry sweep and report what it reclaimed."""
+    run = cache_manager.sweep_expired(budget_ms=budget_ms)
+    if "error" in run:
+        raise RuntimeError(run["error"])
+
+    reclaimed = run.get("entries_reclaimed", 0)
+    if reclaimed > 0:
+        console.print(
+            f"[green]✓ Reclaimed {reclaimed} expired cache entries "
+            f"({run.get('bytes_freed', 0)} bytes) in {run.get('elapsed_ms', 0)} ms[/green]"
+        )
+    else:
+        console.print("[blue]No expired cache entries found in this sweep.[/blue]")
+
+    if not run.get("pass_completed", True):
+        console.print(
+            f"[dim]Time budget spent after {run.get('entries_scanned', 0)} entries; "
+            "the next run resumes from here.[/dim]"
+        )
+
+    sweeper = cache_manager.get_expiry_sweeper()
+    if verbose and sweeper is not None:
+        totals = sweeper.stats()
+        console.print("[blue]Expiry sweeper totals:[/blue]")
+        console.print(f"  Runs: {totals['runs']} ({totals['passes_completed']} full passes)")
+        console.print(f"  Entries reclaimed: {totals['entries_reclaimed']}")
+        console.print(f"  Bytes freed: {totals['bytes_freed']}")
+        console.print(f"  Sweep time: {totals['sweep_time_ms']} ms")
+
+
 @app.command("all")
 def cleanup_all(
     profile: Optional[str] = profile_option(),
@@ -207,7 +207,7 @@ def get_cache_config_summary(config: AdvancedCacheConfig) -> Dict[str, Any]:
                 "dynamodb_profile": config.dynamodb_profile or "default",
             }
         )
-    elif config.backend_type == "file":
+    elif config.backend_type in ("file", "segment", "sqlite"):
         summary.update({"file_cache_dir": config.file_cache_dir or "default"})
     elif config.backend_type == "hybrid":
         summary.update(
@@ -35,7 +35,7 @@ def _display_backend_configuration(cache_manager: Any, actual_config: Any = None
                     console.print(
                         f"[green]DynamoDB Profile:[/green] {actual_config.dynamodb_profile}"
                     )
-            elif backend_type == "file":
+            elif backend_type in ("file", "segment", "sqlite"):
                 if actual_config.file_cache_dir:
                     console.print(
                         f"[green]File Cache Directory:[/green] {actual_config.file_cache_dir}"
@@ -149,6 +149,18 @@ def _display_cache_statistics(stats: dict, cache_manager: Any = None) -> None:
                 f"[green]Total Size:[/green] {stats['total_size_mb']} MB ({stats['total_size_bytes']} bytes)"
             )
 
+        # Display compression accounting of file-based tiers
+        if stats.get("compression"):
+            _display_compression_statistics(stats["compression"])
+
+        # Display the hybrid write-behind queue
+        if stats.get("write_behind"):
+            _display_write_behind_statistics(stats["write_behind"])
+
+        # Display the TTLs chosen by the adaptive TTL policy
+        if stats.get("adaptive_ttl"):
+            _display_adaptive_ttl_statistics(stats["adaptive_ttl"])
+
         # Display cache size management information
         if cache_manager and hasattr(cache_manager, "get_cache_size_info"):
             try:
@@ -185,6 +197,122 @@ def _display_cache_statistics(stats: dict, cache_manager: Any = None) -> None:
         console.print(f"[yellow]Cache Statistics:[/yellow] Unable to retrieve ({e})")
 
 
+def _display_compression_statistics(compression: dict) -> None:
+    """Display compressed and uncompressed byte totals and compression time."""
+    threshold = compression.get("threshold_bytes", 0)
+    codec = compression.get("codec")
+    if not codec or not threshold:
+        console.print("[green]Compression:[/green] Disabled")
+    else:
+        console.print(f"[green]Compression:[/green] {codec} above {threshold} bytes")
+
+    compressed_entries = compression.get("compressed_entries", 0)
+    console.print(f"[green]Compressed Entries:[/green] {compressed_entries}")
+    if compression.get("incompressible_entries"):
+        console.print(
+            f"[green]Incompressible Entries:[/green] {compression['incompressible_entries']}"
+        )
+    if compressed_entries:
+        console.print(
+            f"[green]Uncompressed Size:[/green] {compression.get('uncompressed_bytes', 0)} bytes"
+        )
+        ratio = compression.get("compression_ratio")
+        ratio_display = f" ({ratio * 100:.1f}% of original)" if ratio is not None else ""
+        console.print(
+            f"[green]Compressed Size:[/green] {compression.get('compressed_bytes', 0)} bytes{ratio_display}"
+        )
+    console.print(f"[green]Compression Time:[/green] {compression.get('compress_time_ms', 0)} ms")
+
+
+def _display_write_behind_statistics(write_behind: dict) -> None:
+    """Display write-behind queue depth, flush counters and flush latency."""
+    console.print(
+        f"[green]Write-Behind Queue:[/green] {write_behind.get('queue_depth', 0)}"
+        f"/{write_behind.get('capacity', 0)} pending "
+        f"(peak {write_behind.get('max_queue_depth', 0)})"
+    )
+    console.print(
+        f"[green]Write-Behind Flushed:[/green] {write_behind.get('flushed', 0)} entries in "
+        f"{write_behind.get('flushes', 0)} flushes"
+    )
+    latency = write_behind.get("flush_latency_ms", {})
+    console.print(
+        f"[green]Flush Latency:[/green] avg {latency.get('avg', 0)} ms, "
+        f"max {latency.get('max', 0)} ms"
+    )
+    if write_behind.get("failed"):
+        console.print(f"[yellow]Failed Remote Writes:[/yellow] {write_behind['failed']}")
+    if write_behind.get("sync_fallbacks"):
+        console.print(
+            f"[yellow]Backpressure Synchronous Writes:[/yellow] {write_behind['sync_fallbacks']}"
+        )
+
+
+def _display_adaptive_ttl_statistics(adaptive_ttl: dict) -> None:
+    """Display the learned TTL and refresh change ratio per operation."""
+    console.print(
+        f"[green]Adaptive TTL:[/green] {adaptive_ttl.get('min_ttl', 0)}"
+        f"-{adaptive_ttl.get('max_ttl', 0)} seconds"
+    )
+    for operation, family in adaptive_ttl.get("families", {}).items():
+        change_ratio = family.get("change_ratio")
+        changes = (
+            f"{family.get('changed', 0)}/{family.get('refreshes', 0)} refreshes changed"
+            if change_ratio is not None
+            else "no refreshes yet"
+        )
+        console.print(
+            f"  [green]{operation}:[/green] {family.get('ttl', 0)}s "
+            f"(configured {family.get('base_ttl', 0)}s, {changes})"
+        )
+
+
+def _display_operation_metrics(metrics: dict) -> None:
+    """Display hit ratio, latency percentiles and payload size per operation and tier."""
+    console.print("\n[bold blue]Operation Metrics[/bold blue]")
+    operations = metrics.get("operations", {})
+    if not operations:
+        console.print("[yellow]No cache operations recorded in this process[/yellow]")
+        return
+
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Operation", style="cyan")
+    table.add_column("Tier", style="magenta")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Hit Ratio", justify="right")
+    table.add_column("Hit p50/p99 ms", justify="right")
+    table.add_column("Miss p50/p99 ms", justify="right")
+    table.add_column("Fill p50/p99 ms", justify="right")
+    table.add_column("Avg Payload", justify="right")
+
+    def percentiles(histogram: dict) -> str:
+        if not histogram.get("count"):
+            return "-"
+        return f"{histogram['p50']:g}/{histogram['p99']:g}"
+
+    for operation, tiers in operations.items():
+        for tier, data in tiers.items():
+            latency = data.get("latency_ms", {})
+            payload = data.get("payload_bytes", {})
+            hit_ratio = data.get("hit_ratio")
+            table.add_row(
+                operation,
+                tier,
+                str(data.get("hits", 0)),
+                str(data.get("misses", 0)),
+                f"{hit_ratio * 100:.1f}%" if hit_ratio is not None else "-",
+                percentiles(latency.get("hit", {})),
+                percentiles(latency.get("miss", {})),
+                percentiles(latency.get("fill", {})),
+                f"{payload['avg']:.0f} B" if payload.get("count") else "-",
+            )
+
+    console.print(table)
+
+
 def _display_backend_statistics(cache_manager: Any) -> None:
     """Display backend-specific statistics and health status."""
     try:
@@ -288,6 +416,15 @@ def cache_status(
     region: Optional[str] = region_option(),
     no_cache: bool = advanced_cache_option(),
     verbose: bool = verbose_option(),
+    detailed: bool = typer.Option(
+        False,
+        "--detailed",
+        "-d",
+        help="Show per-operation hit ratio, latency and payload size for each cache tier",
+    ),
+    metrics_json: Optional[str] = typer.Option(
+        None, "--metrics-json", help="Write per-operation cache metrics to this JSON file"
+    ),
 ) -> None:
     """Display internal data storage status and statistics.
 
@@ -297,6 +434,7 @@ def cache_status(
     - Number of stored entries and total storage size
     - Backend-specific statistics and health status
     - Recent entries with expiration times
+    - With --detailed, latency and payload histograms per operation and tier
     """
     try:
         # Extract and process standard command parameters
@@ -427,6 +565,16 @@ def cache_status(
         # Display recent storage entries
         _display_recent_cache_entries(cache_manager)
 
+        # Display and export per-operation histograms
+        if (detailed or metrics_json) and hasattr(cache_manager, "get_metrics"):
+            metrics = cache_manager.get_metrics()
+            if detailed:
+                _display_operation_metrics(metrics)
+            if metrics_json:
+                with open(metrics_json, "w", encoding="utf-8") as f:
+                    json.dump(metrics, f, indent=2, sort_keys=True)
+                console.print(f"[green]Cache metrics written to {metrics_json}[/green]")
+
     except Exception as e:
         console.print(f"[red]Error getting cache status: {e}[/red]")
         raise typer.Exit(1)
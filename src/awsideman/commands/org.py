@@ -8,7 +8,11 @@ from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 
-from ..aws_clients.manager import build_organization_hierarchy, get_account_details
+from ..aws_clients.manager import (
+    DEFAULT_HIERARCHY_CONCURRENCY,
+    build_organization_hierarchy,
+    get_account_details,
+)
 from ..utils.config import Config
 from ..utils.models import NodeType, OrgNode
 from .common import (
@@ -72,6 +76,15 @@ def tree(
         False, "--flat", help="Display in flat format instead of tree format"
     ),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    concurrency: int = typer.Option(
+        DEFAULT_HIERARCHY_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        help="Maximum number of OUs whose children are fetched at once",
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Rebuild the hierarchy instead of loading the saved snapshot"
+    ),
     profile: Optional[str] = profile_option(),
     region: Optional[str] = region_option(),
     no_cache: bool = advanced_cache_option(),
@@ -114,7 +127,9 @@ def tree(
         # Build the organization hierarchy
         if not json_output:
             console.print("[blue]Building organization hierarchy...[/blue]")
-        organization_tree = build_organization_hierarchy(organizations_client)
+        organization_tree = build_organization_hierarchy(
+            organizations_client, max_concurrency=concurrency, refresh=refresh
+        )
 
         # Output based on format requested
         if json_output:
@@ -284,7 +299,7 @@ def search(
 
 @app.command("trace-policies")
 def trace_policies(
-    account_id: str = typer.Argument(..., help="AWS account ID to trace policies for"),
+    account_ids: List[str] = typer.Argument(..., help="AWS account IDs to trace policies for"),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
     profile: Optional[str] = profile_option(),
     region: Optional[str] = region_option(),
@@ -296,6 +311,9 @@ def trace_policies(
     Resolves the full OU path and collects all attached policies from each level.
     Displays policy names, IDs, attachment points, and effective status.
     Distinguishes between SCPs and RCPs in the output.
+
+    Several account IDs can be given; the policies of the OUs and root they
+    share are then looked up only once.
     """
     try:
         # Extract and process standard command parameters
@@ -304,11 +322,12 @@ def trace_policies(
         )
 
         # Validate account ID format (12-digit number)
-        if not _is_valid_account_id(account_id):
-            console.print(
-                f"[red]Error: Invalid account ID format '{account_id}'. Account ID must be a 12-digit number.[/red]"
-            )
-            raise typer.Exit(1)
+        for account_id in account_ids:
+            if not _is_valid_account_id(account_id):
+                console.print(
+                    f"[red]Error: Invalid account ID format '{account_id}'. Account ID must be a 12-digit number.[/red]"
+                )
+                raise typer.Exit(1)
 
         # Get AWS client manager with cache integration
         client_manager = get_aws_client_manager(
@@ -338,17 +357,33 @@ def trace_policies(
 
         policy_resolver = PolicyResolver(organizations_client)
 
-        # Trace policies for the account
+        # Trace policies for a single account
+        if len(account_ids) == 1:
+            account_id = account_ids[0]
+            if not json_output:
+                console.print(f"[blue]Tracing policies for account {account_id}...[/blue]")
+
+            policies = policy_resolver.resolve_policies_for_account(account_id)
+
+            # Output results
+            if json_output:
+                _output_policies_json(policies, account_id)
+            else:
+                _output_policies_table(policies, account_id)
+            return
+
+        # Trace policies for several accounts, sharing the lookups of common OUs
         if not json_output:
-            console.print(f"[blue]Tracing policies for account {account_id}...[/blue]")
+            console.print(f"[blue]Tracing policies for {len(account_ids)} accounts...[/blue]")
 
-        policies = policy_resolver.resolve_policies_for_account(account_id)
+        policies_by_account = policy_resolver.resolve_policies_for_accounts(account_ids)
 
-        # Output results
         if json_output:
-            _output_policies_json(policies, account_id)
+            _output_account_policies_json(policies_by_account)
         else:
-            _output_policies_table(policies, account_id)
+            for account_id, policies in policies_by_account.items():
+                _output_policies_table(policies, account_id)
+                console.print()
 
     except Exception as e:
         handle_aws_error(e, "tracing policies", verbose=verbose)
@@ -357,17 +392,7 @@ def trace_policies(
 
 def _output_tree_json(organization_tree: List[OrgNode]) -> None:
     """Output the organization tree in JSON format."""
-
-    def node_to_dict(node: OrgNode) -> Dict[str, Any]:
-        """Convert an OrgNode to a dictionary for JSON serialization."""
-        return {
-            "id": node.id,
-            "name": node.name,
-            "type": node.type.value,
-            "children": [node_to_dict(child) for child in node.children],
-        }
-
-    tree_data = [node_to_dict(root) for root in organization_tree]
+    tree_data = [root.to_dict() for root in organization_tree]
     console.print(json.dumps(tree_data, indent=2))
 
 
@@ -500,6 +525,9 @@ def _get_all_accounts_with_pagination(organizations_client: Any) -> List[Dict[st
     """
     Get all accounts using list_accounts API with proper pagination handling.
 
+    The accounts come from an AccountCatalog, whose list_accounts call follows
+    NextToken across all pages.
+
     Args:
         organizations_client: OrganizationsClient instance for API calls
 
@@ -509,34 +537,10 @@ def _get_all_accounts_with_pagination(organizations_client: Any) -> List[Dict[st
     Raises:
         ClientError: If AWS API calls fail
     """
-    all_accounts = []
-    next_token = None
+    from ..aws_clients.account_catalog import AccountCatalog
 
     try:
-        while True:
-            # Prepare parameters for the API call
-            params: Dict[str, Any] = {}
-            if next_token:
-                params["NextToken"] = next_token
-
-            # Make the API call
-            if params:
-                # If we have pagination parameters, we need to call the underlying client directly
-                # since our wrapper might not support NextToken
-                response = organizations_client.client.list_accounts(**params)
-            else:
-                response = organizations_client.list_accounts()
-
-            # Extract accounts from response
-            accounts = response.get("Accounts", [])
-            all_accounts.extend(accounts)
-
-            # Check if there are more pages
-            next_token = response.get("NextToken")
-            if not next_token:
-                break
-
-        return all_accounts
+        return AccountCatalog(organizations_client).accounts
 
     except Exception as e:
         console.print(f"[red]Error: Failed to get all accounts with pagination: {str(e)}[/red]")
@@ -736,8 +740,8 @@ def _output_search_results_table(matching_accounts: List, query: str) -> None:
     console.print(f"\n[green]Found {len(matching_accounts)} account(s) matching '{query}'[/green]")
 
 
-def _output_policies_json(policies: List, account_id: str) -> None:
-    """Output policy trace results in JSON format."""
+def _policy_trace_to_dict(policies: List, account_id: str) -> Dict[str, Any]:
+    """Convert the policy trace of one account to a JSON-serializable dictionary."""
     policies_data = []
 
     for policy in policies:
@@ -753,9 +757,21 @@ def _output_policies_json(policies: List, account_id: str) -> None:
         }
         policies_data.append(policy_dict)
 
-    result = {"account_id": account_id, "policies": policies_data}
+    return {"account_id": account_id, "policies": policies_data}
+
 
-    console.print(json.dumps(result, indent=2))
+def _output_policies_json(policies: List, account_id: str) -> None:
+    """Output policy trace results in JSON format."""
+    console.print(json.dumps(_policy_trace_to_dict(policies, account_id), indent=2))
+
+
+def _output_account_policies_json(policies_by_account: Dict[str, List]) -> None:
+    """Output policy trace results of several accounts in JSON format."""
+    results = [
+        _policy_trace_to_dict(policies, account_id)
+        for account_id, policies in policies_by_account.items()
+    ]
+    console.print(json.dumps(results, indent=2))
 
 
 def _output_policies_table(policies: List, account_id: str) -> None:
@@ -179,9 +179,10 @@ def preview_restore(
             profile=profile_name, region=profile_data.get("region")
         )
 
-        # Get the required clients
-        identity_center_client = aws_client_manager.get_identity_center_client()
-        identity_store_client = aws_client_manager.get_identity_store_client()
+        # RestoreManager awaits its client calls, so it gets the asyncio clients
+        async_client_manager = aws_client_manager.get_async_client_manager()
+        identity_center_client = async_client_manager.get_identity_center_client()
+        identity_store_client = async_client_manager.get_identity_store_client()
 
         # Initialize components
         storage_engine = StorageEngine(backend=storage_backend_obj)
@@ -234,10 +235,12 @@ def preview_restore(
                 else:
                     # Use the local restore manager for validation
                     compatibility_result = asyncio.run(
-                        restore_manager.validate_compatibility(
-                            backup_id=backup_id,
-                            target_instance_arn=target_instance_arn
-                            or backup_data.metadata.instance_arn,
+                        async_client_manager.run(
+                            restore_manager.validate_compatibility(
+                                backup_id=backup_id,
+                                target_instance_arn=target_instance_arn
+                                or backup_data.metadata.instance_arn,
+                            )
                         )
                     )
 
@@ -299,8 +302,10 @@ def preview_restore(
 
             try:
                 restore_result = asyncio.run(
-                    operation_restore_manager.restore_backup(
-                        backup_id=backup_id, options=restore_options
+                    async_client_manager.run(
+                        operation_restore_manager.restore_backup(
+                            backup_id=backup_id, options=restore_options
+                        )
                     )
                 )
                 progress.update(task, description="Preview generated!")
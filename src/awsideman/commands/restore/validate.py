@@ -120,9 +120,10 @@ def validate_restore(
             profile=profile_name, region=profile_data.get("region")
         )
 
-        # Get the required clients
-        identity_center_client = aws_client_manager.get_identity_center_client()
-        identity_store_client = aws_client_manager.get_identity_store_client()
+        # RestoreManager awaits its client calls, so it gets the asyncio clients
+        async_client_manager = aws_client_manager.get_async_client_manager()
+        identity_center_client = async_client_manager.get_identity_center_client()
+        identity_store_client = async_client_manager.get_identity_store_client()
 
         # Initialize components
         storage_engine = StorageEngine(backend=storage_backend_obj)
@@ -171,10 +172,12 @@ def validate_restore(
             try:
                 # Use the RestoreManager's validate_compatibility method
                 compatibility_result = asyncio.run(
-                    restore_manager.validate_compatibility(
-                        backup_id=backup_id,
-                        target_instance_arn=target_instance_arn
-                        or backup_data.metadata.instance_arn,
+                    async_client_manager.run(
+                        restore_manager.validate_compatibility(
+                            backup_id=backup_id,
+                            target_instance_arn=target_instance_arn
+                            or backup_data.metadata.instance_arn,
+                        )
                     )
                 )
                 progress.update(task, description="Validation completed!")
@@ -213,11 +213,16 @@ def cleanup_orphaned(
                 progress_text.plain = message
 
             # Initialize the orphaned assignment detector with progress callback
-            detector = OrphanedAssignmentDetector(aws_client, progress_callback=update_progress)
+            async_client_manager = aws_client.get_async_client_manager()
+            detector = OrphanedAssignmentDetector(
+                aws_client,
+                progress_callback=update_progress,
+                async_client_manager=async_client_manager,
+            )
 
             with Live(progress_text, console=console, refresh_per_second=2):
                 # Detect orphaned assignments
-                result = asyncio.run(detector.check_status())
+                result = asyncio.run(async_client_manager.run(detector.check_status()))
 
             # Save results to cache for potential reuse
             cache_file = _save_detection_results(profile_name, result)
@@ -78,14 +78,36 @@ class AESEncryption(EncryptionProvider):
         Raises:
             EncryptionError: If encryption fails
         """
+        return self._encrypt(data, raw=False)
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt an already serialized payload without a JSON pass.
+
+        Args:
+            data: Bytes to encrypt
+
+        Returns:
+            Encrypted data as bytes (IV + encrypted_data)
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        return self._encrypt(data, raw=True)
+
+    def _encrypt(self, data: Any, raw: bool) -> bytes:
+        """Encrypt a JSON-serializable value, or raw bytes when raw is set."""
         key_addr = None
         json_bytes_array = None
         padded_data_array = None
 
         try:
-            # Serialize data to JSON with datetime support
-            json_str = json.dumps(data, cls=DateTimeEncoder, separators=(",", ":"))
-            json_bytes = json_str.encode("utf-8")
+            if raw:
+                json_bytes = bytes(data)
+            else:
+                # Serialize data to JSON with datetime support
+                json_str = json.dumps(data, cls=DateTimeEncoder, separators=(",", ":"))
+                json_bytes = json_str.encode("utf-8")
 
             # Create mutable copy for secure handling
             json_bytes_array = bytearray(json_bytes)
@@ -172,6 +194,25 @@ class AESEncryption(EncryptionProvider):
         Raises:
             EncryptionError: If decryption fails
         """
+        return self._decrypt(encrypted_data, raw=False)
+
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Decrypt a payload encrypted with encrypt_bytes without a JSON pass.
+
+        Args:
+            encrypted_data: Encrypted data as bytes (IV + encrypted_data)
+
+        Returns:
+            Original plaintext bytes
+
+        Raises:
+            EncryptionError: If decryption fails
+        """
+        return self._decrypt(encrypted_data, raw=True)
+
+    def _decrypt(self, encrypted_data: bytes, raw: bool) -> Any:
+        """Decrypt to a JSON-decoded value, or to raw bytes when raw is set."""
         key_addr = None
         padded_data_array = None
         json_bytes_array = None
@@ -221,9 +262,12 @@ class AESEncryption(EncryptionProvider):
             # Create mutable copy for secure handling
             json_bytes_array = bytearray(json_bytes)
 
-            # Deserialize JSON with datetime support
-            json_str = json_bytes.decode("utf-8")
-            result = json.loads(json_str, object_hook=datetime_decoder)
+            if raw:
+                result = json_bytes
+            else:
+                # Deserialize JSON with datetime support
+                json_str = json_bytes.decode("utf-8")
+                result = json.loads(json_str, object_hook=datetime_decoder)
 
             # Log successful decryption
             logger.security_event(
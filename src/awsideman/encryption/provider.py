@@ -1,5 +1,6 @@
 """Encryption provider interface and implementations for cache data encryption."""
 
+import base64
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -48,6 +49,50 @@ class EncryptionProvider(ABC):
         """
         pass
 
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt an already serialized payload.
+
+        Cache backends store entries that are already serialized; encrypting the
+        bytes directly avoids a deserialize/JSON round trip. The default
+        implementation wraps the bytes in base64 and goes through encrypt();
+        providers override it to encrypt the bytes as they are.
+
+        Args:
+            data: Bytes to encrypt
+
+        Returns:
+            Encrypted data as bytes
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        return self.encrypt(base64.b64encode(data).decode("ascii"))
+
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Decrypt a payload produced by encrypt_bytes().
+
+        Args:
+            encrypted_data: Encrypted data as bytes
+
+        Returns:
+            Original plaintext bytes
+
+        Raises:
+            EncryptionError: If decryption fails
+        """
+        try:
+            return base64.b64decode(self.decrypt(encrypted_data), validate=True)
+        except EncryptionError:
+            raise
+        except (TypeError, ValueError) as e:
+            raise EncryptionError(
+                f"Failed to decode decrypted payload: {e}",
+                encryption_type=self.get_encryption_type(),
+                original_error=e,
+            )
+
     @abstractmethod
     def get_encryption_type(self) -> str:
         """
@@ -182,6 +227,30 @@ class NoEncryption(EncryptionProvider):
                 original_error=e,
             )
 
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Return the payload unchanged.
+
+        Args:
+            data: Bytes to store
+
+        Returns:
+            The same bytes
+        """
+        return bytes(data)
+
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Return the payload unchanged.
+
+        Args:
+            encrypted_data: Stored bytes
+
+        Returns:
+            The same bytes
+        """
+        return bytes(encrypted_data)
+
     def get_encryption_type(self) -> str:
         """
         Get the encryption type identifier.
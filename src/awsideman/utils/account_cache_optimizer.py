@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from ..aws_clients.manager import OrganizationsClientWrapper, get_account_details
+from ..aws_clients.manager import OrganizationsClientWrapper
 from ..cache.manager import CacheManager
 from .account_filter import AccountInfo
 
@@ -35,6 +35,7 @@ class OrganizationSnapshot:
     total_count: int
     cached_at: datetime
     cache_key: str
+    tags_loaded: bool = True
 
 
 class AccountCacheOptimizer:
@@ -62,6 +63,7 @@ class AccountCacheOptimizer:
         organizations_client: Optional[OrganizationsClientWrapper],
         cache_manager: Optional[CacheManager] = None,
         profile: Optional[str] = None,
+        account_catalog: Optional[Any] = None,
     ):
         """
         Initialize the account cache optimizer.
@@ -70,6 +72,7 @@ class AccountCacheOptimizer:
             organizations_client: Organizations client for API calls (can be None for cache-only operations)
             cache_manager: Optional unified cache manager instance
             profile: AWS profile name for profile-specific caching
+            account_catalog: Optional AccountCatalog to share with the caller
         """
         self.organizations_client = organizations_client
         self.cache_manager = cache_manager or CacheManager()
@@ -78,8 +81,20 @@ class AccountCacheOptimizer:
         # Make cache keys profile-specific
         self.org_snapshot_key = f"{self.ORG_SNAPSHOT_KEY}_{self.profile}"
         self.account_count_key = f"{self.ACCOUNT_COUNT_KEY}_{self.profile}"
+        self._account_catalog = account_catalog
 
-    def get_all_accounts_optimized(self) -> List[AccountInfo]:
+    @property
+    def account_catalog(self) -> Any:
+        """Get the AccountCatalog used for fresh account data."""
+        if self._account_catalog is None:
+            from ..aws_clients.account_catalog import AccountCatalog
+
+            if self.organizations_client is None:
+                raise ValueError("Organizations client is not available")
+            self._account_catalog = AccountCatalog(self.organizations_client)
+        return self._account_catalog
+
+    def get_all_accounts_optimized(self, include_tags: bool = False) -> List[AccountInfo]:
         """
         Get all accounts in the organization using optimized caching.
 
@@ -89,6 +104,10 @@ class AccountCacheOptimizer:
         3. If count is same, try to rebuild from individual account cache
         4. Otherwise, fetch fresh data and cache it
 
+        Args:
+            include_tags: Make sure the accounts carry their tags, fetching them
+                if the snapshot was saved without
+
         Returns:
             List of AccountInfo objects for all accounts
         """
@@ -100,6 +119,9 @@ class AccountCacheOptimizer:
             logger.info(
                 f"Using cached organization snapshot with {len(cached_snapshot.accounts)} accounts"
             )
+            if include_tags and not cached_snapshot.tags_loaded:
+                self._load_snapshot_tags(cached_snapshot.accounts)
+                self._cache_org_snapshot(cached_snapshot.accounts, tags_loaded=True)
             return cached_snapshot.accounts
 
         # Check current account count vs cached count
@@ -122,10 +144,10 @@ class AccountCacheOptimizer:
 
         # Need to fetch fresh data
         logger.info("Fetching fresh account data from AWS APIs")
-        fresh_accounts = self._fetch_all_accounts_fresh()
+        fresh_accounts = self._fetch_all_accounts_fresh(include_tags=include_tags)
 
         # Cache the results
-        self._cache_org_snapshot(fresh_accounts)
+        self._cache_org_snapshot(fresh_accounts, tags_loaded=include_tags)
         self._cache_account_count(len(fresh_accounts))
 
         logger.info(f"Successfully cached {len(fresh_accounts)} accounts")
@@ -165,13 +187,22 @@ class AccountCacheOptimizer:
                 total_count=cached_data["total_count"],
                 cached_at=datetime.fromisoformat(cached_data["cached_at"]),
                 cache_key=self.org_snapshot_key,
+                # Snapshots written before tags became optional always had them
+                tags_loaded=cached_data.get("tags_loaded", True),
             )
 
         except Exception as e:
             logger.warning(f"Failed to retrieve organization snapshot from cache: {e}")
             return None
 
-    def _cache_org_snapshot(self, accounts: List[AccountInfo]) -> None:
+    def _load_snapshot_tags(self, accounts: List[AccountInfo]) -> None:
+        """Fetch the tags of snapshot accounts concurrently and attach them."""
+        catalog = self.account_catalog
+        catalog.load_tags([account.account_id for account in accounts])
+        for account in accounts:
+            account.tags = dict(catalog.get_tags(account.account_id))
+
+    def _cache_org_snapshot(self, accounts: List[AccountInfo], tags_loaded: bool = True) -> None:
         """Cache the organization snapshot."""
         try:
             # Convert AccountInfo objects to serializable format
@@ -192,6 +223,7 @@ class AccountCacheOptimizer:
                 "accounts": serializable_accounts,
                 "total_count": len(accounts),
                 "cached_at": datetime.now().isoformat(),
+                "tags_loaded": tags_loaded,
             }
 
             self.cache_manager.set(
@@ -206,25 +238,9 @@ class AccountCacheOptimizer:
             logger.warning(f"Failed to cache organization snapshot: {e}")
 
     def _get_current_account_count(self) -> int:
-        """Get current account count from AWS (with caching)."""
+        """Get current account count from AWS with a single list_accounts call."""
         try:
-            # This is a lightweight operation that just counts accounts
-            # without fetching full details
-            from ..aws_clients.manager import build_organization_hierarchy
-
-            if self.organizations_client is None:
-                raise ValueError("Organizations client is not available")
-            organization_tree = build_organization_hierarchy(self.organizations_client)
-
-            def count_accounts_in_tree(nodes):
-                count = 0
-                for node in nodes:
-                    if node.is_account():
-                        count += 1
-                    count += count_accounts_in_tree(node.children)
-                return count
-
-            return int(count_accounts_in_tree(organization_tree))
+            return len(self.account_catalog)
 
         except Exception as e:
             logger.warning(f"Failed to get current account count: {e}")
@@ -267,53 +283,29 @@ class AccountCacheOptimizer:
             logger.warning(f"Failed to rebuild from individual cache: {e}")
             return None
 
-    def _fetch_all_accounts_fresh(self) -> List[AccountInfo]:
+    def _fetch_all_accounts_fresh(self, include_tags: bool = False) -> List[AccountInfo]:
         """
         Fetch all accounts fresh from AWS APIs.
 
-        This is the fallback method when cache is invalid or missing.
-        """
-        from ..aws_clients.manager import build_organization_hierarchy
+        This is the fallback method when cache is invalid or missing. Accounts
+        come from the account catalog: one list_accounts call plus the
+        organization hierarchy for OU paths.
 
+        Args:
+            include_tags: Fetch the tags of all accounts concurrently
+        """
         all_accounts = []
 
-        # Build the organization hierarchy to get all accounts
-        if self.organizations_client is None:
-            raise ValueError("Organizations client is not available")
-        organization_tree = build_organization_hierarchy(self.organizations_client)
-
-        # Collect all account IDs first
-        account_ids = []
-
-        def collect_account_ids(nodes):
-            for node in nodes:
-                if node.is_account():
-                    account_ids.append(node.id)
-                collect_account_ids(node.children)
-
-        collect_account_ids(organization_tree)
+        for account_details in self.account_catalog.get_all_account_details(
+            include_tags=include_tags
+        ):
+            account_info = AccountInfo.from_account_details(account_details)
+            all_accounts.append(account_info)
 
-        logger.debug(f"Found {len(account_ids)} accounts to fetch details for")
-
-        # Fetch account details for each account
-        for i, account_id in enumerate(account_ids):
-            try:
-                if i % 10 == 0:  # Log progress every 10 accounts
-                    logger.debug(f"Fetching account details: {i+1}/{len(account_ids)}")
-
-                if self.organizations_client is None:
-                    raise ValueError("Organizations client is not available")
-                account_details = get_account_details(self.organizations_client, account_id)
-                account_info = AccountInfo.from_account_details(account_details)
-                all_accounts.append(account_info)
-
-                # Also cache individual account for future use
-                self._cache_individual_account(account_info)
-
-            except Exception as e:
-                logger.warning(f"Failed to get details for account {account_id}: {e}")
-                continue
+            # Also cache individual account for future use
+            self._cache_individual_account(account_info)
 
+        logger.debug(f"Fetched details for {len(all_accounts)} accounts")
         return all_accounts
 
     def _cache_individual_account(self, account_info: AccountInfo) -> None:
@@ -1,12 +1,14 @@
 """Account filtering infrastructure for multi-account operations."""
 
+import fnmatch
 import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from ..aws_clients.manager import OrganizationsClientWrapper
+from .account_index import AccountIndex
 from .models import AccountDetails
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,30 @@ class FilterType(str, Enum):
     EXPLICIT = "EXPLICIT"
     OU = "OU"
     PATTERN = "PATTERN"
+    COMPOUND = "COMPOUND"
+
+
+# Terms of a compound filter expression such as "tag:env=prod ou:Root/Workloads name:*pay*"
+COMPOUND_TERM_PREFIXES = ("tag:", "ou:", "name:")
+_COMPOUND_TERM_SPLIT = re.compile(r"\s+(?=(?:tag|ou|name):)")
+
+
+def is_compound_filter_expression(filter_expression: Optional[str]) -> bool:
+    """
+    Check whether a filter expression combines several terms or uses ou:/name: terms.
+
+    Args:
+        filter_expression: Filter expression to check
+
+    Returns:
+        True if the expression is a compound filter, False otherwise
+    """
+    if not filter_expression or not filter_expression.strip():
+        return False
+    expression = filter_expression.strip()
+    return expression.startswith(("ou:", "name:")) or (
+        expression.startswith("tag:") and len(_COMPOUND_TERM_SPLIT.split(expression)) > 1
+    )
 
 
 @dataclass
@@ -101,6 +127,7 @@ class AccountFilter:
     Account filter for multi-account operations.
 
     Supports wildcard, tag-based, explicit account list, OU-based, and regex pattern filtering of AWS accounts.
+    A filter expression can also combine ``tag:``, ``ou:`` and ``name:`` terms, which must all match.
     """
 
     def __init__(
@@ -135,6 +162,23 @@ class AccountFilter:
         )
         self.filter_type = self._determine_filter_type()
         self.tag_filters = self._parse_tag_filters() if self.filter_type == FilterType.TAG else []
+        self.ou_path_term: Optional[str] = None
+        self.name_term: Optional[str] = None
+        if self.filter_type == FilterType.COMPOUND:
+            self._parse_compound_terms()
+        self._account_catalog: Optional[Any] = None
+        self._account_index: Optional[AccountIndex] = None
+
+    @property
+    def account_catalog(self) -> Any:
+        """Get the AccountCatalog shared by all lookups of this filter."""
+        if self._account_catalog is None:
+            from ..aws_clients.account_catalog import AccountCatalog
+
+            if self.organizations_client is None:
+                raise ValueError("Organizations client is not available")
+            self._account_catalog = AccountCatalog(self.organizations_client)
+        return self._account_catalog
 
     def _determine_filter_type(self) -> FilterType:
         """
@@ -151,6 +195,8 @@ class AccountFilter:
             return FilterType.PATTERN
         elif self.filter_expression == "*":
             return FilterType.WILDCARD
+        elif is_compound_filter_expression(self.filter_expression):
+            return FilterType.COMPOUND
         elif self.filter_expression and self.filter_expression.startswith("tag:"):
             return FilterType.TAG
         else:
@@ -175,8 +221,22 @@ class AccountFilter:
             return []
 
         # Remove "tag:" prefix
-        tag_part = self.filter_expression[4:] if self.filter_expression else ""
+        return self._parse_tag_expression(self.filter_expression[4:])
 
+    @staticmethod
+    def _parse_tag_expression(tag_part: str) -> List[Dict[str, str]]:
+        """
+        Parse the Key=Value[,Key2=Value2] part of a tag filter.
+
+        Args:
+            tag_part: Tag filter without the "tag:" prefix
+
+        Returns:
+            List of tag filter dictionaries with 'key' and 'value' keys
+
+        Raises:
+            ValueError: If tag filter format is invalid
+        """
         if not tag_part:
             raise ValueError("Tag filter expression cannot be empty after 'tag:' prefix")
 
@@ -210,6 +270,45 @@ class AccountFilter:
 
         return tag_filters
 
+    def _split_compound_terms(self) -> List[str]:
+        """Split the filter expression before each tag:, ou: or name: term."""
+        if not self.filter_expression:
+            return []
+        return [term for term in _COMPOUND_TERM_SPLIT.split(self.filter_expression) if term]
+
+    def _parse_compound_terms(self) -> None:
+        """
+        Parse the terms of a compound filter expression.
+
+        Tag terms are combined, while ou: and name: may each appear once.
+
+        Raises:
+            ValueError: If a term is malformed or repeated
+        """
+        self.tag_filters = []
+        self.ou_path_term = None
+        self.name_term = None
+
+        for term in self._split_compound_terms():
+            if not term.startswith(COMPOUND_TERM_PREFIXES):
+                raise ValueError(
+                    f"Invalid filter term: '{term}'. Expected tag:Key=Value, ou:Path or name:Pattern"
+                )
+            prefix, value = term.split(":", 1)
+            value = value.strip()
+            if prefix == "tag":
+                self.tag_filters.extend(self._parse_tag_expression(value))
+            elif not value:
+                raise ValueError(f"Filter term '{prefix}:' cannot be empty")
+            elif prefix == "ou":
+                if self.ou_path_term is not None:
+                    raise ValueError("Only one ou: term is allowed in a filter expression")
+                self.ou_path_term = value
+            else:
+                if self.name_term is not None:
+                    raise ValueError("Only one name: term is allowed in a filter expression")
+                self.name_term = value
+
     def validate_filter(self) -> List[ValidationError]:
         """
         Validate the filter expression and all filter options.
@@ -261,6 +360,8 @@ class AccountFilter:
             errors.extend(self._validate_tag_filter())
         elif self.filter_type == FilterType.WILDCARD:
             errors.extend(self._validate_wildcard_filter())
+        elif self.filter_type == FilterType.COMPOUND:
+            errors.extend(self._validate_compound_filter())
 
         return errors
 
@@ -378,6 +479,33 @@ class AccountFilter:
 
         return errors
 
+    def _validate_compound_filter(self) -> List[ValidationError]:
+        """Validate compound filter."""
+        errors = []
+
+        try:
+            self._parse_compound_terms()
+        except ValueError as e:
+            errors.append(
+                ValidationError(
+                    message=str(e), field="filter_expression", value=self.filter_expression
+                )
+            )
+            return errors
+
+        invalid_chars = ["<", ">", "|", "&", ";"]
+        for char in invalid_chars:
+            if self.ou_path_term and char in self.ou_path_term:
+                errors.append(
+                    ValidationError(
+                        message=f"OU filter contains invalid character: '{char}'",
+                        field="filter_expression",
+                        value=self.filter_expression,
+                    )
+                )
+
+        return errors
+
     def _validate_wildcard_filter(self) -> List[ValidationError]:
         """Validate wildcard filter."""
         errors = []
@@ -428,6 +556,16 @@ class AccountFilter:
             return f"Accounts in organizational unit: {self.ou_filter}"
         elif self.filter_type == FilterType.PATTERN:
             return f"Accounts matching pattern: {self.account_name_pattern}"
+        elif self.filter_type == FilterType.COMPOUND:
+            criteria = []
+            if self.tag_filters:
+                tags = ", ".join(f"{tag['key']}={tag['value']}" for tag in self.tag_filters)
+                criteria.append(f"tags {tags}")
+            if self.ou_path_term:
+                criteria.append(f"organizational unit {self.ou_path_term}")
+            if self.name_term:
+                criteria.append(f"name {self.name_term}")
+            return f"Accounts matching all of: {'; '.join(criteria)}"
 
     def resolve_accounts(self) -> List[AccountInfo]:
         """
@@ -456,6 +594,8 @@ class AccountFilter:
             return self._resolve_ou_filtered_accounts()
         elif self.filter_type == FilterType.PATTERN:
             return self._resolve_pattern_filtered_accounts()
+        elif self.filter_type == FilterType.COMPOUND:
+            return self._resolve_compound_accounts()
         else:
             raise ValueError(f"Unsupported filter type: {self.filter_type}")
 
@@ -494,6 +634,8 @@ class AccountFilter:
             yield from self._resolve_ou_filtered_accounts_streaming(chunk_size)
         elif self.filter_type == FilterType.PATTERN:
             yield from self._resolve_pattern_filtered_accounts_streaming(chunk_size)
+        elif self.filter_type == FilterType.COMPOUND:
+            yield from self._resolve_compound_accounts_streaming(chunk_size)
         else:
             raise ValueError(f"Unsupported filter type: {self.filter_type}")
 
@@ -518,8 +660,10 @@ class AccountFilter:
             profile = "default"
 
         # Use the optimized account cache for much better performance
-        optimizer = AccountCacheOptimizer(self.organizations_client, profile=profile)
-        return optimizer.get_all_accounts_optimized()
+        optimizer = AccountCacheOptimizer(
+            self.organizations_client, profile=profile, account_catalog=self.account_catalog
+        )
+        return optimizer.get_all_accounts_optimized(include_tags=bool(self.tag_filters))
 
     def _resolve_wildcard_accounts_streaming(
         self, chunk_size: int = 100
@@ -574,16 +718,8 @@ class AccountFilter:
         Returns:
             List of AccountInfo objects matching all tag filters
         """
-        # First get all accounts
-        all_accounts = self._resolve_wildcard_accounts()
-
-        # Filter by tags
-        filtered_accounts = []
-        for account in all_accounts:
-            if self._account_matches_all_tag_filters(account):
-                filtered_accounts.append(account)
-
-        return filtered_accounts
+        # Look the tags up in the inverted tag index
+        return self._get_account_index().query(tags=self._tag_filter_pairs())
 
     def _resolve_tag_filtered_accounts_streaming(
         self, chunk_size: int = 100
@@ -605,6 +741,71 @@ class AccountFilter:
             if self._account_matches_all_tag_filters(account):
                 yield account
 
+    def _resolve_compound_accounts(self) -> List[AccountInfo]:
+        """
+        Resolve accounts matching every term of a compound filter.
+
+        Each term is answered from the account index and the resulting sets
+        are intersected, so no account is compared against the filter.
+
+        Returns:
+            List of AccountInfo objects matching all terms
+        """
+        return self._get_account_index().query(
+            tags=self._tag_filter_pairs(),
+            ou_path=self.ou_path_term,
+            name_glob=self.name_term,
+        )
+
+    def _resolve_compound_accounts_streaming(
+        self, chunk_size: int = 100
+    ) -> Generator[AccountInfo, None, None]:
+        """
+        Resolve accounts matching every term of a compound filter using streaming.
+
+        Args:
+            chunk_size: Number of accounts to process in each chunk
+
+        Yields:
+            AccountInfo objects matching all terms
+        """
+        # Stream all accounts and check each term on-demand
+        for account in self._resolve_wildcard_accounts_streaming(chunk_size):
+            if self._account_matches_compound_filter(account):
+                yield account
+
+    def _account_matches_compound_filter(self, account: AccountInfo) -> bool:
+        """
+        Check if an account matches every term of a compound filter.
+
+        Args:
+            account: AccountInfo to check
+
+        Returns:
+            True if the account matches all terms, False otherwise
+        """
+        if not self._account_matches_all_tag_filters(account):
+            return False
+        if self.ou_path_term is not None:
+            account_ou_path = "/".join(account.ou_path)
+            if account_ou_path != self.ou_path_term and not account_ou_path.startswith(
+                self.ou_path_term + "/"
+            ):
+                return False
+        if self.name_term is not None:
+            return fnmatch.fnmatchcase(account.account_name.lower(), self.name_term.lower())
+        return True
+
+    def _get_account_index(self) -> AccountIndex:
+        """Get the index over all accounts, resolving them on first use."""
+        if self._account_index is None:
+            self._account_index = AccountIndex(self._resolve_wildcard_accounts())
+        return self._account_index
+
+    def _tag_filter_pairs(self) -> List[Tuple[str, str]]:
+        """Get the tag filters as (key, value) pairs."""
+        return [(tag_filter["key"], tag_filter["value"]) for tag_filter in self.tag_filters]
+
     def _resolve_explicit_accounts(self) -> List[AccountInfo]:
         """
         Resolve accounts from explicit account ID list.
@@ -623,9 +824,7 @@ class AccountFilter:
         for account_id in self.explicit_accounts:
             try:
                 # Get account details from Organizations API
-                if self.organizations_client is None:
-                    raise ValueError("Organizations client is not available")
-                account_data = self.organizations_client.describe_account(account_id)
+                account_data = self._get_explicit_account_data(account_id)
 
                 # Convert to AccountInfo
                 account_info = AccountInfo(
@@ -683,9 +882,7 @@ class AccountFilter:
             for account_id in chunk:
                 try:
                     # Get account details from Organizations API
-                    if self.organizations_client is None:
-                        raise ValueError("Organizations client is not available")
-                    account_data = self.organizations_client.describe_account(account_id)
+                    account_data = self._get_explicit_account_data(account_id)
 
                     # Convert to AccountInfo
                     account_info = AccountInfo(
@@ -713,6 +910,29 @@ class AccountFilter:
                     else:
                         raise ValueError(f"Failed to access account ID '{account_id}': {str(e)}")
 
+    def _get_explicit_account_data(self, account_id: str) -> Dict[str, Any]:
+        """
+        Get the account data of an explicitly listed account.
+
+        Accounts are read from the account catalog if it has already listed
+        the organization's accounts. Otherwise, and for accounts the catalog
+        does not list, they are looked up with describe_account, so that a few
+        explicit accounts do not cost a listing of the whole organization.
+
+        Args:
+            account_id: The unique identifier of the account
+
+        Returns:
+            Account data dictionary
+        """
+        if self.organizations_client is None:
+            raise ValueError("Organizations client is not available")
+        if self._account_catalog is not None and self._account_catalog.loaded:
+            account_data = self._account_catalog.get(account_id)
+            if account_data is not None:
+                return dict(account_data)
+        return self.organizations_client.describe_account(account_id)
+
     def _account_matches_all_tag_filters(self, account: AccountInfo) -> bool:
         """
         Check if an account matches all tag filters.
@@ -730,104 +950,29 @@ class AccountFilter:
 
     def _get_all_accounts_in_organization(self) -> List[Dict[str, Any]]:
         """
-        Get all accounts in the organization by traversing the hierarchy.
+        Get all accounts in the organization from the account catalog.
 
         Returns:
             List of account data dictionaries
         """
-        from ..aws_clients.manager import build_organization_hierarchy
-        from .models import OrgNode
-
-        all_accounts = []
-
-        # Build the organization hierarchy to get all accounts
-        if self.organizations_client is None:
-            raise ValueError("Organizations client is not available")
-        organization_tree = build_organization_hierarchy(self.organizations_client)
-
-        # Recursively collect all accounts from the tree
-        def collect_accounts_from_node(node: OrgNode) -> None:
-            """Recursively collect account data from organization tree."""
-            if node.is_account():
-                # For account nodes, we need to get the full account data
-                try:
-                    if self.organizations_client is None:
-                        raise ValueError("Organizations client is not available")
-                    account_data = self.organizations_client.describe_account(node.id)
-                    all_accounts.append(account_data)
-                except Exception as e:
-                    from rich.console import Console
-
-                    console = Console()
-                    console.print(
-                        f"[yellow]Warning: Could not get account data for {node.id}: {str(e)}[/yellow]"
-                    )
-
-            # Recursively process children
-            for child in node.children:
-                collect_accounts_from_node(child)
-
-        # Collect accounts from all root nodes
-        for root in organization_tree:
-            collect_accounts_from_node(root)
-
-        return all_accounts
+        return list(self.account_catalog.accounts)
 
     def _get_all_accounts_streaming(self) -> Generator[AccountInfo, None, None]:
         """
         Get all accounts in the organization using streaming with lazy evaluation.
 
-        This method uses generators to process accounts on-demand from the organization
-        hierarchy, providing memory efficiency for very large account sets.
+        Accounts come from the account catalog with OU paths from the
+        organization hierarchy. Tags are fetched, concurrently, only when the
+        filter matches on them.
 
         Yields:
             AccountInfo objects for all accounts in the organization
         """
-        from ..aws_clients.manager import build_organization_hierarchy
-        from .models import OrgNode
-
-        # Build the organization hierarchy to get all accounts
-        if self.organizations_client is None:
-            raise ValueError("Organizations client is not available")
-        organization_tree = build_organization_hierarchy(self.organizations_client)
-
-        # Recursively yield accounts from the tree using generators
-        def stream_accounts_from_node(node: OrgNode) -> Generator[AccountInfo, None, None]:
-            """Recursively stream account data from organization tree."""
-            if node.is_account():
-                # For account nodes, we need to get the full account data
-                try:
-                    if self.organizations_client is None:
-                        raise ValueError("Organizations client is not available")
-                    account_data = self.organizations_client.describe_account(node.id)
-
-                    # Convert to AccountInfo and yield immediately
-                    account_info = AccountInfo(
-                        account_id=account_data.get("Id", node.id),
-                        account_name=account_data.get("Name", f"Account-{node.id}"),
-                        email=account_data.get("Email", ""),
-                        status=account_data.get("Status", "UNKNOWN"),
-                        tags=account_data.get("Tags", {}),
-                        ou_path=getattr(node, "ou_path", []),
-                    )
-
-                    yield account_info
-
-                except Exception as e:
-                    from rich.console import Console
-
-                    console = Console()
-                    console.print(
-                        f"[yellow]Warning: Could not get account data for {node.id}: {str(e)}[/yellow]"
-                    )
-
-            # Recursively process children
-            for child in node.children:
-                yield from stream_accounts_from_node(child)
-
-        # Stream accounts from all root nodes
-        for root in organization_tree:
-            yield from stream_accounts_from_node(root)
+        include_tags = bool(self.tag_filters)
+        for account_details in self.account_catalog.get_all_account_details(
+            include_tags=include_tags
+        ):
+            yield AccountInfo.from_account_details(account_details)
 
     def _resolve_ou_filtered_accounts(self) -> List[AccountInfo]:
         """
@@ -836,24 +981,13 @@ class AccountFilter:
         Returns:
             List of AccountInfo objects in the specified OU path
         """
-        # First get all accounts
-        all_accounts = self._resolve_wildcard_accounts()
+        # First get all accounts, indexed by OU path prefix
+        account_index = self._get_account_index()
 
-        logger.info(f"OU Filter: Retrieved {len(all_accounts)} total accounts")
+        logger.info(f"OU Filter: Retrieved {len(account_index)} total accounts")
         logger.info(f"OU Filter: Looking for accounts matching OU path: '{self.ou_filter}'")
 
-        # Filter by OU path
-        filtered_accounts = []
-        for account in all_accounts:
-            if self._account_matches_ou_filter(account):
-                filtered_accounts.append(account)
-                logger.debug(
-                    f"OU Filter: Account {account.account_name} ({account.account_id}) matches OU path: {account.ou_path}"
-                )
-            else:
-                logger.debug(
-                    f"OU Filter: Account {account.account_name} ({account.account_id}) does not match OU path: {account.ou_path}"
-                )
+        filtered_accounts = account_index.query(ou_path=self.ou_filter)
 
         logger.info(
             f"OU Filter: Found {len(filtered_accounts)} accounts matching OU filter '{self.ou_filter}'"
@@ -884,16 +1018,15 @@ class AccountFilter:
         Returns:
             List of AccountInfo objects with names matching the pattern
         """
-        # First get all accounts
-        all_accounts = self._resolve_wildcard_accounts()
-
-        # Filter by account name pattern
-        filtered_accounts = []
-        for account in all_accounts:
-            if self._account_matches_pattern_filter(account):
-                filtered_accounts.append(account)
+        if not self.account_name_pattern:
+            return []
 
-        return filtered_accounts
+        # Match the pattern against the indexed account names
+        try:
+            return self._get_account_index().query(name_regex=self.account_name_pattern)
+        except re.error:
+            # If regex is invalid, nothing matches (should be caught in validation)
+            return []
 
     def _resolve_pattern_filtered_accounts_streaming(
         self, chunk_size: int = 100
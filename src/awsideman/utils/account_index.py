@@ -0,0 +1,249 @@
+"""In-memory indexes over the accounts of an organization.
+
+Account filters used to test every account against every filter term. The
+index is built once from a list of accounts and answers each term with a set
+of matching account IDs:
+
+- names: a trie of lowercased names for prefixes and a trigram index for
+  substrings and ``*`` globs
+- tags: an inverted index from tag key and key/value pair to accounts
+- OU paths: every ``Root/OU/...`` prefix of each account's path, plus every
+  single OU name on it
+
+Compound filters intersect these sets, smallest first, so only the accounts
+that satisfy every term are ever looked at.
+"""
+
+import fnmatch
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .account_filter import AccountInfo
+
+# Substrings are looked up by their character trigrams
+_GRAM_SIZE = 3
+
+
+class _NameTrie:
+    """Trie of names that keeps, at every node, the IDs of names through it."""
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_NameTrie"] = {}
+        self.ids: Set[str] = set()
+
+    def insert(self, name: str, account_id: str) -> None:
+        """Add a name for an account."""
+        node = self
+        node.ids.add(account_id)
+        for char in name:
+            node = node.children.setdefault(char, _NameTrie())
+            node.ids.add(account_id)
+
+    def ids_with_prefix(self, prefix: str) -> Set[str]:
+        """Get the IDs of accounts whose name starts with the prefix."""
+        node = self
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                return set()
+            node = child
+        return node.ids
+
+
+class AccountIndex:
+    """Name, tag and OU path indexes over a list of accounts."""
+
+    def __init__(self, accounts: Iterable["AccountInfo"]):
+        """
+        Build the indexes.
+
+        Args:
+            accounts: Accounts to index; query results keep their order
+        """
+        self._accounts: Dict[str, "AccountInfo"] = {}
+        self._names: Dict[str, str] = {}
+        self._name_trie = _NameTrie()
+        self._name_grams: Dict[str, Set[str]] = {}
+        self._tag_keys: Dict[str, Set[str]] = {}
+        self._tag_values: Dict[Tuple[str, str], Set[str]] = {}
+        self._ou_paths: Dict[str, Set[str]] = {}
+        self._ou_names: Dict[str, Set[str]] = {}
+
+        for account in accounts:
+            self._add(account)
+
+    def _add(self, account: "AccountInfo") -> None:
+        """Add one account to every index."""
+        account_id = account.account_id
+        if account_id in self._accounts:
+            return
+        self._accounts[account_id] = account
+
+        name = (account.account_name or "").lower()
+        self._names[account_id] = name
+        self._name_trie.insert(name, account_id)
+        for gram in self._grams(name):
+            self._name_grams.setdefault(gram, set()).add(account_id)
+
+        for key, value in (account.tags or {}).items():
+            self._tag_keys.setdefault(key, set()).add(account_id)
+            self._tag_values.setdefault((key, value), set()).add(account_id)
+
+        ou_path = account.ou_path or []
+        for depth in range(1, len(ou_path) + 1):
+            self._ou_paths.setdefault("/".join(ou_path[:depth]), set()).add(account_id)
+        for ou_name in ou_path:
+            self._ou_names.setdefault(ou_name, set()).add(account_id)
+
+    @staticmethod
+    def _grams(text: str) -> Set[str]:
+        """Get the distinct trigrams of a string."""
+        return {text[i : i + _GRAM_SIZE] for i in range(len(text) - _GRAM_SIZE + 1)}
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    @property
+    def all_ids(self) -> Set[str]:
+        """Get the IDs of all indexed accounts."""
+        return set(self._accounts)
+
+    def ids_with_name_prefix(self, prefix: str) -> Set[str]:
+        """Get the IDs of accounts whose name starts with the prefix (case-insensitive)."""
+        return set(self._name_trie.ids_with_prefix(prefix.lower()))
+
+    def ids_with_name_containing(self, substring: str) -> Set[str]:
+        """Get the IDs of accounts whose name contains the substring (case-insensitive)."""
+        substring = substring.lower()
+        if len(substring) < _GRAM_SIZE:
+            return {account_id for account_id, name in self._names.items() if substring in name}
+
+        candidates = self._intersect(
+            self._name_grams.get(gram, set()) for gram in self._grams(substring)
+        )
+        return {account_id for account_id in candidates if substring in self._names[account_id]}
+
+    def ids_matching_name_glob(self, pattern: str) -> Set[str]:
+        """
+        Get the IDs of accounts whose whole name matches a ``*`` glob (case-insensitive).
+
+        The literal parts of the pattern narrow the candidates through the
+        trie and the trigram index before the glob itself is checked.
+
+        Args:
+            pattern: Glob such as ``*payments*`` or ``prod-*``
+        """
+        pattern = pattern.lower()
+        # Character classes are not literal text, so they are only checked by the glob
+        literals = [] if "[" in pattern else [part for part in re.split(r"[*?]+", pattern) if part]
+        candidate_sets = [self.ids_with_name_containing(literal) for literal in literals]
+        if literals and pattern.startswith(literals[0]):
+            candidate_sets.append(self.ids_with_name_prefix(literals[0]))
+
+        candidates = self._intersect(candidate_sets) if candidate_sets else self.all_ids
+        return {
+            account_id
+            for account_id in candidates
+            if fnmatch.fnmatchcase(self._names[account_id], pattern)
+        }
+
+    def ids_matching_name_regex(
+        self, pattern: str, candidates: Optional[Set[str]] = None
+    ) -> Set[str]:
+        """
+        Get the IDs of accounts whose original-case name matches a regex.
+
+        Args:
+            pattern: Regular expression searched for in the name
+            candidates: Only test these accounts, all accounts if not given
+        """
+        regex = re.compile(pattern)
+        account_ids = self.all_ids if candidates is None else candidates
+        return {
+            account_id
+            for account_id in account_ids
+            if account_id in self._accounts
+            and regex.search(self._accounts[account_id].account_name)
+        }
+
+    def ids_with_tag(self, key: str, value: Optional[str] = None) -> Set[str]:
+        """Get the IDs of accounts that have a tag, optionally with a specific value."""
+        if value is None:
+            return set(self._tag_keys.get(key, set()))
+        return set(self._tag_values.get((key, value), set()))
+
+    def ids_with_tags(self, tags: Iterable[Tuple[str, str]]) -> Set[str]:
+        """Get the IDs of accounts that have all of the given (key, value) tags."""
+        return self._intersect(self.ids_with_tag(key, value) for key, value in tags)
+
+    def ids_in_ou_path(self, ou_path: str) -> Set[str]:
+        """
+        Get the IDs of accounts in an OU path or below it.
+
+        Args:
+            ou_path: Path from the root such as ``Root/Workloads``
+        """
+        return set(self._ou_paths.get(ou_path, set()))
+
+    def ids_in_ou(self, ou_name: str) -> Set[str]:
+        """Get the IDs of accounts with the given OU anywhere on their path."""
+        return set(self._ou_names.get(ou_name, set()))
+
+    def accounts(self, account_ids: Optional[Set[str]] = None) -> List["AccountInfo"]:
+        """
+        Get indexed accounts in their original order.
+
+        Args:
+            account_ids: Accounts to return, all accounts if not given
+        """
+        if account_ids is None:
+            return list(self._accounts.values())
+        return [
+            account for account_id, account in self._accounts.items() if account_id in account_ids
+        ]
+
+    def _intersect(self, id_sets: Iterable[Set[str]]) -> Set[str]:
+        """Intersect ID sets, starting from the smallest."""
+        ordered = sorted(id_sets, key=len)
+        if not ordered:
+            return self.all_ids
+        result = set(ordered[0])
+        for id_set in ordered[1:]:
+            if not result:
+                break
+            result &= id_set
+        return result
+
+    def query(
+        self,
+        tags: Optional[Iterable[Tuple[str, str]]] = None,
+        ou_path: Optional[str] = None,
+        name_glob: Optional[str] = None,
+        name_regex: Optional[str] = None,
+    ) -> List["AccountInfo"]:
+        """
+        Get the accounts that match every given criterion.
+
+        Args:
+            tags: (key, value) tags the account must all have
+            ou_path: OU path the account must be in or below
+            name_glob: Glob the whole account name must match (case-insensitive)
+            name_regex: Regular expression searched for in the account name
+
+        Returns:
+            Matching accounts in their original order
+        """
+        id_sets = []
+        tag_pairs = list(tags or [])
+        if tag_pairs:
+            id_sets.append(self.ids_with_tags(tag_pairs))
+        if ou_path is not None:
+            id_sets.append(self.ids_in_ou_path(ou_path))
+        if name_glob is not None:
+            id_sets.append(self.ids_matching_name_glob(name_glob))
+
+        matches = self._intersect(id_sets)
+        if name_regex is not None:
+            matches = self.ids_matching_name_regex(name_regex, matches)
+        return self.accounts(matches)
@@ -55,6 +55,25 @@ class OrgNode:
         """Check if this node is an account."""
         return self.type == NodeType.ACCOUNT
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert this node and its subtree to a JSON-serializable dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type.value,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrgNode":
+        """Create a node and its subtree from a dictionary produced by to_dict()."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            type=NodeType(data["type"]),
+            children=[cls.from_dict(child) for child in data.get("children", [])],
+        )
+
 
 @dataclass
 class AccountDetails:
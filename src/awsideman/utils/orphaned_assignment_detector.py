@@ -52,7 +52,7 @@ class OrphanedAssignmentDetector(BaseStatusChecker):
     Provides interactive cleanup functionality with user confirmation.
     """
 
-    def __init__(self, idc_client, config=None, progress_callback=None):
+    def __init__(self, idc_client, config=None, progress_callback=None, async_client_manager=None):
         """
         Initialize the orphaned assignment detector.
 
@@ -60,8 +60,11 @@ class OrphanedAssignmentDetector(BaseStatusChecker):
             idc_client: AWS Identity Center client wrapper
             config: Status check configuration
             progress_callback: Optional callback function for progress updates
+            async_client_manager: Optional AsyncAWSClientManager; when given, the
+                bulk scan issues its list calls concurrently without blocking the loop
         """
         super().__init__(idc_client, config)
+        self.async_client_manager = async_client_manager
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
         # Cache for assignment tracking
@@ -232,11 +235,20 @@ class OrphanedAssignmentDetector(BaseStatusChecker):
             # Get all accounts in the organization (for account names)
             all_accounts = {}
             try:
-                org_client = self.idc_client.get_organizations_client()
-                org_paginator = org_client.get_paginator("list_accounts")
-                for page in org_paginator.paginate():
-                    for account in page.get("Accounts", []):
-                        all_accounts[account["Id"]] = account.get("Name", account["Id"])
+                if self.async_client_manager is not None:
+                    accounts = await self.async_client_manager.paginate(
+                        "organizations", "list_accounts", "Accounts"
+                    )
+                else:
+                    org_client = self.idc_client.get_organizations_client()
+                    org_paginator = org_client.get_paginator("list_accounts")
+                    accounts = [
+                        account
+                        for page in org_paginator.paginate()
+                        for account in page.get("Accounts", [])
+                    ]
+                for account in accounts:
+                    all_accounts[account["Id"]] = account.get("Name", account["Id"])
 
                 self.logger.info(f"Found {len(all_accounts)} accounts in organization")
             except Exception as e:
@@ -254,18 +266,26 @@ class OrphanedAssignmentDetector(BaseStatusChecker):
                 all_permission_sets = []
                 next_token = None
 
-                while True:
-                    list_params = {"InstanceArn": instance_arn}
-                    if next_token:
-                        list_params["NextToken"] = next_token
-
-                    ps_response = client.list_permission_sets(**list_params)
-                    batch_permission_sets = ps_response.get("PermissionSets", [])
-                    all_permission_sets.extend(batch_permission_sets)
-
-                    next_token = ps_response.get("NextToken")
-                    if not next_token:
-                        break
+                if self.async_client_manager is not None:
+                    all_permission_sets = await self.async_client_manager.paginate(
+                        "sso-admin",
+                        "list_permission_sets",
+                        "PermissionSets",
+                        InstanceArn=instance_arn,
+                    )
+                else:
+                    while True:
+                        list_params = {"InstanceArn": instance_arn}
+                        if next_token:
+                            list_params["NextToken"] = next_token
+
+                        ps_response = client.list_permission_sets(**list_params)
+                        batch_permission_sets = ps_response.get("PermissionSets", [])
+                        all_permission_sets.extend(batch_permission_sets)
+
+                        next_token = ps_response.get("NextToken")
+                        if not next_token:
+                            break
 
                 self.logger.info(f"Found {len(all_permission_sets)} permission sets")
 
@@ -669,6 +689,9 @@ class OrphanedAssignmentDetector(BaseStatusChecker):
         principal_names_map = {}  # Maps principal_id to name
 
         try:
+            if self.async_client_manager is not None:
+                return await self._bulk_fetch_valid_principals_async(identity_store_id)
+
             # Bulk fetch all users
             self.logger.info("Fetching all users from identity store...")
             user_paginator = identity_store_client.get_paginator("list_users")
@@ -703,6 +726,32 @@ class OrphanedAssignmentDetector(BaseStatusChecker):
 
         return valid_user_ids, valid_group_ids, principal_names_map
 
+    async def _bulk_fetch_valid_principals_async(
+        self, identity_store_id: str
+    ) -> tuple[set, set, dict]:
+        """Fetch all users and groups concurrently with the asyncio clients."""
+        identity_store = self.async_client_manager.get_identity_store_client()
+        self.logger.info("Fetching all users and groups from identity store...")
+        users, groups = await asyncio.gather(
+            identity_store.paginate("list_users", "Users", IdentityStoreId=identity_store_id),
+            identity_store.paginate("list_groups", "Groups", IdentityStoreId=identity_store_id),
+        )
+
+        principal_names_map = {}
+        for user in users:
+            principal_names_map[user["UserId"]] = user.get("UserName") or user.get(
+                "DisplayName", user["UserId"]
+            )
+        for group in groups:
+            principal_names_map[group["GroupId"]] = group.get("DisplayName", group["GroupId"])
+
+        self.logger.info(f"Found {len(users)} users and {len(groups)} groups")
+        return (
+            {user["UserId"] for user in users},
+            {group["GroupId"] for group in groups},
+            principal_names_map,
+        )
+
     async def _bulk_fetch_all_assignments(
         self, client: Any, instance_arn: str, permission_sets: List[str], all_accounts: dict
     ) -> List[dict]:
@@ -720,59 +769,66 @@ class OrphanedAssignmentDetector(BaseStatusChecker):
         """
         all_assignments: List[Dict[str, Any]] = []
 
-        # Process permission sets in parallel batches
-        batch_size = 5  # Process 5 permission sets at a time
-        semaphore = asyncio.Semaphore(batch_size)
-
-        async def fetch_assignments_for_permission_set(ps_arn: str, ps_name: str) -> None:
+        # Bound the number of concurrent list calls; the asyncio clients can
+        # serve as many as their connection pool holds
+        limit = self.async_client_manager.max_concurrency if self.async_client_manager else 5
+        semaphore = asyncio.Semaphore(limit)
+
+        async def fetch_assignments(
+            ps_arn: str, ps_name: str, account_id: str, account_name: str
+        ) -> List[Dict[str, Any]]:
+            params = {
+                "InstanceArn": instance_arn,
+                "AccountId": account_id,
+                "PermissionSetArn": ps_arn,
+            }
             async with semaphore:
-                assignments_for_ps = []
-
-                # Get assignments for this permission set across all accounts
-                for account_id, account_name in all_accounts.items():
-                    try:
-                        # Get all assignments for this permission set and account
-                        assignments_response = client.list_account_assignments(
-                            InstanceArn=instance_arn, AccountId=account_id, PermissionSetArn=ps_arn
+                try:
+                    if self.async_client_manager is not None:
+                        assignments = await self.async_client_manager.paginate(
+                            "sso-admin", "list_account_assignments", "AccountAssignments", **params
                         )
+                    else:
+                        assignments = client.list_account_assignments(**params).get(
+                            "AccountAssignments", []
+                        )
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                    if error_code not in ["AccessDenied", "ResourceNotFound"]:
+                        self.logger.warning(
+                            f"Error fetching assignments for {ps_name} in {account_id}: {str(e)}"
+                        )
+                    return []
 
-                        for assignment in assignments_response.get("AccountAssignments", []):
-                            assignment_with_metadata = {
-                                **assignment,
-                                "permission_set_arn": ps_arn,
-                                "permission_set_name": ps_name,
-                                "account_id": account_id,
-                                "account_name": account_name,
-                            }
-                            assignments_for_ps.append(assignment_with_metadata)
-
-                    except ClientError as e:
-                        error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                        if error_code not in ["AccessDenied", "ResourceNotFound"]:
-                            self.logger.warning(
-                                f"Error fetching assignments for {ps_name} in {account_id}: {str(e)}"
-                            )
-
-                # assignments_for_ps is already added to all_assignments above
+            return [
+                {
+                    **assignment,
+                    "permission_set_arn": ps_arn,
+                    "permission_set_name": ps_name,
+                    "account_id": account_id,
+                    "account_name": account_name,
+                }
+                for assignment in assignments
+            ]
 
-        # Create tasks for all permission sets
+        # Create tasks for all permission set and account combinations
         tasks = []
         for ps_arn in permission_sets:
             ps_name = f"PermissionSet-{ps_arn.split('/')[-1]}"  # Simple name for now
-            task = fetch_assignments_for_permission_set(ps_arn, ps_name)
-            tasks.append(task)
+            for account_id, account_name in all_accounts.items():
+                tasks.append(fetch_assignments(ps_arn, ps_name, account_id, account_name))
 
         # Execute all tasks in parallel
         if tasks:
             self.logger.info(
-                f"Starting parallel assignment fetching for {len(tasks)} permission sets..."
+                f"Starting parallel assignment fetching for {len(permission_sets)} permission sets..."
             )
             results = await asyncio.gather(*tasks, return_exceptions=True)
             for result in results:
                 if isinstance(result, Exception):
                     self.logger.error(f"Error fetching assignments: {str(result)}")
                 elif result is not None:
-                    all_assignments.extend(result)  # type: ignore[arg-type]
+                    all_assignments.extend(result)
 
         self.logger.info(f"Fetched {len(all_assignments)} total assignments")
         return all_assignments
@@ -161,17 +161,11 @@ class SecureMemory:
         """
 
         try:
-            # Overwrite with random data first
-            for i in range(len(data)):
-                data[i] = secrets.randbits(8)
-
-            # Then overwrite with zeros
-            for i in range(len(data)):
-                data[i] = 0
-
-            # Force memory barrier to ensure writes complete
-            if os.name == "posix":
-                os.sync()
+            # Overwrite with random data first, then with zeros. Slice assignment
+            # writes the buffer in place in one pass instead of byte by byte.
+            length = len(data)
+            data[:] = secrets.token_bytes(length)
+            data[:] = bytes(length)
 
             logger.debug(f"Securely zeroed {len(data)} bytes of sensitive data")
 
@@ -0,0 +1,1092 @@
+"""Offline record/replay of the AWS APIs used by awsideman.
+
+AWSRecorder hooks into botocore's ``before-call`` and ``after-call`` events and
+captures the raw responses of the SSO Admin, Identity Store and Organizations
+calls made by a client or session into an AWSRecording, which is saved as JSON.
+
+AWSReplayer answers requests at botocore's ``before-send`` event, so requests
+are still serialized, signed, retried and parsed by botocore and still pass
+through the client pool's connection limit, but never reach the network.
+Responses come from a recording or from a SyntheticOrganization of any size.
+Per-operation latency and ThrottlingException rates can be injected, so the
+benchmarks in tests/performance show the effect of concurrency and caching.
+
+All three services use the AWS JSON protocol, so request parameters are read
+from the JSON request body and responses are replayed as JSON bodies.
+
+Usage:
+    # Capture a read-only sample of a real organization
+    python -m tests.fixtures.aws_replay record --profile prod --output org.json
+
+    # Replay it, or a synthetic organization, with 20 ms per call and 2% throttling
+    replayer = AWSReplayer(AWSRecording.load("org.json"), latency=0.02, throttle_rate=0.02)
+    replayer = AWSReplayer(SyntheticOrganization(accounts=5000), latency=0.02)
+    client_manager = replay_client_manager(replayer)
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+from src.awsideman.aws_clients.manager import AWSClientManager
+
+RECORDING_VERSION = 1
+
+# Services whose calls are recorded and replayed (botocore service IDs, hyphenized)
+DEFAULT_SERVICES = ("sso-admin", "identitystore", "organizations")
+
+# Request parameters that change between otherwise identical calls
+VOLATILE_PARAMS = ("ClientToken",)
+
+DEFAULT_REGION = "us-east-1"
+
+_REPLAY_KEY = "awsideman_replay_key"
+
+_RESPONSE_HEADERS = {"Content-Type": "application/x-amz-json-1.1"}
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed request has no recorded or synthetic response."""
+
+
+class SyntheticAPIError(Exception):
+    """An AWS error response returned by a synthetic organization."""
+
+    def __init__(self, code: str, message: str, status: int = 400):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+class _RawBody:
+    """Minimal urllib3-like body for a replayed response."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def stream(self, **kwargs: Any) -> Iterable[bytes]:
+        yield self._body
+
+
+class _AsyncRawBody:
+    """Minimal aiohttp-like body for a replayed response to an aiobotocore client."""
+
+    def __init__(self, body: bytes, headers: Dict[str, str]):
+        self._body = body
+        self.raw_headers = [
+            (key.encode("utf-8"), value.encode("utf-8")) for key, value in headers.items()
+        ]
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+def canonical_params(body: Any) -> str:
+    """
+    Get a stable representation of the parameters of a JSON protocol request.
+
+    Args:
+        body: JSON request body as bytes or str, or already decoded parameters
+
+    Returns:
+        Parameters as JSON with sorted keys and without volatile parameters
+    """
+    if isinstance(body, (bytes, bytearray)):
+        body = body.decode("utf-8")
+    if isinstance(body, str):
+        body = json.loads(body) if body.strip() else {}
+    params = {key: value for key, value in (body or {}).items() if key not in VOLATILE_PARAMS}
+    return json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+
+def _split_event_name(event_name: str) -> Tuple[str, str]:
+    """Get the service ID and operation name of an event like ``before-send.sso-admin.X``."""
+    parts = event_name.split(".")
+    return parts[1], parts[2]
+
+
+def _events_of(target: Any) -> Any:
+    """Get the event emitter of a botocore client or a boto3/aioboto3 session."""
+    meta = getattr(target, "meta", None)
+    if meta is not None and hasattr(meta, "events"):
+        return meta.events
+    return target.events
+
+
+def _is_asynchronous(target: Any) -> bool:
+    """Check whether a client or session belongs to aiobotocore."""
+    module = type(target).__module__
+    return module.startswith("aiobotocore") or module.startswith("aioboto3")
+
+
+class AWSRecording:
+    """Recorded responses keyed by service, operation and request parameters."""
+
+    def __init__(self) -> None:
+        self._responses: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        self._replay_positions: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    def add(self, service: str, operation: str, params: Any, status: int, body: bytes) -> None:
+        """
+        Add a response.
+
+        Args:
+            service: botocore service ID, e.g. ``sso-admin``
+            operation: API operation name, e.g. ``ListInstances``
+            params: Request parameters or JSON request body
+            status: HTTP status code of the response
+            body: Raw JSON response body
+        """
+        key = (service, operation, canonical_params(params))
+        with self._lock:
+            self._responses.setdefault(key, []).append(
+                {"status": status, "body": body.decode("utf-8") if body else ""}
+            )
+
+    def operations(self) -> Counter:
+        """Count the recorded responses of each ``service.Operation``."""
+        counts: Counter = Counter()
+        for (service, operation, _), responses in self._responses.items():
+            counts[f"{service}.{operation}"] += len(responses)
+        return counts
+
+    def respond(self, service: str, operation: str, params: Dict[str, Any]) -> Tuple[int, bytes]:
+        """
+        Get the recorded response to a request.
+
+        Repeated identical requests get the recorded responses in order, and
+        the last one once they are used up.
+
+        Raises:
+            ReplayMissError: If the request was not recorded
+        """
+        key = (service, operation, canonical_params(params))
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise ReplayMissError(
+                    f"No recorded response for {service}.{operation} with {key[2]}"
+                )
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            response = responses[min(position, len(responses) - 1)]
+        return response["status"], response["body"].encode("utf-8")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the recording as a JSON-serializable dictionary."""
+        return {
+            "version": RECORDING_VERSION,
+            "calls": [
+                {
+                    "service": service,
+                    "operation": operation,
+                    "params": json.loads(params),
+                    "responses": responses,
+                }
+                for (service, operation, params), responses in sorted(self._responses.items())
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AWSRecording":
+        """Create a recording from the dictionary written by to_dict."""
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('version')}")
+        recording = cls()
+        for call in data.get("calls", []):
+            key = (call["service"], call["operation"], canonical_params(call["params"]))
+            recording._responses[key] = list(call["responses"])
+        return recording
+
+    def save(self, path: str) -> None:
+        """Write the recording as JSON."""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+    @classmethod
+    def load(cls, path: str) -> "AWSRecording":
+        """Read a recording written by save."""
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+class AWSRecorder:
+    """Records the responses of real AWS calls into an AWSRecording."""
+
+    def __init__(
+        self,
+        recording: Optional[AWSRecording] = None,
+        services: Sequence[str] = DEFAULT_SERVICES,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            recording: Recording to add responses to, a new one if not given
+            services: botocore service IDs whose calls are recorded
+        """
+        self.recording = recording if recording is not None else AWSRecording()
+        self.services = set(services)
+
+    def attach(self, target: Any) -> None:
+        """
+        Record the calls made through a client or session.
+
+        Sessions must be attached before their clients are created.
+
+        Args:
+            target: botocore/aiobotocore client or boto3/aioboto3 session
+        """
+        events = _events_of(target)
+        events.register("before-call", self._before_call)
+        events.register("after-call", self._after_call)
+
+    def _before_call(self, params: Dict[str, Any], context: Dict[str, Any], **kwargs: Any) -> None:
+        """Remember the parameters of a call until its response arrives."""
+        service, operation = _split_event_name(kwargs["event_name"])
+        if service in self.services:
+            context[_REPLAY_KEY] = (service, operation, params.get("body") or b"")
+
+    def _after_call(self, http_response: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+        """Record the final response of a call, after any retries."""
+        key = context.pop(_REPLAY_KEY, None)
+        if key is None or http_response is None:
+            return
+        body = getattr(http_response, "_content", None)
+        if body is None:
+            body = http_response.content
+        service, operation, params = key
+        self.recording.add(service, operation, params, http_response.status_code, body)
+
+
+def _error_body(code: str, message: str) -> bytes:
+    """Build a JSON protocol error body."""
+    return json.dumps({"__type": code, "message": message}).encode("utf-8")
+
+
+class AWSReplayer:
+    """Serves AWS responses offline with simulated latency and throttling."""
+
+    def __init__(
+        self,
+        source: Union[AWSRecording, "SyntheticOrganization"],
+        latency: Union[float, Dict[str, float]] = 0.0,
+        throttle_rate: Union[float, Dict[str, float]] = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Initialize the replayer.
+
+        Latency and throttle rates are either one value for every operation or
+        a dictionary keyed by ``service.Operation``, ``Operation`` or ``*``,
+        looked up in that order.
+
+        Args:
+            source: Recording or synthetic organization that answers requests
+            latency: Seconds spent on each request attempt
+            throttle_rate: Fraction of request attempts answered with ThrottlingException
+            jitter: Latency varies uniformly by up to this fraction either way
+            seed: Seed of the latency jitter and the throttling decisions
+        """
+        self.source = source
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests: Counter = Counter()
+        self.throttled: Counter = Counter()
+
+    @staticmethod
+    def _lookup(setting: Union[float, Dict[str, float]], service: str, operation: str) -> float:
+        """Get the value of a per-operation setting."""
+        if not isinstance(setting, dict):
+            return float(setting)
+        for key in (f"{service}.{operation}", operation, "*"):
+            if key in setting:
+                return float(setting[key])
+        return 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of request attempts and throttled attempts per operation."""
+        with self._lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "throttled": sum(self.throttled.values()),
+                "operations": {
+                    operation: {"requests": count, "throttled": self.throttled[operation]}
+                    for operation, count in sorted(self.requests.items())
+                },
+            }
+
+    def attach(self, target: Any, asynchronous: Optional[bool] = None) -> None:
+        """
+        Answer the requests of a client or session.
+
+        The handler is registered last, so handlers registered on clients,
+        such as the client pool's connection limit, still see each attempt.
+        Sessions must be attached before their clients are created.
+
+        Args:
+            target: botocore/aiobotocore client or boto3/aioboto3 session
+            asynchronous: Whether the target is an aiobotocore client or session,
+                detected from its type if not given
+        """
+        if asynchronous is None:
+            asynchronous = _is_asynchronous(target)
+        handler = self._send_async if asynchronous else self._send
+        _events_of(target).register_last("before-send", handler)
+
+    def _respond(self, request: Any, event_name: str) -> Tuple[int, bytes, float]:
+        """Get the status, body and latency of the response to one request attempt."""
+        service, operation = _split_event_name(event_name)
+        name = f"{service}.{operation}"
+        latency = self._lookup(self.latency, service, operation)
+        throttle_rate = self._lookup(self.throttle_rate, service, operation)
+
+        with self._lock:
+            self.requests[name] += 1
+            if self.jitter and latency:
+                latency *= 1 + self._random.uniform(-self.jitter, self.jitter)
+            throttle = throttle_rate > 0 and self._random.random() < throttle_rate
+            if throttle:
+                self.throttled[name] += 1
+
+        if throttle:
+            return 400, _error_body("ThrottlingException", "Rate exceeded"), latency
+
+        params = json.loads(canonical_params(request.body))
+        if isinstance(self.source, AWSRecording):
+            status, body = self.source.respond(service, operation, params)
+        else:
+            try:
+                body = json.dumps(self.source.respond(service, operation, params)).encode("utf-8")
+                status = 200
+            except SyntheticAPIError as e:
+                status, body = e.status, _error_body(e.code, e.message)
+        return status, body, latency
+
+    def _send(self, request: Any, event_name: str, **kwargs: Any) -> AWSResponse:
+        """before-send handler for botocore clients."""
+        status, body, latency = self._respond(request, event_name)
+        if latency > 0:
+            time.sleep(latency)
+        return AWSResponse(request.url, status, dict(_RESPONSE_HEADERS), _RawBody(body))
+
+    def _send_async(self, request: Any, event_name: str, **kwargs: Any) -> Any:
+        """before-send handler for aiobotocore clients; returns an awaitable response."""
+        from aiobotocore.awsrequest import AioAWSResponse
+
+        status, body, latency = self._respond(request, event_name)
+
+        async def respond() -> Any:
+            if latency > 0:
+                await asyncio.sleep(latency)
+            return AioAWSResponse(
+                request.url,
+                status,
+                dict(_RESPONSE_HEADERS),
+                _AsyncRawBody(body, _RESPONSE_HEADERS),
+            )
+
+        return respond()
+
+
+def _epoch(index: int) -> float:
+    """Get a deterministic timestamp for the index-th synthetic resource."""
+    return 1_600_000_000.0 + index * 3600
+
+
+class SyntheticOrganization:
+    """
+    An in-memory organization and Identity Center instance of any size.
+
+    Answers the SSO Admin, Identity Store and Organizations operations used by
+    awsideman, with pagination. Account assignments and permission sets can be
+    created and deleted, so bulk and cloning runs work end to end. The content
+    is deterministic for a given seed.
+    """
+
+    INSTANCE_ARN = "arn:aws:sso:::instance/ssoins-0000000000000000"
+    IDENTITY_STORE_ID = "d-0000000000"
+    ROOT_ID = "r-0000"
+    MANAGEMENT_POLICY_ID = "p-FullAWSAccess"
+
+    def __init__(
+        self,
+        accounts: int = 100,
+        ou_depth: int = 2,
+        ous_per_parent: int = 3,
+        users: int = 100,
+        groups: int = 10,
+        permission_sets: int = 10,
+        assignments_per_account: int = 3,
+        page_size: int = 100,
+        seed: int = 0,
+    ):
+        """
+        Generate the organization.
+
+        Args:
+            accounts: Number of accounts, spread over the leaf OUs
+            ou_depth: Levels of OUs below the root
+            ous_per_parent: OUs under the root and under each non-leaf OU
+            users: Number of Identity Store users
+            groups: Number of Identity Store groups; each user is in one group
+            permission_sets: Number of permission sets
+            assignments_per_account: Account assignments per account, mostly to groups
+            page_size: Results per page when a request gives no MaxResults
+            seed: Seed of the generator
+        """
+        rng = random.Random(seed)
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+
+        # Organization hierarchy: OUs level by level, accounts round-robin over leaf OUs
+        self.ous: Dict[str, Dict[str, Any]] = {}
+        self.children: Dict[str, List[str]] = {self.ROOT_ID: []}
+        self.parents: Dict[str, Tuple[str, str]] = {}
+        level = [self.ROOT_ID]
+        for depth in range(ou_depth):
+            next_level = []
+            for parent_id in level:
+                for _ in range(ous_per_parent):
+                    ou_id = f"ou-0000-{len(self.ous):08x}"
+                    self.ous[ou_id] = {
+                        "Id": ou_id,
+                        "Arn": f"arn:aws:organizations::000000000000:ou/o-0000000000/{ou_id}",
+                        "Name": f"OU-{depth + 1}-{len(next_level)}",
+                    }
+                    self.children[ou_id] = []
+                    self.children[parent_id].append(ou_id)
+                    parent_type = "ROOT" if parent_id == self.ROOT_ID else "ORGANIZATIONAL_UNIT"
+                    self.parents[ou_id] = (parent_id, parent_type)
+                    next_level.append(ou_id)
+            level = next_level
+
+        environments = ["prod", "staging", "dev"]
+        self.accounts: Dict[str, Dict[str, Any]] = {}
+        self.account_ids: List[str] = []
+        self.tags: Dict[str, List[Dict[str, str]]] = {}
+        for index in range(accounts):
+            account_id = f"{100000000000 + index:012d}"
+            self.accounts[account_id] = {
+                "Id": account_id,
+                "Arn": f"arn:aws:organizations::000000000000:account/o-0000000000/{account_id}",
+                "Name": f"account-{index:05d}",
+                "Email": f"account-{index:05d}@example.com",
+                "Status": "ACTIVE",
+                "JoinedMethod": "CREATED",
+                "JoinedTimestamp": _epoch(index),
+            }
+            self.account_ids.append(account_id)
+            self.tags[account_id] = [
+                {"Key": "env", "Value": environments[index % len(environments)]},
+                {"Key": "team", "Value": f"team-{index % 7}"},
+            ]
+            parent_id = level[index % len(level)]
+            parent_type = "ROOT" if parent_id == self.ROOT_ID else "ORGANIZATIONAL_UNIT"
+            self.parents[account_id] = (parent_id, parent_type)
+
+        # Identity Store users and groups
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.memberships: Dict[str, List[Dict[str, Any]]] = {}
+        for index in range(groups):
+            group_id = f"{rng.getrandbits(32):08x}-0000-4000-8000-{index:012d}"
+            self.groups[group_id] = {
+                "GroupId": group_id,
+                "DisplayName": f"group-{index:04d}",
+                "Description": f"Synthetic group {index}",
+                "IdentityStoreId": self.IDENTITY_STORE_ID,
+            }
+            self.memberships[group_id] = []
+        group_ids = list(self.groups)
+        for index in range(users):
+            user_id = f"{rng.getrandbits(32):08x}-0000-4000-9000-{index:012d}"
+            user_name = f"user{index:05d}"
+            self.users[user_id] = {
+                "UserId": user_id,
+                "UserName": user_name,
+                "DisplayName": f"User {index}",
+                "Name": {"GivenName": "User", "FamilyName": str(index)},
+                "Emails": [{"Value": f"{user_name}@example.com", "Type": "work", "Primary": True}],
+                "IdentityStoreId": self.IDENTITY_STORE_ID,
+            }
+            if group_ids:
+                group_id = group_ids[index % len(group_ids)]
+                self.memberships[group_id].append(
+                    {
+                        "IdentityStoreId": self.IDENTITY_STORE_ID,
+                        "MembershipId": f"m-{index:012d}",
+                        "GroupId": group_id,
+                        "MemberId": {"UserId": user_id},
+                    }
+                )
+
+        # Permission sets and account assignments
+        self.permission_sets: Dict[str, Dict[str, Any]] = {}
+        self.managed_policies: Dict[str, List[Dict[str, str]]] = {}
+        self.inline_policies: Dict[str, str] = {}
+        for index in range(permission_sets):
+            self._add_permission_set(f"PermissionSet-{index:03d}", index)
+        self.assignments: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        permission_set_arns = list(self.permission_sets)
+        user_ids = list(self.users)
+        if permission_set_arns:
+            for account_id in self.account_ids:
+                for _ in range(assignments_per_account):
+                    if group_ids and (not user_ids or rng.random() < 0.8):
+                        principal = ("GROUP", rng.choice(group_ids))
+                    elif user_ids:
+                        principal = ("USER", rng.choice(user_ids))
+                    else:
+                        continue
+                    key = (account_id, rng.choice(permission_set_arns))
+                    self.assignments.setdefault(key, set()).add(principal)
+
+    def _add_permission_set(self, name: str, index: int, **attributes: Any) -> str:
+        """Add a permission set and get its ARN."""
+        arn = f"arn:aws:sso:::permissionSet/ssoins-0000000000000000/ps-{index:016x}"
+        self.permission_sets[arn] = {
+            "PermissionSetArn": arn,
+            "Name": name,
+            "Description": attributes.get("Description", f"Synthetic permission set {name}"),
+            "SessionDuration": attributes.get("SessionDuration", "PT1H"),
+            "CreatedDate": _epoch(index),
+        }
+        self.managed_policies[arn] = [
+            {"Name": "ReadOnlyAccess", "Arn": "arn:aws:iam::aws:policy/ReadOnlyAccess"}
+        ]
+        return arn
+
+    def _page(self, key: str, items: List[Any], params: Dict[str, Any]) -> Dict[str, Any]:
+        """Get one page of results, continuing after NextToken."""
+        start = int(params.get("NextToken") or 0)
+        size = int(params.get("MaxResults") or self.page_size)
+        response: Dict[str, Any] = {key: items[start : start + size]}
+        if start + size < len(items):
+            response["NextToken"] = str(start + size)
+        return response
+
+    def _get(self, collection: Dict[str, Any], resource_id: str, kind: str) -> Any:
+        """Get a resource or fail like AWS does for unknown IDs."""
+        if resource_id not in collection:
+            raise SyntheticAPIError("ResourceNotFoundException", f"{kind} {resource_id} not found")
+        return collection[resource_id]
+
+    def respond(self, service: str, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a request.
+
+        Args:
+            service: botocore service ID, e.g. ``sso-admin``
+            operation: API operation name, e.g. ``ListInstances``
+            params: Request parameters
+
+        Returns:
+            Response in the wire format of the JSON protocol
+
+        Raises:
+            SyntheticAPIError: For requests AWS would answer with an error
+            ReplayMissError: For operations the synthetic organization does not support
+        """
+        handler = getattr(self, f"_{service.replace('-', '_')}_{operation}", None)
+        if handler is None:
+            raise ReplayMissError(f"Synthetic organization does not support {service}.{operation}")
+        with self._lock:
+            return handler(params)
+
+    # Organizations
+
+    def _organizations_DescribeOrganization(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "Organization": {
+                "Id": "o-0000000000",
+                "MasterAccountId": self.account_ids[0] if self.account_ids else "000000000000",
+                "FeatureSet": "ALL",
+            }
+        }
+
+    def _organizations_ListRoots(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        root = {
+            "Id": self.ROOT_ID,
+            "Arn": f"arn:aws:organizations::000000000000:root/o-0000000000/{self.ROOT_ID}",
+            "Name": "Root",
+            "PolicyTypes": [{"Type": "SERVICE_CONTROL_POLICY", "Status": "ENABLED"}],
+        }
+        return self._page("Roots", [root], params)
+
+    def _organizations_ListAccounts(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._page("Accounts", list(self.accounts.values()), params)
+
+    def _organizations_ListOrganizationalUnitsForParent(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        child_ids = self._get(self.children, params["ParentId"], "Parent")
+        return self._page("OrganizationalUnits", [self.ous[ou_id] for ou_id in child_ids], params)
+
+    def _organizations_ListAccountsForParent(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        parent_id = params["ParentId"]
+        self._get(self.children, parent_id, "Parent")
+        accounts = [
+            account
+            for account_id, account in self.accounts.items()
+            if self.parents[account_id][0] == parent_id
+        ]
+        return self._page("Accounts", accounts, params)
+
+    def _organizations_ListParents(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        parent_id, parent_type = self._get(self.parents, params["ChildId"], "Child")
+        return self._page("Parents", [{"Id": parent_id, "Type": parent_type}], params)
+
+    def _organizations_DescribeAccount(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"Account": self._get(self.accounts, params["AccountId"], "Account")}
+
+    def _organizations_DescribeOrganizationalUnit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "OrganizationalUnit": self._get(
+                self.ous, params["OrganizationalUnitId"], "OrganizationalUnit"
+            )
+        }
+
+    def _organizations_ListTagsForResource(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._page("Tags", self.tags.get(params["ResourceId"], []), params)
+
+    def _organizations_ListPoliciesForTarget(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        policies = []
+        if params["TargetId"] == self.ROOT_ID and params["Filter"] == "SERVICE_CONTROL_POLICY":
+            policies.append(
+                {
+                    "Id": self.MANAGEMENT_POLICY_ID,
+                    "Arn": (
+                        "arn:aws:organizations::aws:policy/service_control_policy/"
+                        f"{self.MANAGEMENT_POLICY_ID}"
+                    ),
+                    "Name": "FullAWSAccess",
+                    "Description": "Allows access to every operation",
+                    "Type": "SERVICE_CONTROL_POLICY",
+                    "AwsManaged": True,
+                }
+            )
+        return self._page("Policies", policies, params)
+
+    # SSO Admin
+
+    def _sso_admin_ListInstances(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        instance = {
+            "InstanceArn": self.INSTANCE_ARN,
+            "IdentityStoreId": self.IDENTITY_STORE_ID,
+            "Name": "synthetic",
+            "Status": "ACTIVE",
+        }
+        return self._page("Instances", [instance], params)
+
+    def _sso_admin_ListPermissionSets(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._page("PermissionSets", list(self.permission_sets), params)
+
+    def _sso_admin_DescribePermissionSet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        arn = params["PermissionSetArn"]
+        return {"PermissionSet": self._get(self.permission_sets, arn, "PermissionSet")}
+
+    def _sso_admin_ListTagsForResource(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"Tags": []}
+
+    def _sso_admin_ListManagedPoliciesInPermissionSet(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        arn = params["PermissionSetArn"]
+        return self._page(
+            "AttachedManagedPolicies",
+            self._get(self.managed_policies, arn, "PermissionSet"),
+            params,
+        )
+
+    def _sso_admin_ListCustomerManagedPolicyReferencesInPermissionSet(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {"CustomerManagedPolicyReferences": []}
+
+    def _sso_admin_GetInlinePolicyForPermissionSet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"InlinePolicy": self.inline_policies.get(params["PermissionSetArn"], "")}
+
+    def _sso_admin_GetPermissionsBoundaryForPermissionSet(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        raise SyntheticAPIError("ResourceNotFoundException", "No permissions boundary")
+
+    def _sso_admin_ListAccountAssignments(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        account_id, arn = params["AccountId"], params["PermissionSetArn"]
+        assignments = [
+            {
+                "AccountId": account_id,
+                "PermissionSetArn": arn,
+                "PrincipalType": principal_type,
+                "PrincipalId": principal_id,
+            }
+            for principal_type, principal_id in sorted(self.assignments.get((account_id, arn), ()))
+        ]
+        return self._page("AccountAssignments", assignments, params)
+
+    def _sso_admin_ListAccountsForProvisionedPermissionSet(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        arn = params["PermissionSetArn"]
+        account_ids = sorted(
+            {
+                account_id
+                for (account_id, ps_arn), found in self.assignments.items()
+                if found and ps_arn == arn
+            }
+        )
+        return self._page("AccountIds", account_ids, params)
+
+    def _sso_admin_ListPermissionSetsProvisionedToAccount(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        account_id = params["AccountId"]
+        arns = sorted(
+            {
+                ps_arn
+                for (found_id, ps_arn), found in self.assignments.items()
+                if found and found_id == account_id
+            }
+        )
+        return self._page("PermissionSets", arns, params)
+
+    def _assignment_status(
+        self, params: Dict[str, Any], status: str = "SUCCEEDED"
+    ) -> Dict[str, Any]:
+        """Build the status of a completed assignment request."""
+        return {
+            "Status": status,
+            "RequestId": f"{next(self._request_ids):08x}-0000-4000-a000-000000000000",
+            "TargetId": params.get("TargetId"),
+            "TargetType": "AWS_ACCOUNT",
+            "PermissionSetArn": params.get("PermissionSetArn"),
+            "PrincipalType": params.get("PrincipalType"),
+            "PrincipalId": params.get("PrincipalId"),
+            "CreatedDate": time.time(),
+        }
+
+    def _sso_admin_CreateAccountAssignment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get(self.permission_sets, params["PermissionSetArn"], "PermissionSet")
+        key = (params["TargetId"], params["PermissionSetArn"])
+        self.assignments.setdefault(key, set()).add(
+            (params["PrincipalType"], params["PrincipalId"])
+        )
+        return {"AccountAssignmentCreationStatus": self._assignment_status(params)}
+
+    def _sso_admin_DeleteAccountAssignment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        key = (params["TargetId"], params["PermissionSetArn"])
+        self.assignments.get(key, set()).discard((params["PrincipalType"], params["PrincipalId"]))
+        return {"AccountAssignmentDeletionStatus": self._assignment_status(params)}
+
+    def _sso_admin_DescribeAccountAssignmentCreationStatus(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        status = self._assignment_status({})
+        status["RequestId"] = params["AccountAssignmentCreationRequestId"]
+        return {"AccountAssignmentCreationStatus": status}
+
+    def _sso_admin_DescribeAccountAssignmentDeletionStatus(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        status = self._assignment_status({})
+        status["RequestId"] = params["AccountAssignmentDeletionRequestId"]
+        return {"AccountAssignmentDeletionStatus": status}
+
+    def _sso_admin_CreatePermissionSet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if any(ps["Name"] == params["Name"] for ps in self.permission_sets.values()):
+            raise SyntheticAPIError("ConflictException", f"Permission set {params['Name']} exists")
+        arn = self._add_permission_set(params["Name"], len(self.permission_sets), **params)
+        self.managed_policies[arn] = []
+        return {"PermissionSet": self.permission_sets[arn]}
+
+    def _sso_admin_UpdatePermissionSet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        permission_set = self._get(
+            self.permission_sets, params["PermissionSetArn"], "PermissionSet"
+        )
+        for key in ("Description", "SessionDuration", "RelayState"):
+            if key in params:
+                permission_set[key] = params[key]
+        return {}
+
+    def _sso_admin_DeletePermissionSet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        arn = params["PermissionSetArn"]
+        self._get(self.permission_sets, arn, "PermissionSet")
+        del self.permission_sets[arn]
+        self.managed_policies.pop(arn, None)
+        self.inline_policies.pop(arn, None)
+        return {}
+
+    def _sso_admin_AttachManagedPolicyToPermissionSet(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        policies = self._get(self.managed_policies, params["PermissionSetArn"], "PermissionSet")
+        policy_arn = params["ManagedPolicyArn"]
+        if all(policy["Arn"] != policy_arn for policy in policies):
+            policies.append({"Name": policy_arn.rsplit("/", 1)[-1], "Arn": policy_arn})
+        return {}
+
+    def _sso_admin_DetachManagedPolicyFromPermissionSet(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        arn = params["PermissionSetArn"]
+        policies = self._get(self.managed_policies, arn, "PermissionSet")
+        self.managed_policies[arn] = [
+            policy for policy in policies if policy["Arn"] != params["ManagedPolicyArn"]
+        ]
+        return {}
+
+    def _sso_admin_PutInlinePolicyToPermissionSet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get(self.permission_sets, params["PermissionSetArn"], "PermissionSet")
+        self.inline_policies[params["PermissionSetArn"]] = params["InlinePolicy"]
+        return {}
+
+    def _sso_admin_DeleteInlinePolicyFromPermissionSet(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        self.inline_policies.pop(params["PermissionSetArn"], None)
+        return {}
+
+    def _sso_admin_ProvisionPermissionSet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._get(self.permission_sets, params["PermissionSetArn"], "PermissionSet")
+        return {
+            "PermissionSetProvisioningStatus": {
+                "Status": "SUCCEEDED",
+                "RequestId": f"{next(self._request_ids):08x}-0000-4000-b000-000000000000",
+                "PermissionSetArn": params["PermissionSetArn"],
+            }
+        }
+
+    def _sso_admin_DescribePermissionSetProvisioningStatus(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "PermissionSetProvisioningStatus": {
+                "Status": "SUCCEEDED",
+                "RequestId": params["ProvisionPermissionSetRequestId"],
+            }
+        }
+
+    # Identity Store
+
+    @staticmethod
+    def _filter(items: Iterable[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Apply the attribute equality filters of ListUsers and ListGroups."""
+        results = list(items)
+        for condition in params.get("Filters") or []:
+            path, value = condition["AttributePath"], condition["AttributeValue"]
+            results = [item for item in results if item.get(path) == value]
+        return results
+
+    def _identitystore_ListUsers(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._page("Users", self._filter(self.users.values(), params), params)
+
+    def _identitystore_ListGroups(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._page("Groups", self._filter(self.groups.values(), params), params)
+
+    def _identitystore_DescribeUser(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._get(self.users, params["UserId"], "User")
+
+    def _identitystore_DescribeGroup(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._get(self.groups, params["GroupId"], "Group")
+
+    def _identitystore_ListGroupMemberships(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        memberships = self._get(self.memberships, params["GroupId"], "Group")
+        return self._page("GroupMemberships", memberships, params)
+
+    def _identitystore_ListGroupMembershipsForMember(
+        self, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        user_id = params["MemberId"]["UserId"]
+        memberships = [
+            membership
+            for group_memberships in self.memberships.values()
+            for membership in group_memberships
+            if membership["MemberId"]["UserId"] == user_id
+        ]
+        return self._page("GroupMemberships", memberships, params)
+
+    def _identitystore_GetUserId(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        attribute = params["AlternateIdentifier"]["UniqueAttribute"]
+        for user in self.users.values():
+            if user.get(attribute["AttributePath"]) == attribute["AttributeValue"]:
+                return {"UserId": user["UserId"], "IdentityStoreId": self.IDENTITY_STORE_ID}
+        raise SyntheticAPIError("ResourceNotFoundException", "User not found")
+
+    def _identitystore_GetGroupId(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        attribute = params["AlternateIdentifier"]["UniqueAttribute"]
+        for group in self.groups.values():
+            if group.get(attribute["AttributePath"]) == attribute["AttributeValue"]:
+                return {"GroupId": group["GroupId"], "IdentityStoreId": self.IDENTITY_STORE_ID}
+        raise SyntheticAPIError("ResourceNotFoundException", "Group not found")
+
+
+def offline_session(region: str = DEFAULT_REGION) -> boto3.Session:
+    """Create a boto3 session with placeholder credentials for replayed clients."""
+    return boto3.Session(
+        aws_access_key_id="testing", aws_secret_access_key="testing", region_name=region
+    )
+
+
+def replay_client_manager(
+    replayer: AWSReplayer,
+    region: str = DEFAULT_REGION,
+    enable_caching: bool = False,
+    max_concurrency: Optional[int] = None,
+) -> AWSClientManager:
+    """
+    Create an AWSClientManager whose clients are answered by a replayer.
+
+    Args:
+        replayer: Replayer that answers every request
+        region: Region of the clients
+        enable_caching: Whether to cache read operations
+        max_concurrency: Connection pool size of each client
+
+    Returns:
+        AWSClientManager that never reaches the network
+    """
+    client_manager = AWSClientManager(
+        region=region, enable_caching=enable_caching, max_concurrency=max_concurrency
+    )
+    client_manager.session = offline_session(region)
+    replayer.attach(client_manager.session)
+    return client_manager
+
+
+def replay_async_client_manager(replayer: AWSReplayer, client_manager: AWSClientManager) -> Any:
+    """
+    Create the AsyncAWSClientManager counterpart of a replayed client manager.
+
+    Args:
+        replayer: Replayer that answers every request
+        client_manager: Manager created by replay_client_manager
+
+    Returns:
+        AsyncAWSClientManager whose aiobotocore clients are answered by the replayer
+    """
+    from src.awsideman.aws_clients.async_manager import AsyncAWSClientManager
+
+    async_manager = AsyncAWSClientManager.from_client_manager(client_manager)
+    replayer.attach(async_manager._get_session(), asynchronous=True)
+    return async_manager
+
+
+def record_organization(
+    client_manager: AWSClientManager, recorder: AWSRecorder, max_accounts: int = 20
+) -> None:
+    """
+    Make the read-only calls of a typical awsideman run through a recorder.
+
+    Records the organization hierarchy, accounts and their tags, permission
+    sets, users, groups and memberships, and the account assignments of up
+    to ``max_accounts`` accounts.
+
+    Args:
+        client_manager: AWSClientManager for the organization to record
+        recorder: Recorder attached to the manager's session
+        max_accounts: Accounts whose assignments are recorded
+    """
+    from src.awsideman.aws_clients.account_catalog import AccountCatalog
+
+    organizations = client_manager.get_organizations_client()
+    catalog = AccountCatalog(organizations)
+    catalog.get_all_account_details(include_tags=True)
+
+    sso_admin = client_manager.get_identity_center_client()
+    identity_store = client_manager.get_identity_store_client()
+    instance = sso_admin.list_instances()["Instances"][0]
+    instance_arn, identity_store_id = instance["InstanceArn"], instance["IdentityStoreId"]
+
+    permission_set_arns: List[str] = []
+    for page in sso_admin.get_paginator("list_permission_sets").paginate(InstanceArn=instance_arn):
+        permission_set_arns.extend(page["PermissionSets"])
+    for arn in permission_set_arns:
+        sso_admin.describe_permission_set(InstanceArn=instance_arn, PermissionSetArn=arn)
+        sso_admin.list_managed_policies_in_permission_set(
+            InstanceArn=instance_arn, PermissionSetArn=arn
+        )
+        sso_admin.get_inline_policy_for_permission_set(
+            InstanceArn=instance_arn, PermissionSetArn=arn
+        )
+
+    for page in identity_store.get_paginator("list_users").paginate(
+        IdentityStoreId=identity_store_id
+    ):
+        pass
+    group_ids: List[str] = []
+    for page in identity_store.get_paginator("list_groups").paginate(
+        IdentityStoreId=identity_store_id
+    ):
+        group_ids.extend(group["GroupId"] for group in page["Groups"])
+    for group_id in group_ids:
+        for page in identity_store.get_paginator("list_group_memberships").paginate(
+            IdentityStoreId=identity_store_id, GroupId=group_id
+        ):
+            pass
+
+    for account in catalog.accounts[:max_accounts]:
+        for arn in permission_set_arns:
+            for page in sso_admin.get_paginator("list_account_assignments").paginate(
+                InstanceArn=instance_arn, AccountId=account["Id"], PermissionSetArn=arn
+            ):
+                pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Record a read-only sample of a real organization."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record = subparsers.add_parser("record", help="Record AWS responses to a JSON file")
+    record.add_argument("--profile", help="AWS profile to record with")
+    record.add_argument("--region", help="AWS region of the Identity Center instance")
+    record.add_argument("--output", required=True, help="Path of the recording")
+    record.add_argument(
+        "--max-accounts",
+        type=int,
+        default=20,
+        help="Accounts whose assignments are recorded (default: 20)",
+    )
+    args = parser.parse_args(argv)
+
+    client_manager = AWSClientManager(
+        profile=args.profile, region=args.region, enable_caching=False
+    )
+    recorder = AWSRecorder()
+    recorder.attach(client_manager.session)
+    record_organization(client_manager, recorder, max_accounts=args.max_accounts)
+
+    recorder.recording.save(args.output)
+    print(
+        f"Recorded {len(recorder.recording)} responses at "
+        f"{datetime.now(timezone.utc).isoformat()} to {args.output}"
+    )
+    for operation, count in sorted(recorder.recording.operations().items()):
+        print(f"  {operation}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Cache backend fixtures: synthetic payloads and a local DynamoDB stand-in.
+
+LocalDynamoDB implements the subset of the DynamoDB client and table resource
+APIs used by DynamoDBBackend, backed by an in-memory dictionary, so DynamoDB
+and hybrid backends can be tested and benchmarked without network access.
+"""
+
+import pickle
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.awsideman.cache.backends.dynamodb import DynamoDBBackend
+
+# Items returned per scan page when no Limit is given
+SCAN_PAGE_SIZE = 1000
+
+_WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+
+
+def synthetic_payload(
+    index: int, size_bytes: int = 2048, seed: int = 0, now: Optional[float] = None
+) -> bytes:
+    """
+    Build a pickled cache entry shaped like a cached list_users response.
+
+    Payloads are deterministic for a given index, seed and timestamp and are
+    padded with user records until they reach roughly ``size_bytes``.
+
+    Args:
+        index: Entry number, used to vary the content
+        size_bytes: Approximate size of the serialized entry
+        seed: Seed of the content generator
+        now: Creation timestamp of the entry, defaults to the current time
+
+    Returns:
+        Pickled cache entry
+    """
+    rng = random.Random(seed * 1_000_003 + index)
+    now = time.time() if now is None else now
+    users: List[Dict[str, Any]] = []
+    entry = {"data": {"Users": users}, "created_at": now, "expires_at": now + 3600, "ttl": 3600}
+
+    payload = pickle.dumps(entry)
+    while len(payload) < size_bytes:
+        user_number = len(users)
+        name = f"{rng.choice(_WORDS)}.{rng.choice(_WORDS)}{user_number}"
+        users.append(
+            {
+                "UserId": f"{rng.getrandbits(64):016x}-{index}-{user_number}",
+                "UserName": name,
+                "DisplayName": name.replace(".", " ").title(),
+                "Emails": [{"Value": f"{name}@example.com", "Primary": True}],
+            }
+        )
+        payload = pickle.dumps(entry)
+    return payload
+
+
+def _client_error(code: str, operation: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+def _project(item: Dict[str, Any], projection: Optional[str], names: Dict[str, str]):
+    if not projection:
+        return dict(item)
+    attributes = [names.get(name.strip(), name.strip()) for name in projection.split(",")]
+    return {name: item[name] for name in attributes if name in item}
+
+
+class _BatchWriter:
+    """Context manager mirroring Table.batch_writer()."""
+
+    def __init__(self, store: "LocalDynamoDB"):
+        self._store = store
+
+    def __enter__(self) -> "_BatchWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self._store.put_item(Item=Item)
+
+    def delete_item(self, Key: Dict[str, Any]) -> None:
+        self._store.delete_item(Key=Key)
+
+
+class LocalDynamoDB:
+    """
+    In-memory stand-in for a DynamoDB cache table.
+
+    One instance serves as both the low-level client and the table resource.
+    Every API call can be delayed by ``request_latency`` seconds to model a
+    network round trip. Filter expressions are not supported.
+    """
+
+    def __init__(self, table_name: str = "awsideman-cache", request_latency: float = 0.0):
+        self.table_name = table_name
+        self.request_latency = request_latency
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.requests: Dict[str, int] = {}
+        self.meta = SimpleNamespace(client=self)
+        self._lock = threading.Lock()
+
+    def _request(self, operation: str) -> None:
+        with self._lock:
+            self.requests[operation] = self.requests.get(operation, 0) + 1
+        if self.request_latency:
+            time.sleep(self.request_latency)
+
+    # Table resource API
+
+    def get_item(self, Key: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        self._request("GetItem")
+        with self._lock:
+            item = self.items.get(Key["cache_key"])
+            return {"Item": dict(item)} if item is not None else {}
+
+    def put_item(self, Item: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        self._request("PutItem")
+        with self._lock:
+            self.items[Item["cache_key"]] = dict(Item)
+        return {}
+
+    def delete_item(self, Key: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        self._request("DeleteItem")
+        with self._lock:
+            self.items.pop(Key["cache_key"], None)
+        return {}
+
+    def batch_writer(self) -> _BatchWriter:
+        return _BatchWriter(self)
+
+    def scan(self, **kwargs) -> Dict[str, Any]:
+        self._request("Scan")
+        if "FilterExpression" in kwargs:
+            raise NotImplementedError("LocalDynamoDB does not evaluate filter expressions")
+
+        with self._lock:
+            keys = sorted(self.items)
+            if kwargs.get("Select") == "COUNT":
+                return {"Count": len(keys), "ScannedCount": len(keys)}
+
+            start_key = kwargs.get("ExclusiveStartKey")
+            if start_key:
+                keys = [key for key in keys if key > start_key["cache_key"]]
+            page = keys[: kwargs.get("Limit", SCAN_PAGE_SIZE)]
+            names = kwargs.get("ExpressionAttributeNames", {})
+            items = [
+                _project(self.items[key], kwargs.get("ProjectionExpression"), names) for key in page
+            ]
+
+        response: Dict[str, Any] = {"Items": items, "Count": len(items)}
+        if len(page) < len(keys):
+            response["LastEvaluatedKey"] = {"cache_key": page[-1]}
+        return response
+
+    # Client API
+
+    def batch_get_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        self._request("BatchGetItem")
+        request = RequestItems[self.table_name]
+        with self._lock:
+            items = [
+                _project(self.items[key["cache_key"]], request.get("ProjectionExpression"), {})
+                for key in request["Keys"]
+                if key["cache_key"] in self.items
+            ]
+        return {"Responses": {self.table_name: items}, "UnprocessedKeys": {}}
+
+    def batch_write_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        self._request("BatchWriteItem")
+        with self._lock:
+            for request in RequestItems[self.table_name]:
+                if "PutRequest" in request:
+                    item = request["PutRequest"]["Item"]
+                    self.items[item["cache_key"]] = dict(item)
+                else:
+                    self.items.pop(request["DeleteRequest"]["Key"]["cache_key"], None)
+        return {"UnprocessedItems": {}}
+
+    def describe_table(self, TableName: str) -> Dict[str, Any]:
+        self._request("DescribeTable")
+        if TableName != self.table_name:
+            raise _client_error("ResourceNotFoundException", "DescribeTable")
+        with self._lock:
+            size = sum(len(item.get("data", "")) for item in self.items.values())
+            return {
+                "Table": {
+                    "TableName": self.table_name,
+                    "TableStatus": "ACTIVE",
+                    "ItemCount": len(self.items),
+                    "TableSizeBytes": size,
+                    "BillingModeSummary": {"BillingMode": "PAY_PER_REQUEST"},
+                }
+            }
+
+    def describe_time_to_live(self, TableName: str) -> Dict[str, Any]:
+        self._request("DescribeTimeToLive")
+        return {"TimeToLiveDescription": {"TimeToLiveStatus": "ENABLED", "AttributeName": "ttl"}}
+
+    def list_tables(self, **kwargs) -> Dict[str, Any]:
+        self._request("ListTables")
+        return {"TableNames": [self.table_name]}
+
+
+def local_dynamodb_backend(store: LocalDynamoDB) -> DynamoDBBackend:
+    """
+    Create a DynamoDBBackend that talks to a LocalDynamoDB store.
+
+    Args:
+        store: In-memory table to use
+
+    Returns:
+        DynamoDB backend wired to the store
+    """
+    backend = DynamoDBBackend(table_name=store.table_name, region="us-east-1")
+    backend._client = store
+    backend._table = store
+    backend._table_exists = True
+    return backend
+
+
+@pytest.fixture
+def local_dynamodb():
+    """In-memory DynamoDB cache table."""
+    return LocalDynamoDB()
@@ -0,0 +1,314 @@
+"""Reproducible benchmark harness for the cache backends.
+
+Each run loads a backend with synthetic entries and measures:
+
+- bulk load throughput (set_many) and single-entry write latency
+- hit and miss read latency percentiles
+- cold-start ``CacheManager.get_cache_stats`` time on a freshly opened backend
+- the cost of a pattern invalidation that removes one key family
+
+DynamoDB and hybrid backends run against an in-memory DynamoDB stand-in, so no
+network access is needed. Results are written as a JSON report with stable key
+order that can be diffed between runs.
+
+Usage:
+    python -m tests.performance.cache_backend_benchmark --entries 10000 100000 1000000 \\
+        --output cache-benchmark.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.awsideman.cache.backends.base import CacheBackend
+from src.awsideman.cache.backends.file import FileBackend
+from src.awsideman.cache.backends.hybrid import HybridBackend
+from src.awsideman.cache.backends.segment import SegmentLogBackend
+from src.awsideman.cache.backends.sqlite import SQLiteBackend
+from src.awsideman.cache.manager import CacheManager
+from tests.fixtures.cache_backends import LocalDynamoDB, local_dynamodb_backend, synthetic_payload
+
+REPORT_VERSION = 1
+
+DEFAULT_ENTRY_COUNTS = [10_000, 100_000, 1_000_000]
+DEFAULT_SAMPLE_SIZE = 1000
+DEFAULT_PAYLOAD_BYTES = 2048
+LOAD_BATCH_SIZE = 500
+
+# Entries are spread over this many key families; invalidating one removes 1/N of the cache
+KEY_FAMILIES = 10
+KEY_OPERATION = "list_users"
+TTL_SECONDS = 3600
+
+
+def _open_file(directory: str, store: LocalDynamoDB) -> CacheBackend:
+    return FileBackend(cache_dir=directory, encryption_enabled=False)
+
+
+def _open_sqlite(directory: str, store: LocalDynamoDB) -> CacheBackend:
+    return SQLiteBackend(cache_dir=directory)
+
+
+def _open_segment(directory: str, store: LocalDynamoDB) -> CacheBackend:
+    return SegmentLogBackend(cache_dir=directory, auto_compact=False)
+
+
+def _open_dynamodb(directory: str, store: LocalDynamoDB) -> CacheBackend:
+    return local_dynamodb_backend(store)
+
+
+def _open_hybrid(directory: str, store: LocalDynamoDB) -> CacheBackend:
+    local = FileBackend(cache_dir=directory, encryption_enabled=False)
+    return HybridBackend(local, local_dynamodb_backend(store), local_ttl=TTL_SECONDS)
+
+
+BACKENDS: Dict[str, Callable[[str, LocalDynamoDB], CacheBackend]] = {
+    "file": _open_file,
+    "sqlite": _open_sqlite,
+    "segment": _open_segment,
+    "dynamodb": _open_dynamodb,
+    "hybrid": _open_hybrid,
+}
+
+
+def cache_key(index: int) -> str:
+    """Return the benchmark cache key of entry ``index``."""
+    return f"bench:family{index % KEY_FAMILIES}:{KEY_OPERATION}:{index:08d}"
+
+
+def percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    Summarize latency samples in milliseconds.
+
+    Args:
+        samples: Latencies in seconds
+
+    Returns:
+        Dictionary with mean, p50, p90, p99 and max in milliseconds
+    """
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+    ordered = sorted(samples)
+
+    def rank(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    return {
+        "mean": round(sum(ordered) / len(ordered) * 1000, 4),
+        "p50": round(rank(0.50) * 1000, 4),
+        "p90": round(rank(0.90) * 1000, 4),
+        "p99": round(rank(0.99) * 1000, 4),
+        "max": round(ordered[-1] * 1000, 4),
+    }
+
+
+def _close(backend: CacheBackend) -> None:
+    for candidate in (backend, getattr(backend, "local_backend", None)):
+        close = getattr(candidate, "close", None)
+        if callable(close):
+            close()
+
+
+def _timed(operation: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    operation()
+    return time.perf_counter() - start
+
+
+def _manager_for(backend: CacheBackend) -> CacheManager:
+    CacheManager.reset_instance()
+    manager = CacheManager()
+    manager._backend = backend
+    return manager
+
+
+def benchmark_backend(
+    name: str,
+    entries: int,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    payload_bytes: int = DEFAULT_PAYLOAD_BYTES,
+    seed: int = 0,
+    dynamodb_latency: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Benchmark one backend at one entry count.
+
+    Args:
+        name: Backend name, one of BACKENDS
+        entries: Number of entries to load
+        sample_size: Number of timed reads and writes per measurement
+        payload_bytes: Approximate size of each entry
+        seed: Seed for payloads and key sampling
+        dynamodb_latency: Simulated DynamoDB round trip in seconds
+
+    Returns:
+        Result dictionary for the report
+    """
+    open_backend = BACKENDS[name]
+    directory = tempfile.mkdtemp(prefix=f"awsideman-bench-{name}-")
+    store = LocalDynamoDB(request_latency=dynamodb_latency)
+    rng = random.Random(seed)
+    # A handful of distinct payloads keeps generation out of the measured time
+    payloads = [synthetic_payload(i, payload_bytes, seed) for i in range(16)]
+
+    backend = open_backend(directory, store)
+    try:
+        load_seconds = 0.0
+        for start in range(0, entries, LOAD_BATCH_SIZE):
+            batch = {
+                cache_key(i): payloads[i % len(payloads)]
+                for i in range(start, min(entries, start + LOAD_BATCH_SIZE))
+            }
+            load_seconds += _timed(
+                lambda: backend.set_many(batch, ttl=TTL_SECONDS, operation=KEY_OPERATION)
+            )
+
+        samples = min(sample_size, entries)
+        hit_keys = [cache_key(i) for i in rng.sample(range(entries), samples)]
+        miss_keys = [f"bench:missing:{KEY_OPERATION}:{i:08d}" for i in range(samples)]
+
+        write_latency = [
+            _timed(lambda: backend.set(key, payloads[0], ttl=TTL_SECONDS, operation=KEY_OPERATION))
+            for key in hit_keys
+        ]
+        hit_latency = []
+        for key in hit_keys:
+            start = time.perf_counter()
+            value = backend.get(key)
+            hit_latency.append(time.perf_counter() - start)
+            if value is None:
+                raise AssertionError(f"{name} backend lost entry {key}")
+        miss_latency = [_timed(lambda: backend.get(key)) for key in miss_keys]
+
+        # Reopen the backend so the stats call pays its cold-start cost
+        _close(backend)
+        backend = open_backend(directory, store)
+        manager = _manager_for(backend)
+        cold_stats_seconds = _timed(manager.get_cache_stats)
+
+        pattern = "bench:family0:*"
+        start = time.perf_counter()
+        removed = manager.invalidate(pattern)
+        invalidation_seconds = time.perf_counter() - start
+
+        return {
+            "backend": name,
+            "entries": entries,
+            "bulk_load": {
+                "seconds": round(load_seconds, 4),
+                "ops_per_sec": round(entries / load_seconds, 1) if load_seconds else 0.0,
+            },
+            "write_latency_ms": percentiles(write_latency),
+            "hit_latency_ms": percentiles(hit_latency),
+            "miss_latency_ms": percentiles(miss_latency),
+            "cold_start_stats_ms": round(cold_stats_seconds * 1000, 4),
+            "pattern_invalidation": {
+                "pattern": pattern,
+                "removed": removed,
+                "expected": len(range(0, entries, KEY_FAMILIES)),
+                "seconds": round(invalidation_seconds, 4),
+            },
+            "dynamodb_requests": dict(sorted(store.requests.items())),
+        }
+    finally:
+        _close(backend)
+        CacheManager.reset_instance()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def run_benchmarks(
+    backends: Sequence[str],
+    entry_counts: Sequence[int],
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    payload_bytes: int = DEFAULT_PAYLOAD_BYTES,
+    seed: int = 0,
+    dynamodb_latency: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Benchmark every backend at every entry count and build the report.
+
+    Returns:
+        Report dictionary with the run parameters and one result per backend and size
+    """
+    results: List[Dict[str, Any]] = []
+    for name in backends:
+        for entries in entry_counts:
+            results.append(
+                benchmark_backend(name, entries, sample_size, payload_bytes, seed, dynamodb_latency)
+            )
+
+    return {
+        "version": REPORT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "parameters": {
+            "backends": list(backends),
+            "entry_counts": list(entry_counts),
+            "sample_size": sample_size,
+            "payload_bytes": payload_bytes,
+            "seed": seed,
+            "dynamodb_latency_ms": dynamodb_latency * 1000,
+        },
+        "results": results,
+    }
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    """Write the report as indented JSON with sorted keys."""
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark awsideman cache backends")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=list(BACKENDS))
+    parser.add_argument("--entries", nargs="+", type=int, default=DEFAULT_ENTRY_COUNTS)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLE_SIZE)
+    parser.add_argument("--payload-bytes", type=int, default=DEFAULT_PAYLOAD_BYTES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--dynamodb-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated round trip of each DynamoDB request",
+    )
+    parser.add_argument("--output", default="cache-benchmark.json")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        args.backends,
+        args.entries,
+        sample_size=args.samples,
+        payload_bytes=args.payload_bytes,
+        seed=args.seed,
+        dynamodb_latency=args.dynamodb_latency_ms / 1000,
+    )
+    write_report(report, args.output)
+
+    for result in report["results"]:
+        print(
+            f"{result['backend']:>8} {result['entries']:>9,} entries: "
+            f"load {result['bulk_load']['ops_per_sec']:>10,.0f}/s  "
+            f"hit p99 {result['hit_latency_ms']['p99']:.3f} ms  "
+            f"miss p99 {result['miss_latency_ms']['p99']:.3f} ms  "
+            f"stats {result['cold_start_stats_ms']:.1f} ms  "
+            f"invalidate {result['pattern_invalidation']['seconds'] * 1000:.1f} ms"
+        )
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
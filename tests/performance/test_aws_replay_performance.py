@@ -0,0 +1,164 @@
+"""Benchmarks that run against replayed AWS APIs with simulated latency.
+
+The AWS calls are answered offline by the replay harness in
+tests/fixtures/aws_replay.py, from a synthetic organization or a recording,
+with per-operation latency and ThrottlingException rates.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.awsideman.aws_clients.account_catalog import AccountCatalog
+from src.awsideman.aws_clients.manager import build_organization_hierarchy
+from tests.fixtures.aws_replay import (
+    AWSRecorder,
+    AWSRecording,
+    AWSReplayer,
+    ReplayMissError,
+    SyntheticOrganization,
+    replay_async_client_manager,
+    replay_client_manager,
+)
+
+LATENCY_SECONDS = 0.02
+
+
+@pytest.mark.performance
+class TestAWSReplayPerformance:
+    """Measure concurrency, retries and recordings against replayed APIs."""
+
+    def test_concurrency_hides_latency(self):
+        """Tag lookups of many accounts overlap instead of adding up their latency."""
+        organization = SyntheticOrganization(accounts=60)
+        timings = {}
+        for concurrency in (1, 10):
+            replayer = AWSReplayer(organization, latency=LATENCY_SECONDS)
+            client_manager = replay_client_manager(replayer, max_concurrency=concurrency)
+            catalog = AccountCatalog(
+                client_manager.get_organizations_client(), max_concurrency=concurrency
+            )
+            catalog.get_organization_tree()
+
+            start = time.perf_counter()
+            catalog.load_tags()
+            timings[concurrency] = time.perf_counter() - start
+
+            assert catalog.get_tags("100000000059") == {"env": "dev", "team": "team-3"}
+            pool_stats = client_manager.get_client_pool_stats()["services"]["organizations"]
+            assert pool_stats["peak_in_use"] <= concurrency
+
+        print(
+            f"\n60 tag lookups at {LATENCY_SECONDS * 1000:.0f} ms: "
+            f"{timings[1]:.2f}s sequential, {timings[10]:.2f}s with 10 workers"
+        )
+        assert timings[10] < timings[1] / 3
+
+    def test_throttled_requests_are_retried(self):
+        """Injected ThrottlingExceptions are retried by botocore until the call succeeds."""
+        organization = SyntheticOrganization(accounts=10)
+        replayer = AWSReplayer(organization, throttle_rate={"ListTagsForResource": 0.3}, seed=3)
+        client_manager = replay_client_manager(replayer)
+        catalog = AccountCatalog(client_manager.get_organizations_client(), max_concurrency=1)
+
+        catalog.load_tags()
+
+        stats = replayer.stats()["operations"]["organizations.ListTagsForResource"]
+        assert stats["throttled"] > 0
+        assert stats["requests"] == 10 + stats["throttled"]
+        assert all(catalog.get_tags(account_id) for account_id in organization.account_ids)
+
+    def test_recording_replays_the_same_organization(self, tmp_path):
+        """A recording of a run answers the same run offline."""
+        organization = SyntheticOrganization(accounts=25, page_size=10)
+        recorder = AWSRecorder()
+        source_manager = replay_client_manager(AWSReplayer(organization))
+        recorder.attach(source_manager.session)
+        expected = AccountCatalog(source_manager.get_organizations_client())
+        expected_details = expected.get_all_account_details(include_tags=True)
+
+        path = tmp_path / "organization.json"
+        recorder.recording.save(str(path))
+        replayer = AWSReplayer(AWSRecording.load(str(path)))
+        replayed_manager = replay_client_manager(replayer)
+        replayed = AccountCatalog(replayed_manager.get_organizations_client())
+
+        assert replayed.get_all_account_details(include_tags=True) == expected_details
+        assert recorder.recording.operations()["organizations.ListAccounts"] == 3
+        with pytest.raises(ReplayMissError):
+            replayed_manager.get_organizations_client().describe_account("999999999999")
+
+    def test_hierarchy_of_a_large_organization(self):
+        """The hierarchy of a thousand accounts is built level by level under latency."""
+        organization = SyntheticOrganization(accounts=1000, ou_depth=3, ous_per_parent=4)
+        replayer = AWSReplayer(organization, latency=LATENCY_SECONDS, jitter=0.5)
+        client_manager = replay_client_manager(replayer, max_concurrency=10)
+
+        start = time.perf_counter()
+        tree = build_organization_hierarchy(client_manager.get_organizations_client())
+        elapsed = time.perf_counter() - start
+
+        accounts = []
+        stack = list(tree)
+        while stack:
+            node = stack.pop()
+            accounts.extend(child for child in node.children if child.is_account())
+            stack.extend(child for child in node.children if not child.is_account())
+        print(f"\nHierarchy of 1000 accounts in 84 OUs: {elapsed:.2f}s")
+        assert len(accounts) == 1000
+        assert replayer.stats()["requests"] > 84
+
+    def test_async_clients_overlap_requests(self):
+        """aiobotocore clients are replayed too, with latency awaited on the event loop."""
+        organization = SyntheticOrganization(users=20)
+        replayer = AWSReplayer(organization, latency=0.05)
+        async_manager = replay_async_client_manager(replayer, replay_client_manager(replayer))
+
+        async def describe_users():
+            client = await async_manager.get_client("identitystore")
+            return await asyncio.gather(
+                *(
+                    client.describe_user(
+                        IdentityStoreId=organization.IDENTITY_STORE_ID, UserId=user_id
+                    )
+                    for user_id in organization.users
+                )
+            )
+
+        start = time.perf_counter()
+        users = asyncio.run(async_manager.run(describe_users()))
+        elapsed = time.perf_counter() - start
+
+        assert [user["UserName"] for user in users] == [f"user{i:05d}" for i in range(20)]
+        assert elapsed < 20 * 0.05 / 2
+
+    def test_synthetic_assignments_can_be_changed(self):
+        """Created and deleted assignments show up in later listings, as bulk runs need."""
+        organization = SyntheticOrganization(accounts=2, permission_sets=1)
+        client = replay_client_manager(AWSReplayer(organization)).get_identity_center_client()
+        permission_set_arn = next(iter(organization.permission_sets))
+        user_id = next(iter(organization.users))
+        assignment = {
+            "InstanceArn": organization.INSTANCE_ARN,
+            "TargetId": "100000000001",
+            "TargetType": "AWS_ACCOUNT",
+            "PermissionSetArn": permission_set_arn,
+            "PrincipalType": "USER",
+            "PrincipalId": user_id,
+        }
+
+        def user_assigned():
+            response = client.list_account_assignments(
+                InstanceArn=organization.INSTANCE_ARN,
+                AccountId="100000000001",
+                PermissionSetArn=permission_set_arn,
+            )
+            return any(a["PrincipalId"] == user_id for a in response["AccountAssignments"])
+
+        status = client.create_account_assignment(**assignment)
+        assert status["AccountAssignmentCreationStatus"]["Status"] == "SUCCEEDED"
+        assert user_assigned()
+
+        client.delete_account_assignment(**assignment)
+        assert not user_assigned()
@@ -0,0 +1,100 @@
+"""Benchmarks of the cache backends at growing entry counts.
+
+The benchmarks run at small sizes by default. Set
+AWSIDEMAN_CACHE_BENCH_ENTRIES (comma separated) for larger runs and
+AWSIDEMAN_CACHE_BENCH_REPORT to keep the JSON report.
+"""
+
+import json
+import os
+
+import pytest
+
+from tests.fixtures.cache_backends import LocalDynamoDB, local_dynamodb_backend, synthetic_payload
+from tests.performance.cache_backend_benchmark import (
+    BACKENDS,
+    REPORT_VERSION,
+    percentiles,
+    run_benchmarks,
+    write_report,
+)
+
+ENTRY_COUNTS = [
+    int(count) for count in os.environ.get("AWSIDEMAN_CACHE_BENCH_ENTRIES", "500,2000").split(",")
+]
+SAMPLE_SIZE = 200
+
+
+@pytest.mark.performance
+class TestCacheBackendBenchmark:
+    """Run the benchmark harness over every backend."""
+
+    def test_report_covers_every_backend_and_size(self, tmp_path):
+        """Every backend produces a complete result at every entry count."""
+        report = run_benchmarks(list(BACKENDS), ENTRY_COUNTS, sample_size=SAMPLE_SIZE)
+        report_path = os.environ.get("AWSIDEMAN_CACHE_BENCH_REPORT", str(tmp_path / "report.json"))
+        write_report(report, report_path)
+
+        with open(report_path, encoding="utf-8") as handle:
+            loaded = json.load(handle)
+        assert loaded["version"] == REPORT_VERSION
+        assert len(loaded["results"]) == len(BACKENDS) * len(ENTRY_COUNTS)
+
+        print("\nCache backend benchmark (hit p50 / p99 ms, load ops/sec):")
+        for result in loaded["results"]:
+            hits = result["hit_latency_ms"]
+            print(
+                f"  {result['backend']:>8} {result['entries']:>7}: "
+                f"{hits['p50']:.3f} / {hits['p99']:.3f}, "
+                f"{result['bulk_load']['ops_per_sec']:,.0f}"
+            )
+            assert result["bulk_load"]["ops_per_sec"] > 0
+            assert hits["p50"] <= hits["p99"] <= hits["max"]
+            assert result["cold_start_stats_ms"] > 0
+
+            invalidation = result["pattern_invalidation"]
+            if result["backend"] == "dynamodb":
+                # DynamoDB cannot list keys, so pattern invalidation only reaches the memory tier
+                assert invalidation["removed"] == 0
+            else:
+                assert invalidation["removed"] == invalidation["expected"]
+
+    def test_simulated_dynamodb_latency_is_measured(self):
+        """Injected round-trip latency shows up in the DynamoDB hit latency."""
+        report = run_benchmarks(["dynamodb"], [100], sample_size=20, dynamodb_latency=0.002)
+
+        result = report["results"][0]
+        assert result["hit_latency_ms"]["p50"] >= 2.0
+        assert result["dynamodb_requests"]["GetItem"] >= 40
+
+
+class TestBenchmarkFixtures:
+    """Sanity checks of the payload generator and the DynamoDB stand-in."""
+
+    def test_synthetic_payload_is_deterministic_and_sized(self):
+        """Payloads depend only on index and seed and reach the requested size."""
+        payload = synthetic_payload(7, 4096, now=1_700_000_000)
+        assert payload == synthetic_payload(7, 4096, now=1_700_000_000)
+        assert payload != synthetic_payload(8, 4096, now=1_700_000_000)
+        assert 4096 <= len(payload) < 4096 + 512
+
+    def test_local_dynamodb_backend_round_trip_and_scan_pages(self):
+        """The stand-in serves DynamoDBBackend reads, writes and paginated scans."""
+        store = LocalDynamoDB()
+        backend = local_dynamodb_backend(store)
+        backend.set_many({f"key:{i:04d}": b"x" * 10 for i in range(2500)}, ttl=300)
+
+        assert backend.get("key:0042") == b"x" * 10
+        assert backend.get_many(["key:0001", "missing"]) == {"key:0001": b"x" * 10}
+        assert backend.get_stats()["item_count"] == 2500
+
+        backend.invalidate()
+        assert store.items == {}
+        assert store.requests["Scan"] > 2
+
+    def test_percentiles(self):
+        """Percentiles are reported in milliseconds."""
+        summary = percentiles([i / 1000 for i in range(1, 101)])
+        assert summary["p50"] == 51.0
+        assert summary["p99"] == 100.0
+        assert percentiles([])["max"] == 0.0
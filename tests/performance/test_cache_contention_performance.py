@@ -0,0 +1,123 @@
+"""Contention benchmark for concurrent CacheManager reads."""
+
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pytest
+
+from src.awsideman.cache.backends.base import CacheBackend
+from src.awsideman.cache.manager import CacheManager
+from src.awsideman.cache.memory_tier import StripedMemoryTier
+
+BACKEND_LATENCY_SECONDS = 0.002
+KEYS_PER_RUN = 400
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+class LatencyBackend(CacheBackend):
+    """In-memory backend that sleeps on every read to simulate disk or network I/O."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self._data: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        time.sleep(self.latency)
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: str, data: bytes, ttl=None, operation: str = "unknown") -> None:
+        with self._lock:
+            self._data[key] = data
+
+    def invalidate(self, key=None) -> None:
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def get_stats(self):
+        return {"backend_type": "latency", "entries": len(self._data)}
+
+    def health_check(self) -> bool:
+        return True
+
+
+def _entry(index: int) -> bytes:
+    return pickle.dumps(
+        {
+            "data": {"UserId": f"user-{index}", "Groups": [f"group-{i}" for i in range(10)]},
+            "expires_at": time.time() + 3600,
+            "created_at": time.time(),
+            "ttl": 3600,
+        }
+    )
+
+
+@pytest.mark.performance
+class TestCacheManagerContention:
+    """Measure read throughput of the cache manager as the number of threads grows."""
+
+    def setup_method(self):
+        CacheManager.reset_instance()
+        self.manager = CacheManager()
+        self.backend = LatencyBackend(BACKEND_LATENCY_SECONDS)
+        self.manager._backend = self.backend
+        # A tiny memory tier keeps every read on the backend path
+        self.manager._cache = StripedMemoryTier(max_entries=8, max_bytes=1024 * 1024)
+
+    def teardown_method(self):
+        CacheManager.reset_instance()
+
+    def _load_keys(self, run: int) -> List[str]:
+        keys = [f"contention_run{run}_key_{i}" for i in range(KEYS_PER_RUN)]
+        for index, key in enumerate(keys):
+            self.backend.set(key, _entry(index))
+        return keys
+
+    def _throughput(self, keys: List[str], threads: int) -> float:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(self.manager.get, keys))
+        elapsed = time.perf_counter() - start
+
+        assert all(result is not None for result in results)
+        return len(keys) / elapsed
+
+    def test_backend_reads_scale_with_threads(self):
+        """Backend misses must not serialize on a manager-wide lock."""
+        throughput = {}
+        for run, threads in enumerate(THREAD_COUNTS):
+            keys = self._load_keys(run)
+            throughput[threads] = self._throughput(keys, threads)
+
+        print("\nCacheManager backend-read throughput (ops/sec):")
+        for threads, ops in throughput.items():
+            print(f"  {threads} threads: {ops:,.0f} ({ops / throughput[1]:.1f}x)")
+
+        # With the I/O outside any global lock, throughput grows with concurrency
+        assert throughput[2] > throughput[1] * 1.5
+        assert throughput[8] > throughput[1] * 3
+
+    def test_concurrent_reads_and_writes_stay_consistent(self):
+        """Concurrent writers, readers and invalidations never corrupt the memory tier."""
+        keys = self._load_keys(0)
+
+        def worker(offset: int) -> None:
+            for i in range(offset, len(keys), 8):
+                key = keys[i]
+                self.manager.set(key, {"value": i})
+                assert self.manager.get(key) in ({"value": i}, None)
+                if i % 50 == 0:
+                    self.manager.invalidate(f"contention_run0_key_{i}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+
+        stats = self.manager.get_cache_stats()
+        assert stats["memory_tier"]["entries"] <= 8
@@ -0,0 +1,107 @@
+"""Microbenchmark for plaintext and encrypted FileBackend cache hits."""
+
+import json
+import os
+import pickle
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.awsideman.cache.backends.file import FileBackend
+from src.awsideman.encryption.aes import AESEncryption
+
+HITS_PER_RUN = 200
+USERS_PER_ENTRY = 200
+
+
+def _entry() -> bytes:
+    users = [
+        {
+            "UserId": f"user-{i}",
+            "UserName": f"user{i}@example.com",
+            "Emails": [{"Value": f"user{i}@example.com", "Primary": True}],
+            "Groups": [f"group-{g}" for g in range(5)],
+        }
+        for i in range(USERS_PER_ENTRY)
+    ]
+    now = time.time()
+    return pickle.dumps({"data": users, "expires_at": now + 3600, "created_at": now, "ttl": 3600})
+
+
+@pytest.mark.performance
+class TestEncryptedHitLatency:
+    """Compare the cost of a cache hit (backend read plus decode) with and without encryption.
+
+    AES decryption sleeps for a random jitter as a timing-analysis countermeasure.
+    The jitter is disabled here so the numbers reflect serialization and cipher cost.
+    """
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.payload = _entry()
+
+        key_manager = Mock()
+        key_manager.get_key.return_value = os.urandom(32)
+        self.provider = AESEncryption(key_manager)
+
+        self.plain = FileBackend(cache_dir=os.path.join(self.temp_dir, "plain"))
+        self.plain.encryption_enabled = False
+        self.plain.encryption_provider = None
+
+        self.encrypted = FileBackend(cache_dir=os.path.join(self.temp_dir, "encrypted"))
+        self.encrypted.encryption_enabled = True
+        self.encrypted.encryption_provider = self.provider
+
+        self.plain.set("user:list:all", self.payload, ttl=3600)
+        self.encrypted.set("user:list:all", self.payload, ttl=3600)
+        self._write_legacy_entry("user:list:legacy")
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_legacy_entry(self, key: str) -> None:
+        """Write a file in the JSON-encrypted format used before raw payloads."""
+        metadata = json.dumps(
+            {"encrypted": True, "created_at": time.time(), "ttl": 3600, "key": key}
+        ).encode("utf-8")
+        cache_file = self.encrypted.path_manager.get_cache_file_path(key)
+        cache_file.write_bytes(
+            len(metadata).to_bytes(4, byteorder="big")
+            + metadata
+            + self.provider.encrypt(pickle.loads(self.payload))
+        )
+
+    def _hit_latencies(self, read: Callable[[], bytes]) -> List[float]:
+        latencies = []
+        for _ in range(HITS_PER_RUN):
+            start = time.perf_counter()
+            entry = pickle.loads(read())
+            latencies.append(time.perf_counter() - start)
+        assert len(entry["data"]) == USERS_PER_ENTRY
+        return latencies
+
+    def test_encrypted_hit_latency(self):
+        """An encrypted hit costs one decrypt plus one decode, not a JSON and pickle round trip."""
+        with patch("src.awsideman.encryption.aes.timing_protection.add_timing_jitter"):
+            results = {
+                "plaintext": self._hit_latencies(lambda: self.plain.get("user:list:all")),
+                "encrypted": self._hit_latencies(lambda: self.encrypted.get("user:list:all")),
+                "encrypted (legacy JSON)": self._hit_latencies(
+                    lambda: self.encrypted.get("user:list:legacy")
+                ),
+            }
+
+        medians = {name: statistics.median(values) for name, values in results.items()}
+        baseline = medians["plaintext"]
+
+        print(f"\nFileBackend hit latency, {len(self.payload):,} byte entry (median):")
+        for name, median in medians.items():
+            print(f"  {name:<24} {median * 1000:.3f} ms ({median / baseline:.1f}x)")
+
+        assert pickle.loads(self.encrypted.get("user:list:all")) == pickle.loads(self.payload)
+        assert medians["encrypted"] < medians["encrypted (legacy JSON)"]
@@ -0,0 +1,192 @@
+"""Unit tests for the single-pass account catalog."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.awsideman.aws_clients.account_catalog import AccountCatalog
+from src.awsideman.aws_clients.manager import OrganizationsClient, get_account_details
+from src.awsideman.aws_clients.org_snapshot import OrganizationSnapshotStore
+from src.awsideman.cache.manager import CacheManager
+from src.awsideman.utils.models import NodeType, OrgNode
+
+
+@pytest.fixture
+def organization_tree():
+    """Create a hierarchy with accounts at the root and in a nested OU."""
+    return [
+        OrgNode(
+            "r-1234",
+            "Root",
+            NodeType.ROOT,
+            [
+                OrgNode(
+                    "ou-1234-eng",
+                    "Engineering",
+                    NodeType.OU,
+                    [
+                        OrgNode(
+                            "ou-1234-prod",
+                            "Production",
+                            NodeType.OU,
+                            [OrgNode("222222222222", "prod-account", NodeType.ACCOUNT, [])],
+                        )
+                    ],
+                ),
+                OrgNode("111111111111", "management", NodeType.ACCOUNT, []),
+            ],
+        )
+    ]
+
+
+@pytest.fixture
+def organizations_client():
+    """Create an Organizations client stand-in that lists two accounts."""
+    client = MagicMock(spec=OrganizationsClient)
+    client.list_accounts.return_value = {
+        "Accounts": [
+            {
+                "Id": "111111111111",
+                "Name": "management",
+                "Email": "mgmt@example.com",
+                "Status": "ACTIVE",
+                "JoinedTimestamp": "2021-01-01T00:00:00Z",
+            },
+            {
+                "Id": "222222222222",
+                "Name": "prod-account",
+                "Email": "prod@example.com",
+                "Status": "ACTIVE",
+            },
+        ]
+    }
+    client.list_tags_for_resource.side_effect = lambda account_id: [
+        {"Key": "Owner", "Value": f"owner-{account_id}"}
+    ]
+    return client
+
+
+class TestAccountCatalog:
+    """Test account, OU path and tag lookups."""
+
+    def test_accounts_come_from_one_list_call(self, organizations_client):
+        """Test that all lookups share a single list_accounts call."""
+        catalog = AccountCatalog(organizations_client)
+
+        assert len(catalog) == 2
+        assert "222222222222" in catalog
+        assert catalog.get("111111111111")["Name"] == "management"
+        assert catalog.get("999999999999") is None
+        organizations_client.list_accounts.assert_called_once()
+
+    def test_ou_paths_come_from_the_hierarchy(self, organizations_client, organization_tree):
+        """Test that OU paths are read from the tree without list_parents calls."""
+        catalog = AccountCatalog(organizations_client, organization_tree=organization_tree)
+
+        details = {d.id: d for d in catalog.get_all_account_details()}
+
+        assert details["222222222222"].ou_path == ["Root", "Engineering", "Production"]
+        assert details["111111111111"].ou_path == ["Root"]
+        assert details["111111111111"].joined_timestamp.year == 2021
+        organizations_client.list_parents.assert_not_called()
+        organizations_client.describe_account.assert_not_called()
+
+    def test_tags_are_only_fetched_when_requested(self, organizations_client, organization_tree):
+        """Test that tags are loaded on demand and only once per account."""
+        catalog = AccountCatalog(organizations_client, organization_tree=organization_tree)
+
+        without_tags = catalog.get_all_account_details()
+        organizations_client.list_tags_for_resource.assert_not_called()
+        assert all(details.tags == {} for details in without_tags)
+
+        with_tags = catalog.get_all_account_details(include_tags=True)
+        catalog.get_tags("111111111111")
+
+        assert with_tags[1].tags == {"Owner": "owner-222222222222"}
+        assert organizations_client.list_tags_for_resource.call_count == 2
+
+    def test_tags_are_fetched_concurrently(self, organizations_client):
+        """Test that the tag requests of several accounts are in flight together."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def list_tags(account_id):
+            barrier.wait()
+            return [{"Key": "Id", "Value": account_id}]
+
+        organizations_client.list_tags_for_resource.side_effect = list_tags
+        catalog = AccountCatalog(organizations_client, max_concurrency=2)
+
+        catalog.load_tags()
+
+        assert catalog.get_tags("222222222222") == {"Id": "222222222222"}
+
+    def test_failed_tag_lookup_yields_no_tags(self, organizations_client):
+        """Test that one failing tag lookup does not fail the others."""
+        organizations_client.list_tags_for_resource.side_effect = Exception("throttled")
+        catalog = AccountCatalog(organizations_client)
+
+        assert catalog.get_tags("111111111111") == {}
+
+    def test_single_account_is_described_without_listing(self, organizations_client):
+        """Test that one account lookup neither lists accounts nor builds the hierarchy."""
+        organizations_client.describe_account.return_value = {
+            "Id": "111111111111",
+            "Name": "management",
+            "Status": "ACTIVE",
+        }
+        organizations_client.list_parents.return_value = [{"Id": "r-1234", "Type": "ROOT"}]
+        organizations_client.list_roots.return_value = [{"Id": "r-1234", "Name": "Root"}]
+
+        details = get_account_details(organizations_client, "111111111111")
+
+        assert details.name == "management"
+        assert details.ou_path == ["Root"]
+        assert details.tags == {"Owner": "owner-111111111111"}
+        organizations_client.describe_account.assert_called_once_with("111111111111")
+        organizations_client.list_accounts.assert_not_called()
+        organizations_client.list_organizational_units_for_parent.assert_not_called()
+
+    def test_unlisted_account_falls_back_to_describe(self, organizations_client):
+        """Test that accounts missing from list_accounts are described."""
+        organizations_client.describe_account.return_value = {
+            "Id": "333333333333",
+            "Name": "new-account",
+        }
+        organizations_client.list_parents.return_value = []
+
+        details = get_account_details(
+            organizations_client, "333333333333", catalog=AccountCatalog(organizations_client)
+        )
+
+        assert details.name == "new-account"
+        organizations_client.list_accounts.assert_called_once()
+        organizations_client.describe_account.assert_called_once_with("333333333333")
+
+    def test_saved_hierarchy_snapshot_provides_ou_paths(
+        self, organizations_client, organization_tree
+    ):
+        """Test that a saved snapshot is used for OU paths of single lookups."""
+        CacheManager.reset_instance()
+        try:
+            cache_manager = CacheManager(profile="catalog-test")
+            cache_manager._backend = None
+            organizations_client.cache_manager = cache_manager
+            organizations_client.client_manager = MagicMock(profile="catalog-test", region=None)
+            OrganizationSnapshotStore.for_client(organizations_client).save(organization_tree)
+
+            catalog = AccountCatalog(organizations_client)
+
+            assert catalog.get_ou_path("222222222222") == ["Root", "Engineering", "Production"]
+
+            organizations_client.describe_account.return_value = {
+                "Id": "222222222222",
+                "Name": "prod-account",
+            }
+            details = get_account_details(organizations_client, "222222222222")
+
+            assert details.ou_path == ["Root", "Engineering", "Production"]
+            organizations_client.list_accounts.assert_not_called()
+            organizations_client.list_parents.assert_not_called()
+        finally:
+            CacheManager.reset_instance()
@@ -0,0 +1,352 @@
+"""Unit tests for the asyncio AWS client manager."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.awsideman.aws_clients.async_manager import AsyncAWSClientManager
+from src.awsideman.aws_clients.cached_client import CachedAwsClient
+from src.awsideman.aws_clients.manager import AWSClientManager
+from src.awsideman.backup_restore.collector import IdentityCenterCollector
+from src.awsideman.backup_restore.models import BackupOptions
+from src.awsideman.cache.manager import CacheManager
+
+
+class FakeAioClient:
+    """aiobotocore client stand-in answering from canned responses."""
+
+    def __init__(self, service_name, responses, calls, delay):
+        self.service_name = service_name
+        self._responses = responses
+        self._calls = calls
+        self._delay = delay
+
+    async def _respond(self, operation, params):
+        self._calls.append((self.service_name, operation, params))
+        await asyncio.sleep(self._delay)
+        response = self._responses[(self.service_name, operation)]
+        if isinstance(response, Exception):
+            raise response
+        return response(params) if callable(response) else response
+
+    def __getattr__(self, operation):
+        async def call(**params):
+            return await self._respond(operation, params)
+
+        return call
+
+    def get_paginator(self, operation):
+        client = self
+
+        class Paginator:
+            def paginate(self, **params):
+                async def pages():
+                    for page in await client._respond(operation, params):
+                        yield page
+
+                return pages()
+
+        return Paginator()
+
+
+class FakeSession:
+    """aioboto3 session stand-in that records opened and closed clients."""
+
+    def __init__(self, responses, delay=0.0):
+        self.responses = responses
+        self.delay = delay
+        self.calls = []
+        self.opened = []
+        self.closed = []
+
+    def client(self, service_name, config=None):
+        session = self
+
+        class ClientContext:
+            async def __aenter__(self):
+                session.opened.append(service_name)
+                return FakeAioClient(service_name, session.responses, session.calls, session.delay)
+
+            async def __aexit__(self, *exc_info):
+                session.closed.append(service_name)
+
+        return ClientContext()
+
+
+def _manager(responses, cache_manager=None, delay=0.0):
+    manager = AsyncAWSClientManager(
+        profile="async-test",
+        region="us-east-1",
+        enable_caching=cache_manager is not None,
+        cache_manager=cache_manager,
+    )
+    manager._session = FakeSession(responses, delay)
+    return manager
+
+
+class TestAsyncAWSClientManager:
+    """Test async calls, pagination and cache integration."""
+
+    def setup_method(self):
+        """Reset singleton instances before each test."""
+        CacheManager.reset_instance()
+
+    def teardown_method(self):
+        """Reset singleton instances after each test."""
+        CacheManager.reset_instance()
+
+    def test_operations_run_concurrently(self):
+        """Test that gathered calls overlap instead of running one at a time."""
+        manager = _manager(
+            {("sso-admin", "describe_permission_set"): {"PermissionSet": {}}}, delay=0.1
+        )
+        client = manager.get_identity_center_client()
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    client.describe_permission_set(InstanceArn="i", PermissionSetArn=f"ps-{n}")
+                    for n in range(5)
+                )
+            )
+
+        started = time.perf_counter()
+        asyncio.run(manager.run(run()))
+
+        assert time.perf_counter() - started < 0.3
+        assert manager._session.opened == ["sso-admin"]
+        assert manager._session.closed == ["sso-admin"]
+
+    def test_paginate_combines_pages(self):
+        """Test that all pages of a paginated operation are returned."""
+        pages = [{"Users": [{"UserId": "u-1"}]}, {"Users": [{"UserId": "u-2"}]}]
+        manager = _manager({("identitystore", "list_users"): pages})
+
+        users = asyncio.run(
+            manager.run(
+                manager.get_identity_store_client().paginate(
+                    "list_users", "Users", IdentityStoreId="d-123"
+                )
+            )
+        )
+
+        assert [user["UserId"] for user in users] == ["u-1", "u-2"]
+
+    def test_read_operations_share_cache_with_blocking_clients(self):
+        """Test that a cached response is served without an API call."""
+        cache_manager = CacheManager(profile="async-test")
+        cache_manager._backend = None
+        manager = _manager({("sso-admin", "list_instances"): {"Instances": []}}, cache_manager)
+
+        # An entry written by the blocking cached client is served to the async client
+        blocking = CachedAwsClient(Mock(profile="async-test", region="us-east-1"), cache_manager)
+        key = blocking.cache_key("list_instances", {})
+        cache_manager.set(key, {"Instances": [{"InstanceArn": "cached"}]})
+
+        response = asyncio.run(manager.run(manager.get_identity_center_client().list_instances()))
+
+        assert response["Instances"][0]["InstanceArn"] == "cached"
+        assert manager._session.calls == []
+
+    def test_misses_are_cached_and_coalesced(self):
+        """Test that concurrent misses share one call whose result is cached."""
+        cache_manager = CacheManager(profile="async-test")
+        cache_manager._backend = None
+        manager = _manager(
+            {("identitystore", "describe_user"): {"UserId": "u-1"}}, cache_manager, delay=0.05
+        )
+        client = manager.get_identity_store_client()
+
+        async def run():
+            first = await asyncio.gather(
+                *(client.describe_user(IdentityStoreId="d-123", UserId="u-1") for _ in range(3))
+            )
+            second = await client.describe_user(IdentityStoreId="d-123", UserId="u-1")
+            return first, second
+
+        first, second = asyncio.run(manager.run(run()))
+
+        assert len(manager._session.calls) == 1
+        assert all(response == {"UserId": "u-1"} for response in first)
+        assert second == {"UserId": "u-1"}
+
+    def test_cache_lookups_do_not_block_the_event_loop(self):
+        """Test that gathered cache hits are looked up concurrently, off the event loop."""
+        cache_manager = CacheManager(profile="async-test")
+        cache_manager._backend = None
+        manager = _manager({}, cache_manager)
+        blocking = CachedAwsClient(Mock(profile="async-test", region="us-east-1"), cache_manager)
+        user_ids = [f"u-{i}" for i in range(5)]
+        for user_id in user_ids:
+            key = blocking.cache_key(
+                "describe_user", {"IdentityStoreId": "d-123", "UserId": user_id}
+            )
+            cache_manager.set(key, {"UserId": user_id})
+
+        memory_get = cache_manager.get
+
+        def slow_get(key):
+            # Stands in for a read that reaches the disk or DynamoDB backend
+            time.sleep(0.05)
+            return memory_get(key)
+
+        cache_manager.get = slow_get
+        client = manager.get_identity_store_client()
+
+        async def run():
+            return await asyncio.gather(
+                *(client.describe_user(IdentityStoreId="d-123", UserId=u) for u in user_ids)
+            )
+
+        start = time.perf_counter()
+        responses = asyncio.run(manager.run(run()))
+        elapsed = time.perf_counter() - start
+
+        assert [response["UserId"] for response in responses] == user_ids
+        assert manager._session.calls == []
+        assert elapsed < len(user_ids) * 0.05 / 2
+
+    def test_write_operations_are_not_cached(self):
+        """Test that mutating operations always reach AWS."""
+        cache_manager = CacheManager(profile="async-test")
+        cache_manager._backend = None
+        manager = _manager({("identitystore", "create_group"): {"GroupId": "g-1"}}, cache_manager)
+        client = manager.get_identity_store_client()
+
+        async def run():
+            await client.create_group(IdentityStoreId="d-123", DisplayName="Admins")
+            await client.create_group(IdentityStoreId="d-123", DisplayName="Admins")
+
+        asyncio.run(manager.run(run()))
+
+        assert len(manager._session.calls) == 2
+
+    def test_write_operations_invalidate_cached_lists(self):
+        """Test that a cached list is fetched again after a successful create."""
+        cache_manager = CacheManager(profile="async-test")
+        cache_manager._backend = None
+        users = [[{"Users": [{"UserId": "u-1"}]}]]
+        manager = _manager(
+            {
+                ("identitystore", "list_users"): lambda params: users[-1],
+                ("identitystore", "create_user"): {"UserId": "u-2"},
+            },
+            cache_manager,
+        )
+        client = manager.get_identity_store_client()
+
+        async def run():
+            before = await client.paginate("list_users", "Users", IdentityStoreId="d-123")
+            await client.create_user(IdentityStoreId="d-123", UserName="new")
+            users.append([{"Users": [{"UserId": "u-1"}, {"UserId": "u-2"}]}])
+            after = await client.paginate("list_users", "Users", IdentityStoreId="d-123")
+            return before, after
+
+        before, after = asyncio.run(manager.run(run()))
+
+        assert [user["UserId"] for user in before] == ["u-1"]
+        assert [user["UserId"] for user in after] == ["u-1", "u-2"]
+        assert [call[1] for call in manager._session.calls] == [
+            "list_users",
+            "create_user",
+            "list_users",
+        ]
+
+    def test_errors_propagate(self):
+        """Test that AWS errors reach the caller unchanged."""
+        error = ClientError({"Error": {"Code": "AccessDeniedException"}}, "ListInstances")
+        manager = _manager({("sso-admin", "list_instances"): error})
+
+        with pytest.raises(ClientError):
+            asyncio.run(manager.run(manager.get_identity_center_client().list_instances()))
+
+    def test_clients_are_reopened_in_a_new_event_loop(self):
+        """Test that each asyncio.run gets clients bound to its own loop."""
+        manager = _manager({("organizations", "list_roots"): {"Roots": []}})
+        client = manager.get_organizations_client()
+
+        asyncio.run(manager.run(client.list_roots()))
+        asyncio.run(manager.run(client.list_roots()))
+
+        assert manager._session.opened == ["organizations", "organizations"]
+        assert manager._session.closed == ["organizations", "organizations"]
+
+    def test_from_client_manager(self):
+        """Test that the async manager mirrors the blocking manager."""
+        client_manager = AWSClientManager(
+            region="eu-west-1", max_concurrency=24, cache_manager=Mock()
+        )
+        client_manager.profile = "async-test"
+
+        manager = client_manager.get_async_client_manager()
+
+        assert manager.profile == "async-test"
+        assert manager.region == "eu-west-1"
+        assert manager.max_concurrency == 24
+        assert manager.cache_manager is client_manager.cache_manager
+
+
+class TestCollectorWithAsyncClients:
+    """Test that the backup collector uses the asyncio clients when given."""
+
+    def test_collects_resources_concurrently(self):
+        """Test users, groups, permission sets and assignments through the async path."""
+        not_found = ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "Get")
+        responses = {
+            ("sso-admin", "list_instances"): {
+                "Instances": [{"InstanceArn": "arn:instance", "IdentityStoreId": "d-123"}]
+            },
+            ("identitystore", "list_users"): [{"Users": [{"UserId": "u-1", "UserName": "alice"}]}],
+            ("identitystore", "list_groups"): [
+                {"Groups": [{"GroupId": "g-1", "DisplayName": "Admins"}]}
+            ],
+            ("identitystore", "list_group_memberships"): [
+                {"GroupMemberships": [{"MemberId": {"UserId": "u-1"}}]}
+            ],
+            ("sso-admin", "list_permission_sets"): [{"PermissionSets": ["ps-1"]}],
+            ("sso-admin", "describe_permission_set"): {"PermissionSet": {"Name": "Admin"}},
+            ("sso-admin", "get_inline_policy_for_permission_set"): {"InlinePolicy": "{}"},
+            ("sso-admin", "list_managed_policies_in_permission_set"): [
+                {"AttachedManagedPolicies": [{"Arn": "arn:policy"}]}
+            ],
+            ("sso-admin", "list_customer_managed_policy_references_in_permission_set"): [
+                {"CustomerManagedPolicyReferences": []}
+            ],
+            ("sso-admin", "get_permissions_boundary_for_permission_set"): not_found,
+            ("sso-admin", "list_accounts_for_provisioned_permission_set"): [
+                {"AccountIds": ["111111111111", "222222222222"]}
+            ],
+            ("sso-admin", "list_account_assignments"): lambda params: [
+                {
+                    "AccountAssignments": [
+                        {"PrincipalType": "GROUP", "PrincipalId": f"g-{params['AccountId'][0]}"}
+                    ]
+                }
+            ],
+        }
+        async_clients = _manager(responses)
+        collector = IdentityCenterCollector(
+            Mock(spec=AWSClientManager), "arn:instance", async_client_manager=async_clients
+        )
+        options = BackupOptions()
+
+        async def collect():
+            return (
+                await collector.collect_users(options),
+                await collector.collect_groups(options),
+                await collector.collect_permission_sets(options),
+                await collector.collect_assignments(options),
+            )
+
+        users, groups, permission_sets, assignments = asyncio.run(async_clients.run(collect()))
+
+        assert [user.user_name for user in users] == ["alice"]
+        assert groups[0].members == ["u-1"]
+        assert permission_sets[0].managed_policies == ["arn:policy"]
+        assert permission_sets[0].inline_policy == "{}"
+        assert permission_sets[0].permissions_boundary is None
+        assert sorted(a.principal_id for a in assignments) == ["g-1", "g-2"]
+        collector.client_manager.get_identity_center_client.assert_not_called()
@@ -0,0 +1,137 @@
+"""Unit tests for the shared boto3 client pool."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+from src.awsideman.aws_clients.client_pool import ClientPool
+from src.awsideman.aws_clients.manager import AWSClientManager
+
+
+class _RawBody:
+    """Minimal urllib3-like body for a canned response."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    def stream(self, **kwargs):
+        yield self._body
+
+
+def _session():
+    return boto3.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        region_name="us-east-1",
+    )
+
+
+def _fake_send(delay: float = 0.0):
+    """before-send handler that answers every request without network access."""
+
+    def handler(request, **kwargs):
+        time.sleep(delay)
+        return AWSResponse(request.url, 200, {}, _RawBody(b'{"Users": []}'))
+
+    return handler
+
+
+class TestClientPool:
+    """Test client sharing, pool sizing and wait statistics."""
+
+    def test_client_is_shared_across_threads(self):
+        """Test that every thread gets the same client for a service."""
+        pool = ClientPool(_session(), max_connections=4)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: pool.get_client("identitystore"), range(16)))
+
+        assert all(client is clients[0] for client in clients)
+        assert clients[0].meta.config.max_pool_connections == 4
+
+    def test_concurrent_sends_are_limited_and_waits_recorded(self):
+        """Test that sends beyond the pool size wait and the wait is reported."""
+        pool = ClientPool(_session(), max_connections=2)
+        client = pool.get_client("identitystore")
+        client.meta.events.register("before-send", _fake_send(delay=0.05))
+        barrier = threading.Barrier(4)
+
+        def call(_):
+            barrier.wait()
+            return client.list_users(IdentityStoreId="d-1234567890")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(call, range(4)))
+
+        assert all(response["Users"] == [] for response in responses)
+        stats = pool.stats()["services"]["identitystore"]
+        assert stats["requests"] == 4
+        assert stats["peak_in_use"] == 2
+        assert stats["in_use"] == 0
+        assert stats["waits"] >= 1
+        assert stats["wait_seconds_max"] > 0
+
+    def test_failed_call_releases_slot(self):
+        """Test that an attempt ending in an error does not leak its slot."""
+        pool = ClientPool(_session(), max_connections=1)
+        client = pool.get_client("identitystore")
+
+        def failing_send(request, **kwargs):
+            raise RuntimeError("connection reset")
+
+        client.meta.events.register("before-send", failing_send)
+
+        for _ in range(2):
+            try:
+                client.list_users(IdentityStoreId="d-1234567890")
+            except RuntimeError:
+                pass
+
+        assert pool.stats()["services"]["identitystore"]["in_use"] == 0
+
+    def test_ensure_concurrency_grows_pools(self):
+        """Test that a larger worker count replaces clients with larger pools."""
+        pool = ClientPool(_session(), max_connections=2)
+        small = pool.get_client("organizations")
+
+        pool.ensure_concurrency(1)
+        assert pool.get_client("organizations") is small
+
+        pool.ensure_concurrency(20)
+        large = pool.get_client("organizations")
+        assert large is not small
+        assert large.meta.config.max_pool_connections == 20
+        assert pool.stats()["services"]["organizations"]["max_connections"] == 20
+
+
+class TestAWSClientManagerPool:
+    """Test that AWSClientManager hands out pooled clients."""
+
+    def test_get_client_reuses_pooled_client(self):
+        """Test that repeated calls do not create new clients."""
+        manager = AWSClientManager(region="us-east-1", enable_caching=False, max_concurrency=16)
+        manager.session = Mock()
+
+        first = manager.get_raw_identity_center_client()
+        second = manager.get_client("sso-admin")
+
+        assert first is second
+        manager.session.client.assert_called_once()
+        config = manager.session.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 16
+
+    def test_ensure_concurrency_and_stats(self):
+        """Test that declared worker counts size the pool reported in stats."""
+        manager = AWSClientManager(region="us-east-1", enable_caching=False)
+        manager.session = Mock()
+
+        manager.ensure_concurrency(32)
+        manager.get_client("identitystore")
+
+        stats = manager.get_client_pool_stats()
+        assert stats["max_connections"] == 32
+        assert stats["services"]["identitystore"]["waits"] == 0
@@ -251,7 +251,9 @@ class TestEnhancedAWSClientManager:
 
                 assert result == mock_cached_client
                 mock_cached_client_class.assert_called_once_with(
-                    mock_raw_client, mock_cache_manager
+                    mock_raw_client,
+                    mock_cache_manager,
+                    scope={"profile": "test-profile", "region": "us-west-2"},
                 )
 
     @patch("src.awsideman.aws_clients.manager.AWSClientManager._init_session")
@@ -0,0 +1,135 @@
+"""Unit tests for persisted organization hierarchy snapshots."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.awsideman.aws_clients.manager import OrganizationsClient, build_organization_hierarchy
+from src.awsideman.aws_clients.org_snapshot import (
+    HIERARCHY_SNAPSHOT_VERSION,
+    OrganizationSnapshotStore,
+)
+from src.awsideman.cache.manager import CacheManager
+from src.awsideman.utils.models import NodeType, OrgNode
+
+
+@pytest.fixture
+def cache_manager():
+    """Create an in-memory CacheManager."""
+    CacheManager.reset_instance()
+    manager = CacheManager(profile="snapshot-test")
+    manager._backend = None
+    yield manager
+    CacheManager.reset_instance()
+
+
+@pytest.fixture
+def organizations_client(cache_manager):
+    """Create a cached Organizations client stand-in with a small hierarchy."""
+    client = MagicMock(spec=OrganizationsClient)
+    client.cache_manager = cache_manager
+    client.client_manager = Mock(profile="snapshot-test", region="eu-west-1")
+    client.list_roots.return_value = [{"Id": "r-1234", "Name": "Root"}]
+    client.list_organizational_units_for_parent.side_effect = lambda parent_id: (
+        [{"Id": "ou-1234-prod", "Name": "Production"}] if parent_id == "r-1234" else []
+    )
+    client.list_accounts_for_parent.side_effect = lambda parent_id: (
+        [{"Id": "111111111111", "Name": "prod-account"}] if parent_id == "ou-1234-prod" else []
+    )
+    return client
+
+
+class TestOrganizationSnapshotStore:
+    """Test saving and loading hierarchy snapshots."""
+
+    def test_save_and_load(self, cache_manager):
+        """Test that a saved tree is loaded back unchanged."""
+        tree = [
+            OrgNode(
+                "r-1234",
+                "Root",
+                NodeType.ROOT,
+                [OrgNode("111111111111", "account", NodeType.ACCOUNT, [])],
+            )
+        ]
+        store = OrganizationSnapshotStore(cache_manager, profile="snapshot-test")
+
+        store.save(tree)
+        snapshot = store.load()
+
+        assert snapshot is not None
+        assert snapshot.roots == tree
+        assert snapshot.version == HIERARCHY_SNAPSHOT_VERSION
+        assert snapshot.age_seconds() < 60
+
+    def test_other_version_is_ignored(self, cache_manager):
+        """Test that snapshots written in another format are not used."""
+        store = OrganizationSnapshotStore(cache_manager, profile="snapshot-test")
+        cache_manager.set(
+            store.key,
+            {"version": HIERARCHY_SNAPSHOT_VERSION + 1, "created_at": 0, "roots": []},
+        )
+
+        assert store.load() is None
+
+    def test_snapshots_are_separated_by_profile(self, cache_manager):
+        """Test that each profile has its own snapshot."""
+        first = OrganizationSnapshotStore(cache_manager, profile="first")
+        second = OrganizationSnapshotStore(cache_manager, profile="second")
+
+        first.save([OrgNode("r-1234", "Root", NodeType.ROOT, [])])
+
+        assert second.load() is None
+        assert first.key.startswith("organization:")
+
+    def test_uncached_client_has_no_store(self):
+        """Test that clients without a cache manager do not use snapshots."""
+        assert OrganizationSnapshotStore.for_client(MagicMock(spec=OrganizationsClient)) is None
+
+
+class TestBuildHierarchyWithSnapshot:
+    """Test that build_organization_hierarchy reuses saved snapshots."""
+
+    def test_second_build_loads_snapshot(self, organizations_client):
+        """Test that a later build makes no Organizations calls."""
+        first = build_organization_hierarchy(organizations_client)
+        organizations_client.list_roots.reset_mock()
+        organizations_client.list_organizational_units_for_parent.reset_mock()
+
+        second = build_organization_hierarchy(organizations_client)
+
+        assert second == first
+        assert second[0].children[0].children[0].id == "111111111111"
+        organizations_client.list_roots.assert_not_called()
+        organizations_client.list_organizational_units_for_parent.assert_not_called()
+
+    def test_refresh_rebuilds_and_replaces_snapshot(self, organizations_client):
+        """Test that refresh walks the organization and saves the new tree."""
+        build_organization_hierarchy(organizations_client)
+        organizations_client.list_roots.return_value = [{"Id": "r-5678", "Name": "NewRoot"}]
+
+        refreshed = build_organization_hierarchy(organizations_client, refresh=True)
+        loaded = build_organization_hierarchy(organizations_client)
+
+        assert refreshed[0].id == "r-5678"
+        assert loaded[0].id == "r-5678"
+
+    def test_incomplete_tree_is_not_saved(self, organizations_client):
+        """Test that a tree with a failed child fetch is not saved as a snapshot."""
+
+        def list_accounts(parent_id):
+            if parent_id == "ou-1234-prod":
+                raise ClientError(
+                    {"Error": {"Code": "TooManyRequestsException", "Message": "Throttled"}},
+                    "ListAccountsForParent",
+                )
+            return []
+
+        organizations_client.list_accounts_for_parent.side_effect = list_accounts
+
+        tree = build_organization_hierarchy(organizations_client)
+
+        assert tree[0].children[0].children == []
+        store = OrganizationSnapshotStore.for_client(organizations_client)
+        assert store.load() is None
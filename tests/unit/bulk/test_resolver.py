@@ -99,6 +99,43 @@ class TestResourceResolver:
         )
         assert result["account_id"] == "123456789012"
 
+    def test_prefetch_cached_resolutions_uses_single_read(self, resource_resolver):
+        """Test that persisted resolutions are loaded with one get_many call."""
+        resource_resolver.cache_manager = Mock()
+        resource_resolver.cache_manager.get_many.return_value = {
+            "principal:USER:john.doe": {"success": True, "resolved_value": "user-1"},
+            "permission_set:ReadOnlyAccess": {"success": True, "resolved_value": "arn:ps-1"},
+            "account:Production": {"success": True, "resolved_value": "123456789012"},
+        }
+        assignments = [
+            {
+                "principal_name": "john.doe",
+                "principal_type": "USER",
+                "permission_set_name": "ReadOnlyAccess",
+                "account_name": "Production",
+            },
+            {
+                "principal_name": "john.doe",
+                "principal_type": "USER",
+                "permission_set_name": "ReadOnlyAccess",
+                "account_name": "210987654321",
+            },
+        ]
+
+        loaded = resource_resolver.prefetch_cached_resolutions(assignments)
+
+        assert loaded == 3
+        resource_resolver.cache_manager.get_many.assert_called_once_with(
+            ["principal:USER:john.doe", "permission_set:ReadOnlyAccess", "account:Production"]
+        )
+
+        results = [resource_resolver.resolve_assignment(a) for a in assignments]
+
+        assert all(result["resolution_success"] for result in results)
+        assert results[0]["account_id"] == "123456789012"
+        resource_resolver.cache_manager.get.assert_not_called()
+        resource_resolver.identity_store_client.list_users.assert_not_called()
+
 
 class TestAssignmentValidator:
     """Test AssignmentValidator class."""
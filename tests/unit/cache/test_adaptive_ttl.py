@@ -0,0 +1,202 @@
+"""Unit tests for adaptive per-operation TTLs."""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.awsideman.aws_clients.cached_client import CachedAwsClient
+from src.awsideman.cache.adaptive_ttl import AdaptiveTTLPolicy, fingerprint
+from src.awsideman.cache.aws_client import CachedAWSClient
+from src.awsideman.cache.manager import CacheManager
+
+
+class TestAdaptiveTTLPolicy:
+    """Test TTL adjustment from refresh outcomes."""
+
+    def test_first_fetch_keeps_base_ttl(self):
+        """Test that a key seen for the first time does not move the TTL."""
+        policy = AdaptiveTTLPolicy(min_ttl=60, max_ttl=3600)
+
+        assert policy.observe("list_users", "k1", {"Users": []}, 600) is None
+        assert policy.ttl_for("list_users", 600) == 600
+
+    def test_unchanged_refreshes_lengthen_ttl_up_to_max(self):
+        """Test that stable data drifts towards the upper bound."""
+        policy = AdaptiveTTLPolicy(min_ttl=60, max_ttl=1000, increase_factor=2.0)
+        policy.observe("describe_permission_set", "k1", {"Name": "Admin"}, 300)
+
+        assert policy.observe("describe_permission_set", "k1", {"Name": "Admin"}, 300) is False
+        assert policy.ttl_for("describe_permission_set", 300) == 600
+        policy.observe("describe_permission_set", "k1", {"Name": "Admin"}, 300)
+        assert policy.ttl_for("describe_permission_set", 300) == 1000
+
+    def test_changed_refreshes_shorten_ttl_down_to_min(self):
+        """Test that volatile data drifts towards the lower bound."""
+        policy = AdaptiveTTLPolicy(min_ttl=100, max_ttl=3600, decrease_factor=0.5)
+        for members in range(4):
+            policy.observe("list_group_memberships", "k1", {"Members": members}, 600)
+
+        assert policy.ttl_for("list_group_memberships", 600) == 100
+        family = policy.stats()["families"]["list_group_memberships"]
+        assert family["changed"] == 3
+        assert family["change_ratio"] == 1.0
+
+    def test_base_ttl_is_clamped_to_bounds(self):
+        """Test that the starting TTL respects the configured bounds."""
+        policy = AdaptiveTTLPolicy(min_ttl=60, max_ttl=120)
+
+        assert policy.ttl_for("list_users", 3600) == 120
+        assert policy.ttl_for("list_groups", 5) == 60
+
+    def test_tracked_keys_are_bounded(self):
+        """Test that only the most recent fingerprints are kept."""
+        policy = AdaptiveTTLPolicy(max_tracked_keys=2)
+        for index in range(3):
+            policy.observe("list_users", f"k{index}", index, 600)
+
+        assert policy.stats()["tracked_keys"] == 2
+        assert policy.observe("list_users", "k0", 0, 600) is None
+
+    def test_invalid_bounds_are_rejected(self):
+        """Test that inconsistent settings raise ValueError."""
+        with pytest.raises(ValueError):
+            AdaptiveTTLPolicy(min_ttl=600, max_ttl=60)
+        with pytest.raises(ValueError):
+            AdaptiveTTLPolicy(decrease_factor=1.5)
+
+    def test_fingerprint_ignores_key_order(self):
+        """Test that equal responses fingerprint the same regardless of dict order."""
+        assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+        assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+class TestAdaptiveTTLPersistence:
+    """Test that the learned state outlives one policy instance."""
+
+    def test_learning_continues_in_a_new_instance(self, tmp_path):
+        """Test that TTLs and fingerprints are loaded from the state file."""
+        state_file = tmp_path / "adaptive.state"
+        first = AdaptiveTTLPolicy(max_ttl=1000, increase_factor=2.0, state_file=state_file)
+        first.observe("describe_permission_set", "k1", {"Name": "Admin"}, 200)
+        first.observe("describe_permission_set", "k1", {"Name": "Admin"}, 200)
+        first.close()
+
+        second = AdaptiveTTLPolicy(max_ttl=1000, increase_factor=2.0, state_file=state_file)
+
+        assert second.ttl_for("describe_permission_set", 200) == 400
+        # The fingerprint of k1 is known, so this refresh counts as unchanged
+        assert second.observe("describe_permission_set", "k1", {"Name": "Admin"}, 200) is False
+        assert second.ttl_for("describe_permission_set", 200) == 800
+        assert second.stats()["families"]["describe_permission_set"]["refreshes"] == 2
+        second.close()
+
+    def test_state_is_saved_while_observing(self, tmp_path):
+        """Test that the state file is written once the save interval has passed."""
+        state_file = tmp_path / "adaptive.state"
+        policy = AdaptiveTTLPolicy(state_file=state_file, save_interval=0)
+
+        policy.observe("list_users", "k1", {"Users": []}, 600)
+
+        assert AdaptiveTTLPolicy(state_file=state_file).stats()["tracked_keys"] == 1
+        policy.close()
+
+    def test_unreadable_state_is_ignored(self, tmp_path):
+        """Test that a corrupt state file starts the policy from scratch."""
+        state_file = tmp_path / "adaptive.state"
+        state_file.write_text("not json", encoding="utf-8")
+
+        policy = AdaptiveTTLPolicy(state_file=state_file)
+
+        assert policy.stats()["families"] == {}
+        policy.close()
+
+
+class TestCachedClientsUseAdaptiveTTL:
+    """Test that the cached clients store entries with the learned TTL."""
+
+    def _cache_manager(self, policy):
+        cache_manager = Mock()
+        cache_manager.get.return_value = None
+        cache_manager.adaptive_ttl = policy
+        cache_manager.get_cache_config.return_value = None
+        return cache_manager
+
+    def test_cached_aws_client_sets_adaptive_ttl(self):
+        """Test the wrapper used by the cached client factories."""
+        policy = AdaptiveTTLPolicy(min_ttl=60, max_ttl=100000, increase_factor=2.0)
+        cache_manager = self._cache_manager(policy)
+        client = CachedAwsClient(Mock(), cache_manager)
+
+        client._execute_with_cache("describe_user", {"user_id": "u-1"}, lambda: {"UserId": "u-1"})
+        client._execute_with_cache("describe_user", {"user_id": "u-1"}, lambda: {"UserId": "u-1"})
+
+        ttls = [call.kwargs["ttl"] for call in cache_manager.set.call_args_list]
+        assert ttls[1] == 2 * ttls[0]
+
+    def test_static_ttl_when_disabled(self):
+        """Test that no TTL override is passed without a policy."""
+        cache_manager = self._cache_manager(None)
+        client = CachedAwsClient(Mock(), cache_manager)
+
+        client._execute_with_cache("describe_user", {"user_id": "u-1"}, lambda: {"UserId": "u-1"})
+
+        assert "ttl" not in cache_manager.set.call_args.kwargs
+
+    def test_unified_cached_client_adjusts_operation_ttl(self):
+        """Test the generic boto3 wrapper."""
+        policy = AdaptiveTTLPolicy(min_ttl=60, max_ttl=100000, decrease_factor=0.5)
+        cache_manager = self._cache_manager(policy)
+        client = CachedAWSClient(Mock(), "group", cache_manager)
+
+        ttl = client._get_adaptive_ttl("list_groups", "k1", ["a"], timedelta(minutes=15))
+        assert ttl == timedelta(minutes=15)
+        ttl = client._get_adaptive_ttl("list_groups", "k1", ["a", "b"], timedelta(minutes=15))
+        assert ttl == timedelta(seconds=450)
+
+
+class TestCacheManagerAdaptiveTTL:
+    """Test the policy owned by the cache manager."""
+
+    def setup_method(self):
+        """Reset singleton instances before each test."""
+        CacheManager.reset_instance()
+
+    def teardown_method(self):
+        """Reset singleton instances after each test."""
+        CacheManager.reset_instance()
+
+    def test_policy_is_created_from_config_and_reported(self):
+        """Test that the configured bounds are used and the TTLs appear in stats."""
+        manager = CacheManager(profile="adaptive-ttl-test")
+        manager._cache_config = Mock(adaptive_ttl=True, adaptive_ttl_min=30, adaptive_ttl_max=90)
+        manager._adaptive_ttl = manager._create_adaptive_ttl()
+
+        manager.adaptive_ttl.ttl_for("list_users", 600)
+
+        stats = manager.get_stats()["adaptive_ttl"]
+        assert stats["min_ttl"] == 30
+        assert stats["families"]["list_users"]["ttl"] == 90
+
+    def test_policy_state_is_kept_in_the_cache_directory(self, tmp_path):
+        """Test that the policy saves its state next to the profile's cache files."""
+        manager = CacheManager(profile="adaptive-ttl-test")
+        manager._cache_config = Mock(
+            adaptive_ttl=True,
+            adaptive_ttl_min=30,
+            adaptive_ttl_max=90,
+            file_cache_dir=str(tmp_path),
+            profile="adaptive-ttl-test",
+        )
+        policy = manager._create_adaptive_ttl()
+
+        assert policy.state_file.name == "_adaptive_ttl.state"
+        assert tmp_path in policy.state_file.parents
+        policy.close()
+
+    def test_policy_disabled_by_default(self):
+        """Test that the policy is off without configuration."""
+        manager = CacheManager(profile="adaptive-ttl-test")
+        manager._cache_config = Mock(adaptive_ttl=False)
+
+        assert manager._create_adaptive_ttl() is None
@@ -109,17 +109,19 @@ class TestCachedAWSClient:
         """Test cache key generation for user operations."""
         # List operation
         key = self.cached_client._generate_cache_key("list_users", (), {})
-        assert key.startswith("user:list:")
+        assert key.startswith("user:all:list_users:")
 
         # Describe operation with UserId in kwargs
-        key = self.cached_client._generate_cache_key("describe_user", (), {"UserId": "user-123"})
-        assert "user:describe:user-123" in key
-
-        # Describe operation with positional args
         key = self.cached_client._generate_cache_key(
+            "describe_user", (), {"IdentityStoreId": "identity-store-id", "UserId": "user-123"}
+        )
+        assert key.startswith("user:user-123:describe_user:")
+
+        # Describe operation with positional args maps to the same key
+        positional_key = self.cached_client._generate_cache_key(
             "describe_user", ("identity-store-id", "user-123"), {}
         )
-        assert "user:describe:user-123" in key
+        assert positional_key == key
 
     def test_generate_cache_key_for_group_operations(self):
         """Test cache key generation for group operations."""
@@ -131,11 +133,11 @@ class TestCachedAWSClient:
 
         # List operation
         key = client._generate_cache_key("list_groups", (), {})
-        assert key.startswith("group:list:")
+        assert key.startswith("group:all:list_groups:")
 
         # Describe operation with GroupId in kwargs
         key = client._generate_cache_key("describe_group", (), {"GroupId": "group-456"})
-        assert "group:describe:group-456" in key
+        assert key.startswith("group:group-456:describe_group:")
 
     def test_generate_cache_key_for_permission_set_operations(self):
         """Test cache key generation for permission set operations."""
@@ -147,7 +149,7 @@ class TestCachedAWSClient:
 
         # List operation
         key = client._generate_cache_key("list_permission_sets", (), {})
-        assert key.startswith("permission_set:list:")
+        assert key.startswith("permission_set:all:list_permission_sets:")
 
         # Describe operation with PermissionSetArn in kwargs
         key = client._generate_cache_key(
@@ -155,7 +157,7 @@ class TestCachedAWSClient:
             (),
             {"PermissionSetArn": "arn:aws:sso:::permissionSet/ssoins-123/ps-456"},
         )
-        assert "permission_set:describe:" in key
+        assert key.startswith("permission_set:ps-456:describe_permission_set:")
 
     def test_generate_cache_key_for_assignment_operations(self):
         """Test cache key generation for assignment operations."""
@@ -169,7 +171,8 @@ class TestCachedAWSClient:
         key = client._generate_cache_key(
             "list_account_assignments", (), {"AccountId": "123456789012"}
         )
-        assert "assignment:list:123456789012" in key
+        assert key.startswith("assignment:123456789012:list_account_assignments:")
+        account_key = key
 
         # Operation with both account ID and permission set ARN
         key = client._generate_cache_key(
@@ -180,7 +183,8 @@ class TestCachedAWSClient:
                 "PermissionSetArn": "arn:aws:sso:::permissionSet/ssoins-123/ps-456",
             },
         )
-        assert "assignment:list:123456789012" in key
+        assert key.startswith("assignment:123456789012:list_account_assignments:")
+        assert key != account_key
 
     def test_get_ttl_for_operation(self):
         """Test TTL determination for different operations."""
@@ -282,10 +286,9 @@ class TestCachedAWSClient:
             UserName="testuser", UserId="user-123"
         )
 
-        # Should call cache invalidation
-        self.mock_cache_manager.invalidate.assert_called_once()
-        call_args = self.mock_cache_manager.invalidate.call_args
-        assert call_args[0][0] == "create:user:user-123"
+        # Should invalidate user lists and the entries of the created user
+        invalidated = [call[0][0] for call in self.mock_cache_manager.invalidate.call_args_list]
+        assert invalidated == ["user:all:*", "user:user-123:*"]
 
     def test_write_operation_invalidation_error(self):
         """Test write operation with cache invalidation error."""
@@ -349,13 +352,17 @@ class TestCachedAWSClient:
 
     def test_invalidate_for_operation_user_resource(self):
         """Test cache invalidation for user resource operations."""
+        self.mock_cache_manager.invalidate.return_value = 2
+
         # Test with UserId in kwargs
-        _invalidated = self.cached_client._invalidate_for_operation(
+        invalidated = self.cached_client._invalidate_for_operation(
             "update_user", (), {"UserId": "user-123"}
         )
+        assert invalidated == 4
 
         # Should call cache manager invalidation
-        self.mock_cache_manager.invalidate.assert_called_once_with("update:user:user-123")
+        invalidated = [call[0][0] for call in self.mock_cache_manager.invalidate.call_args_list]
+        assert invalidated == ["user:all:*", "user:user-123:*"]
 
     def test_invalidate_for_operation_assignment_resource(self):
         """Test cache invalidation for assignment resource operations."""
@@ -365,6 +372,8 @@ class TestCachedAWSClient:
             cache_manager=self.mock_cache_manager,
         )
 
+        self.mock_cache_manager.invalidate.return_value = 3
+
         # Test with multiple identifiers
         client._invalidate_for_operation(
             "create_account_assignment",
@@ -377,7 +386,7 @@ class TestCachedAWSClient:
         )
 
         # Should call cache manager invalidation with pattern
-        self.mock_cache_manager.invalidate.assert_called_once_with("create:assignment:None")
+        self.mock_cache_manager.invalidate.assert_called_once_with("assignment:123456789012:*")
 
 
 class TestCachedIdentityCenterClient:
@@ -90,12 +90,9 @@ class TestCacheKeyConsistency:
         assert len(set(cache_keys)) == 1, f"Cache keys should be identical, got: {cache_keys}"
 
         # Verify the cache key format
-        _expected_key_pattern = (
-            f"permission_set:list:{instance_arn.replace(':', '_').replace('/', '_')}"
-        )
         assert cache_keys[0].startswith(
-            "permission_set:list:"
-        ), f"Cache key should start with 'permission_set:list:', got: {cache_keys[0]}"
+            "permission_set:all:list_permission_sets:"
+        ), f"Cache key should start with 'permission_set:all:list_permission_sets:', got: {cache_keys[0]}"
 
     def test_list_permission_sets_different_instances_different_keys(self):
         """Test that different SSO instances generate different cache keys."""
@@ -261,3 +258,109 @@ class TestCacheKeyConsistency:
 
         # Both should generate the same cache key
         assert key_1 == key_2, f"Different call styles should generate same key: {key_1} vs {key_2}"
+        key_3 = self.cached_identity_center._generate_cache_key(
+            "describe_permission_set",
+            (),
+            {"instance_arn": instance_arn, "permission_set_arn": permission_set_arn},
+        )
+        assert key_3 == key_1
+        assert key_1.startswith("permission_set:ps-1111111111111111:describe_permission_set:")
+
+    def test_write_invalidates_entries_of_the_resource(self):
+        """Test that a write drops cached reads of the written resource but not of others."""
+        self.mock_identity_store_client.describe_user.side_effect = lambda **kwargs: {
+            "UserId": kwargs["UserId"]
+        }
+        self.mock_identity_store_client.update_user.return_value = {}
+
+        for user_id in ("user-1", "user-2"):
+            self.cached_identity_store.describe_user(IdentityStoreId="d-1", UserId=user_id)
+
+        self.cached_identity_store.update_user(
+            IdentityStoreId="d-1", UserId="user-1", Operations=[]
+        )
+
+        for user_id in ("user-1", "user-2"):
+            self.cached_identity_store.describe_user(IdentityStoreId="d-1", UserId=user_id)
+
+        called_for = [
+            call.kwargs["UserId"]
+            for call in self.mock_identity_store_client.describe_user.call_args_list
+        ]
+        assert called_for == ["user-1", "user-2", "user-1"]
+
+    def test_both_cached_client_layers_share_keys(self):
+        """Test that both cached client layers key the same call identically."""
+        from src.awsideman.aws_clients.cached_client import CachedAwsClient
+        from src.awsideman.cache.key_builder import CacheKeyBuilder
+
+        instance_arn = "arn:aws:sso:::instance/ssoins-1234567890abcdef"
+        permission_set_arn = (
+            "arn:aws:sso:::permissionSet/ssoins-1234567890abcdef/ps-1111111111111111"
+        )
+        params = {"InstanceArn": instance_arn, "PermissionSetArn": permission_set_arn}
+        client_manager = Mock(profile="prod", region="eu-west-1")
+
+        aws_clients_layer = CachedAwsClient(client_manager, cache_manager=self.cache_manager)
+        cache_layer = CachedIdentityCenterClient(
+            self.mock_identity_center_client,
+            cache_manager=self.cache_manager,
+            scope=CacheKeyBuilder.client_scope("prod", "eu-west-1"),
+        )
+
+        key = aws_clients_layer._generate_cache_key("describe_permission_set", params)
+        assert cache_layer._generate_cache_key("describe_permission_set", (), params) == key
+
+        other_region = CachedIdentityCenterClient(
+            self.mock_identity_center_client,
+            cache_manager=self.cache_manager,
+            scope=CacheKeyBuilder.client_scope("prod", "us-east-1"),
+        )
+        assert other_region._generate_cache_key("describe_permission_set", (), params) != key
+
+    def test_stale_while_revalidate_entries_are_keyed_apart(self):
+        """Test that the cache layer never reads a stale-while-revalidate envelope."""
+        from src.awsideman.aws_clients.cached_client import OperationCache
+        from src.awsideman.cache.key_builder import CacheKeyBuilder
+
+        scope = CacheKeyBuilder.client_scope("prod", "eu-west-1")
+        params = {"InstanceArn": "arn:aws:sso:::instance/ssoins-1234567890abcdef"}
+        swr_cache = OperationCache(self.cache_manager, stale_while_revalidate=True, scope=scope)
+        swr_key = swr_cache.cache_key("list_permission_sets", params)
+        swr_cache.store_result("list_permission_sets", swr_key, {"PermissionSets": ["old"]})
+
+        self.mock_identity_center_client.list_permission_sets.return_value = {
+            "PermissionSets": ["new"]
+        }
+        cache_layer = CachedIdentityCenterClient(
+            self.mock_identity_center_client, cache_manager=self.cache_manager, scope=scope
+        )
+
+        assert cache_layer.list_permission_sets(**params) == {"PermissionSets": ["new"]}
+        assert swr_cache.get_fresh(swr_key) == (True, {"PermissionSets": ["old"]})
+
+    def test_processed_organizations_values_are_keyed_apart(self):
+        """Test that the cache layer never reads a value the Organizations wrapper processed."""
+        from src.awsideman.aws_clients.cached_client import (
+            CachedOrganizationsClient as WrapperOrganizationsClient,
+        )
+        from src.awsideman.cache.aws_client import CachedOrganizationsClient
+        from src.awsideman.cache.key_builder import CacheKeyBuilder
+
+        response = {"Account": {"Id": "111111111111", "Name": "prod"}}
+        raw_client = Mock()
+        raw_client.describe_account.return_value = response
+        client_manager = Mock(profile="prod", region="eu-west-1")
+        client_manager.get_raw_organizations_client.return_value = raw_client
+
+        wrapper = WrapperOrganizationsClient(client_manager, self.cache_manager)
+        assert wrapper.describe_account("111111111111") == response["Account"]
+
+        cache_layer = CachedOrganizationsClient(
+            raw_client,
+            cache_manager=self.cache_manager,
+            scope=CacheKeyBuilder.client_scope("prod", "eu-west-1"),
+        )
+        assert cache_layer.describe_account(AccountId="111111111111") == response
+        assert wrapper.describe_account("111111111111") == response["Account"]
+        assert raw_client.describe_account.call_count == 2
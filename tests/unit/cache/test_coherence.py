@@ -0,0 +1,147 @@
+"""Unit tests for the cross-process invalidation journal."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.awsideman.cache.coherence import JOURNAL_FILE_NAME, InvalidationJournal
+from src.awsideman.cache.manager import CacheManager
+
+
+class TestInvalidationJournal:
+    """Test publishing and polling between journal instances."""
+
+    def setup_method(self):
+        """Set up a temporary cache directory."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Remove the cache directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_poll_returns_records_of_other_processes(self):
+        """Test that records published elsewhere are returned once."""
+        reader = InvalidationJournal(self.temp_dir)
+        writer = InvalidationJournal(self.temp_dir)
+
+        writer.publish_keys(["user:all:list_users:abc"])
+        writer.publish_pattern("group:*")
+
+        records = reader.poll()
+        assert [record.get("k") or record.get("m") for record in records] == [
+            ["user:all:list_users:abc"],
+            "group:*",
+        ]
+        assert reader.poll() == []
+
+    def test_own_records_are_skipped(self):
+        """Test that a journal does not return what it published itself."""
+        journal = InvalidationJournal(self.temp_dir)
+
+        journal.publish_clear()
+
+        assert journal.poll() == []
+        assert journal.stats()["published"] == 1
+
+    def test_history_before_start_is_ignored(self):
+        """Test that a new reader starts at the end of the journal."""
+        InvalidationJournal(self.temp_dir).publish_clear()
+
+        assert InvalidationJournal(self.temp_dir).poll() == []
+
+    def test_partial_line_is_read_when_complete(self):
+        """Test that a record still being written is not consumed early."""
+        reader = InvalidationJournal(self.temp_dir)
+        journal_file = self.temp_dir / JOURNAL_FILE_NAME
+        with open(journal_file, "a") as f:
+            f.write('{"p":"other","k":["a"]')
+
+        assert reader.poll() == []
+
+        with open(journal_file, "a") as f:
+            f.write("}\n")
+
+        assert reader.poll() == [{"p": "other", "k": ["a"]}]
+
+    def test_rotation_makes_readers_clear(self):
+        """Test that readers which may have missed records get a clear record."""
+        reader = InvalidationJournal(self.temp_dir)
+        writer = InvalidationJournal(self.temp_dir, max_bytes=1)
+
+        writer.publish_keys(["a"])
+        reader.poll()
+        writer.publish_keys(["b"])
+
+        records = reader.poll()
+        assert records[0] == {"x": 1}
+        assert records[1]["k"] == ["b"]
+        assert reader.stats()["resets"] == 1
+        assert writer.stats()["rotations"] == 1
+
+    def test_deleted_journal_makes_readers_clear(self):
+        """Test that removing the journal resets readers."""
+        writer = InvalidationJournal(self.temp_dir)
+        writer.publish_keys(["a"])
+        reader = InvalidationJournal(self.temp_dir)
+
+        os.remove(self.temp_dir / JOURNAL_FILE_NAME)
+
+        assert reader.poll() == [{"x": 1}]
+
+
+class TestCacheManagerCoherence:
+    """Test that cache managers honour invalidations of other processes."""
+
+    def setup_method(self):
+        """Reset singleton instances and create a shared cache directory."""
+        CacheManager.reset_instance()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.manager = CacheManager(profile="coherence-test")
+        self.manager._backend = None
+        self.manager._journal = InvalidationJournal(self.temp_dir)
+        self.other_process = InvalidationJournal(self.temp_dir)
+
+    def teardown_method(self):
+        """Reset singleton instances and remove the cache directory."""
+        CacheManager.reset_instance()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_key_invalidation_evicts_memory_entry(self):
+        """Test that a key invalidated elsewhere is no longer served from memory."""
+        self.manager.set("user:all:list_users:abc", ["alice"])
+        self.manager.set("user:all:list_users:def", ["bob"])
+
+        self.other_process.publish_keys(["user:all:list_users:abc"])
+
+        assert self.manager.get("user:all:list_users:abc") is None
+        assert self.manager.get("user:all:list_users:def") == ["bob"]
+
+    def test_pattern_invalidation_evicts_matching_entries(self):
+        """Test that patterns are matched against the local memory tier."""
+        self.manager.set("group:all:list_groups:abc", ["admins"])
+        self.manager.set("user:all:list_users:abc", ["alice"])
+
+        self.other_process.publish_pattern("group:*")
+
+        assert self.manager.exists("group:all:list_groups:abc") is False
+        assert self.manager.get("user:all:list_users:abc") == ["alice"]
+
+    def test_clear_empties_memory_tier(self):
+        """Test that a clear published elsewhere empties the memory tier."""
+        self.manager.set("user:all:list_users:abc", ["alice"])
+
+        self.other_process.publish_clear()
+
+        assert self.manager.get_many(["user:all:list_users:abc"]) == {}
+
+    def test_local_invalidation_is_published(self):
+        """Test that invalidations in this process reach the journal."""
+        self.manager.set("user:all:list_users:abc", ["alice"])
+
+        self.manager.invalidate("user:*")
+        self.manager.delete_many(["user:all:list_users:abc"])
+
+        records = self.other_process.poll()
+        assert records[0]["m"] == "user:*"
+        assert records[1]["k"] == ["user:all:list_users:abc"]
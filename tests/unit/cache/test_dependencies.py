@@ -0,0 +1,108 @@
+"""Unit tests for cache dependency tags and the dependency index."""
+
+from src.awsideman.cache.dependencies import (
+    DependencyIndex,
+    dependency_tags,
+    fallback_patterns,
+    resource_tag,
+)
+
+
+class TestDependencyTags:
+    """Test derivation of dependency tags from requests and responses."""
+
+    def test_resource_tag_normalizes_permission_set_arn(self):
+        """Test that ARNs and bare permission set IDs produce the same tag."""
+        arn = "arn:aws:sso:::permissionSet/ssoins-123/ps-abc"
+
+        assert resource_tag("permission_set", arn) == "permission_set:ps-abc"
+        assert resource_tag("permission_set", "ps-abc") == "permission_set:ps-abc"
+        assert resource_tag("user", "u-1") == "user:u-1"
+
+    def test_request_parameters_in_both_naming_styles(self):
+        """Test that boto3 and snake_case parameter names are recognized."""
+        assert dependency_tags({"IdentityStoreId": "d-1", "UserId": "u-1"}) == ["user:u-1"]
+        assert dependency_tags(
+            {
+                "instance_arn": "arn:aws:sso:::instance/ssoins-1",
+                "permission_set_arn": "arn:aws:sso:::permissionSet/ssoins-1/ps-1",
+                "account_id": "123456789012",
+            }
+        ) == ["account:123456789012", "permission_set:ps-1"]
+
+    def test_principal_uses_principal_type(self):
+        """Test that principals are tagged by type, or as both types when unknown."""
+        assert dependency_tags({"PrincipalId": "g-1", "PrincipalType": "GROUP"}) == ["group:g-1"]
+        assert dependency_tags({"PrincipalId": "p-1"}) == ["group:p-1", "user:p-1"]
+
+    def test_response_items_are_tagged(self):
+        """Test that membership and assignment lists are tagged with their members."""
+        memberships = {
+            "GroupMemberships": [
+                {"GroupId": "g-1", "MemberId": {"UserId": "u-1"}},
+                {"GroupId": "g-1", "MemberId": {"UserId": "u-2"}},
+            ],
+            "NextToken": None,
+        }
+        assert dependency_tags({"GroupId": "g-1"}, memberships) == [
+            "group:g-1",
+            "user:u-1",
+            "user:u-2",
+        ]
+
+        assignments = {
+            "AccountAssignments": [
+                {
+                    "AccountId": "123456789012",
+                    "PermissionSetArn": "arn:aws:sso:::permissionSet/ssoins-1/ps-1",
+                    "PrincipalId": "u-1",
+                    "PrincipalType": "USER",
+                }
+            ]
+        }
+        assert dependency_tags(None, assignments) == [
+            "account:123456789012",
+            "permission_set:ps-1",
+            "user:u-1",
+        ]
+
+    def test_fallback_patterns(self):
+        """Test the glob patterns used for backends without tag support."""
+        assert fallback_patterns(["user:u-1", "account:123", "unknown:x"]) == [
+            "user:u-1:*",
+            "account:123:*",
+            "assignment:123:*",
+        ]
+
+
+class TestDependencyIndex:
+    """Test the in-memory reverse index."""
+
+    def test_add_replace_and_discard(self):
+        """Test that tags are replaced on rewrite and removed on discard."""
+        index = DependencyIndex()
+        index.add("k1", ["user:u-1", "group:g-1"])
+        index.add("k2", ["user:u-1"])
+
+        assert index.keys_for(["user:u-1"]) == {"k1", "k2"}
+        assert index.keys_for(["group:g-1", "group:g-2"]) == {"k1"}
+
+        index.add("k1", ["group:g-2"])
+        assert index.keys_for(["user:u-1"]) == {"k2"}
+
+        index.discard(["k2", "missing"])
+        assert index.keys_for(["user:u-1"]) == set()
+        assert index.stats() == {"indexed_keys": 1, "indexed_tags": 1, "complete": True}
+
+    def test_bounded_index_reports_incomplete(self):
+        """Test that dropping keys to stay within the bound marks the index incomplete."""
+        index = DependencyIndex(max_keys=2)
+        index.add("k1", ["user:u-1"])
+        index.add("k2", ["user:u-1"])
+        index.add("k3", ["user:u-1"])
+
+        assert index.keys_for(["user:u-1"]) == {"k2", "k3"}
+        assert index.complete is False
+
+        index.clear()
+        assert index.complete is True
@@ -1,5 +1,6 @@
 """Unit tests for cache invalidation engine."""
 
+import fnmatch
 from unittest.mock import Mock, call
 
 import pytest
@@ -14,6 +15,27 @@ from src.awsideman.cache.invalidation import (
 )
 
 
+def _invalidated_keys(mock_cache_manager):
+    """Collect every pattern and exact key the engine asked the manager to remove."""
+    keys = [call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list]
+    for call_args in mock_cache_manager.delete_many.call_args_list:
+        keys.extend(call_args[0][0])
+    return keys
+
+
+def _is_invalidated(key, actual_calls):
+    """Check that a key was removed directly or is covered by a removed wildcard pattern."""
+    return key in actual_calls or any(fnmatch.fnmatch(key, pattern) for pattern in actual_calls)
+
+
+def _invalidated_tags(mock_cache_manager):
+    """Collect every dependency tag the engine asked the manager to invalidate."""
+    tags = []
+    for call_args in mock_cache_manager.invalidate_tags.call_args_list:
+        tags.extend(call_args[0][0])
+    return tags
+
+
 class TestCacheInvalidationEngine:
     """Test cases for CacheInvalidationEngine."""
 
@@ -22,6 +44,8 @@ class TestCacheInvalidationEngine:
         """Create a mock cache manager for testing."""
         mock_manager = Mock(spec=ICacheManager)
         mock_manager.invalidate.return_value = 1  # Default return value
+        mock_manager.delete_many.side_effect = lambda keys: len(keys)
+        mock_manager.invalidate_tags.side_effect = lambda tags: len(tags)
         mock_manager.get_stats.return_value = {"invalidations": 5, "clears": 1}
         return mock_manager
 
@@ -44,7 +68,7 @@ class TestCacheInvalidationEngine:
 
         # Should invalidate user list caches
         expected_calls = [
-            call("user:list:*"),
+            call("user:all:*"),
         ]
 
         mock_cache_manager.invalidate.assert_has_calls(expected_calls, any_order=True)
@@ -56,20 +80,20 @@ class TestCacheInvalidationEngine:
 
         # Should invalidate user lists, specific user, and cross-resource caches
         expected_patterns = [
-            "user:list:*",
-            "user:describe:user-123",
-            "user:*:user-123",
-            "group:members:*",
+            "user:all:*",
+            "user:user-123:*",
+            "group:*:*members*",
             "assignment:*",
         ]
 
         # Verify all expected patterns were called
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_patterns:
-            assert pattern in actual_calls
+            assert _is_invalidated(pattern, actual_calls)
 
+        # Entries depending on the user are found by tag, not by an identifier glob
+        assert _invalidated_tags(mock_cache_manager) == ["user:user-123"]
+        assert "user:*" not in actual_calls
         assert result >= 0
 
     def test_user_delete_invalidation(self, invalidation_engine, mock_cache_manager):
@@ -78,18 +102,16 @@ class TestCacheInvalidationEngine:
 
         # Should invalidate user lists, specific user, and cross-resource caches
         expected_patterns = [
-            "user:list:*",
-            "user:*:user-123",
-            "group:members:*",
+            "user:all:*",
+            "group:*:*members*",
             "assignment:*",
         ]
 
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_patterns:
-            assert pattern in actual_calls
+            assert _is_invalidated(pattern, actual_calls)
 
+        assert _invalidated_tags(mock_cache_manager) == ["user:user-123"]
         assert result >= 0
 
     def test_group_create_invalidation(self, invalidation_engine, mock_cache_manager):
@@ -97,7 +119,7 @@ class TestCacheInvalidationEngine:
         result = invalidation_engine.invalidate_group_operations("create", "group-456")
 
         expected_calls = [
-            call("group:list:*"),
+            call("group:all:*"),
         ]
 
         mock_cache_manager.invalidate.assert_has_calls(expected_calls, any_order=True)
@@ -108,18 +130,16 @@ class TestCacheInvalidationEngine:
         result = invalidation_engine.invalidate_group_operations("update", "group-456")
 
         expected_patterns = [
-            "group:list:*",
-            "group:describe:group-456",
-            "group:*:group-456",
+            "group:all:*",
+            "group:group-456:*",
             "assignment:*",
         ]
 
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_patterns:
-            assert pattern in actual_calls
+            assert _is_invalidated(pattern, actual_calls)
 
+        assert _invalidated_tags(mock_cache_manager) == ["group:group-456"]
         assert result >= 0
 
     def test_group_membership_invalidation(self, invalidation_engine, mock_cache_manager):
@@ -130,19 +150,21 @@ class TestCacheInvalidationEngine:
         )
 
         expected_patterns = [
-            "group:members:group-456",
-            "group:describe:group-456",
-            "group:members:*",
-            "user:*:user-123",
-            "user:*:user-789",
+            "group:group-456:*",
+            "group:group-456:*",
         ]
 
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_patterns:
-            assert pattern in actual_calls
-
+            assert _is_invalidated(pattern, actual_calls)
+
+        # Only the group and the affected members are touched, not every membership list
+        assert "group:*:*members*" not in actual_calls
+        assert _invalidated_tags(mock_cache_manager) == [
+            "group:group-456",
+            "user:user-123",
+            "user:user-789",
+        ]
         assert result >= 0
 
     def test_permission_set_create_invalidation(self, invalidation_engine, mock_cache_manager):
@@ -152,7 +174,7 @@ class TestCacheInvalidationEngine:
         )
 
         expected_calls = [
-            call("permission_set:list:*"),
+            call("permission_set:all:*"),
         ]
 
         mock_cache_manager.invalidate.assert_has_calls(expected_calls, any_order=True)
@@ -165,19 +187,16 @@ class TestCacheInvalidationEngine:
         )
 
         expected_patterns = [
-            "permission_set:list:*",
-            "permission_set:describe:ps-TestPS",
-            "permission_set:*:ps-TestPS",
+            "permission_set:all:*",
+            "permission_set:ps-TestPS:*",
             "assignment:*",
-            "assignment:*:acc-123456789012*",
         ]
 
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_patterns:
-            assert pattern in actual_calls
+            assert _is_invalidated(pattern, actual_calls)
 
+        assert _invalidated_tags(mock_cache_manager) == ["permission_set:ps-TestPS"]
         assert result >= 0
 
     def test_assignment_create_invalidation(self, invalidation_engine, mock_cache_manager):
@@ -191,18 +210,18 @@ class TestCacheInvalidationEngine:
         )
 
         expected_patterns = [
-            "assignment:list:*",
-            "assignment:account_assignments:*",
-            "assignment:*:acc-123456789012*",
-            "user:*:user-123",
+            "assignment:*",
         ]
 
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_patterns:
-            assert pattern in actual_calls
+            assert _is_invalidated(pattern, actual_calls)
 
+        assert _invalidated_tags(mock_cache_manager) == [
+            "account:123456789012",
+            "permission_set:ps-TestPS",
+            "user:user-123",
+        ]
         assert result >= 0
 
     def test_assignment_delete_invalidation(self, invalidation_engine, mock_cache_manager):
@@ -216,18 +235,18 @@ class TestCacheInvalidationEngine:
         )
 
         expected_patterns = [
-            "assignment:list:*",
-            "assignment:account_assignments:*",
-            "assignment:*:acc-123456789012*",
-            "group:*:group-456",
+            "assignment:*",
         ]
 
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_patterns:
-            assert pattern in actual_calls
+            assert _is_invalidated(pattern, actual_calls)
 
+        assert _invalidated_tags(mock_cache_manager) == [
+            "account:123456789012",
+            "permission_set:ps-TestPS",
+            "group:group-456",
+        ]
         assert result >= 0
 
     def test_cross_resource_invalidation_user_update(self, invalidation_engine, mock_cache_manager):
@@ -236,15 +255,13 @@ class TestCacheInvalidationEngine:
 
         # Should invalidate group memberships and assignments
         expected_cross_patterns = [
-            "group:members:*",
+            "group:*:*members*",
             "assignment:*",
         ]
 
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
         for pattern in expected_cross_patterns:
-            assert pattern in actual_calls
+            assert _is_invalidated(pattern, actual_calls)
 
         assert result >= 0
 
@@ -257,17 +274,9 @@ class TestCacheInvalidationEngine:
         )
 
         # Should invalidate affected users' caches
-        expected_patterns = [
-            "user:*:user-123",
-            "user:*:user-789",
-        ]
-
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
-        for pattern in expected_patterns:
-            assert pattern in actual_calls
-
+        tags = _invalidated_tags(mock_cache_manager)
+        assert "user:user-123" in tags
+        assert "user:user-789" in tags
         assert result >= 0
 
     def test_pattern_deduplication(self, invalidation_engine, mock_cache_manager):
@@ -276,9 +285,7 @@ class TestCacheInvalidationEngine:
         result = invalidation_engine.invalidate_for_operation("update", "user", "user-123")
 
         # Get all called patterns
-        actual_calls = [
-            call_args[0][0] for call_args in mock_cache_manager.invalidate.call_args_list
-        ]
+        actual_calls = _invalidated_keys(mock_cache_manager)
 
         # Check that there are no duplicates
         assert len(actual_calls) == len(set(actual_calls))
@@ -333,6 +340,49 @@ class TestCacheInvalidationEngine:
         assert result >= 0
 
 
+class TestExactKeyBatching:
+    """Test that exact-key patterns are removed in one batch."""
+
+    def test_exact_keys_use_single_delete_many(self):
+        """Test that uncovered exact keys go to one delete_many call."""
+        mock_manager = Mock(spec=ICacheManager)
+        mock_manager.invalidate.return_value = 2
+        mock_manager.delete_many.side_effect = lambda keys: len(keys)
+        mock_manager.invalidate_tags.side_effect = lambda tags: len(tags)
+        engine = CacheInvalidationEngine(mock_manager)
+
+        patterns = [
+            "user:list:*",
+            "user:describe:user-1",
+            "group:describe:group-1",
+            "group:members:group-1",
+        ]
+        engine._get_invalidation_patterns = Mock(return_value=patterns)
+        engine._get_dependency_tags = Mock(return_value=[])
+
+        result = engine.invalidate_for_operation("update", "user", "user-1")
+
+        mock_manager.invalidate.assert_called_once_with("user:list:*")
+        mock_manager.delete_many.assert_called_once_with(
+            ["user:describe:user-1", "group:describe:group-1", "group:members:group-1"]
+        )
+        assert result == 5
+
+    def test_exact_keys_covered_by_wildcard_are_skipped(self):
+        """Test that exact keys matched by a wildcard in the same set are not re-sent."""
+        mock_manager = Mock(spec=ICacheManager)
+        mock_manager.invalidate.return_value = 1
+        engine = CacheInvalidationEngine(mock_manager)
+        engine._get_invalidation_patterns = Mock(
+            return_value=["user:*:user-1", "user:describe:user-1"]
+        )
+        engine._get_dependency_tags = Mock(return_value=[])
+
+        engine.invalidate_for_operation("update", "user", "user-1")
+
+        mock_manager.delete_many.assert_not_called()
+
+
 class TestConvenienceFunctions:
     """Test convenience functions for cache invalidation."""
 
@@ -341,6 +391,8 @@ class TestConvenienceFunctions:
         """Create a mock cache manager for testing."""
         mock_manager = Mock(spec=ICacheManager)
         mock_manager.invalidate.return_value = 1
+        mock_manager.delete_many.side_effect = lambda keys: len(keys)
+        mock_manager.invalidate_tags.side_effect = lambda tags: len(tags)
         return mock_manager
 
     def test_invalidate_user_cache(self, mock_cache_manager):
@@ -355,7 +407,9 @@ class TestConvenienceFunctions:
         result = invalidate_group_cache(mock_cache_manager, "add_member", "group-456", ["user-123"])
 
         assert result >= 0
-        mock_cache_manager.invalidate.assert_called()
+        mock_cache_manager.invalidate_tags.assert_called_once_with(
+            ["group:group-456", "user:user-123"]
+        )
 
     def test_invalidate_permission_set_cache(self, mock_cache_manager):
         """Test permission set cache invalidation convenience function."""
@@ -392,6 +446,8 @@ class TestInvalidationRules:
         """Create invalidation engine with mock cache manager."""
         mock_manager = Mock(spec=ICacheManager)
         mock_manager.invalidate.return_value = 1
+        mock_manager.delete_many.side_effect = lambda keys: len(keys)
+        mock_manager.invalidate_tags.side_effect = lambda tags: len(tags)
         return CacheInvalidationEngine(mock_manager)
 
     def test_user_invalidation_rules(self, invalidation_engine):
@@ -458,7 +514,7 @@ class TestInvalidationRules:
         patterns = invalidation_engine._get_cross_resource_patterns("update", "user", "user-123")
 
         expected_patterns = [
-            "group:members:*",
+            "group:*:*members*",
             "assignment:*",
         ]
 
@@ -477,13 +533,7 @@ class TestInvalidationRules:
             "update", "permission_set", "ps-TestPS", {"account_id": "123456789012"}
         )
 
-        expected_patterns = [
-            "assignment:*",
-            "assignment:*:acc-123456789012*",
-        ]
-
-        for expected in expected_patterns:
-            assert expected in patterns
+        assert "assignment:*" in patterns
 
     def test_cross_resource_patterns_assignment(self, invalidation_engine):
         """Test cross-resource patterns for assignment operations."""
@@ -495,11 +545,24 @@ class TestInvalidationRules:
         )
 
         expected_patterns = [
-            "assignment:list:*",
-            "assignment:account_assignments:*",
-            "assignment:*:acc-123456789012*",
-            "user:*:user-123",
+            "assignment:*",
         ]
 
         for expected in expected_patterns:
             assert expected in patterns
+
+    def test_dependency_tags_assignment(self, invalidation_engine):
+        """Test dependency tags for assignment operations with an unknown principal type."""
+        tags = invalidation_engine._get_dependency_tags(
+            "delete",
+            "assignment",
+            None,
+            {"account_id": "123456789012", "principal_id": "p-1", "principal_type": ""},
+        )
+
+        assert tags == ["account:123456789012", "user:p-1", "group:p-1"]
+
+    def test_dependency_tags_without_resource_id(self, invalidation_engine):
+        """Test that operations without an identifier fall back to a resource-wide pattern."""
+        assert invalidation_engine._get_dependency_tags("update", "user", None, {}) == []
+        assert "user:*" in invalidation_engine._get_cross_resource_patterns("update", "user")
@@ -14,6 +14,9 @@ from src.awsideman.cache.key_builder import (
     user_list_key,
 )
 
+# Parameter hash of a key built without additional parameters
+NO_PARAMS = CacheKeyBuilder._hash_parameters({})
+
 
 class TestCacheKeyBuilder:
     """Test cases for CacheKeyBuilder class."""
@@ -21,21 +24,22 @@ class TestCacheKeyBuilder:
     def test_build_basic_key(self):
         """Test basic key building with required components."""
         key = CacheKeyBuilder.build_key("user", "list")
-        assert key == "user:list"
+        assert key == f"user:all:list:{NO_PARAMS}"
 
         key = CacheKeyBuilder.build_key("user", "describe", "user-123")
-        assert key == "user:describe:user-123"
+        assert key == f"user:user-123:describe:{NO_PARAMS}"
 
         key = CacheKeyBuilder.build_key("group", "members", "group-456", "active")
-        assert key == "group:members:group-456:active"
+        assert key == f"group:group-456:members:active:{NO_PARAMS}"
 
     def test_build_key_with_parameters(self):
         """Test key building with additional parameters."""
         key = CacheKeyBuilder.build_key("user", "list", MaxResults=50, Filter="active")
 
         # Should include parameter hash
-        assert key.startswith("user:list:")
-        assert len(key.split(":")) == 3
+        assert key.startswith("user:all:list:")
+        assert len(key.split(":")) == 4
+        assert key != f"user:all:list:{NO_PARAMS}"
 
         # Same parameters should generate same key
         key2 = CacheKeyBuilder.build_key("user", "list", MaxResults=50, Filter="active")
@@ -49,105 +53,112 @@ class TestCacheKeyBuilder:
         """Test user-specific key building."""
         # List users
         key = CacheKeyBuilder.build_user_key("list")
-        assert key == "user:list"
+        assert key == f"user:all:list:{NO_PARAMS}"
 
         # Describe specific user
         key = CacheKeyBuilder.build_user_key("describe", "user-123")
-        assert key == "user:describe:user-123"
+        assert key == f"user:user-123:describe:{NO_PARAMS}"
 
         # With parameters
         key = CacheKeyBuilder.build_user_key("list", MaxResults=50)
-        assert key.startswith("user:list:")
+        assert key.startswith("user:all:list:")
 
     def test_build_group_key(self):
         """Test group-specific key building."""
         # List groups
         key = CacheKeyBuilder.build_group_key("list")
-        assert key == "group:list"
+        assert key == f"group:all:list:{NO_PARAMS}"
 
         # Describe specific group
         key = CacheKeyBuilder.build_group_key("describe", "group-456")
-        assert key == "group:describe:group-456"
+        assert key == f"group:group-456:describe:{NO_PARAMS}"
 
         # Group members
         key = CacheKeyBuilder.build_group_key("members", "group-456")
-        assert key == "group:members:group-456"
+        assert key == f"group:group-456:members:{NO_PARAMS}"
 
         # With sub-operation
         key = CacheKeyBuilder.build_group_key("members", "group-456", "active")
-        assert key == "group:members:group-456:active"
+        assert key == f"group:group-456:members:active:{NO_PARAMS}"
 
     def test_build_permission_set_key(self):
         """Test permission set key building."""
         # List permission sets
         key = CacheKeyBuilder.build_permission_set_key("list")
-        assert key == "permission_set:list"
+        assert key == f"permission_set:all:list:{NO_PARAMS}"
 
         # With ARN
         arn = "arn:aws:sso:::permissionSet/ssoins-123/ps-456"
         key = CacheKeyBuilder.build_permission_set_key("describe", arn)
-        assert key == "permission_set:describe:ps-456"
+        assert key == f"permission_set:ps-456:describe:{NO_PARAMS}"
 
         # With account ID
         key = CacheKeyBuilder.build_permission_set_key("describe", arn, "account-789")
-        assert key == "permission_set:describe:ps-456:account-789"
+        assert key == f"permission_set:ps-456:describe:account-789:{NO_PARAMS}"
 
     def test_build_assignment_key(self):
         """Test assignment key building."""
         # Basic assignment key
         key = CacheKeyBuilder.build_assignment_key("list")
-        assert key == "assignment:list"
+        assert key == f"assignment:all:list:{NO_PARAMS}"
 
         # With account ID
         key = CacheKeyBuilder.build_assignment_key("list", account_id="123456789012")
-        assert key == "assignment:list:acc-123456789012"
+        assert key == f"assignment:123456789012:list:{NO_PARAMS}"
 
-        # With multiple identifiers
+        # With multiple identifiers; the principal is part of the parameter hash
         arn = "arn:aws:sso:::permissionSet/ssoins-123/ps-456"
         key = CacheKeyBuilder.build_assignment_key(
             "list", account_id="123456789012", permission_set_arn=arn, principal_id="user-789"
         )
-        assert key == "assignment:list:acc-123456789012_ps-ps-456_prin-user-789"
+        assert key.startswith("assignment:123456789012:list:ps-456:")
+        assert key != f"assignment:123456789012:list:ps-456:{NO_PARAMS}"
 
     def test_build_account_key(self):
         """Test account key building."""
         # List accounts
         key = CacheKeyBuilder.build_account_key("list")
-        assert key == "account:list"
+        assert key == f"account:all:list:{NO_PARAMS}"
 
         # Specific account
         key = CacheKeyBuilder.build_account_key("describe", "123456789012")
-        assert key == "account:describe:123456789012"
+        assert key == f"account:123456789012:describe:{NO_PARAMS}"
 
     def test_build_invalidation_pattern(self):
         """Test invalidation pattern building."""
         # All keys
         pattern = CacheKeyBuilder.build_invalidation_pattern()
-        assert pattern == "*:*:*"
+        assert pattern == "*"
 
         # Specific resource type
         pattern = CacheKeyBuilder.build_invalidation_pattern("user")
-        assert pattern == "user:*:*"
+        assert pattern == "user:*"
 
         # Specific operation
         pattern = CacheKeyBuilder.build_invalidation_pattern("user", "list")
-        assert pattern == "user:list:*"
+        assert pattern == "user:*:list:*"
 
         # Specific identifier
         pattern = CacheKeyBuilder.build_invalidation_pattern("user", "describe", "user-123")
-        assert pattern == "user:describe:user-123"
+        assert pattern == "user:user-123:describe:*"
+
+        # Every entry of one resource
+        pattern = CacheKeyBuilder.build_invalidation_pattern("user", identifier="user-123")
+        assert pattern == "user:user-123:*"
 
     def test_parse_key(self):
         """Test key parsing functionality."""
         # Basic key
-        key = "user:list"
+        key = "user:all:list:abc123def456"
         parsed = CacheKeyBuilder.parse_key(key)
         assert parsed["resource_type"] == "user"
         assert parsed["operation"] == "list"
-        assert parsed["identifier"] is None
+        assert parsed["identifier"] == "all"
+        assert parsed["sub_identifier"] is None
+        assert parsed["parameters_hash"] == "abc123def456"
 
         # Full key
-        key = "group:members:group-456:active:abc123def456"
+        key = "group:group-456:members:active:abc123def456"
         parsed = CacheKeyBuilder.parse_key(key)
         assert parsed["resource_type"] == "group"
         assert parsed["operation"] == "members"
@@ -202,7 +213,7 @@ class TestCacheKeyBuilder:
 
         # Special characters should be replaced with underscores
         assert CacheKeyBuilder._sanitize_component("user@domain.com") == "user_domain_com"
-        assert CacheKeyBuilder._sanitize_component("group/name") == "group_name"
+        assert CacheKeyBuilder._sanitize_component("group:name") == "group_name"
 
         # Very long component should be truncated and hashed
         long_component = "x" * 100
@@ -286,43 +297,44 @@ class TestConvenienceFunctions:
     def test_user_list_key(self):
         """Test user list convenience function."""
         key = user_list_key()
-        assert key == "user:list"
+        assert key == f"user:all:list:{NO_PARAMS}"
 
         key = user_list_key(MaxResults=50)
-        assert key.startswith("user:list:")
+        assert key.startswith("user:all:list:")
 
     def test_user_describe_key(self):
         """Test user describe convenience function."""
         key = user_describe_key("user-123")
-        assert key == "user:describe:user-123"
+        assert key == f"user:user-123:describe:{NO_PARAMS}"
 
         key = user_describe_key("user-123", IncludeGroups=True)
-        assert key.startswith("user:describe:user-123:")
+        assert key.startswith("user:user-123:describe:")
+        assert key != f"user:user-123:describe:{NO_PARAMS}"
 
     def test_group_list_key(self):
         """Test group list convenience function."""
         key = group_list_key()
-        assert key == "group:list"
+        assert key == f"group:all:list:{NO_PARAMS}"
 
     def test_group_describe_key(self):
         """Test group describe convenience function."""
         key = group_describe_key("group-456")
-        assert key == "group:describe:group-456"
+        assert key == f"group:group-456:describe:{NO_PARAMS}"
 
     def test_group_members_key(self):
         """Test group members convenience function."""
         key = group_members_key("group-456")
-        assert key == "group:members:group-456"
+        assert key == f"group:group-456:members:{NO_PARAMS}"
 
     def test_permission_set_list_key(self):
         """Test permission set list convenience function."""
         key = permission_set_list_key()
-        assert key == "permission_set:list"
+        assert key == f"permission_set:all:list:{NO_PARAMS}"
 
     def test_assignment_list_key(self):
         """Test assignment list convenience function."""
         key = assignment_list_key("123456789012")
-        assert key == "assignment:list:acc-123456789012"
+        assert key == f"assignment:123456789012:list:{NO_PARAMS}"
 
 
 class TestEdgeCases:
@@ -330,13 +342,13 @@ class TestEdgeCases:
 
     def test_empty_identifier(self):
         """Test handling of empty identifiers."""
-        # Empty identifier should be skipped
+        # Empty identifier should fall back to "all"
         key = CacheKeyBuilder.build_key("user", "list", "")
-        assert key == "user:list"
+        assert key == f"user:all:list:{NO_PARAMS}"
 
-        # None identifier should be skipped
+        # None identifier should fall back to "all"
         key = CacheKeyBuilder.build_key("user", "list", None)
-        assert key == "user:list"
+        assert key == f"user:all:list:{NO_PARAMS}"
 
     def test_special_characters_in_identifiers(self):
         """Test handling of special characters in identifiers."""
@@ -438,3 +450,114 @@ class TestValidationErrors:
         # Multiple long components
         key = CacheKeyBuilder.build_key("user", "describe", "x" * 100, "y" * 100, param1="z" * 100)
         assert len(key) <= CacheKeyBuilder.MAX_KEY_LENGTH
+
+
+class TestOperationKeys:
+    """Test keys built for AWS API calls."""
+
+    INSTANCE_ARN = "arn:aws:sso:::instance/ssoins-1234567890abcdef"
+    PERMISSION_SET_ARN = "arn:aws:sso:::permissionSet/ssoins-1234567890abcdef/ps-1111111111111111"
+
+    def test_resource_identifier_and_operation_layout(self):
+        """Test that keys are laid out as resource/identifier/operation/param-hash."""
+        key = CacheKeyBuilder.build_operation_key(
+            "describe_user", kwargs={"IdentityStoreId": "d-1", "UserId": "u-1"}
+        )
+        resource, identifier, operation, param_hash = key.split(":")
+
+        assert (resource, identifier, operation) == ("user", "u-1", "describe_user")
+        assert len(param_hash) == 12
+
+    def test_call_styles_share_one_key(self):
+        """Test that positional, boto3 and snake_case arguments produce the same key."""
+        keys = {
+            CacheKeyBuilder.build_operation_key(
+                "describe_permission_set", (self.INSTANCE_ARN, self.PERMISSION_SET_ARN)
+            ),
+            CacheKeyBuilder.build_operation_key(
+                "describe_permission_set",
+                kwargs={
+                    "InstanceArn": self.INSTANCE_ARN,
+                    "PermissionSetArn": self.PERMISSION_SET_ARN,
+                },
+            ),
+            CacheKeyBuilder.build_operation_key(
+                "describe_permission_set",
+                kwargs={
+                    "instance_arn": self.INSTANCE_ARN,
+                    "permission_set_arn": self.PERMISSION_SET_ARN,
+                },
+            ),
+        }
+
+        assert len(keys) == 1
+        assert keys.pop().startswith("permission_set:ps-1111111111111111:describe_permission_set:")
+
+    def test_list_scope_is_hashed(self):
+        """Test that list keys share the collection prefix but differ by scope."""
+        key_1 = CacheKeyBuilder.build_operation_key("list_users", kwargs={"IdentityStoreId": "d-1"})
+        key_2 = CacheKeyBuilder.build_operation_key("list_users", kwargs={"IdentityStoreId": "d-2"})
+
+        assert key_1.startswith("user:all:list_users:")
+        assert key_2.startswith("user:all:list_users:")
+        assert key_1 != key_2
+
+    def test_pagination_only_keyed_for_specific_pages(self):
+        """Test that MaxResults is ignored unless a NextToken selects a page."""
+        base = {"IdentityStoreId": "d-1"}
+        initial = CacheKeyBuilder.build_operation_key("list_groups", kwargs=base)
+
+        assert initial == CacheKeyBuilder.build_operation_key(
+            "list_groups", kwargs={**base, "MaxResults": 50, "NextToken": None}
+        )
+        assert initial != CacheKeyBuilder.build_operation_key(
+            "list_groups", kwargs={**base, "MaxResults": 50, "NextToken": "page-2"}
+        )
+
+    def test_scope_separates_keys(self):
+        """Test that scope values such as the profile change only the parameter hash."""
+        key_1 = CacheKeyBuilder.build_operation_key("list_roots", scope={"profile": "a"})
+        key_2 = CacheKeyBuilder.build_operation_key("list_roots", scope={"profile": "b"})
+
+        assert key_1 != key_2
+        assert key_1.rsplit(":", 1)[0] == key_2.rsplit(":", 1)[0] == "organization:all:list_roots"
+
+    def test_unknown_operations_use_default_resource_type(self):
+        """Test operations that are not in the operation table."""
+        key = CacheKeyBuilder.build_operation_key(
+            "list_widgets", kwargs={"WidgetId": "w-1"}, default_resource_type="account"
+        )
+        assert key.startswith("account:all:list_widgets:")
+
+        assert CacheKeyBuilder.build_operation_key("custom_call").startswith("other:all:")
+
+        with pytest.raises(CacheKeyValidationError):
+            CacheKeyBuilder.build_operation_key("List-Widgets")
+
+    def test_prefix_covers_every_entry_of_a_resource(self):
+        """Test that the resource prefix matches all keys of the resource and no others."""
+        prefix = CacheKeyBuilder.build_prefix("permission_set", self.PERMISSION_SET_ARN)
+        assert prefix == "permission_set:ps-1111111111111111:"
+
+        describe = CacheKeyBuilder.build_operation_key(
+            "describe_permission_set", (self.INSTANCE_ARN, self.PERMISSION_SET_ARN)
+        )
+        policies = CacheKeyBuilder.build_operation_key(
+            "list_managed_policies_in_permission_set",
+            kwargs={"InstanceArn": self.INSTANCE_ARN, "PermissionSetArn": self.PERMISSION_SET_ARN},
+        )
+        listing = CacheKeyBuilder.build_operation_key(
+            "list_permission_sets", kwargs={"InstanceArn": self.INSTANCE_ARN}
+        )
+
+        assert describe.startswith(prefix)
+        assert policies.startswith(prefix)
+        assert not listing.startswith(prefix)
+        assert listing.startswith(CacheKeyBuilder.build_prefix("permission_set", "all"))
+
+    def test_operation_parameters(self):
+        """Test that positional arguments are named from the operation table."""
+        params = CacheKeyBuilder.operation_parameters(
+            "describe_group", ("d-1", "g-1"), {"Extra": None}
+        )
+        assert params == {"identitystoreid": "d-1", "groupid": "g-1"}
@@ -1,10 +1,16 @@
 """Unit tests for the unified cache manager."""
 
+import pickle
+import shutil
+import tempfile
 import threading
 import time
 from datetime import timedelta
+from unittest.mock import Mock, patch
 
+from src.awsideman.cache.backends.sqlite import SQLiteBackend
 from src.awsideman.cache.manager import CacheManager
+from src.awsideman.cache.memory_tier import MemoryTier
 
 
 class TestSingletonBehavior:
@@ -198,6 +204,175 @@ class TestCacheOperations:
         assert manager.get("key3") is None
 
 
+class TestBatchOperations:
+    """Test multi-key get, set and delete."""
+
+    def setup_method(self):
+        """Reset singleton instance and use a private backend."""
+        CacheManager.reset_instance()
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = CacheManager()
+        self.backend = SQLiteBackend(cache_dir=self.temp_dir)
+        self.manager._backend = self.backend
+
+    def teardown_method(self):
+        """Close the backend and reset the singleton."""
+        self.backend.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        CacheManager.reset_instance()
+
+    def test_set_many_and_get_many(self):
+        """Test that a batch round trips through memory and the backend."""
+        items = {f"user:u-{i}:describe_user:0a1b2c3d4e5f": {"UserId": f"u-{i}"} for i in range(5)}
+
+        with patch.object(self.backend, "set_many", wraps=self.backend.set_many) as spy:
+            self.manager.set_many(items)
+
+        spy.assert_called_once()
+        assert (
+            self.manager.get_many(list(items) + ["user:missing:describe_user:0a1b2c3d4e5f"])
+            == items
+        )
+        assert self.manager.get_stats()["sets"] == 5
+
+    def test_get_many_reads_memory_misses_in_one_backend_call(self):
+        """Test that only memory misses are read from the backend, in one call."""
+        self.manager.set_many({"user:list:a": 1, "user:list:b": 2})
+        self.manager._cache.clear()
+        self.manager.set("user:list:c", 3)
+
+        with patch.object(self.backend, "get_many", wraps=self.backend.get_many) as spy:
+            result = self.manager.get_many(["user:list:a", "user:list:b", "user:list:c"])
+
+        spy.assert_called_once_with(["user:list:a", "user:list:b"])
+        assert result == {"user:list:a": 1, "user:list:b": 2, "user:list:c": 3}
+        stats = self.manager.get_stats()
+        assert stats["backend_hits"] == 2
+        assert stats["memory_hits"] == 1
+
+    def test_delete_many_removes_from_both_tiers(self):
+        """Test that batch deletes reach memory and the backend."""
+        self.manager.set_many({"group:list:a": 1, "group:list:b": 2, "group:list:c": 3})
+
+        with patch.object(self.backend, "delete_many", wraps=self.backend.delete_many) as spy:
+            removed = self.manager.delete_many(["group:list:a", "group:list:b", "group:list:a"])
+
+        assert removed == 2
+        spy.assert_called_once_with(["group:list:a", "group:list:b"])
+        assert self.manager.get_many(["group:list:a", "group:list:b", "group:list:c"]) == {
+            "group:list:c": 3
+        }
+        assert self.backend.list_keys() == ["group:list:c"]
+
+    def test_pattern_invalidation_deletes_backend_keys_in_one_call(self):
+        """Test that wildcard invalidation removes matching backend keys in one batch."""
+        self.manager.set_many({"user:list:a": 1, "user:list:b": 2, "group:list:a": 3})
+
+        with patch.object(self.backend, "delete_many", wraps=self.backend.delete_many) as spy:
+            assert self.manager.invalidate("user:list:*") == 2
+
+        spy.assert_called_once()
+        assert self.backend.list_keys() == ["group:list:a"]
+
+    def test_sensitive_values_are_encrypted_in_batches(self):
+        """Test that batch writes encrypt sensitive values like single writes do."""
+        self.manager.set_many({"user:describe:secret": {"Password": "hunter2"}})
+        self.manager._cache.clear()
+
+        raw = pickle.loads(self.backend.get("user:describe:secret"))
+        assert raw["data"].get("encrypted") is True
+        assert self.manager.get_many(["user:describe:secret"]) == {
+            "user:describe:secret": {"Password": "hunter2"}
+        }
+
+
+class TestDependencyTagInvalidation:
+    """Test invalidation by dependency tag."""
+
+    def setup_method(self):
+        """Reset singleton instance and use a private backend."""
+        CacheManager.reset_instance()
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = CacheManager()
+        self.backend = SQLiteBackend(cache_dir=self.temp_dir)
+        self.manager._backend = self.backend
+
+    def teardown_method(self):
+        """Close the backend and reset the singleton."""
+        self.backend.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        CacheManager.reset_instance()
+
+    def _populate(self):
+        self.manager.set("describe_user_1", {"UserId": "u-1"}, tags=["user:u-1"])
+        self.manager.set(
+            "list_group_memberships_1",
+            {"GroupMemberships": []},
+            tags=["group:g-1", "user:u-1", "user:u-2"],
+        )
+        self.manager.set("describe_user_2", {"UserId": "u-2"}, tags=["user:u-2"])
+        self.manager.set("list_users_1", {"Users": []})
+
+    def test_invalidate_tags_removes_only_tagged_keys(self):
+        """Test that tagged entries are removed without listing or matching keys."""
+        self._populate()
+
+        with patch.object(self.backend, "list_keys", wraps=self.backend.list_keys) as spy:
+            removed = self.manager.invalidate_tags(["user:u-1"])
+
+        spy.assert_not_called()
+        assert removed == 2
+        assert self.manager.get("describe_user_1") is None
+        assert self.manager.get("list_group_memberships_1") is None
+        assert self.manager.get("describe_user_2") == {"UserId": "u-2"}
+        assert sorted(self.backend.list_keys()) == ["describe_user_2", "list_users_1"]
+
+    def test_invalidate_tags_finds_keys_written_by_other_processes(self):
+        """Test that keys tagged through the backend alone are invalidated."""
+        self._populate()
+        self.manager._dependencies.clear()
+        self.manager._cache.clear()
+
+        assert self.manager.invalidate_tags(["group:g-1"]) == 1
+        assert self.backend.get("list_group_memberships_1") is None
+        assert self.backend.get("describe_user_1") is not None
+
+    def test_untagged_rewrite_drops_tags(self):
+        """Test that rewriting a key without tags removes it from the index."""
+        self._populate()
+        self.manager.set("describe_user_1", {"UserId": "u-1"})
+
+        assert "describe_user_1" not in self.manager._dependencies.keys_for(["user:u-1"])
+        assert self.manager.get_stats()["dependency_index"]["indexed_keys"] == 2
+
+    def test_backend_without_tag_support_uses_fallback_patterns(self):
+        """Test that tags are translated to key patterns when the backend cannot store them."""
+        self.manager._backend = None
+        self.manager.set("user:u-1:describe_user:0a1b2c3d4e5f", {"UserId": "u-1"})
+        self.manager._dependencies.add("user:u-1:describe_user:0a1b2c3d4e5f", [])
+        self.manager._dependencies._complete = False
+
+        assert self.manager.invalidate_tags(["user:u-1"]) == 1
+        assert self.manager.get("user:u-1:describe_user:0a1b2c3d4e5f") is None
+
+    def test_set_many_records_tags(self):
+        """Test that batch writes index and persist tags."""
+        self.manager.set_many(
+            {"describe_group_1": {"GroupId": "g-1"}, "describe_group_2": {"GroupId": "g-2"}},
+            tags={"describe_group_1": ["group:g-1"], "describe_group_2": ["group:g-2"]},
+        )
+
+        assert self.backend.keys_for_tags(["group:g-2"]) == ["describe_group_2"]
+        assert self.manager.invalidate_tags(["group:g-1", "group:g-2"]) == 2
+
+    def test_clear_resets_dependency_index(self):
+        """Test that clearing the cache empties the dependency index."""
+        self._populate()
+        self.manager.clear()
+
+        assert self.manager._dependencies.stats()["indexed_keys"] == 0
+
+
 class TestPatternInvalidation:
     """Test pattern-based cache invalidation."""
 
@@ -494,6 +669,54 @@ class TestStatistics:
         assert stats["expired_entries"] == 2
         assert stats["active_entries"] == 1
 
+    def test_memory_tier_eviction_statistics(self):
+        """Test that memory tier evictions and residency are reported."""
+        manager = CacheManager()
+        manager._cache = MemoryTier(max_entries=2, max_bytes=1024 * 1024)
+
+        manager.set("tier_key1", "data1")
+        manager.set("tier_key2", "data2")
+        manager.set("tier_key3", "data3")
+
+        stats = manager.get_cache_stats()
+        tier_stats = stats["memory_tier"]
+        assert tier_stats["entries"] == 2
+        assert tier_stats["max_entries"] == 2
+        assert tier_stats["evictions"] == 1
+        assert tier_stats["size_bytes"] > 0
+        assert "tier_key1" not in manager._cache
+
+    def test_memory_and_backend_hit_counters(self):
+        """Test that hits served by memory and by the backend are counted separately."""
+        manager = CacheManager()
+        manager._cache = MemoryTier(max_entries=1, max_bytes=1024 * 1024)
+
+        manager.set("tier_key1", "data1")
+        manager.set("tier_key2", "data2")  # Evicts tier_key1 from memory
+
+        assert manager.get("tier_key2") == "data2"
+        stats = manager.get_cache_stats()
+        assert stats["memory_hits"] == 1
+
+        if manager.get_backend() is not None:
+            # Evicted entry is still served from the persistent backend
+            assert manager.get("tier_key1") == "data1"
+            assert manager.get_cache_stats()["backend_hits"] == 1
+
+    def test_compression_statistics_from_hybrid_local_tier(self):
+        """Test that compression stats of a hybrid backend's local tier are surfaced."""
+        manager = CacheManager()
+        compression = {"codec": "lz4", "compressed_entries": 3, "compressed_bytes": 100}
+        backend = Mock(backend_type="hybrid")
+        backend.get_stats.return_value = {
+            "backend_type": "hybrid",
+            "local_backend": {"total_entries": 3, "compression": compression},
+            "remote_backend": {"item_count": 3},
+        }
+        manager._backend = backend
+
+        assert manager.get_cache_stats()["compression"] == compression
+
 
 class TestUtilityMethods:
     """Test utility methods."""
@@ -604,9 +827,9 @@ class TestInvalidationIntegration:
         manager = CacheManager()
 
         # Set up some cache entries
-        manager.set("user:list:all", ["user1", "user2"])
-        manager.set("user:describe:user-123", {"id": "user-123"})
-        manager.set("group:members:group-456", ["user-123"])
+        manager.set("user:all:list_users:0a1b2c3d4e5f", ["user1", "user2"])
+        manager.set("user:user-123:describe_user:0a1b2c3d4e5f", {"id": "user-123"})
+        manager.set("group:group-456:list_group_memberships:0a1b2c3d4e5f", ["user-123"])
 
         # Invalidate for user update
         result = manager.invalidate_for_operation("update", "user", "user-123")
@@ -622,9 +845,9 @@ class TestInvalidationIntegration:
         manager = CacheManager()
 
         # Set up some cache entries
-        manager.set("group:list:all", ["group1", "group2"])
-        manager.set("group:describe:group-456", {"id": "group-456"})
-        manager.set("group:members:group-456", ["user-123"])
+        manager.set("group:all:list_groups:0a1b2c3d4e5f", ["group1", "group2"])
+        manager.set("group:group-456:describe_group:0a1b2c3d4e5f", {"id": "group-456"})
+        manager.set("group:group-456:list_group_memberships:0a1b2c3d4e5f", ["user-123"])
 
         # Invalidate for group update
         result = manager.invalidate_for_operation("update", "group", "group-456")
@@ -640,9 +863,9 @@ class TestInvalidationIntegration:
         manager = CacheManager()
 
         # Set up some cache entries
-        manager.set("group:members:group-456", ["user-123", "user-789"])
-        manager.set("user:describe:user-123", {"id": "user-123"})
-        manager.set("user:describe:user-789", {"id": "user-789"})
+        manager.set("group:group-456:list_group_memberships:0a1b2c3d4e5f", ["user-123", "user-789"])
+        manager.set("user:user-123:describe_user:0a1b2c3d4e5f", {"id": "user-123"})
+        manager.set("user:user-789:describe_user:0a1b2c3d4e5f", {"id": "user-789"})
 
         # Invalidate for group membership change
         result = manager.invalidate_for_operation(
@@ -660,7 +883,7 @@ class TestInvalidationIntegration:
         manager = CacheManager()
 
         # Set up some cache entries
-        manager.set("user:list:all", ["user1", "user2"])
+        manager.set("user:all:list_users:0a1b2c3d4e5f", ["user1", "user2"])
 
         # Should work without additional context
         result = manager.invalidate_for_operation("create", "user")
@@ -672,9 +895,13 @@ class TestInvalidationIntegration:
         manager = CacheManager()
 
         # Set up some cache entries
-        manager.set("permission_set:list:all", ["ps1", "ps2"])
-        manager.set("permission_set:describe:ps-TestPS", {"name": "TestPS"})
-        manager.set("assignment:list:acc-123456789012", ["assignment1"])
+        manager.set("permission_set:all:list_permission_sets:0a1b2c3d4e5f", ["ps1", "ps2"])
+        manager.set(
+            "permission_set:ps-TestPS:describe_permission_set:0a1b2c3d4e5f", {"name": "TestPS"}
+        )
+        manager.set(
+            "assignment:123456789012:list_account_assignments:0a1b2c3d4e5f", ["assignment1"]
+        )
 
         # Invalidate for permission set update
         result = manager.invalidate_for_operation(
@@ -692,9 +919,13 @@ class TestInvalidationIntegration:
         manager = CacheManager()
 
         # Set up some cache entries
-        manager.set("assignment:list:all", ["assignment1", "assignment2"])
-        manager.set("assignment:account_assignments:acc-123456789012", ["assignment1"])
-        manager.set("user:describe:user-123", {"id": "user-123"})
+        manager.set(
+            "assignment:all:list_account_assignments:0a1b2c3d4e5f", ["assignment1", "assignment2"]
+        )
+        manager.set(
+            "assignment:123456789012:list_account_assignments:1a2b3c4d5e6f", ["assignment1"]
+        )
+        manager.set("user:user-123:describe_user:0a1b2c3d4e5f", {"id": "user-123"})
 
         # Invalidate for assignment creation
         result = manager.invalidate_for_operation(
@@ -709,3 +940,172 @@ class TestInvalidationIntegration:
 
         # Note: In current implementation, invalidate_for_operation only clears in-memory cache
         # Backend entries remain and will be reloaded on next access
+
+
+class TestConcurrentBackendFill:
+    """Test that backend reads racing with writes do not resurrect stale values."""
+
+    def setup_method(self):
+        """Reset singleton instance before each test."""
+        CacheManager.reset_instance()
+
+    def teardown_method(self):
+        """Reset singleton instance after each test."""
+        CacheManager.reset_instance()
+
+    def test_set_during_backend_miss_is_not_overwritten(self):
+        """Test that a get() whose backend read began before a set() does not fill memory."""
+        key = "user:all:list_users:abc"
+        read_started = threading.Event()
+        release_read = threading.Event()
+        stored = {}
+
+        class SlowBackend:
+            def get(self, cache_key):
+                data = stored.get(cache_key)
+                read_started.set()
+                release_read.wait(5)
+                return data
+
+            def set(self, cache_key, data, ttl=None, operation=None):
+                stored[cache_key] = data
+
+        manager = CacheManager(profile="fill-race-test")
+        manager._backend = SlowBackend()
+        manager._backend_tier = None
+        manager._journal = None
+        manager.set(key, ["old"])
+        manager._cache.pop(key, None)
+
+        reader = threading.Thread(target=manager.get, args=(key,))
+        reader.start()
+        assert read_started.wait(5)
+
+        # The backend read holds the old bytes; write the new value meanwhile
+        writer = threading.Thread(target=manager.set, args=(key, ["new"]))
+        writer.start()
+        writer.join(5)
+        release_read.set()
+        reader.join(5)
+
+        assert manager.get(key) == ["new"]
+
+    def test_read_during_backend_delete_is_not_kept(self):
+        """Test that a get() that reads the backend before a delete finishes does not fill memory."""
+        key = "user:all:list_users:abc"
+        delete_started = threading.Event()
+        release_delete = threading.Event()
+        stored = {}
+
+        class SlowDeleteBackend:
+            def get(self, cache_key):
+                return stored.get(cache_key)
+
+            def set(self, cache_key, data, ttl=None, operation=None):
+                stored[cache_key] = data
+
+            def delete_many(self, cache_keys):
+                delete_started.set()
+                release_delete.wait(5)
+                for cache_key in cache_keys:
+                    stored.pop(cache_key, None)
+
+        manager = CacheManager(profile="delete-race-test")
+        manager._backend = SlowDeleteBackend()
+        manager._backend_tier = None
+        manager._journal = None
+        manager.set(key, ["old"])
+
+        deleter = threading.Thread(target=manager.delete_many, args=([key],))
+        deleter.start()
+        assert delete_started.wait(5)
+
+        # The memory entry is gone but the backend still holds the old bytes
+        assert manager.get(key) == ["old"]
+        release_delete.set()
+        deleter.join(5)
+
+        assert manager.get(key) is None
+
+    def test_backend_write_does_not_hold_key_lock(self):
+        """Test that a slow backend write does not block a newer write of the same key."""
+        key = "user:all:list_users:abc"
+        write_started = threading.Event()
+        release_write = threading.Event()
+        stored = {}
+
+        class SlowSetBackend:
+            def get(self, cache_key):
+                return stored.get(cache_key)
+
+            def set(self, cache_key, data, ttl=None, operation=None):
+                if not write_started.is_set():
+                    write_started.set()
+                    release_write.wait(5)
+                stored[cache_key] = data
+
+        manager = CacheManager(profile="write-lock-test")
+        manager._backend = SlowSetBackend()
+        manager._backend_tier = None
+        manager._journal = None
+
+        first = threading.Thread(target=manager.set, args=(key, ["old"]))
+        first.start()
+        assert write_started.wait(5)
+
+        second = threading.Thread(target=manager.set, args=(key, ["new"]))
+        second.start()
+        # Watch the memory tier directly; the first write is still in the backend
+        deadline = time.time() + 2
+        while (manager._cache.get(key) or {}).get("data") != ["new"] and time.time() < deadline:
+            time.sleep(0.01)
+        updated_before_release = (manager._cache.get(key) or {}).get("data") == ["new"]
+
+        release_write.set()
+        first.join(5)
+        second.join(5)
+
+        assert updated_before_release
+        assert pickle.loads(stored[key])["data"] == ["new"]
+
+    def test_backend_batch_write_does_not_hold_key_locks(self):
+        """Test that a slow backend batch write does not block a newer write of its keys."""
+        key = "user:all:list_users:abc"
+        write_started = threading.Event()
+        release_write = threading.Event()
+        stored = {}
+
+        class SlowBatchBackend:
+            def get(self, cache_key):
+                return stored.get(cache_key)
+
+            def set(self, cache_key, data, ttl=None, operation=None):
+                stored[cache_key] = data
+
+            def set_many(self, payloads, ttl=None, operation=None):
+                write_started.set()
+                release_write.wait(5)
+                stored.update(payloads)
+
+        manager = CacheManager(profile="batch-write-lock-test")
+        manager._backend = SlowBatchBackend()
+        manager._backend_tier = None
+        manager._journal = None
+
+        batch = threading.Thread(target=manager.set_many, args=({key: ["old"]},))
+        batch.start()
+        assert write_started.wait(5)
+
+        writer = threading.Thread(target=manager.set, args=(key, ["new"]))
+        writer.start()
+        deadline = time.time() + 2
+        while (manager._cache.get(key) or {}).get("data") != ["new"] and time.time() < deadline:
+            time.sleep(0.01)
+        updated_before_release = (manager._cache.get(key) or {}).get("data") == ["new"]
+
+        release_write.set()
+        batch.join(5)
+        writer.join(5)
+
+        assert updated_before_release
+        assert pickle.loads(stored[key])["data"] == ["new"]
@@ -264,6 +264,16 @@ class TestCacheManagerErrorHandling:
         results = []
         errors = []
 
+        # Patching the shared instance from several threads at once can leave the
+        # mock installed, so patch once and fail only in threads that ask for it.
+        failing = threading.local()
+        real_get_internal = manager._get_internal
+
+        def get_internal(key):
+            if getattr(failing, "enabled", False):
+                raise CacheBackendError("Failed")
+            return real_get_internal(key)
+
         def worker(worker_id):
             try:
                 # Some workers will succeed, others will fail
@@ -273,20 +283,19 @@ class TestCacheManagerErrorHandling:
                     results.append(result)
                 else:
                     # Force failure for odd workers
-                    with patch.object(
-                        manager, "_get_internal", side_effect=CacheBackendError("Failed")
-                    ):
-                        result = manager.get(f"key_{worker_id}")
-                        results.append(result)  # Should be None due to graceful degradation
+                    failing.enabled = True
+                    result = manager.get(f"key_{worker_id}")
+                    results.append(result)  # Should be None due to graceful degradation
             except Exception as e:
                 errors.append(e)
 
         # Run multiple threads
-        threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+        with patch.object(manager, "_get_internal", side_effect=get_internal):
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
 
         # Should have results from all threads (no exceptions should propagate)
         assert len(results) == 10
@@ -0,0 +1,187 @@
+"""Unit tests for the bounded LRU memory tier."""
+
+import threading
+
+import pytest
+
+from src.awsideman.cache.memory_tier import MemoryTier, StripedMemoryTier, estimate_entry_size
+
+
+def _entry(value):
+    return {"data": value, "expires_at": 0, "created_at": 0, "ttl": 0}
+
+
+class TestMemoryTier:
+    """Test LRU and size-bound behaviour of MemoryTier."""
+
+    def test_put_and_get(self):
+        """Test basic storage and retrieval."""
+        tier = MemoryTier(max_entries=10, max_bytes=1024 * 1024)
+        tier.put("a", _entry(1), size=10)
+
+        assert "a" in tier
+        assert tier.get("a")["data"] == 1
+        assert tier["a"]["data"] == 1
+        assert len(tier) == 1
+        assert tier.total_bytes == 10
+
+    def test_evicts_least_recently_used_by_count(self):
+        """Test that the least recently used entry is evicted when full."""
+        tier = MemoryTier(max_entries=2, max_bytes=1024)
+        tier.put("a", _entry(1), size=1)
+        tier.put("b", _entry(2), size=1)
+
+        # Touch "a" so "b" becomes the eviction candidate
+        tier.get("a")
+        evicted = tier.put("c", _entry(3), size=1)
+
+        assert evicted == ["b"]
+        assert sorted(tier.keys()) == ["a", "c"]
+        assert tier.get_stats()["evictions"] == 1
+
+    def test_evicts_by_size(self):
+        """Test that the byte bound triggers eviction."""
+        tier = MemoryTier(max_entries=100, max_bytes=100)
+        tier.put("a", _entry(1), size=60)
+        evicted = tier.put("b", _entry(2), size=60)
+
+        assert evicted == ["a"]
+        assert tier.total_bytes == 60
+        assert tier.get_stats()["evicted_bytes"] == 60
+
+    def test_oversized_entry_is_rejected(self):
+        """Test that an entry larger than the tier does not flush other entries."""
+        tier = MemoryTier(max_entries=10, max_bytes=100)
+        tier.put("a", _entry(1), size=10)
+
+        assert tier.put("big", _entry(2), size=1000) == []
+        assert "big" not in tier
+        assert "a" in tier
+        assert tier.get_stats()["rejected_oversized"] == 1
+
+    def test_replace_updates_size(self):
+        """Test that replacing an entry accounts for the new size only."""
+        tier = MemoryTier(max_entries=10, max_bytes=1000)
+        tier.put("a", _entry(1), size=100)
+        tier.put("a", _entry(2), size=30)
+
+        assert len(tier) == 1
+        assert tier.total_bytes == 30
+
+    def test_delete_pop_and_clear(self):
+        """Test removal operations keep byte accounting consistent."""
+        tier = MemoryTier(max_entries=10, max_bytes=1000)
+        tier.put("a", _entry(1), size=10)
+        tier.put("b", _entry(2), size=20)
+
+        del tier["a"]
+        assert tier.total_bytes == 20
+        assert tier.pop("b")["data"] == 2
+        assert tier.total_bytes == 0
+
+        tier["c"] = _entry(3)
+        tier.clear()
+        assert len(tier) == 0
+        assert tier.total_bytes == 0
+
+        with pytest.raises(KeyError):
+            del tier["missing"]
+
+    def test_iteration_is_snapshot(self):
+        """Test that entries can be deleted while iterating."""
+        tier = MemoryTier(max_entries=10, max_bytes=1000)
+        for key in ("a", "b", "c"):
+            tier.put(key, _entry(key), size=1)
+
+        for key, _ in tier.items():
+            del tier[key]
+
+        assert len(tier) == 0
+
+    def test_invalid_bounds(self):
+        """Test that non-positive bounds are rejected."""
+        with pytest.raises(ValueError):
+            MemoryTier(max_entries=0)
+        with pytest.raises(ValueError):
+            MemoryTier(max_bytes=0)
+
+    def test_estimate_entry_size(self):
+        """Test size estimation grows with payload size."""
+        small = estimate_entry_size(_entry("x"))
+        large = estimate_entry_size(_entry("x" * 10000))
+
+        assert large > small
+        assert estimate_entry_size(_entry(lambda: None)) > 0
+
+
+class TestStripedMemoryTier:
+    """Test the lock-striped memory tier."""
+
+    def test_put_get_pop(self):
+        """Test basic storage, retrieval and removal across stripes."""
+        tier = StripedMemoryTier(max_entries=100, max_bytes=1024 * 1024, stripes=4)
+        for i in range(20):
+            tier.put(f"key-{i}", _entry(i), size=10)
+
+        assert len(tier) == 20
+        assert tier.get("key-5")["data"] == 5
+        assert tier["key-6"]["data"] == 6
+        assert tier.pop("key-5")["data"] == 5
+        assert "key-5" not in tier
+        assert tier.pop("key-5") is None
+        assert tier.total_bytes == 190
+        assert sorted(tier.keys()) == sorted(f"key-{i}" for i in range(20) if i != 5)
+
+        del tier["key-6"]
+        with pytest.raises(KeyError):
+            del tier["key-6"]
+
+        tier.clear()
+        assert len(tier) == 0
+        assert tier.total_bytes == 0
+
+    def test_bounds_are_split_across_stripes(self):
+        """Test that the overall entry bound holds."""
+        tier = StripedMemoryTier(max_entries=40, max_bytes=1024 * 1024, stripes=4)
+        for i in range(400):
+            tier.put(f"key-{i}", _entry(i), size=10)
+
+        stats = tier.get_stats()
+        assert len(tier) <= 40
+        assert stats["entries"] == len(tier)
+        assert stats["evictions"] == 400 - len(tier)
+        assert stats["stripes"] == 4
+        assert stats["max_entries"] == 40
+
+    def test_stripes_capped_by_max_entries(self):
+        """Test that small tiers never get empty stripes."""
+        tier = StripedMemoryTier(max_entries=2, max_bytes=1024, stripes=8)
+        assert tier.get_stats()["stripes"] == 2
+
+    def test_concurrent_access(self):
+        """Test that concurrent writers and readers keep the counters consistent."""
+        tier = StripedMemoryTier(max_entries=1000, max_bytes=1024 * 1024, stripes=8)
+
+        def worker(offset):
+            for i in range(500):
+                key = f"key-{offset}-{i % 50}"
+                tier.put(key, _entry(i), size=8)
+                tier.get(key)
+                if i % 7 == 0:
+                    tier.pop(key)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tier.total_bytes == len(tier) * 8
+        assert len(tier) <= 400
+
+    def test_invalid_bounds(self):
+        """Test that non-positive bounds are rejected."""
+        with pytest.raises(ValueError):
+            StripedMemoryTier(max_entries=0)
+        with pytest.raises(ValueError):
+            StripedMemoryTier(max_bytes=0)
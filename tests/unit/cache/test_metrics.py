@@ -0,0 +1,202 @@
+"""Unit tests for per-operation cache latency and payload histograms."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.awsideman.aws_clients.cached_client import CachedAwsClient
+from src.awsideman.cache.backends.hybrid import HybridBackend
+from src.awsideman.cache.manager import CacheManager
+from src.awsideman.cache.metrics import (
+    LATENCY_BUCKETS_MS,
+    MAX_OPERATIONS,
+    CacheMetrics,
+    Histogram,
+    operation_from_key,
+)
+
+
+class TestHistogram:
+    """Test fixed-bucket histograms."""
+
+    def test_observe_tracks_count_sum_min_max(self):
+        """Test that observations update the summary fields."""
+        histogram = Histogram(LATENCY_BUCKETS_MS)
+        for value in (0.2, 3.0, 40.0):
+            histogram.observe(value)
+
+        data = histogram.to_dict()
+        assert data["count"] == 3
+        assert data["sum"] == pytest.approx(43.2)
+        assert data["min"] == pytest.approx(0.2)
+        assert data["max"] == pytest.approx(40.0)
+        assert data["buckets"][-1] == ["+Inf", 0]
+
+    def test_percentile_is_bucket_upper_bound_capped_by_max(self):
+        """Test that percentiles report the containing bucket bound."""
+        histogram = Histogram(LATENCY_BUCKETS_MS)
+        for _ in range(99):
+            histogram.observe(0.3)
+        histogram.observe(7.0)
+
+        assert histogram.percentile(0.5) == 0.5
+        assert histogram.percentile(1.0) == 7.0
+
+    def test_percentile_of_overflow_bucket_is_max(self):
+        """Test that values past the last bound report the largest observation."""
+        histogram = Histogram(LATENCY_BUCKETS_MS)
+        histogram.observe(60_000.0)
+
+        assert histogram.percentile(0.99) == 60_000.0
+
+    def test_merge_adds_serialized_histogram(self):
+        """Test merging a histogram exported by another process."""
+        first = Histogram(LATENCY_BUCKETS_MS)
+        first.observe(1.0)
+        second = Histogram(LATENCY_BUCKETS_MS)
+        second.observe(100.0)
+
+        first.merge(json.loads(json.dumps(second.to_dict())))
+
+        assert first.count == 2
+        assert first.max == 100.0
+        assert first.min == 1.0
+
+    def test_merge_rejects_different_buckets(self):
+        """Test that histograms with other bounds cannot be merged."""
+        histogram = Histogram(LATENCY_BUCKETS_MS)
+
+        with pytest.raises(ValueError):
+            histogram.merge(Histogram((1.0, 2.0)).to_dict())
+
+
+class TestCacheMetrics:
+    """Test the per-operation, per-tier registry."""
+
+    def test_operation_from_key(self):
+        """Test extracting the operation from structured keys."""
+        assert operation_from_key("user:all:list_users:abc123") == "list_users"
+        assert operation_from_key("plain-key") == "unknown"
+
+    def test_record_and_snapshot(self):
+        """Test hit ratio and payload sizes per operation and tier."""
+        metrics = CacheMetrics()
+        metrics.record("list_users", "memory", "hit", 0.0001, size=512)
+        metrics.record("list_users", "memory", "miss", 0.0001)
+        metrics.record("list_users", "local", "hit", 0.002, size=512)
+        metrics.record("list_users", "aws", "fill", 0.25)
+
+        snapshot = metrics.snapshot()
+        memory = snapshot["operations"]["list_users"]["memory"]
+        assert memory["hits"] == 1
+        assert memory["misses"] == 1
+        assert memory["hit_ratio"] == 0.5
+        assert memory["payload_bytes"]["count"] == 1
+        assert snapshot["operations"]["list_users"]["aws"]["latency_ms"]["fill"]["max"] == 250.0
+        assert snapshot["tiers"]["local"] == {"hits": 1, "misses": 0, "fills": 0, "hit_ratio": 1.0}
+        assert snapshot["tiers"]["aws"]["hit_ratio"] is None
+
+    def test_unknown_tier_or_outcome_is_ignored(self):
+        """Test that invalid labels are not recorded."""
+        metrics = CacheMetrics()
+        metrics.record("list_users", "disk", "hit", 0.001)
+        metrics.record("list_users", "memory", "expired", 0.001)
+
+        assert metrics.snapshot()["operations"] == {}
+
+    def test_operation_names_are_bounded(self):
+        """Test that operations past the limit are folded into one entry."""
+        metrics = CacheMetrics()
+        for index in range(MAX_OPERATIONS + 10):
+            metrics.record(f"op_{index}", "memory", "hit", 0.0001)
+
+        operations = metrics.snapshot()["operations"]
+        assert len(operations) == MAX_OPERATIONS + 1
+        assert operations["other"]["memory"]["hits"] == 10
+
+    def test_export_and_merge_round_trip(self, tmp_path):
+        """Test that an exported JSON snapshot merges into another registry."""
+        metrics = CacheMetrics()
+        metrics.record("describe_user", "remote", "miss", 0.03)
+        path = tmp_path / "metrics.json"
+        metrics.export_json(str(path))
+
+        other = CacheMetrics()
+        other.record("describe_user", "remote", "miss", 0.01)
+        other.merge(json.loads(path.read_text()))
+
+        assert other.snapshot()["operations"]["describe_user"]["remote"]["misses"] == 2
+
+
+class TestCacheManagerMetrics:
+    """Test that the cache manager records lookups and fills."""
+
+    def setup_method(self):
+        """Reset singleton instances before each test."""
+        CacheManager.reset_instance()
+
+    def teardown_method(self):
+        """Reset singleton instances after each test."""
+        CacheManager.reset_instance()
+
+    def _manager(self, backend=None):
+        manager = CacheManager(profile="metrics-test")
+        manager._backend = backend
+        manager._backend_tier = manager._detect_backend_tier()
+        manager._metrics.reset()
+        return manager
+
+    def test_memory_hit_miss_and_fill(self):
+        """Test that memory-only lookups are recorded under the memory tier."""
+        manager = self._manager()
+        key = "user:all:list_users:abc123"
+
+        manager.get(key)
+        manager.set(key, {"Users": []})
+        manager.get(key)
+
+        memory = manager.get_metrics()["operations"]["list_users"]["memory"]
+        assert memory["hits"] == 1
+        assert memory["misses"] == 1
+        assert memory["fills"] == 1
+        assert memory["payload_bytes"]["count"] == 1
+
+    def test_backend_lookups_are_recorded_under_its_tier(self):
+        """Test that DynamoDB lookups are recorded as the remote tier."""
+        backend = Mock(spec=["get", "set", "backend_type"])
+        backend.backend_type = "dynamodb"
+        backend.get.return_value = None
+        manager = self._manager(backend)
+
+        manager.get("group:all:list_groups:abc123")
+
+        remote = manager.get_metrics()["operations"]["list_groups"]["remote"]
+        assert remote["misses"] == 1
+
+    def test_hybrid_backend_records_its_own_tiers(self):
+        """Test that the hybrid backend reports local and remote tiers separately."""
+        local_backend = Mock()
+        local_backend.get.return_value = None
+        remote_backend = Mock()
+        remote_backend.get.return_value = b"payload"
+        hybrid = HybridBackend(local_backend=local_backend, remote_backend=remote_backend)
+        manager = self._manager(hybrid)
+
+        assert manager._backend_tier is None
+        hybrid.get("user:all:list_users:abc123")
+
+        tiers = manager.get_metrics()["operations"]["list_users"]
+        assert tiers["local"]["misses"] == 1
+        assert tiers["remote"]["hits"] == 1
+        assert tiers["remote"]["payload_bytes"]["max"] == len(b"payload")
+
+    def test_cached_client_records_api_fill_latency(self):
+        """Test that the API call behind a cache miss is recorded as the aws tier."""
+        manager = self._manager()
+        client = CachedAwsClient(Mock(), manager)
+
+        client._execute_with_cache("list_users", {"identity_store_id": "d-123"}, lambda: [])
+
+        aws = manager.get_metrics()["operations"]["list_users"]["aws"]
+        assert aws["fills"] == 1
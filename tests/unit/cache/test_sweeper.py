@@ -0,0 +1,176 @@
+"""Unit tests for the incremental expiry sweeper."""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.awsideman.cache.backends.base import CacheBackendError, SweepResult
+from src.awsideman.cache.backends.sqlite import SQLiteBackend
+from src.awsideman.cache.manager import CacheManager
+from src.awsideman.cache.sweeper import ExpirySweeper
+
+
+class _SlicedBackend:
+    """Backend stub that sweeps a fixed number of slices of ten expired entries."""
+
+    def __init__(self, slices: int):
+        self.slices = slices
+        self.calls = []
+
+    def sweep_expired(self, cursor=None, limit=500):
+        self.calls.append(cursor)
+        position = int(cursor) if cursor is not None else 0
+        next_position = position + 1
+        return SweepResult(
+            scanned=10,
+            removed=10,
+            bytes_freed=1000,
+            cursor=str(next_position) if next_position < self.slices else None,
+        )
+
+    def sweep_state_file(self):
+        return None
+
+
+class TestExpirySweeper:
+    """Test budgeted, resumable sweeps."""
+
+    def setup_method(self):
+        """Set up a temporary state directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_file = Path(self.temp_dir) / "sweep.state"
+
+    def teardown_method(self):
+        """Remove the state directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_run_completes_pass_within_budget(self):
+        """Test that a generous budget sweeps every slice of the pass."""
+        backend = _SlicedBackend(slices=3)
+        sweeper = ExpirySweeper(backend)
+
+        run = sweeper.run(budget_ms=10_000)
+
+        assert backend.calls == [None, "1", "2"]
+        assert run["pass_completed"] is True
+        assert run["entries_reclaimed"] == 30
+        assert run["bytes_freed"] == 3000
+        assert run["cursor"] is None
+
+    def test_exhausted_budget_resumes_from_cursor(self):
+        """Test that a run stops after its budget and the next run continues."""
+        backend = _SlicedBackend(slices=3)
+        sweeper = ExpirySweeper(backend)
+
+        with patch("src.awsideman.cache.sweeper.time.perf_counter", side_effect=[0.0, 1.0, 1.0]):
+            run = sweeper.run(budget_ms=1)
+
+        assert run["slices"] == 1
+        assert run["pass_completed"] is False
+        assert run["cursor"] == "1"
+
+        sweeper.run(budget_ms=10_000)
+        assert backend.calls == [None, "1", "2"]
+
+        stats = sweeper.stats()
+        assert stats["runs"] == 2
+        assert stats["passes_completed"] == 1
+        assert stats["entries_reclaimed"] == 30
+        assert stats["bytes_freed"] == 3000
+
+    def test_state_is_shared_through_state_file(self):
+        """Test that a new sweeper picks up the cursor and metrics of a previous one."""
+        backend = _SlicedBackend(slices=3)
+        first = ExpirySweeper(backend, state_file=self.state_file)
+        with patch("src.awsideman.cache.sweeper.time.perf_counter", side_effect=[0.0, 1.0, 1.0]):
+            first.run(budget_ms=1)
+
+        second = ExpirySweeper(backend, state_file=self.state_file)
+        assert second.stats()["cursor"] == "1"
+
+        second.run(budget_ms=10_000)
+        assert backend.calls == [None, "1", "2"]
+        assert second.stats()["entries_reclaimed"] == 30
+
+    def test_unreadable_state_file_starts_a_new_pass(self):
+        """Test that a corrupt state file is ignored."""
+        self.state_file.write_text("not json")
+        backend = _SlicedBackend(slices=1)
+
+        ExpirySweeper(backend, state_file=self.state_file).run()
+
+        assert backend.calls == [None]
+
+    def test_backend_errors_propagate_and_are_recorded(self):
+        """Test that a failing slice raises but still counts the run."""
+        backend = Mock()
+        backend.sweep_state_file.return_value = None
+        backend.sweep_expired.side_effect = CacheBackendError("disk gone")
+        sweeper = ExpirySweeper(backend)
+
+        with pytest.raises(CacheBackendError):
+            sweeper.run()
+
+        assert sweeper.stats()["runs"] == 1
+
+    def test_background_thread_runs_periodically(self):
+        """Test that the daemon thread sweeps on its interval and stops cleanly."""
+        backend = _SlicedBackend(slices=1)
+        sweeper = ExpirySweeper(backend)
+
+        sweeper.start(interval=0.01)
+        deadline = time.time() + 5
+        while len(backend.calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert sweeper.stats()["background"] is True
+        sweeper.stop()
+
+        assert len(backend.calls) >= 2
+        assert sweeper.stats()["background"] is False
+
+
+class TestManagerSweep:
+    """Test the cache manager's incremental sweep entry point."""
+
+    def setup_method(self):
+        """Reset the singleton and use a private SQLite backend."""
+        CacheManager.reset_instance()
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = CacheManager()
+        self.backend = SQLiteBackend(cache_dir=self.temp_dir)
+        self.manager._backend = self.backend
+
+    def teardown_method(self):
+        """Close the backend and reset the singleton."""
+        if self.manager._sweeper is not None:
+            self.manager._sweeper.stop()
+        self.backend.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        CacheManager.reset_instance()
+
+    def test_sweep_expired_reclaims_backend_entries(self):
+        """Test that the manager sweeps expired backend entries and publishes metrics."""
+        self.backend.set("old", b"1" * 10, ttl=1)
+        self.backend.set("new", b"2", ttl=3600)
+
+        with patch("src.awsideman.cache.backends.sqlite.time.time", return_value=time.time() + 5):
+            run = self.manager.sweep_expired(budget_ms=100)
+
+        assert run["entries_reclaimed"] == 1
+        assert run["bytes_freed"] == 10
+        assert self.backend.list_keys() == ["new"]
+        assert self.manager.get_stats()["expiry_sweeper"]["entries_reclaimed"] == 1
+        assert self.backend.sweep_state_file().exists()
+
+    def test_sweep_expired_without_backend(self):
+        """Test that sweeping without a persistent backend is a no-op."""
+        self.manager._backend = None
+
+        run = self.manager.sweep_expired()
+
+        assert run["entries_reclaimed"] == 0
+        assert self.manager.get_expiry_sweeper() is None
@@ -44,6 +44,7 @@ def test_cache_status_helper_functions():
         _display_backend_health,
         _display_backend_statistics,
         _display_encryption_status,
+        _display_operation_metrics,
         _display_recent_cache_entries,
     )
 
@@ -54,6 +55,20 @@ def test_cache_status_helper_functions():
         _display_backend_statistics,
         _display_backend_health,
         _display_recent_cache_entries,
+        _display_operation_metrics,
     ]:
         assert callable(func)
         assert func.__doc__ is not None
+
+
+def test_display_operation_metrics_renders_snapshot():
+    """Test that a metrics snapshot renders without errors."""
+    from src.awsideman.cache.metrics import CacheMetrics
+    from src.awsideman.commands.cache.status import _display_operation_metrics
+
+    metrics = CacheMetrics()
+    metrics.record("list_users", "memory", "hit", 0.0001, size=256)
+    metrics.record("list_users", "aws", "fill", 0.2)
+
+    _display_operation_metrics(metrics.snapshot())
+    _display_operation_metrics({"operations": {}, "tiers": {}})
@@ -1,7 +1,7 @@
 """Tests for the account cache optimizer."""
 
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -133,31 +133,17 @@ class TestAccountCacheOptimizer:
         assert result == 29
         optimizer.cache_manager.get.assert_called_once_with(optimizer.account_count_key)
 
-    @patch("src.awsideman.aws_clients.manager.build_organization_hierarchy")
-    def test_get_current_account_count(self, mock_build_hierarchy, optimizer):
-        """Test getting current account count."""
-        # Mock organization tree with accounts
-        mock_account_node1 = Mock()
-        mock_account_node1.is_account.return_value = True
-        mock_account_node1.children = []
-
-        mock_account_node2 = Mock()
-        mock_account_node2.is_account.return_value = True
-        mock_account_node2.children = []
-
-        mock_ou_node = Mock()
-        mock_ou_node.is_account.return_value = False
-        mock_ou_node.children = [mock_account_node1, mock_account_node2]
-
-        mock_root_node = Mock()
-        mock_root_node.is_account.return_value = False
-        mock_root_node.children = [mock_ou_node]
-
-        mock_build_hierarchy.return_value = [mock_root_node]
+    def test_get_current_account_count(self, optimizer, mock_organizations_client):
+        """Test getting current account count from a single list_accounts call."""
+        mock_organizations_client.list_accounts.return_value = {
+            "Accounts": [{"Id": "123456789012"}, {"Id": "123456789013"}]
+        }
 
         result = optimizer._get_current_account_count()
 
         assert result == 2
+        mock_organizations_client.list_accounts.assert_called_once()
+        mock_organizations_client.describe_account.assert_not_called()
 
     def test_invalidate_cache(self, optimizer):
         """Test cache invalidation."""
@@ -244,3 +230,33 @@ class TestAccountCacheOptimizer:
 
         # Should have cached the results
         assert optimizer.cache_manager.set.call_count >= 1  # At least the org snapshot
+
+    def test_tag_filter_loads_tags_missing_from_snapshot(
+        self, optimizer, mock_organizations_client
+    ):
+        """Test that a snapshot saved without tags gets them when a tag filter needs them."""
+        optimizer.cache_manager.get.return_value = {
+            "accounts": [
+                {
+                    "account_id": "123456789012",
+                    "account_name": "Production",
+                    "email": "prod@example.com",
+                    "status": "ACTIVE",
+                    "tags": {},
+                    "ou_path": ["Root"],
+                }
+            ],
+            "total_count": 1,
+            "cached_at": datetime.now().isoformat(),
+            "tags_loaded": False,
+        }
+        mock_organizations_client.list_tags_for_resource.return_value = [
+            {"Key": "Environment", "Value": "Production"}
+        ]
+
+        result = optimizer.get_all_accounts_optimized(include_tags=True)
+
+        assert result[0].tags == {"Environment": "Production"}
+        saved_data = optimizer.cache_manager.set.call_args[0][1]
+        assert saved_data["tags_loaded"] is True
+        assert saved_data["accounts"][0]["tags"] == {"Environment": "Production"}
@@ -1013,6 +1013,8 @@ class TestAccountFilterExplicitAccounts:
         assert accounts[0].account_name == "Account 1"
         assert accounts[1].account_id == "123456789013"
         assert accounts[1].account_name == "Account 2"
+        # A few explicit accounts do not list the whole organization
+        self.mock_org_client.list_accounts.assert_not_called()
 
     def test_resolve_explicit_accounts_not_found(self):
         """Test resolving explicit accounts with account not found."""
@@ -1202,30 +1204,24 @@ class TestAccountFilterStreaming:
         self.mock_org_client.client_manager = Mock()
         self.mock_org_client.client_manager.profile = "test-profile"
 
-    @patch("src.awsideman.utils.account_cache_optimizer.AccountCacheOptimizer")
-    @patch("src.awsideman.aws_clients.manager.build_organization_hierarchy")
-    def test_resolve_accounts_streaming_wildcard(self, mock_build_hierarchy, mock_optimizer_class):
+    @patch("src.awsideman.aws_clients.account_catalog.build_organization_hierarchy")
+    def test_resolve_accounts_streaming_wildcard(self, mock_build_hierarchy):
         """Test streaming account resolution for wildcard filter."""
-        # Setup mock organization hierarchy
-        mock_account_node = Mock()
-        mock_account_node.is_account.return_value = True
-        mock_account_node.id = "123456789012"
-        mock_account_node.children = []
-        mock_account_node.ou_path = ["root", "ou-1"]
-
-        mock_root = Mock()
-        mock_root.is_account.return_value = False
-        mock_root.children = [mock_account_node]
-
-        mock_build_hierarchy.return_value = [mock_root]
-
-        # Setup mock account data
-        self.mock_org_client.describe_account.return_value = {
-            "Id": "123456789012",
-            "Name": "Test Account",
-            "Email": "test@example.com",
-            "Status": "ACTIVE",
-            "Tags": {"Environment": "Production"},
+        # Setup organization hierarchy
+        account_node = OrgNode("123456789012", "Test Account", NodeType.ACCOUNT, [])
+        ou_node = OrgNode("ou-1", "ou-1", NodeType.OU, [account_node])
+        mock_build_hierarchy.return_value = [OrgNode("r-1", "root", NodeType.ROOT, [ou_node])]
+
+        # Setup account data from a single list_accounts call
+        self.mock_org_client.list_accounts.return_value = {
+            "Accounts": [
+                {
+                    "Id": "123456789012",
+                    "Name": "Test Account",
+                    "Email": "test@example.com",
+                    "Status": "ACTIVE",
+                }
+            ]
         }
 
         # Create filter and test streaming
@@ -1241,54 +1237,40 @@ class TestAccountFilterStreaming:
         assert accounts[0].account_name == "Test Account"
         assert accounts[0].email == "test@example.com"
         assert accounts[0].status == "ACTIVE"
-        assert accounts[0].tags == {"Environment": "Production"}
         assert accounts[0].ou_path == ["root", "ou-1"]
 
-    @patch("src.awsideman.utils.account_cache_optimizer.AccountCacheOptimizer")
-    @patch("src.awsideman.aws_clients.manager.build_organization_hierarchy")
-    def test_resolve_accounts_streaming_tag_filter(
-        self, mock_build_hierarchy, mock_optimizer_class
-    ):
+        # Tags are not needed for a wildcard filter and no account is described
+        self.mock_org_client.list_tags_for_resource.assert_not_called()
+        self.mock_org_client.describe_account.assert_not_called()
+
+    @patch("src.awsideman.aws_clients.account_catalog.build_organization_hierarchy")
+    def test_resolve_accounts_streaming_tag_filter(self, mock_build_hierarchy):
         """Test streaming account resolution for tag-based filter."""
-        # Setup mock organization hierarchy with multiple accounts
-        mock_account1 = Mock()
-        mock_account1.is_account.return_value = True
-        mock_account1.id = "123456789012"
-        mock_account1.children = []
-        mock_account1.ou_path = ["root", "ou-1"]
-
-        mock_account2 = Mock()
-        mock_account2.is_account.return_value = True
-        mock_account2.id = "123456789013"
-        mock_account2.children = []
-        mock_account2.ou_path = ["root", "ou-2"]
-
-        mock_root = Mock()
-        mock_root.is_account.return_value = False
-        mock_root.children = [mock_account1, mock_account2]
-
-        mock_build_hierarchy.return_value = [mock_root]
-
-        # Setup mock account data - only first account matches tag filter
-        def mock_describe_account(account_id):
-            if account_id == "123456789012":
-                return {
-                    "Id": "123456789012",
-                    "Name": "Production Account",
-                    "Email": "prod@example.com",
-                    "Status": "ACTIVE",
-                    "Tags": {"Environment": "Production"},
-                }
-            else:
-                return {
-                    "Id": "123456789013",
-                    "Name": "Development Account",
-                    "Email": "dev@example.com",
-                    "Status": "ACTIVE",
-                    "Tags": {"Environment": "Development"},
-                }
+        # Setup organization hierarchy with multiple accounts
+        mock_build_hierarchy.return_value = [
+            OrgNode(
+                "r-1",
+                "root",
+                NodeType.ROOT,
+                [
+                    OrgNode("123456789012", "Production Account", NodeType.ACCOUNT, []),
+                    OrgNode("123456789013", "Development Account", NodeType.ACCOUNT, []),
+                ],
+            )
+        ]
+        self.mock_org_client.list_accounts.return_value = {
+            "Accounts": [
+                {"Id": "123456789012", "Name": "Production Account", "Status": "ACTIVE"},
+                {"Id": "123456789013", "Name": "Development Account", "Status": "ACTIVE"},
+            ]
+        }
 
-        self.mock_org_client.describe_account.side_effect = mock_describe_account
+        # Setup tags - only first account matches tag filter
+        def mock_list_tags(account_id):
+            environment = "Production" if account_id == "123456789012" else "Development"
+            return [{"Key": "Environment", "Value": environment}]
+
+        self.mock_org_client.list_tags_for_resource.side_effect = mock_list_tags
 
         # Create filter and test streaming
         account_filter = AccountFilter(
@@ -1304,6 +1286,7 @@ class TestAccountFilterStreaming:
         assert accounts[0].account_id == "123456789012"
         assert accounts[0].account_name == "Production Account"
         assert accounts[0].tags == {"Environment": "Production"}
+        assert self.mock_org_client.list_tags_for_resource.call_count == 2
 
     def test_resolve_accounts_streaming_explicit_accounts(self):
         """Test streaming account resolution for explicit account list."""
@@ -1454,53 +1437,128 @@ class TestAccountFilterStreaming:
         with pytest.raises(ValueError, match="Account ID '999999999999' does not exist"):
             list(account_filter.resolve_accounts_streaming())
 
-    @patch("src.awsideman.aws_clients.manager.build_organization_hierarchy")
+    @patch("src.awsideman.aws_clients.account_catalog.build_organization_hierarchy")
     def test_get_all_accounts_streaming(self, mock_build_hierarchy):
         """Test the internal _get_all_accounts_streaming method."""
-        # Setup mock organization hierarchy
-        mock_account1 = Mock()
-        mock_account1.is_account.return_value = True
-        mock_account1.id = "123456789012"
-        mock_account1.children = []
-        mock_account1.ou_path = ["root", "ou-1"]
+        # Setup organization hierarchy; the second account is not in it yet
+        mock_build_hierarchy.return_value = [
+            OrgNode(
+                "r-1",
+                "root",
+                NodeType.ROOT,
+                [
+                    OrgNode("123456789012", "Account-123456789012", NodeType.ACCOUNT, []),
+                    OrgNode("ou-2", "ou-2", NodeType.OU, []),
+                ],
+            )
+        ]
+        self.mock_org_client.list_accounts.return_value = {
+            "Accounts": [
+                {"Id": account_id, "Name": f"Account-{account_id}", "Status": "ACTIVE"}
+                for account_id in ("123456789012", "123456789013")
+            ]
+        }
+
+        # Create filter and test internal streaming method
+        account_filter = AccountFilter(
+            filter_expression="*", organizations_client=self.mock_org_client
+        )
 
-        mock_account2 = Mock()
-        mock_account2.is_account.return_value = True
-        mock_account2.id = "123456789013"
-        mock_account2.children = []
-        mock_account2.ou_path = ["root", "ou-2"]
+        # Convert generator to list for testing
+        accounts = list(account_filter._get_all_accounts_streaming())
 
-        mock_ou = Mock()
-        mock_ou.is_account.return_value = False
-        mock_ou.children = [mock_account2]
+        assert [account.account_id for account in accounts] == ["123456789012", "123456789013"]
+        assert accounts[0].ou_path == ["root"]
+        assert accounts[1].ou_path == []
+        self.mock_org_client.describe_account.assert_not_called()
 
-        mock_root = Mock()
-        mock_root.is_account.return_value = False
-        mock_root.children = [mock_account1, mock_ou]
 
-        mock_build_hierarchy.return_value = [mock_root]
+class TestAccountFilterCompound:
+    """Tests for compound filter expressions answered from the account index."""
 
-        # Setup mock account data
-        def mock_describe_account(account_id):
-            return {
-                "Id": account_id,
-                "Name": f"Account-{account_id}",
-                "Email": f"{account_id}@example.com",
-                "Status": "ACTIVE",
-                "Tags": {},
-            }
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_org_client = Mock(spec=OrganizationsClientWrapper)
+        self.mock_org_client.client_manager = Mock()
+        self.mock_org_client.client_manager.profile = None
+        self.accounts = [
+            AccountInfo(
+                account_id="111111111111",
+                account_name="payments-prod",
+                email="payments-prod@example.com",
+                status="ACTIVE",
+                tags={"env": "prod"},
+                ou_path=["Root", "Workloads"],
+            ),
+            AccountInfo(
+                account_id="222222222222",
+                account_name="payments-dev",
+                email="payments-dev@example.com",
+                status="ACTIVE",
+                tags={"env": "dev"},
+                ou_path=["Root", "Workloads"],
+            ),
+            AccountInfo(
+                account_id="333333333333",
+                account_name="payments-archive",
+                email="archive@example.com",
+                status="ACTIVE",
+                tags={"env": "prod"},
+                ou_path=["Root", "Archive"],
+            ),
+        ]
 
-        self.mock_org_client.describe_account.side_effect = mock_describe_account
+    def test_parse_compound_expression(self):
+        """Test that tag, ou and name terms are parsed from one expression."""
+        filter_obj = AccountFilter(
+            "tag:env=prod ou:Root/Workloads name:*payments*", self.mock_org_client
+        )
 
-        # Create filter and test internal streaming method
-        account_filter = AccountFilter(
-            filter_expression="*", organizations_client=self.mock_org_client
+        assert filter_obj.filter_type == FilterType.COMPOUND
+        assert filter_obj.tag_filters == [{"key": "env", "value": "prod"}]
+        assert filter_obj.ou_path_term == "Root/Workloads"
+        assert filter_obj.name_term == "*payments*"
+        assert filter_obj.validate_filter() == []
+        assert "Root/Workloads" in filter_obj.get_filter_description()
+
+    def test_tag_value_with_spaces_stays_a_tag_filter(self):
+        """Test that spaces inside a single tag filter do not start a new term."""
+        filter_obj = AccountFilter("tag:Team=Data Science", self.mock_org_client)
+
+        assert filter_obj.filter_type == FilterType.TAG
+        assert filter_obj.tag_filters == [{"key": "Team", "value": "Data Science"}]
+
+    def test_repeated_ou_term_is_invalid(self):
+        """Test that only one ou: term is accepted."""
+        with pytest.raises(ValueError, match="Only one ou: term"):
+            AccountFilter("ou:Root/A ou:Root/B", self.mock_org_client)
+
+    @patch("src.awsideman.utils.account_cache_optimizer.AccountCacheOptimizer")
+    def test_resolve_compound_accounts(self, mock_optimizer_class):
+        """Test that all terms must match and tags are requested from the optimizer."""
+        mock_optimizer = mock_optimizer_class.return_value
+        mock_optimizer.get_all_accounts_optimized.return_value = self.accounts
+
+        filter_obj = AccountFilter(
+            "tag:env=prod ou:Root/Workloads name:*payments*", self.mock_org_client
         )
+        accounts = filter_obj.resolve_accounts()
 
-        # Convert generator to list for testing
-        accounts = list(account_filter._get_all_accounts_streaming())
+        assert [account.account_id for account in accounts] == ["111111111111"]
+        mock_optimizer.get_all_accounts_optimized.assert_called_once_with(include_tags=True)
 
-        assert len(accounts) == 2
-        account_ids = [account.account_id for account in accounts]
-        assert "123456789012" in account_ids
-        assert "123456789013" in account_ids
+    @patch("src.awsideman.utils.account_cache_optimizer.AccountCacheOptimizer")
+    def test_streaming_matches_indexed_resolution(self, mock_optimizer_class):
+        """Test that streaming resolution returns the same accounts as the index."""
+        mock_optimizer_class.return_value.get_all_accounts_optimized.return_value = self.accounts
+        filter_obj = AccountFilter("ou:Root name:PAYMENTS-*", self.mock_org_client)
+
+        with patch.object(
+            AccountFilter, "_get_all_accounts_streaming", return_value=iter(self.accounts)
+        ):
+            streamed = list(filter_obj.resolve_accounts_streaming())
+
+        assert [account.account_id for account in filter_obj.resolve_accounts()] == [
+            account.account_id for account in streamed
+        ]
+        assert len(streamed) == 3
@@ -0,0 +1,125 @@
+"""Tests for the in-memory account index."""
+
+import pytest
+
+from src.awsideman.utils.account_filter import AccountInfo
+from src.awsideman.utils.account_index import AccountIndex
+
+
+@pytest.fixture
+def accounts():
+    """Create accounts spread over tags, OUs and names."""
+    return [
+        AccountInfo(
+            account_id="111111111111",
+            account_name="Payments-Prod",
+            email="payments-prod@example.com",
+            status="ACTIVE",
+            tags={"env": "prod", "team": "payments"},
+            ou_path=["Root", "Workloads", "Prod"],
+        ),
+        AccountInfo(
+            account_id="222222222222",
+            account_name="payments-dev",
+            email="payments-dev@example.com",
+            status="ACTIVE",
+            tags={"env": "dev", "team": "payments"},
+            ou_path=["Root", "Workloads", "Dev"],
+        ),
+        AccountInfo(
+            account_id="333333333333",
+            account_name="ledger-prod",
+            email="ledger@example.com",
+            status="ACTIVE",
+            tags={"env": "prod"},
+            ou_path=["Root", "Workloads", "Prod"],
+        ),
+        AccountInfo(
+            account_id="444444444444",
+            account_name="security",
+            email="security@example.com",
+            status="ACTIVE",
+            tags={},
+            ou_path=["Root", "Security"],
+        ),
+    ]
+
+
+@pytest.fixture
+def index(accounts):
+    """Create an index over the sample accounts."""
+    return AccountIndex(accounts)
+
+
+class TestAccountIndex:
+    """Test the name, tag and OU path indexes."""
+
+    def test_name_prefix(self, index):
+        """Test case-insensitive name prefix lookups."""
+        assert index.ids_with_name_prefix("payments") == {"111111111111", "222222222222"}
+        assert index.ids_with_name_prefix("PAYMENTS-P") == {"111111111111"}
+        assert index.ids_with_name_prefix("nothing") == set()
+
+    def test_name_substring(self, index):
+        """Test substring lookups through the trigram index and for short substrings."""
+        assert index.ids_with_name_containing("prod") == {"111111111111", "333333333333"}
+        assert index.ids_with_name_containing("ts-d") == {"222222222222"}
+        assert index.ids_with_name_containing("y") == {
+            "111111111111",
+            "222222222222",
+            "444444444444",
+        }
+        assert index.ids_with_name_containing("prodx") == set()
+
+    def test_name_glob(self, index):
+        """Test that globs must match the whole name."""
+        assert index.ids_matching_name_glob("*payments*") == {"111111111111", "222222222222"}
+        assert index.ids_matching_name_glob("*-prod") == {"111111111111", "333333333333"}
+        assert index.ids_matching_name_glob("payments") == set()
+        assert index.ids_matching_name_glob("sec[u]rity") == {"444444444444"}
+
+    def test_name_regex_is_case_sensitive(self, index):
+        """Test that regex lookups keep the original case of names."""
+        assert index.ids_matching_name_regex("^Payments") == {"111111111111"}
+
+    def test_tags(self, index):
+        """Test the inverted tag index."""
+        assert index.ids_with_tag("env", "prod") == {"111111111111", "333333333333"}
+        assert index.ids_with_tag("team") == {"111111111111", "222222222222"}
+        assert index.ids_with_tags([("env", "prod"), ("team", "payments")]) == {"111111111111"}
+
+    def test_ou_paths(self, index):
+        """Test OU path prefixes and single OU names."""
+        assert index.ids_in_ou_path("Root/Workloads") == {
+            "111111111111",
+            "222222222222",
+            "333333333333",
+        }
+        assert index.ids_in_ou_path("Root/Workloads/Prod") == {"111111111111", "333333333333"}
+        assert index.ids_in_ou_path("Root/Work") == set()
+        assert index.ids_in_ou("Security") == {"444444444444"}
+
+    def test_query_intersects_terms(self, index):
+        """Test that a compound query returns accounts matching every term in order."""
+        results = index.query(
+            tags=[("env", "prod")], ou_path="Root/Workloads", name_glob="*payments*"
+        )
+        assert [account.account_id for account in results] == ["111111111111"]
+
+        everything = index.query()
+        assert [account.account_id for account in everything] == [
+            "111111111111",
+            "222222222222",
+            "333333333333",
+            "444444444444",
+        ]
+
+    def test_matches_linear_scan(self, accounts, index):
+        """Test that index lookups agree with checking each account."""
+        for substring in ("pay", "-", "prod", "ledger-p", "zzz"):
+            expected = {
+                account.account_id
+                for account in accounts
+                if substring in account.account_name.lower()
+            }
+            assert index.ids_with_name_containing(substring) == expected
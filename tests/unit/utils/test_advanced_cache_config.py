@@ -289,6 +289,114 @@ class TestAdvancedCacheConfig:
         assert "max_size_mb" in errors
         assert "must be positive" in errors["max_size_mb"]
 
+    def test_validate_invalid_memory_tier_bounds(self):
+        """Test validation with invalid memory tier bounds."""
+        config = AdvancedCacheConfig(memory_max_entries=0, memory_max_size_mb=-1)
+
+        errors = config.validate()
+        assert "must be positive" in errors["memory_max_entries"]
+        assert "must be positive" in errors["memory_max_size_mb"]
+
+    def test_from_environment_memory_tier(self):
+        """Test loading memory tier bounds from environment variables."""
+        env_vars = {
+            "AWSIDEMAN_CACHE_MEMORY_MAX_ENTRIES": "250",
+            "AWSIDEMAN_CACHE_MEMORY_MAX_SIZE_MB": "8",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = AdvancedCacheConfig.from_environment()
+
+        assert config.memory_max_entries == 250
+        assert config.memory_max_size_mb == 8
+
+    def test_validate_invalid_hard_ttl(self):
+        """Test validation of the stale-while-revalidate hard TTL."""
+        errors = AdvancedCacheConfig(hard_ttl=0).validate()
+        assert "must be positive" in errors["hard_ttl"]
+
+        config = AdvancedCacheConfig(stale_while_revalidate=True, default_ttl=3600, hard_ttl=60)
+        errors = config.validate()
+        assert "must not be shorter" in errors["hard_ttl"]
+
+    def test_from_environment_stale_while_revalidate(self):
+        """Test loading stale-while-revalidate settings from environment variables."""
+        env_vars = {
+            "AWSIDEMAN_CACHE_STALE_WHILE_REVALIDATE": "true",
+            "AWSIDEMAN_CACHE_HARD_TTL": "7200",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = AdvancedCacheConfig.from_environment()
+
+        assert config.stale_while_revalidate is True
+        assert config.hard_ttl == 7200
+        assert config.operation_ttls == {}
+
+    def test_compression_threshold(self):
+        """Test the compression threshold default, environment override and validation."""
+        assert AdvancedCacheConfig().compression_threshold == 4096
+
+        with patch.dict(os.environ, {"AWSIDEMAN_CACHE_COMPRESSION_THRESHOLD": "0"}, clear=True):
+            config = AdvancedCacheConfig.from_environment()
+        assert config.compression_threshold == 0
+        assert "compression_threshold" not in config.validate()
+
+        errors = AdvancedCacheConfig(compression_threshold=-1).validate()
+        assert "must not be negative" in errors["compression_threshold"]
+
+    def test_expiry_sweep_interval(self):
+        """Test the background expiry sweep interval setting."""
+        assert AdvancedCacheConfig().expiry_sweep_interval == 0
+
+        with patch.dict(os.environ, {"AWSIDEMAN_CACHE_EXPIRY_SWEEP_INTERVAL": "60"}, clear=True):
+            config = AdvancedCacheConfig.from_environment()
+        assert config.expiry_sweep_interval == 60
+
+        errors = AdvancedCacheConfig(expiry_sweep_interval=-5).validate()
+        assert "must not be negative" in errors["expiry_sweep_interval"]
+
+    def test_write_behind_queue_size(self):
+        """Test the hybrid write-behind queue size setting."""
+        assert AdvancedCacheConfig().write_behind_queue_size == 0
+
+        with patch.dict(os.environ, {"AWSIDEMAN_CACHE_WRITE_BEHIND_QUEUE_SIZE": "500"}, clear=True):
+            config = AdvancedCacheConfig.from_environment()
+        assert config.write_behind_queue_size == 500
+        assert config.get_profile_config("default").write_behind_queue_size == 500
+
+        errors = AdvancedCacheConfig(write_behind_queue_size=-1).validate()
+        assert "must not be negative" in errors["write_behind_queue_size"]
+
+    def test_coherence_journal(self):
+        """Test the cross-process invalidation journal setting."""
+        assert AdvancedCacheConfig().coherence_journal is True
+
+        with patch.dict(os.environ, {"AWSIDEMAN_CACHE_COHERENCE_JOURNAL": "false"}, clear=True):
+            config = AdvancedCacheConfig.from_environment()
+        assert config.coherence_journal is False
+        assert config.get_profile_config("default").coherence_journal is False
+
+    def test_adaptive_ttl(self):
+        """Test the adaptive TTL settings."""
+        assert AdvancedCacheConfig().adaptive_ttl is False
+
+        env = {
+            "AWSIDEMAN_CACHE_ADAPTIVE_TTL": "true",
+            "AWSIDEMAN_CACHE_ADAPTIVE_TTL_MIN": "120",
+            "AWSIDEMAN_CACHE_ADAPTIVE_TTL_MAX": "604800",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = AdvancedCacheConfig.from_environment()
+        assert config.adaptive_ttl is True
+        assert config.adaptive_ttl_min == 120
+        assert config.get_profile_config("default").adaptive_ttl_max == 604800
+
+        errors = AdvancedCacheConfig(adaptive_ttl_min=600, adaptive_ttl_max=60).validate()
+        assert "must not be below" in errors["adaptive_ttl_max"]
+        errors = AdvancedCacheConfig(adaptive_ttl_min=0).validate()
+        assert "must be positive" in errors["adaptive_ttl_min"]
+
     def test_validate_dynamodb_missing_table_name(self):
         """Test validation with missing DynamoDB table name."""
         config = AdvancedCacheConfig(backend_type="dynamodb", dynamodb_table_name="")
@@ -356,6 +464,17 @@ class TestAdvancedCacheConfig:
             "dynamodb_profile": "test-profile",
             "hybrid_local_ttl": 600,
             "file_cache_dir": "/test/cache",
+            "memory_max_entries": 5000,
+            "memory_max_size_mb": 50,
+            "stale_while_revalidate": False,
+            "hard_ttl": 86400,
+            "compression_threshold": 4096,
+            "expiry_sweep_interval": 0,
+            "write_behind_queue_size": 0,
+            "coherence_journal": True,
+            "adaptive_ttl": False,
+            "adaptive_ttl_min": 60,
+            "adaptive_ttl_max": 86400,
         }
 
         assert result == expected
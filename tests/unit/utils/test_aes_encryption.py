@@ -7,6 +7,7 @@ import pytest
 
 from src.awsideman.encryption.aes import AESEncryption
 from src.awsideman.encryption.provider import EncryptionError
+from src.awsideman.utils.security import SecureMemory
 
 
 # Mock timing protection to make tests run instantly
@@ -115,6 +116,24 @@ class TestAESEncryption:
         decrypted = self.provider.decrypt(encrypted)
         assert decrypted == complex_data
 
+    def test_encrypt_bytes_round_trip(self):
+        """Test that raw payloads are encrypted and returned byte for byte."""
+        payload = bytes(range(256)) * 4
+
+        encrypted = self.provider.encrypt_bytes(payload)
+
+        assert encrypted[16:] != payload
+        assert self.provider.decrypt_bytes(encrypted) == payload
+
+    def test_decrypt_bytes_skips_json(self):
+        """Test that raw decryption does not decode JSON."""
+        encrypted = self.provider.encrypt_bytes(b"not json")
+
+        with patch("src.awsideman.encryption.aes.json.loads") as mock_loads:
+            assert self.provider.decrypt_bytes(encrypted) == b"not json"
+
+        mock_loads.assert_not_called()
+
     def test_encrypt_non_serializable_data_raises_error(self):
         """Test that non-JSON-serializable data raises EncryptionError."""
 
@@ -349,6 +368,21 @@ class TestAESEncryption:
         assert exc_info.value.encryption_type == "aes256"
 
 
+class TestSecureZero:
+    """Test wiping of plaintext buffers."""
+
+    def test_secure_zero_clears_buffer_in_place(self):
+        """Test that the buffer is zeroed without changing its length."""
+        buffer = bytearray(b"sensitive plaintext" * 100)
+        view = memoryview(buffer)
+
+        SecureMemory().secure_zero(buffer)
+
+        assert buffer == bytearray(len(b"sensitive plaintext") * 100)
+        assert view.obj is buffer
+        view.release()
+
+
 class TestAESEncryptionIntegration:
     """Integration tests for AES encryption with real key manager."""
 
@@ -240,7 +240,10 @@ class TestBackendFactory:
     def test_create_hybrid_backend_success(self):
         """Test successful hybrid backend creation."""
         config = AdvancedCacheConfig(
-            backend_type="hybrid", dynamodb_table_name="test-table", hybrid_local_ttl=600
+            backend_type="hybrid",
+            dynamodb_table_name="test-table",
+            hybrid_local_ttl=600,
+            write_behind_queue_size=250,
         )
 
         mock_file_backend = Mock()
@@ -263,6 +266,7 @@ class TestBackendFactory:
                         local_backend=mock_file_backend,
                         remote_backend=mock_dynamodb_backend,
                         local_ttl=600,
+                        write_behind_queue_size=250,
                     )
 
     def test_create_hybrid_backend_sub_backend_error(self):
@@ -301,7 +305,7 @@ class TestBackendFactory:
                     assert exc_info.value.backend_type == "hybrid"
 
     def test_get_available_backends_file_only(self):
-        """Test getting available backends when only file is available."""
+        """Test getting available backends when only the local backends are available."""
         # Mock the import to fail
         with patch("builtins.__import__") as mock_import:
 
@@ -314,7 +318,7 @@ class TestBackendFactory:
 
             backends = BackendFactory.get_available_backends()
 
-            assert backends == ["file"]
+            assert backends == ["file", "segment", "sqlite"]
 
     def test_get_available_backends_all(self):
         """Test getting available backends when all are available."""
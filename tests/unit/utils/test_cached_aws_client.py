@@ -1,12 +1,18 @@
 """Tests for cached AWS client functionality."""
 
+import threading
+import time
+from datetime import timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
 from src.awsideman.aws_clients.cached_client import (
+    SWR_FRESH_UNTIL_KEY,
+    SWR_VALUE_KEY,
     CachedAwsClient,
     CachedOrganizationsClient,
+    SingleFlight,
     create_cached_client_manager,
 )
 from src.awsideman.aws_clients.manager import AWSClientManager
@@ -51,7 +57,7 @@ class TestCachedAwsClient:
 
         # Keys should be consistent
         assert key1 == key2
-        assert key1.startswith("list_roots_")
+        assert key1.startswith("organization:all:list_roots:")
 
         # Different operations should have different keys
         key3 = self.cached_client._generate_cache_key(
@@ -95,8 +101,8 @@ class TestCachedAwsClient:
 
         # Should not raise exception
         key = self.cached_client._generate_cache_key("complex_operation", complex_params)
-        assert key.startswith("complex_operation_")
-        assert len(key) > len("complex_operation_")
+        assert key.startswith("other:all:complex_operation:")
+        assert len(key) > len("other:all:complex_operation:")
 
     def test_generate_cache_key_includes_profile_and_region(self):
         """Test that cache keys include profile and region to avoid conflicts."""
@@ -124,7 +130,7 @@ class TestCachedAwsClient:
         self.mock_client_manager.region = "us-east-1"
 
         key = self.cached_client._generate_cache_key("list_roots", {})
-        assert key.startswith("list_roots_")
+        assert key.startswith("organization:all:list_roots:")
 
     def test_is_cacheable_operation(self):
         """Test cacheable operation detection."""
@@ -299,6 +305,235 @@ class TestCachedAwsClient:
         assert result.cache_manager == self.mock_cache_manager
 
 
+class TestRequestCoalescing:
+    """Test single-flight coalescing of concurrent cache misses."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client_manager = Mock(spec=AWSClientManager)
+        self.mock_client_manager.profile = "test-profile"
+        self.mock_client_manager.region = "us-east-1"
+        self.mock_cache_manager = Mock(spec=CacheManager)
+        self.mock_cache_manager.get.return_value = None
+        CachedAwsClient.reset_coalescing_stats()
+
+    def teardown_method(self):
+        """Clean up coalescing counters."""
+        CachedAwsClient.reset_coalescing_stats()
+
+    def _run_concurrently(self, workers, target):
+        barrier = threading.Barrier(workers)
+        results = [None] * workers
+        errors = [None] * workers
+
+        def run(index):
+            barrier.wait()
+            try:
+                results[index] = target()
+            except Exception as e:
+                errors[index] = e
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_misses_make_one_api_call(self):
+        """Test that concurrent misses on one key share a single API call."""
+        api_response = {"PermissionSets": ["arn:ps-1"]}
+
+        def slow_api_call():
+            time.sleep(0.1)
+            return api_response
+
+        api_call = Mock(side_effect=slow_api_call)
+
+        def call():
+            # Every worker builds its own client, as the cached wrappers do
+            client = CachedAwsClient(self.mock_client_manager, self.mock_cache_manager)
+            return client._execute_with_cache(
+                "list_permission_sets", {"instance_arn": "arn:instance"}, api_call
+            )
+
+        results, errors = self._run_concurrently(20, call)
+
+        assert errors == [None] * 20
+        assert all(result == api_response for result in results)
+        api_call.assert_called_once()
+        self.mock_cache_manager.set.assert_called_once()
+        assert CachedAwsClient.get_coalescing_stats() == {"list_permission_sets": 19}
+
+    def test_errors_propagate_to_waiters(self):
+        """Test that every coalesced caller receives the leader's exception."""
+
+        def failing_api_call():
+            time.sleep(0.1)
+            raise RuntimeError("Throttled")
+
+        api_call = Mock(side_effect=failing_api_call)
+        client = CachedAwsClient(self.mock_client_manager, self.mock_cache_manager)
+
+        results, errors = self._run_concurrently(
+            5,
+            lambda: client._execute_with_cache(
+                "describe_permission_set", {"permission_set_arn": "arn:ps-1"}, api_call
+            ),
+        )
+
+        assert all(isinstance(error, RuntimeError) for error in errors)
+        api_call.assert_called_once()
+        self.mock_cache_manager.set.assert_not_called()
+        assert CachedAwsClient.get_coalescing_stats() == {"describe_permission_set": 4}
+
+    def test_different_keys_are_not_coalesced(self):
+        """Test that calls with different parameters run independently."""
+        client = CachedAwsClient(self.mock_client_manager, self.mock_cache_manager)
+        api_call = Mock(side_effect=lambda: time.sleep(0.05) or {"ok": True})
+        counter = iter(range(100))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                account_id = str(next(counter))
+            return client._execute_with_cache(
+                "describe_account", {"account_id": account_id}, api_call
+            )
+
+        results, errors = self._run_concurrently(4, call)
+
+        assert errors == [None] * 4
+        assert api_call.call_count == 4
+        assert CachedAwsClient.get_coalescing_stats() == {}
+
+    def test_key_released_after_completion(self):
+        """Test that sequential calls each run once the previous flight finished."""
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+        assert flight.in_flight() == 0
+        assert flight.get_coalesced_counts() == {}
+
+
+class TestStaleWhileRevalidate:
+    """Test stale-while-revalidate serving mode."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client_manager = Mock(spec=AWSClientManager)
+        self.mock_client_manager.profile = "test-profile"
+        self.mock_client_manager.region = "us-east-1"
+        self.mock_cache_manager = Mock(spec=CacheManager)
+        self.mock_cache_manager.get_cache_config.return_value = None
+        self.cached_client = CachedAwsClient(
+            self.mock_client_manager,
+            self.mock_cache_manager,
+            stale_while_revalidate=True,
+            hard_ttl=7200,
+        )
+        CachedAwsClient.reset_stale_stats()
+
+    def teardown_method(self):
+        """Clean up stale-serving counters."""
+        CachedAwsClient.reset_stale_stats()
+
+    def _wait_for_refreshes(self):
+        deadline = time.time() + 5
+        while CachedAwsClient.get_stale_stats()["refreshes_in_progress"] and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_disabled_by_default(self):
+        """Test that the mode is opt-in."""
+        client = CachedAwsClient(self.mock_client_manager, self.mock_cache_manager)
+        assert client.stale_while_revalidate is False
+
+    def test_enabled_from_cache_config(self):
+        """Test that the mode and hard TTL are read from the cache configuration."""
+        config = Mock(stale_while_revalidate=True, hard_ttl=1800)
+        self.mock_cache_manager.get_cache_config.return_value = config
+
+        client = CachedAwsClient(self.mock_client_manager, self.mock_cache_manager)
+
+        assert client.stale_while_revalidate is True
+        assert client.hard_ttl == 1800
+
+    def test_miss_stores_envelope_with_hard_ttl(self):
+        """Test that results are stored with a soft expiry and the hard TTL."""
+        self.mock_cache_manager.get.return_value = None
+        api_call = Mock(return_value={"Users": []})
+
+        result = self.cached_client._execute_with_cache("list_users", {}, api_call)
+
+        assert result == {"Users": []}
+        stored_key, envelope = self.mock_cache_manager.set.call_args[0]
+        assert envelope[SWR_VALUE_KEY] == {"Users": []}
+        assert envelope[SWR_FRESH_UNTIL_KEY] > time.time()
+        assert self.mock_cache_manager.set.call_args[1]["ttl"] == timedelta(seconds=7200)
+
+    def test_fresh_envelope_is_served(self):
+        """Test that an entry within its soft TTL is a plain hit."""
+        self.mock_cache_manager.get.return_value = {
+            SWR_VALUE_KEY: {"Users": ["fresh"]},
+            SWR_FRESH_UNTIL_KEY: time.time() + 60,
+        }
+        api_call = Mock()
+
+        result = self.cached_client._execute_with_cache("list_users", {}, api_call)
+
+        assert result == {"Users": ["fresh"]}
+        api_call.assert_not_called()
+        assert CachedAwsClient.get_stale_stats()["stale_served"] == {}
+
+    def test_stale_entry_served_and_refreshed(self):
+        """Test that a stale entry is returned at once and refreshed in the background."""
+        self.mock_cache_manager.get.return_value = {
+            SWR_VALUE_KEY: {"Users": ["stale"]},
+            SWR_FRESH_UNTIL_KEY: time.time() - 1,
+        }
+        api_call = Mock(return_value={"Users": ["refreshed"]})
+
+        result = self.cached_client._execute_with_cache("list_users", {}, api_call)
+        self._wait_for_refreshes()
+
+        assert result == {"Users": ["stale"]}
+        api_call.assert_called_once()
+        envelope = self.mock_cache_manager.set.call_args[0][1]
+        assert envelope[SWR_VALUE_KEY] == {"Users": ["refreshed"]}
+
+        stats = CachedAwsClient.get_stale_stats()
+        assert stats["stale_served"] == {"list_users": 1}
+        assert stats["background_refreshes"] == {"list_users": 1}
+
+    def test_refresh_failure_keeps_stale_value(self):
+        """Test that a failed refresh is counted and does not affect the caller."""
+        self.mock_cache_manager.get.return_value = {
+            SWR_VALUE_KEY: ["stale"],
+            SWR_FRESH_UNTIL_KEY: time.time() - 1,
+        }
+        api_call = Mock(side_effect=Exception("Throttled"))
+
+        result = self.cached_client._execute_with_cache("list_groups", {}, api_call)
+        self._wait_for_refreshes()
+
+        assert result == ["stale"]
+        self.mock_cache_manager.set.assert_not_called()
+        assert CachedAwsClient.get_stale_stats()["refresh_failures"] == {"list_groups": 1}
+
+    def test_stale_entry_is_miss_when_disabled(self):
+        """Test that without the mode a stale envelope is refetched synchronously."""
+        client = CachedAwsClient(self.mock_client_manager, self.mock_cache_manager)
+        self.mock_cache_manager.get.return_value = {
+            SWR_VALUE_KEY: ["stale"],
+            SWR_FRESH_UNTIL_KEY: time.time() - 1,
+        }
+        api_call = Mock(return_value=["fresh"])
+
+        assert client._execute_with_cache("list_groups", {}, api_call) == ["fresh"]
+        api_call.assert_called_once()
+
+
 class TestCachedOrganizationsClient:
     """Test cases for CachedOrganizationsClient class."""
 
@@ -714,12 +949,12 @@ class TestCacheKeyGeneration:
         key2 = self.cached_client._generate_cache_key("test_op", large_params)
 
         # Keys should have similar structure (operation prefix + hash)
-        assert key1.startswith("test_op_")
-        assert key2.startswith("test_op_")
+        assert key1.startswith("other:all:test_op:")
+        assert key2.startswith("other:all:test_op:")
 
         # Hash portions should have consistent length
-        hash1 = key1.split("_", 2)[2]
-        hash2 = key2.split("_", 2)[2]
+        hash1 = key1.rsplit(":", 1)[1]
+        hash2 = key2.rsplit(":", 1)[1]
         assert len(hash1) == len(hash2)
 
 
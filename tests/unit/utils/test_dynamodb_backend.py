@@ -498,6 +498,93 @@ class TestDynamoDBBackend:
             self.backend._ensure_table_exists()
             mock_check.assert_not_called()
 
+    @patch.object(DynamoDBBackend, "_ensure_table_exists")
+    @patch.object(DynamoDBBackend, "table", new_callable=lambda: Mock())
+    def test_get_many_retries_unprocessed_keys(self, mock_table, mock_ensure_table):
+        """Test that batch get retries unprocessed keys and skips expired items."""
+        batch_client = mock_table.meta.client
+
+        def item(key, data, **extra):
+            return {"cache_key": key, "data": base64.b64encode(data).decode("utf-8"), **extra}
+
+        batch_client.batch_get_item.side_effect = [
+            {
+                "Responses": {
+                    "test-cache-table": [
+                        item("a", b"1"),
+                        item("old", b"x", ttl=int(time.time()) - 10),
+                    ]
+                },
+                "UnprocessedKeys": {"test-cache-table": {"Keys": [{"cache_key": "b"}]}},
+            },
+            {"Responses": {"test-cache-table": [item("b", b"2")]}},
+        ]
+
+        with patch("src.awsideman.cache.backends.dynamodb.time.sleep") as mock_sleep:
+            result = self.backend.get_many(["a", "b", "old", "missing", "a"])
+
+        assert result == {"a": b"1", "b": b"2"}
+        assert batch_client.batch_get_item.call_count == 2
+        first_request = batch_client.batch_get_item.call_args_list[0][1]["RequestItems"]
+        assert len(first_request["test-cache-table"]["Keys"]) == 4
+        mock_sleep.assert_called_once()
+
+    @patch.object(DynamoDBBackend, "_ensure_table_exists")
+    @patch.object(DynamoDBBackend, "table", new_callable=lambda: Mock())
+    def test_set_many_splits_into_batches(self, mock_table, mock_ensure_table):
+        """Test that batch writes are sent 25 items per request."""
+        batch_client = mock_table.meta.client
+        batch_client.batch_write_item.return_value = {}
+
+        items = {f"key-{i}": f"value-{i}".encode() for i in range(30)}
+        self.backend.set_many(items, ttl=300, operation="list_users")
+
+        calls = batch_client.batch_write_item.call_args_list
+        assert [len(c[1]["RequestItems"]["test-cache-table"]) for c in calls] == [25, 5]
+        put = calls[0][1]["RequestItems"]["test-cache-table"][0]["PutRequest"]["Item"]
+        assert put["cache_key"] == "key-0"
+        assert put["operation"] == "list_users"
+        assert "ttl" in put
+        mock_table.put_item.assert_not_called()
+
+    @patch.object(DynamoDBBackend, "_ensure_table_exists")
+    @patch.object(DynamoDBBackend, "table", new_callable=lambda: Mock())
+    def test_set_many_gives_up_after_retries(self, mock_table, mock_ensure_table):
+        """Test that items left unprocessed after every retry raise an error."""
+        batch_client = mock_table.meta.client
+        batch_client.batch_write_item.return_value = {
+            "UnprocessedItems": {"test-cache-table": [{"PutRequest": {"Item": {}}}]}
+        }
+
+        with patch("src.awsideman.cache.backends.dynamodb.time.sleep"):
+            with pytest.raises(CacheBackendError, match="unprocessed"):
+                self.backend.set_many({"key": b"value"})
+
+    @patch.object(DynamoDBBackend, "_ensure_table_exists")
+    @patch.object(DynamoDBBackend, "table", new_callable=lambda: Mock())
+    def test_delete_many_cleans_up_chunks(self, mock_table, mock_ensure_table):
+        """Test that batch delete removes chunks of chunked entries."""
+        batch_client = mock_table.meta.client
+        batch_client.batch_get_item.return_value = {
+            "Responses": {
+                "test-cache-table": [
+                    {"cache_key": "big", "is_chunked": True, "chunk_id": "chunk-1"},
+                    {"cache_key": "small"},
+                ]
+            }
+        }
+        batch_client.batch_write_item.return_value = {}
+
+        with patch.object(self.backend, "_cleanup_chunks") as mock_cleanup:
+            self.backend.delete_many(["big", "small"])
+
+        mock_cleanup.assert_called_once_with("big", "chunk-1")
+        deletes = batch_client.batch_write_item.call_args[1]["RequestItems"]["test-cache-table"]
+        assert deletes == [
+            {"DeleteRequest": {"Key": {"cache_key": "big"}}},
+            {"DeleteRequest": {"Key": {"cache_key": "small"}}},
+        ]
+
 
 class TestDynamoDBBackendTableManagement:
     """Test cases for DynamoDB table management operations."""
@@ -191,11 +191,11 @@ class TestDynamoDBChunking:
         # Verify batch operations
         assert mock_batch.put_item.call_count == 3  # 1 metadata + 2 chunks
 
-    @patch.object(DynamoDBBackend, "client", new_callable=lambda: Mock())
-    def test_get_chunks_batch(self, mock_client):
+    @patch.object(DynamoDBBackend, "table", new_callable=lambda: Mock())
+    def test_get_chunks_batch(self, mock_table):
         """Test retrieving chunks in batch."""
         # Mock batch_get_item response
-        mock_client.batch_get_item.return_value = {
+        mock_table.meta.client.batch_get_item.return_value = {
             "Responses": {
                 "test-cache-table": [
                     {"chunk_index": 0, "data": "chunk0data"},
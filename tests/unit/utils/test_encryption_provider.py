@@ -22,6 +22,30 @@ class TestEncryptionProvider:
         with pytest.raises(TypeError):
             EncryptionProvider()
 
+    def test_default_bytes_methods_wrap_encrypt(self):
+        """Test that providers without raw support still round trip bytes."""
+
+        class JsonOnlyProvider(EncryptionProvider):
+            def encrypt(self, data):
+                return json.dumps(data).encode("utf-8")
+
+            def decrypt(self, encrypted_data):
+                return json.loads(encrypted_data)
+
+            def get_encryption_type(self):
+                return "json-only"
+
+            def is_available(self):
+                return True
+
+        provider = JsonOnlyProvider()
+        payload = b"\x00\xffbinary"
+
+        assert provider.decrypt_bytes(provider.encrypt_bytes(payload)) == payload
+
+        with pytest.raises(EncryptionError):
+            provider.decrypt_bytes(json.dumps({"not": "base64"}).encode("utf-8"))
+
 
 class TestEncryptionError:
     """Test the EncryptionError exception class."""
@@ -59,6 +83,12 @@ class TestEncryptionError:
 class TestNoEncryption:
     """Test the NoEncryption provider implementation."""
 
+    def test_bytes_methods_pass_through(self):
+        """Test that raw payloads are stored unchanged."""
+        provider = NoEncryption()
+        assert provider.encrypt_bytes(b"payload") == b"payload"
+        assert provider.decrypt_bytes(b"payload") == b"payload"
+
     def setup_method(self):
         """Set up test fixtures."""
         self.provider = NoEncryption()
@@ -1,15 +1,18 @@
 """Tests for file backend implementation."""
 
 import json
+import os
+import pickle
 import tempfile
 import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from src.awsideman.cache.backends.base import CacheBackendError
 from src.awsideman.cache.backends.file import FileBackend
+from src.awsideman.encryption.aes import AESEncryption
 
 
 class TestFileBackend:
@@ -211,9 +214,8 @@ class TestFileBackend:
         self.backend.set("invalid_data_key", invalid_data, operation="test_op")
 
         result = self.backend.get("invalid_data_key")
-        # The file backend should handle invalid JSON gracefully and return the original data
-        # Since the file backend doesn't handle invalid JSON gracefully, we expect None
-        assert result is None
+        # Non-JSON payloads are stored in the binary format and returned unchanged
+        assert result == invalid_data
 
     def test_invalidate_specific_key(self):
         """Test invalidating a specific cache key."""
@@ -464,3 +466,389 @@ class TestFileBackend:
         result = self.backend.get("expired_encrypted_key")
         assert result is None
         assert not cache_file.exists()
+
+
+class TestFileBackendEncryption:
+    """Test cases for encrypted cache files."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.backend = FileBackend(cache_dir=self.temp_dir, encryption_enabled=False)
+        key_manager = Mock()
+        key_manager.get_key.return_value = os.urandom(32)
+        self.backend.encryption_enabled = True
+        self.backend.encryption_provider = AESEncryption(key_manager)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_metadata(self, key):
+        content = self.backend.path_manager.get_cache_file_path(key).read_bytes()
+        length = int.from_bytes(content[:4], byteorder="big")
+        return json.loads(content[4 : 4 + length]), content[4 + length :]
+
+    def test_encrypted_hit_returns_stored_bytes_without_reserializing(self):
+        """Test that an encrypted hit costs one decrypt and no pickle/JSON pass."""
+        data = pickle.dumps({"data": {"UserId": "u-1"}, "expires_at": 0.0})
+        self.backend.set("user:describe:u-1", data, ttl=300)
+
+        metadata, ciphertext = self._read_metadata("user:describe:u-1")
+        assert metadata["encrypted"] is True
+        assert metadata["payload"] == "raw"
+        assert data not in ciphertext
+
+        with (
+            patch("src.awsideman.cache.backends.file.json.dumps") as mock_dumps,
+            patch("pickle.dumps") as mock_pickle,
+        ):
+            assert self.backend.get("user:describe:u-1") == data
+
+        mock_dumps.assert_not_called()
+        mock_pickle.assert_not_called()
+
+    def test_legacy_json_encrypted_files_are_still_readable(self):
+        """Test that files encrypted as JSON by earlier versions still load."""
+        entry = {"data": ["a", "b"], "expires_at": 1.0, "created_at": 0.0, "ttl": 1.0}
+        metadata = {"encrypted": True, "created_at": time.time(), "ttl": 300, "key": "k"}
+        metadata_json = json.dumps(metadata).encode("utf-8")
+        cache_file = self.backend.path_manager.get_cache_file_path("legacy_key")
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(
+            len(metadata_json).to_bytes(4, byteorder="big")
+            + metadata_json
+            + self.backend.encryption_provider.encrypt(entry)
+        )
+
+        assert pickle.loads(self.backend.get("legacy_key")) == entry
+
+
+class TestFileBackendCompression:
+    """Test cases for lz4-compressed cache files."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.backend = FileBackend(
+            cache_dir=self.temp_dir, encryption_enabled=False, compression_threshold=1024
+        )
+        self.payload = pickle.dumps(
+            {"data": [{"AccountId": f"{i:012d}", "Status": "ACTIVE"} for i in range(500)]}
+        )
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_metadata(self, key):
+        content = self.backend.path_manager.get_cache_file_path(key).read_bytes()
+        length = int.from_bytes(content[:4], byteorder="big")
+        return json.loads(content[4 : 4 + length]), content[4 + length :]
+
+    def test_large_entries_are_stored_as_lz4_frames(self):
+        """Test that payloads above the threshold are compressed and read back transparently."""
+        self.backend.set("account:list:all", self.payload, ttl=300)
+
+        metadata, stored = self._read_metadata("account:list:all")
+        assert metadata["compression"] == "lz4"
+        assert metadata["uncompressed_size"] == len(self.payload)
+        assert metadata["compressed_size"] == len(stored) < len(self.payload)
+        assert stored.startswith(b"\x04\x22\x4d\x18")  # lz4 frame magic number
+
+        assert self.backend.get("account:list:all") == self.payload
+
+    def test_small_and_disabled_entries_keep_the_existing_format(self):
+        """Test that entries at or below the threshold are written uncompressed."""
+        small = json.dumps({"UserId": "u-1"}).encode("utf-8")
+        self.backend.set("user:describe:u-1", small)
+        assert json.loads(
+            self.backend.path_manager.get_cache_file_path("user:describe:u-1").read_text()
+        )
+
+        disabled = FileBackend(
+            cache_dir=self.temp_dir, encryption_enabled=False, compression_threshold=0
+        )
+        disabled.set("account:list:all", self.payload)
+        metadata, stored = self._read_metadata("account:list:all")
+        assert "compression" not in metadata
+        assert stored == self.payload
+
+    def test_incompressible_entries_are_stored_raw(self):
+        """Test that compression is skipped when it does not shrink the payload."""
+        data = os.urandom(4096)
+        self.backend.set("random", data)
+
+        metadata, stored = self._read_metadata("random")
+        assert "compression" not in metadata
+        assert stored == data
+        assert self.backend.get("random") == data
+
+        compression = self.backend.get_stats()["compression"]
+        assert compression["compressed_entries"] == 0
+        assert compression["incompressible_entries"] == 1
+
+    def test_compression_happens_before_encryption(self):
+        """Test that encrypted entries hold an encrypted lz4 frame."""
+        key_manager = Mock()
+        key_manager.get_key.return_value = os.urandom(32)
+        self.backend.encryption_enabled = True
+        self.backend.encryption_provider = AESEncryption(key_manager)
+
+        self.backend.set("account:list:all", self.payload, ttl=300)
+
+        metadata, ciphertext = self._read_metadata("account:list:all")
+        assert metadata["encrypted"] is True
+        assert metadata["compression"] == "lz4"
+        assert len(ciphertext) < len(self.payload)
+        assert self.backend.get("account:list:all") == self.payload
+
+    def test_stats_report_compressed_and_uncompressed_totals(self):
+        """Test the compression accounting, including after the key index is rebuilt."""
+        self.backend.set_many({"a": self.payload, "b": self.payload}, ttl=300)
+        self.backend.set("c", b"x")
+
+        compression = self.backend.get_stats()["compression"]
+        assert compression["codec"] == "lz4"
+        assert compression["threshold_bytes"] == 1024
+        assert compression["compressed_entries"] == 2
+        assert compression["uncompressed_bytes"] == 2 * len(self.payload)
+        assert 0 < compression["compressed_bytes"] < compression["uncompressed_bytes"]
+        assert compression["compression_ratio"] < 1
+        assert compression["compress_time_ms"] > 0
+
+        self.backend.key_index.index_file.unlink()
+        rebuilt = FileBackend(cache_dir=self.temp_dir, encryption_enabled=False)
+        rebuilt.list_keys()
+        rebuilt_compression = rebuilt.get_stats()["compression"]
+        assert rebuilt_compression["uncompressed_bytes"] == compression["uncompressed_bytes"]
+        assert rebuilt_compression["compressed_bytes"] == compression["compressed_bytes"]
+
+    def test_corrupted_frame_is_treated_as_corrupted_file(self):
+        """Test that an unreadable lz4 frame is removed and reported as a miss."""
+        self.backend.set("account:list:all", self.payload)
+        cache_file = self.backend.path_manager.get_cache_file_path("account:list:all")
+        content = cache_file.read_bytes()
+        cache_file.write_bytes(content[:-64] + b"\x00" * 64)
+
+        assert self.backend.get("account:list:all") is None
+        assert not cache_file.exists()
+
+
+class TestFileBackendKeyIndex:
+    """Test cases for the file backend's persistent key index."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.backend = FileBackend(cache_dir=self.temp_dir, encryption_enabled=False)
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _store(self, key, ttl=300, operation="list_users"):
+        self.backend.set(
+            key, json.dumps({"key": key}).encode("utf-8"), ttl=ttl, operation=operation
+        )
+
+    def test_list_keys_after_set_and_invalidate(self):
+        """Test that set and invalidate keep the index up to date."""
+        self._store("user:list:all")
+        self._store("group:list:all")
+        assert sorted(self.backend.list_keys()) == ["group:list:all", "user:list:all"]
+
+        self.backend.invalidate("user:list:all")
+        assert self.backend.list_keys() == ["group:list:all"]
+
+        self.backend.invalidate()
+        assert self.backend.list_keys() == []
+
+    def test_list_keys_does_not_open_indexed_files(self):
+        """Test that listing keys is served from the index without reading cache files."""
+        for i in range(5):
+            self._store(f"user:describe:user-{i}")
+
+        with patch.object(self.backend, "_read_index_metadata") as mock_read:
+            keys = self.backend.list_keys()
+
+        assert len(keys) == 5
+        mock_read.assert_not_called()
+
+    def test_index_is_shared_between_instances(self):
+        """Test that a second backend on the same directory sees existing keys."""
+        self._store("user:list:all")
+
+        other = FileBackend(cache_dir=self.temp_dir, encryption_enabled=False)
+        with patch.object(other, "_read_index_metadata") as mock_read:
+            assert other.list_keys() == ["user:list:all"]
+        mock_read.assert_not_called()
+
+        other.invalidate("user:list:all")
+        assert self.backend.list_keys() == []
+
+    def test_index_rebuilds_for_unindexed_files(self):
+        """Test that files written without the index are picked up once."""
+        cache_file = self.backend.path_manager.get_cache_file_path("legacy_key")
+        cache_data = {
+            "data": {"legacy": True},
+            "created_at": time.time(),
+            "ttl": 3600,
+            "key": "legacy_key",
+            "operation": "list_users",
+        }
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache_data, f)
+
+        assert self.backend.list_keys() == ["legacy_key"]
+
+    def test_index_drops_files_removed_externally(self):
+        """Test that entries whose files disappeared are dropped from the index."""
+        self._store("user:list:all")
+        self.backend.path_manager.get_cache_file_path("user:list:all").unlink()
+
+        assert self.backend.list_keys() == []
+
+    def test_index_file_not_counted_as_cache_entry(self):
+        """Test that the index journal is not reported as a cache file."""
+        self._store("user:list:all")
+
+        assert self.backend.get_stats()["total_entries"] == 1
+
+    def test_cleanup_expired_files_uses_index(self):
+        """Test that cleanup removes expired entries and updates the index."""
+        self._store("user:list:all", ttl=3600)
+        self._store("group:list:all", ttl=1)
+
+        future = time.time() + 10
+        with patch("src.awsideman.cache.backends.file.time.time", return_value=future):
+            removed = self.backend.cleanup_expired_files()
+
+        assert removed == 1
+        assert self.backend.list_keys() == ["user:list:all"]
+        assert not self.backend.path_manager.get_cache_file_path("group:list:all").exists()
+
+    def test_sweep_expired_in_slices(self):
+        """Test that the sweep removes expired files a bounded slice at a time."""
+        for i in range(5):
+            self._store(f"group:list:{i}", ttl=1)
+        self._store("user:list:all", ttl=3600)
+        expired_bytes = sum(
+            entry.size for entry in self.backend.key_index.entries() if entry.ttl == 1
+        )
+
+        cursor = None
+        slices = []
+        future = time.time() + 10
+        with patch("src.awsideman.cache.backends.file.time.time", return_value=future):
+            while True:
+                result = self.backend.sweep_expired(cursor, limit=2)
+                slices.append(result)
+                cursor = result.cursor
+                if cursor is None:
+                    break
+
+        assert [result.scanned for result in slices] == [2, 2, 2, 0]
+        assert sum(result.removed for result in slices) == 5
+        assert sum(result.bytes_freed for result in slices) == expired_bytes
+        assert self.backend.list_keys() == ["user:list:all"]
+
+    def test_sweep_reads_unindexed_files_a_slice_at_a_time(self):
+        """Test that a sweep pass does not read every unindexed file up front."""
+        for i in range(6):
+            self._store(f"group:list:{i}", ttl=1)
+        self.backend.key_index.clear()
+        read_metadata = self.backend._read_index_metadata
+
+        cursor = None
+        reads = []
+        future = time.time() + 10
+        with patch("src.awsideman.cache.backends.file.time.time", return_value=future):
+            while True:
+                with patch.object(
+                    self.backend, "_read_index_metadata", side_effect=read_metadata
+                ) as mock_read:
+                    result = self.backend.sweep_expired(cursor, limit=2)
+                reads.append(mock_read.call_count)
+                cursor = result.cursor
+                if cursor is None:
+                    break
+
+        assert reads == [2, 2, 2, 0]
+        assert self.backend.list_keys() == []
+
+    def test_get_recent_entries_from_index(self):
+        """Test recent entries are ordered newest first with parsed metadata."""
+        self._store("user:all:list_users:0a1b2c3d4e5f", operation="list_users")
+        time.sleep(0.01)
+        self._store("group:g-1:describe_group:0a1b2c3d4e5f", operation="describe_group")
+
+        entries = self.backend.get_recent_entries(limit=10)
+
+        assert [entry["resource"] for entry in entries] == ["group", "user"]
+        assert entries[0]["operation"] == "describe_group"
+        assert entries[0]["is_expired"] is False
+        assert (
+            entries[0]["key"]
+            == self.backend.path_manager.get_cache_file_path(
+                "group:g-1:describe_group:0a1b2c3d4e5f"
+            ).stem
+        )
+
+    def test_index_compaction_preserves_entries(self):
+        """Test that compacting the journal keeps live entries only."""
+        self.backend.key_index.compact_threshold = 10
+        for i in range(30):
+            self._store("user:list:all")
+        self._store("group:list:all")
+
+        index_lines = self.backend.key_index.index_file.read_text().splitlines()
+        assert len(index_lines) < 10
+        assert sorted(self.backend.list_keys()) == ["group:list:all", "user:list:all"]
+
+    def test_batch_operations_update_index_once(self):
+        """Test that set_many writes every file with a single index update."""
+        items = {f"user:describe:u-{i}": f"value-{i}".encode() for i in range(20)}
+
+        with patch.object(
+            self.backend.key_index,
+            "record_set_many",
+            wraps=self.backend.key_index.record_set_many,
+        ) as spy:
+            self.backend.set_many(items, ttl=300, operation="describe_user")
+
+        spy.assert_called_once()
+        assert self.backend.get_many(list(items) + ["user:describe:missing"]) == items
+        assert len(self.backend.list_keys("user:describe:")) == 20
+
+        self.backend.delete_many(list(items)[:15])
+        assert sorted(self.backend.list_keys()) == sorted(list(items)[15:])
+        assert self.backend.get("user:describe:u-0") is None
+
+    def test_dependency_tags_survive_reload_and_compaction(self):
+        """Test that tags are replayed by other instances and kept by compaction."""
+        self.backend.key_index.compact_threshold = 10
+        self._store("user:describe:u-1")
+        self._store("group:members:g-1")
+        self.backend.tag({"user:describe:u-1": ["user:u-1"], "group:members:g-1": ["user:u-1"]})
+        for _ in range(20):
+            self._store("group:list:all")
+
+        other = FileBackend(cache_dir=self.temp_dir, encryption_enabled=False)
+        assert sorted(other.keys_for_tags(["user:u-1"])) == [
+            "group:members:g-1",
+            "user:describe:u-1",
+        ]
+
+        # Rewriting a key drops its previous tags
+        self._store("group:members:g-1")
+        assert other.keys_for_tags(["user:u-1"]) == ["user:describe:u-1"]
+
+        self.backend.delete_many(["user:describe:u-1"])
+        assert other.keys_for_tags(["user:u-1"]) == []
@@ -1,5 +1,6 @@
 """Tests for data models and hierarchy builder functionality."""
 
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
@@ -8,8 +9,6 @@ from botocore.exceptions import ClientError
 
 from src.awsideman.aws_clients.manager import (
     OrganizationsClient,
-    _account_matches_ou_filter,
-    _account_matches_tag_filter,
     _build_children_recursive,
     _calculate_ou_path,
     _create_org_node_from_data,
@@ -86,6 +85,17 @@ class TestOrgNode:
         assert ou_node.is_account() is False
         assert account_node.is_account() is True
 
+    def test_to_dict_and_from_dict_round_trip(self):
+        """Test that a subtree survives conversion to a dictionary and back."""
+        account_node = OrgNode("111111111111", "dev-account", NodeType.ACCOUNT, [])
+        ou_node = OrgNode("ou-5678", "Engineering", NodeType.OU, [account_node])
+        root_node = OrgNode("r-1234", "Root", NodeType.ROOT, [ou_node])
+
+        data = root_node.to_dict()
+
+        assert data["children"][0]["type"] == "OU"
+        assert OrgNode.from_dict(data) == root_node
+
 
 class TestAccountDetails:
     """Test AccountDetails data model."""
@@ -601,6 +611,46 @@ class TestBuildOrganizationHierarchy:
         assert hierarchy[0].id == "r-1234567890"
         assert len(hierarchy[0].children) == 0  # No children due to failures
 
+    def test_build_hierarchy_fetches_level_concurrently(self, mock_organizations_client):
+        """Test that the children of all OUs of a level are fetched at the same time."""
+        mock_organizations_client.list_roots.return_value = [{"Id": "r-1234", "Name": "Root"}]
+        ou_ids = [f"ou-1234-{n:08d}" for n in range(8)]
+        barrier = threading.Barrier(len(ou_ids), timeout=5)
+
+        def mock_list_ous(parent_id):
+            if parent_id == "r-1234":
+                return [{"Id": ou_id, "Name": ou_id} for ou_id in ou_ids]
+            # Only passes if every OU of the level is being fetched at once
+            barrier.wait()
+            return []
+
+        def mock_list_accounts(parent_id):
+            if parent_id == "r-1234":
+                return []
+            return [{"Id": f"acct-{parent_id}", "Name": f"account-{parent_id}"}]
+
+        mock_organizations_client.list_organizational_units_for_parent.side_effect = mock_list_ous
+        mock_organizations_client.list_accounts_for_parent.side_effect = mock_list_accounts
+
+        hierarchy = build_organization_hierarchy(mock_organizations_client, max_concurrency=8)
+
+        # Children keep the order returned by the API
+        assert [ou.id for ou in hierarchy[0].children] == ou_ids
+        assert all(ou.children[0].id == f"acct-{ou.id}" for ou in hierarchy[0].children)
+
+    def test_build_hierarchy_skips_repeated_nodes(self, mock_organizations_client):
+        """Test that a node reported under two parents is attached only once."""
+        mock_organizations_client.list_roots.return_value = [{"Id": "r-1234", "Name": "Root"}]
+        mock_organizations_client.list_organizational_units_for_parent.side_effect = (
+            lambda parent_id: [{"Id": "ou-loop", "Name": "Loop"}]
+        )
+        mock_organizations_client.list_accounts_for_parent.return_value = []
+
+        hierarchy = build_organization_hierarchy(mock_organizations_client)
+
+        assert len(hierarchy[0].children) == 1
+        assert hierarchy[0].children[0].children == []
+
 
 class TestBuildChildrenRecursive:
     """Test _build_children_recursive function."""
@@ -889,75 +939,6 @@ class TestCalculateOuPath:
         mock_console.print.assert_called()
 
 
-class TestAccountMatchingFilters:
-    """Test account matching filter functions."""
-
-    def test_account_matches_ou_filter_direct_match(self):
-        """Test OU filter with direct match."""
-        account = AccountDetails(
-            id="111111111111",
-            name="dev-account",
-            email="dev@example.com",
-            status="ACTIVE",
-            joined_timestamp=datetime(2021, 1, 1, tzinfo=timezone.utc),
-            tags={},
-            ou_path=["Root", "Engineering", "Development"],
-        )
-
-        assert _account_matches_ou_filter(account, "Engineering") is True
-        assert _account_matches_ou_filter(account, "Development") is True
-        assert _account_matches_ou_filter(account, "Root") is True
-        assert _account_matches_ou_filter(account, "Marketing") is False
-
-    def test_account_matches_tag_filter_single_tag(self):
-        """Test tag filter with single tag."""
-        account = AccountDetails(
-            id="111111111111",
-            name="dev-account",
-            email="dev@example.com",
-            status="ACTIVE",
-            joined_timestamp=datetime(2021, 1, 1, tzinfo=timezone.utc),
-            tags={"Environment": "Development", "Team": "Engineering"},
-            ou_path=[],
-        )
-
-        assert _account_matches_tag_filter(account, {"Environment": "Development"}) is True
-        assert _account_matches_tag_filter(account, {"Team": "Engineering"}) is True
-        assert _account_matches_tag_filter(account, {"Environment": "Production"}) is False
-        assert _account_matches_tag_filter(account, {"NonExistent": "Value"}) is False
-
-    def test_account_matches_tag_filter_multiple_tags(self):
-        """Test tag filter with multiple tags."""
-        account = AccountDetails(
-            id="111111111111",
-            name="dev-account",
-            email="dev@example.com",
-            status="ACTIVE",
-            joined_timestamp=datetime(2021, 1, 1, tzinfo=timezone.utc),
-            tags={"Environment": "Development", "Team": "Engineering", "Project": "WebApp"},
-            ou_path=[],
-        )
-
-        # All tags match
-        assert (
-            _account_matches_tag_filter(
-                account, {"Environment": "Development", "Team": "Engineering"}
-            )
-            is True
-        )
-
-        # One tag doesn't match
-        assert (
-            _account_matches_tag_filter(
-                account, {"Environment": "Development", "Team": "Marketing"}
-            )
-            is False
-        )
-
-        # Empty filter should match
-        assert _account_matches_tag_filter(account, {}) is True
-
-
 class TestSearchAccounts:
     """Test search_accounts function."""
 
@@ -1132,7 +1113,7 @@ class TestSearchAccounts:
 
             with patch("src.awsideman.aws_clients.manager.get_account_details") as mock_get_details:
 
-                def mock_details_side_effect(client, account_id):
+                def mock_details_side_effect(client, account_id, **kwargs):
                     if account_id == "111111111111":
                         raise Exception("Account details error")
                     return AccountDetails(
@@ -1162,58 +1143,30 @@ class TestGetAllAccountsInOrganization:
     """Test _get_all_accounts_in_organization function."""
 
     def test_get_all_accounts_success(self, mock_organizations_client):
-        """Test successful retrieval of all accounts."""
-        # Mock build_organization_hierarchy
-        with patch("src.awsideman.aws_clients.manager.build_organization_hierarchy") as mock_build:
-            # Create a mock hierarchy
-            account1 = OrgNode("111111111111", "dev-account", NodeType.ACCOUNT, [])
-            account2 = OrgNode("222222222222", "prod-account", NodeType.ACCOUNT, [])
-            ou = OrgNode("ou-1234", "Engineering", NodeType.OU, [account1, account2])
-            root = OrgNode("r-1234", "Root", NodeType.ROOT, [ou])
-
-            mock_build.return_value = [root]
-
-            # Mock describe_account calls
-            mock_organizations_client.describe_account.side_effect = [
+        """Test that all accounts come from a single list_accounts call."""
+        mock_organizations_client.list_accounts.return_value = {
+            "Accounts": [
                 {"Id": "111111111111", "Name": "dev-account"},
                 {"Id": "222222222222", "Name": "prod-account"},
             ]
+        }
 
-            # Get all accounts
-            accounts = _get_all_accounts_in_organization(mock_organizations_client)
-
-            # Should return both accounts
-            assert len(accounts) == 2
-            assert accounts[0]["Id"] == "111111111111"
-            assert accounts[1]["Id"] == "222222222222"
-
-    @patch("src.awsideman.aws_clients.manager.console")
-    def test_get_all_accounts_describe_failure(self, mock_console, mock_organizations_client):
-        """Test retrieval with describe_account failure."""
-        with patch("src.awsideman.aws_clients.manager.build_organization_hierarchy") as mock_build:
-            account1 = OrgNode("111111111111", "dev-account", NodeType.ACCOUNT, [])
-            account2 = OrgNode("222222222222", "prod-account", NodeType.ACCOUNT, [])
-            root = OrgNode("r-1234", "Root", NodeType.ROOT, [account1, account2])
-
-            mock_build.return_value = [root]
-
-            # Mock describe_account - first fails, second succeeds
-            def mock_describe_side_effect(account_id):
-                if account_id == "111111111111":
-                    raise Exception("Describe error")
-                return {"Id": "222222222222", "Name": "prod-account"}
-
-            mock_organizations_client.describe_account.side_effect = mock_describe_side_effect
+        # Get all accounts
+        accounts = _get_all_accounts_in_organization(mock_organizations_client)
 
-            # Get all accounts
-            accounts = _get_all_accounts_in_organization(mock_organizations_client)
+        # Should return both accounts without per-account lookups
+        assert len(accounts) == 2
+        assert accounts[0]["Id"] == "111111111111"
+        assert accounts[1]["Id"] == "222222222222"
+        mock_organizations_client.list_accounts.assert_called_once()
+        mock_organizations_client.describe_account.assert_not_called()
+        mock_organizations_client.list_roots.assert_not_called()
 
-            # Should return only the successful account
-            assert len(accounts) == 1
-            assert accounts[0]["Id"] == "222222222222"
+    def test_get_all_accounts_unexpected_response(self, mock_organizations_client):
+        """Test that a malformed list_accounts response yields no accounts."""
+        mock_organizations_client.list_accounts.return_value = None
 
-            # Should have printed warning
-            mock_console.print.assert_called()
+        assert _get_all_accounts_in_organization(mock_organizations_client) == []
 
 
 class TestEdgeCasesAndMalformedData:
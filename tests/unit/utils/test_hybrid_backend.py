@@ -1,5 +1,8 @@
 """Tests for hybrid backend implementation."""
 
+import shutil
+import tempfile
+import threading
 import time
 from unittest.mock import Mock, patch
 
@@ -9,6 +12,8 @@ from src.awsideman.cache.backends.base import BackendHealthStatus, CacheBackendE
 from src.awsideman.cache.backends.dynamodb import DynamoDBBackend
 from src.awsideman.cache.backends.file import FileBackend
 from src.awsideman.cache.backends.hybrid import HybridBackend
+from src.awsideman.cache.backends.write_behind import WriteBehindQueue
+from tests.fixtures.cache_backends import LocalDynamoDB, local_dynamodb_backend
 
 
 class TestHybridBackend:
@@ -198,6 +203,47 @@ class TestHybridBackend:
         )
         mock_file_backend.set.assert_called_once_with("test_key", test_data, 300, "test_operation")
 
+    def test_get_many_fetches_local_misses_from_remote(
+        self, hybrid_backend, mock_file_backend, mock_dynamodb_backend
+    ):
+        """Test that only local misses go to the remote backend, in one batch."""
+        mock_file_backend.get_many.return_value = {"a": b"1"}
+        mock_dynamodb_backend.get_many.return_value = {"b": b"2"}
+
+        with patch.object(hybrid_backend, "_should_promote_to_local", return_value=True):
+            result = hybrid_backend.get_many(["a", "b", "c"])
+
+        assert result == {"a": b"1", "b": b"2"}
+        mock_file_backend.get_many.assert_called_once_with(["a", "b", "c"])
+        mock_dynamodb_backend.get_many.assert_called_once_with(["b", "c"])
+        mock_file_backend.set_many.assert_called_once_with({"b": b"2"}, 300, "promotion")
+
+    def test_set_many_writes_both_tiers(
+        self, hybrid_backend, mock_file_backend, mock_dynamodb_backend
+    ):
+        """Test that batch writes go to the remote tier and, capped by local TTL, locally."""
+        items = {"a": b"1", "b": b"2"}
+
+        with patch.object(
+            hybrid_backend, "_should_cache_locally", side_effect=lambda k, o: k == "a"
+        ):
+            hybrid_backend.set_many(items, 3600, "list_users")
+
+        mock_dynamodb_backend.set_many.assert_called_once_with(items, 3600, "list_users")
+        mock_file_backend.set_many.assert_called_once_with({"a": b"1"}, 300, "list_users")
+
+    def test_delete_many_clears_both_tiers(
+        self, hybrid_backend, mock_file_backend, mock_dynamodb_backend
+    ):
+        """Test that batch deletes reach both tiers and drop access tracking."""
+        hybrid_backend._access_counts["a"] = 3
+
+        hybrid_backend.delete_many(["a", "b"])
+
+        mock_file_backend.delete_many.assert_called_once_with(["a", "b"])
+        mock_dynamodb_backend.delete_many.assert_called_once_with(["a", "b"])
+        assert "a" not in hybrid_backend._access_counts
+
     def test_invalidate_single_key(self, hybrid_backend, mock_file_backend, mock_dynamodb_backend):
         """Test invalidating a single key from both backends."""
         # Set up some access tracking data
@@ -521,3 +567,116 @@ class TestHybridBackend:
         assert status.is_healthy is True
         assert status.backend_type == "hybrid"
         assert status.response_time_ms is not None
+
+
+class TestHybridWriteBehind:
+    """Test the write-behind mode of the hybrid backend."""
+
+    def setup_method(self):
+        """Create a hybrid backend over a temporary file cache and an in-memory table."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = LocalDynamoDB()
+        self.backend = HybridBackend(
+            local_backend=FileBackend(cache_dir=self.temp_dir, encryption_enabled=False),
+            remote_backend=local_dynamodb_backend(self.store),
+            write_behind_queue_size=10,
+        )
+        # A long flush interval keeps the flusher idle until a test flushes explicitly
+        self.backend._write_behind.close()
+        self.backend._write_behind = WriteBehindQueue(
+            self.backend.remote_backend, max_size=10, flush_interval=60, enqueue_timeout=0.05
+        )
+
+    def teardown_method(self):
+        """Stop the flusher and remove the cache directory."""
+        self.backend.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_writes_land_locally_and_flush_in_batches(self):
+        """Test that a set is served locally at once and reaches DynamoDB via BatchWriteItem."""
+        self.backend.set_many({f"key_{i}": b"x" for i in range(5)}, ttl=300, operation="op")
+        self.backend.set("key_5", b"y", ttl=300, operation="op")
+
+        assert self.backend.local_backend.get("key_5") == b"y"
+        assert self.store.items == {}
+
+        assert self.backend.flush() == 6
+        assert len(self.store.items) == 6
+        assert self.store.requests.get("PutItem") is None
+        assert self.store.requests["BatchWriteItem"] == 1
+
+    def test_pending_writes_are_coalesced_and_readable(self):
+        """Test that only the latest queued write of a key is flushed."""
+        self.backend.set("key", b"old", ttl=300)
+        self.backend.set("key", b"new", ttl=300)
+        self.backend.local_backend.invalidate("key")
+
+        assert self.backend.get("key") == b"new"
+        self.backend.flush()
+        assert self.backend.remote_backend.get("key") == b"new"
+        assert self.backend.get_stats()["write_behind"]["coalesced"] == 1
+
+    def test_invalidate_drops_queued_writes(self):
+        """Test that a queued write cannot recreate an invalidated entry."""
+        self.backend.set("key", b"value", ttl=300)
+        self.backend.invalidate("key")
+        self.backend.flush()
+
+        assert self.backend.get("key") is None
+        assert self.store.items == {}
+
+    def test_full_queue_falls_back_to_synchronous_writes(self):
+        """Test backpressure: with DynamoDB stalled, writers end up writing synchronously."""
+        remote = self.backend.remote_backend
+        self.backend._write_behind.close()
+        self.backend._write_behind = WriteBehindQueue(
+            remote, max_size=10, flush_interval=60, enqueue_timeout=0.5
+        )
+        gate = threading.Event()
+        original_set_many = remote.set_many
+
+        def stalled_set_many(*args, **kwargs):
+            gate.wait(5)
+            return original_set_many(*args, **kwargs)
+
+        with patch.object(remote, "set_many", side_effect=stalled_set_many):
+            # 10 fill the queue, the flusher takes them and stalls, 10 more fill it again
+            for i in range(21):
+                self.backend.set(f"key_{i}", b"x", ttl=300)
+
+            stats = self.backend.get_stats()["write_behind"]
+            assert stats["backpressure_waits"] >= 2
+            assert stats["sync_fallbacks"] >= 1
+            assert self.store.requests["PutItem"] == stats["sync_fallbacks"]
+
+            gate.set()
+            self.backend.flush()
+
+        assert len(self.store.items) == 21
+
+    def test_close_flushes_pending_writes(self):
+        """Test that closing the backend flushes the queue and records flush latency."""
+        self.backend.set("key", b"value", ttl=300)
+        queue = self.backend._write_behind
+
+        self.backend.close()
+
+        assert self.backend.remote_backend.get("key") == b"value"
+        stats = queue.stats()
+        assert stats["flushed"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["flush_latency_ms"]["max"] >= 0
+        assert queue.put("other", b"x", 300, "op") is False
+
+    def test_background_flusher_drains_full_batches(self):
+        """Test that the flusher thread writes a batch as soon as it fills up."""
+        self.backend._write_behind.close()
+        self.backend._write_behind = WriteBehindQueue(
+            self.backend.remote_backend, max_size=10, flush_interval=60, batch_size=3
+        )
+        self.backend.set_many({f"key_{i}": b"x" for i in range(3)}, ttl=300)
+
+        deadline = time.time() + 5
+        while len(self.store.items) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(self.store.items) == 3
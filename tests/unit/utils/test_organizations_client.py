@@ -106,6 +106,32 @@ class TestOrganizationsClientWrapper:
         assert result == expected_accounts
         self.mock_boto_client.list_accounts_for_parent.assert_called_once_with(ParentId=parent_id)
 
+    def test_list_accounts_for_parent_follows_next_token(self):
+        """Test that list_accounts_for_parent returns every page."""
+        self.mock_boto_client.list_accounts_for_parent.side_effect = [
+            {"Accounts": [{"Id": "111111111111"}], "NextToken": "page-2"},
+            {"Accounts": [{"Id": "222222222222"}]},
+        ]
+
+        result = self.client.list_accounts_for_parent("r-1234567890")
+
+        assert [account["Id"] for account in result] == ["111111111111", "222222222222"]
+        self.mock_boto_client.list_accounts_for_parent.assert_called_with(
+            ParentId="r-1234567890", NextToken="page-2"
+        )
+
+    def test_list_accounts_follows_next_token(self):
+        """Test that list_accounts joins all pages into one response."""
+        self.mock_boto_client.list_accounts.side_effect = [
+            {"Accounts": [{"Id": "111111111111"}], "NextToken": "page-2"},
+            {"Accounts": [{"Id": "222222222222"}]},
+        ]
+
+        result = self.client.list_accounts()
+
+        assert result == {"Accounts": [{"Id": "111111111111"}, {"Id": "222222222222"}]}
+        assert self.mock_boto_client.list_accounts.call_count == 2
+
     def test_describe_account_success(self):
         """Test successful describe_account call."""
         account_id = "111111111111"
@@ -11,7 +11,7 @@ import pytest
 from botocore.exceptions import ClientError
 
 from src.awsideman.aws_clients.manager import OrganizationsClient, PolicyResolver
-from src.awsideman.utils.models import HierarchyPath, NodeType, PolicyInfo, PolicyType
+from src.awsideman.utils.models import HierarchyPath, NodeType, OrgNode, PolicyInfo, PolicyType
 
 
 class TestPolicyResolver:
@@ -82,7 +82,7 @@ class TestPolicyResolver:
         ]
 
         with patch.object(policy_resolver, "_get_hierarchy_path", return_value=hierarchy_path):
-            with patch.object(policy_resolver, "_get_policies_for_target") as mock_get_policies:
+            with patch.object(policy_resolver, "_fetch_policies_for_target") as mock_get_policies:
                 # Configure mock to return different policies for different calls
                 mock_get_policies.side_effect = [
                     [scp_policies[0]],  # Root SCP
@@ -101,7 +101,7 @@ class TestPolicyResolver:
                 assert scp_policies[1] in result
                 assert rcp_policies[0] in result
 
-                # Verify _get_policies_for_target was called correctly
+                # Verify _fetch_policies_for_target was called correctly
                 assert mock_get_policies.call_count == 6  # 2 policy types × 3 hierarchy levels
 
                 # Verify calls for each hierarchy level and policy type
@@ -177,7 +177,7 @@ class TestPolicyResolver:
         )
 
         with patch.object(policy_resolver, "_get_hierarchy_path", return_value=hierarchy_path):
-            with patch.object(policy_resolver, "_get_policies_for_target") as mock_get_policies:
+            with patch.object(policy_resolver, "_fetch_policies_for_target") as mock_get_policies:
                 # First call succeeds, second call fails, third succeeds, fourth fails
                 mock_get_policies.side_effect = [
                     [successful_policy],  # Root SCP - success
@@ -499,7 +499,7 @@ class TestPolicyResolver:
         )
 
         with patch.object(policy_resolver, "_get_hierarchy_path", return_value=hierarchy_path):
-            with patch.object(policy_resolver, "_get_policies_for_target") as mock_get_policies:
+            with patch.object(policy_resolver, "_fetch_policies_for_target") as mock_get_policies:
                 # Return SCP for SCP call, RCP for RCP call
                 mock_get_policies.side_effect = [[scp_policy], [rcp_policy]]  # SCP call  # RCP call
 
@@ -574,7 +574,7 @@ class TestPolicyResolver:
         )
 
         with patch.object(policy_resolver, "_get_hierarchy_path", return_value=hierarchy_path):
-            with patch.object(policy_resolver, "_get_policies_for_target") as mock_get_policies:
+            with patch.object(policy_resolver, "_fetch_policies_for_target") as mock_get_policies:
                 # Configure mock to return policies at different levels
                 mock_get_policies.side_effect = [
                     [root_scp],  # Root SCP
@@ -657,7 +657,7 @@ class TestPolicyResolver:
         )
 
         with patch.object(policy_resolver, "_get_hierarchy_path", return_value=hierarchy_path):
-            with patch.object(policy_resolver, "_get_policies_for_target") as mock_get_policies:
+            with patch.object(policy_resolver, "_fetch_policies_for_target") as mock_get_policies:
                 mock_get_policies.side_effect = [
                     [enabled_policy],  # Root SCP
                     [],  # Root RCP
@@ -683,3 +683,155 @@ class TestPolicyResolver:
                 assert attachment_points["p-enabled"] == "r-1234"  # From root
                 assert attachment_points["p-conditional"] == "ou-5678"  # From OU
                 assert attachment_points["p-disabled"] == "ou-5678"  # From OU
+
+
+class TestPolicyResolverBulk:
+    """Test resolving the policies of several accounts at once."""
+
+    @pytest.fixture
+    def organization_tree(self):
+        """Create a hierarchy with two accounts sharing an OU and one under the root."""
+        return [
+            OrgNode(
+                "r-1234",
+                "Root",
+                NodeType.ROOT,
+                [
+                    OrgNode(
+                        "ou-5678",
+                        "Engineering",
+                        NodeType.OU,
+                        [
+                            OrgNode("111111111111", "dev-account", NodeType.ACCOUNT, []),
+                            OrgNode("222222222222", "prod-account", NodeType.ACCOUNT, []),
+                        ],
+                    ),
+                    OrgNode("333333333333", "management", NodeType.ACCOUNT, []),
+                ],
+            )
+        ]
+
+    @pytest.fixture
+    def mock_organizations_client(self):
+        """Create a mock client that attaches one SCP to every target."""
+        client = Mock(spec=OrganizationsClient)
+
+        def list_policies_for_target(target_id, filter_type):
+            if filter_type != "SERVICE_CONTROL_POLICY":
+                return []
+            return [{"Id": f"p-{target_id}", "Name": f"policy-{target_id}", "AwsManaged": False}]
+
+        client.list_policies_for_target.side_effect = list_policies_for_target
+        return client
+
+    def test_shared_targets_are_fetched_once(self, mock_organizations_client, organization_tree):
+        """Test that the root and shared OU policies are looked up once for all accounts."""
+        resolver = PolicyResolver(mock_organizations_client, max_concurrency=4)
+
+        with patch(
+            "src.awsideman.aws_clients.manager.build_organization_hierarchy",
+            return_value=organization_tree,
+        ):
+            result = resolver.resolve_policies_for_accounts(
+                ["111111111111", "222222222222", "333333333333"]
+            )
+
+        assert [p.attachment_point for p in result["222222222222"]] == [
+            "r-1234",
+            "ou-5678",
+            "222222222222",
+        ]
+        assert [p.attachment_point for p in result["333333333333"]] == [
+            "r-1234",
+            "333333333333",
+        ]
+        # Five distinct targets, each looked up for SCPs and RCPs exactly once
+        targets = [
+            (call.args[0], call.args[1])
+            for call in mock_organizations_client.list_policies_for_target.call_args_list
+        ]
+        assert len(targets) == 10
+        assert len(set(targets)) == 10
+        mock_organizations_client.list_parents.assert_not_called()
+
+    def test_matches_single_account_resolution(self, mock_organizations_client, organization_tree):
+        """Test that bulk results equal resolving each account on its own."""
+        with patch(
+            "src.awsideman.aws_clients.manager.build_organization_hierarchy",
+            return_value=organization_tree,
+        ):
+            bulk = PolicyResolver(mock_organizations_client).resolve_policies_for_accounts(
+                ["111111111111", "333333333333"]
+            )
+
+        parents = {
+            "111111111111": [{"Id": "ou-5678", "Type": "ORGANIZATIONAL_UNIT"}],
+            "ou-5678": [{"Id": "r-1234", "Type": "ROOT"}],
+            "333333333333": [{"Id": "r-1234", "Type": "ROOT"}],
+        }
+        mock_organizations_client.list_parents.side_effect = lambda child_id: parents[child_id]
+        mock_organizations_client.describe_account.return_value = {"Name": "account"}
+        mock_organizations_client.list_organizational_units_for_parent.return_value = [
+            {"Id": "ou-5678", "Name": "Engineering"}
+        ]
+        mock_organizations_client.list_roots.return_value = [{"Id": "r-1234", "Name": "Root"}]
+
+        for account_id, policies in bulk.items():
+            single = PolicyResolver(mock_organizations_client).resolve_policies_for_account(
+                account_id
+            )
+            assert [(p.id, p.type) for p in single] == [(p.id, p.type) for p in policies]
+
+    def test_accounts_outside_the_tree_walk_their_parents(
+        self, mock_organizations_client, organization_tree
+    ):
+        """Test that accounts missing from the hierarchy fall back to list_parents."""
+        mock_organizations_client.list_parents.return_value = []
+
+        with patch(
+            "src.awsideman.aws_clients.manager.build_organization_hierarchy",
+            return_value=organization_tree,
+        ):
+            result = PolicyResolver(mock_organizations_client).resolve_policies_for_accounts(
+                ["111111111111", "999999999999"]
+            )
+
+        assert set(result) == {"111111111111", "999999999999"}
+        mock_organizations_client.list_parents.assert_called_once_with("999999999999")
+
+    def test_failed_lookups_are_not_reused(self, mock_organizations_client, organization_tree):
+        """Test that a failed policy lookup is retried instead of remembered as empty."""
+        list_policies = mock_organizations_client.list_policies_for_target.side_effect
+        failures = {"ou-5678": 1}
+
+        def flaky_list_policies(target_id, filter_type):
+            if filter_type == "SERVICE_CONTROL_POLICY" and failures.get(target_id):
+                failures[target_id] -= 1
+                raise ClientError(
+                    error_response={"Error": {"Code": "AccessDenied", "Message": "Denied"}},
+                    operation_name="ListPoliciesForTarget",
+                )
+            return list_policies(target_id, filter_type)
+
+        mock_organizations_client.list_policies_for_target.side_effect = flaky_list_policies
+        resolver = PolicyResolver(mock_organizations_client, max_concurrency=4)
+
+        with patch(
+            "src.awsideman.aws_clients.manager.build_organization_hierarchy",
+            return_value=organization_tree,
+        ):
+            result = resolver.resolve_policies_for_accounts(["111111111111", "222222222222"])
+
+        # The failed prefetch is retried when the first account is collected
+        for account_id in ("111111111111", "222222222222"):
+            assert "ou-5678" in [p.attachment_point for p in result[account_id]]
+
+        failures["ou-5678"] = 5
+        resolver._target_policies.pop(("ou-5678", PolicyType.SERVICE_CONTROL_POLICY))
+        with patch(
+            "src.awsideman.aws_clients.manager.build_organization_hierarchy",
+            return_value=organization_tree,
+        ):
+            incomplete = resolver.resolve_policies_for_accounts(["111111111111", "333333333333"])
+        assert "ou-5678" not in [p.attachment_point for p in incomplete["111111111111"]]
+        assert ("ou-5678", PolicyType.SERVICE_CONTROL_POLICY) not in resolver._target_policies
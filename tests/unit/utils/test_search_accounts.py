@@ -5,11 +5,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.awsideman.aws_clients.manager import (
-    _account_matches_ou_filter,
-    _account_matches_tag_filter,
-    search_accounts,
-)
+from src.awsideman.aws_clients.manager import search_accounts
 from src.awsideman.utils.models import AccountDetails
 
 
@@ -65,7 +61,7 @@ def test_search_accounts_case_insensitive(sample_accounts):
         ]
 
         # Mock get_account_details to return our sample accounts
-        mock_get_details.side_effect = lambda client, account_id: next(
+        mock_get_details.side_effect = lambda client, account_id, **kwargs: next(
             acc for acc in sample_accounts if acc.id == account_id
         )
 
@@ -93,7 +89,7 @@ def test_search_accounts_partial_match(sample_accounts):
             {"Id": "333333333333", "Name": "test-account"},
         ]
 
-        mock_get_details.side_effect = lambda client, account_id: next(
+        mock_get_details.side_effect = lambda client, account_id, **kwargs: next(
             acc for acc in sample_accounts if acc.id == account_id
         )
 
@@ -123,7 +119,7 @@ def test_search_accounts_with_ou_filter(sample_accounts):
             {"Id": "333333333333", "Name": "test-account"},
         ]
 
-        mock_get_details.side_effect = lambda client, account_id: next(
+        mock_get_details.side_effect = lambda client, account_id, **kwargs: next(
             acc for acc in sample_accounts if acc.id == account_id
         )
 
@@ -153,7 +149,7 @@ def test_search_accounts_with_tag_filter(sample_accounts):
             {"Id": "333333333333", "Name": "test-account"},
         ]
 
-        mock_get_details.side_effect = lambda client, account_id: next(
+        mock_get_details.side_effect = lambda client, account_id, **kwargs: next(
             acc for acc in sample_accounts if acc.id == account_id
         )
 
@@ -176,44 +172,3 @@ def test_search_accounts_empty_query():
 
     with pytest.raises(ValueError, match="Search query cannot be empty"):
         search_accounts(mock_org_client, "   ")
-
-
-def test_account_matches_ou_filter(sample_accounts):
-    """Test the OU filter matching function."""
-    dev_account = sample_accounts[0]  # Has OU path: ["Root", "Engineering", "Development"]
-    qa_account = sample_accounts[2]  # Has OU path: ["Root", "QA"]
-
-    # Test exact OU match
-    assert _account_matches_ou_filter(dev_account, "Engineering")
-    assert _account_matches_ou_filter(dev_account, "Development")
-    assert _account_matches_ou_filter(dev_account, "Root")
-    assert not _account_matches_ou_filter(dev_account, "QA")
-
-    assert _account_matches_ou_filter(qa_account, "QA")
-    assert not _account_matches_ou_filter(qa_account, "Engineering")
-
-
-def test_account_matches_tag_filter(sample_accounts):
-    """Test the tag filter matching function."""
-    dev_account = sample_accounts[
-        0
-    ]  # Has tags: {"Environment": "Development", "Team": "Engineering"}
-    qa_account = sample_accounts[2]  # Has tags: {"Environment": "Testing", "Team": "QA"}
-
-    # Test single tag match
-    assert _account_matches_tag_filter(dev_account, {"Environment": "Development"})
-    assert _account_matches_tag_filter(dev_account, {"Team": "Engineering"})
-    assert not _account_matches_tag_filter(dev_account, {"Environment": "Production"})
-    assert not _account_matches_tag_filter(dev_account, {"Team": "QA"})
-    assert _account_matches_tag_filter(qa_account, {"Team": "QA"})
-
-    # Test multiple tag match (all must match)
-    assert _account_matches_tag_filter(
-        dev_account, {"Environment": "Development", "Team": "Engineering"}
-    )
-    assert not _account_matches_tag_filter(
-        dev_account, {"Environment": "Development", "Team": "QA"}
-    )
-
-    # Test non-existent tag
-    assert not _account_matches_tag_filter(dev_account, {"NonExistent": "Value"})
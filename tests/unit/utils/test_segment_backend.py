@@ -0,0 +1,268 @@
+"""Tests for the segment log backend implementation."""
+
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.awsideman.cache.backends.base import CacheBackendError
+from src.awsideman.cache.backends.segment import SegmentLogBackend
+from src.awsideman.cache.config import AdvancedCacheConfig
+from src.awsideman.cache.factory import BackendFactory
+from src.awsideman.encryption.aes import AESEncryption
+
+
+class TestSegmentLogBackend:
+    """Test cases for the segment log backend."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.backends = []
+        self.backend = self._open()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        for backend in self.backends:
+            backend.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _open(self, **kwargs) -> SegmentLogBackend:
+        kwargs.setdefault("auto_compact", False)
+        backend = SegmentLogBackend(cache_dir=self.temp_dir, **kwargs)
+        self.backends.append(backend)
+        return backend
+
+    def _segment_files(self, backend: SegmentLogBackend):
+        return sorted(backend.segment_dir.glob("seg-*.log"))
+
+    def test_set_and_get_round_trip(self):
+        """Test that stored bytes are returned unchanged."""
+        data = pickle.dumps({"UserId": "user-1", "Groups": ["a", "b"]})
+        self.backend.set("user_key", data, ttl=300, operation="describe_user")
+
+        assert self.backend.get("user_key") == data
+        assert self.backend.get("missing_key") is None
+
+    def test_overwrite_returns_latest_value(self):
+        """Test that the newest record for a key wins."""
+        self.backend.set("key", b"first")
+        self.backend.set("key", b"second")
+
+        assert self.backend.get("key") == b"second"
+        stats = self.backend.get_stats()
+        assert stats["total_entries"] == 1
+        assert stats["garbage_bytes"] > 0
+
+    def test_invalidate_single_key(self):
+        """Test that invalidation appends a tombstone that hides the key."""
+        self.backend.set("keep", b"1")
+        self.backend.set("drop", b"2")
+
+        self.backend.invalidate("drop")
+
+        assert self.backend.get("drop") is None
+        assert self.backend.get("keep") == b"1"
+        assert self.backend.list_keys() == ["keep"]
+
+    def test_invalidate_all_replaces_segments(self):
+        """Test that clearing the cache drops every segment file."""
+        self.backend.set("a", b"1")
+        self.backend.set("b", b"2")
+        old_files = self._segment_files(self.backend)
+
+        self.backend.invalidate()
+
+        assert self.backend.get("a") is None
+        assert self.backend.get_stats()["total_entries"] == 0
+        assert not any(path.exists() for path in old_files)
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are not returned."""
+        self.backend.set("short", b"value", ttl=1)
+
+        with patch("src.awsideman.cache.backends.segment.time.time", return_value=time.time() + 5):
+            assert self.backend.get("short") is None
+            assert self.backend.list_keys() == []
+            assert self.backend.get_stats()["expired_entries"] == 1
+
+    def test_invalid_ttl_rejected(self):
+        """Test that non-positive TTLs are rejected."""
+        with pytest.raises(CacheBackendError):
+            self.backend.set("key", b"value", ttl=0)
+
+    def test_index_rebuilt_on_reopen(self):
+        """Test that a new instance rebuilds the index from the log."""
+        self.backend.set("a", b"1", operation="list_users")
+        self.backend.set("b", b"2")
+        self.backend.invalidate("b")
+
+        reopened = self._open()
+
+        assert reopened.get("a") == b"1"
+        assert reopened.get("b") is None
+        assert reopened.get_recent_entries()[0]["key"] == "a"
+
+    def test_writes_visible_across_instances(self):
+        """Test that instances sharing a directory see each other's writes."""
+        other = self._open()
+
+        self.backend.set("shared", b"from-first")
+        assert other.get("shared") == b"from-first"
+
+        other.set("shared", b"from-second")
+        assert self.backend.get("shared") == b"from-second"
+
+        other.invalidate("shared")
+        assert self.backend.get("shared") is None
+
+    def test_compaction_reclaims_dead_records(self):
+        """Test that compaction keeps live entries and drops superseded ones."""
+        for i in range(50):
+            self.backend.set("hot", f"value-{i}".encode())
+        self.backend.set("cold", b"cold", ttl=1)
+        self.backend.set("warm", b"warm")
+        before = self.backend.get_stats()["total_size_bytes"]
+
+        with patch("src.awsideman.cache.backends.segment.time.time", return_value=time.time() + 5):
+            reclaimed = self.backend.compact()
+
+        stats = self.backend.get_stats()
+        assert reclaimed > 0
+        assert stats["total_size_bytes"] == before - reclaimed
+        assert stats["garbage_bytes"] == 0
+        assert stats["compactions"] == 1
+        assert self.backend.get("hot") == b"value-49"
+        assert self.backend.get("warm") == b"warm"
+        assert self.backend.get("cold") is None
+
+        # Other instances pick up the compacted layout
+        assert self._open().get("hot") == b"value-49"
+
+    def test_needs_compaction_uses_garbage_ratio(self):
+        """Test the compaction trigger."""
+        backend = self._open(min_compaction_bytes=1, garbage_ratio=0.5)
+        backend.set("key", b"x" * 100)
+        assert not backend.needs_compaction()
+
+        backend.set("key", b"y" * 100)
+        backend.set("key", b"z" * 100)
+        assert backend.needs_compaction()
+
+    def test_segment_rolls_over_at_size_limit(self):
+        """Test that the active segment is sealed once it reaches the size limit."""
+        backend = self._open(max_segment_bytes=256)
+        for i in range(10):
+            backend.set(f"key_{i}", b"x" * 100)
+
+        assert len(self._segment_files(backend)) > 1
+        assert all(backend.get(f"key_{i}") == b"x" * 100 for i in range(10))
+
+    def test_torn_tail_is_ignored(self):
+        """Test that a partially written record does not break reads or writes."""
+        self.backend.set("good", b"value")
+        active = self._segment_files(self.backend)[-1]
+        with open(active, "ab") as f:
+            f.write(b"\x00\x01\x02")
+
+        reopened = self._open()
+        assert reopened.get("good") == b"value"
+
+        reopened.set("after", b"more")
+        assert self._open().get("after") == b"more"
+
+    def test_checksum_mismatch_is_a_miss(self):
+        """Test that a record whose bytes were damaged is discarded."""
+        self.backend.set("key", b"payload-bytes")
+        active = self._segment_files(self.backend)[-1]
+        raw = bytearray(active.read_bytes())
+        raw[-1] ^= 0xFF
+        active.write_bytes(bytes(raw))
+
+        reopened = self._open()
+        assert reopened.get("key") is None
+        assert reopened.get_stats()["corrupted_entries"] == 1
+
+    def test_manifest_lists_live_segments(self):
+        """Test the manifest format."""
+        manifest = json.loads(self.backend.manifest_file.read_text())
+        assert manifest["version"] == 1
+        assert [f"seg-{i:08d}.log" for i in manifest["segments"]] == [
+            path.name for path in self._segment_files(self.backend)
+        ]
+
+    def test_cleanup_expired_files(self):
+        """Test that cleanup counts expired entries and compacts them away."""
+        self.backend.set("old", b"1", ttl=1)
+        self.backend.set("new", b"2", ttl=3600)
+
+        with patch("src.awsideman.cache.backends.segment.time.time", return_value=time.time() + 5):
+            removed = self.backend.cleanup_expired_files()
+
+        assert removed == 1
+        assert self.backend.list_keys() == ["new"]
+
+    def test_background_compaction(self):
+        """Test that the compactor thread runs once garbage builds up."""
+        backend = self._open(
+            auto_compact=True, compaction_interval=0.05, min_compaction_bytes=1, garbage_ratio=0.5
+        )
+        for i in range(20):
+            backend.set("key", f"value-{i}".encode())
+
+        deadline = time.time() + 5
+        while backend.get_stats()["compactions"] == 0 and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert backend.get_stats()["compactions"] >= 1
+        assert backend.get("key") == b"value-19"
+
+    def test_batch_operations(self):
+        """Test batch writes, reads and tombstones across instances."""
+        items = {f"key_{i}": f"value-{i}".encode() for i in range(10)}
+        self.backend.set_many(items, ttl=300, operation="list_users")
+
+        other = self._open()
+        assert other.get_many(list(items) + ["missing"]) == items
+
+        other.delete_many(["key_0", "key_1"])
+        assert self.backend.get_many(["key_0", "key_1", "key_2"]) == {"key_2": b"value-2"}
+        assert len(self._open().list_keys()) == 8
+
+    def test_encrypted_values_round_trip_as_raw_bytes(self):
+        """Test that encrypted values are decrypted without a JSON/pickle pass."""
+        key_manager = Mock()
+        key_manager.get_key.return_value = os.urandom(32)
+        self.backend.encryption_enabled = True
+        self.backend.encryption_provider = AESEncryption(key_manager)
+        data = pickle.dumps({"data": {"GroupId": "g-1"}})
+
+        self.backend.set("group:describe:g-1", data)
+
+        with patch.object(
+            self.backend.encryption_provider,
+            "decrypt",
+            wraps=self.backend.encryption_provider.decrypt,
+        ) as json_decrypt:
+            assert self.backend.get("group:describe:g-1") == data
+        json_decrypt.assert_not_called()
+
+    def test_health_check(self):
+        """Test the health check result."""
+        result = self.backend.health_check()
+        assert result["healthy"] is True
+        assert result["backend_type"] == "segment"
+
+    def test_factory_creates_segment_backend(self):
+        """Test that the factory selects the segment backend."""
+        config = AdvancedCacheConfig(backend_type="segment", file_cache_dir=self.temp_dir)
+        backend = BackendFactory.create_backend(config)
+        self.backends.append(backend)
+
+        assert isinstance(backend, SegmentLogBackend)
+        assert BackendFactory.get_backend_info("segment")["available"] is True
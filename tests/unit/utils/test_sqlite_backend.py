@@ -0,0 +1,287 @@
+"""Tests for the SQLite backend implementation."""
+
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.awsideman.cache.backends.base import CacheBackendError
+from src.awsideman.cache.backends.sqlite import SQLiteBackend, prefix_upper_bound
+from src.awsideman.cache.config import AdvancedCacheConfig
+from src.awsideman.cache.factory import BackendFactory
+from src.awsideman.cache.manager import CacheManager
+from src.awsideman.encryption.aes import AESEncryption
+
+
+def _write_keys(cache_dir: str, worker: int, count: int) -> None:
+    backend = SQLiteBackend(cache_dir=cache_dir)
+    for i in range(count):
+        backend.set(f"proc{worker}_key_{i}", f"{worker}-{i}".encode())
+    backend.close()
+
+
+class TestSQLiteBackend:
+    """Test cases for the SQLite backend."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.backends = []
+        self.backend = self._open()
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        for backend in self.backends:
+            backend.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _open(self) -> SQLiteBackend:
+        backend = SQLiteBackend(cache_dir=self.temp_dir)
+        self.backends.append(backend)
+        return backend
+
+    def test_uses_wal_mode(self):
+        """Test that connections run in WAL mode."""
+        mode = self.backend._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_set_and_get_round_trip(self):
+        """Test that stored bytes are returned unchanged."""
+        data = pickle.dumps({"UserId": "user-1"})
+        self.backend.set("user_key", data, ttl=300, operation="describe_user")
+
+        assert self.backend.get("user_key") == data
+        assert self.backend.get("missing_key") is None
+
+    def test_overwrite_and_invalidate(self):
+        """Test overwriting, single-key invalidation and clearing."""
+        self.backend.set("a", b"1")
+        self.backend.set("a", b"2")
+        self.backend.set("b", b"3")
+        assert self.backend.get("a") == b"2"
+
+        self.backend.invalidate("a")
+        assert self.backend.get("a") is None
+        assert self.backend.get("b") == b"3"
+
+        self.backend.invalidate()
+        assert self.backend.get_stats()["total_entries"] == 0
+
+    def test_invalid_ttl_rejected(self):
+        """Test that non-positive TTLs are rejected."""
+        with pytest.raises(CacheBackendError):
+            self.backend.set("key", b"value", ttl=-1)
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are not returned."""
+        self.backend.set("short", b"value", ttl=1)
+
+        with patch("src.awsideman.cache.backends.sqlite.time.time", return_value=time.time() + 5):
+            assert self.backend.get("short") is None
+            assert self.backend.list_keys() == []
+            assert self.backend.get_stats()["expired_entries"] == 1
+
+    def test_cleanup_expired_files(self):
+        """Test that cleanup deletes only expired rows."""
+        self.backend.set("old", b"1", ttl=1)
+        self.backend.set("new", b"2", ttl=3600)
+
+        with patch("src.awsideman.cache.backends.sqlite.time.time", return_value=time.time() + 5):
+            assert self.backend.cleanup_expired_files() == 1
+
+        assert self.backend.get_stats()["total_entries"] == 1
+        assert self.backend.get("new") == b"2"
+
+    def test_sweep_expired_in_slices(self):
+        """Test that the sweep deletes at most one slice of expired rows per call."""
+        for i in range(5):
+            self.backend.set(f"old_{i}", b"x" * 10, ttl=1)
+        self.backend.set("new", b"y", ttl=3600)
+
+        with patch("src.awsideman.cache.backends.sqlite.time.time", return_value=time.time() + 5):
+            first = self.backend.sweep_expired(limit=3)
+            second = self.backend.sweep_expired(first.cursor, limit=3)
+
+        assert (first.removed, first.bytes_freed) == (3, 30)
+        assert first.cursor is not None
+        assert (second.removed, second.bytes_freed, second.cursor) == (2, 20, None)
+        assert self.backend.list_keys() == ["new"]
+
+    def test_list_keys_by_prefix(self):
+        """Test that prefix listing returns exactly the keys in the range."""
+        for key in ["user:list", "user:describe", "users", "group:list", "use"]:
+            self.backend.set(key, b"x")
+
+        assert sorted(self.backend.list_keys("user:")) == ["user:describe", "user:list"]
+        assert sorted(self.backend.list_keys("user")) == ["user:describe", "user:list", "users"]
+        assert len(self.backend.list_keys()) == 5
+
+    def test_prefix_range_uses_primary_key_index(self):
+        """Test that the prefix query is served by an index search."""
+        plan = (
+            self.backend._connection()
+            .execute(
+                "EXPLAIN QUERY PLAN SELECT key FROM cache_entries "
+                "WHERE key >= ? AND key < ? AND expires_at > ?",
+                ("user:", "user;", 0),
+            )
+            .fetchall()
+        )
+        assert any("SEARCH" in row[-1] for row in plan)
+
+    def test_prefix_upper_bound(self):
+        """Test the exclusive upper bound of a prefix range."""
+        assert prefix_upper_bound("user:") == "user;"
+        assert prefix_upper_bound("ab" + chr(0x10FFFF)) == "ac"
+        assert prefix_upper_bound("") is None
+
+    def test_get_recent_entries_newest_first(self):
+        """Test that recent entries are ordered by creation time."""
+        for i in range(5):
+            self.backend.set(f"key_{i}", b"x", operation="list_users")
+            time.sleep(0.001)
+
+        entries = self.backend.get_recent_entries(limit=3)
+
+        assert [entry["key"] for entry in entries] == ["key_4", "key_3", "key_2"]
+        assert entries[0]["is_expired"] is False
+
+    def test_stats_by_operation(self):
+        """Test the per-operation entry counts."""
+        self.backend.set("a", b"1", operation="list_users")
+        self.backend.set("b", b"2", operation="list_users")
+        self.backend.set("c", b"3", operation="list_groups")
+
+        stats = self.backend.get_stats()
+        assert stats["entries_by_operation"] == {"list_users": 2, "list_groups": 1}
+        assert stats["valid_entries"] == 3
+
+    def test_writes_visible_across_instances(self):
+        """Test that separate connections share one database."""
+        other = self._open()
+        self.backend.set("shared", b"value")
+        assert other.get("shared") == b"value"
+
+        other.invalidate("shared")
+        assert self.backend.get("shared") is None
+
+    def test_concurrent_processes(self):
+        """Test that several processes can write to the same database."""
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_write_keys, args=(self.temp_dir, worker, 50))
+            for worker in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        assert len(self.backend.list_keys()) == 150
+        assert self.backend.get("proc2_key_49") == b"2-49"
+
+    def test_batch_operations_beyond_parameter_limit(self):
+        """Test batch reads, writes and deletes larger than one IN clause."""
+        items = {f"key_{i:04d}": str(i).encode() for i in range(1200)}
+        self.backend.set_many(items, ttl=300, operation="list_users")
+
+        assert self.backend.get_many(list(items) + ["missing"]) == items
+        assert self.backend.get_stats()["entries_by_operation"] == {"list_users": 1200}
+
+        self.backend.delete_many(list(items)[:1100])
+        assert len(self.backend.list_keys()) == 100
+
+    def test_encrypted_values_round_trip_as_raw_bytes(self):
+        """Test that encrypted values are decrypted without a JSON/pickle pass."""
+        key_manager = Mock()
+        key_manager.get_key.return_value = os.urandom(32)
+        self.backend.encryption_enabled = True
+        self.backend.encryption_provider = AESEncryption(key_manager)
+        data = pickle.dumps({"data": {"GroupId": "g-1"}})
+
+        self.backend.set("group:describe:g-1", data)
+
+        with patch.object(
+            self.backend.encryption_provider,
+            "decrypt",
+            wraps=self.backend.encryption_provider.decrypt,
+        ) as json_decrypt:
+            assert self.backend.get("group:describe:g-1") == data
+        json_decrypt.assert_not_called()
+
+    def test_keys_for_tags(self):
+        """Test tag lookups, tag replacement and tag cleanup on delete."""
+        for key in ["user:describe:u-1", "group:members:g-1", "group:members:g-2"]:
+            self.backend.set(key, b"x")
+        self.backend.tag(
+            {
+                "user:describe:u-1": ["user:u-1"],
+                "group:members:g-1": ["group:g-1", "user:u-1"],
+                "group:members:g-2": ["group:g-2", "user:u-2"],
+            }
+        )
+
+        assert sorted(self.backend.keys_for_tags(["user:u-1"])) == [
+            "group:members:g-1",
+            "user:describe:u-1",
+        ]
+        assert sorted(self.backend.keys_for_tags(["group:g-2", "user:u-1"])) == [
+            "group:members:g-1",
+            "group:members:g-2",
+            "user:describe:u-1",
+        ]
+
+        self.backend.tag({"group:members:g-1": ["group:g-1"]})
+        assert self.backend.keys_for_tags(["user:u-1"]) == ["user:describe:u-1"]
+
+        self.backend.delete_many(["user:describe:u-1"])
+        self.backend.invalidate("group:members:g-2")
+        rows = self.backend._connection().execute("SELECT tag, key FROM cache_tags").fetchall()
+        assert rows == [("group:g-1", "group:members:g-1")]
+
+    def test_keys_for_tags_skips_expired_entries(self):
+        """Test that expired entries are not returned by tag lookups."""
+        self.backend.set("user:describe:u-1", b"x", ttl=1)
+        self.backend.tag({"user:describe:u-1": ["user:u-1"]})
+
+        with patch("src.awsideman.cache.backends.sqlite.time.time", return_value=time.time() + 5):
+            assert self.backend.keys_for_tags(["user:u-1"]) == []
+
+    def test_health_check(self):
+        """Test the health check result."""
+        result = self.backend.health_check()
+        assert result["healthy"] is True
+        assert result["backend_type"] == "sqlite"
+
+    def test_factory_creates_sqlite_backend(self):
+        """Test that the factory selects the SQLite backend."""
+        config = AdvancedCacheConfig(backend_type="sqlite", file_cache_dir=self.temp_dir)
+        backend = BackendFactory.create_backend(config)
+        self.backends.append(backend)
+
+        assert isinstance(backend, SQLiteBackend)
+
+    def test_manager_pattern_invalidation_uses_prefix(self):
+        """Test that the cache manager passes the literal pattern prefix to the backend."""
+        CacheManager.reset_instance()
+        try:
+            manager = CacheManager()
+            manager._backend = self.backend
+            self.backend.set("user:list:1", pickle.dumps({"data": 1}))
+            self.backend.set("user:list:2", pickle.dumps({"data": 2}))
+            self.backend.set("group:list:1", pickle.dumps({"data": 3}))
+
+            with patch.object(self.backend, "list_keys", wraps=self.backend.list_keys) as spy:
+                removed = manager.invalidate("user:list:*")
+
+            spy.assert_called_once_with("user:list:")
+            assert removed == 2
+            assert self.backend.list_keys() == ["group:list:1"]
+        finally:
+            CacheManager.reset_instance()